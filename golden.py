@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# Golden output tests and throughput measurements for MERtide
+#
+# Builds suites of forms with mertide.py against a local DHIS2 stub that serves the metadata in
+# samples/public_metadata.xml (on any free port, or --port), and compares every artifact of each build (forms, XML, rules, favorites,
+# and the files inside zips) with golden files recorded from a known good tree.  The uids and ssids that
+# mertide.py makes at random are normalized first.  The time of each build is recorded with the golden
+# files, so a change can be shown to give the same output, and how much faster it is.
+#
+#   python3 golden.py --record --source=/path/to/known/good/mertide
+#   python3 golden.py
+
+import os
+import re
+import sys
+import csv
+import json
+import time
+import datetime
+import shutil
+import getopt
+import difflib
+import zipfile
+import tempfile
+import threading
+import subprocess
+import urllib.parse
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The suites: the arguments each build is run with, whether its control files are copied many times (see
+# --scale) to make a larger suite, how many times the rows of each form are repeated within the form, and
+# how many processes compile its rules.  The pool suite repeats the rows so that its forms have more rules
+# than a batch (ruleBatchSize in mertide.py), and is built with --jobs, but its golden files are recorded
+# from a build in one process, and it is also compared with a build in one process (see compareSerial).
+goldenSuites = {
+	'samples': {'args': [], 'scaled': False, 'repeated': 1, 'jobs': 1},
+	'options': {'args': ['--html', '--minify', '--lazytabs', '--offlinebundle', '--favoriteisoquarters=2019Q1-2019Q4'], 'scaled': False, 'repeated': 1, 'jobs': 1},
+	'synthetic': {'args': [], 'scaled': True, 'repeated': 1, 'jobs': 1},
+	'pool': {'args': [], 'scaled': False, 'repeated': 8, 'jobs': 2},
+	'assetbundle': {'args': ['--assetbundle=https://example.org/api/apps/assets/{file}', '--offlinebundle'], 'scaled': False, 'repeated': 1, 'jobs': 1},
+}
+
+# The artifacts that are not compared: the log has timings, and the manifest has hashes of the other files
+skippedArtifacts = {'mertide.log', 'manifest.json'}
+
+# The date the builds are made on, so their favorites and cadences do not change with today's date.  It is
+# given to mertide.py as SOURCE_DATE_EPOCH, and today's date is frozen for trees that don't read it.
+buildDate = datetime.date(2019, 11, 15)
+
+# Run mertide.py in a build directory, with /opt/dhis2/dish.json (where mertide.py reads the DHIS2 it connects
+# to) replaced by the dish.json of the build directory, which points at the stub, and with today's date frozen
+mertideBootstrap = '''
+import sys, runpy, builtins, datetime
+today = datetime.date.fromisoformat(sys.argv.pop(1))
+class date(datetime.date):
+	@classmethod
+	def today(cls):
+		return cls(today.year, today.month, today.day)
+class frozenDatetime(datetime.datetime):
+	@classmethod
+	def now(cls, tz = None):
+		return cls(today.year, today.month, today.day, 12, tzinfo = tz)
+	@classmethod
+	def today(cls):
+		return cls.now()
+datetime.date = date
+datetime.datetime = frozenDatetime
+realOpen = builtins.open
+def buildOpen(file, *args, **kwargs):
+	return realOpen('dish.json' if file == '/opt/dhis2/dish.json' else file, *args, **kwargs)
+builtins.open = buildOpen
+sys.argv[0] = 'mertide.py'
+runpy.run_path('mertide.py', run_name = '__main__')
+'''
+
+# The options, with their defaults
+goldenDir = 'golden/'
+stubPort = 0 # Any free port
+sourceDir = os.path.dirname(os.path.abspath(__file__)) + '/'
+suites = list(goldenSuites)
+scale = 5
+repeat = 1
+record = False
+
+dxf = '{http://dhis2.org/schema/dxf/2.0}'
+
+# Read the metadata of a DHIS2 export (like samples/public_metadata.xml) into the objects the stub serves
+def loadMetadata(fileName):
+	root = ET.parse(fileName).getroot()
+	collections = {collection.tag.replace(dxf, ''): list(collection) for collection in root}
+	optionCombos = {}
+	for c in collections.get('categoryOptionCombos', []):
+		optionCombos[c.get('id')] = {'id': c.get('id'), 'name': c.get('name'), 'categoryCombo': c.find(dxf + 'categoryCombo').get('id')}
+	categoryCombos = {}
+	for c in collections.get('categoryCombos', []):
+		categoryCombos[c.get('id')] = {'id': c.get('id'), 'name': c.get('name'),
+			'categoryOptionCombos': [{'id': coc['id'], 'name': coc['name']} for coc in optionCombos.values() if coc['categoryCombo'] == c.get('id')]}
+	dataElements = {}
+	for d in collections.get('dataElements', []):
+		dataElements[d.get('id')] = {'id': d.get('id'), 'name': d.get('name'), 'shortName': d.get('shortName'),
+			'categoryCombo': categoryCombos[d.find(dxf + 'categoryCombo').get('id')]}
+	groups = [{'id': g.get('id'), 'name': g.get('name')} for g in collections.get('dataElementGroups', [])]
+	return {'dataElements': dataElements, 'optionCombos': optionCombos, 'categoryCombos': categoryCombos, 'groups': groups}
+
+# A DHIS2 stub that answers the requests mertide.py makes, from the metadata of the server.  It has no
+# validation rules or indicators, so every rule a build makes is new.
+class StubHandler(BaseHTTPRequestHandler):
+	def log_message(self, *args):
+		pass
+
+	def reply(self, body, code = 200):
+		data = json.dumps(body).encode()
+		self.send_response(code)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(data)))
+		self.end_headers()
+		self.wfile.write(data)
+
+	def do_GET(self):
+		metadata = self.server.metadata
+		url = urllib.parse.urlparse(self.path)
+		filters = urllib.parse.parse_qs(url.query).get('filter', [])
+		path = url.path[len('/api/'):]
+		if path == '':
+			return self.reply({})
+		if path == 'resources.json':
+			return self.reply({'resources': [{'plural': 'dataElements'}]})
+		if path == 'validationRules.json':
+			return self.reply({'validationRules': []})
+		if path == 'indicators.json':
+			return self.reply({'indicators': []})
+		if path == 'dataElements.json':
+			dataElements = list(metadata['dataElements'].values())
+			for f in filters:
+				if f.startswith('id:eq:'):
+					dataElements = [d for d in dataElements if d['id'] == f[len('id:eq:'):]]
+			return self.reply({'dataElements': [{'id': d['id'], 'name': d['name'], 'shortName': d['shortName'],
+				'categoryCombo': {'id': d['categoryCombo']['id']}} for d in dataElements]})
+		if path == 'categoryOptionCombos.json':
+			return self.reply({'categoryOptionCombos': [{'id': c['id'], 'name': c['name'],
+				'categoryCombo': {'id': c['categoryCombo'], 'name': metadata['categoryCombos'][c['categoryCombo']]['name']}}
+				for c in metadata['optionCombos'].values()]})
+		if path == 'dataElementGroups.json':
+			groups = metadata['groups']
+			for f in filters:
+				if f.startswith('name:eq:'):
+					groups = [g for g in groups if g['name'] == f[len('name:eq:'):]]
+			return self.reply({'dataElementGroups': groups})
+		r = re.fullmatch(r'dataElements/(\w{11})\.json', path)
+		if r and r.group(1) in metadata['dataElements']:
+			return self.reply(metadata['dataElements'][r.group(1)])
+		r = re.fullmatch(r'validationRuleGroups/(\w{11})\.json', path)
+		if r:
+			return self.reply({'id': r.group(1), 'name': 'MER validation rules', 'validationRules': []})
+		return self.reply({'httpStatus': 'Not Found', 'httpStatusCode': 404}, 404)
+
+# Start the DHIS2 stub in a thread, serving the metadata of the source tree
+def startStub():
+	server = ThreadingHTTPServer(('localhost', stubPort), StubHandler)
+	server.metadata = loadMetadata(sourceDir + 'samples/public_metadata.xml')
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	return server
+
+# Write the control files of a suite into a build directory.  A scaled suite has each form of the samples
+# as many times as the scale, each copy with its own name and code and without uids, so mertide.py makes new ones.
+# A repeated suite has the rows of each form that many times within the form, each repeat with its own vtab and
+# indicator names and its own unique ids (in ctl_uniqueid, ctl_exclusive and ctl_rules).
+# Returns the number of forms and rows (SUB) in the control files.
+def writeControlFiles(controlDir, copies, repeats):
+	forms = rows = 0
+	os.makedirs(controlDir)
+	sampleDir = sourceDir + 'samples/control_files/'
+	for fileName in sorted(os.listdir(sampleDir)):
+		if not fileName.endswith('.csv'):
+			continue
+		with open(sampleDir + fileName, encoding = 'ISO-8859-1', newline = '') as f:
+			reader = csv.DictReader(f, dialect = 'excel')
+			header = reader.fieldnames
+			sample = repeatRows(list(reader), repeats)
+		with open(controlDir + fileName, 'w', encoding = 'ISO-8859-1', newline = '') as f:
+			writer = csv.DictWriter(f, header, dialect = 'excel')
+			writer.writeheader()
+			for copy in range(1, copies + 1):
+				for row in sample:
+					row = dict(row)
+					if row['Type'] == 'FORM':
+						forms += 1
+						if copy > 1:
+							row['form_name'] += ' copy ' + str(copy)
+							row['form_shortname'] += ' copy ' + str(copy)
+							row['form_code'] += '_COPY_' + str(copy)
+							row['form_uid'] = row['form_dsf_uid'] = ''
+					elif row['Type'] == 'SUB':
+						rows += 1
+					writer.writerow(row)
+	return forms, rows
+
+# Repeat the rows after each FORM row of a control file within the form
+def repeatRows(sample, repeats):
+	if repeats == 1:
+		return sample
+	forms = []
+	for row in sample:
+		if row['Type'] == 'FORM' or not forms:
+			forms.append([row, []])
+		else:
+			forms[-1][1].append(row)
+	repeated = []
+	for [form, rows] in forms:
+		repeated.append(form)
+		uniqueIds = [row['ctl_uniqueid'] for row in rows if row['ctl_uniqueid']]
+		uniqueIdPattern = re.compile(r'(?<![\w."])(' + '|'.join(map(re.escape, uniqueIds)) + r')(?!\w)')
+		for repeat in range(1, repeats + 1):
+			for row in rows:
+				row = dict(row)
+				if repeat > 1:
+					if row['vtab_name']:
+						row['vtab_name'] += ' repeat ' + str(repeat)
+					if row['ind_name']:
+						row['ind_name'] += '_repeat_' + str(repeat)
+					if uniqueIds:
+						for column in ['ctl_uniqueid', 'ctl_exclusive', 'ctl_rules']:
+							row[column] = uniqueIdPattern.sub(r'\1_repeat_' + str(repeat), row[column])
+				repeated.append(row)
+	return repeated
+
+# Make a build directory with the code of the source tree, the disaggs of the samples and the control
+# files of a suite, and a dish.json that points mertide.py at the stub.  periods.py is only copied if
+# the source tree has it (older trees keep the periods in mertide.py).
+def makeBuildDir(suite, server):
+	buildDir = tempfile.mkdtemp(prefix = 'mertide_' + suite + '_') + '/'
+	for fileName in ['mertide.py', 'periods.py']:
+		if os.path.exists(sourceDir + fileName):
+			shutil.copy(sourceDir + fileName, buildDir)
+	with open(buildDir + 'dish.json', 'w') as f:
+		json.dump({'dhis': {'baseurl': 'http://localhost:' + str(server.server_address[1]), 'username': 'golden', 'password': 'golden'}}, f)
+	for dirName in ['js', 'css', 'codechunks']:
+		shutil.copytree(sourceDir + dirName, buildDir + dirName)
+	shutil.copytree(sourceDir + 'samples/disagg_files', buildDir + 'disagg_files')
+	forms, rows = writeControlFiles(buildDir + 'control_files/', scale if goldenSuites[suite]['scaled'] else 1, goldenSuites[suite]['repeated'])
+	return buildDir, forms, rows
+
+# Build a suite in its build directory, compiling the rules in this many processes, and return how long
+# the build took, in seconds, or None if it failed
+def runBuild(buildDir, suite, jobs):
+	shutil.rmtree(buildDir + 'output', ignore_errors = True)
+	sourceDateEpoch = datetime.datetime(buildDate.year, buildDate.month, buildDate.day, tzinfo = datetime.timezone.utc).timestamp()
+	env = dict(os.environ, SOURCE_DATE_EPOCH = str(int(sourceDateEpoch)), PYTHONHASHSEED = '0')
+	jobArgs = ['--jobs=' + str(jobs)] if jobs > 1 else []
+	start = time.perf_counter()
+	with open(buildDir + 'stdout.txt', 'w') as stdout:
+		result = subprocess.run([sys.executable, '-c', mertideBootstrap, buildDate.isoformat(), '-i', 'control_files/', '-d', 'disagg_files/'] + goldenSuites[suite]['args'] + jobArgs,
+			cwd = buildDir, env = env, stdout = stdout, stderr = subprocess.STDOUT)
+	seconds = time.perf_counter() - start
+	if result.returncode != 0:
+		print(suite + ': mertide.py exited with ' + str(result.returncode) + ':')
+		print(''.join(open(buildDir + 'stdout.txt').readlines()[-20:]))
+		return None
+	return seconds
+
+# The tokens that look like uids or ssids but are in the inputs of a build (its code, metadata, control
+# files and disaggs), so they are never normalized
+def knownTokens(buildDir):
+	known = set()
+	inputs = [buildDir + f for f in ['mertide.py', 'periods.py'] if os.path.exists(buildDir + f)] + [sourceDir + 'samples/public_metadata.xml']
+	for dirName in ['js', 'css', 'codechunks', 'disagg_files', 'control_files']:
+		for (dirpath, dirnames, filenames) in os.walk(buildDir + dirName):
+			inputs += [os.path.join(dirpath, fileName) for fileName in filenames]
+	for fileName in inputs:
+		with open(fileName, encoding = 'utf-8', errors = 'replace') as f:
+			known.update(tokenPattern.findall(f.read()))
+	return known
+
+# Random uids (11 characters) and ssids (5 characters and an htab suffix, see makeSsid in mertide.py)
+tokenPattern = re.compile(r'(?<![A-Za-z0-9])[A-Za-z][A-Za-z0-9]{4}(?:[A-Za-z0-9]{6}|dsd|xta|xcs|xna)(?![A-Za-z0-9])')
+
+# Replace each token of an artifact that is not known with a name numbered by where it first appears
+# in the artifact, so the same random uid is the same name wherever it is used in the artifact
+def normalize(text, known):
+	names = {}
+	def name(r):
+		token = r.group(0)
+		if token in known:
+			return token
+		if token not in names:
+			names[token] = ('{ssid' if len(token) == 8 else '{uid') + str(len(names) + 1) + '}'
+		return names[token]
+	return tokenPattern.sub(name, text)
+
+# Read the normalized artifacts of a build, by their path in output/, with the files in each zip as zip/file
+def readArtifacts(buildDir):
+	known = knownTokens(buildDir)
+	artifacts = {}
+	outDir = buildDir + 'output/'
+	for (dirpath, dirnames, filenames) in os.walk(outDir):
+		for fileName in filenames:
+			path = os.path.relpath(os.path.join(dirpath, fileName), outDir)
+			if path in skippedArtifacts:
+				continue
+			if fileName.endswith('.zip'):
+				with zipfile.ZipFile(outDir + path) as z:
+					for member in z.namelist():
+						artifacts[path + '/' + member] = normalize(z.read(member).decode('utf-8', 'replace'), known)
+			else:
+				with open(outDir + path, encoding = 'utf-8', errors = 'replace') as f:
+					artifacts[path] = normalize(f.read(), known)
+	return artifacts
+
+# Write the artifacts and throughput of a suite as its golden files
+def recordSuite(suite, artifacts, throughput):
+	suiteDir = goldenDir + suite + '/'
+	shutil.rmtree(suiteDir, ignore_errors = True)
+	for path in artifacts:
+		os.makedirs(os.path.dirname(suiteDir + 'artifacts/' + path), exist_ok = True)
+		with open(suiteDir + 'artifacts/' + path, 'w', encoding = 'utf-8') as f:
+			f.write(artifacts[path])
+	with open(suiteDir + 'throughput.json', 'w') as f:
+		json.dump(throughput, f, indent = 2)
+	print(suite + ': recorded ' + str(len(artifacts)) + ' artifact(s) in ' + suiteDir)
+
+# Compare the artifacts of a build with the expected artifacts (named by expectedName in the differences),
+# printing the differences.  Returns the number of artifacts that are missing, extra or different.
+def compareArtifacts(suite, expected, artifacts, expectedName):
+	problems = 0
+	for path in sorted(set(expected) | set(artifacts)):
+		if path not in artifacts:
+			print(suite + ': ' + path + ' is missing')
+		elif path not in expected:
+			print(suite + ': ' + path + ' is new')
+		elif artifacts[path] != expected[path]:
+			print(suite + ': ' + path + ' is different:')
+			diff = list(difflib.unified_diff(expected[path].splitlines(), artifacts[path].splitlines(), expectedName + '/' + path, path, n = 1, lineterm = ''))
+			for line in diff[:20]:
+				print('\t' + line[:200])
+			if len(diff) > 20:
+				print('\t... and ' + str(len(diff) - 20) + ' more lines')
+		else:
+			continue
+		problems += 1
+	return problems
+
+# Compare the artifacts of a suite with its golden files, printing the differences.  Returns the number of
+# artifacts that are missing, extra or different.
+def compareSuite(suite, artifacts):
+	artifactDir = goldenDir + suite + '/artifacts/'
+	golden = {}
+	for (dirpath, dirnames, filenames) in os.walk(artifactDir):
+		for fileName in filenames:
+			path = os.path.relpath(os.path.join(dirpath, fileName), artifactDir)
+			with open(artifactDir + path, encoding = 'utf-8') as f:
+				golden[path] = f.read()
+	problems = compareArtifacts(suite, golden, artifacts, 'golden')
+	print(suite + ': ' + str(len(golden)) + ' golden artifact(s), ' + str(problems) + ' different')
+	return problems
+
+# Build a suite that compiles its rules in a pool once more in one process, and compare the artifacts of
+# the pool with it, printing the differences.  Returns the number of problems.
+def compareSerial(suite, buildDir, artifacts):
+	if runBuild(buildDir, suite, 1) is None:
+		return 1
+	serial = readArtifacts(buildDir)
+	problems = compareArtifacts(suite, serial, artifacts, 'serial')
+	print(suite + ': ' + str(len(serial)) + ' artifact(s) built in one process, ' + str(problems) + ' different with --jobs=' + str(goldenSuites[suite]['jobs']))
+	return problems
+
+# Print the throughput of a suite, and how it compares with the throughput recorded with its golden files
+def reportThroughput(suite, throughput):
+	line = suite + ': ' + '{seconds:.2f}s for {forms} form(s) and {rows} row(s), {formsPerSecond:.2f} forms/s, {rowsPerSecond:.0f} rows/s'.format(**throughput)
+	try:
+		golden = json.load(open(goldenDir + suite + '/throughput.json'))
+		line += ' (golden {:.2f}s, {:.2f}x)'.format(golden['seconds'], golden['seconds'] / throughput['seconds'])
+	except (FileNotFoundError, KeyError, ZeroDivisionError):
+		pass
+	print(line)
+
+# Build a suite as many times as asked (keeping the fastest time), and record or compare its artifacts.
+# The rules are compiled in one process when recording.  When comparing a suite that is built with --jobs,
+# its artifacts are also compared with a build in one process.  Returns the number of problems.
+def doSuite(suite, server):
+	buildDir, forms, rows = makeBuildDir(suite, server)
+	jobs = 1 if record else goldenSuites[suite]['jobs']
+	try:
+		times = []
+		for i in range(repeat):
+			seconds = runBuild(buildDir, suite, jobs)
+			if seconds is None:
+				return 1
+			times.append(seconds)
+			if i == 0:
+				artifacts = readArtifacts(buildDir)
+		seconds = min(times)
+		throughput = {'seconds': seconds, 'forms': forms, 'rows': rows, 'formsPerSecond': forms / seconds, 'rowsPerSecond': rows / seconds,
+			'scale': scale if goldenSuites[suite]['scaled'] else 1}
+		reportThroughput(suite, throughput)
+		if record:
+			recordSuite(suite, artifacts, throughput)
+			return 0
+		try:
+			goldenScale = json.load(open(goldenDir + suite + '/throughput.json'))['scale']
+		except FileNotFoundError:
+			print(suite + ': no golden files in ' + goldenDir + suite + '/, record them with --record')
+			return 1
+		if goldenScale != throughput['scale']:
+			print(suite + ': the golden files were recorded with --scale=' + str(goldenScale))
+			return 1
+		problems = compareSuite(suite, artifacts)
+		if jobs > 1:
+			problems += compareSerial(suite, buildDir, artifacts)
+		return problems
+	finally:
+		shutil.rmtree(buildDir, ignore_errors = True)
+
+def main(argv):
+	global goldenDir, sourceDir, suites, scale, repeat, record, stubPort
+	usage = 'usage: golden.py [options]\n	options:\n	  --record\n			Record the golden files, instead of comparing the builds with them\n\n	  --source=/path/to/mertide\n			Build the mertide.py of this tree (Defaults to the tree of golden.py)\n\n	  --golden=golden/\n			Keep the golden files in this directory (Defaults to golden/)\n\n	  --suites=samples,options,synthetic,pool,assetbundle\n			Only build these suites (Defaults to all of them)\n\n	  --scale=20\n			How many times the synthetic suite has each sample form (Defaults to 5)\n\n	  --repeat=3\n			Build each suite this many times and keep the fastest time (Defaults to 1)\n\n	  --port=8080\n			Run the DHIS2 stub on this port (Defaults to any free port)\n\n	 -h, --help\n		Prints this message\n'
+	try:
+		opts, args = getopt.getopt(argv, 'h', ['record', 'source=', 'golden=', 'suites=', 'scale=', 'repeat=', 'port=', 'help'])
+	except getopt.GetoptError:
+		print(usage)
+		sys.exit(2)
+	for opt, arg in opts:
+		if opt in ('-h', '--help'):
+			print(usage)
+			sys.exit(2)
+		elif opt == '--record':
+			record = True
+		elif opt == '--source':
+			sourceDir = os.path.abspath(arg) + '/'
+		elif opt == '--golden':
+			goldenDir = arg if arg.endswith('/') else arg + '/'
+		elif opt == '--suites':
+			suites = arg.split(',')
+			for suite in suites:
+				if suite not in goldenSuites:
+					print('Unknown suite ' + suite + ', the suites are ' + ', '.join(goldenSuites))
+					sys.exit(2)
+		elif opt in ('--scale', '--repeat'):
+			if not arg.isdigit() or int(arg) < 1:
+				print(opt + ' must be a positive number')
+				sys.exit(2)
+			if opt == '--scale':
+				scale = int(arg)
+			else:
+				repeat = int(arg)
+		elif opt == '--port':
+			if not arg.isdigit() or int(arg) > 65535:
+				print('--port must be a port number')
+				sys.exit(2)
+			stubPort = int(arg)
+
+def run(argv):
+	main(argv)
+	try:
+		server = startStub()
+	except OSError as e:
+		print('Unable to start the DHIS2 stub on port ' + str(stubPort) + ': ' + str(e))
+		sys.exit(2)
+	problems = 0
+	try:
+		for suite in suites:
+			problems += doSuite(suite, server)
+	finally:
+		server.shutdown()
+	sys.exit(1 if problems else 0)
+
+if __name__ == '__main__':
+	run(sys.argv[1:])
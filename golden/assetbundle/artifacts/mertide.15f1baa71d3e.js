@@ -0,0 +1,1132 @@
+if (window.dhis2) {
+  (function() {
+    dhis2.util.on(dhis2.de.event.dataValuesLoaded, function(event, ds) {
+      functionloader.dataValuesLoaded(ds);
+    });
+
+    dhis2.util.on(dhis2.de.event.formReady, function(event, ds) {
+      //Form ready extra js to run
+      //#formReady#
+    });
+  })();
+
+  dhis2.util.on(dhis2.de.event.dataValueSaved, function(event, ds, dv) {
+    stella.changed(dv);
+    meany.changed(dv);
+
+    //dataValueSaved extra JS to run
+    //#dataValueSaved#
+  });
+}
+
+var functionloader = {};
+functionloader.dataSetToRunFor = false;
+functionloader.lastSelectedForm = false;
+
+functionloader.setToLoading = function(loadingStatus) {
+  if (loadingStatus) {
+    $('#contentDiv').hide();
+    $('#loaderDiv').children('p').text('Please wait while the PEPFAR data entry form is loading...');
+    $('#loaderDiv').show();
+  } else {
+    setTimeout(function() {
+      $('#loaderDiv').hide();
+      $('#PEPFAR_main').show();
+      $('#contentDiv').show();
+    }, 500);
+
+  }    
+}
+
+functionloader.dataValuesLoaded = function (ds) {
+  functionloader.setToLoading(true);
+  if (!functionloader.dataSetToRunFor) {
+    // dataSetToRunFor is not set, so this is the first time we've been run
+    console.log('PEPFAR: MER | Custom JS Loaded: v20201130 | Loading all javascript for ' + ds);
+    functionloader.erase();
+    functionloader.dataSetToRunFor = ds;
+    functionloader.lastSelectedForm = functionloader.identifySelectedForm();
+    qbert.load();
+
+    $('.PEPFAR_Form_EntryField').find('.entryfield').addClass('PEPFAR_Form_EntryField_input');
+    $('.PEPFAR_Form_OptionSet').find('.entryoptionset').addClass('PEPFAR_Form_EntryField_optionset');
+    $('.PEPFAR_Form_Narrative').find('.entryarea').addClass('PEPFAR_Form_EntryField_narrative');
+
+    //Data Values Loaded extra js to run
+    if (functionloader.formLoaded) {
+      functionloader.formLoaded();
+    }
+
+    functionloader.loadWithDelay();
+
+  } else if (functionloader.dataSetToRunFor == ds && functionloader.lastSelectedForm && functionloader.lastSelectedForm == functionloader.identifySelectedForm()) {
+    // dataSetToRunFor is set, but this appears to be the same form, due to a quirk in DHIS 2 
+    // that causes dataValuesLoaded to be called twice, so we do nothing
+    console.log('PEPFAR: MER | dataValuesLoaded with previous ' + ds + ' and the same form, doing nothing');
+    functionloader.lastSelectedForm = functionloader.identifySelectedForm();
+    functionloader.setToLoading(false);
+
+  } else if (functionloader.dataSetToRunFor == ds) {
+    // dataSetToRunFor is set, and either we are not able to determine the last selected form or it's a different form
+    // Therefore, don't reconstruct the rules, but reload them on the page
+    console.log('PEPFAR: MER | dataValuesLoaded with previous ' + ds + ', reloading custom JS');
+    functionloader.erase();
+    functionloader.lastSelectedForm = functionloader.identifySelectedForm();
+    qbert.load();
+    functionloader.loadWithDelay();
+
+  } else {
+    // Due to another quirk in DHIS 2, this javascript might be trying to run for a different form, as DHIS 2
+    // may not wipe out custom javascript if the new form is not a custom form or does not have custom javascript.
+    // Therefore, we delete our variables and reset all of the CSS, JS, and the like
+    console.log('PEPFAR: MER | ' + functionloader.dataSetToRunFor + ' does not match ' + ds + ', so custom JS should not run; clearing out saved variables');
+    functionloader.lastSelectedForm == false;
+    functionloader.erase();
+    meany.kill();
+    stella.kill();
+    functionloader.setToLoading(false);
+  }
+}
+
+/**
+ * Load the rule table mertide.py precompiled for the form into stella (autocalc rules)
+ * and meany (mutually exclusive rules).  table.ssids and table.cocs list each subindicator id
+ * and category option combo once.  table.operands are [ssid] or [ssid, [cocs]], and the sides of
+ * the rules in table.autocalc (with a target ssid) and table.exclusive are arrays of operands.
+ * Everything refers to the lists by index.
+ */
+functionloader.registerRules = function (table) {
+  stella.register(table);
+  meany.register(table);
+}
+
+functionloader.erase = function () {
+  qbert.erase();
+  meany.erase();
+  stella.erase();
+  cerulean.erase();
+}
+
+/**
+ * After a short delay to allow execution of form display code, load cerulean, stella, and meany
+ * Then remove the gray background formatting that DHIS2 applied to form fields that were disabled, but no longer are
+ */
+functionloader.loadWithDelay = function () {
+  setTimeout(function() {
+    cerulean.load();
+    stella.load();
+    meany.load();
+    $('.entryfield').each(function(index) {
+      if ($(this).css('background-color') != 'rgb(255, 255, 255)' && !$(this).hasClass('disabled')) {
+        $(this).css('background-color', 'rgb(255, 255, 255)');
+      }
+    });
+    functionloader.setToLoading(false);
+  }, 10);
+}
+
+/**
+ * Uniquely identify the form, by adding the uid from the org hierarchy to the various selections from the selection box
+ * and turn them all into a string
+ */
+functionloader.identifySelectedForm = function () {
+  var orgUnit = $('#orgUnitTree .selected').parent('li').attr('id');
+  if (typeof(orgUnit) !== 'undefined') {
+    return $('#orgUnitTree .selected').parent('li').attr('id') + ' ' +
+      Object.values($('#selectedDataSetId,#selectedPeriodId,#category-SH885jaRe0o')
+        .map(function() { 
+          return $(this).val(); 
+        }).sort()
+      ).join(' ');
+  } else {
+    return false;
+  }
+}
+
+/**
+ * Render a vtab that mertide.py --lazytabs emitted as a template, the first time it is opened.
+ * Its htabs and title toggles are set up, and its inputs are set up for data entry like the rest of
+ * the form (see setupEntryFields).  In data entry, DHIS 2 is then asked to load the data values
+ * again, which fills the new inputs and reloads the custom JS through dataValuesLoaded.  Outside of
+ * data entry (reports, the static and the offline forms), the custom JS is simply reloaded.
+ */
+functionloader.materializeTab = function (panel) {
+  var template = $(panel).children('template.PEPFAR_Tabs_lazy')[0];
+  if (!template) {
+    return;
+  }
+  panel.replaceChild(document.importNode(template.content, true), template);
+  $(panel).find('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');
+  functionloader.showAndHideTabs(panel);
+  functionloader.setupEntryFields(panel);
+  $(panel).find('.PEPFAR_Form_EntryField').find('.entryfield').addClass('PEPFAR_Form_EntryField_input');
+  $(panel).find('.PEPFAR_Form_OptionSet').find('.entryoptionset').addClass('PEPFAR_Form_EntryField_optionset');
+  $(panel).find('.PEPFAR_Form_Narrative').find('.entryarea').addClass('PEPFAR_Form_EntryField_narrative');
+
+  if (functionloader.dataSetToRunFor && typeof(window.loadDataValues) === 'function') {
+    // Forget the selected form, so dataValuesLoaded reloads the custom JS instead of ignoring
+    // what looks like DHIS 2 loading the same form twice
+    functionloader.lastSelectedForm = false;
+    window.loadDataValues();
+  } else {
+    functionloader.erase();
+    qbert.load();
+    functionloader.loadWithDelay();
+  }
+}
+
+/**
+ * Set up the inputs of a materialized vtab (in root) the way the inputs of the form were set up when it
+ * loaded: they get the name and class of their kind of entry field, and in data entry the handlers of
+ * DHIS 2 that save a value when it changes (saveVal), check it as it is typed (keyUp), highlight the
+ * field and show its history.  Option sets get their DHIS 2 autocomplete, if DHIS 2 has one.
+ */
+functionloader.setupEntryFields = function (root) {
+  $('.PEPFAR_Form_EntryField', root).find(':input').attr('name', 'entryfield').addClass('entryfield');
+  $('.PEPFAR_Form_OptionSet', root).find(':input').addClass('entryoptionset');
+  $('.PEPFAR_Form_Narrative', root).find(':input').attr('name', 'entryfield').addClass('entryarea');
+  if (typeof(window.saveVal) !== 'function') {
+    return;
+  }
+
+  $('.entryfield, .entryarea', root).each(function () {
+    var id = $(this).attr('id');
+    var split = id.split('-');
+    var dataElementId = split[0];
+    var optionComboId = split[1];
+    $(this).unbind('focus blur change dblclick keyup')
+      .focus(window.valueFocus)
+      .blur(window.valueBlur)
+      .change(function () {
+        saveVal(dataElementId, optionComboId, id);
+      })
+      .dblclick(function () {
+        viewHist(dataElementId, optionComboId);
+      })
+      .keyup(function (event) {
+        keyUp(event, dataElementId, optionComboId, id);
+      });
+  });
+  if (window.dhis2 && dhis2.de && typeof(dhis2.de.insertOptionSets) === 'function') {
+    dhis2.de.insertOptionSets();
+  }
+}
+
+/**
+ * Make the titles and show/hide links of the form (or of the part of it in root) expand and collapse
+ */
+functionloader.showAndHideTabs = function(root) {
+  $(function () {
+    $('.PEPFAR_Form_Title', root).click(function (e) {
+      $(this).toggleClass("expanded")
+      .next(".PEPFAR_Form_Collapse").slideToggle();
+
+      var divText = $(this).text(); 
+      var ls = window.localStorage.getItem('userCollapsed') || '{}';
+      ls = JSON.parse(ls);
+
+      if ($(this).hasClass('expanded')) {
+        // we are collapsing
+        ls[divText] = true;
+        var expandedCount = 0;
+        // after this element is collapsed, we check if any items are still expanded
+        // if all elements are collapsed, we need to change functionality to expand all`
+        // we check that all elements are collapsed, by seeing if count of expanded items === 0
+        $(this).parent().siblings().find('.PEPFAR_Form_Title').each(function(el) {
+            if (!$(this).hasClass('expanded')) {
+              expandedCount += 1;
+              return false;
+            }
+        })
+        if (expandedCount === 0) {
+          $(this).parent().siblings('.PEPFAR_Form_ShowHide').addClass('expanded');
+        }           
+      } else {
+        // we are expanding
+        ls[divText] = false;
+        // if expanding, we should make sure the default `Collapse All` is displayed
+        $(this).parent().siblings('.PEPFAR_Form_ShowHide').removeClass('expanded');
+      }  
+      window.localStorage.setItem('userCollapsed', JSON.stringify(ls)); 
+    });
+
+    $('.PEPFAR_Form_ShowHide', root).click(function (e) {
+        var ls = window.localStorage.getItem('userCollapsed') || '{}';
+        ls = JSON.parse(ls);
+        var currentlyExpandAll = $(this).hasClass('expanded'); //we are expanding if true
+
+        $(this).siblings().find('.PEPFAR_Form_Title').each(function (el) {
+        var divText = $(this).text();
+        ls[divText] = !currentlyExpandAll //userCollapsed is true if expanding is false (and vice versa)
+        if ($(this).hasClass('expanded') && currentlyExpandAll) {
+          $(this).removeClass('expanded')
+          .next(".PEPFAR_Form_Collapse").slideDown();
+        }
+        if (!$(this).hasClass('expanded') && !currentlyExpandAll) {
+          $(this).addClass('expanded')
+          .next(".PEPFAR_Form_Collapse").slideUp();
+        }      
+      })
+      
+      $(this).toggleClass("expanded");
+        window.localStorage.setItem('userCollapsed', JSON.stringify(ls)); 
+    });
+  });
+}
+
+if (!window.dhis2 || !window.jQuery) {
+  var dnj = document.createElement('script');
+  dnj.type = 'text/javascript';
+  dnj.async = false;
+  dnj.src = '/api/apps/Data-Approval/formJs/jqueryAndDhis.js';
+  dnj.onload = function () {
+    $ = jQuery;
+    functionloader.dataValuesLoaded('unknown dataset');
+    functionloader.showAndHideTabs();
+  };
+  (document.getElementsByTagName('head')[0] || document.getElementsByTagName('body')[0]).appendChild(dnj);
+} else {
+  functionloader.showAndHideTabs();
+}
+
+'use strict';
+
+/**
+ * CERULEAN: Make sections of forms designated "conditional" expandable and contractible
+ * @author: Greg Wilson <gwilson@baosystems.com> and Ben Guaraldi <ben@dhis2.org>
+ * @requires: jQuery
+ */
+
+var cerulean = {};
+
+/**
+ * Delete all of cerulean
+ */
+cerulean.erase = function () {
+  $('.cerulean').remove();
+}
+
+/**
+ * On load of form, add expand/collapse buttons and hide sections that do not have values
+ */
+cerulean.load = function () {
+  // Start with a clean slate
+  cerulean.erase();
+
+  // Add new buttons
+  var buttonDiv = '<div class="cerulean"><span><i class="fa fa-minus-square-o" aria-hidden="true"></i> Collapse</span><span><i class="fa fa-plus-square-o" aria-hidden="true"></i> Expand</span></div>';
+  var buttons = $(buttonDiv).appendTo('.PEPFAR_Form_Priority_conditional > .PEPFAR_Form_Description').click(function () {
+    cerulean.toggle(this);
+  });
+
+  // Set up initial state for each section, by considering each of the sets of buttons that was just created
+  buttons.each(function () {
+    // If there are no values, hide the conditional form section; otherwise, show it
+    cerulean.toggle(this, cerulean.hasValues(this));
+  });
+
+  var ls = window.localStorage.getItem('userCollapsed') || '{}';
+  ls = JSON.parse(ls);
+  $('.PEPFAR_Form_ShowHide').each(function (e) {
+    $(this).removeClass('expanded');
+    var expandedCount = 0;
+    $(this).siblings().find('.PEPFAR_Form_Title').each(function (el) {
+      let divText = $(this).text();
+      if (ls.hasOwnProperty(divText)) {
+        if (ls[divText]) {
+          $(this).addClass('expanded')
+          .next('.PEPFAR_Form_Collapse').slideUp();
+        } else {
+          $(this).removeClass('expanded')
+          .next('.PEPFAR_Form_Collapse').slideDown();
+        }  
+      }
+      if (!$(this).hasClass('expanded')) {
+        expandedCount += 1
+      }
+    })
+    if (expandedCount === 0) {
+      $(this).addClass('expanded');
+    }    
+  })  
+};
+
+/**
+ * If visible is true, show the conditional area
+ * If visible is false, hide the conditional area
+ * If visible is undefined, then reverse the visibility of the conditional area
+ * Also, make other necessary changes, like switching the text from Expand to Collapse or vice versa
+ */
+cerulean.toggle = function (buttonDiv, visible) {
+  var sectionTitleDiv = $(buttonDiv).parent().parent().parent();
+  if (visible === undefined) {
+    // Turn on or off the conditional form area
+    $(sectionTitleDiv).siblings().toggle();
+    // Reverse the visibility of the Expand and Collapse divs, so only one shows at a time
+    $(buttonDiv).children().toggle();
+  } else {
+    // If visible is true, show the conditional form area; otherwise, hide it
+    $(sectionTitleDiv).siblings().toggle(visible);
+    // If visible is true, show the Collapse button; otherwise, hide it
+    $(buttonDiv).children().first().toggle(visible);
+    // If visible is true, hide the Expand button; otherwise, show it
+    $(buttonDiv).children().last().toggle(!visible);
+  }
+};
+
+/**
+ * Test to see if a selector has values
+ */
+cerulean.hasValues = function(selector) {
+  // Get the entry fields
+  var fields = $(selector).parent().parent().parent().parent().find('[class*=Form_EntryField]');
+
+  // Consider them one at a time
+  for (var i = 0; i < fields.length; i++) {
+    var field = fields[i];
+    var input = $(field).find('input');
+    // Skip the total fields
+    if ($(field).attr('class').indexOf('tot') === -1) {
+      // Attempt to find the value using two different methods, as the html and css for
+      // the Data Entry app and the Data Approval app are different
+      var val = $(input).val();
+      if (typeof(val) === 'undefined') {
+        val = $(field).find('.val').text();
+        if (typeof(val) !== 'undefined' && val != '') {
+          return true;
+        }
+      } else if (val != '') {
+        return true;
+      }
+    }
+  }
+  // We looked at all of the inputs in all of the fields and we didn't find any values
+  return false;
+};
+
+'use strict';
+
+/**
+ * MEANY: Mutually Exclusivity Automatic Nickel Yak
+ *  Disables input fields based on user-entered data from rules 
+ *  created by mertide.py and established at form load
+ * @author: Greg Wilson <gwilson@baosystems.com> and Ben Guaraldi <ben@dhis2.org>
+ * @requires: dhis2 utils
+ */
+
+var meany = {};
+
+meany.sources = [];
+meany.operands = [];
+meany.rules = [];
+meany.inputrules = {};
+meany.elements = {};
+meany.loaded = false;
+
+/**
+ * Load the mutually exclusive rules (muex) of a rule table precompiled by mertide.py
+ * (see functionloader.registerRules).
+ *
+ * meany.sources is an array of operands, where each operand is an ssid and optionally an array
+ * of cocs that restrict it.  meany.operands is the array of input ids (de-coc-val) each operand
+ * covers, found by meany.index when the form is loaded.
+ *
+ * meany.rules is an array of rules, where one side of the rule is index 0 and the other side
+ * is index 1.  Each side is an array of indices of meany.operands.
+ *
+ * meany.inputrules is a hash, where the input id is the key and the value is an array of the numbers
+ * of the rules the input takes part in.  Rules are numbered from 1.  If the number is negative,
+ * the input is on the right side of the rule, and it refers to a flipped version of the rule
+ * represented by the equivalent positive number.
+ */
+meany.register = function (table) {
+  // Offset, in case more than one table is registered
+  var operandOffset = meany.sources.length;
+
+  table.operands.forEach(function (operand) {
+    meany.sources.push([table.ssids[operand[0]], operand.length > 1 ? operand[1].map(function (c) { return table.cocs[c]; }) : null]);
+  });
+
+  table.exclusive.forEach(function (rule) {
+    meany.rules.push([
+      rule[0].map(function (o) { return o + operandOffset; }),
+      rule[1].map(function (o) { return o + operandOffset; })
+    ]);
+  });
+};
+
+/**
+ * Find the input ids of each operand in the entry fields stella indexed for its ssid (leaving out
+ * the fields that don't reference one of its cocs), and index the rules by input
+ */
+meany.index = function () {
+  if (!stella.indexed) {
+    stella.buildIndex();
+  }
+  meany.operands = meany.sources.map(function (source) {
+    var ids = [];
+    (stella.fieldindex[source[0]] || []).forEach(function (field) {
+      if (field.id && ids.indexOf(field.id) === -1 && (!source[1] || stella.idHasCoc(field, source[1]))) {
+        ids.push(field.id);
+      }
+    });
+    return ids;
+  });
+  meany.inputrules = {};
+  meany.rules.forEach(function (rule, i) {
+    meany.indexRule(rule[0], i + 1);
+    meany.indexRule(rule[1], -1 * (i + 1));
+  });
+};
+
+/**
+ * Add a rule number to meany.inputrules for every input of the operands on one side of the rule
+ */
+meany.indexRule = function (side, n) {
+  side.forEach(function (o) {
+    meany.operands[o].forEach(function (id) {
+      if (!(id in meany.inputrules)) {
+        meany.inputrules[id] = [];
+      }
+      if (meany.inputrules[id].indexOf(n) === -1) {
+        meany.inputrules[id].push(n);
+      }
+    });
+  });
+};
+
+/**
+ * Delete all loaded rules
+ */
+meany.kill = function () {
+  meany.sources = [];
+  meany.operands = [];
+  meany.rules = [];
+  meany.inputrules = {};
+  meany.elements = {};
+  meany.loaded = false;
+};
+
+/**
+ * Reset all form fields to enabled
+ */
+meany.erase = function () {
+  $('.muex_disabled').prop('disabled', false).removeClass('muex_disabled').css('background-color', 'rgb(255, 255, 255)');
+  $('.muex_conflict').prop('disabled', false).removeClass('muex_conflict').css('background-color', 'rgb(255, 255, 255)');
+  meany.elements = {};
+  meany.loaded = false;
+};
+
+/**
+ * Run all of the rules to potentially disable relevant form fields
+ */
+meany.load = function () {
+  // meany.erase should have been run just before this, so all form fields are enabled
+  var updates = {};
+  meany.index();
+
+  for (var n = 1; n <= meany.rules.length; n++) {
+    // Evaluate the rule from both perspectives, to see if anything on the form
+    // needs to be disabled
+    meany.evaluateRuleConsequences(n, updates);
+    meany.evaluateRuleConsequences(-n, updates);
+  }
+  meany.apply(updates);
+
+  meany.loaded = true;
+};
+
+/**
+ * When a form value is changed, consider only the mutual exclusion rules the changed input
+ * takes part in to determine whether any form fields need to be disabled or enabled
+ */
+meany.changed = function (dv) {
+  var id = dv.de + '-' + dv.co + '-val';
+  var updates = {};
+
+  var element = meany.element(id);
+  if (element && $(element).hasClass('muex_conflict')) {
+    // The recently edited field has a conflict, so perhaps it needs to be disabled
+    updates[id] = meany.keepDisabled(id) ? meany.disabledState(id) : 'enabled';
+  }
+
+  (meany.inputrules[id] || []).forEach(function (n) {
+    meany.evaluateRuleConsequences(n, updates);
+  });
+
+  meany.apply(updates);
+};
+
+/**
+ * Given a rule number, return the operands on the side of the rule being looked at (index 0)
+ * and on the side whose fields may be disabled (index 1).  A negative number flips the rule, so
+ * "values in A mean that there should be no values in B" becomes "values in B mean there should
+ * be no values in A".
+ */
+meany.getRule = function (n) {
+  if (n > 0) {
+    return meany.rules[n - 1];
+  } else {
+    var original = meany.rules[(-1 * n) - 1];
+    return [original[1], original[0]];
+  }
+};
+
+/**
+ * Consider a specific mutual exclusion rule and decide whether any form fields need to be disabled or enabled,
+ * adding the decisions to updates.
+ *
+ * This function only considers one direction of the mutual exclusion, so it's looking at the fields on the left side
+ * to determine whether the fields on the right side should be disabled or enabled.
+ */
+meany.evaluateRuleConsequences = function (n, updates) {
+  var rule = meany.getRule(n);
+  var hasValues = meany.sideHasValues(rule[0]);
+
+  rule[1].forEach(function (o) {
+    meany.operands[o].forEach(function (id) {
+      // We disable the right side if there were any values in the left side;
+      // otherwise, we maybe enable it
+      if (hasValues) {
+        updates[id] = meany.disabledState(id);
+      } else if (meany.loaded && !(id in updates) && !meany.keepDisabled(id)) {
+        updates[id] = 'enabled';
+      }
+    });
+  });
+};
+
+/**
+ * Determine whether any input of any of the operands on one side of a rule has a value
+ */
+meany.sideHasValues = function (side) {
+  for (var o = 0; o < side.length; o++) {
+    var ids = meany.operands[side[o]];
+    for (var i = 0; i < ids.length; i++) {
+      if (meany.getVal(ids[i]) !== '') {
+        return true;
+      }
+    }
+  }
+  return false;
+};
+
+/**
+ * Since mutually exclusive rules are symmetric, check to see whether the other side of any rule
+ * the input takes part in has values, which means the input must remain disabled
+ */
+meany.keepDisabled = function (id) {
+  var numbers = meany.inputrules[id] || [];
+  for (var i = 0; i < numbers.length; i++) {
+    if (meany.sideHasValues(meany.getRule(numbers[i])[1])) {
+      return true;
+    }
+  }
+  return false;
+};
+
+/**
+ * A field that should be disabled is marked as a conflict instead if it already has a value
+ */
+meany.disabledState = function (id) {
+  return meany.getVal(id) !== '' ? 'conflict' : 'disabled';
+};
+
+/**
+ * Find (and remember) the input for an id
+ */
+meany.element = function (id) {
+  if (!(id in meany.elements)) {
+    meany.elements[id] = document.getElementById(id);
+  }
+  return meany.elements[id];
+};
+
+/**
+ * Get the value of an input, or of the equivalent span.val in reports
+ */
+meany.getVal = function (id) {
+  var element = meany.element(id);
+  if (element) {
+    return element.value;
+  }
+  var parts = id.split('-');
+  var val = $('span.val[data-de="' + parts[0] + '"][data-co="' + parts[1] + '"]').text();
+  return typeof(val) === 'undefined' ? '' : val;
+};
+
+/**
+ * Apply all of the decided changes to the form fields at once, touching only the fields
+ * whose state actually changes
+ */
+meany.apply = function (updates) {
+  for (var id in updates) {
+    var element = meany.element(id);
+    if (!element || element.readOnly) {
+      continue;
+    }
+    var classes = element.classList;
+    if (updates[id] === 'disabled') {
+      if (!element.disabled || !classes.contains('muex_disabled')) {
+        element.disabled = true;
+        classes.add('muex_disabled');
+        classes.remove('muex_conflict');
+      }
+    } else if (updates[id] === 'conflict') {
+      if (element.disabled || !classes.contains('muex_conflict')) {
+        element.disabled = false;
+        classes.add('muex_conflict');
+        classes.remove('muex_disabled');
+      }
+    } else if (classes.contains('muex_disabled') || classes.contains('muex_conflict')) {
+      element.disabled = false;
+      classes.remove('muex_disabled');
+      classes.remove('muex_conflict');
+    }
+  }
+};
+
+'use strict';
+
+/**
+ * STELLA: Sub Total ELement Lazy Adderupper
+ *  Adds up column, row, and group numeric totals
+ * @author: Greg Wilson <gwilson@baosystems.com> and Ben Guaraldi <ben@dhis2.org>
+ * @requires: dhis2 utils
+ */
+
+/**
+ * Assumptions:
+ * Specific subindicator ids (ssid) are wrapped in a class prefixed with 'si_' (for subindicator) 
+ *   followed by a unique 8 alnum (eg. si_aaaaaaaa)
+ * Each 'Form_EntryField' that contributed to a row or column count needs to have a
+ *   respective "rowX" and "colY" class to indicate which row/column it contributes to.
+ * Row total fields are readonly and have the class totrowX_aaaaaaaa where X is
+ *   the row number and aaaaaaa is the same 8 alnum as the si_ class
+ * Column total fields are readonly and have the class totcolY_aaaaaaaa where Y is
+ *   the column number and aaaaaaa is the same 8 alnum as the si_ class
+ * Grand "subtotal" fields are readonly and have the class total_aaaaaaaa where
+ *   aaaaaaa is the same 8 alnum as the si_ class
+ */
+
+var stella = {};
+
+stella.autocalcindex = {};
+stella.autocalcrules = [];
+
+/**
+ * Load autocalc rules into stella.autocalcrules and stella.autocalcindex.
+ *
+ * stella.autocalcrules is an array of rules, where each rule has an array of operands to sum as index 0
+ * and a single target to put that sum as index 1.   Each source could either be one specific subindicator id 
+ * (ssid) or an array with index 0 as an ssid and index 1 with a set of category option combos (coc).
+ *
+ * stella.autocalcindex is a hash, where the ssid is the key and the value is an array of indices
+ * of rules from stella.autocalcrules.
+ */
+stella.autocalc = function (source, target) {
+  // Add the rule to autocalcrules
+  stella.autocalcrules.push([source, target]);
+
+  // Consider each operand of the source
+  source.forEach(function(s) {
+    // s[0] is the ssid, which is the key for autocalcindex
+    // (s[1], if it exists, is an array of cocs to consider;
+    // any other cocs are ignored)
+
+    // If we haven't seen this ssid, make an empty array for it
+    if (!(s[0] in stella.autocalcindex)) {
+      stella.autocalcindex[s[0]] = [];
+    }
+
+    // Add this rule to autocalcindex if it's not already there
+    if (stella.autocalcindex[s[0]].indexOf(stella.autocalcrules.length - 1) === -1) {
+      stella.autocalcindex[s[0]].push(stella.autocalcrules.length - 1);
+    }
+  });
+};
+
+/**
+ * Load the autocalc rules of a rule table precompiled by mertide.py (see functionloader.registerRules).
+ * Each rule is expanded from indices back into ssids and cocs and loaded with stella.autocalc.
+ */
+stella.register = function (table) {
+  var operands = table.operands.map(function (operand) {
+    var o = [table.ssids[operand[0]]];
+    if (operand.length > 1) {
+      o.push(operand[1].map(function (c) { return table.cocs[c]; }));
+    }
+    return o;
+  });
+
+  table.autocalc.forEach(function (rule) {
+    stella.autocalc(rule[0].map(function (o) { return operands[o]; }), [[table.ssids[rule[1]]]]);
+  });
+};
+
+/**
+ * Delete all loaded autocalculations
+ */
+stella.kill = function () {
+  stella.autocalcindex = {};
+  stella.autocalcrules = [];
+  stella.clearIndex();
+};
+
+/**
+ * Remove all displayed autocalculations
+ */
+stella.erase = function () {
+  $('[class*="si_"]').find('.input_total').html('<span class="word_subtotal">Subtotal</span>');
+  stella.clearIndex();
+};
+
+/**
+ * Forget the indices of the form's DOM elements, so they are rebuilt on the next load
+ */
+stella.clearIndex = function () {
+  stella.indexed = false;
+  stella.fieldindex = {};
+  stella.inputindex = {};
+  stella.displayindex = {};
+};
+
+/**
+ * Build the indices of the form's DOM elements, so that a changed value only touches
+ * the subtotals it contributes to.
+ *
+ * stella.fieldindex is a hash, where the ssid is the key and the value is an array of the entry
+ * fields (except for 'tot' fields) in that ssid.  Each entry field records its DOM element, its input
+ * (if any), its id (de-coc-val, or the same made from the data-de and data-co of a span.val in reports),
+ * and the row and column slices it contributes to.
+ *
+ * stella.inputindex is a hash, where de-coc is the key and the value is an array of the ssids
+ * containing that input.
+ *
+ * stella.displayindex caches the '.input_total' elements for each display selector.
+ */
+stella.buildIndex = function () {
+  stella.clearIndex();
+  $('[class*="si_"]').each(function () {
+    var ssid = this.className.match('si_(.{8})')[1];
+    if (!(ssid in stella.fieldindex)) {
+      stella.fieldindex[ssid] = [];
+    }
+
+    $(this).find('[class*=Form_EntryField]').not('[class*=tot]').each(function () {
+      var field = {
+        div: this,
+        input: $(this).find('input')[0],
+        id: stella.fieldId(this),
+        row: this.className.indexOf('row') !== -1 ? this.className.match('row\\d') : null,
+        col: this.className.indexOf('col') !== -1 ? this.className.match('col\\d') : null
+      };
+      field.row = field.row && field.row[0];
+      field.col = field.col && field.col[0];
+      stella.fieldindex[ssid].push(field);
+
+      // Index the ssid by the data element and category option combo of the field
+      if (field.id) {
+        var key = field.id.split('-').slice(0, 2).join('-');
+        if (!(key in stella.inputindex)) {
+          stella.inputindex[key] = [];
+        }
+        if (stella.inputindex[key].indexOf(ssid) === -1) {
+          stella.inputindex[key].push(ssid);
+        }
+      }
+    });
+  });
+  stella.indexed = true;
+};
+
+/**
+ * Update rows, columns, non-custom and custom totals when loading the page
+ */
+stella.load = function () {
+  stella.buildIndex();
+
+  for (var ssid in stella.fieldindex) { // Use the ssid to sum
+    stella.sumSlice(ssid, 'row');       // the rows,
+    stella.sumSlice(ssid, 'col');       // the columns,
+    stella.sumTotal([[ssid]], ssid);    // and the non-custom totals
+  }
+
+  // For the custom totals, simply consider every rule once
+  for (var r = 0; r < stella.autocalcrules.length; r++) {
+    stella.sumTotal(stella.autocalcrules[r][0], stella.autocalcrules[r][1]);
+  }
+};
+
+/**
+ * When a form value is changed, consider autocalculation of rows, columns, totals, and custom rules 
+ * to determine whether any form fields need to be changed
+ */
+stella.changed = function (dv) {
+  if (!stella.indexed) {
+    stella.buildIndex();
+  }
+
+  // Find the particular sub indicator groups that were modified using the de and co properties 
+  // of dv from DHIS 2's dataValueSaved function
+  var ssids = stella.inputindex[dv.de + '-' + dv.co] || [];
+
+  ssids.forEach(function (ssid) {       // For each ssid, look at the related
+    stella.sumSlice(ssid, 'row');       // rows,
+    stella.sumSlice(ssid, 'col');       // columns,
+    stella.sumTotal([[ssid]], ssid);    // totals,
+    if (ssid in stella.autocalcindex) { // and custom rules
+      stella.autocalcindex[ssid].forEach(function(e) {
+        stella.sumTotal(stella.autocalcrules[e][0], stella.autocalcrules[e][1]);
+      });
+    }
+  });
+};
+
+/**
+ * Calculate the sums of a certain kind of slice of an ssid, usually either a row or a column
+ */
+stella.sumSlice = function (ssid, slice) {
+  // An array to save the various sums of slices
+  var slices = [];
+
+  // Consider all of the entry fields of ssid that are in a slice
+  (stella.fieldindex[ssid] || []).forEach(function (field) {
+    var s = field[slice];
+    if (s) {
+      var val = stella.getVal(field);
+      if (!slices[s]) {
+        slices[s] = 0;
+      }
+      if (!isNaN(val)) {
+        slices[s] += +val;
+      }
+    }
+  });
+
+  // Take all slices that we found display the sum we calculated
+  for (var s in slices) {
+    stella.display('.tot' + s + '_' + ssid, slices[s]);
+  }
+};
+
+/**
+ * Calculate the total sum for source, which is an array of operands, each with either just an ssid or an ssid
+ * and cocs that restrict it.  Then place that total sum in target.  If created in an HTML template file, the
+ * source and target will be the same ssid.  If specified in the CSV control file, they may be the same, but are
+ * more likely to be different.
+ */
+stella.sumTotal = function (source, target) {
+  var total = 0;
+
+  // Consider each operand in source
+  source.forEach(function (s) {
+    var ssid = s[0];
+    var cocs = s[1];
+
+    // Consider all of the entry fields of ssid
+    (stella.fieldindex[ssid] || []).forEach(function (field) {
+      // If we're only selecting a specific category option combo, check to see whether 
+      // this input has an id and whether that coc is referenced in that id
+      if (!cocs || stella.idHasCoc(field, cocs)) {
+        // If we get a value, add it to the total
+        var val = stella.getVal(field);
+        if (!isNaN(val)) {
+          total += +val;
+        }
+      }
+    });
+  });
+
+  // Display the total sum in all DOM elements that match '.total_' + target.  (target is an ssid.)
+  if (source.length) {
+    stella.display('.total_' + target, total);
+  }
+};
+
+/**
+ * Format a value and display it in all DOM elements matching selector.
+ * If value is 0, show the text Subtotal in a small font.
+ */
+stella.display = function (selector, value) {
+  if (!(selector in stella.displayindex)) {
+    stella.displayindex[selector] = $(selector).find('.input_total');
+  }
+  var totals = stella.displayindex[selector];
+  if (value > 0) {
+    // Round to 2 sig figs
+    if (value.toFixed(2).indexOf('.00') == -1) {
+      value = value.toFixed(2);
+    }
+    totals.text(value);
+  } else {
+    totals.html('<span class="word_subtotal">Subtotal</span>');
+  }
+};
+
+/**
+ * Get the DHIS 2 data value of an indexed entry field
+ */
+stella.getVal = function(field) {
+  // Try to get the value through the input of the field
+  if (field.input) {
+    return field.input.value;
+  }
+
+  // We don't have an input, so we are in reports instead
+  return parseInt($(field.div).find('.val').text());
+};
+
+/**
+ * Find the id of the input in an entry field, or make the equivalent id from
+ * the data-de and data-co attributes of its span.val in reports
+ */
+stella.fieldId = function (w) {
+  var x = $(w).find('input');
+  if (x.length) {
+    return x.attr('id');
+  }
+  x = $(w).find('span.val');
+  if (x.length) {
+    return x.attr('data-de') + '-' + x.attr('data-co') + '-val';
+  }
+  return undefined;
+};
+
+/**
+ * Determine whether the id of an indexed entry field references a coc
+ */
+stella.idHasCoc = function (field, cocs) {
+  if (!field.id) {
+    return false;
+  }
+
+  for (var c = 0; c < cocs.length; c++) {
+    if (field.id.indexOf(cocs[c]) !== -1) {
+      return true;
+    }
+  }
+
+  return false;
+};
+
+'use strict';
+
+/**
+ * qbert: Quarter Based Form Locking
+ *  Hides subforms if not in currently selected time period
+ * @author: Greg Wilson <gwilson@baosystems.com>
+ * @requires: dhis2 utils
+ */
+
+/**
+ * Assumptions:
+ */
+
+var qbert = {};
+
+//get the currently selected dataset/period/org
+qbert.getPeriod = function () {
+  return $('#selectedPeriodId').val();
+};
+
+qbert.erase = function () {
+  $('.expanded').parent().find('input').each(function () {
+    qbert._enable(this);
+  });
+  $('.expanded').parent().find('textarea').each(function () {
+    qbert._enable(this);
+  });
+  $('.expanded').removeClass('expanded').removeClass('ic_title_disabled').next('.PEPFAR_Form_Collapse').slideDown();
+};
+
+qbert.eraseForm = function (form) {
+  //Expand
+  $(form).removeClass('expanded').next(".PEPFAR_Form_Collapse").slideDown();
+  //reset the Title
+  $(form).removeClass('ic_title_disabled');
+  //make sure the title class is present
+  //$(form).addClass('PEPFAR_Form_Title'); //Not sure why this was necessary (TH)
+  //set input elements as RO
+  $(form).parent().find("input").each(function () {
+    qbert._enable(this);
+  });
+  $(form).parent().find("textarea").each(function () {
+    qbert._enable(this);
+  });
+  //remove warning text
+  //        append("div").removeClass("cadenceWarning").html("");
+};
+
+//find and disable form elements
+qbert.disable = function (form) {
+  //Collapse
+  $(form).addClass('expanded').next(".PEPFAR_Form_Collapse").slideUp('fast');
+  //grey out title
+  $(form).addClass('ic_title_disabled');
+  //remove existing Title Class (for collapse/expanding)
+  //$(form).removeClass('PEPFAR_Form_Title'); //Not sure why this was necessary (TH)
+  //set input elements as RO
+  $(form).parent().find("input").each(function () {
+    qbert._disable(this);
+  });
+  //set textarea elements as RO
+  $(form).parent().find("textarea").each(function () {
+    qbert._disable(this);
+  });
+  //set select elements as RO
+  $(form).parent().find("select").each(function () {
+    qbert._disable(this);
+  });
+  //add warning text
+  //        append("div").addClass("cadenceWarning").html("Invalid time period. Data entry disabled.");
+};
+
+//disable a form element
+qbert._disable = function (elem) {
+  $(elem).addClass('ic_disabled').prop('disabled', true);
+};
+
+qbert._enable = function (elem) {
+  $(elem).removeClass('ic_disabled').prop('disabled', false).removeClass("ic_conflict");
+};
+
+/**
+ * On-load method to update which sections are visible
+ */
+qbert.load = function () {
+  var period = qbert.getPeriod();
+  
+  //If the period is not found we are probably not in the data entry app, exit
+  if (period == undefined) {
+      return;
+  }
+  
+  //parse the current period
+  var re = /20[1-9][0-9]Q([1-4])/; //we don't expect this to be running in 2100
+  var found = period.match(re);
+
+  if (found !== null) {
+    //Reset the indicators
+    var noentry = $(".ic_title_disabled");
+    $(noentry).each(function () {
+      qbert.eraseForm(this);
+    });
+
+    //only show annual in Q4 of FYOCT
+    if (found[1] === '4' || found[1] === '1' || found[1] === '2') {
+      var anns = $(".PEPFAR_Form_Title_Annually");
+      $(anns).each(function () {
+        qbert.disable(this);
+      });
+    }
+    //only show semi in Q2, Q4 of FYOCT
+    if (found[1] === '4' || found[1] === '2') {
+      var qs = $(".PEPFAR_Form_Title_Semiannually");
+      $(qs).each(function () {
+        qbert.disable(this);
+      });
+    }
+    //always show quarterly (PEPFAR_Form_Title_Quarterly)
+  }
+};
@@ -0,0 +1 @@
+mertideOffline.form({"name":"Testing DataSet Less Than","dataValuesLoaded":"","html":"\t<li class=\"ui-corner-left\"><a href=\"#PEPFAR_Tabs_vertical_1\">Vertical Tab</a></li>\n</ul>\n\n<div id=\"PEPFAR_Tabs_vertical_1\">\n<div id=\"PEPFAR_Tabs_h_1\">\n<ul class=\"ui-helper-hidden\">\n\t<li><a href=\"#PEPFAR_Form_1_DSD\">DSD</a></li>\n</ul>\n\n<div id=\"PEPFAR_Form_1_DSD\">\n<p class=\"PEPFAR_Form_ShowHide\">&nbsp;</p>\n\n<!-- DSD: LT_01 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">LT_01</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid1}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">LT Test 1</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Numerator</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"aWRuc7BJ4uy-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid2}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SohfJfRn87x-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SohfJfRn87x-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SohfJfRn87x-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SohfJfRn87x-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SohfJfRn87x-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SohfJfRn87x-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SohfJfRn87x-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SohfJfRn87x-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD LT_01 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: LT_02 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">LT_02</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid3}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">LT Test 2 (Addition) - This and the following box are the \"Numerator\" and coarse disagg should be less than or equal to it.</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Female</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"mCjJDRtmy1A-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid4}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\"></div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Male</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"WqYHJWMB8yM-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid5}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"kS3brp4gygT-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"kS3brp4gygT-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"kS3brp4gygT-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"kS3brp4gygT-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"kS3brp4gygT-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"kS3brp4gygT-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"kS3brp4gygT-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"kS3brp4gygT-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD LT_02 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: LT_03 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">LT_03</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid6}\">\n\t<!-- <categoryCombo name=\"valtest: Sex\" id=\"GUsatp3km1J\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">LT Test 3 Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Female</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"egeaAnq5kIm-y16fHbQhymI-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Male</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"egeaAnq5kIm-jgTd0VsZFbG-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid7}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Follow up question of only female component</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\"></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"KZm16Sncap4-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD LT_03 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: LT_04 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">LT_04</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid8}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">LT Test 4 Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ulbJrm4a07h-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ulbJrm4a07h-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ulbJrm4a07h-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ulbJrm4a07h-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ulbJrm4a07h-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ulbJrm4a07h-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ulbJrm4a07h-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ulbJrm4a07h-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid9}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Follow up question of only female component</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\"></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"xZxWXjtCvJs-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD LT_04 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: LT_05 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">LT_05</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid10}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">LT Test 5 Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MFzQZrk3JoV-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MFzQZrk3JoV-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MFzQZrk3JoV-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MFzQZrk3JoV-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid10}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MFzQZrk3JoV-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MFzQZrk3JoV-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MFzQZrk3JoV-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MFzQZrk3JoV-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid10}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid10}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid11}\">\n\t<!-- <categoryCombo name=\"valtest: Sex\" id=\"GUsatp3km1J\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Follow up questions should be less than each sex individually</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Female</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"iS1JOqv2RBM-y16fHbQhymI-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Male</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"iS1JOqv2RBM-jgTd0VsZFbG-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid11}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD LT_05 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: LT_05 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">LT_05</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid12}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">LT Test 6, 2 is less than 1, 3 is less than 2</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">One</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"ACvjFHvWwhS-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Two</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"aF9mFHaBf3m-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Three</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"XERjTeP4lJ4-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD LT_05 --></div>\n\n<p>&nbsp;</p>\n\n</div>\n</div>\n</div>\n<script type=\"text/javascript\">\n$('#PEPFAR_Tabs_vertical').tabs({\n  beforeActivate: function (event, ui) {\n    functionloader.materializeTab(ui.newPanel[0]);\n  }\n}).removeClass('ui-tabs').find('ul').removeClass('ui-helper-hidden');\n$('#PEPFAR_Tabs_vertical li').removeClass('ui-corner-top');\n$('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');\n</script></div>\n</div>\n<!-- End Custom DHIS2 Form -->\n\n","attributeCombo":false,"dataElements":[["aWRuc7BJ4uy","PUBLIC - LT_01: Fine"],["SohfJfRn87x","PUBLIC - LT_01: Coarse"],["mCjJDRtmy1A","PUBLIC - LT_02: Female"],["WqYHJWMB8yM","PUBLIC - LT_02: Male"],["kS3brp4gygT","PUBLIC - LT_02: Coarse"],["egeaAnq5kIm","PUBLIC - LT_03: Sex"],["KZm16Sncap4","PUBLIC - LT_03: Default"],["ulbJrm4a07h","PUBLIC - LT_04: Coarse"],["xZxWXjtCvJs","PUBLIC - LT_04: Default"],["MFzQZrk3JoV","PUBLIC - LT_05: Coarse"],["iS1JOqv2RBM","PUBLIC - LT_05: Sex"],["ACvjFHvWwhS","PUBLIC - LT_06: Def 1"],["aF9mFHaBf3m","PUBLIC - LT_06: Def 2"],["XERjTeP4lJ4","PUBLIC - LT_06: Def 3"]],"optionCombos":[["ZyfQ4TCVUzR","15+, Female, Negative"],["jgTd0VsZFbG","Male"],["syoxO60kaBs","<15, Female, Negative"],["fMJDGka70UV","15+, Male, Negative"],["lwN0Zclhn1c","<15, Male, Positive"],["xOtz2rhdmZU","<15, Female, Positive"],["sVJ3ZVJwsrR","15+, Male, Positive"],["HllvX50cXC0","default"],["ZfBpKlBfuiQ","<15, Male, Negative"],["CqeUNqRBN0z","15+, Female, Positive"],["y16fHbQhymI","Female"]]});
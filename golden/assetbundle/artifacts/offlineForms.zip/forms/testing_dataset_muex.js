@@ -0,0 +1 @@
+mertideOffline.form({"name":"Testing DataSet Muex","dataValuesLoaded":"      functionloader.registerRules({\"ssids\":[\"{ssid1}\",\"{ssid2}\",\"{ssid3}\",\"{ssid4}\",\"{ssid5}\",\"{ssid6}\",\"{ssid7}\",\"{ssid8}\",\"{ssid9}\",\"{ssid10}\"],\"cocs\":[\"mUlCakOSrf8\",\"hWEikgijRY5\",\"DTenq9S8usj\"],\"operands\":[[0],[1],[2],[3],[4],[5],[6],[7],[8],[9,[0]],[9,[1]],[9,[2]]],\"autocalc\":[],\"exclusive\":[[[0],[1]],[[1],[0]],[[2],[3]],[[4],[5]],[[6],[7]],[[8],[7]],[[9],[10]],[[9],[11]],[[10],[11]]]});\n","html":"\t<li class=\"ui-corner-left\"><a href=\"#PEPFAR_Tabs_vertical_1\">Vertical Tab</a></li>\n</ul>\n\n<div id=\"PEPFAR_Tabs_vertical_1\">\n<div id=\"PEPFAR_Tabs_h_1\">\n<ul class=\"ui-helper-hidden\">\n\t<li><a href=\"#PEPFAR_Form_1_DSD\">DSD</a></li>\n</ul>\n\n<div id=\"PEPFAR_Form_1_DSD\">\n<p class=\"PEPFAR_Form_ShowHide\">&nbsp;</p>\n\n<!-- DSD: muex_01 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_01</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid1}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Fine and Sex and HIV Status\" id=\"C7pZ8mLT1op\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 1 Test: Communactive</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-itd3raLwPsp-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-e4bzs5GxZGm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-Z2A8wXrOTth-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-piFRKmvpegq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-T46LRcO7hld-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-NhMi3bgsTac-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-rTVaJG2nxHI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cKUvED77YSn-a6wysjILDDa-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-Y2tpTbnSyY1-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-mbEIHyDEEyh-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-lRdL3o512s7-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-Bzg77lnK2Oq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-okriq2ra0Ay-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-SnZ2xYrUjRI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-lnnwKV6YRDA-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cKUvED77YSn-CvsypjsIdPX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid2}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"M6HJnCEHdqu-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"M6HJnCEHdqu-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"M6HJnCEHdqu-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"M6HJnCEHdqu-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"M6HJnCEHdqu-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"M6HJnCEHdqu-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"M6HJnCEHdqu-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"M6HJnCEHdqu-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_01 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_02 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_02</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid3}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Fine and Sex and HIV Status\" id=\"C7pZ8mLT1op\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rules 2 Test: Triple Bang</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-itd3raLwPsp-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-e4bzs5GxZGm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-Z2A8wXrOTth-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-piFRKmvpegq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-T46LRcO7hld-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-NhMi3bgsTac-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-rTVaJG2nxHI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"urExnxqDstx-a6wysjILDDa-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid3}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-Y2tpTbnSyY1-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-mbEIHyDEEyh-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-lRdL3o512s7-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-Bzg77lnK2Oq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-okriq2ra0Ay-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-SnZ2xYrUjRI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-lnnwKV6YRDA-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"urExnxqDstx-CvsypjsIdPX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid3}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid3}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid4}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZIyA9jqk4Eb-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZIyA9jqk4Eb-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZIyA9jqk4Eb-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZIyA9jqk4Eb-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid4}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZIyA9jqk4Eb-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZIyA9jqk4Eb-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZIyA9jqk4Eb-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZIyA9jqk4Eb-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid4}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid4}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_02 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_03 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_03</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid5}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Fine and Sex and HIV Status\" id=\"C7pZ8mLT1op\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 3: Repeated Muex</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-itd3raLwPsp-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-e4bzs5GxZGm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-Z2A8wXrOTth-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-piFRKmvpegq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-T46LRcO7hld-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-NhMi3bgsTac-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-rTVaJG2nxHI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-a6wysjILDDa-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-Y2tpTbnSyY1-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-mbEIHyDEEyh-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-lRdL3o512s7-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-Bzg77lnK2Oq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-okriq2ra0Ay-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-SnZ2xYrUjRI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-lnnwKV6YRDA-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-CvsypjsIdPX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid6}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_03 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_04 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_04</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid11}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine - Not Mutually Exclusive and Sex and HIV Status\" id=\"T0iFf9QjUjr\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 4: Two Row Muex with Options</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-19</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">20-24</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">25-29</div>\n\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-HaXdnWjI1mN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-Qd0uTr2Df9k-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-ZWPt3GRmBFm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-vHSA3OxElS2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-WPEAIFUu5a2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-LP5MQ3dRkPZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-PX6Ls0fC6EZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-PjcOR0v6egX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-pVSSJRSpqwy-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-zy9VW6WQbNW-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-QtXiIwFvhpf-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"KBpZuKgQigT-XA3PWLZWbfC-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid11}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-IwII6nCtYax-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-gZvoEMR4uAc-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-cy1pyVQnjiv-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-hZ9mbNaWRdD-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-drHVzru5m4o-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-uRwXZcZ1P0R-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-gJm0rDUYm6C-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-o8YxLOwJrYJ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-VwQuwxiy9Fe-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-lwWBSzeSwN8-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-irW98YPtxJN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"KBpZuKgQigT-n4TeYFMq1W6-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid11}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid11}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid12}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine - Not Mutually Exclusive and Sex and HIV Status\" id=\"T0iFf9QjUjr\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">1524</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-24</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"cQveat5PZPs-O6ln19QsVLG-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"cQveat5PZPs-NKKzcaB1G0A-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"cQveat5PZPs-moq7cIhTBOI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"cQveat5PZPs-zM1oifGsdVV-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid12}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_04 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_05 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_05</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid7}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine - Not Mutually Exclusive and Sex and HIV Status\" id=\"T0iFf9QjUjr\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 5: Three Row Muex with Options</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-19</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">20-24</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">25-29</div>\n\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-HaXdnWjI1mN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-Qd0uTr2Df9k-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-ZWPt3GRmBFm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-vHSA3OxElS2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-WPEAIFUu5a2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-LP5MQ3dRkPZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-PX6Ls0fC6EZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-PjcOR0v6egX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-pVSSJRSpqwy-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-zy9VW6WQbNW-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-QtXiIwFvhpf-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"Gf9kY8LSr0z-XA3PWLZWbfC-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid7}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-IwII6nCtYax-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-gZvoEMR4uAc-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-cy1pyVQnjiv-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-hZ9mbNaWRdD-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-drHVzru5m4o-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-uRwXZcZ1P0R-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-gJm0rDUYm6C-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-o8YxLOwJrYJ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-VwQuwxiy9Fe-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-lwWBSzeSwN8-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-irW98YPtxJN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"Gf9kY8LSr0z-n4TeYFMq1W6-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid7}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid7}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid9}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine - Not Mutually Exclusive and Sex and HIV Status\" id=\"T0iFf9QjUjr\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">1524</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-24</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"FnmUM0FIwhU-O6ln19QsVLG-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"FnmUM0FIwhU-NKKzcaB1G0A-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"FnmUM0FIwhU-moq7cIhTBOI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"FnmUM0FIwhU-zM1oifGsdVV-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid9}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid8}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SxN0rewi2Ho-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SxN0rewi2Ho-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SxN0rewi2Ho-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"SxN0rewi2Ho-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SxN0rewi2Ho-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SxN0rewi2Ho-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SxN0rewi2Ho-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"SxN0rewi2Ho-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_05 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_06 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_06</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid13}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine - Not Mutually Exclusive and Sex and HIV Status\" id=\"T0iFf9QjUjr\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 6: Same html superfine muex rule with R</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid13}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-19</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">20-24</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">25-29</div>\n\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-HaXdnWjI1mN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-Qd0uTr2Df9k-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-ZWPt3GRmBFm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-vHSA3OxElS2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-WPEAIFUu5a2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-LP5MQ3dRkPZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-PX6Ls0fC6EZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-PjcOR0v6egX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-pVSSJRSpqwy-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-zy9VW6WQbNW-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-QtXiIwFvhpf-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"gkggNkElZtA-XA3PWLZWbfC-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid13}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-IwII6nCtYax-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-gZvoEMR4uAc-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-cy1pyVQnjiv-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-hZ9mbNaWRdD-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-drHVzru5m4o-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-uRwXZcZ1P0R-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-gJm0rDUYm6C-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-o8YxLOwJrYJ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-VwQuwxiy9Fe-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-lwWBSzeSwN8-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-irW98YPtxJN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"gkggNkElZtA-n4TeYFMq1W6-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid13}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Conditional</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\"></div>\n\t\t\t</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"usYla9ZCngJ-O6ln19QsVLG-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"usYla9ZCngJ-NKKzcaB1G0A-val\" /></div>\n\t\t</div\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"usYla9ZCngJ-moq7cIhTBOI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"usYla9ZCngJ-zM1oifGsdVV-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD muex_06 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_07 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_07</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid14}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine - Not Mutually Exclusive and Sex and HIV Status\" id=\"T0iFf9QjUjr\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 7: Same html superfine muex rule without R</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid14}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-19</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">20-24</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">25-29</div>\n\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-HaXdnWjI1mN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-Qd0uTr2Df9k-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-ZWPt3GRmBFm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-vHSA3OxElS2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-WPEAIFUu5a2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-LP5MQ3dRkPZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-PX6Ls0fC6EZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-PjcOR0v6egX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-pVSSJRSpqwy-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-zy9VW6WQbNW-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-QtXiIwFvhpf-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"MTV4BBpw8AU-XA3PWLZWbfC-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid14}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-IwII6nCtYax-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-gZvoEMR4uAc-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-cy1pyVQnjiv-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-hZ9mbNaWRdD-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-drHVzru5m4o-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-uRwXZcZ1P0R-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-gJm0rDUYm6C-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-o8YxLOwJrYJ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-VwQuwxiy9Fe-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-lwWBSzeSwN8-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-irW98YPtxJN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"MTV4BBpw8AU-n4TeYFMq1W6-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid14}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Conditional</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\"></div>\n\t\t\t</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"X6ZEFYCeuX2-O6ln19QsVLG-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"X6ZEFYCeuX2-NKKzcaB1G0A-val\" /></div>\n\t\t</div\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"X6ZEFYCeuX2-moq7cIhTBOI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"X6ZEFYCeuX2-zM1oifGsdVV-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD muex_07 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_08 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_08</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid10}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 8: These three boxes should be MUEX with eathother. This is probably a very niche feature though.</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">One</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"mUlCakOSrf8-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Two</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"hWEikgijRY5-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Three</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"DTenq9S8usj-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD muex_08 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: muex_09 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_09</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid15}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Fine and Sex and HIV Status\" id=\"C7pZ8mLT1op\"/> -->\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 9: Female MUEX Female, Male MUEX Male, same line</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-itd3raLwPsp-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-e4bzs5GxZGm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-Z2A8wXrOTth-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-piFRKmvpegq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-T46LRcO7hld-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-NhMi3bgsTac-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-rTVaJG2nxHI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"ZdWQ4niEIlx-a6wysjILDDa-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid15}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-Y2tpTbnSyY1-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-mbEIHyDEEyh-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-lRdL3o512s7-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-Bzg77lnK2Oq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-okriq2ra0Ay-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-SnZ2xYrUjRI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-lnnwKV6YRDA-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"ZdWQ4niEIlx-CvsypjsIdPX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid15}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 9: Female MUEX Female, Male MUEX Male, same line</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row3\"><input id=\"UbtNQ9fglYW-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row3\"><input id=\"UbtNQ9fglYW-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row3\"><input id=\"UbtNQ9fglYW-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row3\"><input id=\"UbtNQ9fglYW-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow3_{ssid15}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row4\"><input id=\"UbtNQ9fglYW-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row4\"><input id=\"UbtNQ9fglYW-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row4\"><input id=\"UbtNQ9fglYW-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row4\"><input id=\"UbtNQ9fglYW-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow4_{ssid15}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid15}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_09 --></div>\n\n<p>&nbsp;</p>\n\n</div>\n</div>\n</div>\n<script type=\"text/javascript\">\n$('#PEPFAR_Tabs_vertical').tabs({\n  beforeActivate: function (event, ui) {\n    functionloader.materializeTab(ui.newPanel[0]);\n  }\n}).removeClass('ui-tabs').find('ul').removeClass('ui-helper-hidden');\n$('#PEPFAR_Tabs_vertical li').removeClass('ui-corner-top');\n$('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');\n</script></div>\n</div>\n<!-- End Custom DHIS2 Form -->\n\n","attributeCombo":false,"dataElements":[["cKUvED77YSn","PUBLIC - MUEX_01: Fine"],["M6HJnCEHdqu","PUBLIC - MUEX_01: Coarse"],["urExnxqDstx","PUBLIC - MUEX_02: Fine"],["ZIyA9jqk4Eb","PUBLIC - MUEX_02: Coarse"],["HZg0843PdL5","PUBLIC - MUEX_03: Fine"],["XQRueys4hrU","PUBLIC - MUEX_03: Coarse"],["KBpZuKgQigT","PUBLIC - MUEX_04: Superfine Not Mut Ex"],["cQveat5PZPs","PUBLIC - MUEX_04: Coarse Not Mut Ex"],["Gf9kY8LSr0z","PUBLIC - MUEX_05: Superfine Not Mut Ex"],["FnmUM0FIwhU","PUBLIC - MUEX_05: Coarse Not Mut Ex"],["SxN0rewi2Ho","PUBLIC - MUEX_05: Coarse"],["gkggNkElZtA","PUBLIC - MUEX_06: Superfine Not Mut Ex"],["usYla9ZCngJ","PUBLIC - MUEX_06: Coarse Not Mut Ex"],["MTV4BBpw8AU","PUBLIC - MUEX_07: Superfine Not Mut Ex"],["X6ZEFYCeuX2","PUBLIC - MUEX_07: Coarse Not Mut Ex"],["mUlCakOSrf8","PUBLIC - MUEX_08: Def 1"],["hWEikgijRY5","PUBLIC - MUEX_08: Def 2"],["DTenq9S8usj","PUBLIC - MUEX_08: Def 3"],["ZdWQ4niEIlx","PUBLIC - MUEX_09: Fine"],["UbtNQ9fglYW","PUBLIC - MUEX_09: Coarse"]],"optionCombos":[["vHSA3OxElS2","10-14, Male, Positive"],["okriq2ra0Ay","15-29, Female, Negative"],["IwII6nCtYax","0-9, Female, Negative"],["ZWPt3GRmBFm","10-14, Female, Positive"],["Z2A8wXrOTth","10-14, Female, Positive"],["ZyfQ4TCVUzR","15+, Female, Negative"],["piFRKmvpegq","10-14, Male, Positive"],["gZvoEMR4uAc","0-9, Male, Negative"],["syoxO60kaBs","<15, Female, Negative"],["fMJDGka70UV","15+, Male, Negative"],["gJm0rDUYm6C","20-24, Female, Negative"],["lwWBSzeSwN8","25-29, Male, Negative"],["lnnwKV6YRDA","30+, Female, Negative"],["lRdL3o512s7","10-14, Female, Negative"],["T46LRcO7hld","15-29, Female, Positive"],["WPEAIFUu5a2","15-19, Female, Positive"],["VwQuwxiy9Fe","25-29, Female, Negative"],["n4TeYFMq1W6","30+, Male, Negative"],["NKKzcaB1G0A","15-29, Male, Positive"],["CvsypjsIdPX","30+, Male, Negative"],["irW98YPtxJN","30+, Female, Negative"],["QtXiIwFvhpf","30+, Female, Positive"],["NhMi3bgsTac","15-29, Male, Positive"],["a6wysjILDDa","30+, Male, Positive"],["SnZ2xYrUjRI","15-29, Male, Negative"],["e4bzs5GxZGm","0-9, Male, Positive"],["moq7cIhTBOI","15-29, Female, Negative"],["PX6Ls0fC6EZ","20-24, Female, Positive"],["pVSSJRSpqwy","25-29, Female, Positive"],["zy9VW6WQbNW","25-29, Male, Positive"],["XA3PWLZWbfC","30+, Male, Positive"],["lwN0Zclhn1c","<15, Male, Positive"],["xOtz2rhdmZU","<15, Female, Positive"],["uRwXZcZ1P0R","15-19, Male, Negative"],["rTVaJG2nxHI","30+, Female, Positive"],["PjcOR0v6egX","20-24, Male, Positive"],["zM1oifGsdVV","15-29, Male, Negative"],["sVJ3ZVJwsrR","15+, Male, Positive"],["HllvX50cXC0","default"],["Qd0uTr2Df9k","0-9, Male, Positive"],["cy1pyVQnjiv","10-14, Female, Negative"],["drHVzru5m4o","15-19, Female, Negative"],["LP5MQ3dRkPZ","15-19, Male, Positive"],["o8YxLOwJrYJ","20-24, Male, Negative"],["mbEIHyDEEyh","0-9, Male, Negative"],["O6ln19QsVLG","15-29, Female, Positive"],["ZfBpKlBfuiQ","<15, Male, Negative"],["hZ9mbNaWRdD","10-14, Male, Negative"],["Bzg77lnK2Oq","10-14, Male, Negative"],["CqeUNqRBN0z","15+, Female, Positive"],["Y2tpTbnSyY1","0-9, Female, Negative"],["HaXdnWjI1mN","0-9, Female, Positive"],["itd3raLwPsp","0-9, Female, Positive"]]});
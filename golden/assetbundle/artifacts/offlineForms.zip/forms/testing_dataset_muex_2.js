@@ -0,0 +1 @@
+mertideOffline.form({"name":"Testing DataSet Muex 2","dataValuesLoaded":"      functionloader.registerRules({\"ssids\":[\"{ssid1}\",\"{ssid2}\"],\"cocs\":[],\"operands\":[[0],[1]],\"autocalc\":[],\"exclusive\":[[[0],[1]]]});\n","html":"\t<li class=\"ui-corner-left\"><a href=\"#PEPFAR_Tabs_vertical_1\">Vertical Tab</a></li>\n</ul>\n\n<div id=\"PEPFAR_Tabs_vertical_1\">\n<div id=\"PEPFAR_Tabs_h_1\">\n<ul class=\"ui-helper-hidden\">\n\t<li><a href=\"#PEPFAR_Form_1_DSD\">DSD</a></li>\n</ul>\n\n<div id=\"PEPFAR_Form_1_DSD\">\n<p class=\"PEPFAR_Form_ShowHide\">&nbsp;</p>\n\n<!-- DSD: muex_03 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">muex_03</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid1}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Fine and Sex and HIV Status\" id=\"C7pZ8mLT1op\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Rule 3: Repeated Muex</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-29</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-itd3raLwPsp-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-e4bzs5GxZGm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-Z2A8wXrOTth-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-piFRKmvpegq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-T46LRcO7hld-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-NhMi3bgsTac-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-rTVaJG2nxHI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"HZg0843PdL5-a6wysjILDDa-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-Y2tpTbnSyY1-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-mbEIHyDEEyh-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-lRdL3o512s7-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-Bzg77lnK2Oq-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-okriq2ra0Ay-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-SnZ2xYrUjRI-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-lnnwKV6YRDA-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"HZg0843PdL5-CvsypjsIdPX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid2}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"XQRueys4hrU-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"XQRueys4hrU-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD muex_03 --></div>\n\n<p>&nbsp;</p>\n\n</div>\n</div>\n</div>\n<script type=\"text/javascript\">\n$('#PEPFAR_Tabs_vertical').tabs({\n  beforeActivate: function (event, ui) {\n    functionloader.materializeTab(ui.newPanel[0]);\n  }\n}).removeClass('ui-tabs').find('ul').removeClass('ui-helper-hidden');\n$('#PEPFAR_Tabs_vertical li').removeClass('ui-corner-top');\n$('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');\n</script></div>\n</div>\n<!-- End Custom DHIS2 Form -->\n\n","attributeCombo":false,"dataElements":[["HZg0843PdL5","PUBLIC - MUEX_03: Fine"],["XQRueys4hrU","PUBLIC - MUEX_03: Coarse"]],"optionCombos":[["okriq2ra0Ay","15-29, Female, Negative"],["Z2A8wXrOTth","10-14, Female, Positive"],["ZyfQ4TCVUzR","15+, Female, Negative"],["piFRKmvpegq","10-14, Male, Positive"],["syoxO60kaBs","<15, Female, Negative"],["fMJDGka70UV","15+, Male, Negative"],["lnnwKV6YRDA","30+, Female, Negative"],["lRdL3o512s7","10-14, Female, Negative"],["T46LRcO7hld","15-29, Female, Positive"],["CvsypjsIdPX","30+, Male, Negative"],["NhMi3bgsTac","15-29, Male, Positive"],["a6wysjILDDa","30+, Male, Positive"],["SnZ2xYrUjRI","15-29, Male, Negative"],["e4bzs5GxZGm","0-9, Male, Positive"],["lwN0Zclhn1c","<15, Male, Positive"],["xOtz2rhdmZU","<15, Female, Positive"],["rTVaJG2nxHI","30+, Female, Positive"],["sVJ3ZVJwsrR","15+, Male, Positive"],["mbEIHyDEEyh","0-9, Male, Negative"],["ZfBpKlBfuiQ","<15, Male, Negative"],["Bzg77lnK2Oq","10-14, Male, Negative"],["CqeUNqRBN0z","15+, Female, Positive"],["Y2tpTbnSyY1","0-9, Female, Negative"],["itd3raLwPsp","0-9, Female, Positive"]]});
@@ -0,0 +1 @@
+mertideOffline.runtime({"before":"<!DOCTYPE html>\n<html>\n<head>\n<title>MERTIDE: PEPFAR OFFLINE TESTING ENVIRONMENT</title>\n<meta content=\"DHIS 2\" name=\"description\">\n<meta content=\"DHIS 2\" name=\"keywords\">\n<meta content=\"text/html; charset=utf-8\" http-equiv=\"Content-Type\">\n<link href=\"https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.6.3/css/font-awesome.css\" rel=\"stylesheet\" type=\"text/css\">\n<style type=\"text/css\" media=\"screen\">\n/* jquery-ui.css */\n/*! jQuery UI - v1.10.4 - 2014-05-05\n* http://jqueryui.com\n* Includes: jquery.ui.core.css, jquery.ui.resizable.css, jquery.ui.selectable.css, jquery.ui.accordion.css, jquery.ui.autocomplete.css, jquery.ui.button.css, jquery.ui.datepicker.css, jquery.ui.dialog.css, jquery.ui.menu.css, jquery.ui.progressbar.css, jquery.ui.slider.css, jquery.ui.spinner.css, jquery.ui.tabs.css, jquery.ui.tooltip.css, jquery.ui.theme.css\n* To view and modify this theme, visit http://jqueryui.com/themeroller/?ffDefault=Lucida%20Grande%2CLucida%20Sans%2CArial%2Csans-serif&fwDefault=bold&fsDefault=1.1em&cornerRadius=5px&bgColorHeader=5c9ccc&bgTextureHeader=gloss_wave&bgImgOpacityHeader=55&borderColorHeader=4297d7&fcHeader=ffffff&iconColorHeader=d8e7f3&bgColorContent=fcfdfd&bgTextureContent=inset_hard&bgImgOpacityContent=100&borderColorContent=a6c9e2&fcContent=222222&iconColorContent=469bdd&bgColorDefault=dfeffc&bgTextureDefault=glass&bgImgOpacityDefault=85&borderColorDefault=c5dbec&fcDefault=2e6e9e&iconColorDefault=6da8d5&bgColorHover=d0e5f5&bgTextureHover=glass&bgImgOpacityHover=75&borderColorHover=79b7e7&fcHover=1d5987&iconColorHover=217bc0&bgColorActive=f5f8f9&bgTextureActive=inset_hard&bgImgOpacityActive=100&borderColorActive=79b7e7&fcActive=e17009&iconColorActive=f9bd01&bgColorHighlight=fbec88&bgTextureHighlight=flat&bgImgOpacityHighlight=55&borderColorHighlight=fad42e&fcHighlight=363636&iconColorHighlight=2e83ff&bgColorError=fef1ec&bgTextureError=glass&bgImgOpacityError=95&borderColorError=cd0a0a&fcError=cd0a0a&iconColorError=cd0a0a&bgColorOverlay=aaaaaa&bgTextureOverlay=flat&bgImgOpacityOverlay=0&opacityOverlay=30&bgColorShadow=aaaaaa&bgTextureShadow=flat&bgImgOpacityShadow=0&opacityShadow=30&thicknessShadow=8px&offsetTopShadow=-8px&offsetLeftShadow=-8px&cornerRadiusShadow=8px\n* Copyright 2014 jQuery Foundation and other contributors; Licensed MIT */\n\n/* Layout helpers\n----------------------------------*/\n.ui-helper-hidden {\n  display: none;\n}\n.ui-helper-hidden-accessible {\n  border: 0;\n  clip: rect(0 0 0 0);\n  height: 1px;\n  margin: -1px;\n  overflow: hidden;\n  padding: 0;\n  position: absolute;\n  width: 1px;\n}\n.ui-helper-reset {\n  margin: 0;\n  padding: 0;\n  border: 0;\n  outline: 0;\n  line-height: 1.3;\n  text-decoration: none;\n  font-size: 100%;\n  list-style: none;\n}\n.ui-helper-clearfix:before,\n.ui-helper-clearfix:after {\n  content: \"\";\n  display: table;\n  border-collapse: collapse;\n}\n.ui-helper-clearfix:after {\n  clear: both;\n}\n.ui-helper-clearfix {\n  min-height: 0; /* support: IE7 */\n}\n.ui-helper-zfix {\n  width: 100%;\n  height: 100%;\n  top: 0;\n  left: 0;\n  position: absolute;\n  opacity: 0;\n  filter:Alpha(Opacity=0);\n}\n\n.ui-front {\n  z-index: 100;\n}\n\n\n/* Interaction Cues\n----------------------------------*/\n.ui-state-disabled {\n  cursor: default !important;\n}\n\n\n/* Icons\n----------------------------------*/\n\n/* states and images */\n.ui-icon {\n  display: block;\n  text-indent: -99999px;\n  overflow: hidden;\n  background-repeat: no-repeat;\n}\n\n\n/* Misc visuals\n----------------------------------*/\n\n/* Overlays */\n.ui-widget-overlay {\n  position: fixed;\n  top: 0;\n  left: 0;\n  width: 100%;\n  height: 100%;\n}\n.ui-resizable {\n  position: relative;\n}\n.ui-resizable-handle {\n  position: absolute;\n  font-size: 0.1px;\n  display: block;\n}\n.ui-resizable-disabled .ui-resizable-handle,\n.ui-resizable-autohide .ui-resizable-handle {\n  display: none;\n}\n.ui-resizable-n {\n  cursor: n-resize;\n  height: 7px;\n  width: 100%;\n  top: -5px;\n  left: 0;\n}\n.ui-resizable-s {\n  cursor: s-resize;\n  height: 7px;\n  width: 100%;\n  bottom: -5px;\n  left: 0;\n}\n.ui-resizable-e {\n  cursor: e-resize;\n  width: 7px;\n  right: -5px;\n  top: 0;\n  height: 100%;\n}\n.ui-resizable-w {\n  cursor: w-resize;\n  width: 7px;\n  left: -5px;\n  top: 0;\n  height: 100%;\n}\n.ui-resizable-se {\n  cursor: se-resize;\n  width: 12px;\n  height: 12px;\n  right: 1px;\n  bottom: 1px;\n}\n.ui-resizable-sw {\n  cursor: sw-resize;\n  width: 9px;\n  height: 9px;\n  left: -5px;\n  bottom: -5px;\n}\n.ui-resizable-nw {\n  cursor: nw-resize;\n  width: 9px;\n  height: 9px;\n  left: -5px;\n  top: -5px;\n}\n.ui-resizable-ne {\n  cursor: ne-resize;\n  width: 9px;\n  height: 9px;\n  right: -5px;\n  top: -5px;\n}\n.ui-selectable-helper {\n  position: absolute;\n  z-index: 100;\n  border: 1px dotted black;\n}\n.ui-accordion .ui-accordion-header {\n  display: block;\n  cursor: pointer;\n  position: relative;\n  margin-top: 2px;\n  padding: .5em .5em .5em .7em;\n  min-height: 0; /* support: IE7 */\n}\n.ui-accordion .ui-accordion-icons {\n  padding-left: 2.2em;\n}\n.ui-accordion .ui-accordion-noicons {\n  padding-left: .7em;\n}\n.ui-accordion .ui-accordion-icons .ui-accordion-icons {\n  padding-left: 2.2em;\n}\n.ui-accordion .ui-accordion-header .ui-accordion-header-icon {\n  position: absolute;\n  left: .5em;\n  top: 50%;\n  margin-top: -8px;\n}\n.ui-accordion .ui-accordion-content {\n  padding: 1em 2.2em;\n  border-top: 0;\n  overflow: auto;\n}\n.ui-autocomplete {\n  position: absolute;\n  top: 0;\n  left: 0;\n  cursor: default;\n}\n.ui-button {\n  display: inline-block;\n  position: relative;\n  padding: 0;\n  line-height: normal;\n  margin-right: .1em;\n  cursor: pointer;\n  vertical-align: middle;\n  text-align: center;\n  overflow: visible; /* removes extra width in IE */\n}\n.ui-button,\n.ui-button:link,\n.ui-button:visited,\n.ui-button:hover,\n.ui-button:active {\n  text-decoration: none;\n}\n/* to make room for the icon, a width needs to be set here */\n.ui-button-icon-only {\n  width: 2.2em;\n}\n/* button elements seem to need a little more width */\nbutton.ui-button-icon-only {\n  width: 2.4em;\n}\n.ui-button-icons-only {\n  width: 3.4em;\n}\nbutton.ui-button-icons-only {\n  width: 3.7em;\n}\n\n/* button text element */\n.ui-button .ui-button-text {\n  display: block;\n  line-height: normal;\n}\n.ui-button-text-only .ui-button-text {\n  padding: .4em 1em;\n}\n.ui-button-icon-only .ui-button-text,\n.ui-button-icons-only .ui-button-text {\n  padding: .4em;\n  text-indent: -9999999px;\n}\n.ui-button-text-icon-primary .ui-button-text,\n.ui-button-text-icons .ui-button-text {\n  padding: .4em 1em .4em 2.1em;\n}\n.ui-button-text-icon-secondary .ui-button-text,\n.ui-button-text-icons .ui-button-text {\n  padding: .4em 2.1em .4em 1em;\n}\n.ui-button-text-icons .ui-button-text {\n  padding-left: 2.1em;\n  padding-right: 2.1em;\n}\n/* no icon support for input elements, provide padding by default */\ninput.ui-button {\n  padding: .4em 1em;\n}\n\n/* button icon element(s) */\n.ui-button-icon-only .ui-icon,\n.ui-button-text-icon-primary .ui-icon,\n.ui-button-text-icon-secondary .ui-icon,\n.ui-button-text-icons .ui-icon,\n.ui-button-icons-only .ui-icon {\n  position: absolute;\n  top: 50%;\n  margin-top: -8px;\n}\n.ui-button-icon-only .ui-icon {\n  left: 50%;\n  margin-left: -8px;\n}\n.ui-button-text-icon-primary .ui-button-icon-primary,\n.ui-button-text-icons .ui-button-icon-primary,\n.ui-button-icons-only .ui-button-icon-primary {\n  left: .5em;\n}\n.ui-button-text-icon-secondary .ui-button-icon-secondary,\n.ui-button-text-icons .ui-button-icon-secondary,\n.ui-button-icons-only .ui-button-icon-secondary {\n  right: .5em;\n}\n\n/* button sets */\n.ui-buttonset {\n  margin-right: 7px;\n}\n.ui-buttonset .ui-button {\n  margin-left: 0;\n  margin-right: -.3em;\n}\n\n/* workarounds */\n/* reset extra padding in Firefox, see h5bp.com/l */\ninput.ui-button::-moz-focus-inner,\nbutton.ui-button::-moz-focus-inner {\n  border: 0;\n  padding: 0;\n}\n.ui-datepicker {\n  width: 17em;\n  padding: .2em .2em 0;\n  display: none;\n}\n.ui-datepicker .ui-datepicker-header {\n  position: relative;\n  padding: .2em 0;\n}\n.ui-datepicker .ui-datepicker-prev,\n.ui-datepicker .ui-datepicker-next {\n  position: absolute;\n  top: 2px;\n  width: 1.8em;\n  height: 1.8em;\n}\n.ui-datepicker .ui-datepicker-prev-hover,\n.ui-datepicker .ui-datepicker-next-hover {\n  top: 1px;\n}\n.ui-datepicker .ui-datepicker-prev {\n  left: 2px;\n}\n.ui-datepicker .ui-datepicker-next {\n  right: 2px;\n}\n.ui-datepicker .ui-datepicker-prev-hover {\n  left: 1px;\n}\n.ui-datepicker .ui-datepicker-next-hover {\n  right: 1px;\n}\n.ui-datepicker .ui-datepicker-prev span,\n.ui-datepicker .ui-datepicker-next span {\n  display: block;\n  position: absolute;\n  left: 50%;\n  margin-left: -8px;\n  top: 50%;\n  margin-top: -8px;\n}\n.ui-datepicker .ui-datepicker-title {\n  margin: 0 2.3em;\n  line-height: 1.8em;\n  text-align: center;\n}\n.ui-datepicker .ui-datepicker-title select {\n  font-size: 1em;\n  margin: 1px 0;\n}\n.ui-datepicker select.ui-datepicker-month,\n.ui-datepicker select.ui-datepicker-year {\n  width: 49%;\n}\n.ui-datepicker table {\n  width: 100%;\n  font-size: .9em;\n  border-collapse: collapse;\n  margin: 0 0 .4em;\n}\n.ui-datepicker th {\n  padding: .7em .3em;\n  text-align: center;\n  font-weight: bold;\n  border: 0;\n}\n.ui-datepicker td {\n  border: 0;\n  padding: 1px;\n}\n.ui-datepicker td span,\n.ui-datepicker td a {\n  display: block;\n  padding: .2em;\n  text-align: right;\n  text-decoration: none;\n}\n.ui-datepicker .ui-datepicker-buttonpane {\n  background-image: none;\n  margin: .7em 0 0 0;\n  padding: 0 .2em;\n  border-left: 0;\n  border-right: 0;\n  border-bottom: 0;\n}\n.ui-datepicker .ui-datepicker-buttonpane button {\n  float: right;\n  margin: .5em .2em .4em;\n  cursor: pointer;\n  padding: .2em .6em .3em .6em;\n  width: auto;\n  overflow: visible;\n}\n.ui-datepicker .ui-datepicker-buttonpane button.ui-datepicker-current {\n  float: left;\n}\n\n/* with multiple calendars */\n.ui-datepicker.ui-datepicker-multi {\n  width: auto;\n}\n.ui-datepicker-multi .ui-datepicker-group {\n  float: left;\n}\n.ui-datepicker-multi .ui-datepicker-group table {\n  width: 95%;\n  margin: 0 auto .4em;\n}\n.ui-datepicker-multi-2 .ui-datepicker-group {\n  width: 50%;\n}\n.ui-datepicker-multi-3 .ui-datepicker-group {\n  width: 33.3%;\n}\n.ui-datepicker-multi-4 .ui-datepicker-group {\n  width: 25%;\n}\n.ui-datepicker-multi .ui-datepicker-group-last .ui-datepicker-header,\n.ui-datepicker-multi .ui-datepicker-group-middle .ui-datepicker-header {\n  border-left-width: 0;\n}\n.ui-datepicker-multi .ui-datepicker-buttonpane {\n  clear: left;\n}\n.ui-datepicker-row-break {\n  clear: both;\n  width: 100%;\n  font-size: 0;\n}\n\n/* RTL support */\n.ui-datepicker-rtl {\n  direction: rtl;\n}\n.ui-datepicker-rtl .ui-datepicker-prev {\n  right: 2px;\n  left: auto;\n}\n.ui-datepicker-rtl .ui-datepicker-next {\n  left: 2px;\n  right: auto;\n}\n.ui-datepicker-rtl .ui-datepicker-prev:hover {\n  right: 1px;\n  left: auto;\n}\n.ui-datepicker-rtl .ui-datepicker-next:hover {\n  left: 1px;\n  right: auto;\n}\n.ui-datepicker-rtl .ui-datepicker-buttonpane {\n  clear: right;\n}\n.ui-datepicker-rtl .ui-datepicker-buttonpane button {\n  float: left;\n}\n.ui-datepicker-rtl .ui-datepicker-buttonpane button.ui-datepicker-current,\n.ui-datepicker-rtl .ui-datepicker-group {\n  float: right;\n}\n.ui-datepicker-rtl .ui-datepicker-group-last .ui-datepicker-header,\n.ui-datepicker-rtl .ui-datepicker-group-middle .ui-datepicker-header {\n  border-right-width: 0;\n  border-left-width: 1px;\n}\n.ui-dialog {\n  overflow: hidden;\n  position: absolute;\n  top: 0;\n  left: 0;\n  padding: .2em;\n  outline: 0;\n}\n.ui-dialog .ui-dialog-titlebar {\n  padding: .4em 1em;\n  position: relative;\n}\n.ui-dialog .ui-dialog-title {\n  float: left;\n  margin: .1em 0;\n  white-space: nowrap;\n  width: 90%;\n  overflow: hidden;\n  text-overflow: ellipsis;\n}\n.ui-dialog .ui-dialog-titlebar-close {\n  position: absolute;\n  right: .3em;\n  top: 50%;\n  width: 20px;\n  margin: -10px 0 0 0;\n  padding: 1px;\n  height: 20px;\n}\n.ui-dialog .ui-dialog-content {\n  position: relative;\n  border: 0;\n  padding: .5em 1em;\n  background: none;\n  overflow: auto;\n}\n.ui-dialog .ui-dialog-buttonpane {\n  text-align: left;\n  border-width: 1px 0 0 0;\n  background-image: none;\n  margin-top: .5em;\n  padding: .3em 1em .5em .4em;\n}\n.ui-dialog .ui-dialog-buttonpane .ui-dialog-buttonset {\n  float: right;\n}\n.ui-dialog .ui-dialog-buttonpane button {\n  margin: .5em .4em .5em 0;\n  cursor: pointer;\n}\n.ui-dialog .ui-resizable-se {\n  width: 12px;\n  height: 12px;\n  right: -5px;\n  bottom: -5px;\n  background-position: 16px 16px;\n}\n.ui-draggable .ui-dialog-titlebar {\n  cursor: move;\n}\n.ui-menu {\n  list-style: none;\n  padding: 2px;\n  margin: 0;\n  display: block;\n  outline: none;\n}\n.ui-menu .ui-menu {\n  margin-top: -3px;\n  position: absolute;\n}\n.ui-menu .ui-menu-item {\n  margin: 0;\n  padding: 0;\n  width: 100%;\n  /* support: IE10, see #8844 */\n  list-style-image: url(data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7);\n}\n.ui-menu .ui-menu-divider {\n  margin: 5px -2px 5px -2px;\n  height: 0;\n  font-size: 0;\n  line-height: 0;\n  border-width: 1px 0 0 0;\n}\n.ui-menu .ui-menu-item a {\n  text-decoration: none;\n  display: block;\n  padding: 2px .4em;\n  line-height: 1.5;\n  min-height: 0; /* support: IE7 */\n  font-weight: normal;\n}\n.ui-menu .ui-menu-item a.ui-state-focus,\n.ui-menu .ui-menu-item a.ui-state-active {\n  font-weight: normal;\n  margin: -1px;\n}\n\n.ui-menu .ui-state-disabled {\n  font-weight: normal;\n  margin: .4em 0 .2em;\n  line-height: 1.5;\n}\n.ui-menu .ui-state-disabled a {\n  cursor: default;\n}\n\n/* icon support */\n.ui-menu-icons {\n  position: relative;\n}\n.ui-menu-icons .ui-menu-item a {\n  position: relative;\n  padding-left: 2em;\n}\n\n/* left-aligned */\n.ui-menu .ui-icon {\n  position: absolute;\n  top: .2em;\n  left: .2em;\n}\n\n/* right-aligned */\n.ui-menu .ui-menu-icon {\n  position: static;\n  float: right;\n}\n.ui-progressbar {\n  height: 2em;\n  text-align: left;\n  overflow: hidden;\n}\n.ui-progressbar .ui-progressbar-value {\n  margin: -1px;\n  height: 100%;\n}\n.ui-progressbar .ui-progressbar-overlay {\n  background: url(\"images/animated-overlay.gif\");\n  height: 100%;\n  filter: alpha(opacity=25);\n  opacity: 0.25;\n}\n.ui-progressbar-indeterminate .ui-progressbar-value {\n  background-image: none;\n}\n.ui-slider {\n  position: relative;\n  text-align: left;\n}\n.ui-slider .ui-slider-handle {\n  position: absolute;\n  z-index: 2;\n  width: 1.2em;\n  height: 1.2em;\n  cursor: default;\n}\n.ui-slider .ui-slider-range {\n  position: absolute;\n  z-index: 1;\n  font-size: .7em;\n  display: block;\n  border: 0;\n  background-position: 0 0;\n}\n\n/* For IE8 - See #6727 */\n.ui-slider.ui-state-disabled .ui-slider-handle,\n.ui-slider.ui-state-disabled .ui-slider-range {\n  filter: inherit;\n}\n\n.ui-slider-horizontal {\n  height: .8em;\n}\n.ui-slider-horizontal .ui-slider-handle {\n  top: -.3em;\n  margin-left: -.6em;\n}\n.ui-slider-horizontal .ui-slider-range {\n  top: 0;\n  height: 100%;\n}\n.ui-slider-horizontal .ui-slider-range-min {\n  left: 0;\n}\n.ui-slider-horizontal .ui-slider-range-max {\n  right: 0;\n}\n\n.ui-slider-vertical {\n  width: .8em;\n  height: 100px;\n}\n.ui-slider-vertical .ui-slider-handle {\n  left: -.3em;\n  margin-left: 0;\n  margin-bottom: -.6em;\n}\n.ui-slider-vertical .ui-slider-range {\n  left: 0;\n  width: 100%;\n}\n.ui-slider-vertical .ui-slider-range-min {\n  bottom: 0;\n}\n.ui-slider-vertical .ui-slider-range-max {\n  top: 0;\n}\n.ui-spinner {\n  position: relative;\n  display: inline-block;\n  overflow: hidden;\n  padding: 0;\n  vertical-align: middle;\n}\n.ui-spinner-input {\n  border: none;\n  background: none;\n  color: inherit;\n  padding: 0;\n  margin: .2em 0;\n  vertical-align: middle;\n  margin-left: .4em;\n  margin-right: 22px;\n}\n.ui-spinner-button {\n  width: 16px;\n  height: 50%;\n  font-size: .5em;\n  padding: 0;\n  margin: 0;\n  text-align: center;\n  position: absolute;\n  cursor: default;\n  display: block;\n  overflow: hidden;\n  right: 0;\n}\n/* more specificity required here to override default borders */\n.ui-spinner a.ui-spinner-button {\n  border-top: none;\n  border-bottom: none;\n  border-right: none;\n}\n/* vertically center icon */\n.ui-spinner .ui-icon {\n  position: absolute;\n  margin-top: -8px;\n  top: 50%;\n  left: 0;\n}\n.ui-spinner-up {\n  top: 0;\n}\n.ui-spinner-down {\n  bottom: 0;\n}\n\n/* TR overrides */\n.ui-spinner .ui-icon-triangle-1-s {\n  /* need to fix icons sprite */\n  background-position: -65px -16px;\n}\n.ui-tabs {\n  position: relative;/* position: relative prevents IE scroll bug (element with position: relative inside container with overflow: auto appear as \"fixed\") */\n  padding: .2em;\n}\n.ui-tabs .ui-tabs-nav {\n  margin: 0;\n  padding: .2em .2em 0;\n}\n.ui-tabs .ui-tabs-nav li {\n  list-style: none;\n  float: left;\n  position: relative;\n  top: 0;\n  margin: 1px .2em 0 0;\n  border-bottom-width: 0;\n  padding: 0;\n  white-space: nowrap;\n}\n.ui-tabs .ui-tabs-nav .ui-tabs-anchor {\n  float: left;\n  padding: .5em 1em;\n  text-decoration: none;\n}\n.ui-tabs .ui-tabs-nav li.ui-tabs-active {\n  margin-bottom: -1px;\n  padding-bottom: 1px;\n}\n.ui-tabs .ui-tabs-nav li.ui-tabs-active .ui-tabs-anchor,\n.ui-tabs .ui-tabs-nav li.ui-state-disabled .ui-tabs-anchor,\n.ui-tabs .ui-tabs-nav li.ui-tabs-loading .ui-tabs-anchor {\n  cursor: text;\n}\n.ui-tabs-collapsible .ui-tabs-nav li.ui-tabs-active .ui-tabs-anchor {\n  cursor: pointer;\n}\n.ui-tabs .ui-tabs-panel {\n  display: block;\n  border-width: 0;\n  padding: 1em 1.4em;\n  background: none;\n}\n.ui-tooltip {\n  padding: 8px;\n  position: absolute;\n  z-index: 9999;\n  max-width: 300px;\n  -webkit-box-shadow: 0 0 5px #aaa;\n  box-shadow: 0 0 5px #aaa;\n}\nbody .ui-tooltip {\n  border-width: 2px;\n}\n\n/* Component containers\n----------------------------------*/\n.ui-widget {\n  font-family: Lucida Grande,Lucida Sans,Arial,sans-serif;\n  font-size: 1.1em;\n}\n.ui-widget .ui-widget {\n  font-size: 1em;\n}\n.ui-widget input,\n.ui-widget select,\n.ui-widget textarea,\n.ui-widget button {\n  font-family: Lucida Grande,Lucida Sans,Arial,sans-serif;\n  font-size: 1em;\n}\n.ui-widget-content {\n  border: 1px solid #a6c9e2;\n  background: #fcfdfd 50% bottom repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAABkEAIAAACY3hF0AAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAYklEQVQoz+3PMQqAMBQE0cmKYJFKRYMJiCAoev/b+cVCSG2ZwuoVAwvLdZmZCQB+voA1d33XItLSipmeXiyMjGJjYsqcJJLcQSKJjUgU+9tWAkEsbnBDHuvweFEhVMTbcnkARNMN2kh7KjEAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTQtMDUtMDRUMTk6NTU6MTgtMDc6MDD1TBQ3AAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE0LTA1LTA0VDE5OjU1OjE4LTA3OjAwhBGsiwAAAABJRU5ErkJggg==');\n  color: #222222;\n}\n.ui-widget-content a {\n  color: #222222;\n}\n.ui-widget-header {\n  border: 1px solid #4297d7;\n  background: #5c9ccc 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAABkEAIAAACvNYlpAAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAV/klEQVR42u2dT4xd113Hz31+GxBShNlRO80iWVpRNx0RKhZILEISCYkU0EwWpLRCoShSDAsHgfCm2IGmqRypIIGURGRe5IQNi9gNu5LQdLxwaAYWsc3GGbIjYHVTVfa7LO4kufaZ85vv75xz77vP+XwWyfO95/zO7/f9nX8zc969zfO/+C9fuvZzAQAAAAAAJsxs1Q4AAAAAAMDhsHEHAAAAAFgD2LgDAAAAAKwBbNwBAAAAANYANu4AAAAAAGsAG3cAAAAAgDWAjTsAAAAAwBrAxh0AAAAAYA1g4w4AAAAAsAawcQcAAAAAWAPYuAMAAAAArAFs3AEAAAAA1gA27gAAAAAAawAbdwAAAACANYCNOwAAAADAGsDGHQAAAABgDWDjDgAAAACwBhyycW+32512z76iX0+VsVsvsWxfT1lIRR2XSXmo2M9TI6/1PMW8OtgWSrLvzW+J5kotfVzYcXmt6Zn1xqtkVlFMiVHPptLT8kZTOXmjwGs5ddfb8/W6igVvLEOMfaWVcq28epaMBX22UfLinUMUhfXyenR6K+V3S9bEcgVK9Mzr4d61Js++HpFt37sfK1dViaVk/vGW0Vtsvn3hrZ9d/Z+8UAEAAAAAYBw8R2UWYSfs7f93CtT1JGXNbmW1anh9U67Ed6eQ93FybSsQ1/Uqo5S0czROLsrtDzdqvBp62xqzn9fqhyXWpqBPLZt5ec9rvWTsl2ieN4fX1SFvjkr14XL/bTt186tfKRmheQw3r+qZylutSkaHNyJ7NfdayPPEazm63nz7ibfevvrjCjIBAAAAAMBgzMMi7IQPV+0GAAAAAABY8FQZAAAAAIA1gI07AAAAAMAaMG+3w6Ww12yFL4dj/Rvd9bhCV7Jfq1+ybydVJrZju5hqRb+ifM7zKqVVSk+7dV1nXUklR3p30fVRWld8SHkb66NbU/qJnusS9WrpWRK1Vxm9bnmWFfvKGLFr6e3mqZryR8+jd9atpZvSK1LWlDlQ6S3lvSsvd3nlvSM6ruuNKK8/eOc6fb3LWz2989gQ6+M4WfaSt+PqW9B3Qan5Ki8v3ui8JUv2ciWZzYsxpaSSiwNq/c1jb33x6p+HzbDxacK6b7CmrqS+99ov36dfvm9Bb9G2mbLstRBHkfI81a6tg92uTSo6xfNaZXRl7FwoWikqKbEoSqbaVfp/XvYVJW3fUhHZnqfsKDlSRpOumGJB0WcIy3r/8faTlFd6jhS1vX1G7422V14UBbxrkKKVrY8+UvTW7TJKW7Wi9s7btod1Y8/zR9mT5I0mpbyyxqWi1q3ZudN3PiX7OiU67xqkZ1yZS5W8295693vevaLel1K69fhk4w4AAAAAABNm3i7aqTyXHQAAAAAAEvDlVAAAAACANYCNOwAAAADAGjAP27yACQAAAABg6swzn3MCAAAAAAAjwlEZAAAAAIA1YN7Kv3FvNsNGOKaX79fqPtt18+zXtVPLhzFb6VuzLQ9xt4meM5rXQ1KWFWu2AuP3K8WH1BWvhnHsdbNQS6vhemaJJyWz0xBqe22OM5PUyo5us8RzpaSu8BCerGqVmcIK67WgzO3d5zHnLj3LtXwbrs+U7OvG3NF1n+uu8uOMiPIdzgE2n3vu+79w5X9LnAYAAAAAgKGZ3/avRbsTPgybzUY4vv85j74Fr7W4fHel72GeJ3p5uy07Ot2CHlF5RryK9elHGvts+5bSpzyWPDt6LUWHWA0ldruW7aeShdjDVHnFk7q+2dqmYtG1svvbEOOoZH7L860kirra1tUt1YeV2UMfF6m6qXbz5r0hUMa1opIyNpVe4W19CE9sy7VGirdkngJenRVrqf6sK59nwbasRGRn07vrUGx60X3TdZC1bZ578OJ/Xnnf7TQAAAAAAIwIX04FAAAAAFgD5u12uHTo0fj+8fnoy4hS+dQB/L61roxiPy6ve5gqaVuwI9JbTGGrlCqpq5cqr2QhpbPXtzz1UhqmcpTyQbGT1zcUnb1ZS/mZ54mdQaW329F5+4Bd0pt9Pe96T9PVVuYNva7SW/S85OXO9t/WR5/57Vp5uShRWI8lb9ylvMrzTeldXrwjVJ/V87TV+7+ShTgub59RIlV6gneO8vbYkplE0dPWyhtReY+yM+tVLLam9yXbq1padV/PPXvfxS9d+YuwGQ4+P/dZ0Q/3y/Q/K+W9d+8mSiKN605BtyF8SNlUri96rw9LaTUF3YbQxy6Z139qlZka3j42vj/jeDiF3I3pw9TyPkQsU6bWCjjmulPLZl7f0+8q6+DUWO36kmc5b/0dOK5PNu4AAAAAADBhZu12uxP2+v+1K8QlFQupWt7Pqbt5raQspPy327Wj9ipc4oPSru2JoqQ313ruvCop/gQZW7G8Hq5nUM9+iX1ljNh3varqNmv1TK8d7/Va40v31qtSXqRe/+1a3plK90GJPS+zJZbtzHpHqDKre1dtr528nqwr4C2pt17SK7x6ev1U1Mi7rsSVp5sedd3dQsqmN4N6vCX7E2/dvPmnOfNvF3525cnb7tc6OVd+7twuX8vDIU6U5vlfokP5edmSs3feHOWdH83LrFfDvG9x6Bn0nkSspYnieck3TEpO/3v9L+l1Q4/loZWM63Z49Veu9y3nzSd9vPNPSf/XvxehqKHnyzvT1sq+0ge8sei1lNZLZte8bwcp34Qp+Y5Nre8+DZeLvG+GDIF3Pilvq/w7YCUWyneDJs2Zb154+8pvVBALAAAAAAAGg8dBAgAAAACsAfP2kXAuvNtshY1wvN0OOW+QctK11X2OWyz3ZIhYUjb71/V2UwrE18tt6nHFbeUpqWhVKy/lutke6n21Vq+uq7mtUi3llXi9ceVZKNFZz+YQ+nhtpnzz9thx5nxbGX12je3o/SE1S8R2lL4xtG4lc1F8XYnRvq63VTLGlax5Led51W/R60Oq9bgP1+pRuod1V4G8/Ykee8ndutjjMaVnyYiw7Td/9cSFez/4v/07m2GjORYWYaeNTnQ1vZNYB97tX++Xt2ul7ir+pGrpZWz01hXdbDW8llN1dbUV/fOULM9sXFf3tiQKu0yez3b/UfLita9El2rF/myroSvcx5437KiVecbOkVcrvRU7upTO3ru6V/qot+dzr8J2XHoWFLyRem0O58PQs7F3lJVrVb7+lmhVax1RsqnMhN7ZUhnv9l1l3ak1Y6Tq6tfjWPSVyNsrvCuybiflj50vb6QhhDs37gAAAAAAMEnmYZH/WDdYX9pHwovh3Vsnlg+3967Wk+XZ9nT70PJ77f3hhVWrEvl2vb3Y/m57o90Kb4zT4pETs4+b5arj/oz52dkDzRfKv+8/e6c52nxn9k5zNDy/6pgAAADWleZbr735zx98f9VuDEX7t+394YXl9fZi+ztK+W4j294IGRu1/U3wIufE1c1Ty2vtR3k/RN08tbza/vcw+gFMhf0fIUyae5pXw+NHdmcXm+uHlHyquRZOzt5pjjaH/CDR/SjVvBmeDr+SKjO7t3m4eb15qrkWnlm1TgAAcDfTfOuxN//sg79P3b51Znm6fai9EbbCPyVtPNqeC+/eOtEe+rvb/W3xI+FceDdVpr3RPtG+cevE8uFwmLXd5dF2NsgpOgCAcjbDRnMs9VeU2TvN0fCd2b2zh5vz/evdDwnxjx/dDwbdDwn960eebU43P2zuabbD46sOGAAAhqU5+ZPXH9/9r1W7AQAANZmfmH3ctPExp/nZ2QOzA44/HTk7u/+gv2nMzxx5oPnl/pX9Hy0mdqwLAGC1dL9Qjn89ffPZW1fbjw4of2p57Y4TE4uwE/ZunlpeXR50fXd5tG2ak3/3+vHdH6w6WAAAWG9SG/rmzfB0c9DfEO5pXg2Pz041p5sf3nF9O3y1+0tCsq23m18Kz8++OLvj7w8A8PlhuX+8+eDvobU3whPtG7fOLP8yPJSysH9a5NH2xfCj+O7N95dH2yY+2ZHaoI9Dc/LXzn+0uz1+wwAAAMMxu3f2m8357khSssypww8aHTkx+7hpm63EI95CCCHMr8+2mg2Hc5vNRuiOUbWr1gk+NyzanbB3a3d5tG30SsuvtB+3f7K83l4M0ncFOz47Gt0mt7bLs8vT4VfbG2GrPXDb3W6FN6bwCI2p0Tzz3Plnd/84eX8rbIRjYTtYX5pUyqyWcg9jC/0rqbsdcbu1FKur/Jh5XF/Pp+yP3m5JyVTd1IhQypf4mRprU+sVOormQ+Q6r26e/ThrSp8p0bPPEK3U0kRW2/2jQo/9Hxi2cp4W1Ww2G+FYW/w8OtvO/MyRQ7+MHrM8uzwdHlreaA/cCA5HF0v3ORVR+73wQHhheX154cBHZXQWnKp++nvfF8O7I/VnfZzWGgXDjaapIfvcPPPg+V/f/a1V+wsAAAAAABbzdr1+IgEAAAAA+FzSvYDJ/dxxAAAAAAAYkznPQQcAAAAAmD4clQEAAAAAWAPm3XtPDym12WyE47cdqumudHTX4zKKHYW4Lb1WrYNAKQVS9vt363pSErsehTfe4ZTPa6XE/3Kt4rsdJf4Mre0Q/blW7xp/BMWtd9Qa0XXnh7wZcri27Oh0b6c258T+96OolYVasQytiaKDV426Iyt1XRnRJdksn83s1r2zhzIeh9urlKy8ddedMT0fQrfelebpC6/96/t/XaEZAAAAAAAYjHn3GtVVuwEAAAAAABZs3AEAAAAA1oDuy6k8DhIAAAAAYNLMva/YBQAAAACA8Zm3j4Rz7WFPlQEAAAAAgJXCGXcAAAAAgDVg3i7CJTbuAAAAAADTZh62OeMOAAAAADB1uqMyPFUGAAAAAGDSdI+DPOg37v2z75thIxxLlkndVfBaiE/k57WuRGd7qHherk8t6npia9JRt8/0a5VkZGgl9X7lbdGrqqJYSaS1LAydtZKRPkQ2vT7HretzYF39y0f3ECM35ZXe/8u9Khlrtqrlytg2va0rM3+fEvX03mu36F07lB7lzaPXn+HwRpc3K+ZpNZwa3hlgiPW0qs/NH9336k9//IUBmwcAAAAAgGLm7XbYaTkqAwAAAAAwaXgcJAAAAADAGjAPPA4SAAAAAGDydF9O5agMAAAAAMCkmYdH23PhR/v/qvvt9TzyngCQ5890nvqyjlGUPA1gHK30pyKM79uY/tTyoeTJCd5a+pUSPVNPpRgza3lPPFD0/DxQkqnyZ4vpHvZbmfLTlkqe+JFXxvtUn5KclttMWfbqMAR5PU2xWet5R1Po+cNh74JqxbUIO2Gv+cPX/vHUv3911REDAAAAAIAFL2ACAAAAAFgD5i1PlQEAAAAAmDzzsN2ycQcAAAAAmDjzsAiXWjbuAAAAAACTpjsqwxl3AAAAAIBJMw/bYSfshUW7E/bCZhM99Kd3kKa7myqZwlverrWIDvakvOpfSd2N7eh1U9ZsleKSetSKGooyugIpm3le6XXzdNPzqPTJvLq2qkostg51o87rGwoloz4VUf+6fUXxPFYmtqZn3Dsf6m0t5KOMqVi8atfCVrjcWp56tVYufTSlNE+RNy/pKsWeKJqkspmyoM/w3nlMr5UqqWfWuwqU7EN0bb14+0xKKz1Titp5K3KsjDcir828+V/RQV87Ij+bbzz4yk/fe6H7R/cypmYrbITj/Rcz9a/En/t1++X7zcTllbt2rbhkfN32PK6ltGW3bmuiRFTira1Diba2Bd23WB87CkU327K3J3t10FXScx0EvOX1WrZ6Xv1133Q9+1dKFND110eW3Yqij+KVEoWSO135VLt9++XzgN4/U63kRa0rE8ebNw97y+hj1uuzt4/Z9r350mPRvS3JoLKu6T54x7I3I4qeug66tVprt1eB4Sj3oe6KbFtrvv4fr/zgvZO3XVuvB+B7X6LRp/y1AiUvfMl7uVLJ61f0l5XUfQ2W9/VMJa/kUNpSNBz6VV8jvqzhtiveV5+UjIjyl3SUv4ZMfyFLrbFfq5fmteJFf+GO4n9eP7dbTz33rNaLfnTNbct9r4Z4qVnKB6WH2/a9vdGbi7y2bP9rzfN5eF8CVXcmHHNOrvtqxZIdiPKyvFo9oSRfea04W2y+ft8rv/3eQ5lpAAAAAACAUZh3/2u37+anuTdbYSMcu7tjHIJxdCM7U+ZuzY43rrj8+iqzvp5Pjb6StVQt75lDRzrlVur6Of5IWfcWmVvGofmDb7780XtN8v5m8+VwPCzaS3ecxktd9xLb6a50dNdTZVJ3lbb0uPLsp+720f3Pi7ckF7pXcSyp6BR9SnqakrvYQ28rSos2eix2+ZS2tXqsV4e+t7E/tg55/STVSt684e3zqewouRszL14l8yzbuVD0rDWn6Zn19oeSvAw31uy2ailcPpMrOdLj8vqWN/brrrwlOxl9trfn3rrjsXz3VbLuK+tvSRRD73K9Lfai+2Tjvgg77V7YDBtNdDbo0+vd530TvSvx3WQAPfve8nEt29tUK/HdOJZUW3b5FKlatn2lbqr1lGVbgby8KzqnfFO0tTNu9yU7m0q8ih29vIJe186OroDd6/QolPFoa6jMKvqcoPus50gfxYo+tp+Ktbzepc8e5bWUu15r/TLelUhXtWQU2wrYM7wer61k+Yyqz3v6TKjny5sLvUeV+OCdnWxVUx4qfuq9qHxFK1db0SFvFU557o2l1mpVsp9UvFqEnXav+dqFl09d3gkAAAAAADBh5snvidvY3/cfjrx2a3m7qqhrMZz/01Qm5ZX9XfXxNfGqZ8c1dBaGaKUkoun0vSl4OwU1avXnu4/Vrl9TizH1VJBxWrybKI+rfMyOsy6Mn8FaPnifmmV60nxt9vLPX/5u78bxsAg74cP9z581c9CVg00fv+2uXqtPv0W9VqpuSVypiFIe6u0qmtueqMk+7raWUimV2VRcKZ3t/mB7YudF8VmPWtEwpqR1JUb9ijL6bE/y5gHbmm15aJ1ty94Yvb1OiSVuVx87XlXt63l1U/7bM7NCyQyZUt7OgtKWMjfaduycKmrYmus+582NJRnJu1tSPm/GsPuPEoU+avLGSK1RZketrzW6D3k92W5LyZQ+W3pzapePW9RjWYSd8GHz5Gsv7V7+U3c6AQAAAABgRD45KjPmn/Dsgwrj/9GnxGbeH/tSCpT8MSXv+Iftf91eMfRBnTzdbA/1vlqrVw83Eoc4IKTnepw/xZborGdzCH28NlO+eXvsqo4NKJ6kMtJH7w+pWSK2o/SN8Q+k5c0weoz2db2tukf+hljXlLr9Fr0+pFqP+3CtHqV7WHcVyNufxKQs2PbHnMHs8ZiKomREmPabJx976R8u/17bnZuxxe3hLV9is+2727ubuq5YbiMpvRZSZRRr3lr91uPyqehSdxVPFH903eLrKW/1Vuy4UgrYSqYsezUs6Wl6jLZK5SO0POrh/FGyr6idlx3vSKnVe3WVvBGVa+iNUS8zDrVmUUUTW9W8Ua94681I3gxQa2yWqDF0fnXfakU33CguWQeVusOtBf0reWturVHjVbtkvdj//Ps/eekbl7+SJx8AAAAAAIzD/OZTtzaW3121GwAAAAAAYPH/1x9Z4wulgvoAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTQtMDUtMDRUMTk6NTU6MjYtMDc6MDAr/GiJAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE0LTA1LTA0VDE5OjU1OjI2LTA3OjAwWqHQNQAAAABJRU5ErkJggg==');\n  color: #ffffff;\n  font-weight: bold;\n}\n.ui-widget-header a {\n  color: #ffffff;\n}\n\n/* Interaction states\n----------------------------------*/\n.ui-state-default,\n.ui-widget-content .ui-state-default,\n.ui-widget-header .ui-state-default {\n  border: 1px solid #c5dbec;\n  background: #dfeffc 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAGQEAIAAACwqkHPAAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAk0lEQVRIx+3UIQrCABhH8ff9g8EggoKgA5mITe9hsFi8gDuFwewJdgHtYjTZ9Q5aRBjCBNnSNmzewOSXfu3FR3LOokoCAMdxHOfXcL2maVFwm71GZU2Ws6Ija9mGrmxMTCBb2oGBFNmBkMflfS+P0tpODEn22aKCZzuvV6Fsypa+bGIxwTe2szlN0aOBD95xnL/nA7WPJ+2NbKMjAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE0LTA1LTA0VDE5OjU1OjI2LTA3OjAwK/xoiQAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxNC0wNS0wNFQxOTo1NToyNi0wNzowMFqh0DUAAAAASUVORK5CYII=');\n  font-weight: bold;\n  color: #2e6e9e;\n}\n.ui-state-default a,\n.ui-state-default a:link,\n.ui-state-default a:visited {\n  color: #2e6e9e;\n  text-decoration: none;\n}\n.ui-state-hover,\n.ui-widget-content .ui-state-hover,\n.ui-widget-header .ui-state-hover,\n.ui-state-focus,\n.ui-widget-content .ui-state-focus,\n.ui-widget-header .ui-state-focus {\n  border: 1px solid #79b7e7;\n  background: #d0e5f5 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAGQEAIAAACwqkHPAAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAjklEQVRIx+3PoQ4BARzH8e/vl/STBEkz7yDQbIImunQewCtoHkSSdfWK2S4pprE56XbbjeAZjPBPn/BNX87VfV9VBoAgCILg6zyLqt801kZTda0hO0Z2qgMTa62CmZ0LLexcL1K7VKLMLpWwtHLBpym1t7ox53J8ZLW4JmWnHpsTKwZWjzat/5gOgiD4HW/gtCd0DyuhYAAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxNC0wNS0wNFQxOTo1NToyNy0wNzowMI2LYz0AAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTQtMDUtMDRUMTk6NTU6MjctMDc6MDD81tuBAAAAAElFTkSuQmCC');\n  font-weight: bold;\n  color: #1d5987;\n}\n.ui-state-hover a,\n.ui-state-hover a:hover,\n.ui-state-hover a:link,\n.ui-state-hover a:visited,\n.ui-state-focus a,\n.ui-state-focus a:hover,\n.ui-state-focus a:link,\n.ui-state-focus a:visited {\n  color: #1d5987;\n  text-decoration: none;\n}\n.ui-state-active,\n.ui-widget-content .ui-state-active,\n.ui-widget-header .ui-state-active {\n  border: 1px solid #79b7e7;\n  background: #f5f8f9 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAABkEAIAAACY3hF0AAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAi0lEQVQoz+3PIQ8BcRjA4d+9gc0m2Gg0STeFTTDJpjv12hW+gm8jC5pJoo+g2gTBzt37f98zX0G8ID35IcuKQlUA4M8v8O5pO7SEmCkjIWHOmHyh93Ahv4aZdSTaEbOkuJnYEU0t8Sb6tLOvCVvv+p7w8I2/sJWfyiF28E+ZCpNoQF9oUKdWiW11+QL3bzY9wDlB+AAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxNC0wNS0wNFQxOTo1NToyNi0wNzowMCv8aIkAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTQtMDUtMDRUMTk6NTU6MjYtMDc6MDBaodA1AAAAAElFTkSuQmCC');\n  font-weight: bold;\n  color: #e17009;\n}\n.ui-state-active a,\n.ui-state-active a:link,\n.ui-state-active a:visited {\n  color: #e17009;\n  text-decoration: none;\n}\n\n/* Interaction Cues\n----------------------------------*/\n.ui-state-highlight,\n.ui-widget-content .ui-state-highlight,\n.ui-widget-header .ui-state-highlight {\n  border: 1px solid #fad42e;\n  background: #fbec88 url(\"images/ui-bg_flat_55_fbec88_40x100.png\") 50% 50% repeat-x;\n  color: #363636;\n}\n.ui-state-highlight a,\n.ui-widget-content .ui-state-highlight a,\n.ui-widget-header .ui-state-highlight a {\n  color: #363636;\n}\n.ui-state-error,\n.ui-widget-content .ui-state-error,\n.ui-widget-header .ui-state-error {\n  border: 1px solid #cd0a0a;\n  background: #fef1ec url(\"images/ui-bg_glass_95_fef1ec_1x400.png\") 50% 50% repeat-x;\n  color: #cd0a0a;\n}\n.ui-state-error a,\n.ui-widget-content .ui-state-error a,\n.ui-widget-header .ui-state-error a {\n  color: #cd0a0a;\n}\n.ui-state-error-text,\n.ui-widget-content .ui-state-error-text,\n.ui-widget-header .ui-state-error-text {\n  color: #cd0a0a;\n}\n.ui-priority-primary,\n.ui-widget-content .ui-priority-primary,\n.ui-widget-header .ui-priority-primary {\n  font-weight: bold;\n}\n.ui-priority-secondary,\n.ui-widget-content .ui-priority-secondary,\n.ui-widget-header .ui-priority-secondary {\n  opacity: .7;\n  filter:Alpha(Opacity=70);\n  font-weight: normal;\n}\n.ui-state-disabled,\n.ui-widget-content .ui-state-disabled,\n.ui-widget-header .ui-state-disabled {\n  opacity: .35;\n  filter:Alpha(Opacity=35);\n  background-image: none;\n}\n.ui-state-disabled .ui-icon {\n  filter:Alpha(Opacity=35); /* For IE8 - See #6059 */\n}\n\n/* Icons\n----------------------------------*/\n\n/* states and images */\n.ui-icon {\n  width: 16px;\n  height: 16px;\n}\n.ui-icon,\n.ui-widget-content .ui-icon {\n  background-image: url(\"images/ui-icons_469bdd_256x240.png\");\n}\n.ui-widget-header .ui-icon {\n  background-image: url(\"images/ui-icons_d8e7f3_256x240.png\");\n}\n.ui-state-default .ui-icon {\n  background-image: url(\"images/ui-icons_6da8d5_256x240.png\");\n}\n.ui-state-hover .ui-icon,\n.ui-state-focus .ui-icon {\n  background-image: url(\"images/ui-icons_217bc0_256x240.png\");\n}\n.ui-state-active .ui-icon {\n  background-image: url(\"images/ui-icons_f9bd01_256x240.png\");\n}\n.ui-state-highlight .ui-icon {\n  background-image: url(\"images/ui-icons_2e83ff_256x240.png\");\n}\n.ui-state-error .ui-icon,\n.ui-state-error-text .ui-icon {\n  background-image: url(\"images/ui-icons_cd0a0a_256x240.png\");\n}\n\n/* positioning */\n.ui-icon-blank { background-position: 16px 16px; }\n.ui-icon-carat-1-n { background-position: 0 0; }\n.ui-icon-carat-1-ne { background-position: -16px 0; }\n.ui-icon-carat-1-e { background-position: -32px 0; }\n.ui-icon-carat-1-se { background-position: -48px 0; }\n.ui-icon-carat-1-s { background-position: -64px 0; }\n.ui-icon-carat-1-sw { background-position: -80px 0; }\n.ui-icon-carat-1-w { background-position: -96px 0; }\n.ui-icon-carat-1-nw { background-position: -112px 0; }\n.ui-icon-carat-2-n-s { background-position: -128px 0; }\n.ui-icon-carat-2-e-w { background-position: -144px 0; }\n.ui-icon-triangle-1-n { background-position: 0 -16px; }\n.ui-icon-triangle-1-ne { background-position: -16px -16px; }\n.ui-icon-triangle-1-e { background-position: -32px -16px; }\n.ui-icon-triangle-1-se { background-position: -48px -16px; }\n.ui-icon-triangle-1-s { background-position: -64px -16px; }\n.ui-icon-triangle-1-sw { background-position: -80px -16px; }\n.ui-icon-triangle-1-w { background-position: -96px -16px; }\n.ui-icon-triangle-1-nw { background-position: -112px -16px; }\n.ui-icon-triangle-2-n-s { background-position: -128px -16px; }\n.ui-icon-triangle-2-e-w { background-position: -144px -16px; }\n.ui-icon-arrow-1-n { background-position: 0 -32px; }\n.ui-icon-arrow-1-ne { background-position: -16px -32px; }\n.ui-icon-arrow-1-e { background-position: -32px -32px; }\n.ui-icon-arrow-1-se { background-position: -48px -32px; }\n.ui-icon-arrow-1-s { background-position: -64px -32px; }\n.ui-icon-arrow-1-sw { background-position: -80px -32px; }\n.ui-icon-arrow-1-w { background-position: -96px -32px; }\n.ui-icon-arrow-1-nw { background-position: -112px -32px; }\n.ui-icon-arrow-2-n-s { background-position: -128px -32px; }\n.ui-icon-arrow-2-ne-sw { background-position: -144px -32px; }\n.ui-icon-arrow-2-e-w { background-position: -160px -32px; }\n.ui-icon-arrow-2-se-nw { background-position: -176px -32px; }\n.ui-icon-arrowstop-1-n { background-position: -192px -32px; }\n.ui-icon-arrowstop-1-e { background-position: -208px -32px; }\n.ui-icon-arrowstop-1-s { background-position: -224px -32px; }\n.ui-icon-arrowstop-1-w { background-position: -240px -32px; }\n.ui-icon-arrowthick-1-n { background-position: 0 -48px; }\n.ui-icon-arrowthick-1-ne { background-position: -16px -48px; }\n.ui-icon-arrowthick-1-e { background-position: -32px -48px; }\n.ui-icon-arrowthick-1-se { background-position: -48px -48px; }\n.ui-icon-arrowthick-1-s { background-position: -64px -48px; }\n.ui-icon-arrowthick-1-sw { background-position: -80px -48px; }\n.ui-icon-arrowthick-1-w { background-position: -96px -48px; }\n.ui-icon-arrowthick-1-nw { background-position: -112px -48px; }\n.ui-icon-arrowthick-2-n-s { background-position: -128px -48px; }\n.ui-icon-arrowthick-2-ne-sw { background-position: -144px -48px; }\n.ui-icon-arrowthick-2-e-w { background-position: -160px -48px; }\n.ui-icon-arrowthick-2-se-nw { background-position: -176px -48px; }\n.ui-icon-arrowthickstop-1-n { background-position: -192px -48px; }\n.ui-icon-arrowthickstop-1-e { background-position: -208px -48px; }\n.ui-icon-arrowthickstop-1-s { background-position: -224px -48px; }\n.ui-icon-arrowthickstop-1-w { background-position: -240px -48px; }\n.ui-icon-arrowreturnthick-1-w { background-position: 0 -64px; }\n.ui-icon-arrowreturnthick-1-n { background-position: -16px -64px; }\n.ui-icon-arrowreturnthick-1-e { background-position: -32px -64px; }\n.ui-icon-arrowreturnthick-1-s { background-position: -48px -64px; }\n.ui-icon-arrowreturn-1-w { background-position: -64px -64px; }\n.ui-icon-arrowreturn-1-n { background-position: -80px -64px; }\n.ui-icon-arrowreturn-1-e { background-position: -96px -64px; }\n.ui-icon-arrowreturn-1-s { background-position: -112px -64px; }\n.ui-icon-arrowrefresh-1-w { background-position: -128px -64px; }\n.ui-icon-arrowrefresh-1-n { background-position: -144px -64px; }\n.ui-icon-arrowrefresh-1-e { background-position: -160px -64px; }\n.ui-icon-arrowrefresh-1-s { background-position: -176px -64px; }\n.ui-icon-arrow-4 { background-position: 0 -80px; }\n.ui-icon-arrow-4-diag { background-position: -16px -80px; }\n.ui-icon-extlink { background-position: -32px -80px; }\n.ui-icon-newwin { background-position: -48px -80px; }\n.ui-icon-refresh { background-position: -64px -80px; }\n.ui-icon-shuffle { background-position: -80px -80px; }\n.ui-icon-transfer-e-w { background-position: -96px -80px; }\n.ui-icon-transferthick-e-w { background-position: -112px -80px; }\n.ui-icon-folder-collapsed { background-position: 0 -96px; }\n.ui-icon-folder-open { background-position: -16px -96px; }\n.ui-icon-document { background-position: -32px -96px; }\n.ui-icon-document-b { background-position: -48px -96px; }\n.ui-icon-note { background-position: -64px -96px; }\n.ui-icon-mail-closed { background-position: -80px -96px; }\n.ui-icon-mail-open { background-position: -96px -96px; }\n.ui-icon-suitcase { background-position: -112px -96px; }\n.ui-icon-comment { background-position: -128px -96px; }\n.ui-icon-person { background-position: -144px -96px; }\n.ui-icon-print { background-position: -160px -96px; }\n.ui-icon-trash { background-position: -176px -96px; }\n.ui-icon-locked { background-position: -192px -96px; }\n.ui-icon-unlocked { background-position: -208px -96px; }\n.ui-icon-bookmark { background-position: -224px -96px; }\n.ui-icon-tag { background-position: -240px -96px; }\n.ui-icon-home { background-position: 0 -112px; }\n.ui-icon-flag { background-position: -16px -112px; }\n.ui-icon-calendar { background-position: -32px -112px; }\n.ui-icon-cart { background-position: -48px -112px; }\n.ui-icon-pencil { background-position: -64px -112px; }\n.ui-icon-clock { background-position: -80px -112px; }\n.ui-icon-disk { background-position: -96px -112px; }\n.ui-icon-calculator { background-position: -112px -112px; }\n.ui-icon-zoomin { background-position: -128px -112px; }\n.ui-icon-zoomout { background-position: -144px -112px; }\n.ui-icon-search { background-position: -160px -112px; }\n.ui-icon-wrench { background-position: -176px -112px; }\n.ui-icon-gear { background-position: -192px -112px; }\n.ui-icon-heart { background-position: -208px -112px; }\n.ui-icon-star { background-position: -224px -112px; }\n.ui-icon-link { background-position: -240px -112px; }\n.ui-icon-cancel { background-position: 0 -128px; }\n.ui-icon-plus { background-position: -16px -128px; }\n.ui-icon-plusthick { background-position: -32px -128px; }\n.ui-icon-minus { background-position: -48px -128px; }\n.ui-icon-minusthick { background-position: -64px -128px; }\n.ui-icon-close { background-position: -80px -128px; }\n.ui-icon-closethick { background-position: -96px -128px; }\n.ui-icon-key { background-position: -112px -128px; }\n.ui-icon-lightbulb { background-position: -128px -128px; }\n.ui-icon-scissors { background-position: -144px -128px; }\n.ui-icon-clipboard { background-position: -160px -128px; }\n.ui-icon-copy { background-position: -176px -128px; }\n.ui-icon-contact { background-position: -192px -128px; }\n.ui-icon-image { background-position: -208px -128px; }\n.ui-icon-video { background-position: -224px -128px; }\n.ui-icon-script { background-position: -240px -128px; }\n.ui-icon-alert { background-position: 0 -144px; }\n.ui-icon-info { background-position: -16px -144px; }\n.ui-icon-notice { background-position: -32px -144px; }\n.ui-icon-help { background-position: -48px -144px; }\n.ui-icon-check { background-position: -64px -144px; }\n.ui-icon-bullet { background-position: -80px -144px; }\n.ui-icon-radio-on { background-position: -96px -144px; }\n.ui-icon-radio-off { background-position: -112px -144px; }\n.ui-icon-pin-w { background-position: -128px -144px; }\n.ui-icon-pin-s { background-position: -144px -144px; }\n.ui-icon-play { background-position: 0 -160px; }\n.ui-icon-pause { background-position: -16px -160px; }\n.ui-icon-seek-next { background-position: -32px -160px; }\n.ui-icon-seek-prev { background-position: -48px -160px; }\n.ui-icon-seek-end { background-position: -64px -160px; }\n.ui-icon-seek-start { background-position: -80px -160px; }\n/* ui-icon-seek-first is deprecated, use ui-icon-seek-start instead */\n.ui-icon-seek-first { background-position: -80px -160px; }\n.ui-icon-stop { background-position: -96px -160px; }\n.ui-icon-eject { background-position: -112px -160px; }\n.ui-icon-volume-off { background-position: -128px -160px; }\n.ui-icon-volume-on { background-position: -144px -160px; }\n.ui-icon-power { background-position: 0 -176px; }\n.ui-icon-signal-diag { background-position: -16px -176px; }\n.ui-icon-signal { background-position: -32px -176px; }\n.ui-icon-battery-0 { background-position: -48px -176px; }\n.ui-icon-battery-1 { background-position: -64px -176px; }\n.ui-icon-battery-2 { background-position: -80px -176px; }\n.ui-icon-battery-3 { background-position: -96px -176px; }\n.ui-icon-circle-plus { background-position: 0 -192px; }\n.ui-icon-circle-minus { background-position: -16px -192px; }\n.ui-icon-circle-close { background-position: -32px -192px; }\n.ui-icon-circle-triangle-e { background-position: -48px -192px; }\n.ui-icon-circle-triangle-s { background-position: -64px -192px; }\n.ui-icon-circle-triangle-w { background-position: -80px -192px; }\n.ui-icon-circle-triangle-n { background-position: -96px -192px; }\n.ui-icon-circle-arrow-e { background-position: -112px -192px; }\n.ui-icon-circle-arrow-s { background-position: -128px -192px; }\n.ui-icon-circle-arrow-w { background-position: -144px -192px; }\n.ui-icon-circle-arrow-n { background-position: -160px -192px; }\n.ui-icon-circle-zoomin { background-position: -176px -192px; }\n.ui-icon-circle-zoomout { background-position: -192px -192px; }\n.ui-icon-circle-check { background-position: -208px -192px; }\n.ui-icon-circlesmall-plus { background-position: 0 -208px; }\n.ui-icon-circlesmall-minus { background-position: -16px -208px; }\n.ui-icon-circlesmall-close { background-position: -32px -208px; }\n.ui-icon-squaresmall-plus { background-position: -48px -208px; }\n.ui-icon-squaresmall-minus { background-position: -64px -208px; }\n.ui-icon-squaresmall-close { background-position: -80px -208px; }\n.ui-icon-grip-dotted-vertical { background-position: 0 -224px; }\n.ui-icon-grip-dotted-horizontal { background-position: -16px -224px; }\n.ui-icon-grip-solid-vertical { background-position: -32px -224px; }\n.ui-icon-grip-solid-horizontal { background-position: -48px -224px; }\n.ui-icon-gripsmall-diagonal-se { background-position: -64px -224px; }\n.ui-icon-grip-diagonal-se { background-position: -80px -224px; }\n\n\n/* Misc visuals\n----------------------------------*/\n\n/* Corner radius */\n.ui-corner-all,\n.ui-corner-top,\n.ui-corner-left,\n.ui-corner-tl {\n  border-top-left-radius: 5px;\n}\n.ui-corner-all,\n.ui-corner-top,\n.ui-corner-right,\n.ui-corner-tr {\n  border-top-right-radius: 5px;\n}\n.ui-corner-all,\n.ui-corner-bottom,\n.ui-corner-left,\n.ui-corner-bl {\n  border-bottom-left-radius: 5px;\n}\n.ui-corner-all,\n.ui-corner-bottom,\n.ui-corner-right,\n.ui-corner-br {\n  border-bottom-right-radius: 5px;\n}\n\n/* Overlays */\n.ui-widget-overlay {\n  background: #aaaaaa url(\"images/ui-bg_flat_0_aaaaaa_40x100.png\") 50% 50% repeat-x;\n  opacity: .3;\n  filter: Alpha(Opacity=30);\n}\n.ui-widget-shadow {\n  margin: -8px 0 0 -8px;\n  padding: 8px;\n  background: #aaaaaa url(\"images/ui-bg_flat_0_aaaaaa_40x100.png\") 50% 50% repeat-x;\n  opacity: .3;\n  filter: Alpha(Opacity=30);\n  border-radius: 8px;\n}\n</style>\n<style type=\"text/css\" media=\"screen,print\">\n/* vietnam.css */\n\n/*----------------------------------------------------------------------------*/\n/* General                                                                    */\n/*----------------------------------------------------------------------------*/\n\n*\n{\n  font-family: LiberationSans, arial, sans-serif;\n  line-height: 140%;\n}\n\nhtml,body\n{\n  margin: 0px;\n  padding: 0px;\n  background-color: white;\n}\n\nimg\n{\n  border: 0;\n}\n\nul,ol\n{\n  padding: 0px;\n}\n\na\n{\n  text-decoration: none;\n  color: #3b73b8;\n}\n\nselect\n{\n  padding: 1px;\n}\n\na:hover\n{\n  text-decoration: underline;\n}\n\ninput[type=text],input[type=password],input[type=email],textarea\n{\n  border: 1px solid #aaa;\n  padding: 5px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Header                                                                     */\n/*----------------------------------------------------------------------------*/\n\n#header\n{\n  background-color: #b40303;\n  height: 50px;\n  position: fixed;\n  z-index: 15;\n  top: 0px;\n  left: 0px;\n  right: 0px;\n  box-shadow: 0 0 2px #222;\n}\n\n#headerBanner\n{\n  position: absolute;\n  top: 13px;\n  left: 55px;\n}\n\n#headerText\n{\n  position: absolute;\n  top: 4px;\n  left: 175px;\n  font-weight: bold;\n  color: #fff;\n  font-size: 16px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* DropDown Menu                                                              */\n/*----------------------------------------------------------------------------*/\n\n.gearDropDown\n{\n  background-color : #f7f7f7;\n  float            : right;\n  border           : 1px solid #eaeaea;\n  padding          : 4px 10px;\n  cursor           : pointer;\n  border-top-left-radius  : 3px;\n  border-top-right-radius : 3px;\n}\n\n.gearDropDown.active\n{\n  background-color : #ddd;\n}\n\n.dropDown\n{\n  position                   : absolute;\n  display                    : none;\n  font-size                  : 9pt;\n  color                      : #000;\n  border                     : 1px solid #ddd;\n  padding-left               : 2px;\n  padding-right              : 2px;\n  width                      : 70px;\n  max-height                 : 610px;\n  overflow-y                 : auto;\n  background-color           : #f7f7f7;\n  z-index                    : 9;\n  border-bottom-left-radius  : 3px;\n  border-bottom-right-radius : 3px;\n  box-shadow                 : #ccc 0 1px 1px 0;\n}\n\n.dropDown > ul\n{\n  margin: 6px 0;\n}\n\n.dropDown > ul > li\n{\n  list-style-type : none;\n  padding         : 0;\n  margin          : 0;\n}\n\n.dropDown > ul > li > a\n{\n  display       : block;\n  padding       : 8px 5px;\n  color         : #000;\n  border-radius : 3px;\n  cursor        : pointer;\n}\n\n.dropDown > ul > li > a:hover\n{\n  text-decoration  : none;\n  background-color : #eee;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Context Menu                                                               */\n/*----------------------------------------------------------------------------*/\n\n.contextMenu\n{\n  position                   : absolute;\n  font-size                  : 9pt;\n  color                      : #000;\n  border                     : 1px solid #ddd;\n  padding-left               : 4px;\n  padding-right              : 4px;\n  width                      : 189px;\n  max-height                 : 610px;\n  overflow-y                 : auto;\n  background-color           : #f7f7f7;\n  display                    : none;\n  z-index                    : 9;\n  filter                     : alpha(opacity=94);\n  opacity                    : 0.94;\n  border-bottom-left-radius  : 3px;\n  border-bottom-right-radius : 3px;\n  box-shadow                 : #ccc 0px 1px 1px 0px;\n}\n\n.contextMenuItems\n{\n  list-style-type : none;\n  padding         : 0;\n  margin          : 10px 0;\n}\n\n.contextMenuItems a\n{\n  display       : block;\n  padding       : 10px 10px;\n  color         : #000;\n  border-radius : 3px;\n  cursor        : pointer;\n}\n\n.contextMenuItems a:hover\n{\n  text-decoration  : none;\n  background-color : #eee;\n}\n\n.contextMenuItemActive\n{\n  background-color: #246BA1 !important;\n  color: #fff !important;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Left bar                                                                   */\n/*----------------------------------------------------------------------------*/\n\n#leftBar\n{\n  height: 100%;\n  background-color: #f7f7f7;\n  width: 235px;\n  position: fixed;\n  top: 44px;\n  left: 0px;\n  padding-top: 7px;\n  border-right: 1px solid #e1e1e1;\n  z-index: 10;\n}\n\n#leftBarContents\n{\n  font-size: 9pt;\n}\n\n#leftBarContents h2\n{\n  font-size: 9pt;\n  margin: 16px 20px 2px 20px;\n  padding: 7px 0 7px 0;\n  font-weight: normal;\n  font-weight: bold;\n}\n\n#leftBarContents ul\n{\n  list-style-type: none;\n  padding: 0;\n  margin: 0 8px;\n}\n\n#leftBarContents ul a\n{\n  display: block;\n  color: #303030;\n  text-decoration: none;\n  padding: 8px 12px;\n  cursor: pointer;\n  border-bottom: 1px solid #ddd;\n}\n\n#leftBarContents a:hover\n{\n  text-decoration: none;\n  background-color: #eee;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Main page                                                                  */\n/*----------------------------------------------------------------------------*/\n\n.mainPageTable\n{\n  width: 100%;\n}\n\n.page\n{\n  font-size: 9pt;\n}\n\n.page h1\n{\n  font-size: 16pt;\n  font-weight: normal;\n  color: #606060;\n}\n\n.page h2\n{\n  font-size: 15pt;\n  font-weight: normal;\n  color: #606060;\n}\n\n.page h3\n{\n  font-size: 14pt;\n  font-weight: normal;\n  color: #606060;\n}\n\n.page h4\n{\n  font-size: 13pt;\n  font-weight: normal;\n  color: #606060;\n}\n\n.page h5\n{\n  font-size: 12pt;\n  font-weight: normal;\n  color: #606060;\n}\n\n.page h6\n{\n  font-size: 11pt;\n  font-weight: normal;\n  color: #606060;\n}\n\n.page p,.page td,.page th,.page input,.page select,.page textarea\n{\n  font-size: 9pt;\n}\n\n.page th, thead tr, .tabHead\n{\n  background-color: #cbddeb;\n  background-repeat: repeat-x;\n  text-align: left;\n  color: #39547d;\n  padding:3px 0px 2px 6px;\n  border-style: solid;\n  border-width: 1px;\n  border-color: #c8dbea;\n  font-weight: bold;\n  font-size: 13px;\n}\n\n#mainPage\n{\n  margin: 69px 10px 10px 270px;\n}\n\n.required\n{\n  font-style: normal;\n  color: #ff0000;\n}\n\n.listTable\n{\n  width: 100%;\n  border-collapse: collapse;\n  padding-top: 10px;\n  cursor: pointer;\n}\n\n.listTable th\n{\n  background-color: rgba( 0, 0, 0, 0 );\n  border-bottom: 1px solid #cad5e5;\n  padding: 6px 5px 3px 5px;\n  text-align: center;\n}\n\n.listTable td\n{\n  padding: 11px 5px 10px 5px;\n}\n\n.listRow\n{\n  border-bottom: 1px solid #cad5e5;\n}\n\n.listAlternateRow\n{\n  border-bottom: 1px solid #cad5e5;\n  background-color: #ebf0f6;\n}\n\n.listHoverRow\n{\n  background-color: #dfe9f4;\n}\n\n.bold, .bold td\n{\n  font-weight: bold;\n}\n\n.normal\n{\n  font-weight: normal;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Intro                                                                      */\n/*----------------------------------------------------------------------------*/\n\n.introList\n{\n  list-style-type:none;\n  width: 100%;\n  max-width: 1100px;\n  padding-top: 10px;\n  padding-bottom: 20px;\n  color: #444;\n}\n\n.moduleList\n{\n  list-style-type:none;\n  width: 100%;\n  max-width: 1100px;\n  padding-top: 10px;\n  padding-bottom: 20px;\n  color: #444;\n}\n\n.introList li\n{\n  width: 435px;\n  margin-right: 30px;\n}\n\n.moduleList li\n{\n  width: 305px;\n  margin-right: 20px;\n}\n\n.introIcon\n{\n  float: left;\n}\n\n.introItem\n{\n  padding: 15px;\n  cursor: pointer;\n  min-height: 44px;\n  border-bottom: 1px solid #e0e0e0;\n  float: left;\n}\n\n.introItem:hover\n{\n  background-color: #edf2f2;\n}\n\n.introItemHeader\n{\n  font-weight: bold;\n  color: #3F693F;\n  font-size: 13px;\n}\n\n.introItemText\n{\n  margin-left: 73px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* @font-face                                                                 */\n/*----------------------------------------------------------------------------*/\n\n@font-face {\n    font-family: 'LiberationSans';\n    src: format('woff') url(data:application/x-font-woff;charset=utf-8;base64,d09GRgABAAAAAHKsABAAAAAAuTAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAABGRlRNAAABbAAAABsAAAAcWnB4kEdERUYAAAGIAAAAHgAAACABIAAET1MvMgAAAagAAABcAAAAYPcVhgFjbWFwAAACBAAAAaUAAAIKusGAI2N2dCAAAAOsAAAAQAAAAEAQJw1MZnBnbQAAA+wAAAGxAAACZQ+0L6dnYXNwAAAFoAAAAAwAAAAMAAMAB2dseWYAAAWsAABlTAAApzD5Y9k8aGVhZAAAavgAAAAxAAAANvgFEgVoaGVhAABrLAAAACAAAAAkDeQGUWhtdHgAAGtMAAACBwAAA8zuPEnybG9jYQAAbVQAAAHiAAAB6GLHkCRtYXhwAABvOAAAACAAAAAgAhcDzW5hbWUAAG9YAAABAQAAAfArE0Y2cG9zdAAAcFwAAAIPAAADNUNXkCJwcmVwAABybAAAAEAAAABAXsu7eXjaY2BgYGQAguP/NtwH0SctHl+D0rcAYG4IzgB42mNgZGBg4ANiCQYQYGJgBMJPQMwC5jEAAA6wASUAAHjaY2BmMWKcwMDKwMI6i9WYgYFRGkIzX2RIYxLiYGXiZmNhAgGWBQxM6wMYKn4zQIGhY7AzgwODwm8W1sv/ghiN2W0ZNyUwMMy/f52BgcWStRGoRIGBEQCpshCFeNpjYGBgZoBgGQZGIMnAyALkMYL5LAwvgLQZgwKQJcZQx/Cf0ZAxmLGC6RjTLaY7zHUKXAoiClIKcgpKCmoK+gpWCi4K8QprFJWURJUkHzB8YPrN8v8/UL8CwwKgviAkfQwKAgoSCjJQfZZo+hh/M/7////x/0P/J/4v/O/7j+Hv279v/ix4cPLBkQcHHxx4sPfBrgebHqx8sOBB2wOr+0fvnb+XoPBC4AXrC4j7yQGMbAxwzYxMQIIJXQEwiFhY2dg5OLm4eXj5+AUEhYRFRMXEJSSlpGVk5eQVFJWUVVTV1DU0tbR1dPX0DQyNjE1MzcwtLK2sbWzt7B0cnZxdXN3cPTy9vH18/fwDAoOCQ0LDwiMio6JjYuPiExIZ2to7uyfPmLd40ZJlS5evXL1qzdr16zZs3Lx1y7Yd2/fs3ruPoSglNfN+xcKC7OdlWQwdsxiKGRjSy8Guy6lhWLGrMTkPxM6tfZDU1Dr98JHrN+7cvXlrJ8PBo0+ePXr88hVD5e17DC09zb1d/RMm9k2dxjBlztzZh46dKGRgOF4F1AgAsYiZrQAAAP5WAAAEOQWBBcsAnAC+AGoAlgB/AIwArQCUAI4AkACeALgAmgCnAKMAsgCgAKoAsACYAIIAigCSAG8AZQB9AGd42l1Ru05bQRDdDQ8DgcTYIDnaFLOZkALvhTZIIK4uwsh2YzlC2o1c5GJcwAdQIFGD9msGaChTpE2DkAskPoFPiJSZNYmiNDs7s3POmTNLypGqd2m956lzFkjhboNmm34npNpFgAfS9Y1GRtrBIy02M3rlun2/j8FmNOVOGkB5z1vKQ0bTTqAW7bl/Mj+D4T7/yzwHg5Zmmp5aZyE9hMB8M25p8DWjWXf9QV+xOlwNBoYU01Tc9cdUyv+W5lxtGbY2M5p3cCEiP5gGaGqtjUDTnzqkej6OYgly+WysDSamrD/JRHBhMl3VVC0zvnZwn+wsOtikSnPgAQ6wVZ6Ch+OjCYX0LYkyS0OEg9gqMULEJIdCTjl3sj8pUD6ShDFvktLOuGGtgXHkNTCozdMcvsxmU9tbhzB+EUfw3S/Gkg4+sqE2RoTYjlgKYAKRkFFVvqHGcy+LAbnU/jMQJWB5+u1fJwKtOzYRL2VtnWOMFYKe3zbf+WXF3apc50Whu3dVNVTplOZDL2ff4xFPj4XhoLHgzed9f6NA7Q2LGw2aA8GQ3o3e/9FadcRV3gsf2W81s7EWAAAAAAAAAgAEAAL//wADeNqsvQ18G9WZLzxnNPq0LI+kkcayLI/HY1mWJ/JEGo+ViSx/xXEc4RjXMa5jjEmDMSYQ0pBN0zSber2BZtMU2LSUstlcLuXysvlx8+uOZJPSlO0aKKW8bX4syza7Xdrb22W5e+lLC8vtdhuIxfucM5I/AnTv3rv+OJo5M5qZ8zzPec7/+ThnKJq6RFHWpHWeslB2qoMqWBAlL1qtFMfIBaiTFxmyjQyHYlguL1ptlJeRDSubtyF5kSZ7eSeSqY1Jv+gV/V7Re4mZfv/soOWH1vn35qza+zzzJkVRNPU0RaG50n12UAUK3wdZKQHuw8B9yA2oywaTyltsbxpW8rFgs1AOedFuo8JwU7uyaCNb5IZ5Bnl9hk3fmFQ1NWBRLdLTzz/7QugrL71knb/qpsg9xywv0uV7dlKkPQajLlqslAuuZ0uZLTR3yQPYL5dusRC2Mx45b7W9WW4d3ADB/9jT3H1o8kLgAet8sR9dLPbj+zgoipm1HqHClICuowo10LZCIBhSVdUIKwWOr4atRdpKidBYb20klUoZFqXA1gm43mbWO12VUF+wWVzyQrfN7pQLjgo31CCjXsmLSDbaay52nn33IhWQXUZNq+FoNWrYfMh+xXCwebv9ysXOr737ODkYbDXcrUaQzQfgoJvNV8BHDbtA19j98oKFlDZcGiF2wRlywEaQXXAFK2AjwC5UBtxwAktKLyk5XOJzeHIOfKuafAuuGS5fp7Z8nQg+Z6GufKaA6y3d1bTFZnc4XRXuStbLBYJ8dagmXBupE1o/5sforsFE11S/pIlAe/yvBiSLGBAtkh//p0W/6Pj50FXkn7hzHO0b3zf+1/80jJji/xjfN1r86s59o/eiO3YUz6CH70QH7kQPF2fx/53FB+40t0g9BfznPzjIjFjforZSN1AzqI8yehWjS807rW8aY6lCrxOzo7fHKRvXK0ZczYesbxZC1+PKUI0ThOY2xfBfzveDyFL1l72LyEZ1gGj1s3kXkguhniHg4OIMEalCuKULc36GzU8hOZ8G0Zo12fr20edkzDmPUcka00v5QccVI7HEwN6Cq3LaL5dPqFiowLuMMcgutAwm4MA708++TQ7IeHdhAy6ZhSH8gb89g08vwLH6L9Z/UbJ5vD7d2KAX4CqwRXVXuCoqWxKDQ9Mz8oY1tEcXKioTg9MrdcALlJ+agd4W1Y2012jUqbyzF3a36Mb13kUK+RujjbxuhHz52ogOHdKfDvLmrzfWZP5qbelOOg0dtXzEjqu9dYgPrvxydhv5DUgaHPRz5WvgOg9C7Wnzt610Tf5Jj4+PJ5LpYW54YEjTo5Io3P3o1NHZ/q4OVYxUf4PrzBz2DQV6W9ItSq3g86GIoOnjY0eOvnbks98PBEVJiWf70ooYqUVzvemkLFVziA81y0lpCB2N6s1yvcT67Ogdmy8UbpK7s7cO93SNJOh77rFxvtaYro6IU22qu9hn89p8Xr5GiMa19EBuy0AiKQi2r3/ddeOkpU9vjFaHWI8XPU77PGF+x9W7GI8nEkrE0n3ReHXY4wqA+qVyH/za9iPrfVQdlaV6qE9Rn6d+RhUmQIvkO3tAQ+w1NYQDlFW+qxsq2knFYnXThKMSPsy93GfJXo7sIWMOq9NFwVSdApvvBH3dY6OaYK+HzbfCHmseY9l8L+ztMff2sPku2Os2z+xm8wdgb8RUu39giqt270/+CYurBYFk5DsFkIRq3ejxFvgmh67r+e4uqPksCEn1Xq9voXdkzwGQjnx7DnZYoZWCHRCRNpObasrkcqDE/AaTuWmOx6KhpsyztDLPG8yz/Eh1otIV0tdcIbZ6CVxfh9ZcohVJDeSkXHVIjmfSA73pTFwOhULheCKdnetMJ2Lh6tNud0t9WJHDIse7XS53gK8VY9FoQ4CrdJ+x/MnZq9N0LhRqiXekB/rb9Ra5OhzmWxObst3ZbLpVrg496HYHODE8USNy8A34PtfbFO/F25aXj4+Nakme4/ikNjp2/NjYhJoO8Dy3SZkcm7u5p297gGW5Jjmr3bFf64rFPSzyVjVHt3S//zIeTFHh3rHxtmSQQwFOVXdNzh2eHNbh+yjIbYLLHbu5pysW5eA7XDTW1XPzfq2vMSbCo2/pxXpu4IO3rJr1JLWT2kvNU7+mCoN4BL7RSrWCaHVjWUuDykuzi0OmtPF4aPx8SZj+kAjTqKncRtk8C0Jxhykid7D5w7AnmHuCKVqKKTDHTYEJ137PZuo3B2scWMrf5rpiNC4tNN3WCNoJylXtRC06GptuO2CqoTXbRAUdvgMkiB+88RasbARvoUXtw+KmtHp9+XS3DgI31A2S16Hn0zfCZ59ufN57gWKFzOgt+9cJXXpVKbWnO9GqDJr6B+/gs/jSDpHCAOxIWLTMc8ztspjVobKkkktjCeVKF4HfWFn07LaBmlBCyeo7fVWeSofDxvEx+cRELpvZKNeE+7X0YN949rr+T+ob5JovC7o6oGrpjVxcqOYS0ehM34AuRKVkQk93HxobTWuRmnM+nxS9Y3ss0dwQ4x2x/unxzoOZ7L/6fRGtPxsDuUZuV4TfKu9OptDB3NZeVYvHomKTJEeSzQ19aTgl6fM1SWm9K3c4oUTF6N237p4end17UJ4/un+vFuQZi/MEPGa91BGqDvl8lW5ALEl4SL1VkaLNLmeVr8omjpw8cig5kKP3b+7JdnBiRGiIxTdG68LVXEjVMA5D1KzlRSQSHFZPrcdcjJKnYDBEMBhaV3DW7Lf4+zC8It+dK47Tj1gvUSIVpwpOBiPFBiyNeR+MuT42XwMy5kzlQ7DnSuUl8yJamdNqiV1saTCRSqyf43i5ddvQ+DfGc7lYguN5viWW65/8xvjQtlaZ52iWOf25k3sP7T8ytfvI4X1HPne8+M/H5w7v+8zB6akj+39v7xePkGdzw7PJ5WerWn02oyqVF+GB2JQhsnkHNBAer/xsJalgSypNLQ1/EVQe/9yT/bmYHAS9kIjlcuPlZyo9cXF8+uDhOw/PHUdVx49+dt/hI7vhiQ7tPXnky8zpIyfvOHTXkSnybCJdoItAcw8lAaonCLtKMegyhMddOG+loZ9U6Pip0laA0FHeytsrUCwtJpDLdcKNHIniG986/NCfHn6GyX7hDhQv/vi2e7a/N4DoD6iB35q8naYWmQHmEaoC8JNBAYRW88iKATxAfAyTKBdAWUThTWTBiMmtGK7LBp1adJojDpMC7IsPOzHodRHA5aKccr6yxEvRq3oB93kl7zQ69yA6Vxx/kN79ZXS+OPrl4ig6D8/wdPE9NE+9RrHUdqpgxXoNQLUflJjVhq9mZfF9vYphu2xQqbzdFBUHfDjYRca0aEAQfUAROwMUYfUSnzQJEEuZLU/L4dCu5xna7fByVcX3MgO9Pa+di+mSIkkJzqTFBHqFHqYPgIQ3YFpgQuD/spgvWmyUE0hvLTcsMIF+g1559FH83YvYPoI2WChl1TrCbVizjS+ERR9MI/JvXgjbPxdfeO018xmoD96idZBJC6YF/q5hUQs0yKaB1NL3sd3mMJ8Dq+fst9+uIYYDxeYt1isGzcJDX7HkkaWMwwPwVXT2PxVv56w/f08wbavhD95iJOtDVITKUP1UgccjSBTAMUEpbbjRHeRZ64DMdWx+AxCXhUfOwueGOq+vEOQxWKDybVFQ3yylfxwo8KBrNe06SCCVIMFwNLql66axu2Y+Odnd1xiNxbv7/vyV8V09/Q3RCwG+Mb7/uoH98eYAD9uxTdpgLqvHosEA/eyPTp0YH5FEURoZP3HqRy//0QPDY9sbo2OTx7946dzth7L9ut7fd9ehs8bsoWxfTTgS3pI9NEvofBZsPg/0Lxd12KQzEXsHtuCwBc1QtkqgMKZDBbacsdQV7MS4s+MeYbHjTQuWc7fJhsa+H/QRNlhbGcPSasVGNgMjpQVsbdcVCwV1qMBYbSvWkQo9w6pFcec4i2aKz6MdT6CxM0zm9SffeD90Bj/jDDyjG3jUQX279IybgUONmEMcfrKsYlRezsvwZHIlfhy5A56sUsablfjJOs0ni//65f9qjt9W1nAu5dvBPkkuwc6C3eoES6OdXVDbk2B/tOGyAJWrI3oB6rDZoerUBavdmVTb2lfMjPX7eIyn8psp6IBINzhvIVwr6zqx78vQ3+R7K4o1lbhuj7WviAwGjOXOWoXMw2JgJt3fddPwcG6rnoj7uE41eVDWRKE2ZHvaIUnp3u1jM7M3jNwlCCG+VepObjnal1SSCZ7+2dyRscExkJLe9GD/zkxrUveyHl84nJQ7vINb+pV0KBIK7RnYdvO27ky30pXcPJNOyJ1p7QyRjSHoGyGg+yepOaowjOkO5mRhI6Z7o/XNRT44vBGEg8csGCedBMY/A7FY4+UHYLMeTMn8JmBL/SbMi/og8GIXHiYxcZp1o9676Ixt7O4BVEPlg07oQBTSdYP35rt74LPRV4g1b9LXmWIYoJT7jIy0Ml7B2MTesI6O69C0PRAkhOWvQddDF11+XzyqpXMnB4ekhjYtk940syfRmVTjooC29M8d/or7KXdzPJMdHh09Ojyia+GQF9BKWh8c7eoZDnBIiHRld00eODG2a7MeEdBeb1dzvFH0+/r6/nBIaa2NOBxnXQ4hlExcd3dPLzp6l2d370BLa5CPRNRkf9+OvmQ6Lguih3EIwlha690zmNO0cATVN7SpA9eBflJA9tOkf0ao/w7IAftkaNw1qQonXYn9QHkKOqwthYw6xXBeNtypRYcJcC2pgoMMQw4b9AengwxO0B8MlMoLZpdo+18/qcRdgjEQ9FR6KV/huuIxuKWFQAUHHYEnZTUpQ6SsIWUtLgtQrjHIa3RsPoWAfboR0KlvIi7A19RWh1bM8W4nXXFNXamz0BUgD5WYzRpSvWpAgjEyKnqrkAcBsxBWnphpCn3vX3zve08WPejdCp8NGuUqPuyw2xyMq8KNur5kuXB18P7is6jrfvpNTnR5Hb7K5bfcDluVzVPJEnkeAXmOAC17qHupwuayPDdYTJW/2FK9uQHkuQXqqlswsapFPOD2Kob3cj4FSn+LSbSun191EQ0nthrRVg/GRk0VV6xGlM03VGAN19SKFsSGaFOphfmUF0RbasTDRDVIOaiw1IeluiTGWCuUBwO75MeOoo+Q57L8jlxgq3zRSDqZ681mYnEwojhup6YPqGLaI4YFn6FYxOXjYWWgb3Z6fLSjKyIIkS29E1NHZ24czqYlAWUCWkisDwd8PN+c0Lt29LWpOzne6bF5/Jyf/s2ZYq9UGxaFTNfg8J69u0a39IoSqgkpclcaZHO2pB9S1DB1B1WQMUUz5bETNPNi3XYZ2/J1ViqDR/1PECWhAiXDoB1UFhM03wi7I/C5RQWzyFvHydgsavRi9JLfnsHUagxj+4irwwOsd+0AW7aZeTsxS7CU8NgOwn29NOiW7RueW0/pVVsG/85KUnd2z/jRwUy2PRlvDp4Pzw0NdKUngJ7JxQO7z6bTnRFBT58HHD3ZmRGEFwJ8Qzyp9WY3JWNRH/xI0v4tWmtaSgRD9KNPn37g5glNQVUeSUynh4WJEUn4yvS+k5NT2czmc7P7R8e7sjmlddfY8Xn3SHe/otVEglxrQs8+vDkbiyc8rBBT2oi9Qca9ecoPWwV3uefn/VjhcorhvpyvAOVa4cayWgGgtOCuwJtuPOYFTFlt/5v/dtXs4BaQVOuSNe93Qw/3LgGYtnpxtyxYvf5yTzTRXMnWCEhtPkKsWcvj01O7erIx6ZlP9GZuHd3L/NOZ0w8/+rWHHjj38DOPo+GvnXzygTPYNh8HeQiDPHRTN1PHqD+hCjrGfNsJ9wvVWGkdJtuLs+N6NcjFbEkuPk96GN2VSuV34242lUoZu1mjBw8fFHZJKvke+NjN5odBUJKw+Wl8qB7OnYOKT+/2+i44q5vj28cdZCgZ346HkiQMIbPeBUdz3IlF6rCv4K3fra+TH23Fgv7YUeN3OWWwNHWiD4O4ss8vveL3KR/GIjoeCjXFk3Jn1wYFFD+rdegjY7P7J0Z0VYh4PZKgKJlMe1qKcXwknM3cOHn06MTudDYcuej1RIVsemSsPZP1etysKOnZnYN6Wop6vILbHY6o6cGRTWptyOWoFiNaMtef1HSvB50YzGY2yFDNsBExnlDTm4eOamo4EgmriYG+belNShIGOzfjiESaEx1dA2PDA5m0IKA6UcsMDN/StSkpR7HZtn2z2p+NKtEYNjMb4wmNnpTlhBQjnptmUYkp2pgY4Xw+brMSJ9h6N8iDD+QhDQhimir4sX6oL+uHYdAPG7v9oB/yG1cRBKAFYxObbwa2uoG9GC1swmghrBvN3gV/rWOAcHhjPXA4XAtqYbgbq4hNzfq1yNvC0WsdHLH0mt6fLom4/Rp+pq9x1JUZulsQspldo3f/6vARtL275+Y9B4e2pjuUuASaIqvf1N+VlWNh3gJKQdaUdPvUcE5Xxcg3fT5R0vTutJLAjgS/LyqBojZ1Bmd55s5d450ZSfxzo/jEM8U3pm5uVVjMYG0kPJ6QJXFr9sD0HyelOB9xupEkdqVvvv7gQLYrngiFEctGIxl1cLivV0vWY+UhZ/uA3sT2YnQSJ9JWra86bEHSZgysjrk2RGUjH6XwEIlBETvshRdeftmy9+WXScwL26VwXZbiqF2rlmndOsu04MO38JZuEcBWap7ypoidmnf5Ux9hqQZ/t6WKH2SdtXroedNeffls2V5lPo2f0LTfz4D9/iRlA2sBGXYFuyuwAqz+7neXTdCPWAxwGDeYIksX/2n7d//VrKZYwwbVFgc+hFUkdYFCtMW0UEyAv35/RVOigBMFpi3/ePUJywSduYQeO1P8cvH0n5h25TQaZwYsbxFe1JStaNxoYks5lHI8DvQtgn98mVrLP6LxBx+kqQcf/Dfa9M3yw5ttosC8skGbOspNBVsL0Q445MkzlVf+99uU1pxIw22agDb945k/QfvRXWeKU5egPaMwFsWgL+tUlvqmiZ4WM2bck3RnDTerk/RhHfiss/nN8LBCKp/FhnPKyLL5BLC7CoShy2xFjL60xXzcRtaILeWrPVeMwNICXx0AW6yRXWhqjGG/amNsjRUGB7F79akAX90IA7jZlnV7xMWa3QxC5QA9oQGAWKii6nTTcfo7rayA1E60eRdaH6DBOsAPojjqFqN65saxY4dumDgqiH5WDG8Ia8NRSWK5P2e8bL+khXeE46ABEVjnsprpPDUy7H3yecvV8f4hTZPEcGRmcGisP60mYlG+uSPcGIsqyYGkMhGO+3Rfq5CUM1k5GYExAfX3f+4q+9JLQPfHim/Y91svUfdRT6I6QAEM0H2P6e3uwh3ucbJtfEFZPGRuhRVDURd3Eo+38WUwC/4r8ZXsM71U+9h8GsmL99uoJOzdD4gV9q43j13P5m+EPb/p9D5fitX+4btbTS6dYY3tS/kdVVeM3BLsLAyc2Q6M2sEuXLcjBxtQcxbXFKBcYxYM6AU4jpl2YWB77rodZ86uiOD6fcK4hvu9vkV3c9eex/GQfb03v+0RGMVv9BV2Hvs8cbOED4Hix9v5x3d6fd9spJrT22L7Tq/3i6+yeCUY12Dysq29DXSMaU6Ulb92jbuGV9OqBcsDtw6Yr8GL+PuBclyvPKTw14wpUW51PCmDgJXAzWNCJJsdGZ89eOTeUy88dHopoYCKz2weHZ7WRkKcx41o2hbamlDbYUjv6m2C8bch2pu5ZeL31M0gPDUhzh7707s5p4MLSV2aCoiVR/HEjpFfPDL32YMT47n+KRwYGhs5cvQ/7blleEwf6m/YlOwbyu3Nzd7+7OkzN9+qqbSoJKb7spmUKkpgTDnqRWEiPT6XkPkgeuvk/JHfOzg20d1fJ3Xol+ZPPHDf0cNjY0kFhUJcVIgx1V6OSUyIMR+HIkJSGey74djt+z45vEmtcleHRKHlPxdtU2q6PcmF4rHctpun952YPTg0MiEChh4deuHO/Z8+9blDnxxNJpHXHfFJAneXIEhBwc2izdk9s/d/6fzh/j5UF9HSnb3bIorm1YbqBXGsv/+GCVO3MhRlHQFcbKd46omSR8hiV1UCjw2kLtocFNjGeRvWSdVKPmSKcqbzn75vOggBCgdYK3YU2llQOqAt4cPOLgDiA+vWgcuLmW+/aSUx6SCp5HFZgHKNbAd1qgAQEQvzNylQIg5zZ61l6wBF5MPOH6QiySJa/KIFm3ittAZ6h2bo7h/T2vNfX5577DXasyh4Ag6aYRyOipoIiZSdLU7TSfTKSLyHt7mddESoyY3AiHIOdPGb0P56SgWsfVuJAiIgK4RVcTcgqzaVQpUlB2YP0crYkd9GHPktoIerYa+aNRwYR3fAdoeCh2ccQc13iOaInG9TyYbR7QVdCk3witCp6JXhuYSN7aV9KSpeG+YUNbEMkJsk8RxN7b1t4ngvYFxRTeRG+ntbFMCOzXL/4MT0LcXj6GAu2xdTgqFQaIPclxkr/inqBSN1qMpz9ivF71jnOd8n5ybSm1Q5LkZYR10Eeke2b9/2oUSS48+4PWFRSQ72tSaECOtBX2U9vbG4fmCPGbf54C3rERi7MkCvQts6D29g1cMbMd26VD4QxUqIqtyQWK9WUuV4/5oQbmDFEihpAVO3lA2F2dbE+OTR+cd//tUz/d/k6xraMh1dk0cnpjp7awVR3JL91PjRsTk9LUdjZ6XD24Yn9xx8cv74DeNxmX4RNqb2KEm0a+LJjBZvbcCdLRbPDU3Pzh2/dWY4l4jH481tidxQ7isJQPMorU9N33OC9A+QD+s0yAdLSdTmknR4y9Ih4RY3khZ7gfFeEnoizI/ixkvYV+Go0UsMZ/igL/CxHLaL59Crj6Ca3Xv2a+rk1LH5+4sG6jg4sXtLfywWjw3lZmaPFN+2zo+MjhWLi984eWLXZEI50xAdgAP3n7p9ektXvYBMrINlGsd5Kqhc6Ymd5SdmQJ6tDiLPBDy5ycM74eFxzIWEZJwVTlxanKX4SynoYgZczP9zTOLqaUvb1R9aHrbOny12nCkGzpbuexru64SeRO67ek+HldzTge/p+oh7rt6t4pq7nbO8efVHFv/VX8Kdln/9yPILZhtnQA4fBTnsxd6SDG5jrCyHIbhfMpXB1lAS328LuZ8A9xPYvAIMagNLX2nD91WScMc+qFIEYJU3AwNkm+kuScagw7bp+VAKUA/FeoUPy29wnQzjoSxwjWckrUG39ZqDXNl4mknIN+4+evwbx2Z25waSaeECHxP1dPfADce/1ZXtFKWu7K1T8+O9fXo2lggXJ+nR1p7er+3Ze3Ph3hNjky0J+sVHTx2fmk4kEc+1JjL9W9uTrdEGjHOGBnN/BeK8dzCXkKs8QT4cqSk+WqxJynKvjyMSfZ/JI6tIZKOrFAuyq4RNhlVdtLgIlyyrklEBVKNTRgUJWWIzB1sgZYEAJsG/BOW579DvPfvsss06v3yeHn1vjr5v+aDJp2egOEbivOIamfiYqBVc7ZlnsbY2vyt+8JZlFr5bi7MDQ2U5ZjGPq/AjRq51lPuAsZU+EquoAsbWISy8wMcQMLSq7BNfm4yEPeBezKNVD5d40RHipJASlWc6M8V30Q9rw2nt4elzB+5EU4LeLjeEfB400HefZevZq9L0SK47k5345Eq/s3YR2n6RKjjw81J4JLXiB0aMqpaJaiHRRmxZMIARrTYqCogRDx84rbGGIT0OD7Kt4quPmQ4nhgVDi8RawDZ5eeDy3EruhHMJhmYHDLhwhCpYbE48gubxR8kOwUTFuTESsmM2nfuH5XP0n/1y+dK3gFdZ+vnls1dfp8+dWn691H8VeH4rtaGMBEp6Axm28pMXLKTHWqxAYPuqIATg2i9Z598Pn12hhY2Ga22i/oEqNGG+U3xULeOKANBCJ1h6k+lf38Tmq4FbPMjCZrPx3xXfnCYIowkQRiu00nsFe9UvZt5+80ukPtCKvev5Rgd2Fy9d/G7rm10YYxg0u2ChbYCiW9mFWGsT4A0ZlwWoXGP9QB2GHTHA0hYb1xiTV33rFTTUBBqjTauVK6CarwZxEkCcaPh6oVIwnc9AAVTKW6tDgXbT7kG4awAgbmtPE50PHGgiyJfoAQ6H973nrqLDtIuxuR1O2kG73HbOUYHu+s15hqZr3V5XoPjQHxX/2MHYnIyNsTlYL81Y568qNsnFtYq17gjjFuPB7nC15ZX35iznZ2Ob2V52Wk6K2tUuy7Och+NdIRcrKJ25aDY6cXWUWtP/A9iLVIn7P1XiiQt4EiQ8CZg8ASwHhjWgwVSKOJB4kzEv/eynrxEGVAIDPEtM3uInnLFQeYsHO0HpSs9qQBIoA03WmjSsKYihGAx4z/2Ufg+aSJ//n8tVNhrE5P2BPZ5OVsxazr43xxi7w1m23XV1vOT3sv4t6Pk6qoPqowrVWCqbyppeK0UsV9V7ohRT7oTPBNbp1U3Y1NGaPhRRvjZJTGpoXJ+8g8FW7FrnlaLsgqH5yfNzJ0d2tSaUxOT4vccfP1/8l9GJeOJ5Ucp2/cXRe27ec1gQUL3U2bdr8tj8TRNbeusE+sXHT9w7iTFIW3r85nvmzz128t5bpjTtrt0zf3jfw8dv3b9tcExOPHjn3s8fn963dTAGP4ODM7NUGYMQjMpRAox3a0ZWAUY6f4DobOLIriek4IAUgZTBmWjEBdQQMRoRwNw3asrgcz3eFENILEUDAYfQI8cmd+MAB6oTMl27pg4X96DjT+aGRkceL95rnRdETR8cnpocHklnRGn5NfqZgdzJ4wP9iPCreIzwq50apT5JmWzaYX3TiCn4aZFxA3nEtA3nleW3lrg1Bp9b0zDQxhS+E1urrDffIGHGCXgYlnRjh3eRpRqUzo8chUvxCfuKVl+Tm7Xm99/F2pi8ZfDSSb66VoxLctK305OIKcpor55OSmLk8bsPDw/K8X8Xw88cvnd06qCvL94aFl1u5LB+wWWzhfhUYqDrJlda/9TkiS985d+WA+ssiWE0UZ+jCiwZYapUc/zGvWLRG2CxMHgxpWOE0n6gNJcy/Gw+AkTGoIvFA00VGXSwbxh36f/36z/5c9KlWdbwwjhTxULHpgwPjCQeb9n+asLy4yzJT4nuHhqrtZL0rPX0YBPla8fyPVlJjI7NTaHTPy0+WNyGLo126PGYz4f4UJOySR8uZqzzmpYcGtjTN7d/h3f5MTq3fIH+WYCLRpXk5mxSjYgeDxlPJj94i/ktyNWnqAtUYaqMBVosZpgMGXsUo+Fyfgu0bwubr4KmjoFc3WI275/1Z79tDphgpgWW8tu5K8aOJdhZCBIH2XZ24brtO2CIgHLNEBEsO8iC1duv27HiIFuzR4aELQ1mekKVN+9UAUCO+YwUSG4G8MZTFGpIqWOm0K4JUHbSJupX0Brx1D4OW0rX2Ecrv6XIHLaR6mNNk9/2REJt8nBuerK3f0avF/TefiPZn9ajvUpUDPpise3901OHT+ya6sq2NAeeYUOReHSL/sndfbmGmN8nCmk1N7RtWO3ZnOhNS7G4JOYG7tz/1eJ7X3kIjUS1jfHGSMDn8XRO9fYl5BqBjbv8Ht4TDcuxdGJopr9vY4LnUIBvinVmh0UtGg+HWI+PCwuxuJKRm2vDPs7LVlUFWSnSnNg/ND44oOPIyOSkiRcSoOMWiR8CrCzbiobD8XhLirjZbZfx3IuylxyH6GxWMjECh+hWPcA4KSzBnChG/pJ54+zZ98PMG+T6j8A4EofrN+JcqgiWH1cJ2xh+GPiiK8AMUBnO+gqA+DSZF4WRi1vnn4rhmvVRrEe+s1nVu/t2Dg0NarhZf6kkhkf2zn7+4OzMSC6p0JRl/uoDex8G+5pDPN+aHBzab5m+evrU3pm+flEEPduT2Xc7fk4H9PEhYm/eZ/Zwc4pKpYqz1fCTEWz03Brvi5PFzhcaR82dbJ6tuHLx+Rv+v0fKUIihnYCArKS047IANWv8LlbdsOvUIm21O5myOxvvsMw1LvoVhNNFY/+L4wfoXpvX4XF7KsM1Ajr+g+Wl7wE2EflEMCGBuTo8aflZGcdDm+wwblAd9Gmq0IHb1KpkMBbETSsEggkVY2MYxzdczifMwZskoZ371d+tID37Eoz20MTM0sXnEm9/htQrUN+2lJcwAgwuXcze9st/wfX5oOQwJNZjJNi8HIBjEptvDVy5mH2VfK8Ce6ecxBHlImUFKd2krCSlh5RVpGRJ6SWlj5Qc8WmVnqLCnAUj4awOUtaQMkzKWlJGSFlHSoGU9aQUSdmAy4udte/8MbmaxC5EJRnqm0kZx+XF51re/gNytI1d2NimQH0Klxezf//2/aQ+wy60ZzSo30TKzbgsONc52Fy6UaEbbt2o1A0PaCsdu6O8ugGHOL0A38AnbdKNdr0AzVnzxRDJRwnrRq1uRHSjTgf8a9TrhqgbDXoBHgSftFEvwGOv+VazbsR1qluyO91VPo4P1QoNUrQ5Lm9MtWntmza7Kio9rLcmHKmrF1v/7R/U3WxeKBBcvVSrUrpY5t95tfVy7RewZJN4hfnXnoZKkuNE/gSEj2FE78d+R6K2zZia5Hjpqlhjq7S5fXQFTbtoQOlMxa+f/rWLgS2zSoAthy3s8f7ri8U9b/ya8fms1SGPw135m9ehu8wfuyukR9LDjpjb1eJyCx5X3LLv6lfiLk/E44q53M2Ok27eI0c+nd5smQOMP+cZHGEPHOivS8auzpf1plUmNudyCRk6nBVlO6tgsdrUkt1JX8a5phsB15NZSRU2nC+AtR3Y3niGG95z4iMOsl22QdW/+PtR3Kku/nBLaaNUUwFaZwFRVj9W0g6sahBWL+sOMyuHLbBjcaw9XMEu2CvATMtX2Mhh+4cOu1YOw8Vd+OLUAmLsLiIQK1tlM9eJzD/JiRJ0qMj+CJ1Ax14tCrTr1eJ4cZh+jX5i+W/p+PKe5Qg9u/xwmXZ4THBQ91AFe1nXwqDAEKI5iTGETNIgM2nbiicisnkL0Iwx6eQqQagv/uSvTFudYg3HUimceFGb+cm3iE7CMUQLriLGvHWJLtBWB26IQa+KIjQA4eHrVXQePfnq8s+eARt9N/3o1ReXn6YHTF3aC+Pk48THVpoxmbfDOEZcDLTpXMMeNPxEqcW/+19ETdKgJhEY0NhMs2MzDdkIAWmbvXVN5igScfxUDPRaJq7+0vLW1ScsJx9gxs6eev8J7Ns7XRyj49ZLMD5jvxFlzgjFkTPEmNHw1pVoOPZi4MmUdAqTq7xnSZUHaa8YkLxq4DR6+Be/KI7ZD89fOTX/4TxlPOvUoGGM+F15ys9tebuxnKeMqkmesqV6XZ4y2J/SI+hPv269hLOUEcUWx9A50o4B4DluB2W2g2HMOQitK/M+4ZFxxyDzQlnTzQQohC03yL4SdwbLVhO9IvuLX+BphMW/tR2a/+1JuJeLfsxyAXhlwz7KUjxlbexZT72+nTw9Ag5RS3mrh8Sev/e913fhaivhnIU4ePJWnEzILFGL1Eqo+eOC6Xh4diIXOvAD9OnHiz8ovkw/Rv9sWaSPLJ8gMvTBz4uzzMkijqdHKMOilChQ+iCZ6aY/Dk+tFJhz748X37oH024vY9A+6+twXjNlWBU8fdXDlH1DWLsAWYhPCESRYGJzumZA2vvyj6esL9YW/yFgzsEFLH+QGaL6qRup+6nCFizFSTzv9TqSxJSPt6ZSxnXsomJOO6rHsVmfme3kuGFLfaWM3cnkUScJbNsGrNnG5ndiAyeTSuWjgCFugp1tFLF4jZ3eQqhjiw7YPOozNgM2v+E6sDWjVKYDz0LzOby+QqimcV3WSxdaN8EMjMtYJ21i84CXK2UrqeusTMm24kNMc2t9wHYzV2ksHtuSubFv9t0qNiw0yx2qLMWERttfODfN7sjd/dIdMxyvcxVMgGloSIRlORoMu1yMjY8LSfno9kdHRy8qrRMjW7s2xIMceiHTmx2LhFFib39fPMq6GaZjQE7WCG43sjPVvv6kr2cWZ9ROTTxVVEaa4jTNHHBaGI87AvaYHtdiYqR+bPz0qJqsF5JKRzp9o9XlSigJ0848TnI7L1EbqBx1sDSq1OEkhTazq7igqxSqMVf6Slln1+F0WYzdnqpg/VLThkY+hdFXBzChFpgxiL0x2P/KNQATOrz56jqS5w/8yduaoKrP+xTLNUgJPzGV1LZ2DUeXswiAdoCz4T+1FFX2syImuAR1+LcK+c15gdemG5VspuM0TS9C65M3jHzu5andqHj34RuGNtEMTSPkDvhymt7b1aaIoof1sDiN+MRmLRr1BeiAwyZxsnuQ+VVxXHeJdodom9mYOHmq+ObyS4n4jOaSvDWVDouFZveOD+8xJ9zpufH9h7aPJpVwiOfa23ZO4j4Dsm75Acj6arwMxykqgHj56tV4WX05XlYd8/oWKT8nb1jr6cCgRF1nFpazWtdMNSsHzcsmyZiPq5ea5TvSmU2T/b26Jojub7Na5rYdbXjTg6rcorB3aHd3j+ebroiY1PsGd39+16SWDoVpYd/O8c1dcTlZ6Q7xrXJHV7d7StFQKKTpAxOTIxODmXSn2nanuz/TK6uhCJIT23fcur/cty3vgOzEqW3U3aV57zEsO0kzddGDZYfGstNd6sMDhAIt0Idb2PwmnMYkQh9msaeCzdfAR42S345z11qg09poKUay1pI1IDt+Qcch1UXK3iDZTIKxxLelam1NWZpIT5AjPkepKdbWBJVIIn2W9puU+5jZpGPovqMjYwrIjoWmzzOIZpjk6MjRS0vPVLERYc8JXWsmuarNUS2Z61KTgujx0iFaSyifEl28WxbQ4+/7Bt0yJ9kcAdrttdV6BZc2oyRQEEUO50aSahLP0BwePXJgeFDD8zf5YFt66JPUin4Mgcw0Uxr2oUUx+WpM8jkw5VpNfR33RXFGcLzUB9tXpsDFUwUfcdL7vGAap7Fc+TC56jC54l6D+oiJNREkrk3c4z20KUl+cY0HYgzPHB0fnT1x03hGDYeuvu/1RWNadsehbX01j7K9UyM77njn2Nyz9DZPrv9kMqHIiXAdHT29f7avty4ix0cG7pr9/eBU97a2NAiNksgl4rf0hEPogdPo0LmRoSpPNJbthz4TASJkrD+gROoGqlCPJagCg4AqFXs5CwhIYITV0nBlRFJkhl09nj9GvMA1qYJQj1svRJzwpVShXiAzJrCboDwXUF2XqBIoZaN4UASZGfORr1V6akQlPcgn4r5QbU08FAZD99VXFy0Xjh/NpNJi3MczjPUkw7jdfi4bveX41ZzlAuFdcczyDjMI0n8rdTtV6MG8u95UmxJGG4rJR46mSsycKrFvhrBvABTBbXjKBx66WkDOe8C8yrfIOs7gwYbXlO8pqipSoW/CblLOm/eG1w5bRPZJYk5bF1KJ5uRsEYS9FWScakXrcjfN3lBK7cSBiTR3TQ79OgfUGMe1KUODPx8fgZ7B0NbzNG359P43xocGFa3Ts+jr7Lolm9Ijks9HR7iYGMukc9ODA1M8dzEiwTCzVd2UlOOhEErGomlV60+qgshW0eF7p2cG++MxLXmrIxqIO0RPkOZA/QZA/V594eeHDnJcQ2wqGx6Kxf0cXDR7wze0kBIIcT5JPDXzqQeOPphWeOjm7erQ8P6D/1kF9RsKJdWR7QRT3kdRll+BPkpSk6V4p6ASzFoIYuqXO0+KUD9pRjuTbL4eeADClFdxkjQepio9Op5kg/NU8nGoKLhwjW4EvYbdjACVRyquCqnXTJ3hQaTWw4mA976nLAxCTDgmytF0snu6PytHWQ96yuHiw82xwQxObW22Xioe63XHHe6Qy1bhSiZiIa7KHQlpicHeTy4r9DdyiiZKPhbHguXP5JbnTf1xEhqeJTjaTm0sjd9WxozEk+7zO9NWoSU4W/Tk4uIio7//olU8f56iP3gZcDO+Zi1Vj69ZDbKMMwgKdfi6EdjwkOuKePoY9Emiv4UUTonDQBKGqNWZ+6veMyKTOB8wyXB2t08K86zLYVt0OYTaRLIvwce4i4vFt2gLXeEIss0Nrcx/eb83szkpNwd40Mi2Z+HJMI+hvSCNl8AGvm9t3JVwGSfrGszHh14za0Kva8xe5ea/+e1HhF5/+PyP/+z/LPR6chH95NXidnTp1eKDX7BeurqbdheV5YfRr/YV50ptKPFsJU7O/K44+clFsGhU0yYEWG+TYLzYRf09Vbget7+lA3vXsI5BPryiDNE3hqgubiXybqigNCcU43oy+XUILlyBL24D2D3EkvmYJI+JzcuwCSMzzmXEVFnS3vu7lUzfXUvWPApeYTBdlnreu44keNHIhpcbseKPAuysmce/QO8yTRUEMrir7D0fwvOV3Hq+IwudLFSNYeHW62Ggd1eHKrCKo7x5+yhRcaoZPORgqCr3L+IqX7ezprOtTkmxf6gmQEKzTeQvduJJ6Ic0E+EjjaKW6Du2NQcIKCjERT2xZbizS4KRHhUqXMFQTs/ICVGE/lZwufjQ9s1aMh6F3acATTK60wlKy+VodiXTkWgkVOVBSfV2vMl7PYjnNygDuT2kz+rQZ0MBTo736uPL95UreN/GeFcaKiyj/e6kyx11ulwmby2/IvjxaaqQxPorYnI2j3wlvi7GSkoMsGSScHTjWo5uZEkiRCkl60NszPy72ZhZZWOmzMaNJhupfCwJfHRX6Cbn2n8n5z5CM34Mb3hJaBY7k7mxLb2yDOx4yu3GmW2dWEtKQe5aBsjxD1F9WG1rkMA8Ak0Z78qMridzCXNFgM4BwFw5quDB43adOW7Tq5irjLKC0D2CLA4QkPgqQKx8UxAa7qGxALfi6VUuM9rMlmOtAfaaFSKCH7+YyRh64+jURIceiRybe2v/5Hg2I4nP8Fw81pbs6erU4jGe43xNMS3dN9CWbsaTlgVakcRt/Xfs+0Lx5ydPNYgD/bPTDx0dG0kmA3BqKjk6PH9wEmAn0C7AJRNjw8TOK46RNm8GzXEHVWjAbe4120x0hx83fMTUGEmFaIzkZSxcTyGbM9aSwVYeSFcOWl9jKol8biP03YqGJj8B6SO9YM1UNLVkXOWurJUEog5hYB5ZM1KuW/CHEEoiYhOhTXkgEvExxl65Wx//BkKATEBcQsmo1rtx/9mEjNdG4VtadwztP7BrvNUGJ4A9SF80bb8cQPeIG34iQlIdyGh6Y5wLMbrF4nBH2KhrUzIeEXiXewTIufv43K0HtuRa5IQ8bbPZmLCjPVMct9oA5QcA5fuWf1yyBGvDujo6fNutO4ZVLRIBUy45eksJ1xNsOES1UtdRd1GFDZje7SYetGD9zKmL/Sa1w0DtQSJpCkiawubDeBJPJ9hFmNA7YCcMuLBQYdmAMUiNN8+RGZH97V7fNylPdX1FoyJhklu8+SrelEPfak72KkA0daNG7G1tFQvS19C5FCtvNZP7x174fq+mS3EhUgOUZKznGRphmnJRQZb0th5sJbmzKa0n097WLON5lLwkZpKn9ggRgHshFEY1bk8gJAkq4L2Yg6/m6THl0fc19HS7S3J4Ip6EHK0BnINtpd03jcyEwsjnS2nDE3NHBkcUuZpDyfbk6PaVsY8+ATRNUtdTxNAkomv4TNWIkYkRShF8F7ucbyrpRcQAJTG0ayqrrUhsrdraYEop6Kwg92G1FVgbk12jrJpOPMkAPXy8r4HfEM26Ix4vExW5bKtcG/J4nsK00kFBeUSPK+5M6m2xxjAAPtBuj4PIRiLJxPahgeVLlmy/W6kAzOeScPt0sKcvgD0xQr1JFa4rrcSXKXvFEiXNv1MxaknPxP0RLx4QTeFY+GIjmZuQHzX1/q/eeG7U1PtBHOfPt1ddMfQlHMDyBb1+ecFPSo6UAVziafzpdh3GACjXRMbhFBzjCeiGHweQqG6n1xdsT+t+LrAmZPMRleZYUWsGzN3evLUei23CSkLltY3RLcSI70Jl3diJSnHyVno1SK6uTx4uxcUFtCY0fu0kQ/0RbnBgvktWhWg0yG2IZec87bKvp00ThNv3vnThtn01j8OAXh+Lysrhw3yoIbnhM9DPE2okHhLdbJ2opneOTe8Z6O/S5MaiMCoDd7xc75QoBDlvA1PltgUbJLVtx0PXDXX3fSGQCId9nM2GcoNyRGB5d52r0u3nvWEhFk3oOzZ3NcU5Hnk8YiStEBkWPniHlq0yFaIOUYUgxm+VZTvXumLn2lPrlkypUYzq1STa6pXFUqrJLPVqPDXdyWKfLJ4fZlGIArHg5DUaCF4ZJKn0IOuG13TSptUAtny5dUsbaV7hXvXISy/VhLpZkZNiCTn9YzCA3333+PLYUL3A0I573Tbbv9CvQBvuBTl9i9EpnZqhCiLGKUm1oGJ5rTDlFZkaDhmb14ba/UguNMZaUtAf8Zhan8pn4EH9Fng+FRtXeXEDlpAKEbpnTQy6J/LmZbN7YjPimmHUdPiQPwFJeI4K7pZg5ZqZ5CUj997FSnc1r6jt2XQyJoQ40F2IBpyBvTxhPSFmCc4Y8/nRLP3K8ghGDqLbE+Rao1syN9B3X/3GNncKgIPDVeFyOp0YcsRcyeRWgfd5gvzE9m2EpzbAbe8BPfzUH5mzNU29xKp4unF5RvHzf/+LhpU4vs2M4+MojQ0I479y8blv/fKLq3F8G4nj20gE37Yugg+YrBQFQE9RNOMvRwTMvB3KTyZwkVBnkK+jSaizi8bBTNuzv3TZXZzXZnPZnAzn/5dni3t/xOjLvRIn9GcDXD0rst1peun9F0ncoEhR1kvQpiSdM7FovmFj2c5gvQIJmoGiFUx/ploK0Yz/6kcrbbSbbXThSBSbT7quXMz+89v/w0w9gsOOpXwcH9u4dPHZH75jRq8aWvMb4w4jvuTJh0JwzAvHTv/z26t0sRO6kCUscVm+YgWYaAsVDhaH9klZSUoPKatwefHZX7xjhvC9oAG9IawBScmRMkDKICl5Ulbj0oizC1K8AXajpGwiZYyUzbi82Cm+8xi57EZ2oWVjHCegknIDKROkVHAJjLSvT8Ww6QV45DV1a+L1BfgOrkrohozXbDRa9AI89ZqT/TiUj7VykKwcUa0X4LFKwfgmHS/VKIGurgNhcVS4q3whKdoUb0koNnulx09W4Iw1r1v18SMD8Y1U6fus1xdqKF1iY/Lfc5F14SoLSCWJwOMYeyfCsfc6K086tBlvB+WPYuayFRaJNp52W9yMi2acDMs4LM89/wztcADwZ1ibk3Y/axRfeuU8XcXSVYwPznI5C6+APItxTy8X97iT7m53lKHfWA4zckiqF33bBdGh0j97/0X6oqNjyN3Jjrs3uRPh5Rzpwzz04TdB3iuo96+JrdPXxtaJPsOBdZIxb0bV8zbsWylNDMKa2mlODCq5GNquf62eBNR/8P+8liQbbZ997cbfEVlfe/gjIuul631cZH3t4f/jyDqP5ounX0Qe5H6peBrd+/3iT4uv0TLtKd6E/svyr5dfRc8U+0xcxgDWvQq024BSVKGOKsU98CBQoACCYsIlFLwwIMln+uP/uXVFR2zABil3xWM4ly52BN78tRkKDcIRGY7wAThSvXTxu843v06ag1iwVnF2k4WUDCmtpLTjsnyNCkNmF9xyEOsAUrKk9JMygMs8tcGxsAFvgclbypHCvceiG0wpUaoAF1jT4TwkicZPFmnp9tB2p9vD+gPV8gYLY7223/goVD4BOslHnLI+KaXOYoKacvgHdwab3UNLDWD3wYhHBr0uxDz7BuP2ehwhBn7oSt6Cc7Jcr/5lcbegxKeODiUa4yGfo8Y+tLVPZaEnPOmOJhLBPniMKreQdXEtXFSiZ99/cWRq5I4s4zjB0B36vAz8S4LsXwD+OamdpdnvdnMcJ7Pf6RLuXM02SO7/213rsg2s/3vZBkn6oeXTFn35DvriSUv01Mmrr50i8iMVx+gT1ktUF8ZECvacbzAtUxxAwlPjcQQEUYqnkszLJ7Z5t2KkLxvO1GJzKYE9VWhOYzjU3GpGAtLNeC+NIwE9OCpCbQBYEUubsIJER7DhHiTworzClOYFyJlBAYz4A95rV7PgMQYhR0v4tOzNkLKR5lrA9z198yey43LU6wlH6qMxSY4Fwx4PisYnsid6laQU4VgPG65tltCrc4yrqjaciPegOx7IDc5vSt5V/FMlERejPt5BO6p5AXRtW/HMPjU9z/FRAWAKmu2NJ8K1VW6zz10oDqFJ4kNsoNa6DzEMBDOg9FFeaw7A0oUnikP2ud/Or6F3B6Z3x5q8iDBjRp9IxKmlI2xGnAi9s4phvWxwqUXVnAJdnyqoJCVTbQEkalVJomYHkL4mhXP6qHwLCfiqJAqVr8Ie9Rpfnqs3ra1UidZm0LzVYpJS0tRyzJ38rqyoUmaFjKTMRDxWxQb5mCzF+7VITB7PHJ/f0kfoGu7JiIQRrK8hukHpO17827R2B5pRW+R6gQ/ZaUdrz4iKbt2XSqP5waFTxa/2NmOSupg5xk3Y0Vt8OJfUpViAI3nIdJwZtsSojdQ3KSOulKyxhaA17pAXpVK3SCr5lNkt3rrrea9pcsVYI7qUd1ZeMXxLCxVOH8YlpKwkpYeULC4LcPSjIACLDS1nBbQkGnNXrjW0PlxpQr+4hJf2oHQ9b8XeKVSzItklZ8DqYssrsH91oY+yjTupdfftaG4Oa+GkL+oPc6FqgRPZ/mymXRCk6nh1ItJ1vfjpuYmoGA9iddL3ANg3NqbSxtqqAFg6bA4LEwq1fDVYxTrdNBN0NSVsMGQHfNgn8m7xafR0aZ2NdmplbQ2hlIXDrCzPaCEfC8jOOMgq8+GVVebDSPXjiMW71Q9WLz1XfNry66tu5lvf/77pH/jg55b3rPNUljpGFZw4ByetGG3qYrOpzUoaoR2EtFrBaSXY+1KRKi+/UI9tEjbfDsx0pBY1c26/K2Vo5uqFCTjsT+FFGPJaO55s0gwivcELKIyCbTOSf+3M12sWvJY+NPm1HMoHxGMuew1GywlR0jL9ueGjo+mMHI+E3d9i05nbBnSwZ11ut1sSwfic6u2puuDiuVTic2NHDwwOKck4/fSZ6dnu/ohgPXvWVR2W47rW7ZlKajUhNds3dMfU4ECXLgjtbXe4+zRVTW52nTvnalWuG3rG1Cc6RTHD1oeorXi2QRfG+xtw7gLONau1vrlIoa6KSuj1KyZqA9CtXzH6SCi2kQSACo19mMCNDaAQ+hrxZh82TbtS+W14vao+ME02ALE24PWhu4nzRWsHca1FOLrPmeKqeq9dVWA1Mx70gBgQV+ZRi9euICCJGolz6t+u5tXkYG52UM+m5LjkO+/guZBQGxUP3oW+Vrzd5fGzsbCMfh4XGsB691Q87grzajyb6V7uH0vI9IF5VD2Z69e0cLiqqjakxLJ6uC7Mck7XwWPF/z5/rE/W45IiBh3OICeF0/4RPanE/L4ziZHhz/4xlvMD1M8ZmjlINVI9aB+Fpy42qoao5BPWN/EypG6MEclEhl4ieDg6FTXXT46ShHSjNmXwOE7VZta2KYs82SqtpGY01aB8I9X6Eoxqja0vobzXh7d93taXykcddgVq7A4FjkZq8dHaCDl6MdHz13+5Cjy9AJr++i9LNWQmfwTMHrCmnI5aOLT2ZBafjBcY8Tf61n4LTg7jk/HX6/DXLybUvzbIIThZwicX4EZrtByrF6DatGIKcKM1h8J6AR4Bb9XhtfBsTtYfrpNW1N+Hakzdl0mQ1enxxItW1NaejqX50rrOad5edjXz9pgHAaKyl5eZal9d0mw1iejATDQej07P7lH/aEuuM5391OzuuI9DPBebnrk1ffQrRzfNDgb5qKyk70grcjSI13Qq7/BBlJtJH33waHr6tlujCc7X8qnbd2c3ZXN9W7Kbpm+/Fa4cux1d0tJ6Q9zHo6AvLm5O792k4wwDHnb0TVTZ9mYOgx4LUi+Z0Qkyd6FAkVzVRdbrQdAVnbBldsWK1KI/SOqs6qK/7EFCBq8YnsuGL5WvtJGVSSs9ZLZshZO8+8JDlvz0sLDHpYxKkueaZ8BkqS5N/Uv+t39Zwem0ueoDCpK0y2DwysX2l83Dq8muVjPZ1UIBLESgMGhrcM27HCwk4RX3X3PaBkDCNPzTL6K70eGXihOoqziP5orzheJxdIyG7V7r/PIR+sRy37Ezc8VXkDJ35hjuW6u4x041UyTUXXo5icGk8FiRJK/2KG2tydoMIYyBnngCjV/9DXPI4rr6G+KnP/jBKNhXl6jPUF9FClVoY8xMN0zDTyuLzhL6eUgxxMuLh83ueJg1EO6dlLlLKThvGG+JrLERHxgon5f/AtDSm1ocNytmU/mvlV75YH3uOhMqhFmDX8ofq7lizC1dfHv/c62E5vezxpeW8kOuK8bOJThlIRTmoYMNsQvXD+0E6DBMyk/gsgCH1nhr4TjuPMO68QlAEG4+FB76xM5jc1+6//rh9SbKxx4ibtsvDHh9Tzmb2zr6duPQwrjXyIDm7jOnOW3MdMyu+m6vWYdx/Sy8NtOeaVrr0P3whCeeWwUoaxcYsn+Uh7cVrbwaYv1SwOWl2Q9+3R0WpLiS7MgqajTh5VEkvDHRndMGMtlNSlRErKczHkvLUbFeqGJv3/uDwQdULSaxX3cGfTEpLieOdfei6kgsHecGvdHp3s+IkocN4alPsaQkhnyeSCirjY7NDE8MdOsjiyEuIXUke9KTDVGWq4nI8Yyc05LRqMBWTQtpMcr67DaHgw9XSwk1JoVDPr6CDXDNoq4OxhOx7eEQWxX0RaWonLhvcEiMRDRla6C1NsTB12LxfkWI+sJum49xCNz1qjaoxJNCtDbs9kV4KbIh2t6f1ZQ4zyMPTvCjH2xtCNdyAdZbHQoL0USyXgrxnMdP+91CqEEg8p5gnqcnrEdJ/8mQFbsZFRtVCfxan1Rpq5zcbRoR5QwK+7ouBdgGr3qWeOL1x5nnn4YfrLss2L9tfQFwhEztoE7h9UJxTtdiynyjkNtirmsI24v3HKx3g31xj/n2ihtmyN4NpRcOfIncfoPp0d7A5ofg9neaiOxO810WnLmM+X2gtDrvBLFMuW+46ffvIZHImYNe34UNQzdRU0d//6MWOFr/upE1kYPyqydodc36Q2vE2d7gofm2j4Un5UUh1rwOgL/mdQFCTUhJ9PftmBiZvPXMH5y4eUZLo3BIUXq6do6PTU9O3Do2ntvWm1RCNbuTyfP/cHx0dGDHts3ZaMKPh4vWaHbztqFto6PH/+H8nneTSjLXPz2YzkpyKMQdZKt84UhDVOmbEcRa1hMV9/TLcjQS5tzcQR5uG9OzfXuGBpVkqJp+fnJ6fHSov2+Dyoc2Z6Zm/uCehyZvHR8d6enaqPJhVMOrcl/X6Oj4rZP33H3g/B64c/PmbO/QwOi5nQNDvdnNzfh59px/Y273o1paiPi5sCgKraLAhVlfpTshJ/Zf19ujb4wnPW6eE3xNkgICLvi4ekHPXD9M5DBMn6KL1oepPmoXdQ8FVpSRVRdbzNW3tqeMEaJ7QU4Mn7IYKb2DaoJIxVZTDray+U/gJPBNqdRik2ki4KD0VpxMFwT1580HsoDQm3wGDiq0JKG6VTdGvE9RTYlN+laSDY4XlQ0Eo+vXQEyvRppt9lgnWjf72IyagPVEkr/J/H7pmtdBrCbclRa9ClfzSkJLdxdcDp4VojW9I46HbK2NsbbkdQOq1hznuKqqBo/X7d7sUfhIo8thZaJbeifMBY7Zr0bCWzQpHhbd7Emdl4HUlpk+JRGJuN1MR7whHGTtjmzOpYwIIsuiKo8gJORtxR9mgyGGmWWcFe5oDS8OSRJA2UiT3K1JIusLi0KsvpdhGEeFRzPj1aPUfYxoOU85KC9YuwjIjuM1JD3q0z9yrV01zxq+YjBLF//qh3/z/ZXEEgdUMw48qcGDc0uUqb/5jXnMxRoVS3mP54pRuXTxlcq/mTernSQm6al04EMeo2qJ6vYAYmCsNvyWqEpPlfdal9rvPLy6tKCK1xaUVjZG0fATxQIaPjePRs4Vv4FGn0TvdaGDQvFLxdMRtG9lc827DOh3wcJRyysPlt9iwDjNuQ8MUYph8tYyfIChVpbGwG8qkLzTln/8Mr37y8vPofP/l+8EYNbp0puoWeqvP16b3ngz0Z83mkduvBk/241DeN3wCegf18+So9eX+tHtH6FdbzJ71VTKuIklc6knUviFL1C3uMs8NLpO8e4tocTXf2pGfCZY48Ylj7GLNcaXKGO8FeXHbyyBiVtuAgMv5cbd8OYbYXMDRVaYNUb/g1UzImsdELDglywY8JWWOZDRf6DeRWMo+cBgTtVGf/rl7z26OCzHlcTIk/9hKnX5p5auruyB2Y6sv/gYGi4ayJDjg32NUbAL3rGeZ47ZXOZcHgw7Td6jEltX5/KAGLHMfdbzU1Okbx+1TNJPk3c1bKaGzHUa8PQOrGp5ZbGpNOZmiFTUmVJRR5bXwEsHYGbjuR0J860NqvnWhiZQp9TaSQvrF5m4JvcpVTppnaV1NMi1NLcljybbmuNkUgXspfen8V7wzio2EKoXhurEUKgCT1/Ay+PtEMRqzlvFHNHTyZbmAIcCwVg8ldbTm5L41Q487CU3pWNClONZj4fFMf7OJjFk7nBNdYQWeE5dlHkeaFiFV0VZeXMDoxgVKs5yNZypAkM8m4wHezYZ4tm04/7PEoMKjItKs0es2lQWJ3YVlW0q7PVgUnlvaWlYslLpyktMei2vX42gPzNfZHL6NH3uNPpi8TOni4fQKawv4rRKH7feR22kjlKFMOZUlcmpjQrOABFNl6PhvrzYaj5EQ6rsf2y6eMltqleGrM0ar71iNC9RC4ytOW5Ge8pbpFu2uoGHCk7J2EiYaVR5C348aWfNip+lBRiJ4yrWvvq6pPJqBOYSoNCweEiJa4qWFRJ8ODfQ3xKvuNeGk9juAMs3EY9GI0Kj2rInG5Y4dHH5HH0mrYG9HJMjsiQnunLR6BZHMiGLYiPrEYUxLduWjqqRXLJaVA4ATcJ0jJ4HmmwHK40sA7EomDTpJT5ZvOVV8KwxQp0cnp+02GVSp4s1UtgkC5u7YWUxVXobXwqzKownTVyH3dVeK1lgvgvnWPm8+XYcKBDM1edL6zmY2uTaNyhg/VImTye9ToWtroK9gg/CJx1yYnQoDsCsVkz4M+mIEKmJeDzR2JbehGw7YQuHPnFLpi+tSjEPi+TYzVpTLMhVuR4+PdSjtUR9Poursk+UpOhgQvNWWZh9NhvrC4VjGUmSxC1uIOpmwH6iJErqYFrlaZvPFw5FIy2H5ji2UWiOmePcAGOgd8pz+6hr5/YxK3P78gwGUxayyLDmVwNo4McvFy8wRgDV1RbfNK91qjjG7MN5AtQtVCGBc0Hq1FIaiFGdMjNBWBXuQtIFkBk83UiysqtAbJtTeBYLyc+qssDYUJEw6R+Lk1QQ7NfZSCI2zfGPSAQhizOQQeGaVWBMTNYU8576JusWw3JcOzaYQ4tWGxfxsQGvuznUqOKcQ4fLwmgDuem+vWJxzPr68shgOhETWM/42GP03Vdf0XwR0c0w84zLxnrCocZobI+SbI4Vw2bbh4u/tfzGOk+FVrRqlYlZQRVUkddGVIF8Ge4USeHxXsav3POSV+5h34GT+A7wxKdK0LRuU9OGTRxQxqIimaGCf0stG67m8erj47Q6f+DHBwa3dbUlIjVMaHRLti1RE5q58lObdOWnlu/gd0cN9JL3CqHvoDn6DOi75vKY4Wd+9wuF/GQha/Sdn/wEvn+4OIReh9Y2UBKF1xxqIG8yJeONhN/ktFhtYu9G86v/f3PXA9zEdeb3rVartSzLK2nltSzLsizLiyzLQlpkWRb+g2OMcY0DlDjGcRzHcWkgpRQoUI4jLk17NOW4Nm0nzfRvrpfLMZ2bzEr2AccRhoYmNM0xuQ5tcjkml2va64U7roFcp1M4LO59762ktXFIezc3d8zwvPu93dXuvu+9/d77vu/3WxjmijtGSrXQGTw49SOoQdkXD4Vr5SqnRajzDfqc1lWPKA+0xuz2/nhyMGIP5Od4nqsoq5Qqg5KE2OPTpmXhfmwIx7G5S945Hh8PEl6PXQzh2tEfKkDGY/w8+oig8+7o5LHvQ73DmQHuio6eDf/wo42UfwcGTz0XgAXWHY0vGZiqw5JMAdfG+ouvXDzwOqs+wn7syP7H532P6HOai3hO48b24xCjuWJztfTGWoi7gdzVCtLHquhwVCXCe9OZGLNJWCUH341LAOVvqb0DMxJoNyTwlOaai+NjvVVyWFnTef9kV3ck6nJqz31P+5qvxtMfiYeUaj94EjyexkgYzxE9vrJKzjmC54ZRv9frjSf7B8fOvPzymdEtoWC1zYZH6NSmje144mCz220BJd77AfMF6Sd/bpwvCNj4t+D5wqGf1tyGsq1nQZdOofMFR8V1TcSnZH/ySyq2iVlruYCr7HjScJ3OFxBrMvMWwVpus1eKt88X7lRthO1WkRsFChub0Ma8dgwN4zlDGDafxcVzR31oB/qkP3+0O/8VwybuFLduMSmG4YfNh8Qm5sC/MKLC/IK9wTCihfl308n5V/X6PUvUf9L0HqkfIOcfhRqTjYEjyJlYJfZEadz2M9wIHl/bmZXMKSbXAT6zNPGZgeexsQSK5sPjqk/MpnEj2BMkp6MyAWkdQAkQLgGtNH3jb39dJHPC0zYZz+YkncwJOHxlcRZ/vQiNk2DER5Ilgo9ktghSAawXLdgjNsXKNNbZxjiob7oRwDTty8JkCSa1Qk+1prqqUpxMaj7Y0WJ3mGEox+3ifizkXxIyHEhdDZDhJwtA4zvuG+vq9AfQc+fi/R+PKCE5nCag4YmBeOy+mrAr7YwGopEDFDN8df+BitHVBGjc50skB4ZNTxJ3Im4bgpfMX3U2MY2kzX6FhpeUv4suGeT5ovwqmizJLXxR/h6aMByfK8qvoe0G+Y2i/Dx6nDmMdcHDMJZjeOyrZOoAAcRWwARbAPmqORNzdtEG0GB2AgBrKwLA+sFu1ByJYigpYUApYwt4rBQPFvLhCGLBkZ/fXAz7XClR2Gf8p1KctVcS0BwoT6Xf+sVfUthnIqwmpYeUXlLWQZnD5QJvDyDOVBNEaADb8njrisCMDML91igz9lziSSiB1JoQtqwlrE2VhPTI7WGf407OC+zz83eZAjcD82+eRxXozacEp7XSaxM4vghkS5Gi2ec5R8RTm/I4eQeL3//D+WHAPcbvv4m8/z9AedIuBGuXtPsyXR+6l5S/i94yyPNF+VW0zyDPFeXX0H4it+IPXI5cpwXLeeZXT1M9/BM8ELQZ5O/2E/mti1i+lVyfyq9epMfzWK6S61P5tTfoGo9dxzeWmAigXxNeETdWHaCHhJCtOcS4TBURrZlyOC7DdksL8FuDi9eNVUZJ5NwuUBk3xHy43LDpgsmOm6YdQXpMFIxpICrLWusKLt1FcMgBh+t2QGRoSPvXF6Eiz7935nZYZMDdYA9/nZ1cgI7MHs67FgEk5zu+zhTetzlA+l9c73/fJXKCN0nea0Jvz+NLyt9lQwZ5vii/in5akpPrJ/Trf99wfK4ov4Ze1/NUf8b5ud1MOfNbBpBnylXNFNPMhcRFeN08iULQwweJR7ec+nvLwd9r5mGbN5f8vSYWJKwJassE2BbKlvL33hZoaKxeItCw6MpdOtDQWP17BRq6ylCqDMllyFKGjqKH8t/ZiibQxNb8n6IHP5p/Ov9NNIim0ORH899BD2zNP5N/eit6MP8tymP8ivnX5lN4ZEwyq/GYl/MXeA0rQItbYZzrh1glQAahUZoQnRASIQoM4NshGIEEsSVeF3UQHzy+Oc9y2UZYinSdpS8KInQcUIITW2p04d0glFAbJrXNhdo2Ursayhw+0TC+hSFwV3OAu9sF+21pbTXE7TI9NgY5nC4p2Bhublu90HKx0pqFFeTrugq4Mv0dJO2sA2+aq6GHyanFgILU5hYNH1Lq80ZGrqUSDRPx2g28NBqJ6LCYh6a3bNz//ZdHsICCnu7fjgX+ao/Kvtg5uH5Uh718JT3UN60DYlZ74slrk3/02HcLSJheb+qJa5OfPpR/noKf1nrTT7A3d05MDZg2RSWZQl3OfyNSLVMIzJ33TfRDnyHYfaTvtet98iizlPxd9CuDPF+UX0VPGeS5ovwa+jaRExwocp2V+nV+vAB31Y016y4D7uqcVEUwV4GWzdRYgsymIIKAHMhWJRIwAvp17qWmQt6u2wC9SlDBDdiZZNkgcOwM+urB8amOTMCPav37xkcOAfrq+p5MWHFJmz78Z4DAetMfUJMb1z0wMbh+byiYfx0dh3WVZHrl4cFBGEtuXeG+aL7ATDHv6TnvLWquFfpEOyDnQsb2Zrjfh8j9TuGuMCVm+/Gkw0vjJr0iycJo4i/Pik0ZIZLdgA/ZECNQrdO0pzR/5e9S1GQcErVhbDIK1wGC71LjK89R8SpR6z6b9Vdd1+rP4p3ZnlXduCvg0pBK2lNWJfvru4eGe1YZo9luFxJN75/CxqMQT2wGN80Gr8OptWOlJ4xW8bS22ZEVExSLeSkCMmJVgidOTxOyFN3HTTFURZcLdD543Undpq9PLp5DuR1He9OZzWPbxkfXJdVar2jzy/6U3yrWyLFRNRT2+pAktYTX9E2s/0o7KwflB9vi41M13rAypSyr9SJYNKgNOTz1olgfaEkm+pLpQMgpcezOk5Av6KlSlHSyK51Qwv66uF/01ig+T31XUImmOgf7UulI2OvBPesZe4XgEUaGU0oo4E+HQvHY2rgS8vmqA6JnVUuw3l8l2+xOPGKs7Lv7JtgvBHPJ/HOs431Ex+8CZPYl5HvRJoP8YlH+EvOGQX66KP8h8xuD/EBRvo25UpLzu4vy80ggPuHeW1f4c9wwM8rsZB5l/oLJ3QN6+iF1bpyuE/Ukck2wTtSqzrmpZF9iblf7PU3YFtmmzu2iMktC24Vnh7Cat0UPy5ghSr0Za+xmkWirLUFYlHYlculpsE7SKWzPfhrr92ZQnbq0Nu3I+u5Jp7W0M9u8DgbS9nGYpvStXgea5i53OHO+uuaCQ1B3/hl8gspi5lky4C7EVjE6gSm2Sr3JMKvB03aDi7Ch5OtARviVXsnZG8so6fbMynftNp8/HOkEuouQKFlOCX5vKjk8tGtmdGOye/PIx3SIlnledAYDuwcNCC35M9NyNKSqfd0PPXvPplNTE5v6u1uUKukFXzIcUgL+Glm0sa+ynYDhEovGlbC3FkW7u1LDHr9N5HluZWdbrJYgTfH4kZSoExAZwpKEgoE1g/WBAsyLayzTq8bSJZQXxIY7oqFglTTy4SdHpur98UgP4E5xnGCttNfIig95AQRGDIa6e6mNNpIfBuwkrDv9us1tK+qUh+jsgK7Lby4p34t2GuQXi/KXDDrrITo7oOvsb0s2N7nOC8RWvku3uSHXNGaQ7+022Nzk+lT+km5zY01nk+T6VL7tUgnfB5vWTBtzN/P3TC4G/rsOGm0tQ6yRsDYmG0DO1hshs4FVZhkehzfQcdhz94v6OOwUNd/ZrMNyXas7Oys66rAd4hRnXU4f4JBCCVlOfpDnsNBgkNSmc/hw2PKnmRMiNjRqfXX+UnjdYgkZjFPQd+S01uvICbZq4v9Z20FdBoJDsy1en4JeYk6miuT2IbelxHG/iA5y4XJhKyrkxHvlzszY+OG+zkxLNJVZl794KbpmY+THUm9ARfGLI5l+BRsO6ZW99z7wuUc3j2XSPt/pLz2xvisTCjmdol0J7v5GVzqk2B3oZ1MfGe3vawyJond0ZHzV53aPh2JJWVCcTY99fHx40+T49M7pz/J7LqwaCIZQY6i3e2Jy++m5Kjkau2tgfGygLxaJylIs1jcAbXwED2bvkfFwA7d4PPQRXdmo6+hbS8r3oi0G+cWi/CXmqkF+uij/oa6jVH6gKN/G3KDjKvMWF+L2kFiecibF6KufUbKwTPnISRgFieixkQBrIQEroivJGrXO7UGp9Ch/Ya/p5/Mnjx07xk5++cv5mRMn2LdOnKBxPZFbb3Bz3DhTw4SZDuYWzV3VkRJyFliVatBVOEOsb2Cq9ZJoarLAv5Kq8PLPv7amGDRgO5utKYPAAGpx2wCeF0qtRpy111TA+gGUUOsjtXWF2mZS2wEltrhtBgWnoLXl6Rw+Ffax+d0BAfXE4i63Vdg9NXh871gUC/d+VUT927D5ka2ygNo3tOq0VMTmVijeg77CLVKPA1jayPChcC2GfoicBNcl+uX0+nUdY8eei7ikgzP/Nv1U1/SBavR2MKn2DSTxh16WNoWS6Q4AgAhVyTxfobzeNz66j43JVdGHX+67f8t2wH6Ix/ew/YdG2HikiPWQj8ZdgAIRHR050JvKhIne3rqC9Rb0cJSn+km/14vle9GIQX6xKC/oJ5UfKMq3MdQGJ/lf5Drjup57KTYRYE5g23Q5Hvse1DEn2ktIohRzYoB+3cFBRAe/5fzlHKvEExTOpEcHnIBYnx4COOFqaCJhXgPtDudfWcqbmuNWGuW1EEDwg5AmPOjO+BKPz7Esf2dwiTvgSgDWaRFN8AORJUyn7ownUXzHB4rveBuwlmJ7/xwu9pGciiKWEHsnLKFzBOiJ0Xlmf2N51nyEiTBr8NiWqwWrLKgCp1J2RSqRyDkg6liw2VVVhflPrj3ThVtlzl1da6vQKcAooF8L7uwthCEx6yEcBDkPycXyuGBR0SOTsgabYoDtl2rBRlZ9wAaeVo8j56itI58UdzVw9rQY3R0ZBKlvMm5Ew2ofbkW+gXiSFoQY4GNTjgbcek0RtsjyEL1/5LFDz6SsIatcL/gtpiduvsm+M19tGrq5yicKISlkbXv2M4c2jwOfh7+7796xg/2BAOfgOQ8fajh4/2Rnb62fPf/dwzOTY/E4AEnqy4YcxyaTD245eOSpAzu2DQwpipkbYdmQ0j84/TBuCTxeW+LY3m1jRpiHmEP0q68tU+e6aWBxbSLHsYSFRYeL08YTc/dKMQ4bAvfqaUXTRkMA8ieA6ePeRPYjgHWawq+Ki6UJKBxPkualbvxS/fUEIuReR45JrYGtu50aTwBBcFeoN1qpFncJAXARmmSJ+/uDkGvMC+ACZx79D+Td1btl8sDh8ZGVKY+Mbt50Sg2hdOfQ7i96vuX0+dX48LpHjkxOdfX+4I933rd5VWcweNrjaVLak92Z3o6wUiWTxfxUX38qsywiySYfO0jBBdVwxBtg/cj5paPaeCSMzc6hbZOfrRoZGIol8RxsYiAab8bmZrUHRaMTE2MNDWv6tm0/+uiHN8UKkDgjB2bWj0STIjgMWpPDI+6C+TlUXBPIFdcErqGHKUYxp7FPmi8yZbiHgKvWTHyflTQZEtx4Zp6xcJTGLMuClQTwcI6kC3BwlaDl8oV/2nqJfQcc5vb8e+7vfQ/3OZX7IivzuxmZieFRUeNjcxHqI/SXIhiWk/iOEHUWh0TgYQSHMfiH49DFQngYNDucPBkG/RFAMyFuQiRZ7CyNkQZm7i5EyTz5FWSmS5Fp6aBHFn5Y2SV1TUzEIoFgKBQMjGyJxLok13arEHZ7kzVyWLDiTdm7wis1C+ZDcVwbdjsDwZG4OhIMhPC5schwW+m40imQw3AZv7vj5tPYWvgbRqvFb0sFHq/ZUGWtQKjhNFcCac3kLYbpg4YJQkQhvixCDYa3XzovUoMhKGJjN2u1gsEwa7OCYRAUZ+uDdYCuT8oGKHO4yuC3wjVgBjQAij1zwmqrqKsPBhpKBu9iCfniu8K4KWsh7MGkf0jkBFlNID1BNXqoyBICdAFZsAgeSQllIhFn12CwLunzWMetHJaFwukwlnEd9rAHD+oWTuurCUdDeJbkFAJhZ70v3e2NRJVqr0sIsHWChPAkn/kfxg7+353LoHPcbnbIGKOWofEGmQUxag58GrcbnXv8cfqs+DyB+R3PE5jSeTOmk2iAcGgk9Zw/MTZnNzP1cJaDDKKwlIX/z9mpZgHjh50h/Dbk9gvLP9CubtU9w3GENHs/MGibTn65rzYQCzZE3UCgfW7xb66lMQhgddcvYPUmv80XExqtS7B4O29j8VaMLN4z+PfR6DmOrRBEqdJ0MjOwqufFJ5QOfxzuht5H/gYawBYAuY8Cu/j/7n1QIvFzXyoQiRM7Ysh0kp0gfsl6ZoxGwmgeVauMaaI6V0FuSatLEMBI3ByVgI5AYujgBirFrIhvoJ6AuerRh4Akma1gCJRJtk6kpH6FpsIDl95S6uKmG+IEng9XfipS4x37At7GzWjfH6nxjJJmTHo9Y1JmoL/zHNlZ0KalZxCxHfVxPbJEVvWGhezy0jvVHBSG1kxe6+L3iXeAoB3crGALeUSgWIMqdwwgabMCfdVZD1AsBZYkcFcXC4bgIV7gWLu1QrL/GHbO0scjetHddw7rhbQyWg1PBHt9Pvp88Fz5G+wE0RHyXKAlmlvVFUWT/78+V0nP5EzUE5XoXl9t2kO0DjEb0RPsQdNpxsu0MlpVDBALBC6i/0HwxUGvQY8HIf0DpFj4rpxUiRYxwlGTZ6Mkh4JbdqTUUFiSZWckmEztUJOBsIvdsTemNgVbqvBovlxNJdsjsULqH2NC+IPHX2Yu6fPwD+lRpZygqnqcVdZchs1pgqxQCLyyGZGROOiCeNNCiSfKi7ybAfyyCv+R/AJ6+Qx6+ewl8g9fbZQ5ym4kMTifYgiFBYKWgyYrI0lwBb6K2AwNveEI+QAN4edIDP8VGndDXGClGH7Ah2SP6wH3hU+lzmFBPpAcKsUF6pH2o2j9sbyGNhoD7JkF9/iJ4j2ayCLEonvUQ4CK9yhU4PuwlIKANFNrKWyoQr9HPchniXs0hveMLhnKQ8by/CTu/FOEs3Q1k0M6RyI4xDWW8lBgNWJotBagGdGvn7fEStHW949OuD0TonmOgSBS87/+qmknkOMCB8WtK9yI+UlmMzPD5DaAXvThmVQ1+CobSV71huqKiJYu5lVnEnOVdiJrVSGcEGQtidn6DdUCOOZJEoz4Wo61bgYcLTzxmo2tSK1slBMk+6VFJEYok2X6sFU4sDadzjbWExZLCGJVCUQWxQMMptRFlO/GDHVLwBKgAMe4h8h4p2qJEJ1ibL6o7GcBZP9p5ZDYGOrMjG3aMzk4sM0fsJ0SOzq39qZXLMPmTjk6E85Ps3Dki+H8dqvkCUbV1PrprjRE7gAo/eDU/pGxTCaolKPfHGKlMr7eAchbtpmD4w/0dDcGPJ6RTHePfSIWl5wtytreLTNWH55eC17eYzu0qXcokqr2xmMT9u6eznBM9qCmcF//5PZpMr6fZg9YPIRzrA29ytBoGWuNSt57gFCWFFI9eDxbFWqbFPxOEQAI8MTO95Y+qwvpyIAiBnfauTaqJMsTWhvh35urpXrSrsPe3P3OvxI1Vlo5bTnWYWftdbNmPXsqs/OdAVJR05q1OgXNietCUNd09tQP9rxDQcGs4my5FZzOlaQUSemAsnB+OV0BrgFIK1K6SVlFSg+UhVsgWFXLlivAOEXKZlJGSNlCyhiUOfyLhpW1AolUDlfCPgGlAnSqMGBO5fBPGw4uQlPhD3ePs9zhdHlCy1piyytFyV0Vbo4sBTbltpLjakJNCj70/Y8sDEK+NqzY9rSBCg45VBfAOFa55RQweCRdhJaVr4R1Z1PQtAIY5FEM7/lYx2n2C/mbn2fLzrzFspylka+wceyxvz4omHiW/eftzwAJq7WskTU7d+yY38p+bX6riZ+/wJpMXDkrjjsDPoHn0Ldv3kDHXnByLtbKzl9A32QFpyA2Oqc5Gyc65l8hdi2eRbZz7Xh8YRwBR4Br/88fwn+ypooHSNM+8wX8ZQ7hedIf0uwerUFdAIGvcDoLKqzrZL1BdQEafvPviIYPfKnYqtKaCGMKhF0D3HODH7/C8vTvBJOPdKzw94XLZyvn5u6MmX9zsAgyTvqk8fk/UXr6IPfBLABNv99zE5oY5b/xxHd62g94Vh2z+9YteE6zZr4gKswQt5vEeK5l08RLtHZR/d2310PcFquyT5KYZy/zvG6bwvqeOicVAp9znERSVlAZNX7Y1wAWANExCeAkWQInCfHPLBnmWA6GrgSMVASg7NlL36SfX3OrGZJHJD/Jy5vFNj8MNaR0QpnD24aeTuAcmDkzQMTpUaG8VNzR8Rl4ibz15XFsKCQD2GRwqG4T7pZ2k8UUcHSyK9pY5bH8NnToqR1X+YoqzlZhZc8jGXfEXG4HG53/6U5WtrkUwem2c/mfoUCgKci76Fxsm/kG6+SvFnMZTGYwSkkuAzLmMjBZE0MQMfFNhJKq7EZP53/06hvmG2/43gZ7csB8A101XIctXef9cyJSqtsMORE/Mt+Q3va9Qfo7vp8n+TxdM4KbUMG3J+prRjzhGCuuGQk8uRZ5L0rQgs1N3NCwZPTw5Qu8XTpyRLpKcrbxNcf4XCFnmza97uhBCX1Lh9DRs7TBlNSn6qWcbVSwJI8/M3/xWfMNmrWNbl3G1z+Oz1vGHIN4NFjZ1eoTs7XuMoGyclbgHheGHjcXpBO0Zn11Jn1+M12dsZBQb9l6Xas5C0AgnIUFaDZS8lBCYLFHrgHAAtnwpcjhQ0CNeMBdY07gkVj21BRZrlrRbRLdtkMLFl+CpdQkiPkwrtKgK/riS8iX8vos98Eyjby2sEqT8pZWacw3nEKA9QtO5PenO/3haDhOFmiQ39s5IIWjiqfmvwBIH7JkeNpjYGRgYADiO7UH/8bz23xlkOdgAIGTFo9vweh/Cf/8OBjY2YBcDgYmkCgAg5gNJQAAAHjaY2BkYGC3/efH4MIh9y/h30cOBgagCAr4DACFuwZFeNptkr9rU1EUx795uUkeRUpxCdJqKS6KBCkOsWunoCKhkRBKh1AkhGzGwcGhSAmhhAhODoqCU55/gBTpUBAyKQ66S3EqLiK45vk5N+/FUH3w4Zx37vlxzzk3L30SX/AWyp7D4KvqrqsQioUV3crVVMn01A4i7cG57IrWXKT73jfSNvK9xeJfhZfQgrtwHbagndCAZuJ/aDlmdHUvvKQ31HIwyo3VhpHp7kSjfFkt+yfuyElr3t7FHnlfO2+azctp3A5xJfRX6GFhoBBZMrBvkudZ0u9S9lgLrhuf0EuHnNb7PjXqiV7H52KiDzNjHWTG8WfOD0ynfh97fxZn/maTNohb5b+Hns+N4wmyCA7W8bkcnNc7k/S/4+8S6VeSawMecKeJ+aA/5KyU+67V4LeWbVZ+/szebK4T/8yu67Hbpa9IV2EZKu6FBu62qn7ekR5BNfgxjefe5YQK89hP5v4PoXTB76I23UUKORfgaVCOvyDpT4vpHs7CXYfIit/FPNN92H6H6azPwvvbnN/F3E6sfj+pHyb2wX/zMBdqXEvO/2K76OrAJDk+0GuTd1K3ezEr28eNIIpPs0+kAk6pDOpS5hiuTNE3ZAu562O2U8gtcop3speC/c6Mj9oKlSlaLP8NI1ObNC03sUvEHrmb6OL9ATP04LcYNNSBSvCc2B73fR2f/gF8MMufAHjaY2BgMIHCPIZFjA1Mh5i/sBqxBrDOY33DpsCWxLaM7QjbC3YZ9jns7zhWceZwCXHt4s7iPsRzireJdx0fA58HXxbfBv4cgW+CZUJ8Qm1CD4RlhIOE34moibiIzBH5I6ok+k7MTeyEuJz4GQkvSSvJLMl9UhrS12RKZM7JcsnayObJLpH9IMcjZyDPIL9MQU7hgKKD4jylNKUHylzKEcq7lG+oHFOtUv2itkY9TP2Yxg5NKc1FWjzaLTpKuky6Trp3dH/p9embAWGaAYvBKsNTRhFGDcY/TDRMbcxYzNrMNpidM79m/smiwuKEZZDlLysFq3lWH6wFrCOsl9nI2Cyw2WBzwOaCbZ/tLNtltpts99mesr1m12U3zW6R3Tq7XXbH7C7Z3bN7ZffNvsi+zr7Lfpr9Ivt19rscIhw9HEMcExxzHCscWxwfOL1y+ubM5MznLOWs5mzk4uIS4BLjkuFS4tLg0uMyw2WJywbXaa6LXNe57nI95nrJ9Z6biNsnt3/uXO5i7krueu5X3B+4//NY5dnk2ee5w0vH6xwO+Maby1vD28U7wXuW9z0fJZ8Wnw++Mb6LfO/53vMz8Gvw2+C3wb8kYEPAvkC7wE2BhwIvBSUEtQStCLoUzBQ8AwCL3LFFAAAAAQAAAPMAqwAFAIwABAACAAEAAgAWAAABAAKRAAMAAXjahZA9TsNAEIWfSUCkoU4RoT2BFWioIyJoUhFEv06MsYScH5sgqHISeiROwAk4Csfg27EdBEJCq9l9M/Pe292RdKhbdRR1e5K2RI0jHZPVeE9HemlwB/zW4K5ivTd4X319NvhAg6j1+VARDTRWroyoiGelmssRntyDXolTDVlnoJFKzeAUMFKtqZxrwbm03ZvHgm5s3HuWox787+iVlqWcQbuxu2JN6CdW+dY7TckKmFd0Mj3g5GE8kiXMJHCqf5Tul/bGmOWOd8Ld4V9/ubQe17w7N6/2TscbvFUym0Orq+eW6Im9QpVyXuw0U614Rw43/D9M5fKHOkwv/gJB7E9sAAAAeNptz1Vsk1EYxvH/20m7zt2Zbzhfv66Gb6zF3Z3BpIOxjY4CwwbBNRAS7iDYDRBcAwFuILgFJ4FrPCTILWzrabjhJCe/5z0Xb56DgY7zp4S9/O/8aLuCgRBCCSMcIyYiMBNJFNHEEEsc8SSQSBLJpJBKGulkkEkW2WIgh1zyyKeAQooopoTOdKEr3ehOD3rSCw0LOlZKsWHHgRMXvelDX/rRnwEMpIxyBlGBGw+DGcJQhjGcEYxkFKMZw1jGMZ4JTGQSk5nCVKYxnRnMZBazmUOlhHCY9WzgWtsvP7CRnWxjH0c5IqFs5S3r2CNhEs4OMbJZTLyXCPZzjF/85DeHOMFdbnOSucxjF1Xcp5o73OMxD3jIIz5SwzOe8JRT1PKd3bzkOS/w8pmvbGE+dSxgIfU0cIBGFtGEj2b8LGYJS/nEMpbTwgpWsZLLHKSV1axhLV/4xhVecZozXOU173gjZomUKImWGImVOImXBEmUJEmWFEnlLOe4yCVucp4L3GITxyWN69yQdMmQTLZLlmRLJ8mRXMmTfCmQQimSYqO/oU6zOtwdamWasiJgua60Km3t6rrFpeYOdU3TlBalrrQqS5U2pV3pUDqVwX1lAS1qr8Virqmr9fuqqyqbvYEn3aOqqJU2T6jb72tsH9yqj6c80KdNXWlVqj6OUlNtfUuT1/Yv2ILBHgzOYHD9BT+QsqkAuAH/hbABjQBLsAhQWLEBAY5ZsUYGK1ghsBBZS7AUUlghsIBZHbAGK1xYALAFIEWwAytEAbAGIEWwAytEWbAUKw==);\n    font-weight: normal;\n    font-style: normal;\n}\n\n@font-face {\n    font-family: 'LiberationSans';\n    src: format('woff') url(data:application/x-font-woff;charset=utf-8;base64,d09GRgABAAAAAFFIABAAAAAAfqwAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAABGRlRNAAABbAAAABsAAAAcWnB5PEdERUYAAAGIAAAAHQAAACAAtgAET1MvMgAAAagAAABcAAAAYPhChuZjbWFwAAACBAAAASwAAAHitAPmBGN2dCAAAAMwAAAATAAAAEwWyhNNZnBnbQAAA3wAAAGxAAACZQ+0L6dnYXNwAAAFMAAAAAwAAAAMAAMAB2dseWYAAAU8AABGwwAAcIB67Wh1aGVhZAAATAAAAAAxAAAANvmFEYRoaGVhAABMNAAAACAAAAAkD2QGw2htdHgAAExUAAABTQAAAiI1jSWMbG9jYQAATaQAAAEAAAABFCEWQAJtYXhwAABOpAAAACAAAAAgAa0Dl25hbWUAAE7EAAABAgAAAe4qs0V6cG9zdAAAT8gAAAE9AAAB/KOTUpdwcmVwAABRCAAAAEAAAABAXsu7eXjaY2BgYGQAguP/NtwH0SctnuhCaX0AWd4HfAB42mNgZGBg4ANiCQYQYGJgBMIOIGYB8xgACiIAuwAAAHjaY2BmMWPaw8DKwMI6i9WYgYFRGkIzX2RIYxLiYGXiZmdhAgGWBQxM6wMYKn4zQIGhY7AzgwKDwm8W1sv/ghiN2e0YNycwMMy/f52BgcWStRGoRIGBEQC3bBCZeNpjYGBgZoBgGQZGBhC4A+QxgvksDAeAtA6DApDFw1DHsIBhMcNShpUM6xi2MNcpcCmIKEgqyCooKagp6CvEK6xRVHrA8IHpN8v//0BdCkDVi8Cq14JVMygIKEgoyKCpZvzN+P///8f/D/0/+P/A/73/d/3f+mfBg6wHqQ+SHiQ8iHkQ+SDwgdL9a/cTFVoEWlhboC4kGjCyMcC1MDIBCSZ0BUCvs7CysXNwcnHz8PLxCwgKCYuIiolLSEpJy8jKySsoKimrqKqpa2hqaevo6ukbGBoZm5iamVtYWlnb2NrZOzg6Obu4url7eHp5+/j6+QcEBgWHhIaFR0RGRcfExsUnJBLhyuQUYNgyZKQ1Z8JEUrEpq08CUxWVNbVV1WBmEwNDaxsh0wHLH1Nk/lYAAAQ5BYEFzQDjAScAlQCYAOoArQC1AO0AugD0AMABCgDhANwA2gDUANgApgCNARUA+AD/AQYA8AD2AQQBCADQAM0BFwDJANIAiXjaXVG7TltBEN0NDwOBxNggOdoUs5mQAu+FNkggri7CyHZjOULajVzkYlzAB1AgUYP2awZoKFOkTYOQCyQ+gU+IlJk1iaI0Ozuzc86ZM0vKkap3ab3nqXMWSOFug2abfiek2kWAB9L1jUZG2sEjLTYzeuW6fb+PwWY05U4aQHnPW8pDRtNOoBbtuX8yP4PhPv/LPAeDlmaanlpnIT2EwHwzbmnwNaNZd/1BX7E6XA0GhhTTVNz1x1TK/5bmXG0ZtjYzmndwISI/mAZoaq2NQNOfOqR6Po5iCXL5bKwNJqasP8lEcGEyXdVULTO+dnCf7Cw62KRKc+ABDrBVnoKH46MJhfQtiTJLQ4SD2CoxQsQkh0JOOXeyPylQPpKEMW+S0s64Ya2BceQ1MKjN0xy+zGZT21uHMH4RR/DdL8aSDj6yoTZGhNiOWApgApGQUVW+ocZzL4sBudT+MxAlYHn67V8nAq07NhEvZW2dY4wVgp7fNt/5ZcXdqlznRaG7d1U1VOmU5kMvZ9/jEU+PheGgseDN531/o0DtDYsbDZoDwZDejd7/0Vp1xFXeCx/ZbzWzsRYAAAAAAAACAAQAAv//AAN42sW9D3wc1XUvPnd2dnf2j1azq12tRqvVaDQajVbj1Xh3tFqPV6t/lmUhZCGEWIQihLGFUQzCdRzXdR0/x3Fc13UIpUDq5kN5lA8ffimldGYlCM+liRweL39aHh/KB+elCU0TSohTAiTNS2Owlt+5d3b1xyFN+l4/n4fYuzN3ZnbuPefcc77nnnOvKZq6QFHoTecJykG5qZ1UkUKUuoSclMCoRcZBqchkNZO6aDJpy+G6ZDrJ16LLQbHqkttF8YxqurUlFzmyPEilLAYFQ6bL2JzSg2IQiQ7pAmoq/RNqbfoBCpR+6jxxJUFRFE2ddpxwDJbfOwrvhXeZjL7kcFIs/KYrTWrKp6QRjotLtIsKwUWas9xIxS8N2S+13HQwZCHGMKjNqRp4JX7taRSMfRvdi2ri33aeKMEbS+S9EkUxE86DVIwS0LVUsR76W4zU8rqumzGtGI7WwdES7aSiQIBgQzydTpsOrcg1CrjeZdd7vFVQX3Q5vOpin8vtUYuszw81yGzSLBGpZlf9+Z4/+emTVET1mvUdJtth1nMW775sstB09+XzPQ/89HPkYm2H6e8wazkrwl42/Zzlg696bpGud9eoiw5SunBp8tyih2fhoJZb9Nb64CDCLVZF/HADR8ogKcO4xPdEyT3wVB15Cn4zVvmdhsrvxPE9i42VOwVc7+irox0uN+vx+vxVXDAcqY3W8fWxhnij0PEr/jP76jHZM3qNBB/dIcJHj0jkI2Fu1GTFGlF6builtyf/ZALpkw9NPvbC9m/+fOKh8dKL439y3V+jzFDpRXTsQTT6ADpROo4/D5SWHiydRMfwB+pBFmIfzDMF57vUNVSB2oNuoMxtmtmnWx7nJfOmdHGbB7Ni24BHNcc1c5O+FHdSTSAqTelifBxfijd6QIzmNDNycWnERSlwbYSzvEgtxgeuA9Yt7XFRPmCtkOzDLN/DWR8BEdtC7rRut1n69rmv7MNcC5jVnHnbsrXTc9nUlxk4W/RW31ajnn/n1FcScINv0YdPF6twyZg7ucXkTh0uv/29r9xILqfw6eIYLpnF6/AX/o09+PYi1Db9QdMfSK5AMGSYKaMIv4KPfAbV5/f6qqqTKf262/bsHFvPAvRFuJDSb1urBaYgayQCQxEZ1kf2wHfCMLcEzTaDsjzb4LTXMMeDz1Ao0pbQtrREYbzWyLVR+y+otEqtCvnLdGa7yF9Gj1QuOzuQEqzV0+SkEUXCbhf5i0gZuAIPoXAjHQ3iqgBC8HCm0/4xJYYoluN4QVFzAdYzkx/P5CS5Sdqam5yZWpgfG9WzcTFc+kVgeoxxscy+nqnugZ3xuJGbLpxcOPAXW/OSjMSG9GCbLishnkPKfLfBhRvk5kQSndO0hMoLXMiNTjvpaK3Qpg0Ozc/0DbSrUR793u/R9byazA+NKYVb/aVHaDoWibdrf/hb4yPDqZQQd/7Vk/RWTR8cpv8umZHrqtAozXE1fOrKsy5VvTlTLwajHn8VRTkp/YN3XW8676PiVI7qpW6hjlLvUMVurEV6J6dARxQLWIPutRVFD+iwosubx/Us1medpH6ptrXAVsGXfbbjEDnbQc6Q+QmscJcabV3XyFlJEMRqcrbYW50EvdttX+rWlnrto2rO6oObZu2b8rN9cFOPfWmWsxbg0nW2rjxmC3Lms9/531iQHQjExEp2B0OLta1sJ0iB1TMLsvFxEJLavcFQsW92wTAMq3MH3FHdmKRsOSmLBAhAI4rWRsKE+1KzzeNs2JYSPZ3tQWXWdyCp2ZaRGqR7UKctUbb81Lrt55Wrno+uex7+ys/rsbim9eevH833zsbjW7VMbnB4aNtARyoW+ybrDYb4qCLXxpp8LOutDqWb5VicC/jYcce5l6/sRe8ZyeRQfnwkP6RqsTgytEz34PbhbQNaMt7wLXiAi0dbpWisyetl2VA4Eu9pioZDHtbx8pmJgp6KhsPhOwrTJ44spbKRaDSayU5OnJhO5YRmLhDgerpTM7OpgTqJr+YEvj/1/ivOE+8dR+aJJQ2eRJFoKjNZeRbVRjP61PSRabg/Hgqgai7fnR+b0Y1m2RsIeGVxqw6mCnTe9AdvOU87z1AT1O3U71LvU8VrsWxNE9VWzMGx1em8VKzBgnW4LDxHifDc4CLa7wbO8gPz99qisJezDsJZzBaFT9iiwH/jhQVbp7GcefeyJfkum+IynCzuY+8GJXUnKe8i5QIui1C/TkHdaZh3GeaCQX2RFaV9d99518KaTrq6huikvX4QsN2GeTBYvHZ6FqTLjIUsZRuYbms6B1bcgEPrcGcw9AwVU7fcMLt7g8xlsTDZh9Gy/KyqH3yGr0TLJyCBXdnIqmAp9l3rBRWLL7mrfLkGy14PvSp4WGqn+ejmZI8xJoaBi3xranB0bng0l03GY6Ks5wbGB4YS+kReTERfbu6QRzVVS4TbhTpjRNMFI55So5wh66mufNfxmelcLx8vcdxWLdE3kDHqd+nDmUIi+Xq1N86JsjcxwoUUuX9nWwKdGOvPbdHVhDS4Y+jslqFmLRpDYa5dzGVGRjM5VRcTwuHs0Myusbmbhw7NTxxSuBDj8PxtFHldEW8DH/G2grCy3kYhmxscnVbVhFHD8bG6fSNztyW25OkDmQ4x7wqGmFBPTGjNKLK6CcsbohYcJ9AxgsmaqY34i1mHvywnwDwbZy0gLkbQlf383lKB/oLzRUoAdFVkGUB0vIYxEYikFXRdwtCIWsdLscwRrjziRcxcpRUUjywZmXHEj+UMWYxwXLhZNnpHSm+OZ7IjoSAdeujAkd/ef3D+0MGD+39736cXShcXTs8fPHD0rkPz+y8d+y27LTS0ZbDSlmrcFspuC3vRqltri92SLq4sI2LFxoXBdEHb6JHetSbkxhA/njEkOcQBxh3JZsZLhYXfPXBw/jSo2LtO3nn47oMHD80f3H/4dw489PnfOnZp//whuy0u+rQjBnQNUEGq6CCoulqzOLsF2ahDd2Sj7qhbcStZ1+A7oW+G/mXwvfPP/tGD57/EhF6YR6HS2/Mv5F89cuXK0VfI7xWoR5kpxqR81I0UdMt06xZyYnAO8B2DHcoLkBRR+BA5MO7xa6b3okmnlzy2KmDSgGHxZQ8Gr14CnryUR7Wq7DZlxCCg94gYlIIFdO/30X2l/d+njX9Cf1z66D+VPor+GNpwtvQ8MlGKClPduA1LXiflxpIS0UzPRZNKW34gMnzMQBqA7RJL4BXgeKsW8LqfBSUQNtYxICPB+yoj+SxQvC7s8Z5AIuuqDnF8uPS80hzLqEpSRql3tJF8e1ZINhBajKPP01P0PURmoR2YEPiDRdaiQN05XFiCKzKbESPjNIs+/6//ip89C8WT0AcHpa15PhHQreuOieyD/ILbQz72D2Hf5iwSUar0Etwb/uCbtAyy5qBGqCKNZQ3p5efwmCm/n3gF//gzh61uac50LDst5L8MjFymLcoBKtNCDltNwiui8BthJL1d+l7C+fP3vNh3mfjgLUZwfg5kupvaThXrsAVoAwuAoYXVhTudJ21tArI3cVYHUJqDJvfAd0cTUJwFJdvVBraca6I6rrblG5RpRWnKZWvcQ5RuxRi7m8lNE5KS772l8LH5m27uzyuyLA/0zszevm/q5v5eWUJ1Pn+Ub03s38nzfq/XH421JDpzE7Ux1kdfeO3kveMTkig23zB+79lXv3729M2TioJa5MLk2U+/8sjEfKfB8yhl5G6beOTx6+e68mAzU9n8rXcBrU+A/2bAWPJSh22eEdFnsTcGPHMylKsKqI1p4cM6y3K7LhXdxFFz41HhcONDB5Z1v82SZusbW4gv5uxgTEeH03RyFlN12XRwlqvqsoOCOlRknK5VT0eH0eHMyCII7Ak0U3oK7UFe1P+yY/mVf3zj/fGXoU3D0EYR+JSiniy3UQMuxTGXgrhlac2sumi1QMtaqnBzWlLQsqoWfFiFW6bbLWtPvfQ9W1icnOlZtpKBy2b7Mpwsup0e8BmS3KKabAeTDKdrJrkIdfBFPe10e9rVZNkYbzgjEmZpFPEOzGDQCkcM7LBnyoOxwmsJ+Cx3bUB7biIg1QgLgBgZTm3L35Dd1TvU2yxvTs5MzwZKb7CiYOQmC0cOFaYOCwJS1Gxm8g+NoVyM/uzz8wXA+OOZ/lyX0TejJXfv4sbGRjNZQYjF9g6PzO4dm8oZgweTQ7meN/H41D64xCSAjjdS01SxA5NPAl6PacTri4AqwcQsEGIOgcgLTReDVhdQVejCpBQiQMqb8JRExAPAgkKANWqDVr4HvqVQsVXpMoz1bg9GAmW4qqIMwQXr6WAPgXUDhRiIyJrB2IAuNCS4OC4W1WRjbmu2Pi4nZhO7Z5JKJqaEwlpqZupOtvRD/8S23M2je09MTm3NNsS40MjW7Ph0T7+i1IaREN/We8uuI6d3T/flhTg6zicSSiwaCuipOwabYVj6X/d4Q7wo5ae11O5CeO9n9GQsGhf01NDAdYNapiDEOcYbF9RELtN3684RIxOPS2Iud8120CMCyOc8GUP1oDOLHuy90Hj4UD4PXYXnYSwKKOxKIzNG1Lk/bbFAYEe6yBJbwbpAYD0ssSAgsCZKWw1l1+Le7/wcyyxjIhhK9LLlq74cMOuWF3lfHUDIelwWoVwHIXmDWkR1fD2R0yXaVz604SLrsS2FRfvIAdbhCKxTBOxFEMZgprMrk+3MYpmkBXoSGc89V/pZaQ49RDMMywZ88TokvOK498r+l0vfQ8LL6O+S3lZvNhzhqoWApoCM9YJOxfokS52kipvxWAXhKvJY2Bqcl5bE8GYeFIoIdWER9zdchw3qFs30X7TaQLkadr97/+n9y0SL1HWYDR3QY86Kc5edZgNn8RzWIvEOtFjHN8TLPbPaAAdb9TGMe8MV8dwgjGteM0ifWAPW2HH1MFzT072I91YFYmFVMvZ9ojogxNuULUM3C6Ufpx07V6xoYiBfmCtMHARBahIHB2d3nzgwM7HNkFvQrmgiGq8P1wROHzPUpCgAtOmSHfzLpYekhpgkHp0cv3uhMN0/CJ53A5/VhrdjOzQKNMPjsp0apO6kigqmWhoohKGNxQHVoj2KA6gWxeNzOzFJm4BUNSBCmzirC8yRAKdD8N21CbxMf9SB/QAhiCc5rJ40VFGbBFwVDZo1hsmFLJ+fUIejKuMv6rTtUORXGK+WMKnKptesVtkHHUWBK7PdQ51GixIu/SKqJnMHj2tjE7tnR8f0bCwuCEZm19ShKydPIaUhHlMS2q2dGb8/Fm9ROuUWlY+H6EfQEXQsGFIS3QM3yCOiiL735mhrolHYmh8vzM1/ZKrXaJfRU+a3ju9OKGC5tg0dymqpuMiF/AE+3goyNwXjjweZC1HzVNFXGX1WCJOrRjN9Fy0vaDGvj8AyAHBFHwFrPmwbwuVx1vedT9rjzAHSxgCSCAVhoAWXAWAyQTySikww1LGKJjDycRDqRETb5tdMOS4sjlwDhrv0bUXeMTDzJebzb3639NqRR08//MdfeOL+e86d/UMUJ37owAf/wujA7x5qhvoEdS9VNDA+2uGkEoCV8FBZOkSOl26/0YDRsnQ7OUPmMcL6XmB7L2fegrUzeAFmULNuIVXWGEhACg4X8CURROK/QEVvkCAVa+EWGBU38iAFY0Er0YYHyo078EBJQdXtwUW2zZPY6BtmynNWylWgxn2Vrq7ISQvR9fLqhMOqvl8/YbE2nWG/ZKMwuQZq+URbZ1bPJ1OCCIMHxCd7y8TvHC9MdRvxGOJCA1qqe0DPKIlIuEHo6Z3dVVrZNds3sAU1+dgGXlX6h4YaeC/LsjH+xoG8kuBjbp/AuiJ8IzgcrVI45HIhD1vLC1LWEMA9YVl0djJjdKh1MZbxC6KSyGjdhW1DWhKMaEzXhgduzG3OTMTjfsYbi7epYFJ2DY/CswJqBMP8hwdTmxPNeJiLkpBUcilJbhLkUKhJbE3SO/jNckwMhEIhEHy5OSlKfNwfCARivCTicT8M414BOegCi/wxqliDx31TBX+OwbjXemvYKoJ2iF0G5meBvVmOjHWAoibHYaVptmnYMFtZjEBihjkUXKxpaGKBm4BKAKhasQbgcS+erTTHQkWOGrIt9dVglaMq5laR1/Eo47L5fRWGvWpGyV3m4HCT1DNw88zB41OzfTlJLP34/YmJoWxWViKIBe0wlE2m4kIoFG0UCkk9OTs8mexsaEANVaASmmQ9ISUykVDAH+PVREqTE2HBW+X40oHCdHdeEBJqYewzJ86XzpQ+E+YSbf2D18ujzXJ9PGPcUPhYoiGWZL1IVDL5m6bns1pSBjceVXMpTd2i57OyHI2iUDiuyptJ3OIFAERvMF4SL9HXvJVa7M1pS05ydFWwxpXG6JdEZcrRGPi8QKIxTYgvvUm/i+pLP4Dffh58uTfht8NUHegmggewP1dLQh3EyIfByEc0PGFJXsNjVGBRkTRx88xoGrvU2NOrW+/p1X+op5dd7+k5oEXPi2E+xHm96ARqYl2BUJAPL0EjweNraxNT4PHx36x4fEyStNj2gY+BD/wi5aL2Ush0axZrK8bab/z3tA2aEYfxBxMCKL98/lJXpZriTBdUO1iLqQGN6VymnqEQ7bARPsEgV51XNGgQRTwoUmDoKxccvTSDBtDpfy79dem51wl/CkiC9iQIf+ornih2QokvAtTwrHqgCD7wM++XGBpJr71GK9/9LvUf6hMVvgx9WNcn8FUQzcKlgMXAtd+4T9mMB2VQsODou7LM0MdeR4No+z+XjpS+RJE+zYKdWoDxnoYR/+dUUUf2DDaODZIh3467ltVM/aIZT2PkbTakzS7OUoDxAZC8LXbzFf3FebudzZzZsmzVRS6bNcuLkboaQIS1uCxCuQ4RRsB7qYnU1jW3VLyX9WcEF3bpgBJibLuB7UJ7J/i0AaohbduDVY/Fjk641jwWAFI2jAdNkOlcVeLuGhDDWT84sP23zhw/+uy23h2iEG9JxcYSMVCVTOl/u3qSiWyuRTUO7kslE5JQG3bnkOi4dPPOse6tzWJXVj83M1JIJhoTNVmhXpCl1OTRZEJRG+TprVN7uUCcV2X9ioQjoEDXQ6Xn3AXnU9QfUV9EVZR5WsPTtwEYNMc1s0EzU/rSdfb5H6fNv9SW+u2TW7UlPzlC5rNkauFOe6TdyWEQunS/fXY/Z30SEb9nKUxqrP9Wnnr4yE8etLnwZ5w5tGwN1142dyybrUDM45/s+DplffJ4x9fxjfULLzxj33icM48tm5/kzE8tn8+/9s6f4OAVPL24/c+GgGdQrvGMemb70I7hY5/6s1WB23hOmHbT/cHQFxv8qf7R6259nGj7v7wuGHo6TCntg1fZ8g+Bdau6HiB/Z1ayw0trlWtM17M6gTrhVYugXGW18V+0YhbKMDFbnjtebzoq5mPV+nf12vGs8q+t/tghUchlp2dunz996rN/++C5md1JTZG25W4tzMkJoYEPBBDNuPjGeEa7MzczAA4cBwa4uS9/2+yhvZ9udCkPHcIKMClmu7NqMhZDbcrEyLGDf3pq/+HJ3T3D7UmeR6GQ2NypD/fumTpQuG5qYGSbuKtn2Bi796NTB499bGG6MJTXtUgt3ZtK7dFSSiohi7Wsw0UzdFwQm9SkcVOrKPBhzseiF0+cOXZw38yu7l5JyuX2zJ84/Ydnjh+aGs+kvCwfFoUkU+sOhFOK3ColJCljDA73H963vzCZycyOnyu5BkcGG/WEIm8bnp45ePTuhfGRVFIQs70jk9MzC3cdmJwsDO7Ymk0qMR75AzW1sYD2u0pMSnIBFI9loAO3FebunDvUOxANpRJDvQU+oAZ4fzQ10ihWcQkpnkkY6mCK6B+dopz3AU52Uw2ARInNA3TrxtE0DJhNpC+5WAp7rB7dcpEZUGTGNavRlvjuph8FiU9GdZiuDlD8lrsOFCfoyrrLqxcDZoRz4mssf/n889/6UQt5gukw6Q6T4SxH/WU8V2dV1V92LjqrGNBYHlyef370X86TYK6XnHY//S9/TYYHyy3WsRG4LUbKBlwWoVyn3gDx1BlFeG7d8HnaWxWpizWUB08fV1bXOBC/7sKGoDsCpxhb1xo8dYNEUEeio0Z02CFYpTVDUG8AVSOdptEMTZW+c2zlzWNfRg+edflcrN/vcLlolqH9zjoSqpovnaOH0IOcHOTbVFfIwdS4Gn1s0j9kx6LOAC/2AS/qqU1Uhlooz2vFAP0hbAoygP6SmygE6C+JrUIXQX8xMAnJtBnjLAl0UgjOQpzpxWgfw/6Uhv0cKwuXpBR0JAAKYVMMDoBGySCcmpmQ6bUzSdbrgvU6QRbTZW1emcHPiNh1bpXEM/Spw3fM9Q9I0sDg6Semp9XEztFdexdKe9GJzBZdkhNRvllTja7SGTRxfP/hIyXTeSIabVMHh246On5DQ3iq8Ef7Rkd0PRz9ttcb5cfyGUWt4d1e9O3C1K4xbK8nP3jLeS/Yxz6MyIzKbKwb06MOE6G/MhtrDeBpqLq2YGipmuI2p8q6LrQ+Dko82vVKKnK16+F0bXT6JwuFmWOnzFMLs5OjKT1WuuIX+JRmDA7Oj4+lkvU8H9ukj40vFIyBNlWIhREdy2o7R+9Y+L1nfv/M5FRCpb/6OPLO7NZSKM4b+vBwYYeiKc1SMCxJvblbp35rYWZ390CLHI01yyk1s2twYihniBLKGrNznz6NxyeWiQMgE0GqmdpMFYPIdmJtb7YZU0AiFLAZT/CgB4jRUgGk9lzG6tSZvBYzxkKsojOo9Mg9p7+eyaKuzMyuI0fvL/34vanR4d8GjSYdnizsftl5IqGYx08Vnzp96iMzyeTrQvxkYebwscLMvngc+IPb54L2+fC8PFWZ2yHyyoC8OlkirwSg+UlDoXUkNkJCJx6fB5cOTzlOUg6O2IER+3OGmbzyCv3uCucoOE+8XvrTN0r3vG6/lzkH7/WAZNhaa/WdrJO8k8Xv9H7IO9fe5rvqbWeY6pU6+uUVDb/p2jdWrtiYEcvgeZDBAepuyo4Jt1Y8MpDBpc2pHPbINuP3bSPva4T3NdrBAd11qdih4/d2bIY3DuI4QSO4X8EcuF960ORgQG5uhQGpG2YqaDVSUF0Xsrjgem9sTX5tzQPiG6B/SXYzMC6DV0VgJ9XE7OzJ0188Nb/7hvFURii9E92clrYbowsTY/tSPN+VGRvfbwxoeUOS46Uv0Huz+WG4suvQcyC/BTUB8nvqxC4sv3w0o/cNXT+hD0h8bUgST5ogvNNDYGe9bE2oJsx/5dsr72WVpAjAjYjvCUI7LB95Ih+9Np9Mt05YZTr1JYeXcMqxJh0+oBydNn0cweWM7V2tCsXq3xmk0AdQQ+mfV+51nlh5iU69d5yeWXnMfh8ySXxVXCcXvzrCBL+EVTNpq/DBWw6cpydQW6kij/kMMlSsxnwO4CY2kRnJIHDUH8Qc9QeAozjIaQXYDdOLq0HvIGbJ6pQZ4YiAZDYcSktia0FLIvAQexvjvfmbC4f2PtmdV1rQcdUAN7fKnzP20//85pX8wo0TfXlRREktNbqdWqXpEqHpH1BFFreTAoNddOKGIkbXCTER6a3pTWPPhQGo6nRRddhpBNOA0wrhGBMWG/Hk3r9/3Z7oYnDEjMRCwPf5n75vfrCat+BZBuvPmm58hSo6XB5sQy38VfZz7FREDxhJN2HPUTS18jh9tvRYyfUU8OgEfXzlSRjIp0+tlMp9YB6DPjjB1tl6w1HWG8h0VXhVdJAR63ACnd1rQhDBv/8z54n3d79eoYdLhN/K0S32TGmRqmldRTBBoEc3AfM5Oyktx+EZvqUaO/Esb9PgK6+/RTprKh0BU1+22PBlPLd+vvsHb02Q+mAHQAHWZMH/i0fgWuvy+a/83Y+vIYCE5hYdNAtQxElKNy7P5zvLVwGueNkg1PtI6SdlgJQcLs1WbrGxNQ6nAimbSCmSspmULaSUcVlpqM/UucU2XYH6BCnbSamSchMpk6TsIKVGys2kTJEyjcsiNHsdanIaptsowhV8shmnxpka4ATD7DDMTYapGjjDrd0w2wBascF1D/oM029gNMEZRWgmrmoxzGbDFA1TMMwmw2w0qL64w+lmvT5/gIs3is0tcpuqpXWhKdG+KdmxOdXx7/2H+kR69emg/Xir8h/4gXUeOchQDehNAXX10mSWFmsU4vB0dmUJmgNX1iFhlNdBg5nUELi4GBCBXJ+9Qtdwrpgr4ve7gM2/QGdK7wH+pxXGywQZf3Xp70u0m/GzXidUJPAV2nniylvsYC52R3RMVcM1rgYH/95xR4EbCik93BD3YECoyQfak1fedoTYaCARF7iQUP1gPFevdUnGlSfW6dBaPJddhXUoVZZtL8h2lMh2rS3NXE06jXNdPSDgfruqzhbwr939T/1EkKtAwAPLlqOBCLiDshwBoO8i7agKrKWaAo2QDXHxgEMAIMoEGKcPsA7oFnKVHl/5PMO4cAffP28IyU1iv0N/7ziTj+W92WA8e+UCxi/Ydr4OtrOR6qEGqWIUj3SlYj2zWKv2ktEu4OAiZ2nleHoffGsCKNWogmcfsiCRFkd9mE0sRwmlq2Yif5VbOqklZ2Y/dfJJ88Q9EzOgU1PPnjr9WPHTpwsziSRKxOKbM6M79y7snNDAOKL6eKpz5/juuet3dmbqYvRXHzt9chbbws7s1O4Tpx997PSZv8lkiLG759yBKYLkZKV/aGrmzoM3znb3i5LU3DcwtauC4zjgYY1tXdYQiwAIIhQmdjBUNjJADhzHCafNGs6KASW8q8k0azC9nNMniTwCfN5DY4cZ8PiRM7fN9Q7GRZTvG/zIrt8rPYqM4YS+telTny695DwhSkZ+bGp26i97B1uUEke/woW3Tuv770bEF5wsLRBe6dQEnqMkLLrWSaaSBdy0G0jTOqFpnZy1rcypSfje1hkMFduSURxP4oJFQWohc0YCgHGsB64NLnGUlOzeOP2w3t0ADq6LEGdtBEMG3y/xdM0P+RUsbZaGBv770WhdTJJb2jqUiFxLJ4b1sZn777gmdv8PRsaaZeCz0LHK59Sv4fL9Bw7OTh/l86JUGwV3jmH+1utljb0PFAKHZ+eOfPK+A1NzZcYPPvvhfH8Y+B6lWqnfpYphYq1rdBsDYRy5FOHDmPkRTGGFUDgKFK5Lm1EOMx0z3wxjow0GS4Dx3GaP529or91CxnOYMyNgs2s4M7RMmSGwyqFIxXlt5YMf6t7hP+zOEtlZi8mA/Fw4M7Ovu1cSorFWNTtgoGOlpdKzpcfRiYGUJsS5QP/gsdIp54m4qGfHhuYLuSFNFxX/iklHVy7RVzguFkvIqX1APZDwHIx9F8jTDPX3FMnZJb5BK+64jnt7i2YKF60c9A9MMmAR6zqQp1m7ez/51oXPVeYOoGNWH3/Z3L6MM/LDkRDYzD5ucaBvO9ixbaQcxGURatYZpW2GOWgU4Xbs/H8xFI70DWzfNriWO3l1DZk/ywl2xkZVcNHTqhVAZM3rQmD/KEv3gGtJIaFD25jKjaVSsd0pDa1OaZGk7h60IZa6zuskThkpalcDaOW5NvxDORT3R8Nqonvg+nNj46hJuHN7cs/vZLszWkqUg2FVGxz72rF7bt21vbddCZW+H94+8MmdnUlZ8Afq+NncXGv0xuhQ1tCzkhyJIkm8duSNh++5c+4xdTPar6mqLMQDXDK5O6vIqaA3HA9Ew/G4qukD2/ddO96eao+EO5QdA9PKTEeyyhsLi3JDZ7OYrObdrqCLi4QFMaHmesdnbhgzsvm66L7BUeB1FPDci2QeCbSba1W74RwHR5oETVwXLSdAOqcLQzonDrm6nGRxBw65rs3cY2McZZ4pZUvfYh5+/fX3dzMPY4x3FGRpBH5fwnlkDViWfGW8aIbACLZUICNGu0EQpTCIkmz/KPzgqgIhvm9wHSa3uXUUKbXhTXJ+oHfkcKGOR4qmTo0fPnLq6OGD146rSZpzHLjyeGEwpyVqwolCf++tjvErD5/dv3dkUJKAOwOD8zhvKgBjfZjo+CfsyJ295IaD9oVJ+xC0D3E4K5HkakZsUX/+8qX/aYs6oGuKs2geLLObs2r4y+e/ct/bgQrEZGg3gZhkxQoui1CzEb25DGqJZtzlGAR6Go5rKgEJIt44q9KE4QA6CA48WI6xdSeSSAQ2i9VCAHWiZm/QFXD6vRFvwFXF4jy8lfdKrwKYOSzkeTWUVAuKxm/iHWew84RA01Hus9D3DA1WPoP7LrV0YgyOSVDkgs069ku6NFO8aDXbM1IEdrveZcvzhwHTZXc/Bt13cVYmdvl8z5/99GVymQP07WLB9whY7TVwvXP5/IVHfvIX5FoLPNq2bNV6oD64fD7/b++UbHLWc2YzZzXFob6es6T45fMX9v30T9fI6SLkhPJ8z4Gf/Bupd3GLbhcH9V5S+kjpJ2U1Ls9f+P9+8llyZ5BbDAVr8XogUkZweb5n/09+TK7Wc4sN9U146Q8uK231mW3cotzWAvUKLs/33P2TN0l9J7eY7GzHcJ2UGilTpNRxCax2bWB1EZq5rsJbweDVRhEesNe1YPDegfF7EVq67uYwDv8UoQX4RDaK0NJ1VzFSr6fxxCiA7WpQkrX1DY1NstLWnuzQUvq/i9Gp1ee4YOVJqWX12c7Mb4rRawCiCzhLvJcGmbTPGpGAbOhQg2diibYFtE6TIKdIg0BFXbXROM0yfj/toZ9CI0U4rKJddJ2rxlvNhp9AaumB0qNf5pga1u+qYlg/Aw7bl0qPglS/uyt+4K77AgLXlwvwfvrtlZAYzvd5E9574jfpPULBwQFo1wbDu+Ux0eBTekAM8Fdetv3xEIz7QeKP/48ysmM9vor/WXQ4XXrZJ6dtFUXh2VmfraucoAtccOjBdaw92UGSTw5+58XVYCpaNn2c6V0+/42XvkPCfBaFWJzeipZxYNJkls9nXn/tCLniYFjsvzPLZDy5l89//a3X/ge54vOypgf/DPbn3cvUImLcXsK41aOKh+Qhnjz5P4R+WOpHW5ABf12lSfRq6Rulh0sP02/QD5UC6KcrcysxOrXyEqaDBHTIAB1Y6hBVdFdsAGgAhhDAQxLDwQbgNWG4j1/f8o8/LA9+Bhxrp4UEHAlYPt/1NfsCYzo7nNAVHHm11aIDHJYi7WRJHhuZwF+/Po5MP4B2l1AGTaACypS8pX9wnlh5kp68cmHlS/SAza882KovkLnD8mpMyw22hEyf0PakIZ4ZxC1M7/lff0BaSIOOQcuWK4BVM3aakIvQDYRvndOUQSKOPYuRPP3eyoTj5ysuh/Sy4+tvvnhFfxPec7BUoO9zvgg2Es+FUTiX1s7vQQwcM2TNSTm/AM/Q4EWadBoTrHLmSFcMZXnK8iDdWHoLhUsF9+Evv+e5UM6TVip50tS/lyd9ofVf31mVMJIn7bnMAPVpi746T7pGR1L4bST/zPkizpLGNOShL1nSl2uB17gvlN0XhrHXNFT64r4IzcYLScmaU24JuYDb0CoNn5T75a6E7qMimTEDXFpb+hHduPL9S85/+/IvzsD7kjTNHAeeuXA2XDkytT5+v/XxH9xGOIWAU9Sy5Wwi8fsX7vjBdlztJBx0kEksyylexvlc1BK1Gq7/VQkJIE+SByXRaTSAzrxROl96jqYdx6+cwBPSmA4fvPWBizn1wSTQO06ZDg1TIcCo5S+SIW/PNbqBYWHmT96/48kxQr8B5hG61/ka3NdGmU4NL4etYipzXzij3sPYc14gkgSREnRUE5EGEP3+nzuLaul7jdi/AIzNHGfGgAu3UvdQxUE8O9BNgtvAjMXUdYOsupQlC5fMznRRooE5IcKcJc/UoFQFX+VVTbsIQhkFVTTK4dC26UlbCRirt4GCGi0nEd0ULNZLg9jLS4Ss7n7s401dFwwtUon+PryyLQQQuVgfa9uYSpRdy7Isux5rCc+NdGQNnGUj4Ac2VyPbmZfWIs9yeN0st9uOSuckOZO7bufUj/zemmiDJDbH+Npwld9d+o5fjOeyk6Mfn/uzuw0H7fdy4Xqh0R/x0ooakBdSOuvKPH10tHegNRnhkTxiZDqU5lg4hP4o05iMCTJK7RoYaknUhJgtyUwyHGO9yO0KheJiwj/Ym9ms1kVTe+6fKX1cC0cboqzXdY5mafALM5k9uw/WRluT3ds/MjYSDaliJqVvAXfRFQwN2Lkep4FX98KY6QRu3V22FCJO+Oi2l5s5YegUQ5hFg+XsvlHNZC5aGYDNrvbN6XSaON8ZshTRqgfm7ITvvkwwZIVEzIxuzKckuD3BxepEewA7L6EQAANQTV027o2EXfh/fc0zcW9cW6hI5A53OIAiNWvLtypLtfDfaZqhEQ/jMfPkkYXtY5qOlw7o+tj4vsQWRZdVpRauMTTtD0eNpKLt25rLZvdrSqJJiIaF7epHmVdLu/LeNtYrswdmE8nh0bl9h468PDrSrnpZPqQqukvwymIDoE6a5hcGh6+v4aamn392apoLtSvXbrP1zzjQMgty30FN2HO+S/U2EVlMv3CZfhoRapw4VceRkHUwTWaauLS1GUjXWFdesRGux74dF2wUPnTJBo674N5HOCKGVwcJxyVxW/6OXUfnCpNbs4rEld7w7y4cyOivjRrZKlTvlRSjd3Lmo8d37+obaBTp6Km75saGFTke17Rt+esDk7tnp4ulM3rq9qqx/hEtI4ioLQFUWSjPnzEzIDObqR1YZuJYZtpxd3W7u7VYZty4zwNlnTtM+kyCv+BDQC+bt4LgREFaroGTmlQw9HTA3dquD2DxiAbNOPZt40CIZsMcCC5R1YFWeY0KWFBsGuiZztY8XXamRDshpDUjEdmxRylXGaSrEzR4Zm6S59OZc/vzEylFVsI0Fh2GLr3LYCmimdTU5LG9D6S0WC2SX0uoJO8nDC6nnFSyE0Z1gI4fmd83PDoRqQu3qWrcJbB6Fzr7vrC7vVeMB0RO8oqueS1ZuGZ43y0nS/eGQpsSI0PfGRxKJANcYnbbAKYhlpUkyEoSfNObqGLr1dKi22uEO0KteI1wR1kh5lbjqh3pYogEIkJBcFW7sVIOgcBY8UbQhB1Bk/oQkYkjcVWv/bLEIHHddMB4Qt0+MrVrz7HZm7ca8djKCE6FTqj50ela5InWy525kYmPHZrd1TfYJKEEeszblZ1JSnKcDwdo6eG9C72D9fGkOj52cN9Zz5CRS6h1fH4wmlOyCY2Po2ZpaGR+P6JO9Q5Uc0Is22aPH8Bq9FMgVy3U7VRRwlLlw4a71l7TH8STyEucfVKVLiIgk9moY7NmL/lHpqyZEl7vhr05M54uNkuYQs1NHnB4wdA04zMJu/atZddez2xY1BxpXkvviSN7sYH0MMeJcr735lTSvzXgirGBmJrkAm7Xq6+Wfug49tyB3BZDaotEwfuln3HRNMcFYrxQeO7KSccxMn85xkwz49QwtZs6SxVrodGLgVo2oC7dQvSB2aItbbZ7MKAt7SzriD2Ez9dAL67hcDSoWLXlRqxq4zBi5mDEXIOV6ibDzAcX/UmWjJp4yKyFUTOwGYRgUxKEYGewGN+yFRvGW0JPU1UN/p48vq8Wx3evkg29HGnoxW52xAXmb4NkKHIjqgyjPA33rh9g69Kk1iZBsTGEMdaZGZ346L6pyZQTRx0Y5KVpeqh3cHb34b2FyS1bmyU/4rnd43pCEcQAR9Opqekje89pehQGXjZ7QEnKMh56PMiSksxOxIUGWjk2t3t0REloyY+6RG+4mY2z9YEhTr3zyvcPmUa+IY5qo3JbZ7anaeCaQKBZyuZGjYy3hd3XoU0Mj+6aOflXN09zgaQy3Luwr29UUkJcIqkdt+XvXsDgcyB/Sermcly4Xic4mBhAqwXj8A7CmSTwga5Kp82kPRmO7R4OEyQpks9ixoJkQqMFTq2qALAgFLS8bqO8O0rZ4GGbV+FAI4rggM9GTBIJ3ot4TLjcZOHw7PDAJlUu/RDsUVSWsloygWnmfLG0r9+veLyyi40yx7uyGGecm1qZoGeNramEXBtG0bCazOb7Vp4j9h76iL5AsLgb524Qe49tPM5SIEPql5OJHRuTicGbuBenEUPTjPe/ypReAj+L/uC7pQJ6An63nmrEWTG1FKEe9l2KDUw5Y8hPfl7AKx3MWBqniuL80SYbi9bmUEWM1ubCCAIgM3Ccry4R5QN+F4NiXKBVyhijiqEKJop9i2HZmoAU3sp8/P3hfHcqmQhHGYfD9fBLL5V5egja5aNOr49LE646abL5TCXOvyE0jV0cEpeuRPsxoN9808XAhwSlv/7n/5j6PwtKAyHRSZQsnUSfL71Y+u4R54tXnkJfKk2vLKBLN5T22e0v82s1d4D593IH4BfBIdKJPJ+mKNfDoHvGqU9RxR247y0ZPPtFdBDYVNWM6VavE+dqIfN6zdxB1tMVnW4v3gtlyF6yk7HRnQyHLfCmCfgewusxkA/EuitoVuN0LasmBGdyEAA5ZfXibSN8oRovVjcUEHCUQG8RC3ltJFxblnpQO1dlfEbXhkA5xXJdBQHYeJCAySf/n0Z+J+gTgHyj4/uOPFTnikmCCnohNzlgqDCuUekSy0Y4SSxs56Ocn1k9bZZ5vqH0JuBBQ/Yq3rDqbXMd22IcPTigJYS4H0P1zNjgbjyGhjRdEeuiSUU2tJGVp1Yronybun/HynOO4R3+tNevsEKZ3swc0FunZikCiMy69dTGq8mQ2amZ7RexF1Ohc4KzeCAqXpyege9Ee4W4PCYuZYm4wuc1bFpqH0rLchilTC4CDDHM+VBy5SanDxJlUhMi2iR8na4llf5q7iqSHO8ysDIZ3XkzpkQOtImUjIZm9fzAxn7bWOZ+wDKN4EUM2fHUpdZ1WCZVtmqZ9VHVJPS1GvqMZSwplDFvCmcdUb+82Yj7l9cnk+nh9OriHAxcxkVx+/Duuc9+bm7vSUFAzeLw4Pzc2RMf3T00DChFCYV6kqrRe6uEl8H0DXz8eF8/LRzbPTc6lkgk1Afm9x45vLB7fERNoDZldHz3wpFdw4Oz4TBKaImR3o8+f8PU1HTZZyoVmHuZCSpDXUcds2f+l3rs/pa5XQX2/Rrbvqc0hPcmSpFlg88gxi2rHV0tUZI3v+RwKolNcGK2cdb2coTgevje3gZOa1WDHbLsaQABaFFBAK4JFj2sjE06FTIZWxCwFABWKQ+p2jVarXlP5B5ymy0gaB0KXLfUFbtRKMjAf5nC9KH5B1LJGI/qYik8vtTOpCYn1LALIZoGQQHEHOZjQntCBbPcUM0Z2f3JsWZwphijPs6xsi+1kNQKI4N37T1y9KP7t4+2ET8qoWos68H5pbI3W9rFvDWv5kuehcGxZiUSSmgdO0Znn5mZaupQrtlmx34LBDttorbjdUcEI2s2nYOEzkF3gFAe0xlvOTFUMc7YLuNB5c2myRoVawec8EnQS65WrQfrpbqgFWzG1NWwyDUaZk9wkRKbic6CiipbBnFoBg8ujI/W0JG9/PQqHMStoaCNkWCe33ft+KsAgmgnw6AADMHSJdrh0KdmD1ecjO8mVAU7GW2CoIKPkVBjQoB4GXvPAckI0pHFOME58++H0fNZcDACvH9/u7bqY3Adyujgb+0/rSY4LhxVM/nyvCJO2CwBDduo66liE4n/YCzDRXQd5DQEWqkea6WEZjaRoVnWSlY7Xq3ZVFZFlFUPh0Wft9Yoq6GWq9VQeX0F0CpS7nxZ+WzQPbXteO1bPhUNyCE5Pr81Z+uchFf1RjW/7No60xwPh5CL9lxiaaYw9djK247cSCBdp7Ki3R+8Fk2A/txMXaCKE1giWBs9Z7UlpextTuMY7rrMKg6p5c2/8O5e2JC/+/aF8kw2jyPVVr+fRHJ5bjHKR2pUs59b3NaPo7dQrltiDxdJ0nYkyvdv215ZpLL+bEO8lgsWWWUzJtlIyNRwyghLwrXa5hHbmc2uS8uz9Vgli5vsVHO1x++2N0ohxF23imHdXlwV/Tj8b/5I1EjG+7VNShNfyyE+dv3WXbFdymAKu/KNgpG/YXrfxMRQf75NDbznCoXTcjQzl9LDUUnOpHpTe0Yz2SFRNrK3TR3aPTWZ721vQwFZi8UbXIzL5ffGo0qiLhb3h91RX1RSMrnxsXxuUzIcDQYUOZMbiSX4GNxaF8spkWhVwMcGvQ3w0799y3huoA0vEQCnSsro5XnbD96m73NmATvuA+SIeVpVnoOm7ZzMsovnTm/Y3SSmmfxaHi1f2dcEHMUiT5ar89jVa8DZxzwIMl2LBbmqlgQbifOX1SPYxwuv7hlERnMmyP/xlPnii3GhNwTevNarjx49DY5eqfTcyosTkszQ7FOclz19hj4ObT+O50IYA2zBLRSZOCtqq4Fg3PqwXkmKLweCa8Cba1Ha8RirLWfB1ziCWD7wLgWiihvpE/Ei8VYQHBS02lUy1tYixtF1ONlW7Ph/EQZaN1qb/iA44Djisb/Qsuov2BMdP2Np2pmdKuMAGZ2ln1p5dJ2/oHXmB+htV/7bsF/z+ROsN0bTI2FODIKXccQwmrCLgfnGAt7ZB32vpd6w+WZGbLxjobBeyQKrBJhryuatnPr1/Jd/dLcdZ+HM2uXyCre1Wi8JuzL+y+e7vZe+aQ/VIGeGOSuEQy5BzorgSPTC258hoUqGW3QxXpzmSEqWlB5cFqF+XSDRbQDOMD0G1eehGZfbGwyxnnXBQl+5MlK7rnpDABDn6MGYtdeS9SIc9WNR4m9Yb4gOMizDulkv42ciL6DW0oES2OiVx4Qmw9fLxarEiNDkT/ry9K73v0rk/oP3AJ/ngX46/fv2KjurRS7j82IwJJEAFcDF5otLkq29MuUAte+dn60GqD12gNoJVPFwlu68fL7n1p88vpoe6mHBIwlYaviymVo+f+HH7y7YoQe5w0qprKnCtXoJng0tn8//4J2/IUG5UD1r1nMBU+IsMWQHqltCl89fOPDTT64Fqj0kUO0hcX8PSTD14OCx991hco+HW/R7cDppFSk5XFZe7zND3GJNqB6HqEkZJWUdKXlcnu+5t/wuErQWoT5OykZSCrg8f+H7754j96jcYqsqQ30bKdtxWaGCz0xxi5tSKs49JWUHKTVSbsZlEfpydcYCTjmF5q+rriJ5pPBYOQ3Vzj5NGkXox4YljCYGF3h3iyK0Ble14vTUInRi3W1xHNI2BRDDRppxe/xVXE0kWt8giK1t7WpHyumq4+ONm5La5o5fk4HaQpWfD4bKv9Ai27+h/6Y/skHEHVjECbTG0l0Oc9tpQSQToxLnxnlFZJmR2yG6EHuG8TAszboYD+1nXPQTKPm4n8bJqIwXqAsW417ElP659M0n6WrWxTE+huU8T5W+CcPjVEgNCf5kNCzV5EMxL3105ZTOig1cSyjJ+4WQWE8fff+r9P3MgCKNh9vC0pi4sp+y81rA1zLAr18qx0tZD45u0782uo03jl0X1NZf/YdDZLS4cJCOs9xxO9XDGb98/u8a/+H06rZNaLkc1v7bb/2DHSImgWvL7WLt4LVFIxZ+YRFRzhp1XST7aUQSEDbm+4L/HyOzAD6g42dKp5H25g9QCr7vLb10pURrtLf0MNq98ouVl9Dp0hHbTnKAh+ehzzlKpoptVHn3DcqeB8UJ5XiqkLKoNJiToFFOWECNtM0/QAmdZB0jsLEHZYCP69dlZBqRvgpEehGHEk84vCGGdTm9XtoPQuZiAnTQy3lo7yOg2yYTrWqHbvSOxfNSJyt4QoJWL0WFUIgPMUbJ5a/r9kfDnCy6gHg1DMMFuv1ZeaAeLAkqvf/Z3QPDqhaOgiX9KqBC1huJNQiGRvo4SFGOr0IfPdT4+jg4diNpJ5XG8G5dKLzxf+kbQuENv1kofJBuKFU5Eitv0iNfpb/wja+tzLyI3y2WCvRPnS8CfcGr24Tjxwkbh1ThaWh75hng26aqqkpkmWTx6xdNNr0k23CzJl2UydIaWQUoEkgXdRmf6RiKAHcsWSdhS+BSAnt1um3jycYHXMjyhImtz9hjLRMEBJhDEXDOIsFySurqZhYYDZBrNlqszJOIhpLIV3NjE6df2Do9wQWE+Igqq8loPMAllJmtLwx8TJbAyOMLSRU99QLj9XepyTwauW907Mv77ii9kkqCK7IJhnNdLCa3JDeXXpnP6BeSspTLDKGRfFKNxfx+Wx4fKhnoUTI31Uytn5bCoWKgRfmrsgcboJWHkKtkuB/4xV328yrQuwTPd2N6d6+L1+MZw6WYTW+1vbsB6K2W6Z3H0Uczkl7qtGP2YrrYyWAKdwK9i0wnPmS6gfSxNNkArZMBevuB3iqei3V2Ap3bg1aV396AMiJiekfxrjtBO7K0tpsIpijZEKpMbPIXWZ2atfmhItWYHQv6xeiNsirLDQJALCUxY7xwemKMC4hCQjEyKkFekWizfLD/hUt796Gk1iG2xVMs44GBKSnJFErOd2a+PDZ6X+mZfDIRj/m9zAsk4JLMl54ZwpvlJjG9JsBXmnUMgz/8+5Qpky0GFjmnzKpWHPtwSQ2v7sLj4q1LX/mRrbdEzhSWLU/LZTOwvOj1BHDmGC6LcLzOHgGBnvZ4/QFBrDg168/svF05DgSMUIZhOTnsF66KKnFQBLSWDh25asFXZT57Ir91+LpEIpYZVxQjkVcGB/IZoTERibcmhbHtqT3DqSzIWTIcF2pp4VU1FHUxVXWBqpAvwEc3fbu2OuxmGSYSEHmPH7lYjzdUlkP9g+8xONfJwNnMHpyHoWvmZn1JsucKdBIF0tNYKLSKu+hLI3Pr+vmoNJAOhnHKXk7vTeNIpQJ14TTZuqQmbeXwtjVpvE2JhEF6TMLOXE1YabtqO5qNOya3rjlsGwK1eNvkVgLSdUHM5iYn9j86dc1gVpdEf+kHLjEea5FSRwd6tw0cuXlrrhrFWDGeTY0PzT16oDCZy26lnzo0u3tgsD1R9eyzrChoyb7cUEAZqYtygZnpx5+amc5m9/h7B3NbUrLo//Lf+FV1sJfk4oDdnHV+juqnfo8qZrF+TYB+9eHNfOoqCi7rq1LNOHG7cI6GkF4MZ30sDL4BYlB7+tLppbit7vBG2zTZaFuA4UfH8SGNtwbLpkk2fpwmW1BTViILB1vI5EGHBjJUFy4vYd4YhFt1dAnR4qCr1zYNIWnh0fL6f7GyaV0ehRfreD07OnFgrnc0gfeyugTOaf+MkkCNpe9XeevCrTEdHZvv0msu+QUhpR+fWRnlss21cdZPzzzxixl7A6gI3yQZ+pA2Dl+5T3zviemclkhIQrQhlZpVRnsHNutbX2QTfEtKTA3M2HJH/B+yBua/UsUA9v0Ykl/s0PUlLhhgyAJ1bDcCROBA9EhdRMdCGCDGgjhJgYtmKG1Vuch+hlUBsh+gz0N2ww+QjQIDnIcIYtl3MupfryNmz9FhOjtIwMKDtzQBN8BzmQJjiFfOMM4NnguON2Bikj+8KjMLH5xCG0A1qKn0AAqX/gpdX/qr0jslE43TpadQxE5SW0nd9+j9b711/6P3kfXg4gfvOL8K8pOgRqg/AD1UFLC/nib9scWo1842OnlQADFaOmmf3TBHzm4opyCdJWai3R5r7Zx1LVKX7rLP7uLw/iF4YQHexOIzIENb7gqGnk75ej/yiZNk84i5g8FQn6c9u+Xaj1AzRz+xPi9ggxSF1zZ9aF03q1JW5U3kdu5DNojo3LjRMJHGjQu0N65xjZKtI1a1nVgX1bWTE9MTM7ef++TpW/dmDBSDmv7eG6Yn5p69fWJ6fFu+U4/WfWyzPj5x9z7k3nfwEV3TUhPjB/ednBgf2zaUMdqU2sg/1PKp7ODo3M6tekqNCdxDbCgU4Rt5LaMpYCL8dfG4mjBUIV7Pc2H3f63tale3Zid2TwxndL6Wfn5uBppwUtOj/Nbc7N5PnrlvBl490d+7WY/GUH1U7+jPTU1P3DJ38s6D4xMpTdMfOYjbsn9iXNei0dZExhgYHLumMD+0szPHx1GIk4RESkmEYzwXqvKGuTZJT/Xm71DkaNjvj0brRE5TC6IUDjfFu43Rof+7PVqZDXI2Te2hXv/VkjY1Q2Rryr4yNYNHzNS1gLcKN4Gi2rmHXN1Zlry5D5G8afvsI2lzmrNuhYrr7YrrN4hi+V8D+PpPX3uODL6pDrMAsHOKs25kAXYWOOsmFu/4dyMMvxsLN01VdvybvhY0Xcowbw0W070+MqM/hRF61jBnglY7Xly9B6vG/1QhRmRtDQkF1EgOiUdkY0HAM/9Z0ok2o2vOjY2ilD7y6tcWP37vYP/I9lP/WVJXCjigRR+7dWuOB21klL6Kzg/lsj1kryTmEbpQyVGkrs5RZGyJcoPWYHAo3kF2oAJfJ4IKJUSXnmAeaUSCWnr7/3oP4f9Xz+bRBUanz9q5ndB/RJyi8te63E78WN7xc3ThG98gfaXQBZb6DZ4LwnMsVX4M75Xs6EVPgY0L4zU0GFvZyYBhoH9522eAUHheL4y9a30pZA8WvNtziCLLOUhjKuBIL8tnRA+exXs8B/nwM9EGPsT5vMcdvc+nRnKJrJCMx5NtbeLmpFx6f2MbrqGKXjzyPeT163YpIy3xkg2ofWRLMrJB2S9tQO37dRtQh+ymIMHlCoY4Lu7oVYW2NjmpSYh5frAr1ZkVxASOTZ1z9DrmSZsS1EwZdTbqhDimopfpA34KMtsrJAJQWSYPnseM4Fgvhp7pJcWmmbpGM0uJkKjUh9LOrQf1D6s853JxUS8fflYMczzeV+j4Z6EmFAzFn1mtARoPZlP6QDgZV6RYxqYxqcoKkrJWRW3so4zz/DDlzZheJr7JpzfsEgc9bV23B/gG2uN/4qYe4ZtwBpMZ55Z4+xKvkU3DyrvFWXG8NFD+lbvG6Vfz65yINwlnoV+okWwhx8V/nlWUtTPMvlgmKWP2LafIbnJiYrAwNbru1JbzAXSMPuv4OsVTHZRZQ9wEN6OWv5BZT9RLtYtU2l848Ye6KpGqEYUDdBkHDNTWtql61gAIriqp1Ni+o7oht9XW0o/ltnS2qeFoNKwqdx7dN5biYy1tnVvs/Xa+R1FunuxN7qZ8OI+dzIEwLEBKe2Nyy+lJp+19AD3lncr96+MLOHfFDYdusl0FHg0fslfF95CADqAGdKe9l3nlA7/q/eAtZhzs7gTOaR/B786DfxDBuFZ0XgLnYCQCEFZfdQ4y6aUqP6lr13HYBte1pcm6XOdFKzCRTluboQltXXAwSWan8uBB9Q+ACyBWwVFDnLiRWR0ncnYCmpeyeteGHE/nui23RLcYdsVpHO5wi/ZSxeyHZb8qXmWMpg8pUwFF6Rn8i6PzD4AfJPlLb3oTyeHkWH0sFPCh4XjpZZpGk0LpZVc8Ht3UtnVYTbIo6pWkVH544s5j0zP5QUHyo9KDdJVLaHZ5HI4Hj+yZyw8OdKXU4cFruNHWRJMkZxK3PcgEXQ0xl9/94PC+pBzjkaaNB0euGVOzAJ1a23aMTc8v2LkDx4CxDFmTmEOv2GPKQrVAz01E0opOtg7/G1NEy7nsKnJsJ++TdYvdeN0i3joD/8NFH7p0EbsCwHwcAvWRJHscBcXx8KZmQER1tropbzLxwqk37E0mNgGYSS9bQRnAjHf5fO6eH95j5zo122vZIu7LljfI4uVs5Wd8ppdb9HnJLD8pq3FZeZIsR6sJRshyNBxUbeMWpbZmvHUEKWVcnn/h0Te+TG5Oc4vJ9CY8NU/KzaRM4bIIr9g4E19tFOH62oIyPA0fjGxYTVaEn8dHEt71geoL+qqqgzXhSLPcltTSUsuH7MyA+kLe8l1y26ZfdZcd4eVzQTvdkoJWWE1ZwHDeoNlpL4iISEEpiIJ6jS2/Xb10jQ41JMeyB2XsaXOX2yE57HiuEia5ucFj9KPvLdH+X5xl/UyNt8rvjYTv/dnjOG7OBlxMDeNnP3/yc6zfVe2i63Ew/ednz5a86OclL32i9Eo4xibjghDPaCi5chxNMnGvHPKn/dHWam/CK3ClZ9FwSAiIAWbIr1eFZaX0pI0LAGxvYbaAvqGwZmC2vP81/CG6yP4303A+bhu1Ce//i3NyTVkvtuM1PD6dTB20/5oUXauxVd+QpJv8DZN08TpJGWQ0YU/AqGmyd5EMXMX7Rf+G2buonLH472bx0r9j5zP+mmzeKydXEx7pDbT5L2uUwQnLZqv+H8hZTvzHyEE2H2//PyPEryXCryVAObXwgw9w/11XnC9yCjXqnKQo+L6GfgK+XYDRNl6/7pev//9WuOI7AHjaY2BkYGAAYvafukzx/DZfGeQ5GEDgpMUTfRj9//4/Sw4G1g9AdRwMTCBRACJACz0AAAB42mNgZGBgt/vny+DCwfD//v+3HAwMQBEU0AEAjacGOXjaRZG9SsNgFIZP0/zhUEQEEQsiGUU6dIhQilAcOjiENhRxcHRzqbgoIk4ldHB18AbiNbiI6CC9BwniJjiKOtTnnFQNPLznO79fvuNL+Tk3EEMud9UnGblDiWAlqEvTe5S9yqscEjsAp1oX381lQP6Yc2IayyL5PbiALjRgFbZgB3ahozFqHuBee/xRyH4wkWNm6bwMUtO+ZMQyPy7PzMm0r9rmzy23jPf/87BbxJewT7FrwVgcdAEi/G3mH+md0WXmb7jD6Ru23k/r9P8TNFXFH5ldyCU1MH3GbzbvM7L8wvJV02rd6rvWu5Bz7NCPp19oDeZdkW1y1pyWXKPrzO/p2xNrgr5j6L0Q521nOnA+RLx39jPTyiecsLjvGbecG2jfdpj8Qq92KLZb3dGY2VeKM5EO/kJrtA95c5zP3E3swv434s0iiX4AL1h1AgAAAHjaY2CAAxuGCsYQphnM51jZWNVYc1g3sd5ik2FLYKtjW8R2jT2CfRWHH8cvzgYuKa5d3EI8YjxXeJl4Y3iX8B7j4+PbJeAnKCI4T0hOKE9oldAD4TrhbcJXRDREukQ2iCmI1YkziYeI/5OokSySXCT5RapI+oNMicwJWRZZM9ks2UWy7+S45PTkWeRXKcgpHFD0Utyi1KX0R1lDuUT5ivInlVWqaqrz1ILUvqjHaLhpLNFU0jyknaB9S8dHp0tXSddJ95ZeGhD+0V9kIGNoZBhgFGPUhAMuMNpndMfoh7GIcZjxAhMhkw6TM6Y8YLjHnMVcyHyBhYKFgYUDAK/oTjQAAQAAAIkAuAAFAFIABAACAAEAAgAWAAABAAKIAAMAAXjahZAxTsNAEEWfSUDQpEYp0FaIBgtoqAkRNHRB6W1iQqTICbFDFCpOQolEzyE4BMfgAPwdr42QkKLV7PyZ+X9md4Bd7mkRtfeAF1mFIw4UVXhLnNeAW3R4C7jNER8Bb7PPV8A7HPId8Cd51KXPhLGslD2TMcLJEsWJ0LvsjBOdc6ELCu7EycXIWChzyUx+bndiPWaqxsad6jjlff8H1QqLMnmvfbJZMTeqp5b51TsGinIxe4qn4q3ESLUNXy03aFyjGhqnaBinmuf/8p++Vh836lu9emL96rlO70gsM7Yt1B2qraWsdZdSZfJXjWbAI0t1Wtjv/U6u/6j97uIfjZJPTwAAeNptzsdOQmEQhuF3AEFpigpYY+/tnAMI2EHB3nuXxMZGEw13oDG2rTfhznopXo6K/Eu/ZPJkZjH5MPGX7xa++C+3vyOYMGMhDys28inAjgMnLtwUUoSHYkooxYsPP2WUU0ElVVSLiRpqqaOeBhppopkWWmmjnQ466aKbHjR0DAIECdFLmAhR+uhngEGGGGaEGHFGGSNBknEmmGSKaWaYZY55FlhkiWVWWGWNdTbYZIttdthlj30OSImZK6554l4s3PEoeWIVm+RLgdjFIU5xiVsKpUg8UswLr3zwyRvv3PAsJVIqXh7EJ34pk3KpsGXO0lognPhTi2nKsayGpmlKXWkoA8qgMqTsVYaVEWVUGcupq7+6bj9On2Qujg5Tl6e5k5HMGUpaEpmL8+ySUD2S8VyPXw1lQBn8Adr2VtMAAAC4Af+FsAGNAEuwCFBYsQEBjlmxRgYrWCGwEFlLsBRSWCGwgFkdsAYrXFgAsAUgRbADK0QBsAYgRbADK0RZsBQr);\n    font-weight: bold;\n    font-style: normal;\n}\n</style>\n<style type=\"text/css\" media=\"screen,print\">\n/* widgets.css */\n\n/*----------------------------------------------------------------------------*/\n/* Scrollbar (Webkit)                                                        */\n/*----------------------------------------------------------------------------*/\n\n::-webkit-scrollbar\n{\n  width: 11px;\n  height: 11px;\n}\n\n::-webkit-scrollbar-track:horizontal\n{\n  background-color: #eee;\n}\n\n::-webkit-scrollbar-thumb:horizontal\n{\n  background-color: #bbb;\n}\n\n::-webkit-scrollbar-track:vertical\n{\n    background-color: #eee;\n}\n\n::-webkit-scrollbar-thumb:vertical\n{\n  background-color: #bbb;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Right bar                                                                  */\n/*----------------------------------------------------------------------------*/\n\ndiv#rightBar\n{\n  display:none;\n  background-color: #d5efd5;\n  height: 454px;\n  width: 300px;\n  float: right;\n  position: fixed;\n  top: 85px;\n  right: 10px;\n  border: 1px solid #a4d2a3;\n  padding-left: 15px;\n  padding-right: 15px;\n  padding-top: 9px;\n  padding-bottom: 9px;\n  overflow: auto;\n  box-shadow: #ccc 0 1px 1px 0;\n}\n\n#hideRightBar\n{\n  position: relative;\n  left: 0px;\n  top: 0px;\n}\n\n#rightBar h3\n{\n  font-weight: lighter;\n  margin-top: 6px;\n  font-size: 13pt;\n  color: #606060;\n}\n\n#rightBar p\n{\n  font-size: 9pt;\n}\n\n#rightBar ul,ol\n{\n  font-size: 9pt;\n  padding-left: 14px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Details area                                                              */\n/*----------------------------------------------------------------------------*/\n\n#detailsData\n{\n  vertical-align: top;\n  width: 0;\n  padding-left: 15px;\n}\n\n#detailsArea\n{\n  display: none;\n  border: 1px solid #ddd;\n  position: fixed;\n  top: 150px;\n  width: 233px;\n  margin-right: 20px;\n  padding: 15px;\n  overflow: auto;\n  color: #222;\n  box-shadow: #f2f2f2 0 1px 1px 0;\n}\n\n#detailsArea label\n{\n  font-weight: bold;\n  font-size: 13px;\n}\n\n#hideDetailsArea\n{\n  float: right;\n}\n\n#warningArea\n{\n  display: none;\n  border: 1px solid #9d0000;\n  background-color: #f48d8d;\n  position: fixed;\n  top: 150px;\n  width: 233px;\n  padding: 15px;\n  overflow: auto;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Help page                                                                  */\n/*----------------------------------------------------------------------------*/\n\ndiv#helpMenu\n{\n  width: 260px;\n  margin-right: 15px;\n}\n\ndiv#helpMenu ul\n{\n  list-style-type: none;\n  font-size: 9pt;\n}\n\ndiv#helpMenu a\n{\n  text-decoration: none;\n}\n\ndiv#helpMenu h6\n{\n  cursor: pointer;\n  padding: 3px 0px 4px 25px;\n}\n\ndiv#helpContent\n{\n  margin-top: 1px;\n  margin-right: 15px;\n  border: 1px solid #c0c0c0;\n  padding: 10px 20px 20px 20px;\n  border-radius: 3px;\n}\n\ndiv#helpContent ul, ol\n{\n  padding-left: 15px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Thingy                                                                     */\n/*----------------------------------------------------------------------------*/\n\ndiv.thingy\n{\n  clear: both;\n}\n\n.leftBarIcon\n{\n  height: 16px;\n  width: 16px;\n  color: #666;\n  font-size: 10pt;\n}\n\n#showLeftBar\n{\n  display: none;\n  position: absolute;\n  left: 22px;\n  top: 50px;\n  font-weight: bold;\n  font-size: 9pt;\n  cursor: pointer;\n}\n\n#hideLeftBar\n{\n  position: absolute;\n  right: 2px;\n  font-weight: bold;\n  font-size: 9pt;\n  cursor: pointer;\n}\n\n#mainMenuIcon\n{\n  float:right;\n  cursor: pointer;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Organisation Unit Web Tree                                                 */\n/*----------------------------------------------------------------------------*/\n\ndiv#orgUnitTree\n{\n  font-size: 9pt;\n  padding-top: 4px;\n}\n\ndiv#orgUnitTree\n{\n  font-size: 9pt;\n  background-color: white;\n  overflow: auto;\n  width: 235px;\n  height: 300px;\n  border-top: 1px solid #e3e3e3;\n  border-bottom: 1px solid #e3e3e3;\n}\n\ndiv#orgUnitTree ul\n{\n  margin: 0;\n  padding: 0;\n}\n\ndiv#orgUnitTree ul li:last-child\n{\n  background-position: 0pt -1766px;\n}\n\ndiv#orgUnitTree li\n{\n  list-style-type: none;\n  white-space: nowrap;\n  margin-top: 0;\n  padding: 0 0 1px 15px;\n  background-color: transparent;\n  background-image: url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAbwCAYAAABqZ9HZAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyppVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuNi1jMTMyIDc5LjE1OTI4NCwgMjAxNi8wNC8xOS0xMzoxMzo0MCAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENDIDIwMTUuNSAoTWFjaW50b3NoKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo3NkY0OTA3OTg3RDIxMUU2ODI1RjhFODc4REY2RjUxRSIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDo3NkY0OTA3QTg3RDIxMUU2ODI1RjhFODc4REY2RjUxRSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjc2RjQ5MDc3ODdEMjExRTY4MjVGOEU4NzhERjZGNTFFIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjc2RjQ5MDc4ODdEMjExRTY4MjVGOEU4NzhERjZGNTFFIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+S1rIZwAAAbtJREFUeNrs0rENACAMA8HA/o0nhg1IQQW6by1d5VmHkqxqmnUZ4Atg3B6pPBEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC8BIzTmGR1wBZgANT4GKXHs9KrAAAAAElFTkSuQmCC');\n  background-repeat: no-repeat;\n  background-attachment: scroll;\n  background-position: 0pt 0pt;\n}\n\ndiv#orgUnitTree span.toggle\n{\n  margin-left: -12px;\n  cursor: pointer;\n}\n\ndiv#orgUnitTree a\n{\n  display: inline;\n  border: 0;\n  padding: 0;\n  color: #000;\n  text-decoration: none;\n  cursor: pointer;\n}\n\ndiv#orgUnitTree a:hover\n{\n  color: #555;\n  background-color: #fff;\n}\n\ndiv#orgUnitTree a.selected\n{\n  color: orange !important;\n  font-weight: bold;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Organisation Unit Selection Tree                                           */\n/*----------------------------------------------------------------------------*/\n\ndiv#selectionTree\n{\n  font-size: 9pt; /* Size to change */\n  background-color: white;\n  height: 300px;\n  width: 493px;\n  overflow: auto;\n  border: 1px solid #ccc;\n  padding: 4px 0 0 5px;\n}\n\ndiv#selectionTree ul\n{\n  margin: 0em 0em 0em 1.5em;\n}\n\ndiv#selectionTree>ul\n{\n  margin-left: 0em;\n}\n\ndiv#selectionTree li\n{\n  list-style-type: none;\n  white-space: nowrap; /* Makes list items never wrap */\n}\n\ndiv#selectionTree span.toggle\n{\n  font-family: courier new, monospace;\n  font-size: 9pt; /* Size to change */\n  cursor: pointer;\n}\n\ndiv#selectionTree a\n{\n  color: black;\n  text-decoration: none;\n  cursor: pointer;\n}\n\ndiv#selectionTree a:hover\n{\n  color: #808080;\n}\n\ndiv#selectionTree a.selected\n{\n    color: orange !important;\n    font-weight: bold;\n}\n\ndiv#selectionTree a.locked\n{\n  color: green;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Message field                                                              */\n/*----------------------------------------------------------------------------*/\n\n#message\n{\n  display: none;\n  padding: 1em;\n  margin: 1em 0;\n  background-color: #f8eab0;\n  border: 1px solid #dbae56;\n  width: 480px;\n  border-radius: 3px;\n}\n\n#info\n{\n  display: block;\n  padding: 1em;\n  margin: 1em 0;\n  background-color: #baffbc;\n  border: 1px solid #12cd17;\n  width: 480px;\n  border-radius: 3px;\n}\n\n#headerMessage\n{\n  top: 3px;\n  left: 155px;\n  position: fixed;\n  display: none;\n  padding: 10px;\n  padding-bottom: 9px;\n  width: 410px;\n  background-color: #f8eab0;\n  border: 1px solid #dbae56;\n  z-index: 1200;\n  font-size: 9pt;\n  text-align: center;\n  border-radius: 3px;\n}\n\ntable.notificationTable\n{\n  background-color: #f9edbe;\n  border: 1px solid #dbae56;\n  padding: 6px;\n  border-radius: 3px;\n}\n\ntable.notificationTable td\n{\n  padding: 3px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Sorting                                                                    */\n/*----------------------------------------------------------------------------*/\n\ntable thead tr .header\n{\n  background-image: url('images/bg.gif');\n}\n\ntable thead tr .headerSortUp\n{\n  background-image: url('images/asc.gif');\n}\n\ntable thead tr .headerSortDown\n{\n  background-image: url('images/desc.gif');\n}\n\ntable thead tr .headerSortUp,\ntable thead tr .headerSortDown,\ntable thead tr .header\n{\n  background-repeat:no-repeat;\n  background-position: center right;\n  cursor:pointer;\n}\n\ndiv.error\n{\n  background: url('images/error.png') no-repeat 10px 10px\n}\n\ndiv.success\n{\n  background: url('images/success.png') no-repeat 10px 10px\n}\n\ndiv.warning\n{\n  background: url('images/warning.png') no-repeat 10px 10px\n}\n\ndiv.waiting\n{\n  background: url('images/wrench.png') no-repeat 10px 10px\n}\n\ndiv.growlUI h1, div.growlUI h2\n{\n  color: white; padding: 5px 5px 5px 75px; text-align: left;font-size:medium\n}\n\ndiv.growlUI h2\n{\n  font-size: small\n}\n\n.ui-autocomplete-loading\n{\n  background: white url('images/ui-anim_basic.gif') right center no-repeat;\n}\n\nspan.error\n{\n  color: red;\n}\n\n#cluetip-inner\n{\n  font-size:10pt;\n}\n\n#cluetip-inner label\n{\n  padding-bottom:5px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Criteria                                                                   */\n/*----------------------------------------------------------------------------*/\n\ndiv.inputCriteria\n{\n  border: 1px solid #a4d2a3;\n  background-color: #d0eBd0;\n  padding-top: 10px;\n  padding-bottom: 10px;\n  padding-left: 20px;\n  margin-bottom: 15px;\n  border-radius: 3px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Data entry forms                                                           */\n/*----------------------------------------------------------------------------*/\n\n.alt\n{\n  background-color: #f3f3f3;\n  padding-right: 50px;\n}\n\n.reg\n{\n  padding-right: 50px;\n}\n\n.cent\n{\n  text-align: center;\n}\n\n.formSection\n{\n  border:1px solid #cacaca;\n  padding:10px;\n  border-radius: 3px;\n}\n\n.formInputField\n{\n  border: 1px solid #aaa;\n  padding: 4px 1px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Settings                                                                   */\n/*----------------------------------------------------------------------------*/\n\n.settingHeader\n{\n  padding: 9px 0 6px 0;\n  font-size: 12pt;\n  color: #373737;\n}\n\n.settingLabel\n{\n  padding: 2px 0;\n  font-size: 10pt;\n  color: #222;\n}\n\n.setting\n{\n  padding: 2px 0;\n  font-size: 10pt;\n  margin-bottom: 15px;\n  color: #222;\n}\n\n.setting input[type=text],\n.setting input[type=password],\n.inputForm input[type=text],\n.inputForm input[type=password],\n.setting textarea,\n.inputForm textarea\n{\n  width: 25em;\n  border: 1px solid #aaa;\n  box-shadow: inset 0 1px 1px rgba(0, 0, 0, 0.075);\n  border-radius: 3px;\n  padding: 6px 5px;\n  margin: 2px 0;\n  color: #222;\n}\n\n.setting select,\n.inputForm select\n{\n  width: 26em;\n  padding: 6px 1px;\n  margin: 2px 0;\n  border: 1px solid #aaa;\n  border-radius: 3px;\n  background-color: #fff;\n  box-shadow: inset 0 1px 1px rgba(0, 0, 0, 0.075);\n  color: #222;\n}\n\n.setting textarea,\n.inputForm textarea\n{\n  height: 8em;\n}\n\n.inputForm label\n{\n  color: #222;\n}\n\n.settingIndent\n{\n  margin-left: 12px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Paging                                                                     */\n/*----------------------------------------------------------------------------*/\n\n.paging-container\n{\n  text-align: right;\n}\n\ndiv.paging\n{\n  width:300px;\n  float:right;\n  margin-right:5em;\n  text-align: center;\n  height:16px;\n}\n\ndiv.paging span, div.paging a\n{\n    font-weight: bold;\n  padding: 0 5px;\n  font-size: 12px;\n}\n\ndiv.paging a\n{\n  text-decoration: none;\n  color: #FF9900;\n}\n\ndiv.paging a:hover\n{\n  color: #000;\n}\n\ndiv.paging span.page\n{\n  color:#000;\n}\n\ndiv.paging span.seperator\n{\n  display:none;\n}\n\nul.pageSizeSelection\n{\n  list-style:none;\n  float:left;\n  width: 300px;\n  margin: 0;\n  padding: 0;\n}\n\nul.pageSizeSelection span\n{\n  width: 100px; display: block; float :left;\n}\n\nul.pageSizeSelection input\n{\n  text-align: right;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Custom forms dynamic style                                                 */\n/*----------------------------------------------------------------------------*/\n\n.cde table\n{\n  border-collapse: collapse;\n}\n\n.cde-greyfield\n{\n  background-color: #e0e0e0;\n}\n\n.cde-NORMAL td, .cde-NORMAL th\n{\n  padding: 12px;\n  border: 1px solid #c0c0c0;\n}\n\n.cde-COMFORTABLE td, .cde-COMFORTABLE th\n{\n  padding: 18px;\n  border: 1px solid #c0c0c0;\n}\n\n.cde-COMPACT td, .cde-COMPACT th\n{\n  padding: 5px;\n  border: 1px solid #c0c0c0;\n}\n\n.cde-NONE\n{\n}\n\n.dashboardMenuFlag\n{\n  margin-top: 16px;\n  margin-left: 16px;\n  border: 1px solid #D0D0D0;\n  border-radius: 2px; cursor: pointer;\n  max-width: 160px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Buttons                                                                    */\n/*----------------------------------------------------------------------------*/\n\n.greyButtonLink\n{\n  padding: 6px 12px;\n  height: 25px;\n  border: 1px solid #bbb;\n  border-radius: 3px;\n  margin-right: 4px;\n  font-weight: bold;\n  font-size: 13px;\n  background-color: #f3f3f3;\n  color: #606060 !important;\n  text-decoration: none !important;\n}\n\n.greyButtonLink:hover\n{\n  text-decoration: none;\n  background-color: #f8f8f8;\n}\n\n.blueButtonLink\n{\n  padding: 6px 12px;\n  height: 25px;\n  border: 1px solid #3281D1;\n  border-radius: 3px;\n  margin-right: 4px;\n  font-weight: bold;\n  font-size: 13px;\n  background-color: #3581CE;\n  color: #fff !important;\n  text-decoration: none !important;\n}\n\n.blueButtonLink:hover\n{\n  text-decoration: none;\n  background-color: #3176BD;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Multi select/checkbox combo button                                         */\n/*----------------------------------------------------------------------------*/\n\n.multiSelectButton\n{\n    padding: 6px 12px;\n    height: 25px;\n    border: 1px solid #bbb;\n    border-radius: 3px;\n    margin-right: 4px;\n    font-weight: bold;\n    font-size: 13px;\n    background-color: #f3f3f3;\n    color: #606060 !important;\n    text-decoration: none !important;\n}\n\n.multiSelectButton:hover\n{\n    text-decoration: none;\n    background-color: #f8f8f8;\n}\n\n.multiSelectButton .downArrow\n{\n    border: thick;\n    border-color: #777777 transparent white;\n    border-style: solid dashed dashed;\n    margin-left: 5px;\n    position: relative;\n    top: 10px;\n}\n\n.multiSelectButton .downArrow:hover\n{\n    border-color: #999999 transparent white;\n}\n\n.multiSelectButton.disabled .downArrow\n{\n    border-color: #e2e2e2 transparent white;\n}\n\n.multiSelectButton input[type='checkbox']\n{\n    margin: 0;\n}\n\n.multiSelectMenu\n{\n    position: absolute;\n    margin-top: -15px;\n    z-index: 999;\n    padding: 1px 1px;\n    border: 1px solid #bbb;\n    border-radius: 3px;\n    margin-right: 4px;\n    font-weight: bold;\n    font-size: 13px;\n    background-color: #f3f3f3;\n    color: #606060 !important;\n    text-decoration: none !important;\n}\n\n.multiSelectMenu li\n{\n    float: none !important;\n    display: block;\n    text-decoration: none;\n    color: #606060;\n    padding: 6px 9px;\n}\n\n.multiSelectMenu li:hover\n{\n    cursor: pointer;\n    text-decoration: none;\n    background-color: #f8f8f8;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Placeholders                                                               */\n/*----------------------------------------------------------------------------*/\n\n::-webkit-input-placeholder\n{\n  color: #777;\n}\n\ninput:-moz-placeholder\n{\n  color: #777;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Profile                                                                    */\n/*----------------------------------------------------------------------------*/\n\n#updateProfileHeader\n{\n  display: inline-block;\n  font-size: 14pt;\n  color: #606060;\n  padding: 0 0 19px 0;\n}\n\n#updateProfileLink\n{\n  position: relative;\n  top: -2px;\n  display: inline-block;\n  margin-left: 200px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* jQuery overrides                                                           */\n/*----------------------------------------------------------------------------*/\n\n.ui-widget, .ui-widget input, .ui-widget select, .ui-widget textarea, .ui-widget button\n{\n  font-family: LiberationSans, arial, sans-serif !important;\n  font-size: 9pt !important;\n}\n\n.ui-datepicker th\n{\n  font-family: LiberationSans, arial, sans-serif !important;\n  padding: 0.5em 0 !important;\n  font-size: 9pt !important;\n}\n\n.ui-widget-header, .ui-widget-header a\n{\n  font-family: LiberationSans, arial, sans-serif !important;\n  font-size: 10pt !important;\n}\n\n.ui-datepicker-header\n{\n  margin-bottom: 2px;\n}\n\n.ui-button-text\n{\n  font-family: LiberationSans, arial, sans-serif !important;\n  font-size: 9pt !important;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Messages used for sharing                                                  */\n/*----------------------------------------------------------------------------*/\n\n.message\n{\n    border: 1px solid #ddd;\n    border-radius: 3px;\n    width: 450px;\n    padding: 9px;\n    margin-bottom: 8px;\n}\n\n.message-info\n{\n    background-color: #f3f3f3;\n  color: #222;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Filter                                                                     */\n/*----------------------------------------------------------------------------*/\n\n.filterInput\n{\n  max-width: 300px;\n  min-width: 120px;\n  width: 50%;\n}\n\n.filterButton\n{\n  width: 55px;\n}\n\n/*----------------------------------------------------------------------------*/\n/* Div                                                                        */\n/*----------------------------------------------------------------------------*/\n\n.tipText\n{\n  color: #777;\n  font-weight: normal;\n}\n\n.fa-question-circle\n{\n  color: #276696;\n}\n\n.gridTable\n{\n  border-collapse: collapse;\n}\n\n.gridTable td,\n.gridTable th\n{\n  border: 1px solid #e1e1e1;\n}\n</style>\n<link href=\"data:image/gif;base64,R0lGODlhEAAQANUAACtimtvk79Pe6ubt9bfI2z1uoF2Fr097qDZpnv///4Giw/f5+y5knC9lnMbV5KS81H2fwVB+rE98q7zN3zBmnFqFsTlsoViDr2aOtuju9oyqyL3O4JeyzWOJr26UusvY5srY5kZ2p7jL3VR+qUR0pi1jm6O708HR4dfh7OTs9N/n8DFmne7z92qOszZqn+3y+bnJ3Nrj7fD0+Dxuovr7/UVzo4qox0h4qDdroOzx9uzy+QAAAAAAAAAAAAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo5RjRFNzY3NDhGMDIxMUU2QkU5M0M1RTU4QTU0QjE4MSIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDo5RjRFNzY3NThGMDIxMUU2QkU5M0M1RTU4QTU0QjE4MSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjlGNEU3NjcyOEYwMjExRTZCRTkzQzVFNThBNTRCMTgxIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjlGNEU3NjczOEYwMjExRTZCRTkzQzVFNThBNTRCMTgxIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAABAAEAAABn3AV2BILBYzg9ZhyWwuR7CBAUCtUqpUBEFalWxYiRynlN1OAY2Yygb5JDRlLnXWoJISp/gZC4gkHnp8AAwOCzeBWAwiNB5VWnJUKxMLGFiPezggMhV8l1QWKAkmCqQKLgCeABcJrK0JIahmgoKPHQW3uLm3NQQ6Ar/AwcEpQQA7\" rel=\"shortcut icon\">\n<script src=\"https://ajax.googleapis.com/ajax/libs/jquery/1.8.2/jquery.min.js\"></script>\n<script src=\"https://ajax.googleapis.com/ajax/libs/jqueryui/1.10.4/jquery-ui.min.js\"></script>\n<script original=\"mock-de.js\">\n/* mock-de.js */\n/**\n * DHIS2 MOCK DE EVENT RUNNER\n * Tries to emulate some of the DHIS2 data element events\n */\n\n\n/*\ndhis2.de.event.formLoaded       Triggered after the data entry form is rendered, but before data values are set in entry fields.  Event | Data set ID\ndhis2.de.event.formReady        Triggered when the data entry form is completely rendered and loaded with all elements. Event | Data set ID\ndhis2.de.event.dataValuesLoaded Triggered after data values are set in entry fields.  Event | Data set ID\ndhis2.de.event.dataValueSaved   Triggered when a data value is saved successfully.  Event | Data set ID | Data value object\n-dhis2.de.event.completed       Triggered when a data set is successfully marked as complete. Event | Data set ID | Complete registration object\n-dhis2.de.event.uncompleted     Triggered when a data set is successfully marked as incomplete. Event | Data set ID\n-dhis2.de.event.validationSuccess Triggered when validation is done and there were no violations. Event | Data set ID\n-dhis2.de.event.validationError Triggered when validation is done and there were one or more violations.  Event | Data set ID\n-dhis2.ou.event.orgUnitSelected Triggered when one or more organisation units are selected in the org unit web tree.  Event | Org unit IDs | Org unit names | Sub org unit IDs\n\n//EXAMPLES\n  dhis2.util.on( 'dhis2.de.event.formReady', function( event, ds ) {\n      console.log( 'The form with id: ' + ds + ' is loaded!' );\n  } );\n  dhis2.util.on( dhis2.de.event.dataValueSaved, function( event, ds, dv ) {\n    console.log(ds,dv);\n  } );\n*/\n\n\nvar dhis2 = dhis2 || {de:{},util:{}};\n\n//from form.js\ndhis2.de.event={\n  formLoaded        : \"dhis2.de.event.formLoaded\",\n  dataValuesLoaded  : \"dhis2.de.event.dataValuesLoaded\",\n  formReady         : \"dhis2.de.event.formReady\",\n  dataValueSaved    : \"dhis2.de.event.dataValueSaved\",\n  completed         : \"dhis2.de.event.completed\",\n  uncompleted       : \"dhis2.de.event.uncompleted\",\n  validationSucces  : \"dhis2.de.event.validationSuccess\",\n  validationError   : \"dhis2.de.event.validationError\"\n};\n//mock the event handler from util.js\ndhis2.util.on = function( event, fn ) {\n    $( document ).off( event ).on( event, fn );\n};\n\nvar mockForm,inputs;\n\n$( document ).ready(function() {\n    //get the top of the form section\n    mockForm = $(\".cde\");\n    //clear the existing fields\n    inputs = mockForm.find(\"input\");\n    inputs.each(function(k,v){\n      if (v.value.indexOf('[')===0){\n        v.value=\"\";\n      }\n    });\n\n    dhis2.de.currentOrganisationUnitId =\n      (typeof $(\"a.selected\").attr(\"href\").split('\"')[1] !== \"undefined\")? $(\"a.selected\").attr(\"href\").split('\"')[1]:'unknown6666';\n\n\n  $(\".PEPFAR_Form_EntryField\").find(\":input\").addClass(\"entryfield\");\n  $(\".PEPFAR_Form_OptionSet\").find(\":input\").addClass(\"entryoptionset\");\n  $(\".PEPFAR_Form_Narrative\").find(\":input\").addClass(\"entryarea\");\n\n    //doc is ready so form is ready\n    console.log(\"dhis2.de.event.formLoaded\");\n    $( document ).trigger( dhis2.de.event.formLoaded, 'curDataStId' );\n    console.log(\"dhis2.de.event.dataValuesLoaded\");\n    $( document ).trigger( dhis2.de.event.dataValuesLoaded, 'curDataStId' );\n    console.log(\"dhis2.de.event.formReady\");\n    $( document ).trigger( dhis2.de.event.formReady, 'curDataStId' );\n\n    //mock the \"dataValueSaved\" event\n    mockForm.on(\"change\", \"input\", function(k,t) {\n      //from entry.js\n\n      console.log(\"dhis2.de.event.dataValueSaved\");\n      $( document ).trigger( dhis2.de.event.dataValueSaved,\n        [ \"saveRanDmID\", {\n                           de: $( this ).attr('id').split(\"-\")[0],\n                           value:$( this ).attr(\"value\"),\n                           co: $( this ).attr('id').split(\"-\")[1],\n                           ou: dhis2.de.currentOrganisationUnitId ,\n                           pe: \"YYYYMM\"\n                       }]\n                     );\n      if ($( this ).attr(\"value\")!==''){\n        $( this ).css( 'background-color', \"#0f0\" );\n      }\n      else{\n        $( this ).css( 'background-color', \"#fff\" );\n      }\n   });\n\n});\n\n// block some random errors\nvar organisationUnitSelected = false;\nvar selection = {};\nselection.setListenerFunction = function(d){};\nselection.findByName = function(){};\n\n//set up basic sidebar functionality, from main.js\ndhis2.leftBar = {};\ndhis2.leftBar.setLinks = function( showLeftBarLink, showExtendMenuLink ){};\ndhis2.leftBar.extend = function(){\n    $( '#leftBar, #orgUnitTree' ).show().css( \"width\", \"235px\" );\n    $( '#mainPage' ).css( \"margin-left\", \"270px\" );\n    $( '#hideMainMenuLink' ).attr( 'href', 'javascript:dhis2.leftBar.retract()' );\n};\ndhis2.leftBar.hide = function(){\n    $( '#leftBar' ).hide();\n    $( '#showLeftBar' ).show();\n    $( '#mainPage' ).css( 'margin-left', '20px' );\n};\ndhis2.leftBar.resetPosition = function(){\n    $( '#leftBar' ).hide();\n    $( '#showLeftBar').hide();\n    $( '#mainPage' ).css( 'margin-left', '20px' );\n};\ndhis2.leftBar.showAnimated = function(){dhis2.leftBar.extend(); };\ndhis2.leftBar.extendAnimated = function() { dhis2.leftBar.extend(); }\ndhis2.leftBar.retract = function(){ dhis2.leftBar.hide(); };\ndhis2.leftBar.hideAnimated = function(){ dhis2.leftBar.hide(); };\ndhis2.leftBar.setMenuVisible = function(){}\ndhis2.leftBar.setMenuExtended = function(){}\ndhis2.leftBar.setMenuHidden = function(){}\ndhis2.leftBar.openHelpForm = function( id ){}\n\n\n/* Other utilities to mock the system */\n\nlet closeCurrentSelection = function(){\n  $(\"#currentSelection\").hide();\n}\n\nselection.select = function(ouID){\n  //update the OU box\n  $(\"#selectedOrganisationUnit\").val($(\"#orgUnit\"+ouID+\" >a\").text());\n  //update the currentSelection box\n  $(\"#currentOrganisationUnit\").text($(\"#orgUnit\"+ouID+\" >a\").text());\n}\n\nlet periodSelected = function(){\n  $(\"#currentPeriod\").text($( \"#selectedPeriodId option:selected\" ).text());\n}\n\nvar dataElementList = {};\nvar catOptionCombo = {};\n//dataElementListHere\n\n$(document).ready(function(){\n  //get the currently selected OU ID\n  let ouid = $(\"#orgUnitTree\").find(\"a.selected\").parent().attr(\"id\").substr(7);\n  selection.select(ouid);\n  periodSelected();\n\n  //show the DE_id and CatComboID in the #currentSelection box\n  $(\".PEPFAR_Form_EntryField\").click(function(){\n    let selectedID = $(this).find(\"input\").attr(\"id\");\n    \n    //Get DE name from array using a substring from selectedID\n    \n    //Get COC name from array using a substring from selectedID\n    \n    //format for HTML\n    // DE NAME - COC NAME <br />\n    // DE UID.COC UID\n    \n    //Populate gray box:\n    $(\"#currentDataElement\").text(dataElementList[selectedID.substr(0,selectedID.length-16)]+\" | \"+catOptionCombo[selectedID.substr(12,11)]\n    \t+\" | \"+selectedID.substr(0,selectedID.length-16)+\".\"+selectedID.substr(12,11));\n\n  });\n  $(\".PEPFAR_Form_Narrative\").click(function(){\n    let selectedID = $(this).find(\"input\").attr(\"id\");\n    $(\"#currentDataElement\").text(selectedID.substr(0,selectedID.length-4));\n  });\n\n});\n</script>\n<script>\n\tperiodSelected = function () {\n\t\tconsole.log(\"period changed\");\n\t\tconsole.log(\"dhis2.de.event.dataValuesLoaded\");\n\t\t$( document ).trigger( dhis2.de.event.dataValuesLoaded, 'curDataStId' );\n\t}\n</script>\n<style type=\"text/css\">\n/* menu.css */\n#menuLinkArea *{box-sizing:content-box;-webkit-box-sizing:content-box;-moz-box-sizing:content-box;-o-box-sizing:content-box;-m-box-sizing:content-box}#menuLinkArea{list-style-type:none;max-width:1200px;margin:0;padding:0 20px 0 0}#menuLinkArea li{float:right}#menuLinkArea .app-menu-dropdown li{float:left}input.apps-search[type=\"text\"]{border:1px solid #ccc;border-radius:3px;box-sizing:content-box;font-size:inherit;outline:none;padding:4px 1px;padding-right:5px;padding-left:5px;width:348px}.apps-search-wrap{padding-bottom:10px;position:relative;width:360px}.app-menu-dropdown .apps-search-clear{color:#404040;cursor:pointer;display:none;font-size:15px;height:15px;margin:0;padding:0;position:absolute;right:5px;top:18%;width:20px}.menuDropDownBox{list-style-type:none;padding:0;margin:10px 0}.menuDropDownBox a{border-radius:3px;cursor:pointer}.menuDropDownBox a:hover{text-decoration:none;background-color:#f5f5f7;color:#000}.menuDropDownBox li.selected a{background-color:#f5f5f7}.app-menu:after{clear:both;content:\"\"}.app-menu ul,.app-menu li{list-style:none}.app-manager-header,.app-menu{margin:0 auto;position:relative;width:535px}.app-menu li{float:left;position:relative}#menuOrderBy{float:right}.app-menu .app-menu-item,.app-menu .app-menu-placeholder{margin:10px;display:block;border:1px solid #d0d0d0;background-color:#fff;width:225px;height:56px;border-radius:5px;padding:10px}.app-menu .app-menu-item img{max-height:36px;max-width:36px;display:block;left:25px;top:29px;position:absolute}.app-menu .app-menu-item span{font-size:1.15em;padding-left:48px;display:block;padding-top:19px;color:#404040}.app-menu .app-menu-placeholder,.app-menu .app-menu-item:hover{border:1px dashed #9ec5df;background-color:#e9f5fb;text-decoration:none}.app-menu-item-description{display:none}.app-menu-item-description .fa.fa-arrows{font-size:1.3em;position:absolute;right:5px;top:5px}.app-menu li:hover a .app-menu-item-description{position:absolute;top:0;right:0;bottom:0;left:0;background:#fff;border:1px solid #b0b0b0;display:block;margin:10px;padding:10px;font-size:1em;color:#555;border-radius:5px}.app-menu li.ui-sortable-helper:hover a .app-menu-item-description{display:none}.app-menu li.ui-sortable-helper:hover a{background-color:rgba(255,255,255,0.30)}.app-menu-item .app-menu-item-description span{color:#444;display:block;font-size:1.1em;padding:0;padding-bottom:5px;margin:0}.app-menu-item .app-menu-item-description p{height:35px;margin:0;overflow:hidden;padding:0}.app-menu li:hover a .fa.fa-bookmark{display:none}.app-menu a.app-menu-item .fa.fa-bookmark{color:#276696;font-size:2em;position:absolute;right:15px;top:10px}.app-menu li + li + li + li + li + li + li + li + li + li a.app-menu-item .fa.fa-bookmark{display:none}.menu-link{color:#fff;cursor:pointer;font-size:9pt;height:44px;line-height:44px;text-align:center;width:105px}.menu-link i.fa{font-size:2em;padding-right:10px;position:relative;top:5px}a.menu-link:hover{color:#fff;text-decoration:none}.app-menu-dropdown{background-color:#fff;border:1px solid #bbb;border-radius:2px;box-shadow:rgba(0,0,0,0.24) 0 2px 8px 0;color:#000;font-size:9pt;max-height:610px;overflow-y:inherit;padding:10px;top:10px;position:relative;width:360px;z-index:100000}.app-menu-dropdown-wrap{position:absolute;left:-9999px}.app-menu-hide{display:none}.app-menu-dropdown ul{margin:0;overflow:auto}.app-menu-dropdown li{float:left}.app-menu-dropdown img{max-height:48px;max-width:48px;padding:15px 36px 5px}.app-menu-dropdown span{color:#404040;display:block;font-family:LiberationSans,arial,sans-serif;height:30px;overflow:hidden;padding-left:10px;padding-right:10px;text-align:center;width:100px}.app-menu-dropdown .caret-up-background,.app-menu-dropdown .caret-up-border{border-left:10px solid transparent;border-right:10px solid transparent;width:0;height:0;position:absolute}.app-menu-dropdown .caret-up-background{border-bottom:10px solid #fff;top:-9px}.app-menu-dropdown .caret-up-border{border-bottom:10px solid #bbb;top:-10px}.app-menu-dropdown a.app-menu-item{color:#000;display:block;height:110px;padding:0;text-decoration:none;width:120px}.app-menu-dropdown a.app-menu-item:hover span{padding-left:10px;padding-right:10px;text-align:center;width:100px}.apps-menu-bottom-button{display:table;height:34px;padding-top:8px;text-align:center;margin-top:5px;float:left}.apps-menu-bottom-button a{color:#4A89BA;border:1px solid #ccc;background-color:#f5f5f7;border-radius:5px;display:table-cell;vertical-align:middle;text-decoration:none}.apps-scroll{width:60px;margin-left:5px}.app-menu-dropdown:after{content:\" \";visibility:hidden;display:block;height:0;clear:both}.apps-menu-bottom-button a:hover{color:#fff;border:1px solid #4A89BA;background-color:#4A89BA}.apps-menu-more{width:230px}.menu-placeholder{width:100%;text-align:center;vertical-align:middle}hr.app-separator{border:none;border-top:1px solid #bbb;height:1px;position:absolute;top:484px;width:100%}.menu-drop-down-wrap{overflow:hidden;height:375px}.menu-drop-down-scroll{height:375px;overflow-y:auto;overflow-x:hidden;width:384px}#appsMenuDropDown ul.menuDropDownBox{height:330px}.caret-up-background,.caret-up-border{left:298px}.drop-down-menu-link{cursor:pointer;display:block;font-family:LiberationSans,arial,sans-serif}.show-menu{display:block}.app-menu-help{color:#444;line-height:1.75em}.app-menu-help .fa{font-size:1.2em}.app-menu-help .fa-bookmark{color:#276696;font-size:1.5em;padding-right:5px;position:relative;top:2px}.app-menu-help .fa-arrows{padding-right:4px}.app-menu-error{background:#8b0000;background:rgba(160,0,0,.70);border:1px solid #8b0000;border-radius:5px;display:block;padding:.5em 0;text-align:center;width:358px}.app-menu-error:hover{background:rgba(160,0,0,.80);cursor:pointer}.app-menu-error a{background-color:transparent;color:#fff}.app-menu-error a:hover{background-color:transparent;color:#fff;text-decoration:none}@media (max-width: 700px),(max-device-width: 700px){#headerText{display:none}}@media only screen and (min-width: 840px){.app-manager-header,.app-menu{width:808px}hr.app-separator{top:288px}}\n/* jquery.calendars.picker.css */\n.calendars{background-color:#fff;color:#000;border:1px solid #444;-moz-border-radius:.25em;-webkit-border-radius:.25em;border-radius:.25em;font-family:Arial,Helvetica,Sans-serif;font-size:90%}.calendars-rtl{direction:rtl}.calendars-popup{z-index:1000}.calendars-disable{position:absolute;z-index:100;background-color:#fff;opacity:.5;filter:alpha(opacity=50)}.calendars a{color:#fff;text-decoration:none}.calendars a.calendars-disabled{color:#888;cursor:auto}.calendars button{margin:.25em;padding:.125em 0;background-color:#fcc;border:none;-moz-border-radius:.25em;-webkit-border-radius:.25em;border-radius:.25em;font-weight:700}.calendars-nav,.calendars-ctrl{float:left;width:100%;background-color:#000;color:#fff;font-size:90%;font-weight:700}.calendars-ctrl{background-color:#600}.calendars-cmd{width:30%}.calendars-cmd:hover{background-color:#777}.calendars-ctrl .calendars-cmd:hover{background-color:#f08080}.calendars-cmd-prevJump,.calendars-cmd-nextJump{width:8%}a.calendars-cmd{height:1.5em}button.calendars-cmd{text-align:center}.calendars-cmd-prev,.calendars-cmd-prevJump,.calendars-cmd-clear{float:left;padding-left:2%}.calendars-cmd-current,.calendars-cmd-today{float:left;width:35%;text-align:center}.calendars-cmd-next,.calendars-cmd-nextJump,.calendars-cmd-close{float:right;padding-right:2%;text-align:right}.calendars-rtl .calendars-cmd-prev,.calendars-rtl .calendars-cmd-prevJump,.calendars-rtl .calendars-cmd-clear{float:right;padding-left:0;padding-right:2%;text-align:right}.calendars-rtl .calendars-cmd-current,.calendars-rtl .calendars-cmd-today{float:right}.calendars-rtl .calendars-cmd-next,.calendars-rtl .calendars-cmd-nextJump,.calendars-rtl .calendars-cmd-close{float:left;padding-left:2%;padding-right:0;text-align:left}.calendars-month-nav{float:left;background-color:#777;text-align:center}.calendars-month-nav div{float:left;width:12.5%;margin:1%;padding:1%}.calendars-month-nav span{color:#888}.calendars-month-row{clear:left}.calendars-month{float:left;width:15em;border:1px solid #444;text-align:center}.calendars-month-header,.calendars-month-header select,.calendars-month-header input{height:1.5em;background-color:#444;color:#fff;font-weight:700}.calendars-month-header select,.calendars-month-header input{height:1.4em;border:none}.calendars-month-header input{position:absolute;display:none}.calendars-month table{width:100%;border-collapse:collapse}.calendars-month thead{border-bottom:1px solid #aaa}.calendars-month th,.calendars-month td{margin:0;padding:0;font-weight:400;text-align:center}.calendars-month th{border:1px solid #777}.calendars-month th,.calendars-month th a{background-color:#777;color:#fff}.calendars-month td{background-color:#eee;border:1px solid #aaa}.calendars-month td.calendars-week{border:1px solid #777}.calendars-month td.calendars-week *{background-color:#777;color:#fff;border:none}.calendars-month a{display:block;width:100%;padding:.125em 0;background-color:#eee;color:#000;text-decoration:none}.calendars-month span{display:block;width:100%;padding:.125em 0}.calendars-month td span{color:#888}.calendars-month td .calendars-other-month{background-color:#fff}.calendars-month td .calendars-weekend{background-color:#ddd}.calendars-month td .calendars-today{background-color:#f0c0c0}.calendars-month td .calendars-highlight{background-color:#f08080}.calendars-month td .calendars-selected{background-color:#777;color:#fff}.calendars-month th.calendars-week{background-color:#777;color:#fff}.calendars-status{clear:both;background-color:#ddd;text-align:center}.calendars-clear-fix{clear:both}\n/* dhis-web-dataentry.css */\n#currentSelection{padding:6px;background-color:#eee;border:1px solid #bbb;text-align:right;position:fixed;top:55px;right:10px;filter:alpha(opacity=85);opacity:.85;border-radius:3px;z-index:5}#actions{float:right;width:160px;text-align:right}#closeCurrentSelection{float:left;cursor:pointer;margin-right:5px}#contentDiv{margin-bottom:8px}#completenessDiv{display:none;width:399px}#infoDiv{display:none;width:399px;height:20px}#completedByDiv{display:none}.currentRow{background-color:#d5ffc5;padding-right:50px}.hidden{display:none}.separator{color:#aaa;padding:0 4px}.selectionBoxRow{padding:2px 0}.selectionBoxSelect{width:401px}.selectionLabel{display:inline-block;width:130px}.formSection td{padding-right:1px;padding-left:1px;height:28px;white-space:nowrap}.formSection th{text-align:center;min-width:46px;background-color:#f3f3f3;border:1px solid #dadada;color:#444}.sectionTable{border-collapse:collapse}.sectionDescription{font-size:13px;color:#777;padding-bottom:10px}.sectionFilter{padding:5px;border:solid 1px #f0f0f0;outline:0;color:#333;height:14px}.historyHeader{color:#606060;font-size:17px;padding:5px 0}.entryfield,.entryoptionset,.entryselect,.dataelementtotal,.indicator{text-align:center;box-shadow:inset 0 1px 1px rgba(0,0,0,0.06);border:1px solid #aaa}.entryselect{padding:4px 1px}.entryarea{min-width:264px;min-height:45px;text-align:left;padding:4px;box-shadow:inset 0 1px 1px rgba(0,0,0,0.06)}.indicatorArea{margin-top:20px;padding-top:16px;border-top:1px solid #ddd}.commentlink{padding-left:3px}textarea:read-only{background-color:#eee!important}#historyTabs{padding:0;width:545px;height:345px}#historyTabs.ui-tabs.ui-widget.ui-widget-content{border-width:0}#historyTabs .ui-tabs-nav{border-width:0;border-bottom-width:1px;border-bottom-color:inherit;border-radius:0;background:transparent;padding:0}#historyTabs.ui-widget-content{background:none}#historyTabs .ui-tabs-panel. ui-widget-content{padding-top:.5em;padding-left:.5em;padding-right:.5em;border-width:0}#historyAuditTable{width:100%;border-collapse:collapse;text-align:left;background-color:#F5F5F5}#historyAuditTable tbody tr:nth-child( odd ){background-color:#EDEDED}#historyAuditTable td,#historyAuditTable th{padding-top:5px;padding-bottom:5px;padding-left:10px}#historyAuditTable td{border:1px solid #d3d3d3}#historyAuditTable th{background-color:#DFEFFC;border:1px solid #C5DBEC}#historyTabs-chart{padding-bottom:0;padding-left:0}#historyTabs-audit{height:260px;overflow:auto;padding-top:0;margin-top:20px}#historyTabs table thead th .text{position:absolute}.entryfileresource-input{display:none}.upload-field{height:28px;width:200px;border:1px solid #aaa;display:table-cell;overflow:hidden;position:relative}.upload-field-disabled{color:#aaa!important;background-color:#f3f3f3!important;border-color:#dadada!important}.upload-field-disabled a{pointer-events:none;cursor:default;opacity:.6}.upload-progress{z-index:2}.upload-progress-bar{height:100%;width:0;background-color:#ff0;position:absolute;-webkit-transition:width .5s;-moz-transition:width .5s;-o-transition:width .5s;-ms-transition:width .5s;transition:width .5s;z-index:3}.upload-progress-bar-complete{width:0;transition:width 0}.upload-progress-info{font-weight:700;left:45%;top:15%;height:100%;width:100%;position:absolute;z-index:4}.upload-fileinfo{padding:5px;position:absolute;max-width:95%;z-index:2;white-space:nowrap;left:0;right:0;margin:auto}.upload-fileinfo-size{float:right;text-align:right;padding-left:3px;overflow:hidden;text-overflow:ellipsis}.upload-fileinfo-name{overflow:hidden;text-overflow:ellipsis;float:none;width:auto}.upload-button-group{display:table-cell}.upload-button{margin:1px 2px 2px 4px;height:100%}.ui-icon[class*=\" fa-\"]{background:none repeat scroll 0 0 transparent;text-indent:0;margin-top:-.5em}.ui-button-icon-only .ui-icon[class*=\" fa-\"]{margin-left:-7px}.ui-icon.icon-large{margin-top:-.75em}#fileDeleteConfirmationDialog{display:none;font-weight:700;vertical-align:middle}#fileDeleteConfirmationDialog .fa{margin-right:5px}.confirm-dialog-content{display:inline-block;position:absolute;top:16px}\n/* style.css */\n.loginPage{background-color:#25507C}#loginField{width:342px}#loginArea{padding:30px;margin:0 5px 5px;border:1px solid #9E9E9E;border-radius:5px;background-color:#274E77;box-shadow:rgba(0,0,0,0.3) 0 1px 3px}.ea-table th,td{font-size:12px;line-height:1.2em}.ea-comment{width:588px;height:80px}.ea-disagg-th{background-color:#E6EFF5}.ea-sep-th{min-width:15px;width:15px}.alt-rec{background-color:#F1F1F1}.sub-unit{height:26px;width:130px}\n</style>\n</head>\n<body class=\"x-body x-webkit x-chrome x-reset\" id=\"ext-gen1009\">\n  <div id=\"header\">\n\t<img id=\"headerBanner\" style=\"cursor:pointer\" title=\"View home page\" src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABUAAAAZCAYAAADe1WXtAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH4AQIBhggV1z7LgAABh9JREFUSMeVlXuMVGcZxn/fOWdmztwvy+wMu1y23XJbFqFooBUpSGKENKVgpTRaqLZQCxSINdUKSlvQ2JS0qLHENpXWGGwju1l2t2BjGgXZFVhmN7vlIiDKtot7gb3N7cycmXPm8w9Y6MUm+vzzve/7fe+TL+/zJC98Ag/cv+Jj+YmVX61NzJzwXqI6bJ6ae0fd8W+sjIzdSSmJhSN8JubMrEVKeavQ1qO8t3NHVaIqeLQjrsqOCk12lCFP3XnbW82vvRp57Fvfdo493fnc8x/jUgA2b9hI59kzCCFY9KV71Df3vTG1udCzyXmt76ASDC30L11BaM0G9FlzUPquPBSMx99ZumzZxqaDTbd7XLq247ln2ff667dYn1j/+M34yQ0bAk1NTd9pO9nW3d3bK89uXS8v//TH0rQsWZJSZoaH5Pv3zJH9hw7Kzs5O2drS+u/mpubHt2zaGAJ4c98bAKiJjnYAtmx6MvzAqgd3xsfHd/m8vlBuaJCR06dJh+J84Axzrvsa3Rkb26OTT6cZ0Jy4dZff7/ffN72mJuh26m3bd/zI+MWenyMAZlRXa3t+9cpLFZUVWwpmHpfuIZOD/vMfcDVnkda99GYsNAdMc4wS1ixi1VMomDnsYpGKykr6B/p/vWTJkqeAnCqlJBAMPThjZs3uocFr6B4fRsnHYFYh6/JiKTZekoS1PDGXiculYTscpJIpnC6dUChIanSUcCRSs3z58pH9+/efFFUTJ7r/UF9/3uNxT8pmcuTVMP3DRcj3UypmkCUbFQsQSAnyE67x+YNEx4XBKuIL+E/UH6h7RH3xxd0ra2tnrevr60UPltN6dggXaVy6G8XOYuHmquHBIQqoivyUFQvFIqpDpyzswzTNaDQeu6xMmjz568lkElXTudBnYBgp7IJBytQYkXHyBYuglkZTSv/V37JUIpNOIVERQnF53Z4vK4FAYJ7f78PtD9I9MMS0UAq3yGIbA4ymsnQnPRSlgipAVUAIrqt7A0JAPl/gUn8Kv8+Lw+GYq3m8nvjw0BDuYASnMBFcn5tPzRH05hgUEk0IHKrg8MUckwIqfpdCyK2ga4K+tE0BuM1rkstlURRRrggEpmlSsm2yWQNFufWPkgSfS3B+0GIkX+LuiU4cKmx/d4TthwcZzpV455zB4QsFQMHj9mBZllCMnHHNHwhgFoqgeRnN2bfmBficgtFMkeGsTbEkOHTOoMznImsJWi6bnOnNYdklogGdQqGIbZcGlXQqlfC43ThUgaXq7G1NM2TYqMp1YtOSfGWaB9OG351K8rdug5RhkjKKHPlXnhKCqnE+YgEHyXQaRRGdypWeK3VSCFRsFs0ox8TJXy8ZqOIjckhJRUDDkgKnpuB0qrgcKhKBR3cxvzqEpiqoqmblc+YRpbGh4bCRNXqdTicRZ5FVX5zEhynJtYx1Q3HBhyNFftOWprPXRCAQgKYKbFuyeEYZC6p9DI6kiEajp48ePXJYvfCPi/mFCxYMxcePX5FNJZlSEcTh1BkYThPzK7g0hX8OFjkzUKQkJRKFfLGEQ1NYNa+S9YsnIc0sbo8nf6WnZ++j6x5rUAGCfv+lyVVVkWh57AtWPktV1Es4HCJrmPQYgubzeXy6xlXLiaq7mT3ew9al1SyqdpMd7iNeOYHh0dH6Z57+/vbe/r6iCtDZ1VX8XO2shM/vD4UjkbkOFaLxMgLv1hN8dTe+ivFMdBSYd/wAa/Qe7n3kXvz2MEGfm2gsTm9fX2NDXf0TB5sbk+lMFna/8MJNPZ7f8Wy4/kDd0x2dXeaVixfk+TX3yzYV2X+oUfYnErJ9ekx2VLjkpb+fk11dXfLsmbOlt996e8e2H27zjHHEy8ZdD/a89PJN4oXz7xI/+/2BKX/83ub9iVmVdtf8qXKw/ZTMlKR8/+7psiOIPPna3mRjY9MrWzZsrD6RaFc+uuc+hfJwhJaWVgAStRPXdkzQ5bHZk//025/sWvfLhubVLXfV/KUjJuSpz9+xa6zn4dUP8T+j5dGHJySmlv+5vaZi880Fu3D22vaq4MCxH2yN8f/i9I3z+De/tuz46vvuHKsf2/bU7SeXLV47Ahx75ruf2f8f5t+m6DwZp+AAAAAASUVORK5CYII='/>\n    <span id=\"headerText\" onclick=\"window.location.href='../dhis-web-dashboard-integration/index.action'\" style=\"cursor:pointer\" title=\"View home page\">MERTIDE: Offline PEPFAR MER Data Entry Screen Shots<br><font size=\"2\">For reference ONLY, data entry MUST be done in DATIM</font></span>\n    <div id=\"dhisDropDownMenu\">\n      <ul id=\"menuLinkArea\">\n        <li id=\"profileButton\">\n          <a class=\"menu-link drop-down-menu-link\" id=\"profileLink\"><i class=\"fa fa-user\"></i>Profile</a>\n        </li>\n        <li id=\"applicationsButton\">\n          <a class=\"menu-link drop-down-menu-link\" id=\"applicationsLink\"><i class=\"fa fa-th\"></i>Apps</a>\n        </li>\n      </ul>\n    </div><span id=\"showLeftBar\"><a href=\"javascript:dhis2.leftBar.showAnimated()\" title=\"Show menu\"><i class=\"fa fa-arrow-right leftBarIcon\"></i></a></span>\n  </div>\n  <div id=\"leftBar\">\n    <div id=\"hideLeftBar\">\n      <a href=\"index.action\" id=\"showMainMenuLink\" title=\"Show main menu\"><i class=\"fa fa-home leftBarIcon\"></i></a> <a href=\"javascript:dhis2.leftBar.hideAnimated()\" id=\"hideMainMenuLink\" title=\n      \"Hide menu\"><i class=\"fa fa-arrow-left leftBarIcon\"></i></a> <a href=\"javascript:dhis2.leftBar.extendAnimated()\" id=\"extendMainMenuLink\" title=\"Extend menu\"><i class=\n      \"fa fa-arrow-right leftBarIcon\"></i></a>\n    </div>\n    <div id=\"leftBarContents\">\n      <script type=\"text/javascript\">\n            selection.setListenerFunction(organisationUnitSelected);\n      </script>\n      <style type=\"text/css\">\n            #leftBarContents div#orgUnitTree {\n            height : 430px;\n            }\n      </style><br>\n      <script type=\"text/javascript\">\n            jQuery(document).ready(function(){\n              jQuery(\"#searchIcon\").click(function(){\n              jQuery(\"#searchSpan\").toggle();\n              jQuery(\"#searchField\").focus();\n            });\n\n            jQuery(\"#searchField\").autocomplete({\n            source: \"../dhis-web-commons/ouwt/getOrganisationUnitsByName.action\",\n            select: function(event,ui) {\n                jQuery(\"#searchField\").val(ui.item.value);\n                selection.findByName();\n            }\n            });\n            });\n\n            var i18n_find = 'Find';\n      </script>\n\n\n\n      <img id=\"searchIcon\" src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAAsTAAALEwEAmpwYAAAKT2lDQ1BQaG90b3Nob3AgSUNDIHByb2ZpbGUAAHjanVNnVFPpFj333vRCS4iAlEtvUhUIIFJCi4AUkSYqIQkQSoghodkVUcERRUUEG8igiAOOjoCMFVEsDIoK2AfkIaKOg6OIisr74Xuja9a89+bN/rXXPues852zzwfACAyWSDNRNYAMqUIeEeCDx8TG4eQuQIEKJHAAEAizZCFz/SMBAPh+PDwrIsAHvgABeNMLCADATZvAMByH/w/qQplcAYCEAcB0kThLCIAUAEB6jkKmAEBGAYCdmCZTAKAEAGDLY2LjAFAtAGAnf+bTAICd+Jl7AQBblCEVAaCRACATZYhEAGg7AKzPVopFAFgwABRmS8Q5ANgtADBJV2ZIALC3AMDOEAuyAAgMADBRiIUpAAR7AGDIIyN4AISZABRG8lc88SuuEOcqAAB4mbI8uSQ5RYFbCC1xB1dXLh4ozkkXKxQ2YQJhmkAuwnmZGTKBNA/g88wAAKCRFRHgg/P9eM4Ors7ONo62Dl8t6r8G/yJiYuP+5c+rcEAAAOF0ftH+LC+zGoA7BoBt/qIl7gRoXgugdfeLZrIPQLUAoOnaV/Nw+H48PEWhkLnZ2eXk5NhKxEJbYcpXff5nwl/AV/1s+X48/Pf14L7iJIEyXYFHBPjgwsz0TKUcz5IJhGLc5o9H/LcL//wd0yLESWK5WCoU41EScY5EmozzMqUiiUKSKcUl0v9k4t8s+wM+3zUAsGo+AXuRLahdYwP2SycQWHTA4vcAAPK7b8HUKAgDgGiD4c93/+8//UegJQCAZkmScQAAXkQkLlTKsz/HCAAARKCBKrBBG/TBGCzABhzBBdzBC/xgNoRCJMTCQhBCCmSAHHJgKayCQiiGzbAdKmAv1EAdNMBRaIaTcA4uwlW4Dj1wD/phCJ7BKLyBCQRByAgTYSHaiAFiilgjjggXmYX4IcFIBBKLJCDJiBRRIkuRNUgxUopUIFVIHfI9cgI5h1xGupE7yAAygvyGvEcxlIGyUT3UDLVDuag3GoRGogvQZHQxmo8WoJvQcrQaPYw2oefQq2gP2o8+Q8cwwOgYBzPEbDAuxsNCsTgsCZNjy7EirAyrxhqwVqwDu4n1Y8+xdwQSgUXACTYEd0IgYR5BSFhMWE7YSKggHCQ0EdoJNwkDhFHCJyKTqEu0JroR+cQYYjIxh1hILCPWEo8TLxB7iEPENyQSiUMyJ7mQAkmxpFTSEtJG0m5SI+ksqZs0SBojk8naZGuyBzmULCAryIXkneTD5DPkG+Qh8lsKnWJAcaT4U+IoUspqShnlEOU05QZlmDJBVaOaUt2ooVQRNY9aQq2htlKvUYeoEzR1mjnNgxZJS6WtopXTGmgXaPdpr+h0uhHdlR5Ol9BX0svpR+iX6AP0dwwNhhWDx4hnKBmbGAcYZxl3GK+YTKYZ04sZx1QwNzHrmOeZD5lvVVgqtip8FZHKCpVKlSaVGyovVKmqpqreqgtV81XLVI+pXlN9rkZVM1PjqQnUlqtVqp1Q61MbU2epO6iHqmeob1Q/pH5Z/YkGWcNMw09DpFGgsV/jvMYgC2MZs3gsIWsNq4Z1gTXEJrHN2Xx2KruY/R27iz2qqaE5QzNKM1ezUvOUZj8H45hx+Jx0TgnnKKeX836K3hTvKeIpG6Y0TLkxZVxrqpaXllirSKtRq0frvTau7aedpr1Fu1n7gQ5Bx0onXCdHZ4/OBZ3nU9lT3acKpxZNPTr1ri6qa6UbobtEd79up+6Ynr5egJ5Mb6feeb3n+hx9L/1U/W36p/VHDFgGswwkBtsMzhg8xTVxbzwdL8fb8VFDXcNAQ6VhlWGX4YSRudE8o9VGjUYPjGnGXOMk423GbcajJgYmISZLTepN7ppSTbmmKaY7TDtMx83MzaLN1pk1mz0x1zLnm+eb15vft2BaeFostqi2uGVJsuRaplnutrxuhVo5WaVYVVpds0atna0l1rutu6cRp7lOk06rntZnw7Dxtsm2qbcZsOXYBtuutm22fWFnYhdnt8Wuw+6TvZN9un2N/T0HDYfZDqsdWh1+c7RyFDpWOt6azpzuP33F9JbpL2dYzxDP2DPjthPLKcRpnVOb00dnF2e5c4PziIuJS4LLLpc+Lpsbxt3IveRKdPVxXeF60vWdm7Obwu2o26/uNu5p7ofcn8w0nymeWTNz0MPIQ+BR5dE/C5+VMGvfrH5PQ0+BZ7XnIy9jL5FXrdewt6V3qvdh7xc+9j5yn+M+4zw33jLeWV/MN8C3yLfLT8Nvnl+F30N/I/9k/3r/0QCngCUBZwOJgUGBWwL7+Hp8Ib+OPzrbZfay2e1BjKC5QRVBj4KtguXBrSFoyOyQrSH355jOkc5pDoVQfujW0Adh5mGLw34MJ4WHhVeGP45wiFga0TGXNXfR3ENz30T6RJZE3ptnMU85ry1KNSo+qi5qPNo3ujS6P8YuZlnM1VidWElsSxw5LiquNm5svt/87fOH4p3iC+N7F5gvyF1weaHOwvSFpxapLhIsOpZATIhOOJTwQRAqqBaMJfITdyWOCnnCHcJnIi/RNtGI2ENcKh5O8kgqTXqS7JG8NXkkxTOlLOW5hCepkLxMDUzdmzqeFpp2IG0yPTq9MYOSkZBxQqohTZO2Z+pn5mZ2y6xlhbL+xW6Lty8elQfJa7OQrAVZLQq2QqboVFoo1yoHsmdlV2a/zYnKOZarnivN7cyzytuQN5zvn//tEsIS4ZK2pYZLVy0dWOa9rGo5sjxxedsK4xUFK4ZWBqw8uIq2Km3VT6vtV5eufr0mek1rgV7ByoLBtQFr6wtVCuWFfevc1+1dT1gvWd+1YfqGnRs+FYmKrhTbF5cVf9go3HjlG4dvyr+Z3JS0qavEuWTPZtJm6ebeLZ5bDpaql+aXDm4N2dq0Dd9WtO319kXbL5fNKNu7g7ZDuaO/PLi8ZafJzs07P1SkVPRU+lQ27tLdtWHX+G7R7ht7vPY07NXbW7z3/T7JvttVAVVN1WbVZftJ+7P3P66Jqun4lvttXa1ObXHtxwPSA/0HIw6217nU1R3SPVRSj9Yr60cOxx++/p3vdy0NNg1VjZzG4iNwRHnk6fcJ3/ceDTradox7rOEH0x92HWcdL2pCmvKaRptTmvtbYlu6T8w+0dbq3nr8R9sfD5w0PFl5SvNUyWna6YLTk2fyz4ydlZ19fi753GDborZ752PO32oPb++6EHTh0kX/i+c7vDvOXPK4dPKy2+UTV7hXmq86X23qdOo8/pPTT8e7nLuarrlca7nuer21e2b36RueN87d9L158Rb/1tWeOT3dvfN6b/fF9/XfFt1+cif9zsu72Xcn7q28T7xf9EDtQdlD3YfVP1v+3Njv3H9qwHeg89HcR/cGhYPP/pH1jw9DBY+Zj8uGDYbrnjg+OTniP3L96fynQ89kzyaeF/6i/suuFxYvfvjV69fO0ZjRoZfyl5O/bXyl/erA6xmv28bCxh6+yXgzMV70VvvtwXfcdx3vo98PT+R8IH8o/2j5sfVT0Kf7kxmTk/8EA5jz/GMzLdsAAAAgY0hSTQAAeiUAAICDAAD5/wAAgOkAAHUwAADqYAAAOpgAABdvkl/FRgAAAjVJREFUeNqkk01IVFEUx3/3vucbZ6zRxvkgmUoiZ2PWxkVEiz5WErSxNkW4LNq1002bFkUGLYqIWrVpEUWQIZUEbYpaiAm2mUwyND9yHNFHvJm5754WjjOBEUIHLlzO+Z8f//txlIjwP6HOPI0DnAauAfu22DcJDABPNgCFy4fuJnLJg1vqzi+Nc+vDpWWg1a3mEqt6iNfz1xHsvy2jSXidAAmADQBrZg4jIQBt0SN0NV8k6iT5WfrEaPEGQbhcVYasmbkaUG9sQisYKyS9bk6k7zO7OMnbz/fwKm0cTz3AioupakIrmwFGBCNCLnaeiZlXDH/pJx885uHHPiIkSXndNY354+XcOsBirCVCmh/l9yR2r5caWyoU/O+4lQzGrt+P0Xazg5IVAmuZXh6jc2cPQhOBtSSiXWR3HGCqOEZgLYG1lOxfHKwZg28ML2Zu0pE6Sl/7G1bNLEmvA79UZEUvUTIGAIvZ9JEkl9vLamUBG4L/1ePwnl5S27Pk50c52XmB1uYMtyd78U2BeEOGfH4KQNUA6fYsK5UFAMRCULTYMrgxRVj0uHrsGeO/XjK8cIeWhgyL32YAVO0IjnZwlEYQcKAp6dRsStzQP9JDpFnTlHZwdL3mPj9bck49ivj7Y9ltjS27cFQEXefWow2sGEIpEZSFOab9oXNlx/U8Lx4UGByZeHcFcLY4TGFQYNDzvLiKxWJRrbWnlGpQSjkiopVSGlDVBSCyPvdWKWWBUEQqxpjy7wEA4uT9qfoAMmMAAAAASUVORK5CYII=' style=\"cursor: pointer\" title=\"Locate organisation unit by name\"> <span id=\"searchSpan\" style=\n      \"width:100%;display:none;\"><span aria-live=\"polite\" class=\"ui-helper-hidden-accessible\" role=\"status\"></span><input autocomplete=\"off\" class=\"ui-autocomplete-input\" id=\"searchField\" name=\"key\"\n      style=\"width:155px\" type=\"text\"> <input onclick=\"selection.findByName()\" type=\"button\" value=\"Find\"></span>\n      <div id=\"orgUnitTreeContainer\">\n      <div id=\"orgUnitTree\" style=\"cursor: auto;\">\n        <ul>\n          <li id=\"orgUnitybg3MO3hcf4\">\n            <span class=\"toggle\"><img alt=\"[-]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoxNTVEOTI0OThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDoxNTVEOTI0QThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjE1NUQ5MjQ3OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjE1NUQ5MjQ4OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhGMj6ALxuteC0BYO2WW8aEfFAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"ybg3MO3hcf4\"%20)' style=\n            \"cursor: auto;\">   <a class=\"selected\" href=\n                                            'javascript:void%20selection.select(%20\"IHuZkWbFwNK\"%20)' style=\"cursor: auto;\">Global</a></a>\n            <ul style=\"display: block;\">\n              <li id=\"orgUnitKSkooYTy8FB\">\n                <span class=\"toggle\"><img alt=\"[-]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoxNTVEOTI0OThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDoxNTVEOTI0QThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjE1NUQ5MjQ3OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjE1NUQ5MjQ4OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhGMj6ALxuteC0BYO2WW8aEfFAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"KSkooYTy8FB\"%20)' style=\n                \"cursor: auto;\">Africa</a>\n                <ul>\n                <ul style=\"display: block;\">\n                  <li id=\"orgUnitXOivy2uDpMF\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"l1KFEXKI4Dg\"%20)' style=\n                    \"cursor: auto;\">Angola</a>\n\n                  </li>\n                </li>\n                    </ul>\n                  </li>\n                  <li id=\"orgUnitl1KFEXKI4Dg\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"l1KFEXKI4Dg\"%20)' style=\n                    \"cursor: auto;\">Botswana</a>\n                  </li>\n                  <li id=\"orgUnitQh4XMQJhbk8\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"Qh4XMQJhbk8\"%20)' style=\n                    \"cursor: auto;\">Burundi</a>\n                  </li>\n                  <li id=\"orgUnitbQQJe0cC1eD\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"bQQJe0cC1eD\"%20)' style=\n                    \"cursor: auto;\">Cameroon</a>\n                  </li>\n                  <li id=\"orgUnitds0ADyc9UCU\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"ds0ADyc9UCU\"%20)' style=\n                    \"cursor: auto;\">Cote d'Ivoire</a>\n                  </li>\n                  <li id=\"orgUnitANN4YCOufcP\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"ANN4YCOufcP\"%20)' style=\n                    \"cursor: auto;\">Democratic Republic of the Congo</a>\n                  </li>\n                  <li id=\"orgUnitIH1kchw86uA\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"IH1kchw86uA\"%20)' style=\n                    \"cursor: auto;\">Ethiopia</a>\n                  </li>\n                  <li id=\"orgUnity3zhsvdXlhN\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"y3zhsvdXlhN\"%20)' style=\n                    \"cursor: auto;\">Ghana</a>\n                  </li>\n                  <li id=\"orgUnitHfVjCurKxh2\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"HfVjCurKxh2\"%20)' style=\n                    \"cursor: auto;\">Kenya</a>\n                  </li>\n                  <li id=\"orgUnitqllxzIjjurr\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"qllxzIjjurr\"%20)' style=\n                    \"cursor: auto;\">Lesotho</a>\n                  </li>\n                  <li id=\"orgUnitlZsCb6y0KDX\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"lZsCb6y0KDX\"%20)' style=\n                    \"cursor: auto;\">Malawi</a>\n                  </li>\n                  <li id=\"orgUnith11OyvlPxpJ\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"h11OyvlPxpJ\"%20)' style=\n                    \"cursor: auto;\">Mozambique</a>\n                  </li>\n                </ul>\n              </li>\n              <li id=\"orgUnitqM7yIwbxM76\">\n                <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"qM7yIwbxM76\"%20)' style=\n                \"cursor: auto;\">Americas</a>\n              </li>\n              <li id=\"orgUnitNTRKjfU2iaF\">\n                <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"NTRKjfU2iaF\"%20)' style=\n                \"cursor: auto;\">Asia</a>\n              </li>\n              <li id=\"orgUnitZ6HA94OLdeg\">\n                <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"Z6HA94OLdeg\"%20)' style=\n                \"cursor: auto;\">Europe</a>\n              </li>\n            </ul>\n          </li>\n        </ul>\n      </div></div>\n    </div>\n  </div>\n  <div class=\"bold\" id=\"headerMessage\" style=\"display: none;\">\n    You are online\n  </div>\n  <div class=\"page\" id=\"mainPage\">\n    <!-- Do not set style attr -->\n    <script type=\"text/javascript\">\n        var i18n_select_data_set = 'Select data set';\n        var i18n_select_period = 'Select period';\n        var i18n_select_option = 'Select option';\n        var i18n_register_complete_dataset_success = 'Registered complete data set';\n        var i18n_register_complete_dataset_failed = 'Register complete data set failed';\n        var i18n_undo_register_complete_dataset_success = 'Undo register complete data set success';\n        var i18n_value_of_data_element_less = 'The value of the following data element is less than the specified minimum value.';\n        var i18n_value_of_data_element_greater = 'The value of the following data element is greater than the specified maximum value.';\n        var i18n_value_too_long = 'Value is too long';\n        var i18n_value_must_integer = 'Value must be an integer';\n        var i18n_value_must_number = 'Value must be a number';\n        var i18n_value_must_positive_integer = 'Value must be a positive integer';\n        var i18n_value_must_zero_or_positive_integer = 'Value must be zero or a positive integer';\n        var i18n_value_must_coordinate = 'Value must be a coordinate (longitude, latitude)';\n        var i18n_value_must_negative_integer = 'Value must be a negative integer';\n        var i18n_value_must_unit_interval = 'Value must be a unit interval (between 0 and 1)';\n        var i18n_value_must_percentage = 'Value must be a percentage (between 0 and 100)';\n        var i18n_field_unallowed_save_zero = 'This element does not permit 0 values. The original value will not be affected.';\n        var i18n_saving_value_failed_status_code = 'Saving value failed with status code';\n        var i18n_saving_value_failed_dataset_is_locked = 'Data set is locked, please contact admin';\n        var i18n_saving_comment_failed_status_code = 'Saving comment failed with status code';\n        var i18n_saving_minmax_failed_error_code = 'Saving min\\/max values failed with error code';\n        var i18n_confirm_complete = 'Are you sure this data set is complete?';\n        var i18n_confirm_undo = 'Are you sure you will undo the registration?';\n        var i18n_no_response_from_server = 'No response from server, please check connectivity and try again';\n        var i18n_enter_digits = 'Enter digit only.';\n        var i18n_max_must_be_greater_than_min = 'Max must be greater than min';\n        var i18n_mark_value_for_followup = 'Mark value for follow-up';\n        var i18n_unmark_value_for_followup = 'Un-mark value for follow-up';\n        var i18n_operation_not_available_offline = 'This operation is not available in off-line mode';\n        var i18n_online_notification = 'You are online';\n        var i18n_offline_notification = 'You are offline, data will be stored locally';\n        var i18n_need_to_sync_notification = 'There is data stored locally, please upload to server';\n        var i18n_sync_now = 'Upload';\n        var i18n_discard = 'Discard';\n        var i18n_remove_local_data = 'Are you sure you want to remove the locally stored data?';\n        var i18n_sync_success = 'Upload to server was successful';\n        var i18n_sync_failed = 'Upload to server failed, please try again later';\n        var i18n_uploading_data_notification = 'Uploading locally stored data to the server';\n        var i18n_ajax_login_failed = 'Login failed, check your username and password and try again';\n        var i18n_no_dataelement_selected = 'No Data Element Selected';\n        var i18n_dataset_is_locked = 'Data set is locked';\n        var i18n_register_complete_failed_dataset_is_locked = 'Data set is locked, registration failed, please contact admin';\n        var i18n_unregister_complete_failed_dataset_is_locked = 'Data set is locked, un-registration failed, please contact admin';\n        var i18n_show_all_sections = 'Show all sections';\n        var i18n_show_all_items = 'Show all items';\n        var i18n_all_values_for_data_element_must_be_filled = 'This form requires that all fields for a data element must be filled, please correct this before continuing.';\n        var i18n_validation_result = 'Validation Result';\n        var i18n_successful_validation = 'The data entry screen successfully passed validation';\n        var i18n_no_organisationunit_selected = 'No Organisation Unit Selected';\n        var i18n_childrens_forms = 'Sub Organisation Units';\n        var i18n_no_periods_click_prev_year_button = 'No periods, click \\\"Prev year\\\" button';\n        var i18n_view_comment = 'View comment';\n        var i18n_no_orgunits = 'No organisation unit attached to current user, no data entry possible';\n        var i18n_confirm_deletion = 'Confirm deletion';\n        var i18n_file_upload_failed = 'File upload failed';\n        var i18n_loading_file_info_failed = 'Loading file info failed';\n    </script>\n    <style media=\"print\" type=\"text/css\">\n        #moduleHeader, #currentSelection, #actions, #selectionBox, #completenessDiv, .ui-helper-hidden-accessible {\n        display: none;\n        }\n    </style>\n    <h3 id=\"moduleHeader\">Data Entry <a href=\"javascript:getHelpContent('dataEntry')\" title=\"Help\"><i class=\"fa fa-question-circle\"></i></a></h3>\n\t<div id=\"currentSelection\">\n        <span id=\"closeCurrentSelection\"><img src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAAXNSR0IArs4c6QAAAAZiS0dEAP8A/wD/oL2nkwAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB9wHDRUHIfCnlTsAAAF/SURBVCjPbZAxaFMBEIb/S3TskEVpkilriZOCmVwe2C2EDA8Skq2LQ3G03RS6iVPGLiag2TOoZAoB39ahD4dMoS9vaMmQRUkM9985+JCH9IPjhv8/fu4XZPR6vUMAOhqN1gBQr9cRxzH6/b64e0VE1sPh8HcBADqdzkszuzGzq263ewQAcRwDAFT1zMxWJN8DgIRheAjgBsDDLCwVkafj8fguDMNzAO8AFDPtwwOSCuAOQBWAZ/u63W5/IvkaOUQkFQBotVpH7v41dyQ5n//1ymCz2Zz+E5rN5mOS1wAe4T9E5HIymZwAQLFUKmG322GxWPyq1WoVd3/u7sjPdrt9sVwu98hHB0FwLiIXuJ8UwPF0Ov0hQRAIybNcG/f+kLX3rLDf7yskL0gWSYKkmNmlqh6QTEkKSSdZVdWPBTNbkxyoKlQVJAez2exkPp//NLNjkqmqCslbM3tbTJKEq9XqS7lcPnD3b41G400URQCAJEnW1Wr1s5k9MbNXURR9/wMXpub96TSLHgAAAABJRU5ErkJggg==' title=\"Close\" onclick=\"closeCurrentSelection()\"></span>\n        <span id=\"currentDataElement\">No Data Element Selected</span>\n    </div>\n    <div id=\"actions\">\n      <input disabled=\"disabled\" id=\"validationButton\" onclick=\"dhis2.de.validate( false )\" style=\"width:120px; margin-bottom: 3px;\" type=\"button\" value=\"Run validation\"><br>\n      <input id=\"printButton\" onclick=\"window.print()\" style=\"width:120px; margin-bottom: 3px;\" type=\"button\" value=\"Print form\"><br>\n      <input onclick=\"printBlankForm()\" style=\"width:120px; margin-bottom: 3px;\" type=\"button\" value=\"Print blank form\"><br>\n    </div>\n    <div class=\"inputCriteria\" id=\"selectionBox\" style=\"width:564px\">\n        <div class=\"selectionBoxRow\">\n            <div class=\"selectionLabel\">\n                Organisation Unit\n            </div><input id=\"selectedOrganisationUnit\" readonly=\"readonly\"\n            style=\"width: 394px; padding: 3px;\" type=\"text\" value=\n            \"Global\">\n        </div>\n        <div class=\"selectionBoxRow\">\n            <div class=\"selectionLabel\">\n                Data Set\n            </div><select class=\"selectionBoxSelect\" id=\"selectedDataSetId\"\n            name=\"selectedDataSetId\" onchange=\"dataSetSelected()\">\n                <option value=\"-1\">\n                    [ Select data set ]\n                </option>\n                <option value=\"i29foJcLY9Y\" selected>\n                    MER Results: Facility Based\n                </option>\n            </select>\n        </div>\n        <div class=\"selectionBoxRow\">\n            <div class=\"selectionLabel\">\n                Period\n            </div><select id=\"selectedPeriodId\" name=\"selectedPeriodId\"\n            onchange=\"periodSelected()\" style=\"width:225px\">\n                <option value=\"\">\n                    [ Select period ]\n                </option>\n                <option value=\"2035Q4\">\n                    October - December 2035\n                </option>\n                <option value=\"2035Q3\" selected>\n                    July - September 2035\n                </option>\n                <option value=\"2035Q2\">\n                    April - June 2035\n                </option>\n                <option value=\"2035Q1\">\n                    January - March 2035\n                </option>\n                <option value=\"2036Oct\">\n                \tOctober 2036 - September 2037\n                </option>\n            </select> <input id=\"prevButton\" onclick=\n            \"previousPeriodsSelected()\" style=\"width:85px\" title=\n            \"Earlier periods\" type=\"button\" value=\"Prev year\"> <input id=\n            \"nextButton\" onclick=\"nextPeriodsSelected()\" style=\"width:85px\"\n            title=\"Later periods\" type=\"button\" value=\"Next year\">\n        </div>\n<!--attributeComboStart--> \n        <div id=\"attributeComboDiv\">\n            <div class=\"selectionBoxRow\">\n                <div class=\"selectionLabel\">\n                    Funding Mechanism\n                </div>&nbsp;<select class=\"selectionBoxSelect\" id=\n                \"category-SH885jaRe0o\" onchange=\n                \"dhis2.de.attributeSelected('SH885jaRe0o')\">\n                    <option value=\"-1\">\n                        [ Select option ]\n                    </option>\n                    <option value=\"gz8WBMTzN0t\" selected>\n                        12345 - Test Mechanism 1\n                    </option>\n                </select>\n            </div>\n        </div>\n<!--attributeComboEnd--> \n        <div class=\"selectionBoxRow\" id=\"filterDataSetSectionDiv\" style=\n        \"display:none\">\n            <div class=\"selectionLabel\">\n                Filter on section\n            </div><select class=\"selectionBoxSelect\" id=\"filterDataSetSection\"\n            name=\"filterDataSetSection\" onchange=\"dhis2.de.filterOnSection()\">\n                </select>\n        </div>\n    </div>\n    <div class=\"page\" id=\"contentDiv\">\n    <div class=\"cde cde-NORMAL\">\n","form":"<!-- Start Custom DHIS2 Form -->\n\n<link rel=\"stylesheet\" type=\"text/css\" href=\"mertide.3bf839cddda0.css\" />\n<script type=\"text/javascript\" src=\"mertide.15f1baa71d3e.js\"></script>\n<script>\nfunctionloader.formLoaded = function () {\n//#dataValuesLoaded#\n};\n</script>\n<div style=\"display:none\" id=\"PEPFAR_main\"><div class=\"PEPFAR_reporting_legend\">\n\t<i class=\"fa fa-square PEPFAR_quarterly_square\">&nbsp;</i><span>Quarterly Reporting</span>\n\t<i class=\"fa fa-square PEPFAR_semiannually_square\">&nbsp;</i><span>Semiannually Reporting</span>\n\t<i class=\"fa fa-square PEPFAR_annually_square\">&nbsp;</i><span>Annually Reporting</span>\n</div>\n\n<div id=\"PEPFAR_Tabs_vertical\" class=\"ui-tabs-vertical ui-helper-clearfix\">\n<ul class=\"ui-helper-hidden\">\n","end":"\t</div>\n\t</div>\n    <div class=\"page\" id=\"historyDiv\"></div>\n    <div class=\"page\" id=\"validationDiv\"></div>\n<div id=\"completenessDiv\" class=\"page inputCriteria\" style=\"display: block;\">\n<input type=\"button\" id=\"completeButton\" name=\"completeButton\" value=\"Complete\" onclick=\"registerCompleteDataSet()\" style=\"width:120px\">\n<input type=\"button\" id=\"undoButton\" name=\"undoButton\" value=\"Incomplete\" onclick=\"undoCompleteDataSet()\" style=\"width:120px\" disabled=\"disabled\">\n<span class=\"separator\">|</span>\n<input type=\"button\" id=\"validateButton\" value=\"Run validation\" onclick=\"dhis2.de.validate( false )\" style=\"width:120px\">\n</div>\n    <div class=\"page inputCriteria\" id=\"infoDiv\" style=\"display: none;\">\n      <span class=\"tipText\">Completed by:</span> <span id=\"completedBy\"></span> <span class=\"tipText\">at:</span> <span id=\"completedDate\"></span> <a href=\"javascript:displayUserDetails()\">See\n      details</a>\n    </div>\n    <div class=\"page\" id=\"completedByDiv\">\n      <h3><span id=\"userFullName\"></span></h3>\n      <table>\n        <tbody>\n          <tr>\n            <td><label>Username:</label></td>\n            <td><span id=\"userUsername\"></span></td>\n          </tr>\n          <tr>\n            <td><label>E-mail:</label></td>\n            <td><span id=\"userEmail\"></span></td>\n          </tr>\n          <tr>\n            <td><label>Mobile phone number:</label></td>\n            <td><span id=\"userPhoneNumber\"></span></td>\n          </tr>\n          <tr>\n            <td><label>Organisation units:</label></td>\n            <td><span id=\"userOrganisationUnits\"></span></td>\n          </tr>\n          <tr>\n            <td><label>User roles:</label></td>\n            <td><span id=\"userUserRoles\"></span></td>\n          </tr>\n        </tbody>\n      </table>\n    </div>\n    <div id=\"fileDeleteConfirmationDialog\">\n      <div class=\"confirm-dialog-content\">\n        <span class=\"fa fa-exclamation-triangle fa-lg\"></span><span>Are you sure you want to delete this file?</span>\n      </div>\n    </div>\n  </div>\n  <div id=\"rightBar\">\n    <span id=\"hideRightBar\"><a href=\"javascript:hideHelpContent()\" title=\"Close\"><i class=\"fa fa-times leftBarIcon\"></i></a></span>\n    <div id=\"rightBarContents\"></div>\n  </div><select id=\"selectedDataSetId_storage\" style=\"visibility: hidden;\">\n    </select><select id=\"selectedPeriodId_storage\" style=\"visibility: hidden;\">\n    </select><select id=\"filterDataSetSection_storage\" style=\"visibility: hidden;\">\n    </select>\n  <ul class=\"ui-autocomplete ui-front ui-menu ui-widget ui-widget-content ui-corner-all\" id=\"ui-id-1\" style=\"display: none;\" tabindex=\"0\"></ul>\n</body>\n</html>"});
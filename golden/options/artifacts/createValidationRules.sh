@@ -0,0 +1,13 @@
+#!/usr/bin/env bash
+
+# Exit immediately upon non-zero exit status
+set -e ; set -o pipefail
+
+# Add src/bash to PATH as necessary
+if ! [[ $PATH =~ /opt/bao/bin ]]; then 
+  export PATH="$PATH:../../src/bash"
+fi
+
+source dhis_config
+
+dhis_api --content-json --request POST --data-binary '@validationRulesImport.json' --api-request='metadata/?preheatCache=false&dryRun=false'
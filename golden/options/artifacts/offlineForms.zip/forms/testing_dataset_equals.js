@@ -0,0 +1 @@
+mertideOffline.form({"name":"Testing DataSet Equals","dataValuesLoaded":"      functionloader.registerRules({\"ssids\":[\"{ssid1}\",\"{ssid2}\",\"{ssid3}\",\"{ssid4}\",\"{ssid5}\",\"{ssid6}\",\"{ssid7}\",\"{ssid8}\",\"{ssid9}\",\"{ssid10}\",\"{ssid11}\",\"{ssid12}\",\"{ssid13}\",\"{ssid14}\",\"{ssid15}\",\"{ssid16}\",\"{ssid17}\"],\"cocs\":[\"DeRpqXAN3tS\",\"iyTkERr58vA\",\"c7N7xWfiOfX\"],\"operands\":[[0],[2],[3],[5,[]],[11,[0]],[11,[1]],[11,[2]]],\"autocalc\":[[[0],1],[[1,2],4],[[3],6],[[3],7],[[3],8],[[3],9],[[3],10],[[4],12],[[4,5],13],[[4,5,6],14],[[5,6],15],[[6],16]],\"exclusive\":[]});\n","html":"\t<li class=\"ui-corner-left\"><a href=\"#PEPFAR_Tabs_vertical_1\">Vertical Tab</a></li>\n</ul>\n\n<div id=\"PEPFAR_Tabs_vertical_1\">\n<div id=\"PEPFAR_Tabs_h_1\">\n<ul class=\"ui-helper-hidden\">\n\t<li><a href=\"#PEPFAR_Form_1_DSD\">DSD</a></li>\n</ul>\n\n<div id=\"PEPFAR_Form_1_DSD\">\n<p class=\"PEPFAR_Form_ShowHide\">&nbsp;</p>\n\n<!-- DSD: eq_01 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">eq_01</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid2}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Simple Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Numerator</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid1}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cXxLhfuVI6t-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cXxLhfuVI6t-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cXxLhfuVI6t-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"cXxLhfuVI6t-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cXxLhfuVI6t-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cXxLhfuVI6t-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cXxLhfuVI6t-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"cXxLhfuVI6t-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid1}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD eq_01 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: eq_02 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">eq_02</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid5}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Addition and Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Numerator</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid3}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Question1</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Female</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"QtmcO7WTHLM-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid4}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Question2</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Male</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"TmP1kySrUbY-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD eq_02 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: eq_03 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">eq_03</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid7}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Female</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid7}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid8}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Under 15</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid8}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid9}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Over 15</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid9}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid10}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Male Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid10}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid11}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Positive Under 15</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid11}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid6}\">\n\t<!-- <categoryCombo name=\"valtest: Age - SuperFine and Sex and HIV Status\" id=\"Vh6tavFLzjv\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Super Fine</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">0-9</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">10-14</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15-19</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">20-24</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">25-29</div>\n\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">30+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-HaXdnWjI1mN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-Qd0uTr2Df9k-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-ZWPt3GRmBFm-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-vHSA3OxElS2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-WPEAIFUu5a2-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-LP5MQ3dRkPZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-PX6Ls0fC6EZ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-PjcOR0v6egX-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-pVSSJRSpqwy-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-zy9VW6WQbNW-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-QtXiIwFvhpf-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"z4RrbhHmJzO-XA3PWLZWbfC-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-IwII6nCtYax-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-gZvoEMR4uAc-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-cy1pyVQnjiv-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-hZ9mbNaWRdD-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-drHVzru5m4o-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-uRwXZcZ1P0R-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-gJm0rDUYm6C-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-o8YxLOwJrYJ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-VwQuwxiy9Fe-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-lwWBSzeSwN8-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-irW98YPtxJN-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"z4RrbhHmJzO-n4TeYFMq1W6-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid6}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD eq_03 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: eq_04 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">eq_04</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid13}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">1</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid13}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid14}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">1,2</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid14}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid15}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">1,2,3</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid15}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid16}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">2,3</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid16}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid17}\">\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_auto_calculate\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Auto-Calculate</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Subtotal</div>\n\t\t\t</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">3</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid17}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n<div class=\"si_{ssid12}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">1, 2, and 3</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">One</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"DeRpqXAN3tS-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Two</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"iyTkERr58vA-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Three</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"c7N7xWfiOfX-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD eq_04 --></div>\n\n<p>&nbsp;</p>\n\n</div>\n</div>\n</div>\n<script type=\"text/javascript\">\n$('#PEPFAR_Tabs_vertical').tabs({\n  beforeActivate: function (event, ui) {\n    functionloader.materializeTab(ui.newPanel[0]);\n  }\n}).removeClass('ui-tabs').find('ul').removeClass('ui-helper-hidden');\n$('#PEPFAR_Tabs_vertical li').removeClass('ui-corner-top');\n$('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');\n</script></div>\n</div>\n<!-- End Custom DHIS2 Form -->\n\n","attributeCombo":false,"dataElements":[["cXxLhfuVI6t","PUBLIC - EQ_01: Coarse"],["QtmcO7WTHLM","PUBLIC - EQ_02: Female"],["TmP1kySrUbY","PUBLIC - EQ_02: Male"],["z4RrbhHmJzO","PUBLIC - EQ_03: Superfine"],["DeRpqXAN3tS","PUBLIC - EQ_04: Def 1"],["iyTkERr58vA","PUBLIC - EQ_04: Def 2"],["c7N7xWfiOfX","PUBLIC - EQ_04: Def 3"]],"optionCombos":[["vHSA3OxElS2","10-14, Male, Positive"],["IwII6nCtYax","0-9, Female, Negative"],["ZWPt3GRmBFm","10-14, Female, Positive"],["ZyfQ4TCVUzR","15+, Female, Negative"],["gZvoEMR4uAc","0-9, Male, Negative"],["syoxO60kaBs","<15, Female, Negative"],["fMJDGka70UV","15+, Male, Negative"],["gJm0rDUYm6C","20-24, Female, Negative"],["lwWBSzeSwN8","25-29, Male, Negative"],["WPEAIFUu5a2","15-19, Female, Positive"],["VwQuwxiy9Fe","25-29, Female, Negative"],["n4TeYFMq1W6","30+, Male, Negative"],["irW98YPtxJN","30+, Female, Negative"],["QtXiIwFvhpf","30+, Female, Positive"],["PX6Ls0fC6EZ","20-24, Female, Positive"],["pVSSJRSpqwy","25-29, Female, Positive"],["zy9VW6WQbNW","25-29, Male, Positive"],["XA3PWLZWbfC","30+, Male, Positive"],["lwN0Zclhn1c","<15, Male, Positive"],["xOtz2rhdmZU","<15, Female, Positive"],["uRwXZcZ1P0R","15-19, Male, Negative"],["PjcOR0v6egX","20-24, Male, Positive"],["sVJ3ZVJwsrR","15+, Male, Positive"],["HllvX50cXC0","default"],["Qd0uTr2Df9k","0-9, Male, Positive"],["cy1pyVQnjiv","10-14, Female, Negative"],["drHVzru5m4o","15-19, Female, Negative"],["LP5MQ3dRkPZ","15-19, Male, Positive"],["o8YxLOwJrYJ","20-24, Male, Negative"],["ZfBpKlBfuiQ","<15, Male, Negative"],["hZ9mbNaWRdD","10-14, Male, Negative"],["CqeUNqRBN0z","15+, Female, Positive"],["HaXdnWjI1mN","0-9, Female, Positive"]]});
@@ -0,0 +1 @@
+mertideOffline.form({"name":"Testing DataSet Greater Than","dataValuesLoaded":"","html":"\t<li class=\"ui-corner-left\"><a href=\"#PEPFAR_Tabs_vertical_1\">Vertical Tab</a></li>\n</ul>\n\n<div id=\"PEPFAR_Tabs_vertical_1\">\n<div id=\"PEPFAR_Tabs_h_1\">\n<ul class=\"ui-helper-hidden\">\n\t<li><a href=\"#PEPFAR_Form_1_DSD\">DSD</a></li>\n</ul>\n\n<div id=\"PEPFAR_Form_1_DSD\">\n<p class=\"PEPFAR_Form_ShowHide\">&nbsp;</p>\n\n<!-- DSD: GT_01 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">GT_01</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid1}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">GT Test 1</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Numerator</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"feGBSzY2DXh-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid2}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse and Sex and HIV Status\" id=\"dDkbis0ADST\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse Disagg</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty PEPFAR_Form_EntryField_2x_wide\">15+</div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"line-height:100%;\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\" style=\"padding-top:0px;padding-bottom:0px;\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">F</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\" style=\"padding-top:0px;padding-bottom:0px;\">M</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"dvcF9ZaGZTv-xOtz2rhdmZU-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"dvcF9ZaGZTv-lwN0Zclhn1c-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"dvcF9ZaGZTv-CqeUNqRBN0z-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row1\"><input id=\"dvcF9ZaGZTv-sVJ3ZVJwsrR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow1_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Negative</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"dvcF9ZaGZTv-syoxO60kaBs-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"dvcF9ZaGZTv-ZfBpKlBfuiQ-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"dvcF9ZaGZTv-ZyfQ4TCVUzR-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField row2\"><input id=\"dvcF9ZaGZTv-fMJDGka70UV-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField totrow2_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid2}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n\n</div>\n\n\n</div>\n<!-- END DSD GT_01 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: GT_02 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">GT_02</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid3}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">GT Test 2 - Cool AND Awesome People</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName\">Numerator</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"UtNVQNb8cxR-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid4}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse\" id=\"j1Kh8Xz6x1D\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse Disagg 1 Cool People Ages</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\">15+</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"mnAracaujVw-r4oa6r28mVz-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"mnAracaujVw-sUW7O9zZnFq-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid4}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n</div>\n\n\n<div class=\"si_{ssid5}\">\n\t<!-- <categoryCombo name=\"valtest: Age - Coarse\" id=\"j1Kh8Xz6x1D\"/> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">Coarse Disagg 2 Awesome People Ages</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\" style=\"border-bottom:0px solid #cccccc;line-height:100%;\">\t\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">&nbsp;</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\">&lt;15</div>\n\t\t\t<div class=\"PEPFAR_Form_Empty\">15+</div>\n\t\t</div>\n\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Positive</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"JNSW7N11Kt6-r4oa6r28mVz-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"JNSW7N11Kt6-sUW7O9zZnFq-val\" /></div>\n\t\t</div>\n\t\t\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin_b\">Sub-total</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField total_{ssid5}\"><div class=\"input_total\"></div></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD GT_02 --></div>\n\n<p>&nbsp;</p>\n\n<!-- DSD: GT_02 -->\n<div class=\"PEPFAR_Form\">\n<div class=\"PEPFAR_Form_Container PEPFAR_Form_Title PEPFAR_Form_Title_Quarterly\">GT_02</div>\n<div class=\"PEPFAR_Form_Collapse\">\n<div class=\"si_{ssid6}\">\n\t<!-- <categoryCombo name=\"default\" id=\"bjDvmb4bfuf\"> -->\n\t\t<div class=\"PEPFAR_Form_Priority_Container_Outer\">\n\t\t\t<div class=\"PEPFAR_Form_Priority_Container_Inner PEPFAR_Form_Priority_required\">\n\t\t\t\t<div class=\"PEPFAR_Form_Priority\"><span class=\"PEPFAR_Form_Priority_text\">Required</span></div>\n\t\t\t\t<div class=\"PEPFAR_Form_Description\">GT Test 3 - 1 is greater than 2 and 3 together</div>\n\t\t\t</div>\n\t\t</div>\n\t\t<div class=\"PEPFAR_Form_Container\">\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">One</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"vxMyclyWWg6-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Two</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"jLsEMbex4o0-HllvX50cXC0-val\" /></div>\n\t\t\t<div class=\"PEPFAR_Form_EntryName_Thin\">Three</div>\n\t\t\t<div class=\"PEPFAR_Form_EntryField\"><input id=\"MDHJh2FKkHm-HllvX50cXC0-val\" /></div>\n\t\t</div>\n</div>\n\n\n</div>\n<!-- END DSD GT_02 --></div>\n\n<p>&nbsp;</p>\n\n</div>\n</div>\n</div>\n<script type=\"text/javascript\">\n$('#PEPFAR_Tabs_vertical').tabs({\n  beforeActivate: function (event, ui) {\n    functionloader.materializeTab(ui.newPanel[0]);\n  }\n}).removeClass('ui-tabs').find('ul').removeClass('ui-helper-hidden');\n$('#PEPFAR_Tabs_vertical li').removeClass('ui-corner-top');\n$('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');\n</script></div>\n</div>\n<!-- End Custom DHIS2 Form -->\n\n","attributeCombo":false,"dataElements":[["feGBSzY2DXh","PUBLIC - GT_01: Default"],["dvcF9ZaGZTv","PUBLIC - GT_01: Coarse"],["UtNVQNb8cxR","PUBLIC - GT_02: Default"],["mnAracaujVw","PUBLIC - GT_02: Coarse 1"],["JNSW7N11Kt6","PUBLIC - GT_02: Coarse 2"],["vxMyclyWWg6","PUBLIC - GT_03: Def 1"],["jLsEMbex4o0","PUBLIC - GT_03: Def 2"],["MDHJh2FKkHm","PUBLIC - GT_03: Def 3"]],"optionCombos":[["ZyfQ4TCVUzR","15+, Female, Negative"],["syoxO60kaBs","<15, Female, Negative"],["fMJDGka70UV","15+, Male, Negative"],["lwN0Zclhn1c","<15, Male, Positive"],["xOtz2rhdmZU","<15, Female, Positive"],["sUW7O9zZnFq","15+, Positive"],["r4oa6r28mVz","<15, Positive"],["sVJ3ZVJwsrR","15+, Male, Positive"],["HllvX50cXC0","default"],["ZfBpKlBfuiQ","<15, Male, Negative"],["CqeUNqRBN0z","15+, Female, Positive"]]});
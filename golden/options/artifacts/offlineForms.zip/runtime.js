@@ -0,0 +1 @@
+mertideOffline.runtime({"before":"<!DOCTYPE html>\n<html>\n<head>\n<title>MERTIDE: PEPFAR OFFLINE TESTING ENVIRONMENT</title>\n<meta content=\"DHIS 2\" name=\"description\">\n<meta content=\"DHIS 2\" name=\"keywords\">\n<meta content=\"text/html; charset=utf-8\" http-equiv=\"Content-Type\">\n<link href=\"https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.6.3/css/font-awesome.css\" rel=\"stylesheet\" type=\"text/css\">\n<style type=\"text/css\" media=\"screen\">.ui-helper-hidden{display: none;}.ui-helper-hidden-accessible{border: 0;clip: rect(0 0 0 0);height: 1px;margin: -1px;overflow: hidden;padding: 0;position: absolute;width: 1px;}.ui-helper-reset{margin: 0;padding: 0;border: 0;outline: 0;line-height: 1.3;text-decoration: none;font-size: 100%;list-style: none;}.ui-helper-clearfix:before,.ui-helper-clearfix:after{content: \"\";display: table;border-collapse: collapse;}.ui-helper-clearfix:after{clear: both;}.ui-helper-clearfix{min-height: 0;}.ui-helper-zfix{width: 100%;height: 100%;top: 0;left: 0;position: absolute;opacity: 0;filter:Alpha(Opacity=0);}.ui-front{z-index: 100;}.ui-state-disabled{cursor: default !important;}.ui-icon{display: block;text-indent: -99999px;overflow: hidden;background-repeat: no-repeat;}.ui-widget-overlay{position: fixed;top: 0;left: 0;width: 100%;height: 100%;}.ui-resizable{position: relative;}.ui-resizable-handle{position: absolute;font-size: 0.1px;display: block;}.ui-resizable-disabled .ui-resizable-handle,.ui-resizable-autohide .ui-resizable-handle{display: none;}.ui-resizable-n{cursor: n-resize;height: 7px;width: 100%;top: -5px;left: 0;}.ui-resizable-s{cursor: s-resize;height: 7px;width: 100%;bottom: -5px;left: 0;}.ui-resizable-e{cursor: e-resize;width: 7px;right: -5px;top: 0;height: 100%;}.ui-resizable-w{cursor: w-resize;width: 7px;left: -5px;top: 0;height: 100%;}.ui-resizable-se{cursor: se-resize;width: 12px;height: 12px;right: 1px;bottom: 1px;}.ui-resizable-sw{cursor: sw-resize;width: 9px;height: 9px;left: -5px;bottom: -5px;}.ui-resizable-nw{cursor: nw-resize;width: 9px;height: 9px;left: -5px;top: -5px;}.ui-resizable-ne{cursor: ne-resize;width: 9px;height: 9px;right: -5px;top: -5px;}.ui-selectable-helper{position: absolute;z-index: 100;border: 1px dotted black;}.ui-accordion .ui-accordion-header{display: block;cursor: pointer;position: relative;margin-top: 2px;padding: .5em .5em .5em .7em;min-height: 0;}.ui-accordion .ui-accordion-icons{padding-left: 2.2em;}.ui-accordion .ui-accordion-noicons{padding-left: .7em;}.ui-accordion .ui-accordion-icons .ui-accordion-icons{padding-left: 2.2em;}.ui-accordion .ui-accordion-header .ui-accordion-header-icon{position: absolute;left: .5em;top: 50%;margin-top: -8px;}.ui-accordion .ui-accordion-content{padding: 1em 2.2em;border-top: 0;overflow: auto;}.ui-autocomplete{position: absolute;top: 0;left: 0;cursor: default;}.ui-button{display: inline-block;position: relative;padding: 0;line-height: normal;margin-right: .1em;cursor: pointer;vertical-align: middle;text-align: center;overflow: visible;}.ui-button,.ui-button:link,.ui-button:visited,.ui-button:hover,.ui-button:active{text-decoration: none;}.ui-button-icon-only{width: 2.2em;}button.ui-button-icon-only{width: 2.4em;}.ui-button-icons-only{width: 3.4em;}button.ui-button-icons-only{width: 3.7em;}.ui-button .ui-button-text{display: block;line-height: normal;}.ui-button-text-only .ui-button-text{padding: .4em 1em;}.ui-button-icon-only .ui-button-text,.ui-button-icons-only .ui-button-text{padding: .4em;text-indent: -9999999px;}.ui-button-text-icon-primary .ui-button-text,.ui-button-text-icons .ui-button-text{padding: .4em 1em .4em 2.1em;}.ui-button-text-icon-secondary .ui-button-text,.ui-button-text-icons .ui-button-text{padding: .4em 2.1em .4em 1em;}.ui-button-text-icons .ui-button-text{padding-left: 2.1em;padding-right: 2.1em;}input.ui-button{padding: .4em 1em;}.ui-button-icon-only .ui-icon,.ui-button-text-icon-primary .ui-icon,.ui-button-text-icon-secondary .ui-icon,.ui-button-text-icons .ui-icon,.ui-button-icons-only .ui-icon{position: absolute;top: 50%;margin-top: -8px;}.ui-button-icon-only .ui-icon{left: 50%;margin-left: -8px;}.ui-button-text-icon-primary .ui-button-icon-primary,.ui-button-text-icons .ui-button-icon-primary,.ui-button-icons-only .ui-button-icon-primary{left: .5em;}.ui-button-text-icon-secondary .ui-button-icon-secondary,.ui-button-text-icons .ui-button-icon-secondary,.ui-button-icons-only .ui-button-icon-secondary{right: .5em;}.ui-buttonset{margin-right: 7px;}.ui-buttonset .ui-button{margin-left: 0;margin-right: -.3em;}input.ui-button::-moz-focus-inner,button.ui-button::-moz-focus-inner{border: 0;padding: 0;}.ui-datepicker{width: 17em;padding: .2em .2em 0;display: none;}.ui-datepicker .ui-datepicker-header{position: relative;padding: .2em 0;}.ui-datepicker .ui-datepicker-prev,.ui-datepicker .ui-datepicker-next{position: absolute;top: 2px;width: 1.8em;height: 1.8em;}.ui-datepicker .ui-datepicker-prev-hover,.ui-datepicker .ui-datepicker-next-hover{top: 1px;}.ui-datepicker .ui-datepicker-prev{left: 2px;}.ui-datepicker .ui-datepicker-next{right: 2px;}.ui-datepicker .ui-datepicker-prev-hover{left: 1px;}.ui-datepicker .ui-datepicker-next-hover{right: 1px;}.ui-datepicker .ui-datepicker-prev span,.ui-datepicker .ui-datepicker-next span{display: block;position: absolute;left: 50%;margin-left: -8px;top: 50%;margin-top: -8px;}.ui-datepicker .ui-datepicker-title{margin: 0 2.3em;line-height: 1.8em;text-align: center;}.ui-datepicker .ui-datepicker-title select{font-size: 1em;margin: 1px 0;}.ui-datepicker select.ui-datepicker-month,.ui-datepicker select.ui-datepicker-year{width: 49%;}.ui-datepicker table{width: 100%;font-size: .9em;border-collapse: collapse;margin: 0 0 .4em;}.ui-datepicker th{padding: .7em .3em;text-align: center;font-weight: bold;border: 0;}.ui-datepicker td{border: 0;padding: 1px;}.ui-datepicker td span,.ui-datepicker td a{display: block;padding: .2em;text-align: right;text-decoration: none;}.ui-datepicker .ui-datepicker-buttonpane{background-image: none;margin: .7em 0 0 0;padding: 0 .2em;border-left: 0;border-right: 0;border-bottom: 0;}.ui-datepicker .ui-datepicker-buttonpane button{float: right;margin: .5em .2em .4em;cursor: pointer;padding: .2em .6em .3em .6em;width: auto;overflow: visible;}.ui-datepicker .ui-datepicker-buttonpane button.ui-datepicker-current{float: left;}.ui-datepicker.ui-datepicker-multi{width: auto;}.ui-datepicker-multi .ui-datepicker-group{float: left;}.ui-datepicker-multi .ui-datepicker-group table{width: 95%;margin: 0 auto .4em;}.ui-datepicker-multi-2 .ui-datepicker-group{width: 50%;}.ui-datepicker-multi-3 .ui-datepicker-group{width: 33.3%;}.ui-datepicker-multi-4 .ui-datepicker-group{width: 25%;}.ui-datepicker-multi .ui-datepicker-group-last .ui-datepicker-header,.ui-datepicker-multi .ui-datepicker-group-middle .ui-datepicker-header{border-left-width: 0;}.ui-datepicker-multi .ui-datepicker-buttonpane{clear: left;}.ui-datepicker-row-break{clear: both;width: 100%;font-size: 0;}.ui-datepicker-rtl{direction: rtl;}.ui-datepicker-rtl .ui-datepicker-prev{right: 2px;left: auto;}.ui-datepicker-rtl .ui-datepicker-next{left: 2px;right: auto;}.ui-datepicker-rtl .ui-datepicker-prev:hover{right: 1px;left: auto;}.ui-datepicker-rtl .ui-datepicker-next:hover{left: 1px;right: auto;}.ui-datepicker-rtl .ui-datepicker-buttonpane{clear: right;}.ui-datepicker-rtl .ui-datepicker-buttonpane button{float: left;}.ui-datepicker-rtl .ui-datepicker-buttonpane button.ui-datepicker-current,.ui-datepicker-rtl .ui-datepicker-group{float: right;}.ui-datepicker-rtl .ui-datepicker-group-last .ui-datepicker-header,.ui-datepicker-rtl .ui-datepicker-group-middle .ui-datepicker-header{border-right-width: 0;border-left-width: 1px;}.ui-dialog{overflow: hidden;position: absolute;top: 0;left: 0;padding: .2em;outline: 0;}.ui-dialog .ui-dialog-titlebar{padding: .4em 1em;position: relative;}.ui-dialog .ui-dialog-title{float: left;margin: .1em 0;white-space: nowrap;width: 90%;overflow: hidden;text-overflow: ellipsis;}.ui-dialog .ui-dialog-titlebar-close{position: absolute;right: .3em;top: 50%;width: 20px;margin: -10px 0 0 0;padding: 1px;height: 20px;}.ui-dialog .ui-dialog-content{position: relative;border: 0;padding: .5em 1em;background: none;overflow: auto;}.ui-dialog .ui-dialog-buttonpane{text-align: left;border-width: 1px 0 0 0;background-image: none;margin-top: .5em;padding: .3em 1em .5em .4em;}.ui-dialog .ui-dialog-buttonpane .ui-dialog-buttonset{float: right;}.ui-dialog .ui-dialog-buttonpane button{margin: .5em .4em .5em 0;cursor: pointer;}.ui-dialog .ui-resizable-se{width: 12px;height: 12px;right: -5px;bottom: -5px;background-position: 16px 16px;}.ui-draggable .ui-dialog-titlebar{cursor: move;}.ui-menu{list-style: none;padding: 2px;margin: 0;display: block;outline: none;}.ui-menu .ui-menu{margin-top: -3px;position: absolute;}.ui-menu .ui-menu-item{margin: 0;padding: 0;width: 100%;list-style-image: url(data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7);}.ui-menu .ui-menu-divider{margin: 5px -2px 5px -2px;height: 0;font-size: 0;line-height: 0;border-width: 1px 0 0 0;}.ui-menu .ui-menu-item a{text-decoration: none;display: block;padding: 2px .4em;line-height: 1.5;min-height: 0;font-weight: normal;}.ui-menu .ui-menu-item a.ui-state-focus,.ui-menu .ui-menu-item a.ui-state-active{font-weight: normal;margin: -1px;}.ui-menu .ui-state-disabled{font-weight: normal;margin: .4em 0 .2em;line-height: 1.5;}.ui-menu .ui-state-disabled a{cursor: default;}.ui-menu-icons{position: relative;}.ui-menu-icons .ui-menu-item a{position: relative;padding-left: 2em;}.ui-menu .ui-icon{position: absolute;top: .2em;left: .2em;}.ui-menu .ui-menu-icon{position: static;float: right;}.ui-progressbar{height: 2em;text-align: left;overflow: hidden;}.ui-progressbar .ui-progressbar-value{margin: -1px;height: 100%;}.ui-progressbar .ui-progressbar-overlay{background: url(\"images/animated-overlay.gif\");height: 100%;filter: alpha(opacity=25);opacity: 0.25;}.ui-progressbar-indeterminate .ui-progressbar-value{background-image: none;}.ui-slider{position: relative;text-align: left;}.ui-slider .ui-slider-handle{position: absolute;z-index: 2;width: 1.2em;height: 1.2em;cursor: default;}.ui-slider .ui-slider-range{position: absolute;z-index: 1;font-size: .7em;display: block;border: 0;background-position: 0 0;}.ui-slider.ui-state-disabled .ui-slider-handle,.ui-slider.ui-state-disabled .ui-slider-range{filter: inherit;}.ui-slider-horizontal{height: .8em;}.ui-slider-horizontal .ui-slider-handle{top: -.3em;margin-left: -.6em;}.ui-slider-horizontal .ui-slider-range{top: 0;height: 100%;}.ui-slider-horizontal .ui-slider-range-min{left: 0;}.ui-slider-horizontal .ui-slider-range-max{right: 0;}.ui-slider-vertical{width: .8em;height: 100px;}.ui-slider-vertical .ui-slider-handle{left: -.3em;margin-left: 0;margin-bottom: -.6em;}.ui-slider-vertical .ui-slider-range{left: 0;width: 100%;}.ui-slider-vertical .ui-slider-range-min{bottom: 0;}.ui-slider-vertical .ui-slider-range-max{top: 0;}.ui-spinner{position: relative;display: inline-block;overflow: hidden;padding: 0;vertical-align: middle;}.ui-spinner-input{border: none;background: none;color: inherit;padding: 0;margin: .2em 0;vertical-align: middle;margin-left: .4em;margin-right: 22px;}.ui-spinner-button{width: 16px;height: 50%;font-size: .5em;padding: 0;margin: 0;text-align: center;position: absolute;cursor: default;display: block;overflow: hidden;right: 0;}.ui-spinner a.ui-spinner-button{border-top: none;border-bottom: none;border-right: none;}.ui-spinner .ui-icon{position: absolute;margin-top: -8px;top: 50%;left: 0;}.ui-spinner-up{top: 0;}.ui-spinner-down{bottom: 0;}.ui-spinner .ui-icon-triangle-1-s{background-position: -65px -16px;}.ui-tabs{position: relative;padding: .2em;}.ui-tabs .ui-tabs-nav{margin: 0;padding: .2em .2em 0;}.ui-tabs .ui-tabs-nav li{list-style: none;float: left;position: relative;top: 0;margin: 1px .2em 0 0;border-bottom-width: 0;padding: 0;white-space: nowrap;}.ui-tabs .ui-tabs-nav .ui-tabs-anchor{float: left;padding: .5em 1em;text-decoration: none;}.ui-tabs .ui-tabs-nav li.ui-tabs-active{margin-bottom: -1px;padding-bottom: 1px;}.ui-tabs .ui-tabs-nav li.ui-tabs-active .ui-tabs-anchor,.ui-tabs .ui-tabs-nav li.ui-state-disabled .ui-tabs-anchor,.ui-tabs .ui-tabs-nav li.ui-tabs-loading .ui-tabs-anchor{cursor: text;}.ui-tabs-collapsible .ui-tabs-nav li.ui-tabs-active .ui-tabs-anchor{cursor: pointer;}.ui-tabs .ui-tabs-panel{display: block;border-width: 0;padding: 1em 1.4em;background: none;}.ui-tooltip{padding: 8px;position: absolute;z-index: 9999;max-width: 300px;-webkit-box-shadow: 0 0 5px #aaa;box-shadow: 0 0 5px #aaa;}body .ui-tooltip{border-width: 2px;}.ui-widget{font-family: Lucida Grande,Lucida Sans,Arial,sans-serif;font-size: 1.1em;}.ui-widget .ui-widget{font-size: 1em;}.ui-widget input,.ui-widget select,.ui-widget textarea,.ui-widget button{font-family: Lucida Grande,Lucida Sans,Arial,sans-serif;font-size: 1em;}.ui-widget-content{border: 1px solid #a6c9e2;background: #fcfdfd 50% bottom repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAABkEAIAAACY3hF0AAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAYklEQVQoz+3PMQqAMBQE0cmKYJFKRYMJiCAoev/b+cVCSG2ZwuoVAwvLdZmZCQB+voA1d33XItLSipmeXiyMjGJjYsqcJJLcQSKJjUgU+9tWAkEsbnBDHuvweFEhVMTbcnkARNMN2kh7KjEAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTQtMDUtMDRUMTk6NTU6MTgtMDc6MDD1TBQ3AAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE0LTA1LTA0VDE5OjU1OjE4LTA3OjAwhBGsiwAAAABJRU5ErkJggg==');color: #222222;}.ui-widget-content a{color: #222222;}.ui-widget-header{border: 1px solid #4297d7;background: #5c9ccc 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAABkEAIAAACvNYlpAAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAV/klEQVR42u2dT4xd113Hz31+GxBShNlRO80iWVpRNx0RKhZILEISCYkU0EwWpLRCoShSDAsHgfCm2IGmqRypIIGURGRe5IQNi9gNu5LQdLxwaAYWsc3GGbIjYHVTVfa7LO4kufaZ85vv75xz77vP+XwWyfO95/zO7/f9nX8zc969zfO/+C9fuvZzAQAAAAAAJsxs1Q4AAAAAAMDhsHEHAAAAAFgD2LgDAAAAAKwBbNwBAAAAANYANu4AAAAAAGsAG3cAAAAAgDWAjTsAAAAAwBrAxh0AAAAAYA1g4w4AAAAAsAawcQcAAAAAWAPYuAMAAAAArAFs3AEAAAAA1gA27gAAAAAAawAbdwAAAACANYCNOwAAAADAGsDGHQAAAABgDWDjDgAAAACwBhyycW+32512z76iX0+VsVsvsWxfT1lIRR2XSXmo2M9TI6/1PMW8OtgWSrLvzW+J5kotfVzYcXmt6Zn1xqtkVlFMiVHPptLT8kZTOXmjwGs5ddfb8/W6igVvLEOMfaWVcq28epaMBX22UfLinUMUhfXyenR6K+V3S9bEcgVK9Mzr4d61Js++HpFt37sfK1dViaVk/vGW0Vtsvn3hrZ9d/Z+8UAEAAAAAYBw8R2UWYSfs7f93CtT1JGXNbmW1anh9U67Ed6eQ93FybSsQ1/Uqo5S0czROLsrtDzdqvBp62xqzn9fqhyXWpqBPLZt5ec9rvWTsl2ieN4fX1SFvjkr14XL/bTt186tfKRmheQw3r+qZylutSkaHNyJ7NfdayPPEazm63nz7ibfevvrjCjIBAAAAAMBgzMMi7IQPV+0GAAAAAABY8FQZAAAAAIA1gI07AAAAAMAaMG+3w6Ww12yFL4dj/Rvd9bhCV7Jfq1+ybydVJrZju5hqRb+ifM7zKqVVSk+7dV1nXUklR3p30fVRWld8SHkb66NbU/qJnusS9WrpWRK1Vxm9bnmWFfvKGLFr6e3mqZryR8+jd9atpZvSK1LWlDlQ6S3lvSsvd3nlvSM6ruuNKK8/eOc6fb3LWz2989gQ6+M4WfaSt+PqW9B3Qan5Ki8v3ui8JUv2ciWZzYsxpaSSiwNq/c1jb33x6p+HzbDxacK6b7CmrqS+99ov36dfvm9Bb9G2mbLstRBHkfI81a6tg92uTSo6xfNaZXRl7FwoWikqKbEoSqbaVfp/XvYVJW3fUhHZnqfsKDlSRpOumGJB0WcIy3r/8faTlFd6jhS1vX1G7422V14UBbxrkKKVrY8+UvTW7TJKW7Wi9s7btod1Y8/zR9mT5I0mpbyyxqWi1q3ZudN3PiX7OiU67xqkZ1yZS5W8295693vevaLel1K69fhk4w4AAAAAABNm3i7aqTyXHQAAAAAAEvDlVAAAAACANYCNOwAAAADAGjAP27yACQAAAABg6swzn3MCAAAAAAAjwlEZAAAAAIA1YN7Kv3FvNsNGOKaX79fqPtt18+zXtVPLhzFb6VuzLQ9xt4meM5rXQ1KWFWu2AuP3K8WH1BWvhnHsdbNQS6vhemaJJyWz0xBqe22OM5PUyo5us8RzpaSu8BCerGqVmcIK67WgzO3d5zHnLj3LtXwbrs+U7OvG3NF1n+uu8uOMiPIdzgE2n3vu+79w5X9LnAYAAAAAgKGZ3/avRbsTPgybzUY4vv85j74Fr7W4fHel72GeJ3p5uy07Ot2CHlF5RryK9elHGvts+5bSpzyWPDt6LUWHWA0ldruW7aeShdjDVHnFk7q+2dqmYtG1svvbEOOoZH7L860kirra1tUt1YeV2UMfF6m6qXbz5r0hUMa1opIyNpVe4W19CE9sy7VGirdkngJenRVrqf6sK59nwbasRGRn07vrUGx60X3TdZC1bZ578OJ/Xnnf7TQAAAAAAIwIX04FAAAAAFgD5u12uHTo0fj+8fnoy4hS+dQB/L61roxiPy6ve5gqaVuwI9JbTGGrlCqpq5cqr2QhpbPXtzz1UhqmcpTyQbGT1zcUnb1ZS/mZ54mdQaW329F5+4Bd0pt9Pe96T9PVVuYNva7SW/S85OXO9t/WR5/57Vp5uShRWI8lb9ylvMrzTeldXrwjVJ/V87TV+7+ShTgub59RIlV6gneO8vbYkplE0dPWyhtReY+yM+tVLLam9yXbq1padV/PPXvfxS9d+YuwGQ4+P/dZ0Q/3y/Q/K+W9d+8mSiKN605BtyF8SNlUri96rw9LaTUF3YbQxy6Z139qlZka3j42vj/jeDiF3I3pw9TyPkQsU6bWCjjmulPLZl7f0+8q6+DUWO36kmc5b/0dOK5PNu4AAAAAADBhZu12uxP2+v+1K8QlFQupWt7Pqbt5raQspPy327Wj9ipc4oPSru2JoqQ313ruvCop/gQZW7G8Hq5nUM9+iX1ljNh3varqNmv1TK8d7/Va40v31qtSXqRe/+1a3plK90GJPS+zJZbtzHpHqDKre1dtr528nqwr4C2pt17SK7x6ev1U1Mi7rsSVp5sedd3dQsqmN4N6vCX7E2/dvPmnOfNvF3525cnb7tc6OVd+7twuX8vDIU6U5vlfokP5edmSs3feHOWdH83LrFfDvG9x6Bn0nkSspYnieck3TEpO/3v9L+l1Q4/loZWM63Z49Veu9y3nzSd9vPNPSf/XvxehqKHnyzvT1sq+0ge8sei1lNZLZte8bwcp34Qp+Y5Nre8+DZeLvG+GDIF3Pilvq/w7YCUWyneDJs2Zb154+8pvVBALAAAAAAAGg8dBAgAAAACsAfP2kXAuvNtshY1wvN0OOW+QctK11X2OWyz3ZIhYUjb71/V2UwrE18tt6nHFbeUpqWhVKy/lutke6n21Vq+uq7mtUi3llXi9ceVZKNFZz+YQ+nhtpnzz9thx5nxbGX12je3o/SE1S8R2lL4xtG4lc1F8XYnRvq63VTLGlax5Led51W/R60Oq9bgP1+pRuod1V4G8/Ykee8ndutjjMaVnyYiw7Td/9cSFez/4v/07m2GjORYWYaeNTnQ1vZNYB97tX++Xt2ul7ir+pGrpZWz01hXdbDW8llN1dbUV/fOULM9sXFf3tiQKu0yez3b/UfLita9El2rF/myroSvcx5437KiVecbOkVcrvRU7upTO3ru6V/qot+dzr8J2XHoWFLyRem0O58PQs7F3lJVrVb7+lmhVax1RsqnMhN7ZUhnv9l1l3ak1Y6Tq6tfjWPSVyNsrvCuybiflj50vb6QhhDs37gAAAAAAMEnmYZH/WDdYX9pHwovh3Vsnlg+3967Wk+XZ9nT70PJ77f3hhVWrEvl2vb3Y/m57o90Kb4zT4pETs4+b5arj/oz52dkDzRfKv+8/e6c52nxn9k5zNDy/6pgAAADWleZbr735zx98f9VuDEX7t+394YXl9fZi+ztK+W4j294IGRu1/U3wIufE1c1Ty2vtR3k/RN08tbza/vcw+gFMhf0fIUyae5pXw+NHdmcXm+uHlHyquRZOzt5pjjaH/CDR/SjVvBmeDr+SKjO7t3m4eb15qrkWnlm1TgAAcDfTfOuxN//sg79P3b51Znm6fai9EbbCPyVtPNqeC+/eOtEe+rvb/W3xI+FceDdVpr3RPtG+cevE8uFwmLXd5dF2NsgpOgCAcjbDRnMs9VeU2TvN0fCd2b2zh5vz/evdDwnxjx/dDwbdDwn960eebU43P2zuabbD46sOGAAAhqU5+ZPXH9/9r1W7AQAANZmfmH3ctPExp/nZ2QOzA44/HTk7u/+gv2nMzxx5oPnl/pX9Hy0mdqwLAGC1dL9Qjn89ffPZW1fbjw4of2p57Y4TE4uwE/ZunlpeXR50fXd5tG2ak3/3+vHdH6w6WAAAWG9SG/rmzfB0c9DfEO5pXg2Pz041p5sf3nF9O3y1+0tCsq23m18Kz8++OLvj7w8A8PlhuX+8+eDvobU3whPtG7fOLP8yPJSysH9a5NH2xfCj+O7N95dH2yY+2ZHaoI9Dc/LXzn+0uz1+wwAAAMMxu3f2m8357khSssypww8aHTkx+7hpm63EI95CCCHMr8+2mg2Hc5vNRuiOUbWr1gk+NyzanbB3a3d5tG30SsuvtB+3f7K83l4M0ncFOz47Gt0mt7bLs8vT4VfbG2GrPXDb3W6FN6bwCI2p0Tzz3Plnd/84eX8rbIRjYTtYX5pUyqyWcg9jC/0rqbsdcbu1FKur/Jh5XF/Pp+yP3m5JyVTd1IhQypf4mRprU+sVOormQ+Q6r26e/ThrSp8p0bPPEK3U0kRW2/2jQo/9Hxi2cp4W1Ww2G+FYW/w8OtvO/MyRQ7+MHrM8uzwdHlreaA/cCA5HF0v3ORVR+73wQHhheX154cBHZXQWnKp++nvfF8O7I/VnfZzWGgXDjaapIfvcPPPg+V/f/a1V+wsAAAAAABbzdr1+IgEAAAAA+FzSvYDJ/dxxAAAAAAAYkznPQQcAAAAAmD4clQEAAAAAWAPm3XtPDym12WyE47cdqumudHTX4zKKHYW4Lb1WrYNAKQVS9vt363pSErsehTfe4ZTPa6XE/3Kt4rsdJf4Mre0Q/blW7xp/BMWtd9Qa0XXnh7wZcri27Oh0b6c258T+96OolYVasQytiaKDV426Iyt1XRnRJdksn83s1r2zhzIeh9urlKy8ddedMT0fQrfelebpC6/96/t/XaEZAAAAAAAYjHn3GtVVuwEAAAAAABZs3AEAAAAA1oDuy6k8DhIAAAAAYNLMva/YBQAAAACA8Zm3j4Rz7WFPlQEAAAAAgJXCGXcAAAAAgDVg3i7CJTbuAAAAAADTZh62OeMOAAAAADB1uqMyPFUGAAAAAGDSdI+DPOg37v2z75thIxxLlkndVfBaiE/k57WuRGd7qHherk8t6npia9JRt8/0a5VkZGgl9X7lbdGrqqJYSaS1LAydtZKRPkQ2vT7HretzYF39y0f3ECM35ZXe/8u9Khlrtqrlytg2va0rM3+fEvX03mu36F07lB7lzaPXn+HwRpc3K+ZpNZwa3hlgiPW0qs/NH9336k9//IUBmwcAAAAAgGLm7XbYaTkqAwAAAAAwaXgcJAAAAADAGjAPPA4SAAAAAGDydF9O5agMAAAAAMCkmYdH23PhR/v/qvvt9TzyngCQ5890nvqyjlGUPA1gHK30pyKM79uY/tTyoeTJCd5a+pUSPVNPpRgza3lPPFD0/DxQkqnyZ4vpHvZbmfLTlkqe+JFXxvtUn5KclttMWfbqMAR5PU2xWet5R1Po+cNh74JqxbUIO2Gv+cPX/vHUv3911REDAAAAAIAFL2ACAAAAAFgD5i1PlQEAAAAAmDzzsN2ycQcAAAAAmDjzsAiXWjbuAAAAAACTpjsqwxl3AAAAAIBJMw/bYSfshUW7E/bCZhM99Kd3kKa7myqZwlverrWIDvakvOpfSd2N7eh1U9ZsleKSetSKGooyugIpm3le6XXzdNPzqPTJvLq2qkostg51o87rGwoloz4VUf+6fUXxPFYmtqZn3Dsf6m0t5KOMqVi8atfCVrjcWp56tVYufTSlNE+RNy/pKsWeKJqkspmyoM/w3nlMr5UqqWfWuwqU7EN0bb14+0xKKz1Titp5K3KsjDcir828+V/RQV87Ij+bbzz4yk/fe6H7R/cypmYrbITj/Rcz9a/En/t1++X7zcTllbt2rbhkfN32PK6ltGW3bmuiRFTira1Diba2Bd23WB87CkU327K3J3t10FXScx0EvOX1WrZ6Xv1133Q9+1dKFND110eW3Yqij+KVEoWSO135VLt9++XzgN4/U63kRa0rE8ebNw97y+hj1uuzt4/Z9r350mPRvS3JoLKu6T54x7I3I4qeug66tVprt1eB4Sj3oe6KbFtrvv4fr/zgvZO3XVuvB+B7X6LRp/y1AiUvfMl7uVLJ61f0l5XUfQ2W9/VMJa/kUNpSNBz6VV8jvqzhtiveV5+UjIjyl3SUv4ZMfyFLrbFfq5fmteJFf+GO4n9eP7dbTz33rNaLfnTNbct9r4Z4qVnKB6WH2/a9vdGbi7y2bP9rzfN5eF8CVXcmHHNOrvtqxZIdiPKyvFo9oSRfea04W2y+ft8rv/3eQ5lpAAAAAACAUZh3/2u37+anuTdbYSMcu7tjHIJxdCM7U+ZuzY43rrj8+iqzvp5Pjb6StVQt75lDRzrlVur6Of5IWfcWmVvGofmDb7780XtN8v5m8+VwPCzaS3ecxktd9xLb6a50dNdTZVJ3lbb0uPLsp+720f3Pi7ckF7pXcSyp6BR9SnqakrvYQ28rSos2eix2+ZS2tXqsV4e+t7E/tg55/STVSt684e3zqewouRszL14l8yzbuVD0rDWn6Zn19oeSvAw31uy2ailcPpMrOdLj8vqWN/brrrwlOxl9trfn3rrjsXz3VbLuK+tvSRRD73K9Lfai+2Tjvgg77V7YDBtNdDbo0+vd530TvSvx3WQAPfve8nEt29tUK/HdOJZUW3b5FKlatn2lbqr1lGVbgby8KzqnfFO0tTNu9yU7m0q8ih29vIJe186OroDd6/QolPFoa6jMKvqcoPus50gfxYo+tp+Ktbzepc8e5bWUu15r/TLelUhXtWQU2wrYM7wer61k+Yyqz3v6TKjny5sLvUeV+OCdnWxVUx4qfuq9qHxFK1db0SFvFU557o2l1mpVsp9UvFqEnXav+dqFl09d3gkAAAAAADBh5snvidvY3/cfjrx2a3m7qqhrMZz/01Qm5ZX9XfXxNfGqZ8c1dBaGaKUkoun0vSl4OwU1avXnu4/Vrl9TizH1VJBxWrybKI+rfMyOsy6Mn8FaPnifmmV60nxt9vLPX/5u78bxsAg74cP9z581c9CVg00fv+2uXqtPv0W9VqpuSVypiFIe6u0qmtueqMk+7raWUimV2VRcKZ3t/mB7YudF8VmPWtEwpqR1JUb9ijL6bE/y5gHbmm15aJ1ty94Yvb1OiSVuVx87XlXt63l1U/7bM7NCyQyZUt7OgtKWMjfaduycKmrYmus+582NJRnJu1tSPm/GsPuPEoU+avLGSK1RZketrzW6D3k92W5LyZQ+W3pzapePW9RjWYSd8GHz5Gsv7V7+U3c6AQAAAABgRD45KjPmn/Dsgwrj/9GnxGbeH/tSCpT8MSXv+Iftf91eMfRBnTzdbA/1vlqrVw83Eoc4IKTnepw/xZborGdzCH28NlO+eXvsqo4NKJ6kMtJH7w+pWSK2o/SN8Q+k5c0weoz2db2tukf+hljXlLr9Fr0+pFqP+3CtHqV7WHcVyNufxKQs2PbHnMHs8ZiKomREmPabJx976R8u/17bnZuxxe3hLV9is+2727ubuq5YbiMpvRZSZRRr3lr91uPyqehSdxVPFH903eLrKW/1Vuy4UgrYSqYsezUs6Wl6jLZK5SO0POrh/FGyr6idlx3vSKnVe3WVvBGVa+iNUS8zDrVmUUUTW9W8Ua94681I3gxQa2yWqDF0fnXfakU33CguWQeVusOtBf0reWturVHjVbtkvdj//Ps/eekbl7+SJx8AAAAAAIzD/OZTtzaW3121GwAAAAAAYPH/1x9Z4wulgvoAAAAldEVYdGRhdGU6Y3JlYXRlADIwMTQtMDUtMDRUMTk6NTU6MjYtMDc6MDAr/GiJAAAAJXRFWHRkYXRlOm1vZGlmeQAyMDE0LTA1LTA0VDE5OjU1OjI2LTA3OjAwWqHQNQAAAABJRU5ErkJggg==');color: #ffffff;font-weight: bold;}.ui-widget-header a{color: #ffffff;}.ui-state-default,.ui-widget-content .ui-state-default,.ui-widget-header .ui-state-default{border: 1px solid #c5dbec;background: #dfeffc 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAGQEAIAAACwqkHPAAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAk0lEQVRIx+3UIQrCABhH8ff9g8EggoKgA5mITe9hsFi8gDuFwewJdgHtYjTZ9Q5aRBjCBNnSNmzewOSXfu3FR3LOokoCAMdxHOfXcL2maVFwm71GZU2Ws6Ija9mGrmxMTCBb2oGBFNmBkMflfS+P0tpODEn22aKCZzuvV6Fsypa+bGIxwTe2szlN0aOBD95xnL/nA7WPJ+2NbKMjAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE0LTA1LTA0VDE5OjU1OjI2LTA3OjAwK/xoiQAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxNC0wNS0wNFQxOTo1NToyNi0wNzowMFqh0DUAAAAASUVORK5CYII=');font-weight: bold;color: #2e6e9e;}.ui-state-default a,.ui-state-default a:link,.ui-state-default a:visited{color: #2e6e9e;text-decoration: none;}.ui-state-hover,.ui-widget-content .ui-state-hover,.ui-widget-header .ui-state-hover,.ui-state-focus,.ui-widget-content .ui-state-focus,.ui-widget-header .ui-state-focus{border: 1px solid #79b7e7;background: #d0e5f5 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAGQEAIAAACwqkHPAAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAjklEQVRIx+3PoQ4BARzH8e/vl/STBEkz7yDQbIImunQewCtoHkSSdfWK2S4pprE56XbbjeAZjPBPn/BNX87VfV9VBoAgCILg6zyLqt801kZTda0hO0Z2qgMTa62CmZ0LLexcL1K7VKLMLpWwtHLBpym1t7ox53J8ZLW4JmWnHpsTKwZWjzat/5gOgiD4HW/gtCd0DyuhYAAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxNC0wNS0wNFQxOTo1NToyNy0wNzowMI2LYz0AAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTQtMDUtMDRUMTk6NTU6MjctMDc6MDD81tuBAAAAAElFTkSuQmCC');font-weight: bold;color: #1d5987;}.ui-state-hover a,.ui-state-hover a:hover,.ui-state-hover a:link,.ui-state-hover a:visited,.ui-state-focus a,.ui-state-focus a:hover,.ui-state-focus a:link,.ui-state-focus a:visited{color: #1d5987;text-decoration: none;}.ui-state-active,.ui-widget-content .ui-state-active,.ui-widget-header .ui-state-active{border: 1px solid #79b7e7;background: #f5f8f9 50% 50% repeat-x url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAABkEAIAAACY3hF0AAAABmJLR0T///////8JWPfcAAAACXBIWXMAAABIAAAASABGyWs+AAAAi0lEQVQoz+3PIQ8BcRjA4d+9gc0m2Gg0STeFTTDJpjv12hW+gm8jC5pJoo+g2gTBzt37f98zX0G8ID35IcuKQlUA4M8v8O5pO7SEmCkjIWHOmHyh93Ahv4aZdSTaEbOkuJnYEU0t8Sb6tLOvCVvv+p7w8I2/sJWfyiF28E+ZCpNoQF9oUKdWiW11+QL3bzY9wDlB+AAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAxNC0wNS0wNFQxOTo1NToyNi0wNzowMCv8aIkAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMTQtMDUtMDRUMTk6NTU6MjYtMDc6MDBaodA1AAAAAElFTkSuQmCC');font-weight: bold;color: #e17009;}.ui-state-active a,.ui-state-active a:link,.ui-state-active a:visited{color: #e17009;text-decoration: none;}.ui-state-highlight,.ui-widget-content .ui-state-highlight,.ui-widget-header .ui-state-highlight{border: 1px solid #fad42e;background: #fbec88 url(\"images/ui-bg_flat_55_fbec88_40x100.png\") 50% 50% repeat-x;color: #363636;}.ui-state-highlight a,.ui-widget-content .ui-state-highlight a,.ui-widget-header .ui-state-highlight a{color: #363636;}.ui-state-error,.ui-widget-content .ui-state-error,.ui-widget-header .ui-state-error{border: 1px solid #cd0a0a;background: #fef1ec url(\"images/ui-bg_glass_95_fef1ec_1x400.png\") 50% 50% repeat-x;color: #cd0a0a;}.ui-state-error a,.ui-widget-content .ui-state-error a,.ui-widget-header .ui-state-error a{color: #cd0a0a;}.ui-state-error-text,.ui-widget-content .ui-state-error-text,.ui-widget-header .ui-state-error-text{color: #cd0a0a;}.ui-priority-primary,.ui-widget-content .ui-priority-primary,.ui-widget-header .ui-priority-primary{font-weight: bold;}.ui-priority-secondary,.ui-widget-content .ui-priority-secondary,.ui-widget-header .ui-priority-secondary{opacity: .7;filter:Alpha(Opacity=70);font-weight: normal;}.ui-state-disabled,.ui-widget-content .ui-state-disabled,.ui-widget-header .ui-state-disabled{opacity: .35;filter:Alpha(Opacity=35);background-image: none;}.ui-state-disabled .ui-icon{filter:Alpha(Opacity=35);}.ui-icon{width: 16px;height: 16px;}.ui-icon,.ui-widget-content .ui-icon{background-image: url(\"images/ui-icons_469bdd_256x240.png\");}.ui-widget-header .ui-icon{background-image: url(\"images/ui-icons_d8e7f3_256x240.png\");}.ui-state-default .ui-icon{background-image: url(\"images/ui-icons_6da8d5_256x240.png\");}.ui-state-hover .ui-icon,.ui-state-focus .ui-icon{background-image: url(\"images/ui-icons_217bc0_256x240.png\");}.ui-state-active .ui-icon{background-image: url(\"images/ui-icons_f9bd01_256x240.png\");}.ui-state-highlight .ui-icon{background-image: url(\"images/ui-icons_2e83ff_256x240.png\");}.ui-state-error .ui-icon,.ui-state-error-text .ui-icon{background-image: url(\"images/ui-icons_cd0a0a_256x240.png\");}.ui-icon-blank{background-position: 16px 16px;}.ui-icon-carat-1-n{background-position: 0 0;}.ui-icon-carat-1-ne{background-position: -16px 0;}.ui-icon-carat-1-e{background-position: -32px 0;}.ui-icon-carat-1-se{background-position: -48px 0;}.ui-icon-carat-1-s{background-position: -64px 0;}.ui-icon-carat-1-sw{background-position: -80px 0;}.ui-icon-carat-1-w{background-position: -96px 0;}.ui-icon-carat-1-nw{background-position: -112px 0;}.ui-icon-carat-2-n-s{background-position: -128px 0;}.ui-icon-carat-2-e-w{background-position: -144px 0;}.ui-icon-triangle-1-n{background-position: 0 -16px;}.ui-icon-triangle-1-ne{background-position: -16px -16px;}.ui-icon-triangle-1-e{background-position: -32px -16px;}.ui-icon-triangle-1-se{background-position: -48px -16px;}.ui-icon-triangle-1-s{background-position: -64px -16px;}.ui-icon-triangle-1-sw{background-position: -80px -16px;}.ui-icon-triangle-1-w{background-position: -96px -16px;}.ui-icon-triangle-1-nw{background-position: -112px -16px;}.ui-icon-triangle-2-n-s{background-position: -128px -16px;}.ui-icon-triangle-2-e-w{background-position: -144px -16px;}.ui-icon-arrow-1-n{background-position: 0 -32px;}.ui-icon-arrow-1-ne{background-position: -16px -32px;}.ui-icon-arrow-1-e{background-position: -32px -32px;}.ui-icon-arrow-1-se{background-position: -48px -32px;}.ui-icon-arrow-1-s{background-position: -64px -32px;}.ui-icon-arrow-1-sw{background-position: -80px -32px;}.ui-icon-arrow-1-w{background-position: -96px -32px;}.ui-icon-arrow-1-nw{background-position: -112px -32px;}.ui-icon-arrow-2-n-s{background-position: -128px -32px;}.ui-icon-arrow-2-ne-sw{background-position: -144px -32px;}.ui-icon-arrow-2-e-w{background-position: -160px -32px;}.ui-icon-arrow-2-se-nw{background-position: -176px -32px;}.ui-icon-arrowstop-1-n{background-position: -192px -32px;}.ui-icon-arrowstop-1-e{background-position: -208px -32px;}.ui-icon-arrowstop-1-s{background-position: -224px -32px;}.ui-icon-arrowstop-1-w{background-position: -240px -32px;}.ui-icon-arrowthick-1-n{background-position: 0 -48px;}.ui-icon-arrowthick-1-ne{background-position: -16px -48px;}.ui-icon-arrowthick-1-e{background-position: -32px -48px;}.ui-icon-arrowthick-1-se{background-position: -48px -48px;}.ui-icon-arrowthick-1-s{background-position: -64px -48px;}.ui-icon-arrowthick-1-sw{background-position: -80px -48px;}.ui-icon-arrowthick-1-w{background-position: -96px -48px;}.ui-icon-arrowthick-1-nw{background-position: -112px -48px;}.ui-icon-arrowthick-2-n-s{background-position: -128px -48px;}.ui-icon-arrowthick-2-ne-sw{background-position: -144px -48px;}.ui-icon-arrowthick-2-e-w{background-position: -160px -48px;}.ui-icon-arrowthick-2-se-nw{background-position: -176px -48px;}.ui-icon-arrowthickstop-1-n{background-position: -192px -48px;}.ui-icon-arrowthickstop-1-e{background-position: -208px -48px;}.ui-icon-arrowthickstop-1-s{background-position: -224px -48px;}.ui-icon-arrowthickstop-1-w{background-position: -240px -48px;}.ui-icon-arrowreturnthick-1-w{background-position: 0 -64px;}.ui-icon-arrowreturnthick-1-n{background-position: -16px -64px;}.ui-icon-arrowreturnthick-1-e{background-position: -32px -64px;}.ui-icon-arrowreturnthick-1-s{background-position: -48px -64px;}.ui-icon-arrowreturn-1-w{background-position: -64px -64px;}.ui-icon-arrowreturn-1-n{background-position: -80px -64px;}.ui-icon-arrowreturn-1-e{background-position: -96px -64px;}.ui-icon-arrowreturn-1-s{background-position: -112px -64px;}.ui-icon-arrowrefresh-1-w{background-position: -128px -64px;}.ui-icon-arrowrefresh-1-n{background-position: -144px -64px;}.ui-icon-arrowrefresh-1-e{background-position: -160px -64px;}.ui-icon-arrowrefresh-1-s{background-position: -176px -64px;}.ui-icon-arrow-4{background-position: 0 -80px;}.ui-icon-arrow-4-diag{background-position: -16px -80px;}.ui-icon-extlink{background-position: -32px -80px;}.ui-icon-newwin{background-position: -48px -80px;}.ui-icon-refresh{background-position: -64px -80px;}.ui-icon-shuffle{background-position: -80px -80px;}.ui-icon-transfer-e-w{background-position: -96px -80px;}.ui-icon-transferthick-e-w{background-position: -112px -80px;}.ui-icon-folder-collapsed{background-position: 0 -96px;}.ui-icon-folder-open{background-position: -16px -96px;}.ui-icon-document{background-position: -32px -96px;}.ui-icon-document-b{background-position: -48px -96px;}.ui-icon-note{background-position: -64px -96px;}.ui-icon-mail-closed{background-position: -80px -96px;}.ui-icon-mail-open{background-position: -96px -96px;}.ui-icon-suitcase{background-position: -112px -96px;}.ui-icon-comment{background-position: -128px -96px;}.ui-icon-person{background-position: -144px -96px;}.ui-icon-print{background-position: -160px -96px;}.ui-icon-trash{background-position: -176px -96px;}.ui-icon-locked{background-position: -192px -96px;}.ui-icon-unlocked{background-position: -208px -96px;}.ui-icon-bookmark{background-position: -224px -96px;}.ui-icon-tag{background-position: -240px -96px;}.ui-icon-home{background-position: 0 -112px;}.ui-icon-flag{background-position: -16px -112px;}.ui-icon-calendar{background-position: -32px -112px;}.ui-icon-cart{background-position: -48px -112px;}.ui-icon-pencil{background-position: -64px -112px;}.ui-icon-clock{background-position: -80px -112px;}.ui-icon-disk{background-position: -96px -112px;}.ui-icon-calculator{background-position: -112px -112px;}.ui-icon-zoomin{background-position: -128px -112px;}.ui-icon-zoomout{background-position: -144px -112px;}.ui-icon-search{background-position: -160px -112px;}.ui-icon-wrench{background-position: -176px -112px;}.ui-icon-gear{background-position: -192px -112px;}.ui-icon-heart{background-position: -208px -112px;}.ui-icon-star{background-position: -224px -112px;}.ui-icon-link{background-position: -240px -112px;}.ui-icon-cancel{background-position: 0 -128px;}.ui-icon-plus{background-position: -16px -128px;}.ui-icon-plusthick{background-position: -32px -128px;}.ui-icon-minus{background-position: -48px -128px;}.ui-icon-minusthick{background-position: -64px -128px;}.ui-icon-close{background-position: -80px -128px;}.ui-icon-closethick{background-position: -96px -128px;}.ui-icon-key{background-position: -112px -128px;}.ui-icon-lightbulb{background-position: -128px -128px;}.ui-icon-scissors{background-position: -144px -128px;}.ui-icon-clipboard{background-position: -160px -128px;}.ui-icon-copy{background-position: -176px -128px;}.ui-icon-contact{background-position: -192px -128px;}.ui-icon-image{background-position: -208px -128px;}.ui-icon-video{background-position: -224px -128px;}.ui-icon-script{background-position: -240px -128px;}.ui-icon-alert{background-position: 0 -144px;}.ui-icon-info{background-position: -16px -144px;}.ui-icon-notice{background-position: -32px -144px;}.ui-icon-help{background-position: -48px -144px;}.ui-icon-check{background-position: -64px -144px;}.ui-icon-bullet{background-position: -80px -144px;}.ui-icon-radio-on{background-position: -96px -144px;}.ui-icon-radio-off{background-position: -112px -144px;}.ui-icon-pin-w{background-position: -128px -144px;}.ui-icon-pin-s{background-position: -144px -144px;}.ui-icon-play{background-position: 0 -160px;}.ui-icon-pause{background-position: -16px -160px;}.ui-icon-seek-next{background-position: -32px -160px;}.ui-icon-seek-prev{background-position: -48px -160px;}.ui-icon-seek-end{background-position: -64px -160px;}.ui-icon-seek-start{background-position: -80px -160px;}.ui-icon-seek-first{background-position: -80px -160px;}.ui-icon-stop{background-position: -96px -160px;}.ui-icon-eject{background-position: -112px -160px;}.ui-icon-volume-off{background-position: -128px -160px;}.ui-icon-volume-on{background-position: -144px -160px;}.ui-icon-power{background-position: 0 -176px;}.ui-icon-signal-diag{background-position: -16px -176px;}.ui-icon-signal{background-position: -32px -176px;}.ui-icon-battery-0{background-position: -48px -176px;}.ui-icon-battery-1{background-position: -64px -176px;}.ui-icon-battery-2{background-position: -80px -176px;}.ui-icon-battery-3{background-position: -96px -176px;}.ui-icon-circle-plus{background-position: 0 -192px;}.ui-icon-circle-minus{background-position: -16px -192px;}.ui-icon-circle-close{background-position: -32px -192px;}.ui-icon-circle-triangle-e{background-position: -48px -192px;}.ui-icon-circle-triangle-s{background-position: -64px -192px;}.ui-icon-circle-triangle-w{background-position: -80px -192px;}.ui-icon-circle-triangle-n{background-position: -96px -192px;}.ui-icon-circle-arrow-e{background-position: -112px -192px;}.ui-icon-circle-arrow-s{background-position: -128px -192px;}.ui-icon-circle-arrow-w{background-position: -144px -192px;}.ui-icon-circle-arrow-n{background-position: -160px -192px;}.ui-icon-circle-zoomin{background-position: -176px -192px;}.ui-icon-circle-zoomout{background-position: -192px -192px;}.ui-icon-circle-check{background-position: -208px -192px;}.ui-icon-circlesmall-plus{background-position: 0 -208px;}.ui-icon-circlesmall-minus{background-position: -16px -208px;}.ui-icon-circlesmall-close{background-position: -32px -208px;}.ui-icon-squaresmall-plus{background-position: -48px -208px;}.ui-icon-squaresmall-minus{background-position: -64px -208px;}.ui-icon-squaresmall-close{background-position: -80px -208px;}.ui-icon-grip-dotted-vertical{background-position: 0 -224px;}.ui-icon-grip-dotted-horizontal{background-position: -16px -224px;}.ui-icon-grip-solid-vertical{background-position: -32px -224px;}.ui-icon-grip-solid-horizontal{background-position: -48px -224px;}.ui-icon-gripsmall-diagonal-se{background-position: -64px -224px;}.ui-icon-grip-diagonal-se{background-position: -80px -224px;}.ui-corner-all,.ui-corner-top,.ui-corner-left,.ui-corner-tl{border-top-left-radius: 5px;}.ui-corner-all,.ui-corner-top,.ui-corner-right,.ui-corner-tr{border-top-right-radius: 5px;}.ui-corner-all,.ui-corner-bottom,.ui-corner-left,.ui-corner-bl{border-bottom-left-radius: 5px;}.ui-corner-all,.ui-corner-bottom,.ui-corner-right,.ui-corner-br{border-bottom-right-radius: 5px;}.ui-widget-overlay{background: #aaaaaa url(\"images/ui-bg_flat_0_aaaaaa_40x100.png\") 50% 50% repeat-x;opacity: .3;filter: Alpha(Opacity=30);}.ui-widget-shadow{margin: -8px 0 0 -8px;padding: 8px;background: #aaaaaa url(\"images/ui-bg_flat_0_aaaaaa_40x100.png\") 50% 50% repeat-x;opacity: .3;filter: Alpha(Opacity=30);border-radius: 8px;}</style>\n<style type=\"text/css\" media=\"screen,print\">*{font-family: LiberationSans,arial,sans-serif;line-height: 140%;}html,body{margin: 0px;padding: 0px;background-color: white;}img{border: 0;}ul,ol{padding: 0px;}a{text-decoration: none;color: #3b73b8;}select{padding: 1px;}a:hover{text-decoration: underline;}input[type=text],input[type=password],input[type=email],textarea{border: 1px solid #aaa;padding: 5px;}#header{background-color: #b40303;height: 50px;position: fixed;z-index: 15;top: 0px;left: 0px;right: 0px;box-shadow: 0 0 2px #222;}#headerBanner{position: absolute;top: 13px;left: 55px;}#headerText{position: absolute;top: 4px;left: 175px;font-weight: bold;color: #fff;font-size: 16px;}.gearDropDown{background-color : #f7f7f7;float : right;border : 1px solid #eaeaea;padding : 4px 10px;cursor : pointer;border-top-left-radius : 3px;border-top-right-radius : 3px;}.gearDropDown.active{background-color : #ddd;}.dropDown{position : absolute;display : none;font-size : 9pt;color : #000;border : 1px solid #ddd;padding-left : 2px;padding-right : 2px;width : 70px;max-height : 610px;overflow-y : auto;background-color : #f7f7f7;z-index : 9;border-bottom-left-radius : 3px;border-bottom-right-radius : 3px;box-shadow : #ccc 0 1px 1px 0;}.dropDown > ul{margin: 6px 0;}.dropDown > ul > li{list-style-type : none;padding : 0;margin : 0;}.dropDown > ul > li > a{display : block;padding : 8px 5px;color : #000;border-radius : 3px;cursor : pointer;}.dropDown > ul > li > a:hover{text-decoration : none;background-color : #eee;}.contextMenu{position : absolute;font-size : 9pt;color : #000;border : 1px solid #ddd;padding-left : 4px;padding-right : 4px;width : 189px;max-height : 610px;overflow-y : auto;background-color : #f7f7f7;display : none;z-index : 9;filter : alpha(opacity=94);opacity : 0.94;border-bottom-left-radius : 3px;border-bottom-right-radius : 3px;box-shadow : #ccc 0px 1px 1px 0px;}.contextMenuItems{list-style-type : none;padding : 0;margin : 10px 0;}.contextMenuItems a{display : block;padding : 10px 10px;color : #000;border-radius : 3px;cursor : pointer;}.contextMenuItems a:hover{text-decoration : none;background-color : #eee;}.contextMenuItemActive{background-color: #246BA1 !important;color: #fff !important;}#leftBar{height: 100%;background-color: #f7f7f7;width: 235px;position: fixed;top: 44px;left: 0px;padding-top: 7px;border-right: 1px solid #e1e1e1;z-index: 10;}#leftBarContents{font-size: 9pt;}#leftBarContents h2{font-size: 9pt;margin: 16px 20px 2px 20px;padding: 7px 0 7px 0;font-weight: normal;font-weight: bold;}#leftBarContents ul{list-style-type: none;padding: 0;margin: 0 8px;}#leftBarContents ul a{display: block;color: #303030;text-decoration: none;padding: 8px 12px;cursor: pointer;border-bottom: 1px solid #ddd;}#leftBarContents a:hover{text-decoration: none;background-color: #eee;}.mainPageTable{width: 100%;}.page{font-size: 9pt;}.page h1{font-size: 16pt;font-weight: normal;color: #606060;}.page h2{font-size: 15pt;font-weight: normal;color: #606060;}.page h3{font-size: 14pt;font-weight: normal;color: #606060;}.page h4{font-size: 13pt;font-weight: normal;color: #606060;}.page h5{font-size: 12pt;font-weight: normal;color: #606060;}.page h6{font-size: 11pt;font-weight: normal;color: #606060;}.page p,.page td,.page th,.page input,.page select,.page textarea{font-size: 9pt;}.page th,thead tr,.tabHead{background-color: #cbddeb;background-repeat: repeat-x;text-align: left;color: #39547d;padding:3px 0px 2px 6px;border-style: solid;border-width: 1px;border-color: #c8dbea;font-weight: bold;font-size: 13px;}#mainPage{margin: 69px 10px 10px 270px;}.required{font-style: normal;color: #ff0000;}.listTable{width: 100%;border-collapse: collapse;padding-top: 10px;cursor: pointer;}.listTable th{background-color: rgba( 0,0,0,0 );border-bottom: 1px solid #cad5e5;padding: 6px 5px 3px 5px;text-align: center;}.listTable td{padding: 11px 5px 10px 5px;}.listRow{border-bottom: 1px solid #cad5e5;}.listAlternateRow{border-bottom: 1px solid #cad5e5;background-color: #ebf0f6;}.listHoverRow{background-color: #dfe9f4;}.bold,.bold td{font-weight: bold;}.normal{font-weight: normal;}.introList{list-style-type:none;width: 100%;max-width: 1100px;padding-top: 10px;padding-bottom: 20px;color: #444;}.moduleList{list-style-type:none;width: 100%;max-width: 1100px;padding-top: 10px;padding-bottom: 20px;color: #444;}.introList li{width: 435px;margin-right: 30px;}.moduleList li{width: 305px;margin-right: 20px;}.introIcon{float: left;}.introItem{padding: 15px;cursor: pointer;min-height: 44px;border-bottom: 1px solid #e0e0e0;float: left;}.introItem:hover{background-color: #edf2f2;}.introItemHeader{font-weight: bold;color: #3F693F;font-size: 13px;}.introItemText{margin-left: 73px;}@font-face{font-family: 'LiberationSans';src: format('woff') url(data:application/x-font-woff;charset=utf-8;base64,d09GRgABAAAAAHKsABAAAAAAuTAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAABGRlRNAAABbAAAABsAAAAcWnB4kEdERUYAAAGIAAAAHgAAACABIAAET1MvMgAAAagAAABcAAAAYPcVhgFjbWFwAAACBAAAAaUAAAIKusGAI2N2dCAAAAOsAAAAQAAAAEAQJw1MZnBnbQAAA+wAAAGxAAACZQ+0L6dnYXNwAAAFoAAAAAwAAAAMAAMAB2dseWYAAAWsAABlTAAApzD5Y9k8aGVhZAAAavgAAAAxAAAANvgFEgVoaGVhAABrLAAAACAAAAAkDeQGUWhtdHgAAGtMAAACBwAAA8zuPEnybG9jYQAAbVQAAAHiAAAB6GLHkCRtYXhwAABvOAAAACAAAAAgAhcDzW5hbWUAAG9YAAABAQAAAfArE0Y2cG9zdAAAcFwAAAIPAAADNUNXkCJwcmVwAABybAAAAEAAAABAXsu7eXjaY2BgYGQAguP/NtwH0SctHl+D0rcAYG4IzgB42mNgZGBg4ANiCQYQYGJgBMJPQMwC5jEAAA6wASUAAHjaY2BmMWKcwMDKwMI6i9WYgYFRGkIzX2RIYxLiYGXiZmNhAgGWBQxM6wMYKn4zQIGhY7AzgwODwm8W1sv/ghiN2W0ZNyUwMMy/f52BgcWStRGoRIGBEQCpshCFeNpjYGBgZoBgGQZGIMnAyALkMYL5LAwvgLQZgwKQJcZQx/Cf0ZAxmLGC6RjTLaY7zHUKXAoiClIKcgpKCmoK+gpWCi4K8QprFJWURJUkHzB8YPrN8v8/UL8CwwKgviAkfQwKAgoSCjJQfZZo+hh/M/7////x/0P/J/4v/O/7j+Hv279v/ix4cPLBkQcHHxx4sPfBrgebHqx8sOBB2wOr+0fvnb+XoPBC4AXrC4j7yQGMbAxwzYxMQIIJXQEwiFhY2dg5OLm4eXj5+AUEhYRFRMXEJSSlpGVk5eQVFJWUVVTV1DU0tbR1dPX0DQyNjE1MzcwtLK2sbWzt7B0cnZxdXN3cPTy9vH18/fwDAoOCQ0LDwiMio6JjYuPiExIZ2to7uyfPmLd40ZJlS5evXL1qzdr16zZs3Lx1y7Yd2/fs3ruPoSglNfN+xcKC7OdlWQwdsxiKGRjSy8Guy6lhWLGrMTkPxM6tfZDU1Dr98JHrN+7cvXlrJ8PBo0+ePXr88hVD5e17DC09zb1d/RMm9k2dxjBlztzZh46dKGRgOF4F1AgAsYiZrQAAAP5WAAAEOQWBBcsAnAC+AGoAlgB/AIwArQCUAI4AkACeALgAmgCnAKMAsgCgAKoAsACYAIIAigCSAG8AZQB9AGd42l1Ru05bQRDdDQ8DgcTYIDnaFLOZkALvhTZIIK4uwsh2YzlC2o1c5GJcwAdQIFGD9msGaChTpE2DkAskPoFPiJSZNYmiNDs7s3POmTNLypGqd2m956lzFkjhboNmm34npNpFgAfS9Y1GRtrBIy02M3rlun2/j8FmNOVOGkB5z1vKQ0bTTqAW7bl/Mj+D4T7/yzwHg5Zmmp5aZyE9hMB8M25p8DWjWXf9QV+xOlwNBoYU01Tc9cdUyv+W5lxtGbY2M5p3cCEiP5gGaGqtjUDTnzqkej6OYgly+WysDSamrD/JRHBhMl3VVC0zvnZwn+wsOtikSnPgAQ6wVZ6Ch+OjCYX0LYkyS0OEg9gqMULEJIdCTjl3sj8pUD6ShDFvktLOuGGtgXHkNTCozdMcvsxmU9tbhzB+EUfw3S/Gkg4+sqE2RoTYjlgKYAKRkFFVvqHGcy+LAbnU/jMQJWB5+u1fJwKtOzYRL2VtnWOMFYKe3zbf+WXF3apc50Whu3dVNVTplOZDL2ff4xFPj4XhoLHgzed9f6NA7Q2LGw2aA8GQ3o3e/9FadcRV3gsf2W81s7EWAAAAAAAAAgAEAAL//wADeNqsvQ18G9WZLzxnNPq0LI+kkcayLI/HY1mWJ/JEGo+ViSx/xXEc4RjXMa5jjEmDMSYQ0pBN0zSber2BZtMU2LSUstlcLuXysvlx8+uOZJPSlO0aKKW8bX4syza7Xdrb22W5e+lLC8vtdhuIxfucM5I/AnTv3rv+OJo5M5qZ8zzPec7/+ThnKJq6RFHWpHWeslB2qoMqWBAlL1qtFMfIBaiTFxmyjQyHYlguL1ptlJeRDSubtyF5kSZ7eSeSqY1Jv+gV/V7Re4mZfv/soOWH1vn35qza+zzzJkVRNPU0RaG50n12UAUK3wdZKQHuw8B9yA2oywaTyltsbxpW8rFgs1AOedFuo8JwU7uyaCNb5IZ5Bnl9hk3fmFQ1NWBRLdLTzz/7QugrL71knb/qpsg9xywv0uV7dlKkPQajLlqslAuuZ0uZLTR3yQPYL5dusRC2Mx45b7W9WW4d3ADB/9jT3H1o8kLgAet8sR9dLPbj+zgoipm1HqHClICuowo10LZCIBhSVdUIKwWOr4atRdpKidBYb20klUoZFqXA1gm43mbWO12VUF+wWVzyQrfN7pQLjgo31CCjXsmLSDbaay52nn33IhWQXUZNq+FoNWrYfMh+xXCwebv9ysXOr737ODkYbDXcrUaQzQfgoJvNV8BHDbtA19j98oKFlDZcGiF2wRlywEaQXXAFK2AjwC5UBtxwAktKLyk5XOJzeHIOfKuafAuuGS5fp7Z8nQg+Z6GufKaA6y3d1bTFZnc4XRXuStbLBYJ8dagmXBupE1o/5sforsFE11S/pIlAe/yvBiSLGBAtkh//p0W/6Pj50FXkn7hzHO0b3zf+1/80jJji/xjfN1r86s59o/eiO3YUz6CH70QH7kQPF2fx/53FB+40t0g9BfznPzjIjFjforZSN1AzqI8yehWjS807rW8aY6lCrxOzo7fHKRvXK0ZczYesbxZC1+PKUI0ThOY2xfBfzveDyFL1l72LyEZ1gGj1s3kXkguhniHg4OIMEalCuKULc36GzU8hOZ8G0Zo12fr20edkzDmPUcka00v5QccVI7HEwN6Cq3LaL5dPqFiowLuMMcgutAwm4MA708++TQ7IeHdhAy6ZhSH8gb89g08vwLH6L9Z/UbJ5vD7d2KAX4CqwRXVXuCoqWxKDQ9Mz8oY1tEcXKioTg9MrdcALlJ+agd4W1Y2012jUqbyzF3a36Mb13kUK+RujjbxuhHz52ogOHdKfDvLmrzfWZP5qbelOOg0dtXzEjqu9dYgPrvxydhv5DUgaHPRz5WvgOg9C7Wnzt610Tf5Jj4+PJ5LpYW54YEjTo5Io3P3o1NHZ/q4OVYxUf4PrzBz2DQV6W9ItSq3g86GIoOnjY0eOvnbks98PBEVJiWf70ooYqUVzvemkLFVziA81y0lpCB2N6s1yvcT67Ogdmy8UbpK7s7cO93SNJOh77rFxvtaYro6IU22qu9hn89p8Xr5GiMa19EBuy0AiKQi2r3/ddeOkpU9vjFaHWI8XPU77PGF+x9W7GI8nEkrE0n3ReHXY4wqA+qVyH/za9iPrfVQdlaV6qE9Rn6d+RhUmQIvkO3tAQ+w1NYQDlFW+qxsq2knFYnXThKMSPsy93GfJXo7sIWMOq9NFwVSdApvvBH3dY6OaYK+HzbfCHmseY9l8L+ztMff2sPku2Os2z+xm8wdgb8RUu39giqt270/+CYurBYFk5DsFkIRq3ejxFvgmh67r+e4uqPksCEn1Xq9voXdkzwGQjnx7DnZYoZWCHRCRNpObasrkcqDE/AaTuWmOx6KhpsyztDLPG8yz/Eh1otIV0tdcIbZ6CVxfh9ZcohVJDeSkXHVIjmfSA73pTFwOhULheCKdnetMJ2Lh6tNud0t9WJHDIse7XS53gK8VY9FoQ4CrdJ+x/MnZq9N0LhRqiXekB/rb9Ra5OhzmWxObst3ZbLpVrg496HYHODE8USNy8A34PtfbFO/F25aXj4+Nakme4/ikNjp2/NjYhJoO8Dy3SZkcm7u5p297gGW5Jjmr3bFf64rFPSzyVjVHt3S//zIeTFHh3rHxtmSQQwFOVXdNzh2eHNbh+yjIbYLLHbu5pysW5eA7XDTW1XPzfq2vMSbCo2/pxXpu4IO3rJr1JLWT2kvNU7+mCoN4BL7RSrWCaHVjWUuDykuzi0OmtPF4aPx8SZj+kAjTqKncRtk8C0Jxhykid7D5w7AnmHuCKVqKKTDHTYEJ137PZuo3B2scWMrf5rpiNC4tNN3WCNoJylXtRC06GptuO2CqoTXbRAUdvgMkiB+88RasbARvoUXtw+KmtHp9+XS3DgI31A2S16Hn0zfCZ59ufN57gWKFzOgt+9cJXXpVKbWnO9GqDJr6B+/gs/jSDpHCAOxIWLTMc8ztspjVobKkkktjCeVKF4HfWFn07LaBmlBCyeo7fVWeSofDxvEx+cRELpvZKNeE+7X0YN949rr+T+ob5JovC7o6oGrpjVxcqOYS0ehM34AuRKVkQk93HxobTWuRmnM+nxS9Y3ss0dwQ4x2x/unxzoOZ7L/6fRGtPxsDuUZuV4TfKu9OptDB3NZeVYvHomKTJEeSzQ19aTgl6fM1SWm9K3c4oUTF6N237p4end17UJ4/un+vFuQZi/MEPGa91BGqDvl8lW5ALEl4SL1VkaLNLmeVr8omjpw8cig5kKP3b+7JdnBiRGiIxTdG68LVXEjVMA5D1KzlRSQSHFZPrcdcjJKnYDBEMBhaV3DW7Lf4+zC8It+dK47Tj1gvUSIVpwpOBiPFBiyNeR+MuT42XwMy5kzlQ7DnSuUl8yJamdNqiV1saTCRSqyf43i5ddvQ+DfGc7lYguN5viWW65/8xvjQtlaZ52iWOf25k3sP7T8ytfvI4X1HPne8+M/H5w7v+8zB6akj+39v7xePkGdzw7PJ5WerWn02oyqVF+GB2JQhsnkHNBAer/xsJalgSypNLQ1/EVQe/9yT/bmYHAS9kIjlcuPlZyo9cXF8+uDhOw/PHUdVx49+dt/hI7vhiQ7tPXnky8zpIyfvOHTXkSnybCJdoItAcw8lAaonCLtKMegyhMddOG+loZ9U6Pip0laA0FHeytsrUCwtJpDLdcKNHIniG986/NCfHn6GyX7hDhQv/vi2e7a/N4DoD6iB35q8naYWmQHmEaoC8JNBAYRW88iKATxAfAyTKBdAWUThTWTBiMmtGK7LBp1adJojDpMC7IsPOzHodRHA5aKccr6yxEvRq3oB93kl7zQ69yA6Vxx/kN79ZXS+OPrl4ig6D8/wdPE9NE+9RrHUdqpgxXoNQLUflJjVhq9mZfF9vYphu2xQqbzdFBUHfDjYRca0aEAQfUAROwMUYfUSnzQJEEuZLU/L4dCu5xna7fByVcX3MgO9Pa+di+mSIkkJzqTFBHqFHqYPgIQ3YFpgQuD/spgvWmyUE0hvLTcsMIF+g1559FH83YvYPoI2WChl1TrCbVizjS+ERR9MI/JvXgjbPxdfeO018xmoD96idZBJC6YF/q5hUQs0yKaB1NL3sd3mMJ8Dq+fst9+uIYYDxeYt1isGzcJDX7HkkaWMwwPwVXT2PxVv56w/f08wbavhD95iJOtDVITKUP1UgccjSBTAMUEpbbjRHeRZ64DMdWx+AxCXhUfOwueGOq+vEOQxWKDybVFQ3yylfxwo8KBrNe06SCCVIMFwNLql66axu2Y+Odnd1xiNxbv7/vyV8V09/Q3RCwG+Mb7/uoH98eYAD9uxTdpgLqvHosEA/eyPTp0YH5FEURoZP3HqRy//0QPDY9sbo2OTx7946dzth7L9ut7fd9ehs8bsoWxfTTgS3pI9NEvofBZsPg/0Lxd12KQzEXsHtuCwBc1QtkqgMKZDBbacsdQV7MS4s+MeYbHjTQuWc7fJhsa+H/QRNlhbGcPSasVGNgMjpQVsbdcVCwV1qMBYbSvWkQo9w6pFcec4i2aKz6MdT6CxM0zm9SffeD90Bj/jDDyjG3jUQX279IybgUONmEMcfrKsYlRezsvwZHIlfhy5A56sUsablfjJOs0ni//65f9qjt9W1nAu5dvBPkkuwc6C3eoES6OdXVDbk2B/tOGyAJWrI3oB6rDZoerUBavdmVTb2lfMjPX7eIyn8psp6IBINzhvIVwr6zqx78vQ3+R7K4o1lbhuj7WviAwGjOXOWoXMw2JgJt3fddPwcG6rnoj7uE41eVDWRKE2ZHvaIUnp3u1jM7M3jNwlCCG+VepObjnal1SSCZ7+2dyRscExkJLe9GD/zkxrUveyHl84nJQ7vINb+pV0KBIK7RnYdvO27ky30pXcPJNOyJ1p7QyRjSHoGyGg+yepOaowjOkO5mRhI6Z7o/XNRT44vBGEg8csGCedBMY/A7FY4+UHYLMeTMn8JmBL/SbMi/og8GIXHiYxcZp1o9676Ixt7O4BVEPlg07oQBTSdYP35rt74LPRV4g1b9LXmWIYoJT7jIy0Ml7B2MTesI6O69C0PRAkhOWvQddDF11+XzyqpXMnB4ekhjYtk940syfRmVTjooC29M8d/or7KXdzPJMdHh09Ojyia+GQF9BKWh8c7eoZDnBIiHRld00eODG2a7MeEdBeb1dzvFH0+/r6/nBIaa2NOBxnXQ4hlExcd3dPLzp6l2d370BLa5CPRNRkf9+OvmQ6Lguih3EIwlha690zmNO0cATVN7SpA9eBflJA9tOkf0ao/w7IAftkaNw1qQonXYn9QHkKOqwthYw6xXBeNtypRYcJcC2pgoMMQw4b9AengwxO0B8MlMoLZpdo+18/qcRdgjEQ9FR6KV/huuIxuKWFQAUHHYEnZTUpQ6SsIWUtLgtQrjHIa3RsPoWAfboR0KlvIi7A19RWh1bM8W4nXXFNXamz0BUgD5WYzRpSvWpAgjEyKnqrkAcBsxBWnphpCn3vX3zve08WPejdCp8NGuUqPuyw2xyMq8KNur5kuXB18P7is6jrfvpNTnR5Hb7K5bfcDluVzVPJEnkeAXmOAC17qHupwuayPDdYTJW/2FK9uQHkuQXqqlswsapFPOD2Kob3cj4FSn+LSbSun191EQ0nthrRVg/GRk0VV6xGlM03VGAN19SKFsSGaFOphfmUF0RbasTDRDVIOaiw1IeluiTGWCuUBwO75MeOoo+Q57L8jlxgq3zRSDqZ681mYnEwojhup6YPqGLaI4YFn6FYxOXjYWWgb3Z6fLSjKyIIkS29E1NHZ24czqYlAWUCWkisDwd8PN+c0Lt29LWpOzne6bF5/Jyf/s2ZYq9UGxaFTNfg8J69u0a39IoSqgkpclcaZHO2pB9S1DB1B1WQMUUz5bETNPNi3XYZ2/J1ViqDR/1PECWhAiXDoB1UFhM03wi7I/C5RQWzyFvHydgsavRi9JLfnsHUagxj+4irwwOsd+0AW7aZeTsxS7CU8NgOwn29NOiW7RueW0/pVVsG/85KUnd2z/jRwUy2PRlvDp4Pzw0NdKUngJ7JxQO7z6bTnRFBT58HHD3ZmRGEFwJ8Qzyp9WY3JWNRH/xI0v4tWmtaSgRD9KNPn37g5glNQVUeSUynh4WJEUn4yvS+k5NT2czmc7P7R8e7sjmlddfY8Xn3SHe/otVEglxrQs8+vDkbiyc8rBBT2oi9Qca9ecoPWwV3uefn/VjhcorhvpyvAOVa4cayWgGgtOCuwJtuPOYFTFlt/5v/dtXs4BaQVOuSNe93Qw/3LgGYtnpxtyxYvf5yTzTRXMnWCEhtPkKsWcvj01O7erIx6ZlP9GZuHd3L/NOZ0w8/+rWHHjj38DOPo+GvnXzygTPYNh8HeQiDPHRTN1PHqD+hCjrGfNsJ9wvVWGkdJtuLs+N6NcjFbEkuPk96GN2VSuV34242lUoZu1mjBw8fFHZJKvke+NjN5odBUJKw+Wl8qB7OnYOKT+/2+i44q5vj28cdZCgZ346HkiQMIbPeBUdz3IlF6rCv4K3fra+TH23Fgv7YUeN3OWWwNHWiD4O4ss8vveL3KR/GIjoeCjXFk3Jn1wYFFD+rdegjY7P7J0Z0VYh4PZKgKJlMe1qKcXwknM3cOHn06MTudDYcuej1RIVsemSsPZP1etysKOnZnYN6Wop6vILbHY6o6cGRTWptyOWoFiNaMtef1HSvB50YzGY2yFDNsBExnlDTm4eOamo4EgmriYG+belNShIGOzfjiESaEx1dA2PDA5m0IKA6UcsMDN/StSkpR7HZtn2z2p+NKtEYNjMb4wmNnpTlhBQjnptmUYkp2pgY4Xw+brMSJ9h6N8iDD+QhDQhimir4sX6oL+uHYdAPG7v9oB/yG1cRBKAFYxObbwa2uoG9GC1swmghrBvN3gV/rWOAcHhjPXA4XAtqYbgbq4hNzfq1yNvC0WsdHLH0mt6fLom4/Rp+pq9x1JUZulsQspldo3f/6vARtL275+Y9B4e2pjuUuASaIqvf1N+VlWNh3gJKQdaUdPvUcE5Xxcg3fT5R0vTutJLAjgS/LyqBojZ1Bmd55s5d450ZSfxzo/jEM8U3pm5uVVjMYG0kPJ6QJXFr9sD0HyelOB9xupEkdqVvvv7gQLYrngiFEctGIxl1cLivV0vWY+UhZ/uA3sT2YnQSJ9JWra86bEHSZgysjrk2RGUjH6XwEIlBETvshRdeftmy9+WXScwL26VwXZbiqF2rlmndOsu04MO38JZuEcBWap7ypoidmnf5Ux9hqQZ/t6WKH2SdtXroedNeffls2V5lPo2f0LTfz4D9/iRlA2sBGXYFuyuwAqz+7neXTdCPWAxwGDeYIksX/2n7d//VrKZYwwbVFgc+hFUkdYFCtMW0UEyAv35/RVOigBMFpi3/ePUJywSduYQeO1P8cvH0n5h25TQaZwYsbxFe1JStaNxoYks5lHI8DvQtgn98mVrLP6LxBx+kqQcf/Dfa9M3yw5ttosC8skGbOspNBVsL0Q445MkzlVf+99uU1pxIw22agDb945k/QfvRXWeKU5egPaMwFsWgL+tUlvqmiZ4WM2bck3RnDTerk/RhHfiss/nN8LBCKp/FhnPKyLL5BLC7CoShy2xFjL60xXzcRtaILeWrPVeMwNICXx0AW6yRXWhqjGG/amNsjRUGB7F79akAX90IA7jZlnV7xMWa3QxC5QA9oQGAWKii6nTTcfo7rayA1E60eRdaH6DBOsAPojjqFqN65saxY4dumDgqiH5WDG8Ia8NRSWK5P2e8bL+khXeE46ABEVjnsprpPDUy7H3yecvV8f4hTZPEcGRmcGisP60mYlG+uSPcGIsqyYGkMhGO+3Rfq5CUM1k5GYExAfX3f+4q+9JLQPfHim/Y91svUfdRT6I6QAEM0H2P6e3uwh3ucbJtfEFZPGRuhRVDURd3Eo+38WUwC/4r8ZXsM71U+9h8GsmL99uoJOzdD4gV9q43j13P5m+EPb/p9D5fitX+4btbTS6dYY3tS/kdVVeM3BLsLAyc2Q6M2sEuXLcjBxtQcxbXFKBcYxYM6AU4jpl2YWB77rodZ86uiOD6fcK4hvu9vkV3c9eex/GQfb03v+0RGMVv9BV2Hvs8cbOED4Hix9v5x3d6fd9spJrT22L7Tq/3i6+yeCUY12Dysq29DXSMaU6Ulb92jbuGV9OqBcsDtw6Yr8GL+PuBclyvPKTw14wpUW51PCmDgJXAzWNCJJsdGZ89eOTeUy88dHopoYCKz2weHZ7WRkKcx41o2hbamlDbYUjv6m2C8bch2pu5ZeL31M0gPDUhzh7707s5p4MLSV2aCoiVR/HEjpFfPDL32YMT47n+KRwYGhs5cvQ/7blleEwf6m/YlOwbyu3Nzd7+7OkzN9+qqbSoJKb7spmUKkpgTDnqRWEiPT6XkPkgeuvk/JHfOzg20d1fJ3Xol+ZPPHDf0cNjY0kFhUJcVIgx1V6OSUyIMR+HIkJSGey74djt+z45vEmtcleHRKHlPxdtU2q6PcmF4rHctpun952YPTg0MiEChh4deuHO/Z8+9blDnxxNJpHXHfFJAneXIEhBwc2izdk9s/d/6fzh/j5UF9HSnb3bIorm1YbqBXGsv/+GCVO3MhRlHQFcbKd46omSR8hiV1UCjw2kLtocFNjGeRvWSdVKPmSKcqbzn75vOggBCgdYK3YU2llQOqAt4cPOLgDiA+vWgcuLmW+/aSUx6SCp5HFZgHKNbAd1qgAQEQvzNylQIg5zZ61l6wBF5MPOH6QiySJa/KIFm3ittAZ6h2bo7h/T2vNfX5577DXasyh4Ag6aYRyOipoIiZSdLU7TSfTKSLyHt7mddESoyY3AiHIOdPGb0P56SgWsfVuJAiIgK4RVcTcgqzaVQpUlB2YP0crYkd9GHPktoIerYa+aNRwYR3fAdoeCh2ccQc13iOaInG9TyYbR7QVdCk3witCp6JXhuYSN7aV9KSpeG+YUNbEMkJsk8RxN7b1t4ngvYFxRTeRG+ntbFMCOzXL/4MT0LcXj6GAu2xdTgqFQaIPclxkr/inqBSN1qMpz9ivF71jnOd8n5ybSm1Q5LkZYR10Eeke2b9/2oUSS48+4PWFRSQ72tSaECOtBX2U9vbG4fmCPGbf54C3rERi7MkCvQts6D29g1cMbMd26VD4QxUqIqtyQWK9WUuV4/5oQbmDFEihpAVO3lA2F2dbE+OTR+cd//tUz/d/k6xraMh1dk0cnpjp7awVR3JL91PjRsTk9LUdjZ6XD24Yn9xx8cv74DeNxmX4RNqb2KEm0a+LJjBZvbcCdLRbPDU3Pzh2/dWY4l4jH481tidxQ7isJQPMorU9N33OC9A+QD+s0yAdLSdTmknR4y9Ih4RY3khZ7gfFeEnoizI/ixkvYV+Go0UsMZ/igL/CxHLaL59Crj6Ca3Xv2a+rk1LH5+4sG6jg4sXtLfywWjw3lZmaPFN+2zo+MjhWLi984eWLXZEI50xAdgAP3n7p9ektXvYBMrINlGsd5Kqhc6Ymd5SdmQJ6tDiLPBDy5ycM74eFxzIWEZJwVTlxanKX4SynoYgZczP9zTOLqaUvb1R9aHrbOny12nCkGzpbuexru64SeRO67ek+HldzTge/p+oh7rt6t4pq7nbO8efVHFv/VX8Kdln/9yPILZhtnQA4fBTnsxd6SDG5jrCyHIbhfMpXB1lAS328LuZ8A9xPYvAIMagNLX2nD91WScMc+qFIEYJU3AwNkm+kuScagw7bp+VAKUA/FeoUPy29wnQzjoSxwjWckrUG39ZqDXNl4mknIN+4+evwbx2Z25waSaeECHxP1dPfADce/1ZXtFKWu7K1T8+O9fXo2lggXJ+nR1p7er+3Ze3Ph3hNjky0J+sVHTx2fmk4kEc+1JjL9W9uTrdEGjHOGBnN/BeK8dzCXkKs8QT4cqSk+WqxJynKvjyMSfZ/JI6tIZKOrFAuyq4RNhlVdtLgIlyyrklEBVKNTRgUJWWIzB1sgZYEAJsG/BOW579DvPfvsss06v3yeHn1vjr5v+aDJp2egOEbivOIamfiYqBVc7ZlnsbY2vyt+8JZlFr5bi7MDQ2U5ZjGPq/AjRq51lPuAsZU+EquoAsbWISy8wMcQMLSq7BNfm4yEPeBezKNVD5d40RHipJASlWc6M8V30Q9rw2nt4elzB+5EU4LeLjeEfB400HefZevZq9L0SK47k5345Eq/s3YR2n6RKjjw81J4JLXiB0aMqpaJaiHRRmxZMIARrTYqCogRDx84rbGGIT0OD7Kt4quPmQ4nhgVDi8RawDZ5eeDy3EruhHMJhmYHDLhwhCpYbE48gubxR8kOwUTFuTESsmM2nfuH5XP0n/1y+dK3gFdZ+vnls1dfp8+dWn691H8VeH4rtaGMBEp6Axm28pMXLKTHWqxAYPuqIATg2i9Z598Pn12hhY2Ga22i/oEqNGG+U3xULeOKANBCJ1h6k+lf38Tmq4FbPMjCZrPx3xXfnCYIowkQRiu00nsFe9UvZt5+80ukPtCKvev5Rgd2Fy9d/G7rm10YYxg0u2ChbYCiW9mFWGsT4A0ZlwWoXGP9QB2GHTHA0hYb1xiTV33rFTTUBBqjTauVK6CarwZxEkCcaPh6oVIwnc9AAVTKW6tDgXbT7kG4awAgbmtPE50PHGgiyJfoAQ6H973nrqLDtIuxuR1O2kG73HbOUYHu+s15hqZr3V5XoPjQHxX/2MHYnIyNsTlYL81Y568qNsnFtYq17gjjFuPB7nC15ZX35iznZ2Ob2V52Wk6K2tUuy7Och+NdIRcrKJ25aDY6cXWUWtP/A9iLVIn7P1XiiQt4EiQ8CZg8ASwHhjWgwVSKOJB4kzEv/eynrxEGVAIDPEtM3uInnLFQeYsHO0HpSs9qQBIoA03WmjSsKYihGAx4z/2Ufg+aSJ//n8tVNhrE5P2BPZ5OVsxazr43xxi7w1m23XV1vOT3sv4t6Pk6qoPqowrVWCqbyppeK0UsV9V7ohRT7oTPBNbp1U3Y1NGaPhRRvjZJTGpoXJ+8g8FW7FrnlaLsgqH5yfNzJ0d2tSaUxOT4vccfP1/8l9GJeOJ5Ucp2/cXRe27ec1gQUL3U2bdr8tj8TRNbeusE+sXHT9w7iTFIW3r85nvmzz128t5bpjTtrt0zf3jfw8dv3b9tcExOPHjn3s8fn963dTAGP4ODM7NUGYMQjMpRAox3a0ZWAUY6f4DobOLIriek4IAUgZTBmWjEBdQQMRoRwNw3asrgcz3eFENILEUDAYfQI8cmd+MAB6oTMl27pg4X96DjT+aGRkceL95rnRdETR8cnpocHklnRGn5NfqZgdzJ4wP9iPCreIzwq50apT5JmWzaYX3TiCn4aZFxA3nEtA3nleW3lrg1Bp9b0zDQxhS+E1urrDffIGHGCXgYlnRjh3eRpRqUzo8chUvxCfuKVl+Tm7Xm99/F2pi8ZfDSSb66VoxLctK305OIKcpor55OSmLk8bsPDw/K8X8Xw88cvnd06qCvL94aFl1u5LB+wWWzhfhUYqDrJlda/9TkiS985d+WA+ssiWE0UZ+jCiwZYapUc/zGvWLRG2CxMHgxpWOE0n6gNJcy/Gw+AkTGoIvFA00VGXSwbxh36f/36z/5c9KlWdbwwjhTxULHpgwPjCQeb9n+asLy4yzJT4nuHhqrtZL0rPX0YBPla8fyPVlJjI7NTaHTPy0+WNyGLo126PGYz4f4UJOySR8uZqzzmpYcGtjTN7d/h3f5MTq3fIH+WYCLRpXk5mxSjYgeDxlPJj94i/ktyNWnqAtUYaqMBVosZpgMGXsUo+Fyfgu0bwubr4KmjoFc3WI275/1Z79tDphgpgWW8tu5K8aOJdhZCBIH2XZ24brtO2CIgHLNEBEsO8iC1duv27HiIFuzR4aELQ1mekKVN+9UAUCO+YwUSG4G8MZTFGpIqWOm0K4JUHbSJupX0Brx1D4OW0rX2Ecrv6XIHLaR6mNNk9/2REJt8nBuerK3f0avF/TefiPZn9ajvUpUDPpise3901OHT+ya6sq2NAeeYUOReHSL/sndfbmGmN8nCmk1N7RtWO3ZnOhNS7G4JOYG7tz/1eJ7X3kIjUS1jfHGSMDn8XRO9fYl5BqBjbv8Ht4TDcuxdGJopr9vY4LnUIBvinVmh0UtGg+HWI+PCwuxuJKRm2vDPs7LVlUFWSnSnNg/ND44oOPIyOSkiRcSoOMWiR8CrCzbiobD8XhLirjZbZfx3IuylxyH6GxWMjECh+hWPcA4KSzBnChG/pJ54+zZ98PMG+T6j8A4EofrN+JcqgiWH1cJ2xh+GPiiK8AMUBnO+gqA+DSZF4WRi1vnn4rhmvVRrEe+s1nVu/t2Dg0NarhZf6kkhkf2zn7+4OzMSC6p0JRl/uoDex8G+5pDPN+aHBzab5m+evrU3pm+flEEPduT2Xc7fk4H9PEhYm/eZ/Zwc4pKpYqz1fCTEWz03Brvi5PFzhcaR82dbJ6tuHLx+Rv+v0fKUIihnYCArKS047IANWv8LlbdsOvUIm21O5myOxvvsMw1LvoVhNNFY/+L4wfoXpvX4XF7KsM1Ajr+g+Wl7wE2EflEMCGBuTo8aflZGcdDm+wwblAd9Gmq0IHb1KpkMBbETSsEggkVY2MYxzdczifMwZskoZ371d+tID37Eoz20MTM0sXnEm9/htQrUN+2lJcwAgwuXcze9st/wfX5oOQwJNZjJNi8HIBjEptvDVy5mH2VfK8Ce6ecxBHlImUFKd2krCSlh5RVpGRJ6SWlj5Qc8WmVnqLCnAUj4awOUtaQMkzKWlJGSFlHSoGU9aQUSdmAy4udte/8MbmaxC5EJRnqm0kZx+XF51re/gNytI1d2NimQH0Klxezf//2/aQ+wy60ZzSo30TKzbgsONc52Fy6UaEbbt2o1A0PaCsdu6O8ugGHOL0A38AnbdKNdr0AzVnzxRDJRwnrRq1uRHSjTgf8a9TrhqgbDXoBHgSftFEvwGOv+VazbsR1qluyO91VPo4P1QoNUrQ5Lm9MtWntmza7Kio9rLcmHKmrF1v/7R/U3WxeKBBcvVSrUrpY5t95tfVy7RewZJN4hfnXnoZKkuNE/gSEj2FE78d+R6K2zZia5Hjpqlhjq7S5fXQFTbtoQOlMxa+f/rWLgS2zSoAthy3s8f7ri8U9b/ya8fms1SGPw135m9ehu8wfuyukR9LDjpjb1eJyCx5X3LLv6lfiLk/E44q53M2Ok27eI0c+nd5smQOMP+cZHGEPHOivS8auzpf1plUmNudyCRk6nBVlO6tgsdrUkt1JX8a5phsB15NZSRU2nC+AtR3Y3niGG95z4iMOsl22QdW/+PtR3Kku/nBLaaNUUwFaZwFRVj9W0g6sahBWL+sOMyuHLbBjcaw9XMEu2CvATMtX2Mhh+4cOu1YOw8Vd+OLUAmLsLiIQK1tlM9eJzD/JiRJ0qMj+CJ1Ax14tCrTr1eJ4cZh+jX5i+W/p+PKe5Qg9u/xwmXZ4THBQ91AFe1nXwqDAEKI5iTGETNIgM2nbiicisnkL0Iwx6eQqQagv/uSvTFudYg3HUimceFGb+cm3iE7CMUQLriLGvHWJLtBWB26IQa+KIjQA4eHrVXQePfnq8s+eARt9N/3o1ReXn6YHTF3aC+Pk48THVpoxmbfDOEZcDLTpXMMeNPxEqcW/+19ETdKgJhEY0NhMs2MzDdkIAWmbvXVN5igScfxUDPRaJq7+0vLW1ScsJx9gxs6eev8J7Ns7XRyj49ZLMD5jvxFlzgjFkTPEmNHw1pVoOPZi4MmUdAqTq7xnSZUHaa8YkLxq4DR6+Be/KI7ZD89fOTX/4TxlPOvUoGGM+F15ys9tebuxnKeMqkmesqV6XZ4y2J/SI+hPv269hLOUEcUWx9A50o4B4DluB2W2g2HMOQitK/M+4ZFxxyDzQlnTzQQohC03yL4SdwbLVhO9IvuLX+BphMW/tR2a/+1JuJeLfsxyAXhlwz7KUjxlbexZT72+nTw9Ag5RS3mrh8Sev/e913fhaivhnIU4ePJWnEzILFGL1Eqo+eOC6Xh4diIXOvAD9OnHiz8ovkw/Rv9sWaSPLJ8gMvTBz4uzzMkijqdHKMOilChQ+iCZ6aY/Dk+tFJhz748X37oH024vY9A+6+twXjNlWBU8fdXDlH1DWLsAWYhPCESRYGJzumZA2vvyj6esL9YW/yFgzsEFLH+QGaL6qRup+6nCFizFSTzv9TqSxJSPt6ZSxnXsomJOO6rHsVmfme3kuGFLfaWM3cnkUScJbNsGrNnG5ndiAyeTSuWjgCFugp1tFLF4jZ3eQqhjiw7YPOozNgM2v+E6sDWjVKYDz0LzOby+QqimcV3WSxdaN8EMjMtYJ21i84CXK2UrqeusTMm24kNMc2t9wHYzV2ksHtuSubFv9t0qNiw0yx2qLMWERttfODfN7sjd/dIdMxyvcxVMgGloSIRlORoMu1yMjY8LSfno9kdHRy8qrRMjW7s2xIMceiHTmx2LhFFib39fPMq6GaZjQE7WCG43sjPVvv6kr2cWZ9ROTTxVVEaa4jTNHHBaGI87AvaYHtdiYqR+bPz0qJqsF5JKRzp9o9XlSigJ0848TnI7L1EbqBx1sDSq1OEkhTazq7igqxSqMVf6Slln1+F0WYzdnqpg/VLThkY+hdFXBzChFpgxiL0x2P/KNQATOrz56jqS5w/8yduaoKrP+xTLNUgJPzGV1LZ2DUeXswiAdoCz4T+1FFX2syImuAR1+LcK+c15gdemG5VspuM0TS9C65M3jHzu5andqHj34RuGNtEMTSPkDvhymt7b1aaIoof1sDiN+MRmLRr1BeiAwyZxsnuQ+VVxXHeJdodom9mYOHmq+ObyS4n4jOaSvDWVDouFZveOD+8xJ9zpufH9h7aPJpVwiOfa23ZO4j4Dsm75Acj6arwMxykqgHj56tV4WX05XlYd8/oWKT8nb1jr6cCgRF1nFpazWtdMNSsHzcsmyZiPq5ea5TvSmU2T/b26Jojub7Na5rYdbXjTg6rcorB3aHd3j+ebroiY1PsGd39+16SWDoVpYd/O8c1dcTlZ6Q7xrXJHV7d7StFQKKTpAxOTIxODmXSn2nanuz/TK6uhCJIT23fcur/cty3vgOzEqW3U3aV57zEsO0kzddGDZYfGstNd6sMDhAIt0Idb2PwmnMYkQh9msaeCzdfAR42S345z11qg09poKUay1pI1IDt+Qcch1UXK3iDZTIKxxLelam1NWZpIT5AjPkepKdbWBJVIIn2W9puU+5jZpGPovqMjYwrIjoWmzzOIZpjk6MjRS0vPVLERYc8JXWsmuarNUS2Z61KTgujx0iFaSyifEl28WxbQ4+/7Bt0yJ9kcAdrttdV6BZc2oyRQEEUO50aSahLP0BwePXJgeFDD8zf5YFt66JPUin4Mgcw0Uxr2oUUx+WpM8jkw5VpNfR33RXFGcLzUB9tXpsDFUwUfcdL7vGAap7Fc+TC56jC54l6D+oiJNREkrk3c4z20KUl+cY0HYgzPHB0fnT1x03hGDYeuvu/1RWNadsehbX01j7K9UyM77njn2Nyz9DZPrv9kMqHIiXAdHT29f7avty4ix0cG7pr9/eBU97a2NAiNksgl4rf0hEPogdPo0LmRoSpPNJbthz4TASJkrD+gROoGqlCPJagCg4AqFXs5CwhIYITV0nBlRFJkhl09nj9GvMA1qYJQj1svRJzwpVShXiAzJrCboDwXUF2XqBIoZaN4UASZGfORr1V6akQlPcgn4r5QbU08FAZD99VXFy0Xjh/NpNJi3MczjPUkw7jdfi4bveX41ZzlAuFdcczyDjMI0n8rdTtV6MG8u95UmxJGG4rJR46mSsycKrFvhrBvABTBbXjKBx66WkDOe8C8yrfIOs7gwYbXlO8pqipSoW/CblLOm/eG1w5bRPZJYk5bF1KJ5uRsEYS9FWScakXrcjfN3lBK7cSBiTR3TQ79OgfUGMe1KUODPx8fgZ7B0NbzNG359P43xocGFa3Ts+jr7Lolm9Ijks9HR7iYGMukc9ODA1M8dzEiwTCzVd2UlOOhEErGomlV60+qgshW0eF7p2cG++MxLXmrIxqIO0RPkOZA/QZA/V594eeHDnJcQ2wqGx6Kxf0cXDR7wze0kBIIcT5JPDXzqQeOPphWeOjm7erQ8P6D/1kF9RsKJdWR7QRT3kdRll+BPkpSk6V4p6ASzFoIYuqXO0+KUD9pRjuTbL4eeADClFdxkjQepio9Op5kg/NU8nGoKLhwjW4EvYbdjACVRyquCqnXTJ3hQaTWw4mA976nLAxCTDgmytF0snu6PytHWQ96yuHiw82xwQxObW22Xioe63XHHe6Qy1bhSiZiIa7KHQlpicHeTy4r9DdyiiZKPhbHguXP5JbnTf1xEhqeJTjaTm0sjd9WxozEk+7zO9NWoSU4W/Tk4uIio7//olU8f56iP3gZcDO+Zi1Vj69ZDbKMMwgKdfi6EdjwkOuKePoY9Emiv4UUTonDQBKGqNWZ+6veMyKTOB8wyXB2t08K86zLYVt0OYTaRLIvwce4i4vFt2gLXeEIss0Nrcx/eb83szkpNwd40Mi2Z+HJMI+hvSCNl8AGvm9t3JVwGSfrGszHh14za0Kva8xe5ea/+e1HhF5/+PyP/+z/LPR6chH95NXidnTp1eKDX7BeurqbdheV5YfRr/YV50ptKPFsJU7O/K44+clFsGhU0yYEWG+TYLzYRf09Vbget7+lA3vXsI5BPryiDNE3hqgubiXybqigNCcU43oy+XUILlyBL24D2D3EkvmYJI+JzcuwCSMzzmXEVFnS3vu7lUzfXUvWPApeYTBdlnreu44keNHIhpcbseKPAuysmce/QO8yTRUEMrir7D0fwvOV3Hq+IwudLFSNYeHW62Ggd1eHKrCKo7x5+yhRcaoZPORgqCr3L+IqX7ezprOtTkmxf6gmQEKzTeQvduJJ6Ic0E+EjjaKW6Du2NQcIKCjERT2xZbizS4KRHhUqXMFQTs/ICVGE/lZwufjQ9s1aMh6F3acATTK60wlKy+VodiXTkWgkVOVBSfV2vMl7PYjnNygDuT2kz+rQZ0MBTo736uPL95UreN/GeFcaKiyj/e6kyx11ulwmby2/IvjxaaqQxPorYnI2j3wlvi7GSkoMsGSScHTjWo5uZEkiRCkl60NszPy72ZhZZWOmzMaNJhupfCwJfHRX6Cbn2n8n5z5CM34Mb3hJaBY7k7mxLb2yDOx4yu3GmW2dWEtKQe5aBsjxD1F9WG1rkMA8Ak0Z78qMridzCXNFgM4BwFw5quDB43adOW7Tq5irjLKC0D2CLA4QkPgqQKx8UxAa7qGxALfi6VUuM9rMlmOtAfaaFSKCH7+YyRh64+jURIceiRybe2v/5Hg2I4nP8Fw81pbs6erU4jGe43xNMS3dN9CWbsaTlgVakcRt/Xfs+0Lx5ydPNYgD/bPTDx0dG0kmA3BqKjk6PH9wEmAn0C7AJRNjw8TOK46RNm8GzXEHVWjAbe4120x0hx83fMTUGEmFaIzkZSxcTyGbM9aSwVYeSFcOWl9jKol8biP03YqGJj8B6SO9YM1UNLVkXOWurJUEog5hYB5ZM1KuW/CHEEoiYhOhTXkgEvExxl65Wx//BkKATEBcQsmo1rtx/9mEjNdG4VtadwztP7BrvNUGJ4A9SF80bb8cQPeIG34iQlIdyGh6Y5wLMbrF4nBH2KhrUzIeEXiXewTIufv43K0HtuRa5IQ8bbPZmLCjPVMct9oA5QcA5fuWf1yyBGvDujo6fNutO4ZVLRIBUy45eksJ1xNsOES1UtdRd1GFDZje7SYetGD9zKmL/Sa1w0DtQSJpCkiawubDeBJPJ9hFmNA7YCcMuLBQYdmAMUiNN8+RGZH97V7fNylPdX1FoyJhklu8+SrelEPfak72KkA0daNG7G1tFQvS19C5FCtvNZP7x174fq+mS3EhUgOUZKznGRphmnJRQZb0th5sJbmzKa0n097WLON5lLwkZpKn9ggRgHshFEY1bk8gJAkq4L2Yg6/m6THl0fc19HS7S3J4Ip6EHK0BnINtpd03jcyEwsjnS2nDE3NHBkcUuZpDyfbk6PaVsY8+ATRNUtdTxNAkomv4TNWIkYkRShF8F7ucbyrpRcQAJTG0ayqrrUhsrdraYEop6Kwg92G1FVgbk12jrJpOPMkAPXy8r4HfEM26Ix4vExW5bKtcG/J4nsK00kFBeUSPK+5M6m2xxjAAPtBuj4PIRiLJxPahgeVLlmy/W6kAzOeScPt0sKcvgD0xQr1JFa4rrcSXKXvFEiXNv1MxaknPxP0RLx4QTeFY+GIjmZuQHzX1/q/eeG7U1PtBHOfPt1ddMfQlHMDyBb1+ecFPSo6UAVziafzpdh3GACjXRMbhFBzjCeiGHweQqG6n1xdsT+t+LrAmZPMRleZYUWsGzN3evLUei23CSkLltY3RLcSI70Jl3diJSnHyVno1SK6uTx4uxcUFtCY0fu0kQ/0RbnBgvktWhWg0yG2IZec87bKvp00ThNv3vnThtn01j8OAXh+Lysrhw3yoIbnhM9DPE2okHhLdbJ2opneOTe8Z6O/S5MaiMCoDd7xc75QoBDlvA1PltgUbJLVtx0PXDXX3fSGQCId9nM2GcoNyRGB5d52r0u3nvWEhFk3oOzZ3NcU5Hnk8YiStEBkWPniHlq0yFaIOUYUgxm+VZTvXumLn2lPrlkypUYzq1STa6pXFUqrJLPVqPDXdyWKfLJ4fZlGIArHg5DUaCF4ZJKn0IOuG13TSptUAtny5dUsbaV7hXvXISy/VhLpZkZNiCTn9YzCA3333+PLYUL3A0I573Tbbv9CvQBvuBTl9i9EpnZqhCiLGKUm1oGJ5rTDlFZkaDhmb14ba/UguNMZaUtAf8Zhan8pn4EH9Fng+FRtXeXEDlpAKEbpnTQy6J/LmZbN7YjPimmHUdPiQPwFJeI4K7pZg5ZqZ5CUj997FSnc1r6jt2XQyJoQ40F2IBpyBvTxhPSFmCc4Y8/nRLP3K8ghGDqLbE+Rao1syN9B3X/3GNncKgIPDVeFyOp0YcsRcyeRWgfd5gvzE9m2EpzbAbe8BPfzUH5mzNU29xKp4unF5RvHzf/+LhpU4vs2M4+MojQ0I479y8blv/fKLq3F8G4nj20gE37Yugg+YrBQFQE9RNOMvRwTMvB3KTyZwkVBnkK+jSaizi8bBTNuzv3TZXZzXZnPZnAzn/5dni3t/xOjLvRIn9GcDXD0rst1peun9F0ncoEhR1kvQpiSdM7FovmFj2c5gvQIJmoGiFUx/ploK0Yz/6kcrbbSbbXThSBSbT7quXMz+89v/w0w9gsOOpXwcH9u4dPHZH75jRq8aWvMb4w4jvuTJh0JwzAvHTv/z26t0sRO6kCUscVm+YgWYaAsVDhaH9klZSUoPKatwefHZX7xjhvC9oAG9IawBScmRMkDKICl5Ulbj0oizC1K8AXajpGwiZYyUzbi82Cm+8xi57EZ2oWVjHCegknIDKROkVHAJjLSvT8Ww6QV45DV1a+L1BfgOrkrohozXbDRa9AI89ZqT/TiUj7VykKwcUa0X4LFKwfgmHS/VKIGurgNhcVS4q3whKdoUb0koNnulx09W4Iw1r1v18SMD8Y1U6fus1xdqKF1iY/Lfc5F14SoLSCWJwOMYeyfCsfc6K086tBlvB+WPYuayFRaJNp52W9yMi2acDMs4LM89/wztcADwZ1ibk3Y/axRfeuU8XcXSVYwPznI5C6+APItxTy8X97iT7m53lKHfWA4zckiqF33bBdGh0j97/0X6oqNjyN3Jjrs3uRPh5Rzpwzz04TdB3iuo96+JrdPXxtaJPsOBdZIxb0bV8zbsWylNDMKa2mlODCq5GNquf62eBNR/8P+8liQbbZ997cbfEVlfe/gjIuul631cZH3t4f/jyDqP5ounX0Qe5H6peBrd+/3iT4uv0TLtKd6E/svyr5dfRc8U+0xcxgDWvQq024BSVKGOKsU98CBQoACCYsIlFLwwIMln+uP/uXVFR2zABil3xWM4ly52BN78tRkKDcIRGY7wAThSvXTxu843v06ag1iwVnF2k4WUDCmtpLTjsnyNCkNmF9xyEOsAUrKk9JMygMs8tcGxsAFvgclbypHCvceiG0wpUaoAF1jT4TwkicZPFmnp9tB2p9vD+gPV8gYLY7223/goVD4BOslHnLI+KaXOYoKacvgHdwab3UNLDWD3wYhHBr0uxDz7BuP2ehwhBn7oSt6Cc7Jcr/5lcbegxKeODiUa4yGfo8Y+tLVPZaEnPOmOJhLBPniMKreQdXEtXFSiZ99/cWRq5I4s4zjB0B36vAz8S4LsXwD+OamdpdnvdnMcJ7Pf6RLuXM02SO7/213rsg2s/3vZBkn6oeXTFn35DvriSUv01Mmrr50i8iMVx+gT1ktUF8ZECvacbzAtUxxAwlPjcQQEUYqnkszLJ7Z5t2KkLxvO1GJzKYE9VWhOYzjU3GpGAtLNeC+NIwE9OCpCbQBYEUubsIJER7DhHiTworzClOYFyJlBAYz4A95rV7PgMQYhR0v4tOzNkLKR5lrA9z198yey43LU6wlH6qMxSY4Fwx4PisYnsid6laQU4VgPG65tltCrc4yrqjaciPegOx7IDc5vSt5V/FMlERejPt5BO6p5AXRtW/HMPjU9z/FRAWAKmu2NJ8K1VW6zz10oDqFJ4kNsoNa6DzEMBDOg9FFeaw7A0oUnikP2ud/Or6F3B6Z3x5q8iDBjRp9IxKmlI2xGnAi9s4phvWxwqUXVnAJdnyqoJCVTbQEkalVJomYHkL4mhXP6qHwLCfiqJAqVr8Ie9Rpfnqs3ra1UidZm0LzVYpJS0tRyzJ38rqyoUmaFjKTMRDxWxQb5mCzF+7VITB7PHJ/f0kfoGu7JiIQRrK8hukHpO17827R2B5pRW+R6gQ/ZaUdrz4iKbt2XSqP5waFTxa/2NmOSupg5xk3Y0Vt8OJfUpViAI3nIdJwZtsSojdQ3KSOulKyxhaA17pAXpVK3SCr5lNkt3rrrea9pcsVYI7qUd1ZeMXxLCxVOH8YlpKwkpYeULC4LcPSjIACLDS1nBbQkGnNXrjW0PlxpQr+4hJf2oHQ9b8XeKVSzItklZ8DqYssrsH91oY+yjTupdfftaG4Oa+GkL+oPc6FqgRPZ/mymXRCk6nh1ItJ1vfjpuYmoGA9iddL3ANg3NqbSxtqqAFg6bA4LEwq1fDVYxTrdNBN0NSVsMGQHfNgn8m7xafR0aZ2NdmplbQ2hlIXDrCzPaCEfC8jOOMgq8+GVVebDSPXjiMW71Q9WLz1XfNry66tu5lvf/77pH/jg55b3rPNUljpGFZw4ByetGG3qYrOpzUoaoR2EtFrBaSXY+1KRKi+/UI9tEjbfDsx0pBY1c26/K2Vo5uqFCTjsT+FFGPJaO55s0gwivcELKIyCbTOSf+3M12sWvJY+NPm1HMoHxGMuew1GywlR0jL9ueGjo+mMHI+E3d9i05nbBnSwZ11ut1sSwfic6u2puuDiuVTic2NHDwwOKck4/fSZ6dnu/ohgPXvWVR2W47rW7ZlKajUhNds3dMfU4ECXLgjtbXe4+zRVTW52nTvnalWuG3rG1Cc6RTHD1oeorXi2QRfG+xtw7gLONau1vrlIoa6KSuj1KyZqA9CtXzH6SCi2kQSACo19mMCNDaAQ+hrxZh82TbtS+W14vao+ME02ALE24PWhu4nzRWsHca1FOLrPmeKqeq9dVWA1Mx70gBgQV+ZRi9euICCJGolz6t+u5tXkYG52UM+m5LjkO+/guZBQGxUP3oW+Vrzd5fGzsbCMfh4XGsB691Q87grzajyb6V7uH0vI9IF5VD2Z69e0cLiqqjakxLJ6uC7Mck7XwWPF/z5/rE/W45IiBh3OICeF0/4RPanE/L4ziZHhz/4xlvMD1M8ZmjlINVI9aB+Fpy42qoao5BPWN/EypG6MEclEhl4ieDg6FTXXT46ShHSjNmXwOE7VZta2KYs82SqtpGY01aB8I9X6Eoxqja0vobzXh7d93taXykcddgVq7A4FjkZq8dHaCDl6MdHz13+5Cjy9AJr++i9LNWQmfwTMHrCmnI5aOLT2ZBafjBcY8Tf61n4LTg7jk/HX6/DXLybUvzbIIThZwicX4EZrtByrF6DatGIKcKM1h8J6AR4Bb9XhtfBsTtYfrpNW1N+Hakzdl0mQ1enxxItW1NaejqX50rrOad5edjXz9pgHAaKyl5eZal9d0mw1iejATDQej07P7lH/aEuuM5391OzuuI9DPBebnrk1ffQrRzfNDgb5qKyk70grcjSI13Qq7/BBlJtJH33waHr6tlujCc7X8qnbd2c3ZXN9W7Kbpm+/Fa4cux1d0tJ6Q9zHo6AvLm5O792k4wwDHnb0TVTZ9mYOgx4LUi+Z0Qkyd6FAkVzVRdbrQdAVnbBldsWK1KI/SOqs6qK/7EFCBq8YnsuGL5WvtJGVSSs9ZLZshZO8+8JDlvz0sLDHpYxKkueaZ8BkqS5N/Uv+t39Zwem0ueoDCpK0y2DwysX2l83Dq8muVjPZ1UIBLESgMGhrcM27HCwk4RX3X3PaBkDCNPzTL6K70eGXihOoqziP5orzheJxdIyG7V7r/PIR+sRy37Ezc8VXkDJ35hjuW6u4x041UyTUXXo5icGk8FiRJK/2KG2tydoMIYyBnngCjV/9DXPI4rr6G+KnP/jBKNhXl6jPUF9FClVoY8xMN0zDTyuLzhL6eUgxxMuLh83ueJg1EO6dlLlLKThvGG+JrLERHxgon5f/AtDSm1ocNytmU/mvlV75YH3uOhMqhFmDX8ofq7lizC1dfHv/c62E5vezxpeW8kOuK8bOJThlIRTmoYMNsQvXD+0E6DBMyk/gsgCH1nhr4TjuPMO68QlAEG4+FB76xM5jc1+6//rh9SbKxx4ibtsvDHh9Tzmb2zr6duPQwrjXyIDm7jOnOW3MdMyu+m6vWYdx/Sy8NtOeaVrr0P3whCeeWwUoaxcYsn+Uh7cVrbwaYv1SwOWl2Q9+3R0WpLiS7MgqajTh5VEkvDHRndMGMtlNSlRErKczHkvLUbFeqGJv3/uDwQdULSaxX3cGfTEpLieOdfei6kgsHecGvdHp3s+IkocN4alPsaQkhnyeSCirjY7NDE8MdOsjiyEuIXUke9KTDVGWq4nI8Yyc05LRqMBWTQtpMcr67DaHgw9XSwk1JoVDPr6CDXDNoq4OxhOx7eEQWxX0RaWonLhvcEiMRDRla6C1NsTB12LxfkWI+sJum49xCNz1qjaoxJNCtDbs9kV4KbIh2t6f1ZQ4zyMPTvCjH2xtCNdyAdZbHQoL0USyXgrxnMdP+91CqEEg8p5gnqcnrEdJ/8mQFbsZFRtVCfxan1Rpq5zcbRoR5QwK+7ouBdgGr3qWeOL1x5nnn4YfrLss2L9tfQFwhEztoE7h9UJxTtdiynyjkNtirmsI24v3HKx3g31xj/n2ihtmyN4NpRcOfIncfoPp0d7A5ofg9neaiOxO810WnLmM+X2gtDrvBLFMuW+46ffvIZHImYNe34UNQzdRU0d//6MWOFr/upE1kYPyqydodc36Q2vE2d7gofm2j4Un5UUh1rwOgL/mdQFCTUhJ9PftmBiZvPXMH5y4eUZLo3BIUXq6do6PTU9O3Do2ntvWm1RCNbuTyfP/cHx0dGDHts3ZaMKPh4vWaHbztqFto6PH/+H8nneTSjLXPz2YzkpyKMQdZKt84UhDVOmbEcRa1hMV9/TLcjQS5tzcQR5uG9OzfXuGBpVkqJp+fnJ6fHSov2+Dyoc2Z6Zm/uCehyZvHR8d6enaqPJhVMOrcl/X6Oj4rZP33H3g/B64c/PmbO/QwOi5nQNDvdnNzfh59px/Y273o1paiPi5sCgKraLAhVlfpTshJ/Zf19ujb4wnPW6eE3xNkgICLvi4ekHPXD9M5DBMn6KL1oepPmoXdQ8FVpSRVRdbzNW3tqeMEaJ7QU4Mn7IYKb2DaoJIxVZTDray+U/gJPBNqdRik2ki4KD0VpxMFwT1580HsoDQm3wGDiq0JKG6VTdGvE9RTYlN+laSDY4XlQ0Eo+vXQEyvRppt9lgnWjf72IyagPVEkr/J/H7pmtdBrCbclRa9ClfzSkJLdxdcDp4VojW9I46HbK2NsbbkdQOq1hznuKqqBo/X7d7sUfhIo8thZaJbeifMBY7Zr0bCWzQpHhbd7Emdl4HUlpk+JRGJuN1MR7whHGTtjmzOpYwIIsuiKo8gJORtxR9mgyGGmWWcFe5oDS8OSRJA2UiT3K1JIusLi0KsvpdhGEeFRzPj1aPUfYxoOU85KC9YuwjIjuM1JD3q0z9yrV01zxq+YjBLF//qh3/z/ZXEEgdUMw48qcGDc0uUqb/5jXnMxRoVS3mP54pRuXTxlcq/mTernSQm6al04EMeo2qJ6vYAYmCsNvyWqEpPlfdal9rvPLy6tKCK1xaUVjZG0fATxQIaPjePRs4Vv4FGn0TvdaGDQvFLxdMRtG9lc827DOh3wcJRyysPlt9iwDjNuQ8MUYph8tYyfIChVpbGwG8qkLzTln/8Mr37y8vPofP/l+8EYNbp0puoWeqvP16b3ngz0Z83mkduvBk/241DeN3wCegf18+So9eX+tHtH6FdbzJ71VTKuIklc6knUviFL1C3uMs8NLpO8e4tocTXf2pGfCZY48Ylj7GLNcaXKGO8FeXHbyyBiVtuAgMv5cbd8OYbYXMDRVaYNUb/g1UzImsdELDglywY8JWWOZDRf6DeRWMo+cBgTtVGf/rl7z26OCzHlcTIk/9hKnX5p5auruyB2Y6sv/gYGi4ayJDjg32NUbAL3rGeZ47ZXOZcHgw7Td6jEltX5/KAGLHMfdbzU1Okbx+1TNJPk3c1bKaGzHUa8PQOrGp5ZbGpNOZmiFTUmVJRR5bXwEsHYGbjuR0J860NqvnWhiZQp9TaSQvrF5m4JvcpVTppnaV1NMi1NLcljybbmuNkUgXspfen8V7wzio2EKoXhurEUKgCT1/Ay+PtEMRqzlvFHNHTyZbmAIcCwVg8ldbTm5L41Q487CU3pWNClONZj4fFMf7OJjFk7nBNdYQWeE5dlHkeaFiFV0VZeXMDoxgVKs5yNZypAkM8m4wHezYZ4tm04/7PEoMKjItKs0es2lQWJ3YVlW0q7PVgUnlvaWlYslLpyktMei2vX42gPzNfZHL6NH3uNPpi8TOni4fQKawv4rRKH7feR22kjlKFMOZUlcmpjQrOABFNl6PhvrzYaj5EQ6rsf2y6eMltqleGrM0ar71iNC9RC4ytOW5Ge8pbpFu2uoGHCk7J2EiYaVR5C348aWfNip+lBRiJ4yrWvvq6pPJqBOYSoNCweEiJa4qWFRJ8ODfQ3xKvuNeGk9juAMs3EY9GI0Kj2rInG5Y4dHH5HH0mrYG9HJMjsiQnunLR6BZHMiGLYiPrEYUxLduWjqqRXLJaVA4ATcJ0jJ4HmmwHK40sA7EomDTpJT5ZvOVV8KwxQp0cnp+02GVSp4s1UtgkC5u7YWUxVXobXwqzKownTVyH3dVeK1lgvgvnWPm8+XYcKBDM1edL6zmY2uTaNyhg/VImTye9ToWtroK9gg/CJx1yYnQoDsCsVkz4M+mIEKmJeDzR2JbehGw7YQuHPnFLpi+tSjEPi+TYzVpTLMhVuR4+PdSjtUR9Poursk+UpOhgQvNWWZh9NhvrC4VjGUmSxC1uIOpmwH6iJErqYFrlaZvPFw5FIy2H5ji2UWiOmePcAGOgd8pz+6hr5/YxK3P78gwGUxayyLDmVwNo4McvFy8wRgDV1RbfNK91qjjG7MN5AtQtVCGBc0Hq1FIaiFGdMjNBWBXuQtIFkBk83UiysqtAbJtTeBYLyc+qssDYUJEw6R+Lk1QQ7NfZSCI2zfGPSAQhizOQQeGaVWBMTNYU8576JusWw3JcOzaYQ4tWGxfxsQGvuznUqOKcQ4fLwmgDuem+vWJxzPr68shgOhETWM/42GP03Vdf0XwR0c0w84zLxnrCocZobI+SbI4Vw2bbh4u/tfzGOk+FVrRqlYlZQRVUkddGVIF8Ge4USeHxXsav3POSV+5h34GT+A7wxKdK0LRuU9OGTRxQxqIimaGCf0stG67m8erj47Q6f+DHBwa3dbUlIjVMaHRLti1RE5q58lObdOWnlu/gd0cN9JL3CqHvoDn6DOi75vKY4Wd+9wuF/GQha/Sdn/wEvn+4OIReh9Y2UBKF1xxqIG8yJeONhN/ktFhtYu9G86v/f3PXA9zEdeb3rVartSzLK2nltSzLsizLiyzLQlpkWRb+g2OMcY0DlDjGcRzHcWkgpRQoUI4jLk17NOW4Nm0nzfRvrpfLMZ2bzEr2AccRhoYmNM0xuQ5tcjkml2va64U7roFcp1M4LO59762ktXFIezc3d8zwvPu93dXuvu+9/d77vu/3WxjmijtGSrXQGTw49SOoQdkXD4Vr5SqnRajzDfqc1lWPKA+0xuz2/nhyMGIP5Od4nqsoq5Qqg5KE2OPTpmXhfmwIx7G5S945Hh8PEl6PXQzh2tEfKkDGY/w8+oig8+7o5LHvQ73DmQHuio6eDf/wo42UfwcGTz0XgAXWHY0vGZiqw5JMAdfG+ouvXDzwOqs+wn7syP7H532P6HOai3hO48b24xCjuWJztfTGWoi7gdzVCtLHquhwVCXCe9OZGLNJWCUH341LAOVvqb0DMxJoNyTwlOaai+NjvVVyWFnTef9kV3ck6nJqz31P+5qvxtMfiYeUaj94EjyexkgYzxE9vrJKzjmC54ZRv9frjSf7B8fOvPzymdEtoWC1zYZH6NSmje144mCz220BJd77AfMF6Sd/bpwvCNj4t+D5wqGf1tyGsq1nQZdOofMFR8V1TcSnZH/ySyq2iVlruYCr7HjScJ3OFxBrMvMWwVpus1eKt88X7lRthO1WkRsFChub0Ma8dgwN4zlDGDafxcVzR31oB/qkP3+0O/8VwybuFLduMSmG4YfNh8Qm5sC/MKLC/IK9wTCihfl308n5V/X6PUvUf9L0HqkfIOcfhRqTjYEjyJlYJfZEadz2M9wIHl/bmZXMKSbXAT6zNPGZgeexsQSK5sPjqk/MpnEj2BMkp6MyAWkdQAkQLgGtNH3jb39dJHPC0zYZz+YkncwJOHxlcRZ/vQiNk2DER5Ilgo9ktghSAawXLdgjNsXKNNbZxjiob7oRwDTty8JkCSa1Qk+1prqqUpxMaj7Y0WJ3mGEox+3ifizkXxIyHEhdDZDhJwtA4zvuG+vq9AfQc+fi/R+PKCE5nCag4YmBeOy+mrAr7YwGopEDFDN8df+BitHVBGjc50skB4ZNTxJ3Im4bgpfMX3U2MY2kzX6FhpeUv4suGeT5ovwqmizJLXxR/h6aMByfK8qvoe0G+Y2i/Dx6nDmMdcHDMJZjeOyrZOoAAcRWwARbAPmqORNzdtEG0GB2AgBrKwLA+sFu1ByJYigpYUApYwt4rBQPFvLhCGLBkZ/fXAz7XClR2Gf8p1KctVcS0BwoT6Xf+sVfUthnIqwmpYeUXlLWQZnD5QJvDyDOVBNEaADb8njrisCMDML91igz9lziSSiB1JoQtqwlrE2VhPTI7WGf407OC+zz83eZAjcD82+eRxXozacEp7XSaxM4vghkS5Gi2ec5R8RTm/I4eQeL3//D+WHAPcbvv4m8/z9AedIuBGuXtPsyXR+6l5S/i94yyPNF+VW0zyDPFeXX0H4it+IPXI5cpwXLeeZXT1M9/BM8ELQZ5O/2E/mti1i+lVyfyq9epMfzWK6S61P5tTfoGo9dxzeWmAigXxNeETdWHaCHhJCtOcS4TBURrZlyOC7DdksL8FuDi9eNVUZJ5NwuUBk3xHy43LDpgsmOm6YdQXpMFIxpICrLWusKLt1FcMgBh+t2QGRoSPvXF6Eiz7935nZYZMDdYA9/nZ1cgI7MHs67FgEk5zu+zhTetzlA+l9c73/fJXKCN0nea0Jvz+NLyt9lQwZ5vii/in5akpPrJ/Trf99wfK4ov4Ze1/NUf8b5ud1MOfNbBpBnylXNFNPMhcRFeN08iULQwweJR7ec+nvLwd9r5mGbN5f8vSYWJKwJassE2BbKlvL33hZoaKxeItCw6MpdOtDQWP17BRq6ylCqDMllyFKGjqKH8t/ZiibQxNb8n6IHP5p/Ov9NNIim0ORH899BD2zNP5N/eit6MP8tymP8ivnX5lN4ZEwyq/GYl/MXeA0rQItbYZzrh1glQAahUZoQnRASIQoM4NshGIEEsSVeF3UQHzy+Oc9y2UZYinSdpS8KInQcUIITW2p04d0glFAbJrXNhdo2Ursayhw+0TC+hSFwV3OAu9sF+21pbTXE7TI9NgY5nC4p2Bhublu90HKx0pqFFeTrugq4Mv0dJO2sA2+aq6GHyanFgILU5hYNH1Lq80ZGrqUSDRPx2g28NBqJ6LCYh6a3bNz//ZdHsICCnu7fjgX+ao/Kvtg5uH5Uh718JT3UN60DYlZ74slrk3/02HcLSJheb+qJa5OfPpR/noKf1nrTT7A3d05MDZg2RSWZQl3OfyNSLVMIzJ33TfRDnyHYfaTvtet98iizlPxd9CuDPF+UX0VPGeS5ovwa+jaRExwocp2V+nV+vAB31Y016y4D7uqcVEUwV4GWzdRYgsymIIKAHMhWJRIwAvp17qWmQt6u2wC9SlDBDdiZZNkgcOwM+urB8amOTMCPav37xkcOAfrq+p5MWHFJmz78Z4DAetMfUJMb1z0wMbh+byiYfx0dh3WVZHrl4cFBGEtuXeG+aL7ATDHv6TnvLWquFfpEOyDnQsb2Zrjfh8j9TuGuMCVm+/Gkw0vjJr0iycJo4i/Pik0ZIZLdgA/ZECNQrdO0pzR/5e9S1GQcErVhbDIK1wGC71LjK89R8SpR6z6b9Vdd1+rP4p3ZnlXduCvg0pBK2lNWJfvru4eGe1YZo9luFxJN75/CxqMQT2wGN80Gr8OptWOlJ4xW8bS22ZEVExSLeSkCMmJVgidOTxOyFN3HTTFURZcLdD543Undpq9PLp5DuR1He9OZzWPbxkfXJdVar2jzy/6U3yrWyLFRNRT2+pAktYTX9E2s/0o7KwflB9vi41M13rAypSyr9SJYNKgNOTz1olgfaEkm+pLpQMgpcezOk5Av6KlSlHSyK51Qwv66uF/01ig+T31XUImmOgf7UulI2OvBPesZe4XgEUaGU0oo4E+HQvHY2rgS8vmqA6JnVUuw3l8l2+xOPGKs7Lv7JtgvBHPJ/HOs431Ex+8CZPYl5HvRJoP8YlH+EvOGQX66KP8h8xuD/EBRvo25UpLzu4vy80ggPuHeW1f4c9wwM8rsZB5l/oLJ3QN6+iF1bpyuE/Ukck2wTtSqzrmpZF9iblf7PU3YFtmmzu2iMktC24Vnh7Cat0UPy5ghSr0Za+xmkWirLUFYlHYlculpsE7SKWzPfhrr92ZQnbq0Nu3I+u5Jp7W0M9u8DgbS9nGYpvStXgea5i53OHO+uuaCQ1B3/hl8gspi5lky4C7EVjE6gSm2Sr3JMKvB03aDi7Ch5OtARviVXsnZG8so6fbMynftNp8/HOkEuouQKFlOCX5vKjk8tGtmdGOye/PIx3SIlnledAYDuwcNCC35M9NyNKSqfd0PPXvPplNTE5v6u1uUKukFXzIcUgL+Glm0sa+ynYDhEovGlbC3FkW7u1LDHr9N5HluZWdbrJYgTfH4kZSoExAZwpKEgoE1g/WBAsyLayzTq8bSJZQXxIY7oqFglTTy4SdHpur98UgP4E5xnGCttNfIig95AQRGDIa6e6mNNpIfBuwkrDv9us1tK+qUh+jsgK7Lby4p34t2GuQXi/KXDDrrITo7oOvsb0s2N7nOC8RWvku3uSHXNGaQ7+022Nzk+lT+km5zY01nk+T6VL7tUgnfB5vWTBtzN/P3TC4G/rsOGm0tQ6yRsDYmG0DO1hshs4FVZhkehzfQcdhz94v6OOwUNd/ZrMNyXas7Oys66rAd4hRnXU4f4JBCCVlOfpDnsNBgkNSmc/hw2PKnmRMiNjRqfXX+UnjdYgkZjFPQd+S01uvICbZq4v9Z20FdBoJDsy1en4JeYk6miuT2IbelxHG/iA5y4XJhKyrkxHvlzszY+OG+zkxLNJVZl794KbpmY+THUm9ARfGLI5l+BRsO6ZW99z7wuUc3j2XSPt/pLz2xvisTCjmdol0J7v5GVzqk2B3oZ1MfGe3vawyJond0ZHzV53aPh2JJWVCcTY99fHx40+T49M7pz/J7LqwaCIZQY6i3e2Jy++m5Kjkau2tgfGygLxaJylIs1jcAbXwED2bvkfFwA7d4PPQRXdmo6+hbS8r3oi0G+cWi/CXmqkF+uij/oa6jVH6gKN/G3KDjKvMWF+L2kFiecibF6KufUbKwTPnISRgFieixkQBrIQEroivJGrXO7UGp9Ch/Ya/p5/Mnjx07xk5++cv5mRMn2LdOnKBxPZFbb3Bz3DhTw4SZDuYWzV3VkRJyFliVatBVOEOsb2Cq9ZJoarLAv5Kq8PLPv7amGDRgO5utKYPAAGpx2wCeF0qtRpy111TA+gGUUOsjtXWF2mZS2wEltrhtBgWnoLXl6Rw+Ffax+d0BAfXE4i63Vdg9NXh871gUC/d+VUT927D5ka2ygNo3tOq0VMTmVijeg77CLVKPA1jayPChcC2GfoicBNcl+uX0+nUdY8eei7ikgzP/Nv1U1/SBavR2MKn2DSTxh16WNoWS6Q4AgAhVyTxfobzeNz66j43JVdGHX+67f8t2wH6Ix/ew/YdG2HikiPWQj8ZdgAIRHR050JvKhIne3rqC9Rb0cJSn+km/14vle9GIQX6xKC/oJ5UfKMq3MdQGJ/lf5Drjup57KTYRYE5g23Q5Hvse1DEn2ktIohRzYoB+3cFBRAe/5fzlHKvEExTOpEcHnIBYnx4COOFqaCJhXgPtDudfWcqbmuNWGuW1EEDwg5AmPOjO+BKPz7Esf2dwiTvgSgDWaRFN8AORJUyn7ownUXzHB4rveBuwlmJ7/xwu9pGciiKWEHsnLKFzBOiJ0Xlmf2N51nyEiTBr8NiWqwWrLKgCp1J2RSqRyDkg6liw2VVVhflPrj3ThVtlzl1da6vQKcAooF8L7uwthCEx6yEcBDkPycXyuGBR0SOTsgabYoDtl2rBRlZ9wAaeVo8j56itI58UdzVw9rQY3R0ZBKlvMm5Ew2ofbkW+gXiSFoQY4GNTjgbcek0RtsjyEL1/5LFDz6SsIatcL/gtpiduvsm+M19tGrq5yicKISlkbXv2M4c2jwOfh7+7796xg/2BAOfgOQ8fajh4/2Rnb62fPf/dwzOTY/E4AEnqy4YcxyaTD245eOSpAzu2DQwpipkbYdmQ0j84/TBuCTxeW+LY3m1jRpiHmEP0q68tU+e6aWBxbSLHsYSFRYeL08YTc/dKMQ4bAvfqaUXTRkMA8ieA6ePeRPYjgHWawq+Ki6UJKBxPkualbvxS/fUEIuReR45JrYGtu50aTwBBcFeoN1qpFncJAXARmmSJ+/uDkGvMC+ACZx79D+Td1btl8sDh8ZGVKY+Mbt50Sg2hdOfQ7i96vuX0+dX48LpHjkxOdfX+4I933rd5VWcweNrjaVLak92Z3o6wUiWTxfxUX38qsywiySYfO0jBBdVwxBtg/cj5paPaeCSMzc6hbZOfrRoZGIol8RxsYiAab8bmZrUHRaMTE2MNDWv6tm0/+uiHN8UKkDgjB2bWj0STIjgMWpPDI+6C+TlUXBPIFdcErqGHKUYxp7FPmi8yZbiHgKvWTHyflTQZEtx4Zp6xcJTGLMuClQTwcI6kC3BwlaDl8oV/2nqJfQcc5vb8e+7vfQ/3OZX7IivzuxmZieFRUeNjcxHqI/SXIhiWk/iOEHUWh0TgYQSHMfiH49DFQngYNDucPBkG/RFAMyFuQiRZ7CyNkQZm7i5EyTz5FWSmS5Fp6aBHFn5Y2SV1TUzEIoFgKBQMjGyJxLok13arEHZ7kzVyWLDiTdm7wis1C+ZDcVwbdjsDwZG4OhIMhPC5schwW+m40imQw3AZv7vj5tPYWvgbRqvFb0sFHq/ZUGWtQKjhNFcCac3kLYbpg4YJQkQhvixCDYa3XzovUoMhKGJjN2u1gsEwa7OCYRAUZ+uDdYCuT8oGKHO4yuC3wjVgBjQAij1zwmqrqKsPBhpKBu9iCfniu8K4KWsh7MGkf0jkBFlNID1BNXqoyBICdAFZsAgeSQllIhFn12CwLunzWMetHJaFwukwlnEd9rAHD+oWTuurCUdDeJbkFAJhZ70v3e2NRJVqr0sIsHWChPAkn/kfxg7+353LoHPcbnbIGKOWofEGmQUxag58GrcbnXv8cfqs+DyB+R3PE5jSeTOmk2iAcGgk9Zw/MTZnNzP1cJaDDKKwlIX/z9mpZgHjh50h/Dbk9gvLP9CubtU9w3GENHs/MGibTn65rzYQCzZE3UCgfW7xb66lMQhgddcvYPUmv80XExqtS7B4O29j8VaMLN4z+PfR6DmOrRBEqdJ0MjOwqufFJ5QOfxzuht5H/gYawBYAuY8Cu/j/7n1QIvFzXyoQiRM7Ysh0kp0gfsl6ZoxGwmgeVauMaaI6V0FuSatLEMBI3ByVgI5AYujgBirFrIhvoJ6AuerRh4Akma1gCJRJtk6kpH6FpsIDl95S6uKmG+IEng9XfipS4x37At7GzWjfH6nxjJJmTHo9Y1JmoL/zHNlZ0KalZxCxHfVxPbJEVvWGhezy0jvVHBSG1kxe6+L3iXeAoB3crGALeUSgWIMqdwwgabMCfdVZD1AsBZYkcFcXC4bgIV7gWLu1QrL/GHbO0scjetHddw7rhbQyWg1PBHt9Pvp88Fz5G+wE0RHyXKAlmlvVFUWT/78+V0nP5EzUE5XoXl9t2kO0DjEb0RPsQdNpxsu0MlpVDBALBC6i/0HwxUGvQY8HIf0DpFj4rpxUiRYxwlGTZ6Mkh4JbdqTUUFiSZWckmEztUJOBsIvdsTemNgVbqvBovlxNJdsjsULqH2NC+IPHX2Yu6fPwD+lRpZygqnqcVdZchs1pgqxQCLyyGZGROOiCeNNCiSfKi7ybAfyyCv+R/AJ6+Qx6+ewl8g9fbZQ5ym4kMTifYgiFBYKWgyYrI0lwBb6K2AwNveEI+QAN4edIDP8VGndDXGClGH7Ah2SP6wH3hU+lzmFBPpAcKsUF6pH2o2j9sbyGNhoD7JkF9/iJ4j2ayCLEonvUQ4CK9yhU4PuwlIKANFNrKWyoQr9HPchniXs0hveMLhnKQ8by/CTu/FOEs3Q1k0M6RyI4xDWW8lBgNWJotBagGdGvn7fEStHW949OuD0TonmOgSBS87/+qmknkOMCB8WtK9yI+UlmMzPD5DaAXvThmVQ1+CobSV71huqKiJYu5lVnEnOVdiJrVSGcEGQtidn6DdUCOOZJEoz4Wo61bgYcLTzxmo2tSK1slBMk+6VFJEYok2X6sFU4sDadzjbWExZLCGJVCUQWxQMMptRFlO/GDHVLwBKgAMe4h8h4p2qJEJ1ibL6o7GcBZP9p5ZDYGOrMjG3aMzk4sM0fsJ0SOzq39qZXLMPmTjk6E85Ps3Dki+H8dqvkCUbV1PrprjRE7gAo/eDU/pGxTCaolKPfHGKlMr7eAchbtpmD4w/0dDcGPJ6RTHePfSIWl5wtytreLTNWH55eC17eYzu0qXcokqr2xmMT9u6eznBM9qCmcF//5PZpMr6fZg9YPIRzrA29ytBoGWuNSt57gFCWFFI9eDxbFWqbFPxOEQAI8MTO95Y+qwvpyIAiBnfauTaqJMsTWhvh35urpXrSrsPe3P3OvxI1Vlo5bTnWYWftdbNmPXsqs/OdAVJR05q1OgXNietCUNd09tQP9rxDQcGs4my5FZzOlaQUSemAsnB+OV0BrgFIK1K6SVlFSg+UhVsgWFXLlivAOEXKZlJGSNlCyhiUOfyLhpW1AolUDlfCPgGlAnSqMGBO5fBPGw4uQlPhD3ePs9zhdHlCy1piyytFyV0Vbo4sBTbltpLjakJNCj70/Y8sDEK+NqzY9rSBCg45VBfAOFa55RQweCRdhJaVr4R1Z1PQtAIY5FEM7/lYx2n2C/mbn2fLzrzFspylka+wceyxvz4omHiW/eftzwAJq7WskTU7d+yY38p+bX6riZ+/wJpMXDkrjjsDPoHn0Ldv3kDHXnByLtbKzl9A32QFpyA2Oqc5Gyc65l8hdi2eRbZz7Xh8YRwBR4Br/88fwn+ypooHSNM+8wX8ZQ7hedIf0uwerUFdAIGvcDoLKqzrZL1BdQEafvPviIYPfKnYqtKaCGMKhF0D3HODH7/C8vTvBJOPdKzw94XLZyvn5u6MmX9zsAgyTvqk8fk/UXr6IPfBLABNv99zE5oY5b/xxHd62g94Vh2z+9YteE6zZr4gKswQt5vEeK5l08RLtHZR/d2310PcFquyT5KYZy/zvG6bwvqeOicVAp9znERSVlAZNX7Y1wAWANExCeAkWQInCfHPLBnmWA6GrgSMVASg7NlL36SfX3OrGZJHJD/Jy5vFNj8MNaR0QpnD24aeTuAcmDkzQMTpUaG8VNzR8Rl4ibz15XFsKCQD2GRwqG4T7pZ2k8UUcHSyK9pY5bH8NnToqR1X+YoqzlZhZc8jGXfEXG4HG53/6U5WtrkUwem2c/mfoUCgKci76Fxsm/kG6+SvFnMZTGYwSkkuAzLmMjBZE0MQMfFNhJKq7EZP53/06hvmG2/43gZ7csB8A101XIctXef9cyJSqtsMORE/Mt+Q3va9Qfo7vp8n+TxdM4KbUMG3J+prRjzhGCuuGQk8uRZ5L0rQgs1N3NCwZPTw5Qu8XTpyRLpKcrbxNcf4XCFnmza97uhBCX1Lh9DRs7TBlNSn6qWcbVSwJI8/M3/xWfMNmrWNbl3G1z+Oz1vGHIN4NFjZ1eoTs7XuMoGyclbgHheGHjcXpBO0Zn11Jn1+M12dsZBQb9l6Xas5C0AgnIUFaDZS8lBCYLFHrgHAAtnwpcjhQ0CNeMBdY07gkVj21BRZrlrRbRLdtkMLFl+CpdQkiPkwrtKgK/riS8iX8vos98Eyjby2sEqT8pZWacw3nEKA9QtO5PenO/3haDhOFmiQ39s5IIWjiqfmvwBIH7JkeNpjYGRgYADiO7UH/8bz23xlkOdgAIGTFo9vweh/Cf/8OBjY2YBcDgYmkCgAg5gNJQAAAHjaY2BkYGC3/efH4MIh9y/h30cOBgagCAr4DACFuwZFeNptkr9rU1EUx795uUkeRUpxCdJqKS6KBCkOsWunoCKhkRBKh1AkhGzGwcGhSAmhhAhODoqCU55/gBTpUBAyKQ66S3EqLiK45vk5N+/FUH3w4Zx37vlxzzk3L30SX/AWyp7D4KvqrqsQioUV3crVVMn01A4i7cG57IrWXKT73jfSNvK9xeJfhZfQgrtwHbagndCAZuJ/aDlmdHUvvKQ31HIwyo3VhpHp7kSjfFkt+yfuyElr3t7FHnlfO2+azctp3A5xJfRX6GFhoBBZMrBvkudZ0u9S9lgLrhuf0EuHnNb7PjXqiV7H52KiDzNjHWTG8WfOD0ynfh97fxZn/maTNohb5b+Hns+N4wmyCA7W8bkcnNc7k/S/4+8S6VeSawMecKeJ+aA/5KyU+67V4LeWbVZ+/szebK4T/8yu67Hbpa9IV2EZKu6FBu62qn7ekR5BNfgxjefe5YQK89hP5v4PoXTB76I23UUKORfgaVCOvyDpT4vpHs7CXYfIit/FPNN92H6H6azPwvvbnN/F3E6sfj+pHyb2wX/zMBdqXEvO/2K76OrAJDk+0GuTd1K3ezEr28eNIIpPs0+kAk6pDOpS5hiuTNE3ZAu562O2U8gtcop3speC/c6Mj9oKlSlaLP8NI1ObNC03sUvEHrmb6OL9ATP04LcYNNSBSvCc2B73fR2f/gF8MMufAHjaY2BgMIHCPIZFjA1Mh5i/sBqxBrDOY33DpsCWxLaM7QjbC3YZ9jns7zhWceZwCXHt4s7iPsRzireJdx0fA58HXxbfBv4cgW+CZUJ8Qm1CD4RlhIOE34moibiIzBH5I6ok+k7MTeyEuJz4GQkvSSvJLMl9UhrS12RKZM7JcsnayObJLpH9IMcjZyDPIL9MQU7hgKKD4jylNKUHylzKEcq7lG+oHFOtUv2itkY9TP2Yxg5NKc1FWjzaLTpKuky6Trp3dH/p9embAWGaAYvBKsNTRhFGDcY/TDRMbcxYzNrMNpidM79m/smiwuKEZZDlLysFq3lWH6wFrCOsl9nI2Cyw2WBzwOaCbZ/tLNtltpts99mesr1m12U3zW6R3Tq7XXbH7C7Z3bN7ZffNvsi+zr7Lfpr9Ivt19rscIhw9HEMcExxzHCscWxwfOL1y+ubM5MznLOWs5mzk4uIS4BLjkuFS4tLg0uMyw2WJywbXaa6LXNe57nI95nrJ9Z6biNsnt3/uXO5i7krueu5X3B+4//NY5dnk2ee5w0vH6xwO+Maby1vD28U7wXuW9z0fJZ8Wnw++Mb6LfO/53vMz8Gvw2+C3wb8kYEPAvkC7wE2BhwIvBSUEtQStCLoUzBQ8AwCL3LFFAAAAAQAAAPMAqwAFAIwABAACAAEAAgAWAAABAAKRAAMAAXjahZA9TsNAEIWfSUCkoU4RoT2BFWioIyJoUhFEv06MsYScH5sgqHISeiROwAk4Csfg27EdBEJCq9l9M/Pe292RdKhbdRR1e5K2RI0jHZPVeE9HemlwB/zW4K5ivTd4X319NvhAg6j1+VARDTRWroyoiGelmssRntyDXolTDVlnoJFKzeAUMFKtqZxrwbm03ZvHgm5s3HuWox787+iVlqWcQbuxu2JN6CdW+dY7TckKmFd0Mj3g5GE8kiXMJHCqf5Tul/bGmOWOd8Ld4V9/ubQe17w7N6/2TscbvFUym0Orq+eW6Im9QpVyXuw0U614Rw43/D9M5fKHOkwv/gJB7E9sAAAAeNptz1Vsk1EYxvH/20m7zt2Zbzhfv66Gb6zF3Z3BpIOxjY4CwwbBNRAS7iDYDRBcAwFuILgFJ4FrPCTILWzrabjhJCe/5z0Xb56DgY7zp4S9/O/8aLuCgRBCCSMcIyYiMBNJFNHEEEsc8SSQSBLJpJBKGulkkEkW2WIgh1zyyKeAQooopoTOdKEr3ehOD3rSCw0LOlZKsWHHgRMXvelDX/rRnwEMpIxyBlGBGw+DGcJQhjGcEYxkFKMZw1jGMZ4JTGQSk5nCVKYxnRnMZBazmUOlhHCY9WzgWtsvP7CRnWxjH0c5IqFs5S3r2CNhEs4OMbJZTLyXCPZzjF/85DeHOMFdbnOSucxjF1Xcp5o73OMxD3jIIz5SwzOe8JRT1PKd3bzkOS/w8pmvbGE+dSxgIfU0cIBGFtGEj2b8LGYJS/nEMpbTwgpWsZLLHKSV1axhLV/4xhVecZozXOU173gjZomUKImWGImVOImXBEmUJEmWFEnlLOe4yCVucp4L3GITxyWN69yQdMmQTLZLlmRLJ8mRXMmTfCmQQimSYqO/oU6zOtwdamWasiJgua60Km3t6rrFpeYOdU3TlBalrrQqS5U2pV3pUDqVwX1lAS1qr8Virqmr9fuqqyqbvYEn3aOqqJU2T6jb72tsH9yqj6c80KdNXWlVqj6OUlNtfUuT1/Yv2ILBHgzOYHD9BT+QsqkAuAH/hbABjQBLsAhQWLEBAY5ZsUYGK1ghsBBZS7AUUlghsIBZHbAGK1xYALAFIEWwAytEAbAGIEWwAytEWbAUKw==);font-weight: normal;font-style: normal;}@font-face{font-family: 'LiberationSans';src: format('woff') url(data:application/x-font-woff;charset=utf-8;base64,d09GRgABAAAAAFFIABAAAAAAfqwAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAABGRlRNAAABbAAAABsAAAAcWnB5PEdERUYAAAGIAAAAHQAAACAAtgAET1MvMgAAAagAAABcAAAAYPhChuZjbWFwAAACBAAAASwAAAHitAPmBGN2dCAAAAMwAAAATAAAAEwWyhNNZnBnbQAAA3wAAAGxAAACZQ+0L6dnYXNwAAAFMAAAAAwAAAAMAAMAB2dseWYAAAU8AABGwwAAcIB67Wh1aGVhZAAATAAAAAAxAAAANvmFEYRoaGVhAABMNAAAACAAAAAkD2QGw2htdHgAAExUAAABTQAAAiI1jSWMbG9jYQAATaQAAAEAAAABFCEWQAJtYXhwAABOpAAAACAAAAAgAa0Dl25hbWUAAE7EAAABAgAAAe4qs0V6cG9zdAAAT8gAAAE9AAAB/KOTUpdwcmVwAABRCAAAAEAAAABAXsu7eXjaY2BgYGQAguP/NtwH0SctnuhCaX0AWd4HfAB42mNgZGBg4ANiCQYQYGJgBMIOIGYB8xgACiIAuwAAAHjaY2BmMWPaw8DKwMI6i9WYgYFRGkIzX2RIYxLiYGXiZmdhAgGWBQxM6wMYKn4zQIGhY7AzgwKDwm8W1sv/ghiN2e0YNycwMMy/f52BgcWStRGoRIGBEQC3bBCZeNpjYGBgZoBgGQZGBhC4A+QxgvksDAeAtA6DApDFw1DHsIBhMcNShpUM6xi2MNcpcCmIKEgqyCooKagp6CvEK6xRVHrA8IHpN8v//0BdCkDVi8Cq14JVMygIKEgoyKCpZvzN+P///8f/D/0/+P/A/73/d/3f+mfBg6wHqQ+SHiQ8iHkQ+SDwgdL9a/cTFVoEWlhboC4kGjCyMcC1MDIBCSZ0BUCvs7CysXNwcnHz8PLxCwgKCYuIiolLSEpJy8jKySsoKimrqKqpa2hqaevo6ukbGBoZm5iamVtYWlnb2NrZOzg6Obu4url7eHp5+/j6+QcEBgWHhIaFR0RGRcfExsUnJBLhyuQUYNgyZKQ1Z8JEUrEpq08CUxWVNbVV1WBmEwNDaxsh0wHLH1Nk/lYAAAQ5BYEFzQDjAScAlQCYAOoArQC1AO0AugD0AMABCgDhANwA2gDUANgApgCNARUA+AD/AQYA8AD2AQQBCADQAM0BFwDJANIAiXjaXVG7TltBEN0NDwOBxNggOdoUs5mQAu+FNkggri7CyHZjOULajVzkYlzAB1AgUYP2awZoKFOkTYOQCyQ+gU+IlJk1iaI0Ozuzc86ZM0vKkap3ab3nqXMWSOFug2abfiek2kWAB9L1jUZG2sEjLTYzeuW6fb+PwWY05U4aQHnPW8pDRtNOoBbtuX8yP4PhPv/LPAeDlmaanlpnIT2EwHwzbmnwNaNZd/1BX7E6XA0GhhTTVNz1x1TK/5bmXG0ZtjYzmndwISI/mAZoaq2NQNOfOqR6Po5iCXL5bKwNJqasP8lEcGEyXdVULTO+dnCf7Cw62KRKc+ABDrBVnoKH46MJhfQtiTJLQ4SD2CoxQsQkh0JOOXeyPylQPpKEMW+S0s64Ya2BceQ1MKjN0xy+zGZT21uHMH4RR/DdL8aSDj6yoTZGhNiOWApgApGQUVW+ocZzL4sBudT+MxAlYHn67V8nAq07NhEvZW2dY4wVgp7fNt/5ZcXdqlznRaG7d1U1VOmU5kMvZ9/jEU+PheGgseDN531/o0DtDYsbDZoDwZDejd7/0Vp1xFXeCx/ZbzWzsRYAAAAAAAACAAQAAv//AAN42sW9D3wc1XUvPnd2dnf2j1azq12tRqvVaDQajVbj1Xh3tFqPV6t/lmUhZCGEWIQihLGFUQzCdRzXdR0/x3Fc13UIpUDq5kN5lA8ffimldGYlCM+liRweL39aHh/KB+elCU0TSohTAiTNS2Owlt+5d3b1xyFN+l4/n4fYuzN3ZnbuPefcc77nnnOvKZq6QFHoTecJykG5qZ1UkUKUuoSclMCoRcZBqchkNZO6aDJpy+G6ZDrJ16LLQbHqkttF8YxqurUlFzmyPEilLAYFQ6bL2JzSg2IQiQ7pAmoq/RNqbfoBCpR+6jxxJUFRFE2ddpxwDJbfOwrvhXeZjL7kcFIs/KYrTWrKp6QRjotLtIsKwUWas9xIxS8N2S+13HQwZCHGMKjNqRp4JX7taRSMfRvdi2ri33aeKMEbS+S9EkUxE86DVIwS0LVUsR76W4zU8rqumzGtGI7WwdES7aSiQIBgQzydTpsOrcg1CrjeZdd7vFVQX3Q5vOpin8vtUYuszw81yGzSLBGpZlf9+Z4/+emTVET1mvUdJtth1nMW775sstB09+XzPQ/89HPkYm2H6e8wazkrwl42/Zzlg696bpGud9eoiw5SunBp8tyih2fhoJZb9Nb64CDCLVZF/HADR8ogKcO4xPdEyT3wVB15Cn4zVvmdhsrvxPE9i42VOwVc7+irox0uN+vx+vxVXDAcqY3W8fWxhnij0PEr/jP76jHZM3qNBB/dIcJHj0jkI2Fu1GTFGlF6builtyf/ZALpkw9NPvbC9m/+fOKh8dKL439y3V+jzFDpRXTsQTT6ADpROo4/D5SWHiydRMfwB+pBFmIfzDMF57vUNVSB2oNuoMxtmtmnWx7nJfOmdHGbB7Ni24BHNcc1c5O+FHdSTSAqTelifBxfijd6QIzmNDNycWnERSlwbYSzvEgtxgeuA9Yt7XFRPmCtkOzDLN/DWR8BEdtC7rRut1n69rmv7MNcC5jVnHnbsrXTc9nUlxk4W/RW31ajnn/n1FcScINv0YdPF6twyZg7ucXkTh0uv/29r9xILqfw6eIYLpnF6/AX/o09+PYi1Db9QdMfSK5AMGSYKaMIv4KPfAbV5/f6qqqTKf262/bsHFvPAvRFuJDSb1urBaYgayQCQxEZ1kf2wHfCMLcEzTaDsjzb4LTXMMeDz1Ao0pbQtrREYbzWyLVR+y+otEqtCvnLdGa7yF9Gj1QuOzuQEqzV0+SkEUXCbhf5i0gZuAIPoXAjHQ3iqgBC8HCm0/4xJYYoluN4QVFzAdYzkx/P5CS5Sdqam5yZWpgfG9WzcTFc+kVgeoxxscy+nqnugZ3xuJGbLpxcOPAXW/OSjMSG9GCbLishnkPKfLfBhRvk5kQSndO0hMoLXMiNTjvpaK3Qpg0Ozc/0DbSrUR793u/R9byazA+NKYVb/aVHaDoWibdrf/hb4yPDqZQQd/7Vk/RWTR8cpv8umZHrqtAozXE1fOrKsy5VvTlTLwajHn8VRTkp/YN3XW8676PiVI7qpW6hjlLvUMVurEV6J6dARxQLWIPutRVFD+iwosubx/Us1medpH6ptrXAVsGXfbbjEDnbQc6Q+QmscJcabV3XyFlJEMRqcrbYW50EvdttX+rWlnrto2rO6oObZu2b8rN9cFOPfWmWsxbg0nW2rjxmC3Lms9/531iQHQjExEp2B0OLta1sJ0iB1TMLsvFxEJLavcFQsW92wTAMq3MH3FHdmKRsOSmLBAhAI4rWRsKE+1KzzeNs2JYSPZ3tQWXWdyCp2ZaRGqR7UKctUbb81Lrt55Wrno+uex7+ys/rsbim9eevH833zsbjW7VMbnB4aNtARyoW+ybrDYb4qCLXxpp8LOutDqWb5VicC/jYcce5l6/sRe8ZyeRQfnwkP6RqsTgytEz34PbhbQNaMt7wLXiAi0dbpWisyetl2VA4Eu9pioZDHtbx8pmJgp6KhsPhOwrTJ44spbKRaDSayU5OnJhO5YRmLhDgerpTM7OpgTqJr+YEvj/1/ivOE+8dR+aJJQ2eRJFoKjNZeRbVRjP61PSRabg/Hgqgai7fnR+b0Y1m2RsIeGVxqw6mCnTe9AdvOU87z1AT1O3U71LvU8VrsWxNE9VWzMGx1em8VKzBgnW4LDxHifDc4CLa7wbO8gPz99qisJezDsJZzBaFT9iiwH/jhQVbp7GcefeyJfkum+IynCzuY+8GJXUnKe8i5QIui1C/TkHdaZh3GeaCQX2RFaV9d99518KaTrq6huikvX4QsN2GeTBYvHZ6FqTLjIUsZRuYbms6B1bcgEPrcGcw9AwVU7fcMLt7g8xlsTDZh9Gy/KyqH3yGr0TLJyCBXdnIqmAp9l3rBRWLL7mrfLkGy14PvSp4WGqn+ejmZI8xJoaBi3xranB0bng0l03GY6Ks5wbGB4YS+kReTERfbu6QRzVVS4TbhTpjRNMFI55So5wh66mufNfxmelcLx8vcdxWLdE3kDHqd+nDmUIi+Xq1N86JsjcxwoUUuX9nWwKdGOvPbdHVhDS4Y+jslqFmLRpDYa5dzGVGRjM5VRcTwuHs0Myusbmbhw7NTxxSuBDj8PxtFHldEW8DH/G2grCy3kYhmxscnVbVhFHD8bG6fSNztyW25OkDmQ4x7wqGmFBPTGjNKLK6CcsbohYcJ9AxgsmaqY34i1mHvywnwDwbZy0gLkbQlf383lKB/oLzRUoAdFVkGUB0vIYxEYikFXRdwtCIWsdLscwRrjziRcxcpRUUjywZmXHEj+UMWYxwXLhZNnpHSm+OZ7IjoSAdeujAkd/ef3D+0MGD+39736cXShcXTs8fPHD0rkPz+y8d+y27LTS0ZbDSlmrcFspuC3vRqltri92SLq4sI2LFxoXBdEHb6JHetSbkxhA/njEkOcQBxh3JZsZLhYXfPXBw/jSo2LtO3nn47oMHD80f3H/4dw489PnfOnZp//whuy0u+rQjBnQNUEGq6CCoulqzOLsF2ahDd2Sj7qhbcStZ1+A7oW+G/mXwvfPP/tGD57/EhF6YR6HS2/Mv5F89cuXK0VfI7xWoR5kpxqR81I0UdMt06xZyYnAO8B2DHcoLkBRR+BA5MO7xa6b3okmnlzy2KmDSgGHxZQ8Gr14CnryUR7Wq7DZlxCCg94gYlIIFdO/30X2l/d+njX9Cf1z66D+VPor+GNpwtvQ8MlGKClPduA1LXiflxpIS0UzPRZNKW34gMnzMQBqA7RJL4BXgeKsW8LqfBSUQNtYxICPB+yoj+SxQvC7s8Z5AIuuqDnF8uPS80hzLqEpSRql3tJF8e1ZINhBajKPP01P0PURmoR2YEPiDRdaiQN05XFiCKzKbESPjNIs+/6//ip89C8WT0AcHpa15PhHQreuOieyD/ILbQz72D2Hf5iwSUar0Etwb/uCbtAyy5qBGqCKNZQ3p5efwmCm/n3gF//gzh61uac50LDst5L8MjFymLcoBKtNCDltNwiui8BthJL1d+l7C+fP3vNh3mfjgLUZwfg5kupvaThXrsAVoAwuAoYXVhTudJ21tArI3cVYHUJqDJvfAd0cTUJwFJdvVBraca6I6rrblG5RpRWnKZWvcQ5RuxRi7m8lNE5KS772l8LH5m27uzyuyLA/0zszevm/q5v5eWUJ1Pn+Ub03s38nzfq/XH421JDpzE7Ux1kdfeO3kveMTkig23zB+79lXv3729M2TioJa5MLk2U+/8sjEfKfB8yhl5G6beOTx6+e68mAzU9n8rXcBrU+A/2bAWPJSh22eEdFnsTcGPHMylKsKqI1p4cM6y3K7LhXdxFFz41HhcONDB5Z1v82SZusbW4gv5uxgTEeH03RyFlN12XRwlqvqsoOCOlRknK5VT0eH0eHMyCII7Ak0U3oK7UFe1P+yY/mVf3zj/fGXoU3D0EYR+JSiniy3UQMuxTGXgrhlac2sumi1QMtaqnBzWlLQsqoWfFiFW6bbLWtPvfQ9W1icnOlZtpKBy2b7Mpwsup0e8BmS3KKabAeTDKdrJrkIdfBFPe10e9rVZNkYbzgjEmZpFPEOzGDQCkcM7LBnyoOxwmsJ+Cx3bUB7biIg1QgLgBgZTm3L35Dd1TvU2yxvTs5MzwZKb7CiYOQmC0cOFaYOCwJS1Gxm8g+NoVyM/uzz8wXA+OOZ/lyX0TejJXfv4sbGRjNZQYjF9g6PzO4dm8oZgweTQ7meN/H41D64xCSAjjdS01SxA5NPAl6PacTri4AqwcQsEGIOgcgLTReDVhdQVejCpBQiQMqb8JRExAPAgkKANWqDVr4HvqVQsVXpMoz1bg9GAmW4qqIMwQXr6WAPgXUDhRiIyJrB2IAuNCS4OC4W1WRjbmu2Pi4nZhO7Z5JKJqaEwlpqZupOtvRD/8S23M2je09MTm3NNsS40MjW7Ph0T7+i1IaREN/We8uuI6d3T/flhTg6zicSSiwaCuipOwabYVj6X/d4Q7wo5ae11O5CeO9n9GQsGhf01NDAdYNapiDEOcYbF9RELtN3684RIxOPS2Iud8120CMCyOc8GUP1oDOLHuy90Hj4UD4PXYXnYSwKKOxKIzNG1Lk/bbFAYEe6yBJbwbpAYD0ssSAgsCZKWw1l1+Le7/wcyyxjIhhK9LLlq74cMOuWF3lfHUDIelwWoVwHIXmDWkR1fD2R0yXaVz604SLrsS2FRfvIAdbhCKxTBOxFEMZgprMrk+3MYpmkBXoSGc89V/pZaQ49RDMMywZ88TokvOK498r+l0vfQ8LL6O+S3lZvNhzhqoWApoCM9YJOxfokS52kipvxWAXhKvJY2Bqcl5bE8GYeFIoIdWER9zdchw3qFs30X7TaQLkadr97/+n9y0SL1HWYDR3QY86Kc5edZgNn8RzWIvEOtFjHN8TLPbPaAAdb9TGMe8MV8dwgjGteM0ifWAPW2HH1MFzT072I91YFYmFVMvZ9ojogxNuULUM3C6Ufpx07V6xoYiBfmCtMHARBahIHB2d3nzgwM7HNkFvQrmgiGq8P1wROHzPUpCgAtOmSHfzLpYekhpgkHp0cv3uhMN0/CJ53A5/VhrdjOzQKNMPjsp0apO6kigqmWhoohKGNxQHVoj2KA6gWxeNzOzFJm4BUNSBCmzirC8yRAKdD8N21CbxMf9SB/QAhiCc5rJ40VFGbBFwVDZo1hsmFLJ+fUIejKuMv6rTtUORXGK+WMKnKptesVtkHHUWBK7PdQ51GixIu/SKqJnMHj2tjE7tnR8f0bCwuCEZm19ShKydPIaUhHlMS2q2dGb8/Fm9ROuUWlY+H6EfQEXQsGFIS3QM3yCOiiL735mhrolHYmh8vzM1/ZKrXaJfRU+a3ju9OKGC5tg0dymqpuMiF/AE+3goyNwXjjweZC1HzVNFXGX1WCJOrRjN9Fy0vaDGvj8AyAHBFHwFrPmwbwuVx1vedT9rjzAHSxgCSCAVhoAWXAWAyQTySikww1LGKJjDycRDqRETb5tdMOS4sjlwDhrv0bUXeMTDzJebzb3639NqRR08//MdfeOL+e86d/UMUJ37owAf/wujA7x5qhvoEdS9VNDA+2uGkEoCV8FBZOkSOl26/0YDRsnQ7OUPmMcL6XmB7L2fegrUzeAFmULNuIVXWGEhACg4X8CURROK/QEVvkCAVa+EWGBU38iAFY0Er0YYHyo078EBJQdXtwUW2zZPY6BtmynNWylWgxn2Vrq7ISQvR9fLqhMOqvl8/YbE2nWG/ZKMwuQZq+URbZ1bPJ1OCCIMHxCd7y8TvHC9MdRvxGOJCA1qqe0DPKIlIuEHo6Z3dVVrZNds3sAU1+dgGXlX6h4YaeC/LsjH+xoG8kuBjbp/AuiJ8IzgcrVI45HIhD1vLC1LWEMA9YVl0djJjdKh1MZbxC6KSyGjdhW1DWhKMaEzXhgduzG3OTMTjfsYbi7epYFJ2DY/CswJqBMP8hwdTmxPNeJiLkpBUcilJbhLkUKhJbE3SO/jNckwMhEIhEHy5OSlKfNwfCARivCTicT8M414BOegCi/wxqliDx31TBX+OwbjXemvYKoJ2iF0G5meBvVmOjHWAoibHYaVptmnYMFtZjEBihjkUXKxpaGKBm4BKAKhasQbgcS+erTTHQkWOGrIt9dVglaMq5laR1/Eo47L5fRWGvWpGyV3m4HCT1DNw88zB41OzfTlJLP34/YmJoWxWViKIBe0wlE2m4kIoFG0UCkk9OTs8mexsaEANVaASmmQ9ISUykVDAH+PVREqTE2HBW+X40oHCdHdeEBJqYewzJ86XzpQ+E+YSbf2D18ujzXJ9PGPcUPhYoiGWZL1IVDL5m6bns1pSBjceVXMpTd2i57OyHI2iUDiuyptJ3OIFAERvMF4SL9HXvJVa7M1pS05ydFWwxpXG6JdEZcrRGPi8QKIxTYgvvUm/i+pLP4Dffh58uTfht8NUHegmggewP1dLQh3EyIfByEc0PGFJXsNjVGBRkTRx88xoGrvU2NOrW+/p1X+op5dd7+k5oEXPi2E+xHm96ARqYl2BUJAPL0EjweNraxNT4PHx36x4fEyStNj2gY+BD/wi5aL2Ush0axZrK8bab/z3tA2aEYfxBxMCKL98/lJXpZriTBdUO1iLqQGN6VymnqEQ7bARPsEgV51XNGgQRTwoUmDoKxccvTSDBtDpfy79dem51wl/CkiC9iQIf+ornih2QokvAtTwrHqgCD7wM++XGBpJr71GK9/9LvUf6hMVvgx9WNcn8FUQzcKlgMXAtd+4T9mMB2VQsODou7LM0MdeR4No+z+XjpS+RJE+zYKdWoDxnoYR/+dUUUf2DDaODZIh3467ltVM/aIZT2PkbTakzS7OUoDxAZC8LXbzFf3FebudzZzZsmzVRS6bNcuLkboaQIS1uCxCuQ4RRsB7qYnU1jW3VLyX9WcEF3bpgBJibLuB7UJ7J/i0AaohbduDVY/Fjk641jwWAFI2jAdNkOlcVeLuGhDDWT84sP23zhw/+uy23h2iEG9JxcYSMVCVTOl/u3qSiWyuRTUO7kslE5JQG3bnkOi4dPPOse6tzWJXVj83M1JIJhoTNVmhXpCl1OTRZEJRG+TprVN7uUCcV2X9ioQjoEDXQ6Xn3AXnU9QfUV9EVZR5WsPTtwEYNMc1s0EzU/rSdfb5H6fNv9SW+u2TW7UlPzlC5rNkauFOe6TdyWEQunS/fXY/Z30SEb9nKUxqrP9Wnnr4yE8etLnwZ5w5tGwN1142dyybrUDM45/s+DplffJ4x9fxjfULLzxj33icM48tm5/kzE8tn8+/9s6f4OAVPL24/c+GgGdQrvGMemb70I7hY5/6s1WB23hOmHbT/cHQFxv8qf7R6259nGj7v7wuGHo6TCntg1fZ8g+Bdau6HiB/Z1ayw0trlWtM17M6gTrhVYugXGW18V+0YhbKMDFbnjtebzoq5mPV+nf12vGs8q+t/tghUchlp2dunz996rN/++C5md1JTZG25W4tzMkJoYEPBBDNuPjGeEa7MzczAA4cBwa4uS9/2+yhvZ9udCkPHcIKMClmu7NqMhZDbcrEyLGDf3pq/+HJ3T3D7UmeR6GQ2NypD/fumTpQuG5qYGSbuKtn2Bi796NTB499bGG6MJTXtUgt3ZtK7dFSSiohi7Wsw0UzdFwQm9SkcVOrKPBhzseiF0+cOXZw38yu7l5JyuX2zJ84/Ydnjh+aGs+kvCwfFoUkU+sOhFOK3ColJCljDA73H963vzCZycyOnyu5BkcGG/WEIm8bnp45ePTuhfGRVFIQs70jk9MzC3cdmJwsDO7Ymk0qMR75AzW1sYD2u0pMSnIBFI9loAO3FebunDvUOxANpRJDvQU+oAZ4fzQ10ihWcQkpnkkY6mCK6B+dopz3AU52Uw2ARInNA3TrxtE0DJhNpC+5WAp7rB7dcpEZUGTGNavRlvjuph8FiU9GdZiuDlD8lrsOFCfoyrrLqxcDZoRz4mssf/n889/6UQt5gukw6Q6T4SxH/WU8V2dV1V92LjqrGNBYHlyef370X86TYK6XnHY//S9/TYYHyy3WsRG4LUbKBlwWoVyn3gDx1BlFeG7d8HnaWxWpizWUB08fV1bXOBC/7sKGoDsCpxhb1xo8dYNEUEeio0Z02CFYpTVDUG8AVSOdptEMTZW+c2zlzWNfRg+edflcrN/vcLlolqH9zjoSqpovnaOH0IOcHOTbVFfIwdS4Gn1s0j9kx6LOAC/2AS/qqU1Uhlooz2vFAP0hbAoygP6SmygE6C+JrUIXQX8xMAnJtBnjLAl0UgjOQpzpxWgfw/6Uhv0cKwuXpBR0JAAKYVMMDoBGySCcmpmQ6bUzSdbrgvU6QRbTZW1emcHPiNh1bpXEM/Spw3fM9Q9I0sDg6Semp9XEztFdexdKe9GJzBZdkhNRvllTja7SGTRxfP/hIyXTeSIabVMHh246On5DQ3iq8Ef7Rkd0PRz9ttcb5cfyGUWt4d1e9O3C1K4xbK8nP3jLeS/Yxz6MyIzKbKwb06MOE6G/MhtrDeBpqLq2YGipmuI2p8q6LrQ+Dko82vVKKnK16+F0bXT6JwuFmWOnzFMLs5OjKT1WuuIX+JRmDA7Oj4+lkvU8H9ukj40vFIyBNlWIhREdy2o7R+9Y+L1nfv/M5FRCpb/6OPLO7NZSKM4b+vBwYYeiKc1SMCxJvblbp35rYWZ390CLHI01yyk1s2twYihniBLKGrNznz6NxyeWiQMgE0GqmdpMFYPIdmJtb7YZU0AiFLAZT/CgB4jRUgGk9lzG6tSZvBYzxkKsojOo9Mg9p7+eyaKuzMyuI0fvL/34vanR4d8GjSYdnizsftl5IqGYx08Vnzp96iMzyeTrQvxkYebwscLMvngc+IPb54L2+fC8PFWZ2yHyyoC8OlkirwSg+UlDoXUkNkJCJx6fB5cOTzlOUg6O2IER+3OGmbzyCv3uCucoOE+8XvrTN0r3vG6/lzkH7/WAZNhaa/WdrJO8k8Xv9H7IO9fe5rvqbWeY6pU6+uUVDb/p2jdWrtiYEcvgeZDBAepuyo4Jt1Y8MpDBpc2pHPbINuP3bSPva4T3NdrBAd11qdih4/d2bIY3DuI4QSO4X8EcuF960ORgQG5uhQGpG2YqaDVSUF0Xsrjgem9sTX5tzQPiG6B/SXYzMC6DV0VgJ9XE7OzJ0188Nb/7hvFURii9E92clrYbowsTY/tSPN+VGRvfbwxoeUOS46Uv0Huz+WG4suvQcyC/BTUB8nvqxC4sv3w0o/cNXT+hD0h8bUgST5ogvNNDYGe9bE2oJsx/5dsr72WVpAjAjYjvCUI7LB95Ih+9Np9Mt05YZTr1JYeXcMqxJh0+oBydNn0cweWM7V2tCsXq3xmk0AdQQ+mfV+51nlh5iU69d5yeWXnMfh8ySXxVXCcXvzrCBL+EVTNpq/DBWw6cpydQW6kij/kMMlSsxnwO4CY2kRnJIHDUH8Qc9QeAozjIaQXYDdOLq0HvIGbJ6pQZ4YiAZDYcSktia0FLIvAQexvjvfmbC4f2PtmdV1rQcdUAN7fKnzP20//85pX8wo0TfXlRREktNbqdWqXpEqHpH1BFFreTAoNddOKGIkbXCTER6a3pTWPPhQGo6nRRddhpBNOA0wrhGBMWG/Hk3r9/3Z7oYnDEjMRCwPf5n75vfrCat+BZBuvPmm58hSo6XB5sQy38VfZz7FREDxhJN2HPUTS18jh9tvRYyfUU8OgEfXzlSRjIp0+tlMp9YB6DPjjB1tl6w1HWG8h0VXhVdJAR63ACnd1rQhDBv/8z54n3d79eoYdLhN/K0S32TGmRqmldRTBBoEc3AfM5Oyktx+EZvqUaO/Esb9PgK6+/RTprKh0BU1+22PBlPLd+vvsHb02Q+mAHQAHWZMH/i0fgWuvy+a/83Y+vIYCE5hYdNAtQxElKNy7P5zvLVwGueNkg1PtI6SdlgJQcLs1WbrGxNQ6nAimbSCmSspmULaSUcVlpqM/UucU2XYH6BCnbSamSchMpk6TsIKVGys2kTJEyjcsiNHsdanIaptsowhV8shmnxpka4ATD7DDMTYapGjjDrd0w2wBascF1D/oM029gNMEZRWgmrmoxzGbDFA1TMMwmw2w0qL64w+lmvT5/gIs3is0tcpuqpXWhKdG+KdmxOdXx7/2H+kR69emg/Xir8h/4gXUeOchQDehNAXX10mSWFmsU4vB0dmUJmgNX1iFhlNdBg5nUELi4GBCBXJ+9Qtdwrpgr4ve7gM2/QGdK7wH+pxXGywQZf3Xp70u0m/GzXidUJPAV2nniylvsYC52R3RMVcM1rgYH/95xR4EbCik93BD3YECoyQfak1fedoTYaCARF7iQUP1gPFevdUnGlSfW6dBaPJddhXUoVZZtL8h2lMh2rS3NXE06jXNdPSDgfruqzhbwr939T/1EkKtAwAPLlqOBCLiDshwBoO8i7agKrKWaAo2QDXHxgEMAIMoEGKcPsA7oFnKVHl/5PMO4cAffP28IyU1iv0N/7ziTj+W92WA8e+UCxi/Ydr4OtrOR6qEGqWIUj3SlYj2zWKv2ktEu4OAiZ2nleHoffGsCKNWogmcfsiCRFkd9mE0sRwmlq2Yif5VbOqklZ2Y/dfJJ88Q9EzOgU1PPnjr9WPHTpwsziSRKxOKbM6M79y7snNDAOKL6eKpz5/juuet3dmbqYvRXHzt9chbbws7s1O4Tpx997PSZv8lkiLG759yBKYLkZKV/aGrmzoM3znb3i5LU3DcwtauC4zjgYY1tXdYQiwAIIhQmdjBUNjJADhzHCafNGs6KASW8q8k0azC9nNMniTwCfN5DY4cZ8PiRM7fN9Q7GRZTvG/zIrt8rPYqM4YS+telTny695DwhSkZ+bGp26i97B1uUEke/woW3Tuv770bEF5wsLRBe6dQEnqMkLLrWSaaSBdy0G0jTOqFpnZy1rcypSfje1hkMFduSURxP4oJFQWohc0YCgHGsB64NLnGUlOzeOP2w3t0ADq6LEGdtBEMG3y/xdM0P+RUsbZaGBv770WhdTJJb2jqUiFxLJ4b1sZn777gmdv8PRsaaZeCz0LHK59Sv4fL9Bw7OTh/l86JUGwV3jmH+1utljb0PFAKHZ+eOfPK+A1NzZcYPPvvhfH8Y+B6lWqnfpYphYq1rdBsDYRy5FOHDmPkRTGGFUDgKFK5Lm1EOMx0z3wxjow0GS4Dx3GaP529or91CxnOYMyNgs2s4M7RMmSGwyqFIxXlt5YMf6t7hP+zOEtlZi8mA/Fw4M7Ovu1cSorFWNTtgoGOlpdKzpcfRiYGUJsS5QP/gsdIp54m4qGfHhuYLuSFNFxX/iklHVy7RVzguFkvIqX1APZDwHIx9F8jTDPX3FMnZJb5BK+64jnt7i2YKF60c9A9MMmAR6zqQp1m7ez/51oXPVeYOoGNWH3/Z3L6MM/LDkRDYzD5ucaBvO9ixbaQcxGURatYZpW2GOWgU4Xbs/H8xFI70DWzfNriWO3l1DZk/ywl2xkZVcNHTqhVAZM3rQmD/KEv3gGtJIaFD25jKjaVSsd0pDa1OaZGk7h60IZa6zuskThkpalcDaOW5NvxDORT3R8Nqonvg+nNj46hJuHN7cs/vZLszWkqUg2FVGxz72rF7bt21vbddCZW+H94+8MmdnUlZ8Afq+NncXGv0xuhQ1tCzkhyJIkm8duSNh++5c+4xdTPar6mqLMQDXDK5O6vIqaA3HA9Ew/G4qukD2/ddO96eao+EO5QdA9PKTEeyyhsLi3JDZ7OYrObdrqCLi4QFMaHmesdnbhgzsvm66L7BUeB1FPDci2QeCbSba1W74RwHR5oETVwXLSdAOqcLQzonDrm6nGRxBw65rs3cY2McZZ4pZUvfYh5+/fX3dzMPY4x3FGRpBH5fwnlkDViWfGW8aIbACLZUICNGu0EQpTCIkmz/KPzgqgIhvm9wHSa3uXUUKbXhTXJ+oHfkcKGOR4qmTo0fPnLq6OGD146rSZpzHLjyeGEwpyVqwolCf++tjvErD5/dv3dkUJKAOwOD8zhvKgBjfZjo+CfsyJ295IaD9oVJ+xC0D3E4K5HkakZsUX/+8qX/aYs6oGuKs2geLLObs2r4y+e/ct/bgQrEZGg3gZhkxQoui1CzEb25DGqJZtzlGAR6Go5rKgEJIt44q9KE4QA6CA48WI6xdSeSSAQ2i9VCAHWiZm/QFXD6vRFvwFXF4jy8lfdKrwKYOSzkeTWUVAuKxm/iHWew84RA01Hus9D3DA1WPoP7LrV0YgyOSVDkgs069ku6NFO8aDXbM1IEdrveZcvzhwHTZXc/Bt13cVYmdvl8z5/99GVymQP07WLB9whY7TVwvXP5/IVHfvIX5FoLPNq2bNV6oD64fD7/b++UbHLWc2YzZzXFob6es6T45fMX9v30T9fI6SLkhPJ8z4Gf/Bupd3GLbhcH9V5S+kjpJ2U1Ls9f+P9+8llyZ5BbDAVr8XogUkZweb5n/09+TK7Wc4sN9U146Q8uK231mW3cotzWAvUKLs/33P2TN0l9J7eY7GzHcJ2UGilTpNRxCax2bWB1EZq5rsJbweDVRhEesNe1YPDegfF7EVq67uYwDv8UoQX4RDaK0NJ1VzFSr6fxxCiA7WpQkrX1DY1NstLWnuzQUvq/i9Gp1ee4YOVJqWX12c7Mb4rRawCiCzhLvJcGmbTPGpGAbOhQg2diibYFtE6TIKdIg0BFXbXROM0yfj/toZ9CI0U4rKJddJ2rxlvNhp9AaumB0qNf5pga1u+qYlg/Aw7bl0qPglS/uyt+4K77AgLXlwvwfvrtlZAYzvd5E9574jfpPULBwQFo1wbDu+Ux0eBTekAM8Fdetv3xEIz7QeKP/48ysmM9vor/WXQ4XXrZJ6dtFUXh2VmfraucoAtccOjBdaw92UGSTw5+58XVYCpaNn2c6V0+/42XvkPCfBaFWJzeipZxYNJkls9nXn/tCLniYFjsvzPLZDy5l89//a3X/ge54vOypgf/DPbn3cvUImLcXsK41aOKh+Qhnjz5P4R+WOpHW5ABf12lSfRq6Rulh0sP02/QD5UC6KcrcysxOrXyEqaDBHTIAB1Y6hBVdFdsAGgAhhDAQxLDwQbgNWG4j1/f8o8/LA9+Bhxrp4UEHAlYPt/1NfsCYzo7nNAVHHm11aIDHJYi7WRJHhuZwF+/Po5MP4B2l1AGTaACypS8pX9wnlh5kp68cmHlS/SAza882KovkLnD8mpMyw22hEyf0PakIZ4ZxC1M7/lff0BaSIOOQcuWK4BVM3aakIvQDYRvndOUQSKOPYuRPP3eyoTj5ysuh/Sy4+tvvnhFfxPec7BUoO9zvgg2Es+FUTiX1s7vQQwcM2TNSTm/AM/Q4EWadBoTrHLmSFcMZXnK8iDdWHoLhUsF9+Evv+e5UM6TVip50tS/lyd9ofVf31mVMJIn7bnMAPVpi746T7pGR1L4bST/zPkizpLGNOShL1nSl2uB17gvlN0XhrHXNFT64r4IzcYLScmaU24JuYDb0CoNn5T75a6E7qMimTEDXFpb+hHduPL9S85/+/IvzsD7kjTNHAeeuXA2XDkytT5+v/XxH9xGOIWAU9Sy5Wwi8fsX7vjBdlztJBx0kEksyylexvlc1BK1Gq7/VQkJIE+SByXRaTSAzrxROl96jqYdx6+cwBPSmA4fvPWBizn1wSTQO06ZDg1TIcCo5S+SIW/PNbqBYWHmT96/48kxQr8B5hG61/ka3NdGmU4NL4etYipzXzij3sPYc14gkgSREnRUE5EGEP3+nzuLaul7jdi/AIzNHGfGgAu3UvdQxUE8O9BNgtvAjMXUdYOsupQlC5fMznRRooE5IcKcJc/UoFQFX+VVTbsIQhkFVTTK4dC26UlbCRirt4GCGi0nEd0ULNZLg9jLS4Ss7n7s401dFwwtUon+PryyLQQQuVgfa9uYSpRdy7Isux5rCc+NdGQNnGUj4Ac2VyPbmZfWIs9yeN0st9uOSuckOZO7bufUj/zemmiDJDbH+Npwld9d+o5fjOeyk6Mfn/uzuw0H7fdy4Xqh0R/x0ooakBdSOuvKPH10tHegNRnhkTxiZDqU5lg4hP4o05iMCTJK7RoYaknUhJgtyUwyHGO9yO0KheJiwj/Ym9ms1kVTe+6fKX1cC0cboqzXdY5mafALM5k9uw/WRluT3ds/MjYSDaliJqVvAXfRFQwN2Lkep4FX98KY6QRu3V22FCJO+Oi2l5s5YegUQ5hFg+XsvlHNZC5aGYDNrvbN6XSaON8ZshTRqgfm7ITvvkwwZIVEzIxuzKckuD3BxepEewA7L6EQAANQTV027o2EXfh/fc0zcW9cW6hI5A53OIAiNWvLtypLtfDfaZqhEQ/jMfPkkYXtY5qOlw7o+tj4vsQWRZdVpRauMTTtD0eNpKLt25rLZvdrSqJJiIaF7epHmVdLu/LeNtYrswdmE8nh0bl9h468PDrSrnpZPqQqukvwymIDoE6a5hcGh6+v4aamn392apoLtSvXbrP1zzjQMgty30FN2HO+S/U2EVlMv3CZfhoRapw4VceRkHUwTWaauLS1GUjXWFdesRGux74dF2wUPnTJBo674N5HOCKGVwcJxyVxW/6OXUfnCpNbs4rEld7w7y4cyOivjRrZKlTvlRSjd3Lmo8d37+obaBTp6Km75saGFTke17Rt+esDk7tnp4ulM3rq9qqx/hEtI4ioLQFUWSjPnzEzIDObqR1YZuJYZtpxd3W7u7VYZty4zwNlnTtM+kyCv+BDQC+bt4LgREFaroGTmlQw9HTA3dquD2DxiAbNOPZt40CIZsMcCC5R1YFWeY0KWFBsGuiZztY8XXamRDshpDUjEdmxRylXGaSrEzR4Zm6S59OZc/vzEylFVsI0Fh2GLr3LYCmimdTU5LG9D6S0WC2SX0uoJO8nDC6nnFSyE0Z1gI4fmd83PDoRqQu3qWrcJbB6Fzr7vrC7vVeMB0RO8oqueS1ZuGZ43y0nS/eGQpsSI0PfGRxKJANcYnbbAKYhlpUkyEoSfNObqGLr1dKi22uEO0KteI1wR1kh5lbjqh3pYogEIkJBcFW7sVIOgcBY8UbQhB1Bk/oQkYkjcVWv/bLEIHHddMB4Qt0+MrVrz7HZm7ca8djKCE6FTqj50ela5InWy525kYmPHZrd1TfYJKEEeszblZ1JSnKcDwdo6eG9C72D9fGkOj52cN9Zz5CRS6h1fH4wmlOyCY2Po2ZpaGR+P6JO9Q5Uc0Is22aPH8Bq9FMgVy3U7VRRwlLlw4a71l7TH8STyEucfVKVLiIgk9moY7NmL/lHpqyZEl7vhr05M54uNkuYQs1NHnB4wdA04zMJu/atZddez2xY1BxpXkvviSN7sYH0MMeJcr735lTSvzXgirGBmJrkAm7Xq6+Wfug49tyB3BZDaotEwfuln3HRNMcFYrxQeO7KSccxMn85xkwz49QwtZs6SxVrodGLgVo2oC7dQvSB2aItbbZ7MKAt7SzriD2Ez9dAL67hcDSoWLXlRqxq4zBi5mDEXIOV6ibDzAcX/UmWjJp4yKyFUTOwGYRgUxKEYGewGN+yFRvGW0JPU1UN/p48vq8Wx3evkg29HGnoxW52xAXmb4NkKHIjqgyjPA33rh9g69Kk1iZBsTGEMdaZGZ346L6pyZQTRx0Y5KVpeqh3cHb34b2FyS1bmyU/4rnd43pCEcQAR9Opqekje89pehQGXjZ7QEnKMh56PMiSksxOxIUGWjk2t3t0REloyY+6RG+4mY2z9YEhTr3zyvcPmUa+IY5qo3JbZ7anaeCaQKBZyuZGjYy3hd3XoU0Mj+6aOflXN09zgaQy3Luwr29UUkJcIqkdt+XvXsDgcyB/Sermcly4Xic4mBhAqwXj8A7CmSTwga5Kp82kPRmO7R4OEyQpks9ixoJkQqMFTq2qALAgFLS8bqO8O0rZ4GGbV+FAI4rggM9GTBIJ3ot4TLjcZOHw7PDAJlUu/RDsUVSWsloygWnmfLG0r9+veLyyi40yx7uyGGecm1qZoGeNramEXBtG0bCazOb7Vp4j9h76iL5AsLgb524Qe49tPM5SIEPql5OJHRuTicGbuBenEUPTjPe/ypReAj+L/uC7pQJ6An63nmrEWTG1FKEe9l2KDUw5Y8hPfl7AKx3MWBqniuL80SYbi9bmUEWM1ubCCAIgM3Ccry4R5QN+F4NiXKBVyhijiqEKJop9i2HZmoAU3sp8/P3hfHcqmQhHGYfD9fBLL5V5egja5aNOr49LE646abL5TCXOvyE0jV0cEpeuRPsxoN9808XAhwSlv/7n/5j6PwtKAyHRSZQsnUSfL71Y+u4R54tXnkJfKk2vLKBLN5T22e0v82s1d4D593IH4BfBIdKJPJ+mKNfDoHvGqU9RxR247y0ZPPtFdBDYVNWM6VavE+dqIfN6zdxB1tMVnW4v3gtlyF6yk7HRnQyHLfCmCfgewusxkA/EuitoVuN0LasmBGdyEAA5ZfXibSN8oRovVjcUEHCUQG8RC3ltJFxblnpQO1dlfEbXhkA5xXJdBQHYeJCAySf/n0Z+J+gTgHyj4/uOPFTnikmCCnohNzlgqDCuUekSy0Y4SSxs56Ocn1k9bZZ5vqH0JuBBQ/Yq3rDqbXMd22IcPTigJYS4H0P1zNjgbjyGhjRdEeuiSUU2tJGVp1Yronybun/HynOO4R3+tNevsEKZ3swc0FunZikCiMy69dTGq8mQ2amZ7RexF1Ohc4KzeCAqXpyege9Ee4W4PCYuZYm4wuc1bFpqH0rLchilTC4CDDHM+VBy5SanDxJlUhMi2iR8na4llf5q7iqSHO8ysDIZ3XkzpkQOtImUjIZm9fzAxn7bWOZ+wDKN4EUM2fHUpdZ1WCZVtmqZ9VHVJPS1GvqMZSwplDFvCmcdUb+82Yj7l9cnk+nh9OriHAxcxkVx+/Duuc9+bm7vSUFAzeLw4Pzc2RMf3T00DChFCYV6kqrRe6uEl8H0DXz8eF8/LRzbPTc6lkgk1Afm9x45vLB7fERNoDZldHz3wpFdw4Oz4TBKaImR3o8+f8PU1HTZZyoVmHuZCSpDXUcds2f+l3rs/pa5XQX2/Rrbvqc0hPcmSpFlg88gxi2rHV0tUZI3v+RwKolNcGK2cdb2coTgevje3gZOa1WDHbLsaQABaFFBAK4JFj2sjE06FTIZWxCwFABWKQ+p2jVarXlP5B5ymy0gaB0KXLfUFbtRKMjAf5nC9KH5B1LJGI/qYik8vtTOpCYn1LALIZoGQQHEHOZjQntCBbPcUM0Z2f3JsWZwphijPs6xsi+1kNQKI4N37T1y9KP7t4+2ET8qoWos68H5pbI3W9rFvDWv5kuehcGxZiUSSmgdO0Znn5mZaupQrtlmx34LBDttorbjdUcEI2s2nYOEzkF3gFAe0xlvOTFUMc7YLuNB5c2myRoVawec8EnQS65WrQfrpbqgFWzG1NWwyDUaZk9wkRKbic6CiipbBnFoBg8ujI/W0JG9/PQqHMStoaCNkWCe33ft+KsAgmgnw6AADMHSJdrh0KdmD1ecjO8mVAU7GW2CoIKPkVBjQoB4GXvPAckI0pHFOME58++H0fNZcDACvH9/u7bqY3Adyujgb+0/rSY4LhxVM/nyvCJO2CwBDduo66liE4n/YCzDRXQd5DQEWqkea6WEZjaRoVnWSlY7Xq3ZVFZFlFUPh0Wft9Yoq6GWq9VQeX0F0CpS7nxZ+WzQPbXteO1bPhUNyCE5Pr81Z+uchFf1RjW/7No60xwPh5CL9lxiaaYw9djK247cSCBdp7Ki3R+8Fk2A/txMXaCKE1giWBs9Z7UlpextTuMY7rrMKg6p5c2/8O5e2JC/+/aF8kw2jyPVVr+fRHJ5bjHKR2pUs59b3NaPo7dQrltiDxdJ0nYkyvdv215ZpLL+bEO8lgsWWWUzJtlIyNRwyghLwrXa5hHbmc2uS8uz9Vgli5vsVHO1x++2N0ohxF23imHdXlwV/Tj8b/5I1EjG+7VNShNfyyE+dv3WXbFdymAKu/KNgpG/YXrfxMRQf75NDbznCoXTcjQzl9LDUUnOpHpTe0Yz2SFRNrK3TR3aPTWZ721vQwFZi8UbXIzL5ffGo0qiLhb3h91RX1RSMrnxsXxuUzIcDQYUOZMbiSX4GNxaF8spkWhVwMcGvQ3w0799y3huoA0vEQCnSsro5XnbD96m73NmATvuA+SIeVpVnoOm7ZzMsovnTm/Y3SSmmfxaHi1f2dcEHMUiT5ar89jVa8DZxzwIMl2LBbmqlgQbifOX1SPYxwuv7hlERnMmyP/xlPnii3GhNwTevNarjx49DY5eqfTcyosTkszQ7FOclz19hj4ObT+O50IYA2zBLRSZOCtqq4Fg3PqwXkmKLweCa8Cba1Ha8RirLWfB1ziCWD7wLgWiihvpE/Ei8VYQHBS02lUy1tYixtF1ONlW7Ph/EQZaN1qb/iA44Djisb/Qsuov2BMdP2Np2pmdKuMAGZ2ln1p5dJ2/oHXmB+htV/7bsF/z+ROsN0bTI2FODIKXccQwmrCLgfnGAt7ZB32vpd6w+WZGbLxjobBeyQKrBJhryuatnPr1/Jd/dLcdZ+HM2uXyCre1Wi8JuzL+y+e7vZe+aQ/VIGeGOSuEQy5BzorgSPTC258hoUqGW3QxXpzmSEqWlB5cFqF+XSDRbQDOMD0G1eehGZfbGwyxnnXBQl+5MlK7rnpDABDn6MGYtdeS9SIc9WNR4m9Yb4gOMizDulkv42ciL6DW0oES2OiVx4Qmw9fLxarEiNDkT/ry9K73v0rk/oP3AJ/ngX46/fv2KjurRS7j82IwJJEAFcDF5otLkq29MuUAte+dn60GqD12gNoJVPFwlu68fL7n1p88vpoe6mHBIwlYaviymVo+f+HH7y7YoQe5w0qprKnCtXoJng0tn8//4J2/IUG5UD1r1nMBU+IsMWQHqltCl89fOPDTT64Fqj0kUO0hcX8PSTD14OCx991hco+HW/R7cDppFSk5XFZe7zND3GJNqB6HqEkZJWUdKXlcnu+5t/wuErQWoT5OykZSCrg8f+H7754j96jcYqsqQ30bKdtxWaGCz0xxi5tSKs49JWUHKTVSbsZlEfpydcYCTjmF5q+rriJ5pPBYOQ3Vzj5NGkXox4YljCYGF3h3iyK0Ble14vTUInRi3W1xHNI2BRDDRppxe/xVXE0kWt8giK1t7WpHyumq4+ONm5La5o5fk4HaQpWfD4bKv9Ai27+h/6Y/skHEHVjECbTG0l0Oc9tpQSQToxLnxnlFZJmR2yG6EHuG8TAszboYD+1nXPQTKPm4n8bJqIwXqAsW417ElP659M0n6WrWxTE+huU8T5W+CcPjVEgNCf5kNCzV5EMxL3105ZTOig1cSyjJ+4WQWE8fff+r9P3MgCKNh9vC0pi4sp+y81rA1zLAr18qx0tZD45u0782uo03jl0X1NZf/YdDZLS4cJCOs9xxO9XDGb98/u8a/+H06rZNaLkc1v7bb/2DHSImgWvL7WLt4LVFIxZ+YRFRzhp1XST7aUQSEDbm+4L/HyOzAD6g42dKp5H25g9QCr7vLb10pURrtLf0MNq98ouVl9Dp0hHbTnKAh+ehzzlKpoptVHn3DcqeB8UJ5XiqkLKoNJiToFFOWECNtM0/QAmdZB0jsLEHZYCP69dlZBqRvgpEehGHEk84vCGGdTm9XtoPQuZiAnTQy3lo7yOg2yYTrWqHbvSOxfNSJyt4QoJWL0WFUIgPMUbJ5a/r9kfDnCy6gHg1DMMFuv1ZeaAeLAkqvf/Z3QPDqhaOgiX9KqBC1huJNQiGRvo4SFGOr0IfPdT4+jg4diNpJ5XG8G5dKLzxf+kbQuENv1kofJBuKFU5Eitv0iNfpb/wja+tzLyI3y2WCvRPnS8CfcGr24Tjxwkbh1ThaWh75hng26aqqkpkmWTx6xdNNr0k23CzJl2UydIaWQUoEkgXdRmf6RiKAHcsWSdhS+BSAnt1um3jycYHXMjyhImtz9hjLRMEBJhDEXDOIsFySurqZhYYDZBrNlqszJOIhpLIV3NjE6df2Do9wQWE+Igqq8loPMAllJmtLwx8TJbAyOMLSRU99QLj9XepyTwauW907Mv77ii9kkqCK7IJhnNdLCa3JDeXXpnP6BeSspTLDKGRfFKNxfx+Wx4fKhnoUTI31Uytn5bCoWKgRfmrsgcboJWHkKtkuB/4xV328yrQuwTPd2N6d6+L1+MZw6WYTW+1vbsB6K2W6Z3H0Uczkl7qtGP2YrrYyWAKdwK9i0wnPmS6gfSxNNkArZMBevuB3iqei3V2Ap3bg1aV396AMiJiekfxrjtBO7K0tpsIpijZEKpMbPIXWZ2atfmhItWYHQv6xeiNsirLDQJALCUxY7xwemKMC4hCQjEyKkFekWizfLD/hUt796Gk1iG2xVMs44GBKSnJFErOd2a+PDZ6X+mZfDIRj/m9zAsk4JLMl54ZwpvlJjG9JsBXmnUMgz/8+5Qpky0GFjmnzKpWHPtwSQ2v7sLj4q1LX/mRrbdEzhSWLU/LZTOwvOj1BHDmGC6LcLzOHgGBnvZ4/QFBrDg168/svF05DgSMUIZhOTnsF66KKnFQBLSWDh25asFXZT57Ir91+LpEIpYZVxQjkVcGB/IZoTERibcmhbHtqT3DqSzIWTIcF2pp4VU1FHUxVXWBqpAvwEc3fbu2OuxmGSYSEHmPH7lYjzdUlkP9g+8xONfJwNnMHpyHoWvmZn1JsucKdBIF0tNYKLSKu+hLI3Pr+vmoNJAOhnHKXk7vTeNIpQJ14TTZuqQmbeXwtjVpvE2JhEF6TMLOXE1YabtqO5qNOya3rjlsGwK1eNvkVgLSdUHM5iYn9j86dc1gVpdEf+kHLjEea5FSRwd6tw0cuXlrrhrFWDGeTY0PzT16oDCZy26lnzo0u3tgsD1R9eyzrChoyb7cUEAZqYtygZnpx5+amc5m9/h7B3NbUrLo//Lf+FV1sJfk4oDdnHV+juqnfo8qZrF+TYB+9eHNfOoqCi7rq1LNOHG7cI6GkF4MZ30sDL4BYlB7+tLppbit7vBG2zTZaFuA4UfH8SGNtwbLpkk2fpwmW1BTViILB1vI5EGHBjJUFy4vYd4YhFt1dAnR4qCr1zYNIWnh0fL6f7GyaV0ehRfreD07OnFgrnc0gfeyugTOaf+MkkCNpe9XeevCrTEdHZvv0msu+QUhpR+fWRnlss21cdZPzzzxixl7A6gI3yQZ+pA2Dl+5T3zviemclkhIQrQhlZpVRnsHNutbX2QTfEtKTA3M2HJH/B+yBua/UsUA9v0Ykl/s0PUlLhhgyAJ1bDcCROBA9EhdRMdCGCDGgjhJgYtmKG1Vuch+hlUBsh+gz0N2ww+QjQIDnIcIYtl3MupfryNmz9FhOjtIwMKDtzQBN8BzmQJjiFfOMM4NnguON2Bikj+8KjMLH5xCG0A1qKn0AAqX/gpdX/qr0jslE43TpadQxE5SW0nd9+j9b711/6P3kfXg4gfvOL8K8pOgRqg/AD1UFLC/nib9scWo1842OnlQADFaOmmf3TBHzm4opyCdJWai3R5r7Zx1LVKX7rLP7uLw/iF4YQHexOIzIENb7gqGnk75ej/yiZNk84i5g8FQn6c9u+Xaj1AzRz+xPi9ggxSF1zZ9aF03q1JW5U3kdu5DNojo3LjRMJHGjQu0N65xjZKtI1a1nVgX1bWTE9MTM7ef++TpW/dmDBSDmv7eG6Yn5p69fWJ6fFu+U4/WfWyzPj5x9z7k3nfwEV3TUhPjB/ednBgf2zaUMdqU2sg/1PKp7ODo3M6tekqNCdxDbCgU4Rt5LaMpYCL8dfG4mjBUIV7Pc2H3f63tale3Zid2TwxndL6Wfn5uBppwUtOj/Nbc7N5PnrlvBl490d+7WY/GUH1U7+jPTU1P3DJ38s6D4xMpTdMfOYjbsn9iXNei0dZExhgYHLumMD+0szPHx1GIk4RESkmEYzwXqvKGuTZJT/Xm71DkaNjvj0brRE5TC6IUDjfFu43Rof+7PVqZDXI2Te2hXv/VkjY1Q2Rryr4yNYNHzNS1gLcKN4Gi2rmHXN1Zlry5D5G8afvsI2lzmrNuhYrr7YrrN4hi+V8D+PpPX3uODL6pDrMAsHOKs25kAXYWOOsmFu/4dyMMvxsLN01VdvybvhY0Xcowbw0W070+MqM/hRF61jBnglY7Xly9B6vG/1QhRmRtDQkF1EgOiUdkY0HAM/9Z0ok2o2vOjY2ilD7y6tcWP37vYP/I9lP/WVJXCjigRR+7dWuOB21klL6Kzg/lsj1kryTmEbpQyVGkrs5RZGyJcoPWYHAo3kF2oAJfJ4IKJUSXnmAeaUSCWnr7/3oP4f9Xz+bRBUanz9q5ndB/RJyi8te63E78WN7xc3ThG98gfaXQBZb6DZ4LwnMsVX4M75Xs6EVPgY0L4zU0GFvZyYBhoH9522eAUHheL4y9a30pZA8WvNtziCLLOUhjKuBIL8tnRA+exXs8B/nwM9EGPsT5vMcdvc+nRnKJrJCMx5NtbeLmpFx6f2MbrqGKXjzyPeT163YpIy3xkg2ofWRLMrJB2S9tQO37dRtQh+ymIMHlCoY4Lu7oVYW2NjmpSYh5frAr1ZkVxASOTZ1z9DrmSZsS1EwZdTbqhDimopfpA34KMtsrJAJQWSYPnseM4Fgvhp7pJcWmmbpGM0uJkKjUh9LOrQf1D6s853JxUS8fflYMczzeV+j4Z6EmFAzFn1mtARoPZlP6QDgZV6RYxqYxqcoKkrJWRW3so4zz/DDlzZheJr7JpzfsEgc9bV23B/gG2uN/4qYe4ZtwBpMZ55Z4+xKvkU3DyrvFWXG8NFD+lbvG6Vfz65yINwlnoV+okWwhx8V/nlWUtTPMvlgmKWP2LafIbnJiYrAwNbru1JbzAXSMPuv4OsVTHZRZQ9wEN6OWv5BZT9RLtYtU2l848Ye6KpGqEYUDdBkHDNTWtql61gAIriqp1Ni+o7oht9XW0o/ltnS2qeFoNKwqdx7dN5biYy1tnVvs/Xa+R1FunuxN7qZ8OI+dzIEwLEBKe2Nyy+lJp+19AD3lncr96+MLOHfFDYdusl0FHg0fslfF95CADqAGdKe9l3nlA7/q/eAtZhzs7gTOaR/B786DfxDBuFZ0XgLnYCQCEFZfdQ4y6aUqP6lr13HYBte1pcm6XOdFKzCRTluboQltXXAwSWan8uBB9Q+ACyBWwVFDnLiRWR0ncnYCmpeyeteGHE/nui23RLcYdsVpHO5wi/ZSxeyHZb8qXmWMpg8pUwFF6Rn8i6PzD4AfJPlLb3oTyeHkWH0sFPCh4XjpZZpGk0LpZVc8Ht3UtnVYTbIo6pWkVH544s5j0zP5QUHyo9KDdJVLaHZ5HI4Hj+yZyw8OdKXU4cFruNHWRJMkZxK3PcgEXQ0xl9/94PC+pBzjkaaNB0euGVOzAJ1a23aMTc8v2LkDx4CxDFmTmEOv2GPKQrVAz01E0opOtg7/G1NEy7nsKnJsJ++TdYvdeN0i3joD/8NFH7p0EbsCwHwcAvWRJHscBcXx8KZmQER1tropbzLxwqk37E0mNgGYSS9bQRnAjHf5fO6eH95j5zo122vZIu7LljfI4uVs5Wd8ppdb9HnJLD8pq3FZeZIsR6sJRshyNBxUbeMWpbZmvHUEKWVcnn/h0Te+TG5Oc4vJ9CY8NU/KzaRM4bIIr9g4E19tFOH62oIyPA0fjGxYTVaEn8dHEt71geoL+qqqgzXhSLPcltTSUsuH7MyA+kLe8l1y26ZfdZcd4eVzQTvdkoJWWE1ZwHDeoNlpL4iISEEpiIJ6jS2/Xb10jQ41JMeyB2XsaXOX2yE57HiuEia5ucFj9KPvLdH+X5xl/UyNt8rvjYTv/dnjOG7OBlxMDeNnP3/yc6zfVe2i63Ew/ednz5a86OclL32i9Eo4xibjghDPaCi5chxNMnGvHPKn/dHWam/CK3ClZ9FwSAiIAWbIr1eFZaX0pI0LAGxvYbaAvqGwZmC2vP81/CG6yP4303A+bhu1Ce//i3NyTVkvtuM1PD6dTB20/5oUXauxVd+QpJv8DZN08TpJGWQ0YU/AqGmyd5EMXMX7Rf+G2buonLH472bx0r9j5zP+mmzeKydXEx7pDbT5L2uUwQnLZqv+H8hZTvzHyEE2H2//PyPEryXCryVAObXwgw9w/11XnC9yCjXqnKQo+L6GfgK+XYDRNl6/7pev//9WuOI7AHjaY2BkYGAAYvafukzx/DZfGeQ5GEDgpMUTfRj9//4/Sw4G1g9AdRwMTCBRACJACz0AAAB42mNgZGBgt/vny+DCwfD//v+3HAwMQBEU0AEAjacGOXjaRZG9SsNgFIZP0/zhUEQEEQsiGUU6dIhQilAcOjiENhRxcHRzqbgoIk4ldHB18AbiNbiI6CC9BwniJjiKOtTnnFQNPLznO79fvuNL+Tk3EEMud9UnGblDiWAlqEvTe5S9yqscEjsAp1oX381lQP6Yc2IayyL5PbiALjRgFbZgB3ahozFqHuBee/xRyH4wkWNm6bwMUtO+ZMQyPy7PzMm0r9rmzy23jPf/87BbxJewT7FrwVgcdAEi/G3mH+md0WXmb7jD6Ru23k/r9P8TNFXFH5ldyCU1MH3GbzbvM7L8wvJV02rd6rvWu5Bz7NCPp19oDeZdkW1y1pyWXKPrzO/p2xNrgr5j6L0Q521nOnA+RLx39jPTyiecsLjvGbecG2jfdpj8Qq92KLZb3dGY2VeKM5EO/kJrtA95c5zP3E3swv434s0iiX4AL1h1AgAAAHjaY2CAAxuGCsYQphnM51jZWNVYc1g3sd5ik2FLYKtjW8R2jT2CfRWHH8cvzgYuKa5d3EI8YjxXeJl4Y3iX8B7j4+PbJeAnKCI4T0hOKE9oldAD4TrhbcJXRDREukQ2iCmI1YkziYeI/5OokSySXCT5RapI+oNMicwJWRZZM9ks2UWy7+S45PTkWeRXKcgpHFD0Utyi1KX0R1lDuUT5ivInlVWqaqrz1ILUvqjHaLhpLNFU0jyknaB9S8dHp0tXSddJ95ZeGhD+0V9kIGNoZBhgFGPUhAMuMNpndMfoh7GIcZjxAhMhkw6TM6Y8YLjHnMVcyHyBhYKFgYUDAK/oTjQAAQAAAIkAuAAFAFIABAACAAEAAgAWAAABAAKIAAMAAXjahZAxTsNAEEWfSUDQpEYp0FaIBgtoqAkRNHRB6W1iQqTICbFDFCpOQolEzyE4BMfgAPwdr42QkKLV7PyZ+X9md4Bd7mkRtfeAF1mFIw4UVXhLnNeAW3R4C7jNER8Bb7PPV8A7HPId8Cd51KXPhLGslD2TMcLJEsWJ0LvsjBOdc6ELCu7EycXIWChzyUx+bndiPWaqxsad6jjlff8H1QqLMnmvfbJZMTeqp5b51TsGinIxe4qn4q3ESLUNXy03aFyjGhqnaBinmuf/8p++Vh836lu9emL96rlO70gsM7Yt1B2qraWsdZdSZfJXjWbAI0t1Wtjv/U6u/6j97uIfjZJPTwAAeNptzsdOQmEQhuF3AEFpigpYY+/tnAMI2EHB3nuXxMZGEw13oDG2rTfhznopXo6K/Eu/ZPJkZjH5MPGX7xa++C+3vyOYMGMhDys28inAjgMnLtwUUoSHYkooxYsPP2WUU0ElVVSLiRpqqaOeBhppopkWWmmjnQ466aKbHjR0DAIECdFLmAhR+uhngEGGGGaEGHFGGSNBknEmmGSKaWaYZY55FlhkiWVWWGWNdTbYZIttdthlj30OSImZK6554l4s3PEoeWIVm+RLgdjFIU5xiVsKpUg8UswLr3zwyRvv3PAsJVIqXh7EJ34pk3KpsGXO0lognPhTi2nKsayGpmlKXWkoA8qgMqTsVYaVEWVUGcupq7+6bj9On2Qujg5Tl6e5k5HMGUpaEpmL8+ySUD2S8VyPXw1lQBn8Adr2VtMAAAC4Af+FsAGNAEuwCFBYsQEBjlmxRgYrWCGwEFlLsBRSWCGwgFkdsAYrXFgAsAUgRbADK0QBsAYgRbADK0RZsBQr);font-weight: bold;font-style: normal;}</style>\n<style type=\"text/css\" media=\"screen,print\">::-webkit-scrollbar{width: 11px;height: 11px;}::-webkit-scrollbar-track:horizontal{background-color: #eee;}::-webkit-scrollbar-thumb:horizontal{background-color: #bbb;}::-webkit-scrollbar-track:vertical{background-color: #eee;}::-webkit-scrollbar-thumb:vertical{background-color: #bbb;}div#rightBar{display:none;background-color: #d5efd5;height: 454px;width: 300px;float: right;position: fixed;top: 85px;right: 10px;border: 1px solid #a4d2a3;padding-left: 15px;padding-right: 15px;padding-top: 9px;padding-bottom: 9px;overflow: auto;box-shadow: #ccc 0 1px 1px 0;}#hideRightBar{position: relative;left: 0px;top: 0px;}#rightBar h3{font-weight: lighter;margin-top: 6px;font-size: 13pt;color: #606060;}#rightBar p{font-size: 9pt;}#rightBar ul,ol{font-size: 9pt;padding-left: 14px;}#detailsData{vertical-align: top;width: 0;padding-left: 15px;}#detailsArea{display: none;border: 1px solid #ddd;position: fixed;top: 150px;width: 233px;margin-right: 20px;padding: 15px;overflow: auto;color: #222;box-shadow: #f2f2f2 0 1px 1px 0;}#detailsArea label{font-weight: bold;font-size: 13px;}#hideDetailsArea{float: right;}#warningArea{display: none;border: 1px solid #9d0000;background-color: #f48d8d;position: fixed;top: 150px;width: 233px;padding: 15px;overflow: auto;}div#helpMenu{width: 260px;margin-right: 15px;}div#helpMenu ul{list-style-type: none;font-size: 9pt;}div#helpMenu a{text-decoration: none;}div#helpMenu h6{cursor: pointer;padding: 3px 0px 4px 25px;}div#helpContent{margin-top: 1px;margin-right: 15px;border: 1px solid #c0c0c0;padding: 10px 20px 20px 20px;border-radius: 3px;}div#helpContent ul,ol{padding-left: 15px;}div.thingy{clear: both;}.leftBarIcon{height: 16px;width: 16px;color: #666;font-size: 10pt;}#showLeftBar{display: none;position: absolute;left: 22px;top: 50px;font-weight: bold;font-size: 9pt;cursor: pointer;}#hideLeftBar{position: absolute;right: 2px;font-weight: bold;font-size: 9pt;cursor: pointer;}#mainMenuIcon{float:right;cursor: pointer;}div#orgUnitTree{font-size: 9pt;padding-top: 4px;}div#orgUnitTree{font-size: 9pt;background-color: white;overflow: auto;width: 235px;height: 300px;border-top: 1px solid #e3e3e3;border-bottom: 1px solid #e3e3e3;}div#orgUnitTree ul{margin: 0;padding: 0;}div#orgUnitTree ul li:last-child{background-position: 0pt -1766px;}div#orgUnitTree li{list-style-type: none;white-space: nowrap;margin-top: 0;padding: 0 0 1px 15px;background-color: transparent;background-image: url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAbwCAYAAABqZ9HZAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyppVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuNi1jMTMyIDc5LjE1OTI4NCwgMjAxNi8wNC8xOS0xMzoxMzo0MCAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENDIDIwMTUuNSAoTWFjaW50b3NoKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo3NkY0OTA3OTg3RDIxMUU2ODI1RjhFODc4REY2RjUxRSIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDo3NkY0OTA3QTg3RDIxMUU2ODI1RjhFODc4REY2RjUxRSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjc2RjQ5MDc3ODdEMjExRTY4MjVGOEU4NzhERjZGNTFFIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjc2RjQ5MDc4ODdEMjExRTY4MjVGOEU4NzhERjZGNTFFIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+S1rIZwAAAbtJREFUeNrs0rENACAMA8HA/o0nhg1IQQW6by1d5VmHkqxqmnUZ4Atg3B6pPBEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC8BIzTmGR1wBZgANT4GKXHs9KrAAAAAElFTkSuQmCC');background-repeat: no-repeat;background-attachment: scroll;background-position: 0pt 0pt;}div#orgUnitTree span.toggle{margin-left: -12px;cursor: pointer;}div#orgUnitTree a{display: inline;border: 0;padding: 0;color: #000;text-decoration: none;cursor: pointer;}div#orgUnitTree a:hover{color: #555;background-color: #fff;}div#orgUnitTree a.selected{color: orange !important;font-weight: bold;}div#selectionTree{font-size: 9pt;background-color: white;height: 300px;width: 493px;overflow: auto;border: 1px solid #ccc;padding: 4px 0 0 5px;}div#selectionTree ul{margin: 0em 0em 0em 1.5em;}div#selectionTree>ul{margin-left: 0em;}div#selectionTree li{list-style-type: none;white-space: nowrap;}div#selectionTree span.toggle{font-family: courier new,monospace;font-size: 9pt;cursor: pointer;}div#selectionTree a{color: black;text-decoration: none;cursor: pointer;}div#selectionTree a:hover{color: #808080;}div#selectionTree a.selected{color: orange !important;font-weight: bold;}div#selectionTree a.locked{color: green;}#message{display: none;padding: 1em;margin: 1em 0;background-color: #f8eab0;border: 1px solid #dbae56;width: 480px;border-radius: 3px;}#info{display: block;padding: 1em;margin: 1em 0;background-color: #baffbc;border: 1px solid #12cd17;width: 480px;border-radius: 3px;}#headerMessage{top: 3px;left: 155px;position: fixed;display: none;padding: 10px;padding-bottom: 9px;width: 410px;background-color: #f8eab0;border: 1px solid #dbae56;z-index: 1200;font-size: 9pt;text-align: center;border-radius: 3px;}table.notificationTable{background-color: #f9edbe;border: 1px solid #dbae56;padding: 6px;border-radius: 3px;}table.notificationTable td{padding: 3px;}table thead tr .header{background-image: url('images/bg.gif');}table thead tr .headerSortUp{background-image: url('images/asc.gif');}table thead tr .headerSortDown{background-image: url('images/desc.gif');}table thead tr .headerSortUp,table thead tr .headerSortDown,table thead tr .header{background-repeat:no-repeat;background-position: center right;cursor:pointer;}div.error{background: url('images/error.png') no-repeat 10px 10px}div.success{background: url('images/success.png') no-repeat 10px 10px}div.warning{background: url('images/warning.png') no-repeat 10px 10px}div.waiting{background: url('images/wrench.png') no-repeat 10px 10px}div.growlUI h1,div.growlUI h2{color: white;padding: 5px 5px 5px 75px;text-align: left;font-size:medium}div.growlUI h2{font-size: small}.ui-autocomplete-loading{background: white url('images/ui-anim_basic.gif') right center no-repeat;}span.error{color: red;}#cluetip-inner{font-size:10pt;}#cluetip-inner label{padding-bottom:5px;}div.inputCriteria{border: 1px solid #a4d2a3;background-color: #d0eBd0;padding-top: 10px;padding-bottom: 10px;padding-left: 20px;margin-bottom: 15px;border-radius: 3px;}.alt{background-color: #f3f3f3;padding-right: 50px;}.reg{padding-right: 50px;}.cent{text-align: center;}.formSection{border:1px solid #cacaca;padding:10px;border-radius: 3px;}.formInputField{border: 1px solid #aaa;padding: 4px 1px;}.settingHeader{padding: 9px 0 6px 0;font-size: 12pt;color: #373737;}.settingLabel{padding: 2px 0;font-size: 10pt;color: #222;}.setting{padding: 2px 0;font-size: 10pt;margin-bottom: 15px;color: #222;}.setting input[type=text],.setting input[type=password],.inputForm input[type=text],.inputForm input[type=password],.setting textarea,.inputForm textarea{width: 25em;border: 1px solid #aaa;box-shadow: inset 0 1px 1px rgba(0,0,0,0.075);border-radius: 3px;padding: 6px 5px;margin: 2px 0;color: #222;}.setting select,.inputForm select{width: 26em;padding: 6px 1px;margin: 2px 0;border: 1px solid #aaa;border-radius: 3px;background-color: #fff;box-shadow: inset 0 1px 1px rgba(0,0,0,0.075);color: #222;}.setting textarea,.inputForm textarea{height: 8em;}.inputForm label{color: #222;}.settingIndent{margin-left: 12px;}.paging-container{text-align: right;}div.paging{width:300px;float:right;margin-right:5em;text-align: center;height:16px;}div.paging span,div.paging a{font-weight: bold;padding: 0 5px;font-size: 12px;}div.paging a{text-decoration: none;color: #FF9900;}div.paging a:hover{color: #000;}div.paging span.page{color:#000;}div.paging span.seperator{display:none;}ul.pageSizeSelection{list-style:none;float:left;width: 300px;margin: 0;padding: 0;}ul.pageSizeSelection span{width: 100px;display: block;float :left;}ul.pageSizeSelection input{text-align: right;}.cde table{border-collapse: collapse;}.cde-greyfield{background-color: #e0e0e0;}.cde-NORMAL td,.cde-NORMAL th{padding: 12px;border: 1px solid #c0c0c0;}.cde-COMFORTABLE td,.cde-COMFORTABLE th{padding: 18px;border: 1px solid #c0c0c0;}.cde-COMPACT td,.cde-COMPACT th{padding: 5px;border: 1px solid #c0c0c0;}.cde-NONE{}.dashboardMenuFlag{margin-top: 16px;margin-left: 16px;border: 1px solid #D0D0D0;border-radius: 2px;cursor: pointer;max-width: 160px;}.greyButtonLink{padding: 6px 12px;height: 25px;border: 1px solid #bbb;border-radius: 3px;margin-right: 4px;font-weight: bold;font-size: 13px;background-color: #f3f3f3;color: #606060 !important;text-decoration: none !important;}.greyButtonLink:hover{text-decoration: none;background-color: #f8f8f8;}.blueButtonLink{padding: 6px 12px;height: 25px;border: 1px solid #3281D1;border-radius: 3px;margin-right: 4px;font-weight: bold;font-size: 13px;background-color: #3581CE;color: #fff !important;text-decoration: none !important;}.blueButtonLink:hover{text-decoration: none;background-color: #3176BD;}.multiSelectButton{padding: 6px 12px;height: 25px;border: 1px solid #bbb;border-radius: 3px;margin-right: 4px;font-weight: bold;font-size: 13px;background-color: #f3f3f3;color: #606060 !important;text-decoration: none !important;}.multiSelectButton:hover{text-decoration: none;background-color: #f8f8f8;}.multiSelectButton .downArrow{border: thick;border-color: #777777 transparent white;border-style: solid dashed dashed;margin-left: 5px;position: relative;top: 10px;}.multiSelectButton .downArrow:hover{border-color: #999999 transparent white;}.multiSelectButton.disabled .downArrow{border-color: #e2e2e2 transparent white;}.multiSelectButton input[type='checkbox']{margin: 0;}.multiSelectMenu{position: absolute;margin-top: -15px;z-index: 999;padding: 1px 1px;border: 1px solid #bbb;border-radius: 3px;margin-right: 4px;font-weight: bold;font-size: 13px;background-color: #f3f3f3;color: #606060 !important;text-decoration: none !important;}.multiSelectMenu li{float: none !important;display: block;text-decoration: none;color: #606060;padding: 6px 9px;}.multiSelectMenu li:hover{cursor: pointer;text-decoration: none;background-color: #f8f8f8;}::-webkit-input-placeholder{color: #777;}input:-moz-placeholder{color: #777;}#updateProfileHeader{display: inline-block;font-size: 14pt;color: #606060;padding: 0 0 19px 0;}#updateProfileLink{position: relative;top: -2px;display: inline-block;margin-left: 200px;}.ui-widget,.ui-widget input,.ui-widget select,.ui-widget textarea,.ui-widget button{font-family: LiberationSans,arial,sans-serif !important;font-size: 9pt !important;}.ui-datepicker th{font-family: LiberationSans,arial,sans-serif !important;padding: 0.5em 0 !important;font-size: 9pt !important;}.ui-widget-header,.ui-widget-header a{font-family: LiberationSans,arial,sans-serif !important;font-size: 10pt !important;}.ui-datepicker-header{margin-bottom: 2px;}.ui-button-text{font-family: LiberationSans,arial,sans-serif !important;font-size: 9pt !important;}.message{border: 1px solid #ddd;border-radius: 3px;width: 450px;padding: 9px;margin-bottom: 8px;}.message-info{background-color: #f3f3f3;color: #222;}.filterInput{max-width: 300px;min-width: 120px;width: 50%;}.filterButton{width: 55px;}.tipText{color: #777;font-weight: normal;}.fa-question-circle{color: #276696;}.gridTable{border-collapse: collapse;}.gridTable td,.gridTable th{border: 1px solid #e1e1e1;}</style>\n<link href=\"data:image/gif;base64,R0lGODlhEAAQANUAACtimtvk79Pe6ubt9bfI2z1uoF2Fr097qDZpnv///4Giw/f5+y5knC9lnMbV5KS81H2fwVB+rE98q7zN3zBmnFqFsTlsoViDr2aOtuju9oyqyL3O4JeyzWOJr26UusvY5srY5kZ2p7jL3VR+qUR0pi1jm6O708HR4dfh7OTs9N/n8DFmne7z92qOszZqn+3y+bnJ3Nrj7fD0+Dxuovr7/UVzo4qox0h4qDdroOzx9uzy+QAAAAAAAAAAAAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo5RjRFNzY3NDhGMDIxMUU2QkU5M0M1RTU4QTU0QjE4MSIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDo5RjRFNzY3NThGMDIxMUU2QkU5M0M1RTU4QTU0QjE4MSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjlGNEU3NjcyOEYwMjExRTZCRTkzQzVFNThBNTRCMTgxIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjlGNEU3NjczOEYwMjExRTZCRTkzQzVFNThBNTRCMTgxIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAABAAEAAABn3AV2BILBYzg9ZhyWwuR7CBAUCtUqpUBEFalWxYiRynlN1OAY2Yygb5JDRlLnXWoJISp/gZC4gkHnp8AAwOCzeBWAwiNB5VWnJUKxMLGFiPezggMhV8l1QWKAkmCqQKLgCeABcJrK0JIahmgoKPHQW3uLm3NQQ6Ar/AwcEpQQA7\" rel=\"shortcut icon\">\n<script src=\"https://ajax.googleapis.com/ajax/libs/jquery/1.8.2/jquery.min.js\"></script>\n<script src=\"https://ajax.googleapis.com/ajax/libs/jqueryui/1.10.4/jquery-ui.min.js\"></script>\n<script original=\"mock-de.js\">var dhis2 = dhis2 || {de:{},util:{}};\ndhis2.de.event={\{uid1}        : \"dhis2.de.event.formLoaded\",\ndataValuesLoaded  : \"dhis2.de.event.dataValuesLoaded\",\nformReady         : \"dhis2.de.event.formReady\",\ndataValueSaved    : \"dhis2.de.event.dataValueSaved\",\ncompleted         : \"dhis2.de.event.completed\",\nuncompleted       : \"dhis2.de.event.uncompleted\",\nvalidationSucces  : \"dhis2.de.event.validationSuccess\",\nvalidationError   : \"dhis2.de.event.validationError\"\n};\ndhis2.util.on = function( event, fn ) {\n$( document ).off( event ).on( event, fn );\n};\nvar mockForm,inputs;\n$( document ).ready(function() {\nmockForm = $(\".cde\");\ninputs = mockForm.find(\"input\");\ninputs.each(function(k,v){\nif (v.value.indexOf('[')===0){\nv.value=\"\";\n}\n});\ndhis2.de.currentOrganisationUnitId =\n(typeof $(\"a.selected\").attr(\"href\").split('\"')[1] !== \"undefined\")? $(\"a.selected\").attr(\"href\").split('\"')[1]:'unknown6666';\n$(\".PEPFAR_Form_EntryField\").find(\":input\").addClass(\"entryfield\");\n$(\".PEPFAR_Form_OptionSet\").find(\":input\").addClass(\"entryoptionset\");\n$(\".PEPFAR_Form_Narrative\").find(\":input\").addClass(\"entryarea\");\nconsole.log(\"dhis2.de.event.formLoaded\");\n$( document ).trigger( dhis2.de.event.formLoaded, 'curDataStId' );\nconsole.log(\"dhis2.de.event.dataValuesLoaded\");\n$( document ).trigger( dhis2.de.event.dataValuesLoaded, 'curDataStId' );\nconsole.log(\"dhis2.de.event.formReady\");\n$( document ).trigger( dhis2.de.event.formReady, 'curDataStId' );\nmockForm.on(\"change\", \"input\", function(k,t) {\nconsole.log(\"dhis2.de.event.dataValueSaved\");\n$( document ).trigger( dhis2.de.event.dataValueSaved,\n[ \"saveRanDmID\", {\nde: $( this ).attr('id').split(\"-\")[0],\nvalue:$( this ).attr(\"value\"),\nco: $( this ).attr('id').split(\"-\")[1],\nou: dhis2.de.currentOrganisationUnitId ,\npe: \"YYYYMM\"\n}]\n);\nif ($( this ).attr(\"value\")!==''){\n$( this ).css( 'background-color', \"#0f0\" );\n}\nelse{\n$( this ).css( 'background-color', \"#fff\" );\n}\n});\n});\nvar organisationUnitSelected = false;\nvar selection = {};\nselection.setListenerFunction = function(d){};\nselection.findByName = function(){};\ndhis2.leftBar = {};\ndhis2.leftBar.setLinks = function( showLeftBarLink, showExtendMenuLink ){};\ndhis2.leftBar.extend = function(){\n$( '#leftBar, #orgUnitTree' ).show().css( \"width\", \"235px\" );\n$( '#mainPage' ).css( \"margin-left\", \"270px\" );\n$( '#hideMainMenuLink' ).attr( 'href', 'javascript:dhis2.leftBar.retract()' );\n};\ndhis2.leftBar.hide = function(){\n$( '#leftBar' ).hide();\n$( '#showLeftBar' ).show();\n$( '#mainPage' ).css( 'margin-left', '20px' );\n};\ndhis2.leftBar.resetPosition = function(){\n$( '#leftBar' ).hide();\n$( '#showLeftBar').hide();\n$( '#mainPage' ).css( 'margin-left', '20px' );\n};\ndhis2.leftBar.showAnimated = function(){dhis2.leftBar.extend(); };\ndhis2.leftBar.extendAnimated = function() { dhis2.leftBar.extend(); }\ndhis2.leftBar.retract = function(){ dhis2.leftBar.hide(); };\ndhis2.leftBar.hideAnimated = function(){ dhis2.leftBar.hide(); };\ndhis2.leftBar.setMenuVisible = function(){}\ndhis2.leftBar.setMenuExtended = function(){}\ndhis2.leftBar.setMenuHidden = function(){}\ndhis2.leftBar.openHelpForm = function( id ){}\nlet closeCurrentSelection = function(){\n$(\"#currentSelection\").hide();\n}\nselection.select = function(ouID){\n$(\"#selectedOrganisationUnit\").val($(\"#orgUnit\"+ouID+\" >a\").text());\n$(\"#currentOrganisationUnit\").text($(\"#orgUnit\"+ouID+\" >a\").text());\n}\nlet periodSelected = function(){\n$(\"#currentPeriod\").text($( \"#selectedPeriodId option:selected\" ).text());\n}\nvar dataElementList = {};\nvar catOptionCombo = {};\n//dataElementListHere\n$(document).ready(function(){\nlet ouid = $(\"#orgUnitTree\").find(\"a.selected\").parent().attr(\"id\").substr(7);\nselection.select(ouid);\nperiodSelected();\n$(\".PEPFAR_Form_EntryField\").click(function(){\nlet selectedID = $(this).find(\"input\").attr(\"id\");\n$(\"#currentDataElement\").text(dataElementList[selectedID.substr(0,selectedID.length-16)]+\" | \"+catOptionCombo[selectedID.substr(12,11)]\n+\" | \"+selectedID.substr(0,selectedID.length-16)+\".\"+selectedID.substr(12,11));\n});\n$(\".PEPFAR_Form_Narrative\").click(function(){\nlet selectedID = $(this).find(\"input\").attr(\"id\");\n$(\"#currentDataElement\").text(selectedID.substr(0,selectedID.length-4));\n});\n});</script>\n<script>periodSelected = function () {\nconsole.log(\"period changed\");\nconsole.log(\"dhis2.de.event.dataValuesLoaded\");\n$( document ).trigger( dhis2.de.event.dataValuesLoaded, 'curDataStId' );\n}</script>\n<style type=\"text/css\">#menuLinkArea *{box-sizing:content-box;-webkit-box-sizing:content-box;-moz-box-sizing:content-box;-o-box-sizing:content-box;-m-box-sizing:content-box}#menuLinkArea{list-style-type:none;max-width:1200px;margin:0;padding:0 20px 0 0}#menuLinkArea li{float:right}#menuLinkArea .app-menu-dropdown li{float:left}input.apps-search[type=\"text\"]{border:1px solid #ccc;border-radius:3px;box-sizing:content-box;font-size:inherit;outline:none;padding:4px 1px;padding-right:5px;padding-left:5px;width:348px}.apps-search-wrap{padding-bottom:10px;position:relative;width:360px}.app-menu-dropdown .apps-search-clear{color:#404040;cursor:pointer;display:none;font-size:15px;height:15px;margin:0;padding:0;position:absolute;right:5px;top:18%;width:20px}.menuDropDownBox{list-style-type:none;padding:0;margin:10px 0}.menuDropDownBox a{border-radius:3px;cursor:pointer}.menuDropDownBox a:hover{text-decoration:none;background-color:#f5f5f7;color:#000}.menuDropDownBox li.selected a{background-color:#f5f5f7}.app-menu:after{clear:both;content:\"\"}.app-menu ul,.app-menu li{list-style:none}.app-manager-header,.app-menu{margin:0 auto;position:relative;width:535px}.app-menu li{float:left;position:relative}#menuOrderBy{float:right}.app-menu .app-menu-item,.app-menu .app-menu-placeholder{margin:10px;display:block;border:1px solid #d0d0d0;background-color:#fff;width:225px;height:56px;border-radius:5px;padding:10px}.app-menu .app-menu-item img{max-height:36px;max-width:36px;display:block;left:25px;top:29px;position:absolute}.app-menu .app-menu-item span{font-size:1.15em;padding-left:48px;display:block;padding-top:19px;color:#404040}.app-menu .app-menu-placeholder,.app-menu .app-menu-item:hover{border:1px dashed #9ec5df;background-color:#e9f5fb;text-decoration:none}.app-menu-item-description{display:none}.app-menu-item-description .fa.fa-arrows{font-size:1.3em;position:absolute;right:5px;top:5px}.app-menu li:hover a .app-menu-item-description{position:absolute;top:0;right:0;bottom:0;left:0;background:#fff;border:1px solid #b0b0b0;display:block;margin:10px;padding:10px;font-size:1em;color:#555;border-radius:5px}.app-menu li.ui-sortable-helper:hover a .app-menu-item-description{display:none}.app-menu li.ui-sortable-helper:hover a{background-color:rgba(255,255,255,0.30)}.app-menu-item .app-menu-item-description span{color:#444;display:block;font-size:1.1em;padding:0;padding-bottom:5px;margin:0}.app-menu-item .app-menu-item-description p{height:35px;margin:0;overflow:hidden;padding:0}.app-menu li:hover a .fa.fa-bookmark{display:none}.app-menu a.app-menu-item .fa.fa-bookmark{color:#276696;font-size:2em;position:absolute;right:15px;top:10px}.app-menu li + li + li + li + li + li + li + li + li + li a.app-menu-item .fa.fa-bookmark{display:none}.menu-link{color:#fff;cursor:pointer;font-size:9pt;height:44px;line-height:44px;text-align:center;width:105px}.menu-link i.fa{font-size:2em;padding-right:10px;position:relative;top:5px}a.menu-link:hover{color:#fff;text-decoration:none}.app-menu-dropdown{background-color:#fff;border:1px solid #bbb;border-radius:2px;box-shadow:rgba(0,0,0,0.24) 0 2px 8px 0;color:#000;font-size:9pt;max-height:610px;overflow-y:inherit;padding:10px;top:10px;position:relative;width:360px;z-index:100000}.app-menu-dropdown-wrap{position:absolute;left:-9999px}.app-menu-hide{display:none}.app-menu-dropdown ul{margin:0;overflow:auto}.app-menu-dropdown li{float:left}.app-menu-dropdown img{max-height:48px;max-width:48px;padding:15px 36px 5px}.app-menu-dropdown span{color:#404040;display:block;font-family:LiberationSans,arial,sans-serif;height:30px;overflow:hidden;padding-left:10px;padding-right:10px;text-align:center;width:100px}.app-menu-dropdown .caret-up-background,.app-menu-dropdown .caret-up-border{border-left:10px solid transparent;border-right:10px solid transparent;width:0;height:0;position:absolute}.app-menu-dropdown .caret-up-background{border-bottom:10px solid #fff;top:-9px}.app-menu-dropdown .caret-up-border{border-bottom:10px solid #bbb;top:-10px}.app-menu-dropdown a.app-menu-item{color:#000;display:block;height:110px;padding:0;text-decoration:none;width:120px}.app-menu-dropdown a.app-menu-item:hover span{padding-left:10px;padding-right:10px;text-align:center;width:100px}.apps-menu-bottom-button{display:table;height:34px;padding-top:8px;text-align:center;margin-top:5px;float:left}.apps-menu-bottom-button a{color:#4A89BA;border:1px solid #ccc;background-color:#f5f5f7;border-radius:5px;display:table-cell;vertical-align:middle;text-decoration:none}.apps-scroll{width:60px;margin-left:5px}.app-menu-dropdown:after{content:\" \";visibility:hidden;display:block;height:0;clear:both}.apps-menu-bottom-button a:hover{color:#fff;border:1px solid #4A89BA;background-color:#4A89BA}.apps-menu-more{width:230px}.menu-placeholder{width:100%;text-align:center;vertical-align:middle}hr.app-separator{border:none;border-top:1px solid #bbb;height:1px;position:absolute;top:484px;width:100%}.menu-drop-down-wrap{overflow:hidden;height:375px}.menu-drop-down-scroll{height:375px;overflow-y:auto;overflow-x:hidden;width:384px}#appsMenuDropDown ul.menuDropDownBox{height:330px}.caret-up-background,.caret-up-border{left:298px}.drop-down-menu-link{cursor:pointer;display:block;font-family:LiberationSans,arial,sans-serif}.show-menu{display:block}.app-menu-help{color:#444;line-height:1.75em}.app-menu-help .fa{font-size:1.2em}.app-menu-help .fa-bookmark{color:#276696;font-size:1.5em;padding-right:5px;position:relative;top:2px}.app-menu-help .fa-arrows{padding-right:4px}.app-menu-error{background:#8b0000;background:rgba(160,0,0,.70);border:1px solid #8b0000;border-radius:5px;display:block;padding:.5em 0;text-align:center;width:358px}.app-menu-error:hover{background:rgba(160,0,0,.80);cursor:pointer}.app-menu-error a{background-color:transparent;color:#fff}.app-menu-error a:hover{background-color:transparent;color:#fff;text-decoration:none}@media (max-width: 700px),(max-device-width: 700px){#headerText{display:none}}@media only screen and (min-width: 840px){.app-manager-header,.app-menu{width:808px}hr.app-separator{top:288px}}.calendars{background-color:#fff;color:#000;border:1px solid #444;-moz-border-radius:.25em;-webkit-border-radius:.25em;border-radius:.25em;font-family:Arial,Helvetica,Sans-serif;font-size:90%}.calendars-rtl{direction:rtl}.calendars-popup{z-index:1000}.calendars-disable{position:absolute;z-index:100;background-color:#fff;opacity:.5;filter:alpha(opacity=50)}.calendars a{color:#fff;text-decoration:none}.calendars a.calendars-disabled{color:#888;cursor:auto}.calendars button{margin:.25em;padding:.125em 0;background-color:#fcc;border:none;-moz-border-radius:.25em;-webkit-border-radius:.25em;border-radius:.25em;font-weight:700}.calendars-nav,.calendars-ctrl{float:left;width:100%;background-color:#000;color:#fff;font-size:90%;font-weight:700}.calendars-ctrl{background-color:#600}.calendars-cmd{width:30%}.calendars-cmd:hover{background-color:#777}.calendars-ctrl .calendars-cmd:hover{background-color:#f08080}.calendars-cmd-prevJump,.calendars-cmd-nextJump{width:8%}a.calendars-cmd{height:1.5em}button.calendars-cmd{text-align:center}.calendars-cmd-prev,.calendars-cmd-prevJump,.calendars-cmd-clear{float:left;padding-left:2%}.calendars-cmd-current,.calendars-cmd-today{float:left;width:35%;text-align:center}.calendars-cmd-next,.calendars-cmd-nextJump,.calendars-cmd-close{float:right;padding-right:2%;text-align:right}.calendars-rtl .calendars-cmd-prev,.calendars-rtl .calendars-cmd-prevJump,.calendars-rtl .calendars-cmd-clear{float:right;padding-left:0;padding-right:2%;text-align:right}.calendars-rtl .calendars-cmd-current,.calendars-rtl .calendars-cmd-today{float:right}.calendars-rtl .calendars-cmd-next,.calendars-rtl .calendars-cmd-nextJump,.calendars-rtl .calendars-cmd-close{float:left;padding-left:2%;padding-right:0;text-align:left}.calendars-month-nav{float:left;background-color:#777;text-align:center}.calendars-month-nav div{float:left;width:12.5%;margin:1%;padding:1%}.calendars-month-nav span{color:#888}.calendars-month-row{clear:left}.calendars-month{float:left;width:15em;border:1px solid #444;text-align:center}.calendars-month-header,.calendars-month-header select,.calendars-month-header input{height:1.5em;background-color:#444;color:#fff;font-weight:700}.calendars-month-header select,.calendars-month-header input{height:1.4em;border:none}.calendars-month-header input{position:absolute;display:none}.calendars-month table{width:100%;border-collapse:collapse}.calendars-month thead{border-bottom:1px solid #aaa}.calendars-month th,.calendars-month td{margin:0;padding:0;font-weight:400;text-align:center}.calendars-month th{border:1px solid #777}.calendars-month th,.calendars-month th a{background-color:#777;color:#fff}.calendars-month td{background-color:#eee;border:1px solid #aaa}.calendars-month td.calendars-week{border:1px solid #777}.calendars-month td.calendars-week *{background-color:#777;color:#fff;border:none}.calendars-month a{display:block;width:100%;padding:.125em 0;background-color:#eee;color:#000;text-decoration:none}.calendars-month span{display:block;width:100%;padding:.125em 0}.calendars-month td span{color:#888}.calendars-month td .calendars-other-month{background-color:#fff}.calendars-month td .calendars-weekend{background-color:#ddd}.calendars-month td .calendars-today{background-color:#f0c0c0}.calendars-month td .calendars-highlight{background-color:#f08080}.calendars-month td .calendars-selected{background-color:#777;color:#fff}.calendars-month th.calendars-week{background-color:#777;color:#fff}.calendars-status{clear:both;background-color:#ddd;text-align:center}.calendars-clear-fix{clear:both}#currentSelection{padding:6px;background-color:#eee;border:1px solid #bbb;text-align:right;position:fixed;top:55px;right:10px;filter:alpha(opacity=85);opacity:.85;border-radius:3px;z-index:5}#actions{float:right;width:160px;text-align:right}#closeCurrentSelection{float:left;cursor:pointer;margin-right:5px}#contentDiv{margin-bottom:8px}#completenessDiv{display:none;width:399px}#infoDiv{display:none;width:399px;height:20px}#completedByDiv{display:none}.currentRow{background-color:#d5ffc5;padding-right:50px}.hidden{display:none}.separator{color:#aaa;padding:0 4px}.selectionBoxRow{padding:2px 0}.selectionBoxSelect{width:401px}.selectionLabel{display:inline-block;width:130px}.formSection td{padding-right:1px;padding-left:1px;height:28px;white-space:nowrap}.formSection th{text-align:center;min-width:46px;background-color:#f3f3f3;border:1px solid #dadada;color:#444}.sectionTable{border-collapse:collapse}.sectionDescription{font-size:13px;color:#777;padding-bottom:10px}.sectionFilter{padding:5px;border:solid 1px #f0f0f0;outline:0;color:#333;height:14px}.historyHeader{color:#606060;font-size:17px;padding:5px 0}.entryfield,.entryoptionset,.entryselect,.dataelementtotal,.indicator{text-align:center;box-shadow:inset 0 1px 1px rgba(0,0,0,0.06);border:1px solid #aaa}.entryselect{padding:4px 1px}.entryarea{min-width:264px;min-height:45px;text-align:left;padding:4px;box-shadow:inset 0 1px 1px rgba(0,0,0,0.06)}.indicatorArea{margin-top:20px;padding-top:16px;border-top:1px solid #ddd}.commentlink{padding-left:3px}textarea:read-only{background-color:#eee!important}#historyTabs{padding:0;width:545px;height:345px}#historyTabs.ui-tabs.ui-widget.ui-widget-content{border-width:0}#historyTabs .ui-tabs-nav{border-width:0;border-bottom-width:1px;border-bottom-color:inherit;border-radius:0;background:transparent;padding:0}#historyTabs.ui-widget-content{background:none}#historyTabs .ui-tabs-panel. ui-widget-content{padding-top:.5em;padding-left:.5em;padding-right:.5em;border-width:0}#historyAuditTable{width:100%;border-collapse:collapse;text-align:left;background-color:#F5F5F5}#historyAuditTable tbody tr:nth-child( odd ){background-color:#EDEDED}#historyAuditTable td,#historyAuditTable th{padding-top:5px;padding-bottom:5px;padding-left:10px}#historyAuditTable td{border:1px solid #d3d3d3}#historyAuditTable th{background-color:#DFEFFC;border:1px solid #C5DBEC}#historyTabs-chart{padding-bottom:0;padding-left:0}#historyTabs-audit{height:260px;overflow:auto;padding-top:0;margin-top:20px}#historyTabs table thead th .text{position:absolute}.entryfileresource-input{display:none}.upload-field{height:28px;width:200px;border:1px solid #aaa;display:table-cell;overflow:hidden;position:relative}.upload-field-disabled{color:#aaa!important;background-color:#f3f3f3!important;border-color:#dadada!important}.upload-field-disabled a{pointer-events:none;cursor:default;opacity:.6}.upload-progress{z-index:2}.upload-progress-bar{height:100%;width:0;background-color:#ff0;position:absolute;-webkit-transition:width .5s;-moz-transition:width .5s;-o-transition:width .5s;-ms-transition:width .5s;transition:width .5s;z-index:3}.upload-progress-bar-complete{width:0;transition:width 0}.upload-progress-info{font-weight:700;left:45%;top:15%;height:100%;width:100%;position:absolute;z-index:4}.upload-fileinfo{padding:5px;position:absolute;max-width:95%;z-index:2;white-space:nowrap;left:0;right:0;margin:auto}.upload-fileinfo-size{float:right;text-align:right;padding-left:3px;overflow:hidden;text-overflow:ellipsis}.upload-fileinfo-name{overflow:hidden;text-overflow:ellipsis;float:none;width:auto}.upload-button-group{display:table-cell}.upload-button{margin:1px 2px 2px 4px;height:100%}.ui-icon[class*=\" fa-\"]{background:none repeat scroll 0 0 transparent;text-indent:0;margin-top:-.5em}.ui-button-icon-only .ui-icon[class*=\" fa-\"]{margin-left:-7px}.ui-icon.icon-large{margin-top:-.75em}#fileDeleteConfirmationDialog{display:none;font-weight:700;vertical-align:middle}#fileDeleteConfirmationDialog .fa{margin-right:5px}.confirm-dialog-content{display:inline-block;position:absolute;top:16px}.loginPage{background-color:#25507C}#loginField{width:342px}#loginArea{padding:30px;margin:0 5px 5px;border:1px solid #9E9E9E;border-radius:5px;background-color:#274E77;box-shadow:rgba(0,0,0,0.3) 0 1px 3px}.ea-table th,td{font-size:12px;line-height:1.2em}.ea-comment{width:588px;height:80px}.ea-disagg-th{background-color:#E6EFF5}.ea-sep-th{min-width:15px;width:15px}.alt-rec{background-color:#F1F1F1}.sub-unit{height:26px;width:130px}</style>\n</head>\n<body class=\"x-body x-webkit x-chrome x-reset\" id=\"ext-gen1009\">\n  <div id=\"header\">\n\t<img id=\"headerBanner\" style=\"cursor:pointer\" title=\"View home page\" src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABUAAAAZCAYAAADe1WXtAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH4AQIBhggV1z7LgAABh9JREFUSMeVlXuMVGcZxn/fOWdmztwvy+wMu1y23XJbFqFooBUpSGKENKVgpTRaqLZQCxSINdUKSlvQ2JS0qLHENpXWGGwju1l2t2BjGgXZFVhmN7vlIiDKtot7gb3N7cycmXPm8w9Y6MUm+vzzve/7fe+TL+/zJC98Ag/cv+Jj+YmVX61NzJzwXqI6bJ6ae0fd8W+sjIzdSSmJhSN8JubMrEVKeavQ1qO8t3NHVaIqeLQjrsqOCk12lCFP3XnbW82vvRp57Fvfdo493fnc8x/jUgA2b9hI59kzCCFY9KV71Df3vTG1udCzyXmt76ASDC30L11BaM0G9FlzUPquPBSMx99ZumzZxqaDTbd7XLq247ln2ff667dYn1j/+M34yQ0bAk1NTd9pO9nW3d3bK89uXS8v//TH0rQsWZJSZoaH5Pv3zJH9hw7Kzs5O2drS+u/mpubHt2zaGAJ4c98bAKiJjnYAtmx6MvzAqgd3xsfHd/m8vlBuaJCR06dJh+J84Axzrvsa3Rkb26OTT6cZ0Jy4dZff7/ffN72mJuh26m3bd/zI+MWenyMAZlRXa3t+9cpLFZUVWwpmHpfuIZOD/vMfcDVnkda99GYsNAdMc4wS1ixi1VMomDnsYpGKykr6B/p/vWTJkqeAnCqlJBAMPThjZs3uocFr6B4fRsnHYFYh6/JiKTZekoS1PDGXiculYTscpJIpnC6dUChIanSUcCRSs3z58pH9+/efFFUTJ7r/UF9/3uNxT8pmcuTVMP3DRcj3UypmkCUbFQsQSAnyE67x+YNEx4XBKuIL+E/UH6h7RH3xxd0ra2tnrevr60UPltN6dggXaVy6G8XOYuHmquHBIQqoivyUFQvFIqpDpyzswzTNaDQeu6xMmjz568lkElXTudBnYBgp7IJBytQYkXHyBYuglkZTSv/V37JUIpNOIVERQnF53Z4vK4FAYJ7f78PtD9I9MMS0UAq3yGIbA4ymsnQnPRSlgipAVUAIrqt7A0JAPl/gUn8Kv8+Lw+GYq3m8nvjw0BDuYASnMBFcn5tPzRH05hgUEk0IHKrg8MUckwIqfpdCyK2ga4K+tE0BuM1rkstlURRRrggEpmlSsm2yWQNFufWPkgSfS3B+0GIkX+LuiU4cKmx/d4TthwcZzpV455zB4QsFQMHj9mBZllCMnHHNHwhgFoqgeRnN2bfmBficgtFMkeGsTbEkOHTOoMznImsJWi6bnOnNYdklogGdQqGIbZcGlXQqlfC43ThUgaXq7G1NM2TYqMp1YtOSfGWaB9OG351K8rdug5RhkjKKHPlXnhKCqnE+YgEHyXQaRRGdypWeK3VSCFRsFs0ox8TJXy8ZqOIjckhJRUDDkgKnpuB0qrgcKhKBR3cxvzqEpiqoqmblc+YRpbGh4bCRNXqdTicRZ5FVX5zEhynJtYx1Q3HBhyNFftOWprPXRCAQgKYKbFuyeEYZC6p9DI6kiEajp48ePXJYvfCPi/mFCxYMxcePX5FNJZlSEcTh1BkYThPzK7g0hX8OFjkzUKQkJRKFfLGEQ1NYNa+S9YsnIc0sbo8nf6WnZ++j6x5rUAGCfv+lyVVVkWh57AtWPktV1Es4HCJrmPQYgubzeXy6xlXLiaq7mT3ew9al1SyqdpMd7iNeOYHh0dH6Z57+/vbe/r6iCtDZ1VX8XO2shM/vD4UjkbkOFaLxMgLv1hN8dTe+ivFMdBSYd/wAa/Qe7n3kXvz2MEGfm2gsTm9fX2NDXf0TB5sbk+lMFna/8MJNPZ7f8Wy4/kDd0x2dXeaVixfk+TX3yzYV2X+oUfYnErJ9ekx2VLjkpb+fk11dXfLsmbOlt996e8e2H27zjHHEy8ZdD/a89PJN4oXz7xI/+/2BKX/83ub9iVmVdtf8qXKw/ZTMlKR8/+7psiOIPPna3mRjY9MrWzZsrD6RaFc+uuc+hfJwhJaWVgAStRPXdkzQ5bHZk//025/sWvfLhubVLXfV/KUjJuSpz9+xa6zn4dUP8T+j5dGHJySmlv+5vaZi880Fu3D22vaq4MCxH2yN8f/i9I3z+De/tuz46vvuHKsf2/bU7SeXLV47Ahx75ruf2f8f5t+m6DwZp+AAAAAASUVORK5CYII='/>\n    <span id=\"headerText\" onclick=\"window.location.href='../dhis-web-dashboard-integration/index.action'\" style=\"cursor:pointer\" title=\"View home page\">MERTIDE: Offline PEPFAR MER Data Entry Screen Shots<br><font size=\"2\">For reference ONLY, data entry MUST be done in DATIM</font></span>\n    <div id=\"dhisDropDownMenu\">\n      <ul id=\"menuLinkArea\">\n        <li id=\"profileButton\">\n          <a class=\"menu-link drop-down-menu-link\" id=\"profileLink\"><i class=\"fa fa-user\"></i>Profile</a>\n        </li>\n        <li id=\"applicationsButton\">\n          <a class=\"menu-link drop-down-menu-link\" id=\"applicationsLink\"><i class=\"fa fa-th\"></i>Apps</a>\n        </li>\n      </ul>\n    </div><span id=\"showLeftBar\"><a href=\"javascript:dhis2.leftBar.showAnimated()\" title=\"Show menu\"><i class=\"fa fa-arrow-right leftBarIcon\"></i></a></span>\n  </div>\n  <div id=\"leftBar\">\n    <div id=\"hideLeftBar\">\n      <a href=\"index.action\" id=\"showMainMenuLink\" title=\"Show main menu\"><i class=\"fa fa-home leftBarIcon\"></i></a> <a href=\"javascript:dhis2.leftBar.hideAnimated()\" id=\"hideMainMenuLink\" title=\n      \"Hide menu\"><i class=\"fa fa-arrow-left leftBarIcon\"></i></a> <a href=\"javascript:dhis2.leftBar.extendAnimated()\" id=\"extendMainMenuLink\" title=\"Extend menu\"><i class=\n      \"fa fa-arrow-right leftBarIcon\"></i></a>\n    </div>\n    <div id=\"leftBarContents\">\n      <script type=\"text/javascript\">selection.setListenerFunction(organisationUnitSelected);</script>\n      <style type=\"text/css\">#leftBarContents div#orgUnitTree{height : 430px;}</style><br>\n      <script type=\"text/javascript\">jQuery(document).ready(function(){\njQuery(\"#searchIcon\").click(function(){\njQuery(\"#searchSpan\").toggle();\njQuery(\"#searchField\").focus();\n});\njQuery(\"#searchField\").autocomplete({\nsource: \"../dhis-web-commons/ouwt/getOrganisationUnitsByName.action\",\nselect: function(event,ui) {\njQuery(\"#searchField\").val(ui.item.value);\nselection.findByName();\n}\n});\n});\nvar i18n_find = 'Find';</script>\n\n\n\n      <img id=\"searchIcon\" src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAAsTAAALEwEAmpwYAAAKT2lDQ1BQaG90b3Nob3AgSUNDIHByb2ZpbGUAAHjanVNnVFPpFj333vRCS4iAlEtvUhUIIFJCi4AUkSYqIQkQSoghodkVUcERRUUEG8igiAOOjoCMFVEsDIoK2AfkIaKOg6OIisr74Xuja9a89+bN/rXXPues852zzwfACAyWSDNRNYAMqUIeEeCDx8TG4eQuQIEKJHAAEAizZCFz/SMBAPh+PDwrIsAHvgABeNMLCADATZvAMByH/w/qQplcAYCEAcB0kThLCIAUAEB6jkKmAEBGAYCdmCZTAKAEAGDLY2LjAFAtAGAnf+bTAICd+Jl7AQBblCEVAaCRACATZYhEAGg7AKzPVopFAFgwABRmS8Q5ANgtADBJV2ZIALC3AMDOEAuyAAgMADBRiIUpAAR7AGDIIyN4AISZABRG8lc88SuuEOcqAAB4mbI8uSQ5RYFbCC1xB1dXLh4ozkkXKxQ2YQJhmkAuwnmZGTKBNA/g88wAAKCRFRHgg/P9eM4Ors7ONo62Dl8t6r8G/yJiYuP+5c+rcEAAAOF0ftH+LC+zGoA7BoBt/qIl7gRoXgugdfeLZrIPQLUAoOnaV/Nw+H48PEWhkLnZ2eXk5NhKxEJbYcpXff5nwl/AV/1s+X48/Pf14L7iJIEyXYFHBPjgwsz0TKUcz5IJhGLc5o9H/LcL//wd0yLESWK5WCoU41EScY5EmozzMqUiiUKSKcUl0v9k4t8s+wM+3zUAsGo+AXuRLahdYwP2SycQWHTA4vcAAPK7b8HUKAgDgGiD4c93/+8//UegJQCAZkmScQAAXkQkLlTKsz/HCAAARKCBKrBBG/TBGCzABhzBBdzBC/xgNoRCJMTCQhBCCmSAHHJgKayCQiiGzbAdKmAv1EAdNMBRaIaTcA4uwlW4Dj1wD/phCJ7BKLyBCQRByAgTYSHaiAFiilgjjggXmYX4IcFIBBKLJCDJiBRRIkuRNUgxUopUIFVIHfI9cgI5h1xGupE7yAAygvyGvEcxlIGyUT3UDLVDuag3GoRGogvQZHQxmo8WoJvQcrQaPYw2oefQq2gP2o8+Q8cwwOgYBzPEbDAuxsNCsTgsCZNjy7EirAyrxhqwVqwDu4n1Y8+xdwQSgUXACTYEd0IgYR5BSFhMWE7YSKggHCQ0EdoJNwkDhFHCJyKTqEu0JroR+cQYYjIxh1hILCPWEo8TLxB7iEPENyQSiUMyJ7mQAkmxpFTSEtJG0m5SI+ksqZs0SBojk8naZGuyBzmULCAryIXkneTD5DPkG+Qh8lsKnWJAcaT4U+IoUspqShnlEOU05QZlmDJBVaOaUt2ooVQRNY9aQq2htlKvUYeoEzR1mjnNgxZJS6WtopXTGmgXaPdpr+h0uhHdlR5Ol9BX0svpR+iX6AP0dwwNhhWDx4hnKBmbGAcYZxl3GK+YTKYZ04sZx1QwNzHrmOeZD5lvVVgqtip8FZHKCpVKlSaVGyovVKmqpqreqgtV81XLVI+pXlN9rkZVM1PjqQnUlqtVqp1Q61MbU2epO6iHqmeob1Q/pH5Z/YkGWcNMw09DpFGgsV/jvMYgC2MZs3gsIWsNq4Z1gTXEJrHN2Xx2KruY/R27iz2qqaE5QzNKM1ezUvOUZj8H45hx+Jx0TgnnKKeX836K3hTvKeIpG6Y0TLkxZVxrqpaXllirSKtRq0frvTau7aedpr1Fu1n7gQ5Bx0onXCdHZ4/OBZ3nU9lT3acKpxZNPTr1ri6qa6UbobtEd79up+6Ynr5egJ5Mb6feeb3n+hx9L/1U/W36p/VHDFgGswwkBtsMzhg8xTVxbzwdL8fb8VFDXcNAQ6VhlWGX4YSRudE8o9VGjUYPjGnGXOMk423GbcajJgYmISZLTepN7ppSTbmmKaY7TDtMx83MzaLN1pk1mz0x1zLnm+eb15vft2BaeFostqi2uGVJsuRaplnutrxuhVo5WaVYVVpds0atna0l1rutu6cRp7lOk06rntZnw7Dxtsm2qbcZsOXYBtuutm22fWFnYhdnt8Wuw+6TvZN9un2N/T0HDYfZDqsdWh1+c7RyFDpWOt6azpzuP33F9JbpL2dYzxDP2DPjthPLKcRpnVOb00dnF2e5c4PziIuJS4LLLpc+Lpsbxt3IveRKdPVxXeF60vWdm7Obwu2o26/uNu5p7ofcn8w0nymeWTNz0MPIQ+BR5dE/C5+VMGvfrH5PQ0+BZ7XnIy9jL5FXrdewt6V3qvdh7xc+9j5yn+M+4zw33jLeWV/MN8C3yLfLT8Nvnl+F30N/I/9k/3r/0QCngCUBZwOJgUGBWwL7+Hp8Ib+OPzrbZfay2e1BjKC5QRVBj4KtguXBrSFoyOyQrSH355jOkc5pDoVQfujW0Adh5mGLw34MJ4WHhVeGP45wiFga0TGXNXfR3ENz30T6RJZE3ptnMU85ry1KNSo+qi5qPNo3ujS6P8YuZlnM1VidWElsSxw5LiquNm5svt/87fOH4p3iC+N7F5gvyF1weaHOwvSFpxapLhIsOpZATIhOOJTwQRAqqBaMJfITdyWOCnnCHcJnIi/RNtGI2ENcKh5O8kgqTXqS7JG8NXkkxTOlLOW5hCepkLxMDUzdmzqeFpp2IG0yPTq9MYOSkZBxQqohTZO2Z+pn5mZ2y6xlhbL+xW6Lty8elQfJa7OQrAVZLQq2QqboVFoo1yoHsmdlV2a/zYnKOZarnivN7cyzytuQN5zvn//tEsIS4ZK2pYZLVy0dWOa9rGo5sjxxedsK4xUFK4ZWBqw8uIq2Km3VT6vtV5eufr0mek1rgV7ByoLBtQFr6wtVCuWFfevc1+1dT1gvWd+1YfqGnRs+FYmKrhTbF5cVf9go3HjlG4dvyr+Z3JS0qavEuWTPZtJm6ebeLZ5bDpaql+aXDm4N2dq0Dd9WtO319kXbL5fNKNu7g7ZDuaO/PLi8ZafJzs07P1SkVPRU+lQ27tLdtWHX+G7R7ht7vPY07NXbW7z3/T7JvttVAVVN1WbVZftJ+7P3P66Jqun4lvttXa1ObXHtxwPSA/0HIw6217nU1R3SPVRSj9Yr60cOxx++/p3vdy0NNg1VjZzG4iNwRHnk6fcJ3/ceDTradox7rOEH0x92HWcdL2pCmvKaRptTmvtbYlu6T8w+0dbq3nr8R9sfD5w0PFl5SvNUyWna6YLTk2fyz4ydlZ19fi753GDborZ752PO32oPb++6EHTh0kX/i+c7vDvOXPK4dPKy2+UTV7hXmq86X23qdOo8/pPTT8e7nLuarrlca7nuer21e2b36RueN87d9L158Rb/1tWeOT3dvfN6b/fF9/XfFt1+cif9zsu72Xcn7q28T7xf9EDtQdlD3YfVP1v+3Njv3H9qwHeg89HcR/cGhYPP/pH1jw9DBY+Zj8uGDYbrnjg+OTniP3L96fynQ89kzyaeF/6i/suuFxYvfvjV69fO0ZjRoZfyl5O/bXyl/erA6xmv28bCxh6+yXgzMV70VvvtwXfcdx3vo98PT+R8IH8o/2j5sfVT0Kf7kxmTk/8EA5jz/GMzLdsAAAAgY0hSTQAAeiUAAICDAAD5/wAAgOkAAHUwAADqYAAAOpgAABdvkl/FRgAAAjVJREFUeNqkk01IVFEUx3/3vucbZ6zRxvkgmUoiZ2PWxkVEiz5WErSxNkW4LNq1002bFkUGLYqIWrVpEUWQIZUEbYpaiAm2mUwyND9yHNFHvJm5754WjjOBEUIHLlzO+Z8f//txlIjwP6HOPI0DnAauAfu22DcJDABPNgCFy4fuJnLJg1vqzi+Nc+vDpWWg1a3mEqt6iNfz1xHsvy2jSXidAAmADQBrZg4jIQBt0SN0NV8k6iT5WfrEaPEGQbhcVYasmbkaUG9sQisYKyS9bk6k7zO7OMnbz/fwKm0cTz3AioupakIrmwFGBCNCLnaeiZlXDH/pJx885uHHPiIkSXndNY354+XcOsBirCVCmh/l9yR2r5caWyoU/O+4lQzGrt+P0Xazg5IVAmuZXh6jc2cPQhOBtSSiXWR3HGCqOEZgLYG1lOxfHKwZg28ML2Zu0pE6Sl/7G1bNLEmvA79UZEUvUTIGAIvZ9JEkl9vLamUBG4L/1ePwnl5S27Pk50c52XmB1uYMtyd78U2BeEOGfH4KQNUA6fYsK5UFAMRCULTYMrgxRVj0uHrsGeO/XjK8cIeWhgyL32YAVO0IjnZwlEYQcKAp6dRsStzQP9JDpFnTlHZwdL3mPj9bck49ivj7Y9ltjS27cFQEXefWow2sGEIpEZSFOab9oXNlx/U8Lx4UGByZeHcFcLY4TGFQYNDzvLiKxWJRrbWnlGpQSjkiopVSGlDVBSCyPvdWKWWBUEQqxpjy7wEA4uT9qfoAMmMAAAAASUVORK5CYII=' style=\"cursor: pointer\" title=\"Locate organisation unit by name\"> <span id=\"searchSpan\" style=\n      \"width:100%;display:none;\"><span aria-live=\"polite\" class=\"ui-helper-hidden-accessible\" role=\"status\"></span><input autocomplete=\"off\" class=\"ui-autocomplete-input\" id=\"searchField\" name=\"key\"\n      style=\"width:155px\" type=\"text\"> <input onclick=\"selection.findByName()\" type=\"button\" value=\"Find\"></span>\n      <div id=\"orgUnitTreeContainer\">\n      <div id=\"orgUnitTree\" style=\"cursor: auto;\">\n        <ul>\n          <li id=\"orgUnitybg3MO3hcf4\">\n            <span class=\"toggle\"><img alt=\"[-]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoxNTVEOTI0OThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDoxNTVEOTI0QThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjE1NUQ5MjQ3OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjE1NUQ5MjQ4OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhGMj6ALxuteC0BYO2WW8aEfFAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"ybg3MO3hcf4\"%20)' style=\n            \"cursor: auto;\">   <a class=\"selected\" href=\n                                            'javascript:void%20selection.select(%20\"IHuZkWbFwNK\"%20)' style=\"cursor: auto;\">Global</a></a>\n            <ul style=\"display: block;\">\n              <li id=\"orgUnitKSkooYTy8FB\">\n                <span class=\"toggle\"><img alt=\"[-]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoxNTVEOTI0OThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDoxNTVEOTI0QThFRkYxMUU2OUQ0REQ1OTMyQkJENjA1QiI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjE1NUQ5MjQ3OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjE1NUQ5MjQ4OEVGRjExRTY5RDRERDU5MzJCQkQ2MDVCIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhGMj6ALxuteC0BYO2WW8aEfFAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"KSkooYTy8FB\"%20)' style=\n                \"cursor: auto;\">Africa</a>\n                <ul>\n                <ul style=\"display: block;\">\n                  <li id=\"orgUnitXOivy2uDpMF\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"l1KFEXKI4Dg\"%20)' style=\n                    \"cursor: auto;\">Angola</a>\n\n                  </li>\n                </li>\n                    </ul>\n                  </li>\n                  <li id=\"orgUnitl1KFEXKI4Dg\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"l1KFEXKI4Dg\"%20)' style=\n                    \"cursor: auto;\">Botswana</a>\n                  </li>\n                  <li id=\"orgUnitQh4XMQJhbk8\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"Qh4XMQJhbk8\"%20)' style=\n                    \"cursor: auto;\">Burundi</a>\n                  </li>\n                  <li id=\"orgUnitbQQJe0cC1eD\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"bQQJe0cC1eD\"%20)' style=\n                    \"cursor: auto;\">Cameroon</a>\n                  </li>\n                  <li id=\"orgUnitds0ADyc9UCU\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"ds0ADyc9UCU\"%20)' style=\n                    \"cursor: auto;\">Cote d'Ivoire</a>\n                  </li>\n                  <li id=\"orgUnitANN4YCOufcP\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"ANN4YCOufcP\"%20)' style=\n                    \"cursor: auto;\">Democratic Republic of the Congo</a>\n                  </li>\n                  <li id=\"orgUnitIH1kchw86uA\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"IH1kchw86uA\"%20)' style=\n                    \"cursor: auto;\">Ethiopia</a>\n                  </li>\n                  <li id=\"orgUnity3zhsvdXlhN\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"y3zhsvdXlhN\"%20)' style=\n                    \"cursor: auto;\">Ghana</a>\n                  </li>\n                  <li id=\"orgUnitHfVjCurKxh2\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"HfVjCurKxh2\"%20)' style=\n                    \"cursor: auto;\">Kenya</a>\n                  </li>\n                  <li id=\"orgUnitqllxzIjjurr\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"qllxzIjjurr\"%20)' style=\n                    \"cursor: auto;\">Lesotho</a>\n                  </li>\n                  <li id=\"orgUnitlZsCb6y0KDX\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"lZsCb6y0KDX\"%20)' style=\n                    \"cursor: auto;\">Malawi</a>\n                  </li>\n                  <li id=\"orgUnith11OyvlPxpJ\">\n                    <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"h11OyvlPxpJ\"%20)' style=\n                    \"cursor: auto;\">Mozambique</a>\n                  </li>\n                </ul>\n              </li>\n              <li id=\"orgUnitqM7yIwbxM76\">\n                <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"qM7yIwbxM76\"%20)' style=\n                \"cursor: auto;\">Americas</a>\n              </li>\n              <li id=\"orgUnitNTRKjfU2iaF\">\n                <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"NTRKjfU2iaF\"%20)' style=\n                \"cursor: auto;\">Asia</a>\n              </li>\n              <li id=\"orgUnitZ6HA94OLdeg\">\n                <span class=\"toggle\"><img alt=\"[+]\" src='data:image/gif;base64,R0lGODlhCQAJAJEAAP///4CAgAAAAAAAACH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzIgNzkuMTU5Mjg0LCAyMDE2LzA0LzE5LTEzOjEzOjQwICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgMjAxNS41IChXaW5kb3dzKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDowQzA5OTJDODhFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDowQzA5OTJDOThFRkYxMUU2QTQ3REY2NTdFREZBMkU5NCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjBDMDk5MkM2OEVGRjExRTZBNDdERjY1N0VERkEyRTk0IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjBDMDk5MkM3OEVGRjExRTZBNDdERjY1N0VERkEyRTk0Ii8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/OzczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aVlJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1cW1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQjIiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAAkACQAAAhSMj6ALtrKcgsqJe1t4cc/OdAhSAAA7'>&nbsp;</span><a href='javascript:void%20selection.select(%20\"Z6HA94OLdeg\"%20)' style=\n                \"cursor: auto;\">Europe</a>\n              </li>\n            </ul>\n          </li>\n        </ul>\n      </div></div>\n    </div>\n  </div>\n  <div class=\"bold\" id=\"headerMessage\" style=\"display: none;\">\n    You are online\n  </div>\n  <div class=\"page\" id=\"mainPage\">\n    <!-- Do not set style attr -->\n    <script type=\"text/javascript\">var i18n_select_data_set = 'Select data set';\nvar i18n_select_period = 'Select period';\nvar i18n_select_option = 'Select option';\nvar i18n_register_complete_dataset_success = 'Registered complete data set';\nvar i18n_register_complete_dataset_failed = 'Register complete data set failed';\nvar i18n_undo_register_complete_dataset_success = 'Undo register complete data set success';\nvar i18n_value_of_data_element_less = 'The value of the following data element is less than the specified minimum value.';\nvar i18n_value_of_data_element_greater = 'The value of the following data element is greater than the specified maximum value.';\nvar i18n_value_too_long = 'Value is too long';\nvar i18n_value_must_integer = 'Value must be an integer';\nvar i18n_value_must_number = 'Value must be a number';\nvar i18n_value_must_positive_integer = 'Value must be a positive integer';\nvar i18n_value_must_zero_or_positive_integer = 'Value must be zero or a positive integer';\nvar i18n_value_must_coordinate = 'Value must be a coordinate (longitude, latitude)';\nvar i18n_value_must_negative_integer = 'Value must be a negative integer';\nvar i18n_value_must_unit_interval = 'Value must be a unit interval (between 0 and 1)';\nvar i18n_value_must_percentage = 'Value must be a percentage (between 0 and 100)';\nvar i18n_field_unallowed_save_zero = 'This element does not permit 0 values. The original value will not be affected.';\nvar i18n_saving_value_failed_status_code = 'Saving value failed with status code';\nvar i18n_saving_value_failed_dataset_is_locked = 'Data set is locked, please contact admin';\nvar i18n_saving_comment_failed_status_code = 'Saving comment failed with status code';\nvar i18n_saving_minmax_failed_error_code = 'Saving min\\/max values failed with error code';\nvar i18n_confirm_complete = 'Are you sure this data set is complete?';\nvar i18n_confirm_undo = 'Are you sure you will undo the registration?';\nvar i18n_no_response_from_server = 'No response from server, please check connectivity and try again';\nvar i18n_enter_digits = 'Enter digit only.';\nvar i18n_max_must_be_greater_than_min = 'Max must be greater than min';\nvar i18n_mark_value_for_followup = 'Mark value for follow-up';\nvar i18n_unmark_value_for_followup = 'Un-mark value for follow-up';\nvar i18n_operation_not_available_offline = 'This operation is not available in off-line mode';\nvar i18n_online_notification = 'You are online';\nvar i18n_offline_notification = 'You are offline, data will be stored locally';\nvar i18n_need_to_sync_notification = 'There is data stored locally, please upload to server';\nvar i18n_sync_now = 'Upload';\nvar i18n_discard = 'Discard';\nvar i18n_remove_local_data = 'Are you sure you want to remove the locally stored data?';\nvar i18n_sync_success = 'Upload to server was successful';\nvar i18n_sync_failed = 'Upload to server failed, please try again later';\nvar i18n_uploading_data_notification = 'Uploading locally stored data to the server';\nvar i18n_ajax_login_failed = 'Login failed, check your username and password and try again';\nvar i18n_no_dataelement_selected = 'No Data Element Selected';\nvar i18n_dataset_is_locked = 'Data set is locked';\nvar i18n_register_complete_failed_dataset_is_locked = 'Data set is locked, registration failed, please contact admin';\nvar i18n_unregister_complete_failed_dataset_is_locked = 'Data set is locked, un-registration failed, please contact admin';\nvar i18n_show_all_sections = 'Show all sections';\nvar i18n_show_all_items = 'Show all items';\nvar i18n_all_values_for_data_element_must_be_filled = 'This form requires that all fields for a data element must be filled, please correct this before continuing.';\nvar i18n_validation_result = 'Validation Result';\nvar i18n_successful_validation = 'The data entry screen successfully passed validation';\nvar i18n_no_organisationunit_selected = 'No Organisation Unit Selected';\nvar i18n_childrens_forms = 'Sub Organisation Units';\nvar i18n_no_periods_click_prev_year_button = 'No periods, click \\\"Prev year\\\" button';\nvar i18n_view_comment = 'View comment';\nvar i18n_no_orgunits = 'No organisation unit attached to current user, no data entry possible';\nvar i18n_confirm_deletion = 'Confirm deletion';\nvar i18n_file_upload_failed = 'File upload failed';\nvar i18n_loading_file_info_failed = 'Loading file info failed';</script>\n    <style media=\"print\" type=\"text/css\">#moduleHeader,#currentSelection,#actions,#selectionBox,#completenessDiv,.ui-helper-hidden-accessible{display: none;}</style>\n    <h3 id=\"moduleHeader\">Data Entry <a href=\"javascript:getHelpContent('dataEntry')\" title=\"Help\"><i class=\"fa fa-question-circle\"></i></a></h3>\n\t<div id=\"currentSelection\">\n        <span id=\"closeCurrentSelection\"><img src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAAXNSR0IArs4c6QAAAAZiS0dEAP8A/wD/oL2nkwAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB9wHDRUHIfCnlTsAAAF/SURBVCjPbZAxaFMBEIb/S3TskEVpkilriZOCmVwe2C2EDA8Skq2LQ3G03RS6iVPGLiag2TOoZAoB39ahD4dMoS9vaMmQRUkM9985+JCH9IPjhv8/fu4XZPR6vUMAOhqN1gBQr9cRxzH6/b64e0VE1sPh8HcBADqdzkszuzGzq263ewQAcRwDAFT1zMxWJN8DgIRheAjgBsDDLCwVkafj8fguDMNzAO8AFDPtwwOSCuAOQBWAZ/u63W5/IvkaOUQkFQBotVpH7v41dyQ5n//1ymCz2Zz+E5rN5mOS1wAe4T9E5HIymZwAQLFUKmG322GxWPyq1WoVd3/u7sjPdrt9sVwu98hHB0FwLiIXuJ8UwPF0Ov0hQRAIybNcG/f+kLX3rLDf7yskL0gWSYKkmNmlqh6QTEkKSSdZVdWPBTNbkxyoKlQVJAez2exkPp//NLNjkqmqCslbM3tbTJKEq9XqS7lcPnD3b41G400URQCAJEnW1Wr1s5k9MbNXURR9/wMXpub96TSLHgAAAABJRU5ErkJggg==' title=\"Close\" onclick=\"closeCurrentSelection()\"></span>\n        <span id=\"currentDataElement\">No Data Element Selected</span>\n    </div>\n    <div id=\"actions\">\n      <input disabled=\"disabled\" id=\"validationButton\" onclick=\"dhis2.de.validate( false )\" style=\"width:120px; margin-bottom: 3px;\" type=\"button\" value=\"Run validation\"><br>\n      <input id=\"printButton\" onclick=\"window.print()\" style=\"width:120px; margin-bottom: 3px;\" type=\"button\" value=\"Print form\"><br>\n      <input onclick=\"printBlankForm()\" style=\"width:120px; margin-bottom: 3px;\" type=\"button\" value=\"Print blank form\"><br>\n    </div>\n    <div class=\"inputCriteria\" id=\"selectionBox\" style=\"width:564px\">\n        <div class=\"selectionBoxRow\">\n            <div class=\"selectionLabel\">\n                Organisation Unit\n            </div><input id=\"selectedOrganisationUnit\" readonly=\"readonly\"\n            style=\"width: 394px; padding: 3px;\" type=\"text\" value=\n            \"Global\">\n        </div>\n        <div class=\"selectionBoxRow\">\n            <div class=\"selectionLabel\">\n                Data Set\n            </div><select class=\"selectionBoxSelect\" id=\"selectedDataSetId\"\n            name=\"selectedDataSetId\" onchange=\"dataSetSelected()\">\n                <option value=\"-1\">\n                    [ Select data set ]\n                </option>\n                <option value=\"i29foJcLY9Y\" selected>\n                    MER Results: Facility Based\n                </option>\n            </select>\n        </div>\n        <div class=\"selectionBoxRow\">\n            <div class=\"selectionLabel\">\n                Period\n            </div><select id=\"selectedPeriodId\" name=\"selectedPeriodId\"\n            onchange=\"periodSelected()\" style=\"width:225px\">\n                <option value=\"\">\n                    [ Select period ]\n                </option>\n                <option value=\"2035Q4\">\n                    October - December 2035\n                </option>\n                <option value=\"2035Q3\" selected>\n                    July - September 2035\n                </option>\n                <option value=\"2035Q2\">\n                    April - June 2035\n                </option>\n                <option value=\"2035Q1\">\n                    January - March 2035\n                </option>\n                <option value=\"2036Oct\">\n                \tOctober 2036 - September 2037\n                </option>\n            </select> <input id=\"prevButton\" onclick=\n            \"previousPeriodsSelected()\" style=\"width:85px\" title=\n            \"Earlier periods\" type=\"button\" value=\"Prev year\"> <input id=\n            \"nextButton\" onclick=\"nextPeriodsSelected()\" style=\"width:85px\"\n            title=\"Later periods\" type=\"button\" value=\"Next year\">\n        </div>\n<!--attributeComboStart--> \n        <div id=\"attributeComboDiv\">\n            <div class=\"selectionBoxRow\">\n                <div class=\"selectionLabel\">\n                    Funding Mechanism\n                </div>&nbsp;<select class=\"selectionBoxSelect\" id=\n                \"category-SH885jaRe0o\" onchange=\n                \"dhis2.de.attributeSelected('SH885jaRe0o')\">\n                    <option value=\"-1\">\n                        [ Select option ]\n                    </option>\n                    <option value=\"gz8WBMTzN0t\" selected>\n                        12345 - Test Mechanism 1\n                    </option>\n                </select>\n            </div>\n        </div>\n<!--attributeComboEnd--> \n        <div class=\"selectionBoxRow\" id=\"filterDataSetSectionDiv\" style=\n        \"display:none\">\n            <div class=\"selectionLabel\">\n                Filter on section\n            </div><select class=\"selectionBoxSelect\" id=\"filterDataSetSection\"\n            name=\"filterDataSetSection\" onchange=\"dhis2.de.filterOnSection()\">\n                </select>\n        </div>\n    </div>\n    <div class=\"page\" id=\"contentDiv\">\n    <div class=\"cde cde-NORMAL\">\n","form":"<!-- Start Custom DHIS2 Form -->\n\n<style>\n.smaller_font{font-size:11px;}.PEPFAR_Form{font-family: Arial,Helvetica,sans-serif;width 100%;font-size: 13px;text-align: left;border:1px solid #cccccc;}.PEPFAR_Form_Container{clear:both;line-height: 140%;display:flex;border-bottom: 1px solid #cccccc;}.PEPFAR_Form_Priority_Container_Outer{width:100%;background:white;overflow:hidden;position:relative;border-bottom: 1px solid #cccccc;}.PEPFAR_Form_Priority_Container_Inner{width:100%;position:relative;right:82%;display: flex;background:gray;}.PEPFAR_Form_Priority{float:left;width:18%;position:relative;left:82%;overflow:hidden;min-height:26px;align-items: stretch;}.PEPFAR_Form_Priority_text{position: absolute;top:50%;left:50%;transform:translateX(-50%) translateY(-50%);color:white;font-size:16px;white-space: nowrap;}.PEPFAR_Form_Description{float:left;width:82%;position:relative;left:82%;overflow:hidden;text-align: left;padding: 4px 8px 4px 8px;color:black;font-weight:bold;}.PEPFAR_Form_Description_No_Priority{text-align: left;padding: 4px 8px 4px 8px;color:black;font-weight:bold;}.PEPFAR_reporting_legend{text-align:right;display:block;margin:10px;height:26px;}.PEPFAR_Form_Title{background-color: #1f497d;color: #ffffff;font-size:20px;padding: 4px 8px 4px 8px;cursor: pointer;border:none;}.PEPFAR_Form_Title_Quarterly{background-color: #64AB23;color: #ffffff;}.PEPFAR_Form_Title_Quarterly:hover{background-color:#7AD12B;text-decoration:none;}.PEPFAR_quarterly_square{font-size:26px;color:#64AB23;}.PEPFAR_Form_Title_Semiannually{background-color: #DF8500;color: #ffffff;}.PEPFAR_Form_Title_Semiannually:hover{background-color:#FF9800;text-decoration:none;}.PEPFAR_semiannually_square{font-size:26px;color:#DF8500;}.PEPFAR_Form_Title_Annually{background-color: #68468F;color: #ffffff;}.PEPFAR_Form_Title_Annually:hover{background-color:#8F60C4;text-decoration:none;}.PEPFAR_annually_square{font-size:26px;color:#68468F;}.PEPFAR_spinner{font-size:26px;width: 26px;line-height: 26px;height: 26px;}.PEPFAR_Form_Title::after{content: \"- Collapse\";left: 84%;position: absolute;color: white;}.PEPFAR_Form_Title.expanded{background-size: 18px;}.PEPFAR_Form_Title.expanded::after{content: \"+ Expand\";left: 84%;position: absolute;}.PEPFAR_Form_ShowHide{background-size: 18px;padding: 8px;cursor: pointer;}.PEPFAR_Form_ShowHide::after{content: \"- Collapse All\";left: 1%;position: absolute;color: #2e6e9e;font-size: 14px;font-weight: bold;}.PEPFAR_Form_ShowHide.expanded{background-size: 18px;}.PEPFAR_Form_ShowHide.expanded::after{content: \"+ Expand All\";left: 1%;position: absolute;}.PEPFAR_Form_Collapse{clear:both;line-height: 140%;display:block;border-bottom:1px solid #cccccc;}.PEPFAR_Form_Priority_conditional{color: #ffffff;background-color: #66a5f4;}.PEPFAR_Form_Priority_optional{color: #ffffff;background-color: #66a5f4;}.PEPFAR_Form_Priority_required{color: #ffffff;background-color: #66a5f4;}.PEPFAR_Form_Priority_required_description{color: #ffffff;background-color: #66a5f4;}.PEPFAR_Form_Priority_auto_calculate{color: #ffffff;background-color: #66a5f4;}.PEPFAR_Form_Priority_dreams_only{color: #ffffff;background-color: #66a5f4;}.PEPFAR_Form_Empty{display:inline;padding: 8px 2px 8px 2px;float:left;width:44px;text-align:center;}.PEPFAR_Form_Empty_half{width:22px;float:left;display:inline;padding: 8px 1px 8px 1px;text-align:center;}.PEPFAR_Form_Empty_double{width:88px;float:left;display:inline;padding: 8px 16px 8px 16px;text-align:center;}.PEPFAR_Form_EntryName,.PEPFAR_Form_EntryName_b{float:left;min-width:140px;max-width:140px;display:inline;padding: 8px;text-align:right;}.PEPFAR_Form_EntryName_Wide,.PEPFAR_Form_EntryName_Wide_b{float:left;min-width:220px;max-width:220px;display:inline;padding: 8px;text-align:right;}.PEPFAR_Form_EntryName_extraWide,.PEPFAR_Form_EntryName__extraWide_b{float:left;min-width:300px;max-width:300px;display:inline;padding: 8px;text-align:right;}.PEPFAR_Form_EntryName_Thin,.PEPFAR_Form_EntryName_Thin_b{float:left;min-width:70px;max-width:70px;display:inline;padding: 8px;text-align:right;}.PEPFAR_Form_EntryName_b,.PEPFAR_Form_EntryName_Wide_b,.PEPFAR_Form_EntryName_Thin_b{font-weight:bold;}.PEPFAR_Form_EntryField{display:inline;padding: 8px 2px 8px 2px;float:left;width:44px;text-align:center;}.PEPFAR_Form_OptionSet{display:inline;padding: 8px 8px 8px 8px;width: 132px;float:left;text-align:left;}.PEPFAR_Form_Narrative{display:inline;padding: 8px 4px 8px 4px;min-width: 580px;max-width: 840px;float:left;text-align:left;}.PEPFAR_Form_EntryField_wide{padding: 8px 8px 8px 8px;width: 66px;}.PEPFAR_Form_EntryField_150x_wide{padding: 8px 3px 8px 3px;width: 66px;}.PEPFAR_Form_EntryField_2x_wide{padding: 8px 4px 8px 4px;width: 88px;}.PEPFAR_Form_EntryField_3x_wide{padding: 8px 6px 8px 6px;width: 132px;}.PEPFAR_Form_EntryField_4x_wide{padding: 8px 8px 8px 8px;width: 176px;}.PEPFAR_Form_EntryField_6x_wide{padding: 8px 12px 8px 12px;width: 264px;}.PEPFAR_Form_EntryField_input{width: 40px;height: 22px;padding: 2px !important;text-align: center;}.PEPFAR_Form_EntryField_narrative{min-width: 580px;max-width: 840px;height: 90px;padding:2px !important;}.PEPFAR_Form_SubRange_Container{background-color: #D6E0F5;}.ui-widget{border: none;}.ui-widget.ui-widget-content{border: none;}.ui-corner-all,.ui-corner-bottom,.ui-corner-right,.ui-corner-br,.ui-corner-left{border-bottom-right-radius: 0px;border-bottom-left-radius: 0px;border-top-right-radius: 0px;border-top-left-radius: 0px;}.ui-widget-header{border: 1px solid #4297d7;background: #5c9ccc;margin-top: 2px;}.ui-state-default,.ui-widget-content .ui-state-default,.ui-widget-header .ui-state-default{border: 1px solid #c5dbec;background: #ffffff;}.ui-tabs-vertical{position: relative;}.ui-tabs-vertical .ui-tabs-nav li{list-style: none;float: left;position: relative;top: 0;margin: 0px 4px 0px 0px;border-bottom-width: 0;padding: 0;}.ui-tabs-vertical .ui-tabs-nav .ui-tabs-anchor{float: left;padding: 4px 8px 4px 8px;text-decoration: none;}.ui-tabs-vertical .ui-tabs-nav li.ui-tabs-active{padding-bottom: 1px;}.ui-tabs-vertical .ui-tabs-nav li.ui-tabs-active .ui-tabs-anchor,.ui-tabs-vertical .ui-tabs-nav li.ui-state-disabled .ui-tabs-anchor,.ui-tabs-vertical .ui-tabs-nav li.ui-tabs-loading .ui-tabs-anchor{cursor: text;}.ui-tabs-collapsible .ui-tabs-nav li.ui-tabs-active .ui-tabs-anchor{cursor: pointer;}.ui-tabs-vertical .ui-tabs-panel{display: block;border-width: 0;padding: 16px 20px;background: none;}.ui-tabs-vertical{width: 100%;}.ui-tabs-vertical .ui-tabs-nav{padding: 2px 2px 0px 2px;float: left;width: 13%;min-width: 155px;}.ui-tabs-vertical .ui-tabs-nav li{clear: left;width: 100%;border-bottom-width: 1px !important;border-right-width: 0 !important;margin: 0px -1px .2em 0;}.ui-tabs-vertical .ui-tabs-nav li a{display: block;}.ui-tabs-vertical .ui-tabs-nav li.ui-tabs-active{padding-bottom: 0;background: #e8f3fc;}.ui-tabs-vertical .ui-tabs-panel{padding: 1em !important;float: right;}.ui-tabs .ui-tabs-nav{padding: .2em .2em 0;width: 100%;max-width: 120em;}.ui-tabs .ui-tabs-nav li{clear: none;width: auto;list-style: none;float: left;position: relative;top: 0;margin: 1px .2em 0 0;border-bottom-width: 0;padding: 0;}.ui-tabs-vertical .ui-tabs-panel{padding: 0em !important;float: left;width: 78%;min-width: 860px;}.ui-tabs .ui-tabs-panel{padding: .2em !important;float: left;width: 98%;}.ui-tabs-anchor{width: 100%;}.ui-tabs-vertical .ui-tabs-nav .ui-tabs-anchor{box-sizing: border-box;}.ui-state-active a,.ui-state-active a:link,.ui-state-active a:visited{color:#900;}.input_total{padding: 5px 2px 2px 2px;height: 19px;width: 40px;display: inline-block;font-size: 12px;border: 1px solid #aaa;background: #ddd;}.PEPFAR_Form_EntryField > span.val{padding: 5px 2px 2px 2px;height: 19px;width: 40px;display: inline-block;font-size: 12px;border: 1px solid #333;background: #fff;}.word_subtotal{font-size:80%;}.ic_title_disabled{opacity: 0.4;}.muex_disabled,.ic_disabled{background-color: #888888;background: repeating-linear-gradient( 38deg,#999999,#999999 4px,#B0B0B0 4px,#B0B0B0 8px );}.muex_conflict,.ic_conflict{background: #f88 !important;background: repeating-linear-gradient( 38deg,#FF6666,#FF6666 4px,#FF3333 4px,#FF3333 8px );border:1px solid #f66 !important;}.cerulean{float:right;color:red}\n</style>\n\n<script>\nif (window.dhis2) {\n(function() {\ndhis2.util.on(dhis2.de.event.dataValuesLoaded, function(event, ds) {\nfunctionloader.dataValuesLoaded(ds);\n});\ndhis2.util.on(dhis2.de.event.formReady, function(event, ds) {\n//#formReady#\n});\n})();\ndhis2.util.on(dhis2.de.event.dataValueSaved, function(event, ds, dv) {\nstella.changed(dv);\nmeany.changed(dv);\n//#dataValueSaved#\n});\n}\nvar functionloader = {};\nfunctionloader.dataSetToRunFor = false;\nfunctionloader.lastSelectedForm = false;\nfunctionloader.setToLoading = function(loadingStatus) {\nif (loadingStatus) {\n$('#contentDiv').hide();\n$('#loaderDiv').children('p').text('Please wait while the PEPFAR data entry form is loading...');\n$('#loaderDiv').show();\n} else {\{uid2}(function() {\n$('#loaderDiv').hide();\n$('#PEPFAR_main').show();\n$('#contentDiv').show();\n}, 500);\n}\n}\nfunctionloader.dataValuesLoaded = function (ds) {\nfunctionloader.setToLoading(true);\nif (!functionloader.dataSetToRunFor) {\nconsole.log('PEPFAR: MER | Custom JS Loaded: v20201130 | Loading all javascript for ' + ds);\nfunctionloader.erase();\nfunctionloader.dataSetToRunFor = ds;\nfunctionloader.lastSelectedForm = functionloader.identifySelectedForm();\nqbert.load();\n$('.PEPFAR_Form_EntryField').find('.entryfield').addClass('PEPFAR_Form_EntryField_input');\n$('.PEPFAR_Form_OptionSet').find('.entryoptionset').addClass('PEPFAR_Form_EntryField_optionset');\n$('.PEPFAR_Form_Narrative').find('.entryarea').addClass('PEPFAR_Form_EntryField_narrative');\n//#dataValuesLoaded#\nfunctionloader.loadWithDelay();\n} else if (functionloader.dataSetToRunFor == ds && functionloader.lastSelectedForm && functionloader.lastSelectedForm == functionloader.identifySelectedForm()) {\nconsole.log('PEPFAR: MER | dataValuesLoaded with previous ' + ds + ' and the same form, doing nothing');\nfunctionloader.lastSelectedForm = functionloader.identifySelectedForm();\nfunctionloader.setToLoading(false);\n} else if (functionloader.dataSetToRunFor == ds) {\nconsole.log('PEPFAR: MER | dataValuesLoaded with previous ' + ds + ', reloading custom JS');\nfunctionloader.erase();\nfunctionloader.lastSelectedForm = functionloader.identifySelectedForm();\nqbert.load();\nfunctionloader.loadWithDelay();\n} else {\nconsole.log('PEPFAR: MER | ' + functionloader.dataSetToRunFor + ' does not match ' + ds + ', so custom JS should not run; clearing out saved variables');\nfunctionloader.lastSelectedForm == false;\nfunctionloader.erase();\nmeany.kill();\nstella.kill();\nfunctionloader.setToLoading(false);\n}\n}\nfunctionloader.registerRules = function (table) {\nstella.register(table);\nmeany.register(table);\n}\nfunctionloader.erase = function () {\nqbert.erase();\nmeany.erase();\nstella.erase();\ncerulean.erase();\n}\nfunctionloader.loadWithDelay = function () {\{uid2}(function() {\ncerulean.load();\nstella.load();\nmeany.load();\n$('.entryfield').each(function(index) {\nif ($(this).css('background-color') != 'rgb(255, 255, 255)' && !$(this).hasClass('disabled')) {\n$(this).css('background-color', 'rgb(255, 255, 255)');\n}\n});\nfunctionloader.setToLoading(false);\n}, 10);\n}\nfunctionloader.identifySelectedForm = function () {\nvar orgUnit = $('#orgUnitTree .selected').parent('li').attr('id');\nif (typeof(orgUnit) !== 'undefined') {\nreturn $('#orgUnitTree .selected').parent('li').attr('id') + ' ' +\nObject.values($('#selectedDataSetId,#selectedPeriodId,#category-SH885jaRe0o')\n.map(function() {\nreturn $(this).val();\n}).sort()\n).join(' ');\n} else {\nreturn false;\n}\n}\nfunctionloader.materializeTab = function (panel) {\nvar template = $(panel).children('template.PEPFAR_Tabs_lazy')[0];\nif (!template) {\nreturn;\n}\npanel.replaceChild(document.importNode(template.content, true), template);\n$(panel).find('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');\nfunctionloader.showAndHideTabs(panel);\nfunctionloader.setupEntryFields(panel);\n$(panel).find('.PEPFAR_Form_EntryField').find('.entryfield').addClass('PEPFAR_Form_EntryField_input');\n$(panel).find('.PEPFAR_Form_OptionSet').find('.entryoptionset').addClass('PEPFAR_Form_EntryField_optionset');\n$(panel).find('.PEPFAR_Form_Narrative').find('.entryarea').addClass('PEPFAR_Form_EntryField_narrative');\nif (functionloader.dataSetToRunFor && typeof(window.loadDataValues) === 'function') {\nfunctionloader.lastSelectedForm = false;\nwindow.loadDataValues();\n} else {\nfunctionloader.erase();\nqbert.load();\nfunctionloader.loadWithDelay();\n}\n}\nfunctionloader.setupEntryFields = function (root) {\n$('.PEPFAR_Form_EntryField', root).find(':input').attr('name', 'entryfield').addClass('entryfield');\n$('.PEPFAR_Form_OptionSet', root).find(':input').addClass('entryoptionset');\n$('.PEPFAR_Form_Narrative', root).find(':input').attr('name', 'entryfield').addClass('entryarea');\nif (typeof(window.saveVal) !== 'function') {\nreturn;\n}\n$('.entryfield, .entryarea', root).each(function () {\nvar id = $(this).attr('id');\nvar split = id.split('-');\nvar dataElementId = split[0];\nvar optionComboId = split[1];\n$(this).unbind('focus blur change dblclick keyup')\n.focus(window.valueFocus)\n.blur(window.valueBlur)\n.change(function () {\nsaveVal(dataElementId, optionComboId, id);\n})\n.dblclick(function () {\nviewHist(dataElementId, optionComboId);\n})\n.keyup(function (event) {\nkeyUp(event, dataElementId, optionComboId, id);\n});\n});\nif (window.dhis2 && dhis2.de && typeof(dhis2.de.insertOptionSets) === 'function') {\ndhis2.de.insertOptionSets();\n}\n}\nfunctionloader.showAndHideTabs = function(root) {\n$(function () {\n$('.PEPFAR_Form_Title', root).click(function (e) {\n$(this).toggleClass(\"expanded\")\n.next(\".PEPFAR_Form_Collapse\").slideToggle();\nvar divText = $(this).text();\nvar ls = window.localStorage.getItem('userCollapsed') || '{}';\nls = JSON.parse(ls);\nif ($(this).hasClass('expanded')) {\nls[divText] = true;\nvar expandedCount = 0;\n$(this).parent().siblings().find('.PEPFAR_Form_Title').each(function(el) {\nif (!$(this).hasClass('expanded')) {\nexpandedCount += 1;\nreturn false;\n}\n})\nif (expandedCount === 0) {\n$(this).parent().siblings('.PEPFAR_Form_ShowHide').addClass('expanded');\n}\n} else {\nls[divText] = false;\n$(this).parent().siblings('.PEPFAR_Form_ShowHide').removeClass('expanded');\n}\nwindow.localStorage.setItem('userCollapsed', JSON.stringify(ls));\n});\n$('.PEPFAR_Form_ShowHide', root).click(function (e) {\nvar ls = window.localStorage.getItem('userCollapsed') || '{}';\nls = JSON.parse(ls);\nvar currentlyExpandAll = $(this).hasClass('expanded');\n$(this).siblings().find('.PEPFAR_Form_Title').each(function (el) {\nvar divText = $(this).text();\nls[divText] = !currentlyExpandAll\nif ($(this).hasClass('expanded') && currentlyExpandAll) {\n$(this).removeClass('expanded')\n.next(\".PEPFAR_Form_Collapse\").slideDown();\n}\nif (!$(this).hasClass('expanded') && !currentlyExpandAll) {\n$(this).addClass('expanded')\n.next(\".PEPFAR_Form_Collapse\").slideUp();\n}\n})\n$(this).toggleClass(\"expanded\");\nwindow.localStorage.setItem('userCollapsed', JSON.stringify(ls));\n});\n});\n}\nif (!window.dhis2 || !window.jQuery) {\nvar dnj = document.createElement('script');\ndnj.type = 'text/javascript';\ndnj.async = false;\ndnj.src = '/api/apps/Data-Approval/formJs/jqueryAndDhis.js';\ndnj.onload = function () {\n$ = jQuery;\nfunctionloader.dataValuesLoaded('unknown dataset');\nfunctionloader.showAndHideTabs();\n};\n(document.getElementsByTagName('head')[0] || document.getElementsByTagName('body')[0]).appendChild(dnj);\n} else {\nfunctionloader.showAndHideTabs();\n}\n'use strict';\nvar cerulean = {};\ncerulean.erase = function () {\n$('.cerulean').remove();\n}\ncerulean.load = function () {\ncerulean.erase();\nvar buttonDiv = '<div class=\"cerulean\"><span><i class=\"fa fa-minus-square-o\" aria-hidden=\"true\"></i> Collapse</span><span><i class=\"fa fa-plus-square-o\" aria-hidden=\"true\"></i> Expand</span></div>';\nvar buttons = $(buttonDiv).appendTo('.PEPFAR_Form_Priority_conditional > .PEPFAR_Form_Description').click(function () {\ncerulean.toggle(this);\n});\nbuttons.each(function () {\ncerulean.toggle(this, cerulean.hasValues(this));\n});\nvar ls = window.localStorage.getItem('userCollapsed') || '{}';\nls = JSON.parse(ls);\n$('.PEPFAR_Form_ShowHide').each(function (e) {\n$(this).removeClass('expanded');\nvar expandedCount = 0;\n$(this).siblings().find('.PEPFAR_Form_Title').each(function (el) {\nlet divText = $(this).text();\nif (ls.hasOwnProperty(divText)) {\nif (ls[divText]) {\n$(this).addClass('expanded')\n.next('.PEPFAR_Form_Collapse').slideUp();\n} else {\n$(this).removeClass('expanded')\n.next('.PEPFAR_Form_Collapse').slideDown();\n}\n}\nif (!$(this).hasClass('expanded')) {\nexpandedCount += 1\n}\n})\nif (expandedCount === 0) {\n$(this).addClass('expanded');\n}\n})\n};\ncerulean.toggle = function (buttonDiv, visible) {\nvar sectionTitleDiv = $(buttonDiv).parent().parent().parent();\nif (visible === undefined) {\n$(sectionTitleDiv).siblings().toggle();\n$(buttonDiv).children().toggle();\n} else {\n$(sectionTitleDiv).siblings().toggle(visible);\n$(buttonDiv).children().first().toggle(visible);\n$(buttonDiv).children().last().toggle(!visible);\n}\n};\ncerulean.hasValues = function(selector) {\nvar fields = $(selector).parent().parent().parent().parent().find('[class*=Form_EntryField]');\nfor (var i = 0; i < fields.length; i++) {\nvar field = fields[i];\nvar input = $(field).find('input');\nif ($(field).attr('class').indexOf('tot') === -1) {\nvar val = $(input).val();\nif (typeof(val) === 'undefined') {\nval = $(field).find('.val').text();\nif (typeof(val) !== 'undefined' && val != '') {\nreturn true;\n}\n} else if (val != '') {\nreturn true;\n}\n}\n}\nreturn false;\n};\n'use strict';\nvar meany = {};\nmeany.sources = [];\nmeany.operands = [];\nmeany.rules = [];\nmeany.inputrules = {};\nmeany.elements = {};\nmeany.loaded = false;\nmeany.register = function (table) {\nvar operandOffset = meany.sources.length;\ntable.operands.forEach(function (operand) {\nmeany.sources.push([table.ssids[operand[0]], operand.length > 1 ? operand[1].map(function (c) { return table.cocs[c]; }) : null]);\n});\ntable.exclusive.forEach(function (rule) {\nmeany.rules.push([\nrule[0].map(function (o) { return o + operandOffset; }),\nrule[1].map(function (o) { return o + operandOffset; })\n]);\n});\n};\nmeany.index = function () {\nif (!stella.indexed) {\nstella.buildIndex();\n}\nmeany.operands = meany.sources.map(function (source) {\nvar ids = [];\n(stella.fieldindex[source[0]] || []).forEach(function (field) {\nif (field.id && ids.indexOf(field.id) === -1 && (!source[1] || stella.idHasCoc(field, source[1]))) {\nids.push(field.id);\n}\n});\nreturn ids;\n});\nmeany.inputrules = {};\nmeany.rules.forEach(function (rule, i) {\nmeany.indexRule(rule[0], i + 1);\nmeany.indexRule(rule[1], -1 * (i + 1));\n});\n};\nmeany.indexRule = function (side, n) {\nside.forEach(function (o) {\nmeany.operands[o].forEach(function (id) {\nif (!(id in meany.inputrules)) {\nmeany.inputrules[id] = [];\n}\nif (meany.inputrules[id].indexOf(n) === -1) {\nmeany.inputrules[id].push(n);\n}\n});\n});\n};\nmeany.kill = function () {\nmeany.sources = [];\nmeany.operands = [];\nmeany.rules = [];\nmeany.inputrules = {};\nmeany.elements = {};\nmeany.loaded = false;\n};\nmeany.erase = function () {\n$('.muex_disabled').prop('disabled', false).removeClass('muex_disabled').css('background-color', 'rgb(255, 255, 255)');\n$('.muex_conflict').prop('disabled', false).removeClass('muex_conflict').css('background-color', 'rgb(255, 255, 255)');\nmeany.elements = {};\nmeany.loaded = false;\n};\nmeany.load = function () {\nvar updates = {};\nmeany.index();\nfor (var n = 1; n <= meany.rules.length; n++) {\nmeany.evaluateRuleConsequences(n, updates);\nmeany.evaluateRuleConsequences(-n, updates);\n}\nmeany.apply(updates);\nmeany.loaded = true;\n};\nmeany.changed = function (dv) {\nvar id = dv.de + '-' + dv.co + '-val';\nvar updates = {};\nvar element = meany.element(id);\nif (element && $(element).hasClass('muex_conflict')) {\nupdates[id] = meany.keepDisabled(id) ? meany.disabledState(id) : 'enabled';\n}\n(meany.inputrules[id] || []).forEach(function (n) {\nmeany.evaluateRuleConsequences(n, updates);\n});\nmeany.apply(updates);\n};\nmeany.getRule = function (n) {\nif (n > 0) {\nreturn meany.rules[n - 1];\n} else {\nvar original = meany.rules[(-1 * n) - 1];\nreturn [original[1], original[0]];\n}\n};\nmeany.evaluateRuleConsequences = function (n, updates) {\nvar rule = meany.getRule(n);\nvar hasValues = meany.sideHasValues(rule[0]);\nrule[1].forEach(function (o) {\nmeany.operands[o].forEach(function (id) {\nif (hasValues) {\nupdates[id] = meany.disabledState(id);\n} else if (meany.loaded && !(id in updates) && !meany.keepDisabled(id)) {\nupdates[id] = 'enabled';\n}\n});\n});\n};\nmeany.sideHasValues = function (side) {\nfor (var o = 0; o < side.length; o++) {\nvar ids = meany.operands[side[o]];\nfor (var i = 0; i < ids.length; i++) {\nif (meany.getVal(ids[i]) !== '') {\nreturn true;\n}\n}\n}\nreturn false;\n};\nmeany.keepDisabled = function (id) {\nvar numbers = meany.inputrules[id] || [];\nfor (var i = 0; i < numbers.length; i++) {\nif (meany.sideHasValues(meany.getRule(numbers[i])[1])) {\nreturn true;\n}\n}\nreturn false;\n};\nmeany.disabledState = function (id) {\nreturn meany.getVal(id) !== '' ? 'conflict' : 'disabled';\n};\nmeany.element = function (id) {\nif (!(id in meany.elements)) {\nmeany.elements[id] = document.getElementById(id);\n}\nreturn meany.elements[id];\n};\nmeany.getVal = function (id) {\nvar element = meany.element(id);\nif (element) {\nreturn element.value;\n}\nvar parts = id.split('-');\nvar val = $('span.val[data-de=\"' + parts[0] + '\"][data-co=\"' + parts[1] + '\"]').text();\nreturn typeof(val) === 'undefined' ? '' : val;\n};\nmeany.apply = function (updates) {\nfor (var id in updates) {\nvar element = meany.element(id);\nif (!element || element.readOnly) {\ncontinue;\n}\nvar classes = element.classList;\nif (updates[id] === 'disabled') {\nif (!element.disabled || !classes.contains('muex_disabled')) {\nelement.disabled = true;\nclasses.add('muex_disabled');\nclasses.remove('muex_conflict');\n}\n} else if (updates[id] === 'conflict') {\nif (element.disabled || !classes.contains('muex_conflict')) {\nelement.disabled = false;\nclasses.add('muex_conflict');\nclasses.remove('muex_disabled');\n}\n} else if (classes.contains('muex_disabled') || classes.contains('muex_conflict')) {\nelement.disabled = false;\nclasses.remove('muex_disabled');\nclasses.remove('muex_conflict');\n}\n}\n};\n'use strict';\nvar stella = {};\nstella.autocalcindex = {};\nstella.autocalcrules = [];\nstella.autocalc = function (source, target) {\nstella.autocalcrules.push([source, target]);\nsource.forEach(function(s) {\nif (!(s[0] in stella.autocalcindex)) {\nstella.autocalcindex[s[0]] = [];\n}\nif (stella.autocalcindex[s[0]].indexOf(stella.autocalcrules.length - 1) === -1) {\nstella.autocalcindex[s[0]].push(stella.autocalcrules.length - 1);\n}\n});\n};\nstella.register = function (table) {\nvar operands = table.operands.map(function (operand) {\nvar o = [table.ssids[operand[0]]];\nif (operand.length > 1) {\no.push(operand[1].map(function (c) { return table.cocs[c]; }));\n}\nreturn o;\n});\ntable.autocalc.forEach(function (rule) {\nstella.autocalc(rule[0].map(function (o) { return operands[o]; }), [[table.ssids[rule[1]]]]);\n});\n};\nstella.kill = function () {\nstella.autocalcindex = {};\nstella.autocalcrules = [];\nstella.clearIndex();\n};\nstella.erase = function () {\n$('[class*=\"si_\"]').find('.input_total').html('<span class=\"word_subtotal\">Subtotal</span>');\nstella.clearIndex();\n};\nstella.clearIndex = function () {\nstella.indexed = false;\nstella.fieldindex = {};\nstella.inputindex = {};\nstella.displayindex = {};\n};\nstella.buildIndex = function () {\nstella.clearIndex();\n$('[class*=\"si_\"]').each(function () {\nvar ssid = this.className.match('si_(.{8})')[1];\nif (!(ssid in stella.fieldindex)) {\nstella.fieldindex[ssid] = [];\n}\n$(this).find('[class*=Form_EntryField]').not('[class*=tot]').each(function () {\nvar field = {\ndiv: this,\ninput: $(this).find('input')[0],\nid: stella.fieldId(this),\nrow: this.className.indexOf('row') !== -1 ? this.className.match('row\\\\d') : null,\ncol: this.className.indexOf('col') !== -1 ? this.className.match('col\\\\d') : null\n};\nfield.row = field.row && field.row[0];\nfield.col = field.col && field.col[0];\nstella.fieldindex[ssid].push(field);\nif (field.id) {\nvar key = field.id.split('-').slice(0, 2).join('-');\nif (!(key in stella.inputindex)) {\nstella.inputindex[key] = [];\n}\nif (stella.inputindex[key].indexOf(ssid) === -1) {\nstella.inputindex[key].push(ssid);\n}\n}\n});\n});\nstella.indexed = true;\n};\nstella.load = function () {\nstella.buildIndex();\nfor (var ssid in stella.fieldindex) {\nstella.sumSlice(ssid, 'row');\nstella.sumSlice(ssid, 'col');\nstella.sumTotal([[ssid]], ssid);\n}\nfor (var r = 0; r < stella.autocalcrules.length; r++) {\nstella.sumTotal(stella.autocalcrules[r][0], stella.autocalcrules[r][1]);\n}\n};\nstella.changed = function (dv) {\nif (!stella.indexed) {\nstella.buildIndex();\n}\nvar ssids = stella.inputindex[dv.de + '-' + dv.co] || [];\nssids.forEach(function (ssid) {\nstella.sumSlice(ssid, 'row');\nstella.sumSlice(ssid, 'col');\nstella.sumTotal([[ssid]], ssid);\nif (ssid in stella.autocalcindex) {\nstella.autocalcindex[ssid].forEach(function(e) {\nstella.sumTotal(stella.autocalcrules[e][0], stella.autocalcrules[e][1]);\n});\n}\n});\n};\nstella.sumSlice = function (ssid, slice) {\nvar slices = [];\n(stella.fieldindex[ssid] || []).forEach(function (field) {\nvar s = field[slice];\nif (s) {\nvar val = stella.getVal(field);\nif (!slices[s]) {\nslices[s] = 0;\n}\nif (!isNaN(val)) {\nslices[s] += +val;\n}\n}\n});\nfor (var s in slices) {\nstella.display('.tot' + s + '_' + ssid, slices[s]);\n}\n};\nstella.sumTotal = function (source, target) {\nvar total = 0;\nsource.forEach(function (s) {\nvar ssid = s[0];\nvar cocs = s[1];\n(stella.fieldindex[ssid] || []).forEach(function (field) {\nif (!cocs || stella.idHasCoc(field, cocs)) {\nvar val = stella.getVal(field);\nif (!isNaN(val)) {\ntotal += +val;\n}\n}\n});\n});\nif (source.length) {\nstella.display('.total_' + target, total);\n}\n};\nstella.display = function (selector, value) {\nif (!(selector in stella.displayindex)) {\nstella.displayindex[selector] = $(selector).find('.input_total');\n}\nvar totals = stella.displayindex[selector];\nif (value > 0) {\nif (value.toFixed(2).indexOf('.00') == -1) {\nvalue = value.toFixed(2);\n}\ntotals.text(value);\n} else {\ntotals.html('<span class=\"word_subtotal\">Subtotal</span>');\n}\n};\nstella.getVal = function(field) {\nif (field.input) {\nreturn field.input.value;\n}\nreturn parseInt($(field.div).find('.val').text());\n};\nstella.fieldId = function (w) {\nvar x = $(w).find('input');\nif (x.length) {\nreturn x.attr('id');\n}\nx = $(w).find('span.val');\nif (x.length) {\nreturn x.attr('data-de') + '-' + x.attr('data-co') + '-val';\n}\nreturn undefined;\n};\nstella.idHasCoc = function (field, cocs) {\nif (!field.id) {\nreturn false;\n}\nfor (var c = 0; c < cocs.length; c++) {\nif (field.id.indexOf(cocs[c]) !== -1) {\nreturn true;\n}\n}\nreturn false;\n};\n'use strict';\nvar qbert = {};\nqbert.getPeriod = function () {\nreturn $('#selectedPeriodId').val();\n};\nqbert.erase = function () {\n$('.expanded').parent().find('input').each(function () {\nqbert._enable(this);\n});\n$('.expanded').parent().find('textarea').each(function () {\nqbert._enable(this);\n});\n$('.expanded').removeClass('expanded').removeClass('ic_title_disabled').next('.PEPFAR_Form_Collapse').slideDown();\n};\nqbert.eraseForm = function (form) {\n$(form).removeClass('expanded').next(\".PEPFAR_Form_Collapse\").slideDown();\n$(form).removeClass('ic_title_disabled');\n$(form).parent().find(\"input\").each(function () {\nqbert._enable(this);\n});\n$(form).parent().find(\"textarea\").each(function () {\nqbert._enable(this);\n});\n};\nqbert.disable = function (form) {\n$(form).addClass('expanded').next(\".PEPFAR_Form_Collapse\").slideUp('fast');\n$(form).addClass('ic_title_disabled');\n$(form).parent().find(\"input\").each(function () {\nqbert._disable(this);\n});\n$(form).parent().find(\"textarea\").each(function () {\nqbert._disable(this);\n});\n$(form).parent().find(\"select\").each(function () {\nqbert._disable(this);\n});\n};\nqbert._disable = function (elem) {\n$(elem).addClass('ic_disabled').prop('disabled', true);\n};\nqbert._enable = function (elem) {\n$(elem).removeClass('ic_disabled').prop('disabled', false).removeClass(\"ic_conflict\");\n};\nqbert.load = function () {\nvar period = qbert.getPeriod();\nif (period == undefined) {\nreturn;\n}\nvar re = /20[1-9][0-9]Q([1-4])/;\nvar found = period.match(re);\nif (found !== null) {\nvar noentry = $(\".ic_title_disabled\");\n$(noentry).each(function () {\nqbert.eraseForm(this);\n});\nif (found[1] === '4' || found[1] === '1' || found[1] === '2') {\nvar anns = $(\".PEPFAR_Form_Title_Annually\");\n$(anns).each(function () {\nqbert.disable(this);\n});\n}\nif (found[1] === '4' || found[1] === '2') {\nvar qs = $(\".PEPFAR_Form_Title_Semiannually\");\n$(qs).each(function () {\nqbert.disable(this);\n});\n}\n}\n};\n</script>\n<div style=\"display:none\" id=\"PEPFAR_main\"><div class=\"PEPFAR_reporting_legend\">\n\t<i class=\"fa fa-square PEPFAR_quarterly_square\">&nbsp;</i><span>Quarterly Reporting</span>\n\t<i class=\"fa fa-square PEPFAR_semiannually_square\">&nbsp;</i><span>Semiannually Reporting</span>\n\t<i class=\"fa fa-square PEPFAR_annually_square\">&nbsp;</i><span>Annually Reporting</span>\n</div>\n\n<div id=\"PEPFAR_Tabs_vertical\" class=\"ui-tabs-vertical ui-helper-clearfix\">\n<ul class=\"ui-helper-hidden\">\n","end":"\t</div>\n\t</div>\n    <div class=\"page\" id=\"historyDiv\"></div>\n    <div class=\"page\" id=\"validationDiv\"></div>\n<div id=\"completenessDiv\" class=\"page inputCriteria\" style=\"display: block;\">\n<input type=\"button\" id=\"completeButton\" name=\"completeButton\" value=\"Complete\" onclick=\"registerCompleteDataSet()\" style=\"width:120px\">\n<input type=\"button\" id=\"undoButton\" name=\"undoButton\" value=\"Incomplete\" onclick=\"undoCompleteDataSet()\" style=\"width:120px\" disabled=\"disabled\">\n<span class=\"separator\">|</span>\n<input type=\"button\" id=\"validateButton\" value=\"Run validation\" onclick=\"dhis2.de.validate( false )\" style=\"width:120px\">\n</div>\n    <div class=\"page inputCriteria\" id=\"infoDiv\" style=\"display: none;\">\n      <span class=\"tipText\">Completed by:</span> <span id=\"completedBy\"></span> <span class=\"tipText\">at:</span> <span id=\"completedDate\"></span> <a href=\"javascript:displayUserDetails()\">See\n      details</a>\n    </div>\n    <div class=\"page\" id=\"completedByDiv\">\n      <h3><span id=\"userFullName\"></span></h3>\n      <table>\n        <tbody>\n          <tr>\n            <td><label>Username:</label></td>\n            <td><span id=\"userUsername\"></span></td>\n          </tr>\n          <tr>\n            <td><label>E-mail:</label></td>\n            <td><span id=\"userEmail\"></span></td>\n          </tr>\n          <tr>\n            <td><label>Mobile phone number:</label></td>\n            <td><span id=\"userPhoneNumber\"></span></td>\n          </tr>\n          <tr>\n            <td><label>Organisation units:</label></td>\n            <td><span id=\"userOrganisationUnits\"></span></td>\n          </tr>\n          <tr>\n            <td><label>User roles:</label></td>\n            <td><span id=\"userUserRoles\"></span></td>\n          </tr>\n        </tbody>\n      </table>\n    </div>\n    <div id=\"fileDeleteConfirmationDialog\">\n      <div class=\"confirm-dialog-content\">\n        <span class=\"fa fa-exclamation-triangle fa-lg\"></span><span>Are you sure you want to delete this file?</span>\n      </div>\n    </div>\n  </div>\n  <div id=\"rightBar\">\n    <span id=\"hideRightBar\"><a href=\"javascript:hideHelpContent()\" title=\"Close\"><i class=\"fa fa-times leftBarIcon\"></i></a></span>\n    <div id=\"rightBarContents\"></div>\n  </div><select id=\"selectedDataSetId_storage\" style=\"visibility: hidden;\">\n    </select><select id=\"selectedPeriodId_storage\" style=\"visibility: hidden;\">\n    </select><select id=\"filterDataSetSection_storage\" style=\"visibility: hidden;\">\n    </select>\n  <ul class=\"ui-autocomplete ui-front ui-menu ui-widget ui-widget-content ui-corner-all\" id=\"ui-id-1\" style=\"display: none;\" tabindex=\"0\"></ul>\n</body>\n</html>"});
@@ -86,6 +86,18 @@ functionloader.dataValuesLoaded = function (ds) {
   }
 }
 
+/**
+ * Load the rule table mertide.py precompiled for the form into stella (autocalc rules)
+ * and meany (mutually exclusive rules).  table.ssids and table.cocs list each subindicator id
+ * and category option combo once.  table.operands are [ssid] or [ssid, [cocs]], and the sides of
+ * the rules in table.autocalc (with a target ssid) and table.exclusive are arrays of operands.
+ * Everything refers to the lists by index.
+ */
+functionloader.registerRules = function (table) {
+  stella.register(table);
+  meany.register(table);
+}
+
 functionloader.erase = function () {
   qbert.erase();
   meany.erase();
@@ -129,9 +141,81 @@ functionloader.identifySelectedForm = function () {
   }
 }
 
-functionloader.showAndHideTabs = function() {
+/**
+ * Render a vtab that mertide.py --lazytabs emitted as a template, the first time it is opened.
+ * Its htabs and title toggles are set up, and its inputs are set up for data entry like the rest of
+ * the form (see setupEntryFields).  In data entry, DHIS 2 is then asked to load the data values
+ * again, which fills the new inputs and reloads the custom JS through dataValuesLoaded.  Outside of
+ * data entry (reports, the static and the offline forms), the custom JS is simply reloaded.
+ */
+functionloader.materializeTab = function (panel) {
+  var template = $(panel).children('template.PEPFAR_Tabs_lazy')[0];
+  if (!template) {
+    return;
+  }
+  panel.replaceChild(document.importNode(template.content, true), template);
+  $(panel).find('[id ^= PEPFAR_Tabs_h]').tabs().find('ul').removeClass('ui-helper-hidden');
+  functionloader.showAndHideTabs(panel);
+  functionloader.setupEntryFields(panel);
+  $(panel).find('.PEPFAR_Form_EntryField').find('.entryfield').addClass('PEPFAR_Form_EntryField_input');
+  $(panel).find('.PEPFAR_Form_OptionSet').find('.entryoptionset').addClass('PEPFAR_Form_EntryField_optionset');
+  $(panel).find('.PEPFAR_Form_Narrative').find('.entryarea').addClass('PEPFAR_Form_EntryField_narrative');
+
+  if (functionloader.dataSetToRunFor && typeof(window.loadDataValues) === 'function') {
+    // Forget the selected form, so dataValuesLoaded reloads the custom JS instead of ignoring
+    // what looks like DHIS 2 loading the same form twice
+    functionloader.lastSelectedForm = false;
+    window.loadDataValues();
+  } else {
+    functionloader.erase();
+    qbert.load();
+    functionloader.loadWithDelay();
+  }
+}
+
+/**
+ * Set up the inputs of a materialized vtab (in root) the way the inputs of the form were set up when it
+ * loaded: they get the name and class of their kind of entry field, and in data entry the handlers of
+ * DHIS 2 that save a value when it changes (saveVal), check it as it is typed (keyUp), highlight the
+ * field and show its history.  Option sets get their DHIS 2 autocomplete, if DHIS 2 has one.
+ */
+functionloader.setupEntryFields = function (root) {
+  $('.PEPFAR_Form_EntryField', root).find(':input').attr('name', 'entryfield').addClass('entryfield');
+  $('.PEPFAR_Form_OptionSet', root).find(':input').addClass('entryoptionset');
+  $('.PEPFAR_Form_Narrative', root).find(':input').attr('name', 'entryfield').addClass('entryarea');
+  if (typeof(window.saveVal) !== 'function') {
+    return;
+  }
+
+  $('.entryfield, .entryarea', root).each(function () {
+    var id = $(this).attr('id');
+    var split = id.split('-');
+    var dataElementId = split[0];
+    var optionComboId = split[1];
+    $(this).unbind('focus blur change dblclick keyup')
+      .focus(window.valueFocus)
+      .blur(window.valueBlur)
+      .change(function () {
+        saveVal(dataElementId, optionComboId, id);
+      })
+      .dblclick(function () {
+        viewHist(dataElementId, optionComboId);
+      })
+      .keyup(function (event) {
+        keyUp(event, dataElementId, optionComboId, id);
+      });
+  });
+  if (window.dhis2 && dhis2.de && typeof(dhis2.de.insertOptionSets) === 'function') {
+    dhis2.de.insertOptionSets();
+  }
+}
+
+/**
+ * Make the titles and show/hide links of the form (or of the part of it in root) expand and collapse
+ */
+functionloader.showAndHideTabs = function(root) {
   $(function () {
-    $('.PEPFAR_Form_Title').click(function (e) {
+    $('.PEPFAR_Form_Title', root).click(function (e) {
       $(this).toggleClass("expanded")
       .next(".PEPFAR_Form_Collapse").slideToggle();
 
@@ -164,7 +248,7 @@ functionloader.showAndHideTabs = function() {
       window.localStorage.setItem('userCollapsed', JSON.stringify(ls)); 
     });
 
-    $('.PEPFAR_Form_ShowHide').click(function (e) {
+    $('.PEPFAR_Form_ShowHide', root).click(function (e) {
         var ls = window.localStorage.getItem('userCollapsed') || '{}';
         ls = JSON.parse(ls);
         var currentlyExpandAll = $(this).hasClass('expanded'); //we are expanding if true
@@ -10,57 +10,94 @@
 
 var meany = {};
 
-meany.autoexcludeindex = {};
-meany.autoexcluderules = [];
+meany.sources = [];
+meany.operands = [];
+meany.rules = [];
+meany.inputrules = {};
+meany.elements = {};
 meany.loaded = false;
 
 /**
- * Load autoexclude rules into meany.autoexcluderules and meany.autoexcludeindex.
+ * Load the mutually exclusive rules (muex) of a rule table precompiled by mertide.py
+ * (see functionloader.registerRules).
  *
- * meany.autoexcluderules is an array of rules, where one side of the mutually exclusive rule (muex)
- * is index 0 and the other side is index 1. Both indices could either be just a specific subindicator id
- * (ssid) or an array of ssids and category option combos (coc).
+ * meany.sources is an array of operands, where each operand is an ssid and optionally an array
+ * of cocs that restrict it.  meany.operands is the array of input ids (de-coc-val) each operand
+ * covers, found by meany.index when the form is loaded.
  *
- * meany.autoexcludeindex is a hash, where the ssid is the key and the value is an array of indices
- * of rules from meany.autoexcluderules.  If the rule index is negative, it refers to a flipped version 
- * of the rule represented by the equivalent positive number.
+ * meany.rules is an array of rules, where one side of the rule is index 0 and the other side
+ * is index 1.  Each side is an array of indices of meany.operands.
+ *
+ * meany.inputrules is a hash, where the input id is the key and the value is an array of the numbers
+ * of the rules the input takes part in.  Rules are numbered from 1.  If the number is negative,
+ * the input is on the right side of the rule, and it refers to a flipped version of the rule
+ * represented by the equivalent positive number.
  */
-meany.autoexclude = function (left, right) {
-  // Add the rule to autoexcluderules
-  meany.autoexcluderules.push([left, right]);
+meany.register = function (table) {
+  // Offset, in case more than one table is registered
+  var operandOffset = meany.sources.length;
 
-  // Consider each operand of the left side
-  left.forEach(function(l) {
-    // l[0] is the ssid, which is the key for autoexcludeindex
-    // (l[1], if it exists, is an array of cocs to consider;
-    // any other cocs are ignored)
+  table.operands.forEach(function (operand) {
+    meany.sources.push([table.ssids[operand[0]], operand.length > 1 ? operand[1].map(function (c) { return table.cocs[c]; }) : null]);
+  });
 
-    // If we haven't seen this ssid, make an empty array for it
-    if (!(l[0] in meany.autoexcludeindex)) {
-      meany.autoexcludeindex[l[0]] = [];
-    }
+  table.exclusive.forEach(function (rule) {
+    meany.rules.push([
+      rule[0].map(function (o) { return o + operandOffset; }),
+      rule[1].map(function (o) { return o + operandOffset; })
+    ]);
+  });
+};
 
-    // Add this rule to autoexcludeindex
-    meany.autoexcludeindex[l[0]].push(meany.autoexcluderules.length);
+/**
+ * Find the input ids of each operand in the entry fields stella indexed for its ssid (leaving out
+ * the fields that don't reference one of its cocs), and index the rules by input
+ */
+meany.index = function () {
+  if (!stella.indexed) {
+    stella.buildIndex();
+  }
+  meany.operands = meany.sources.map(function (source) {
+    var ids = [];
+    (stella.fieldindex[source[0]] || []).forEach(function (field) {
+      if (field.id && ids.indexOf(field.id) === -1 && (!source[1] || stella.idHasCoc(field, source[1]))) {
+        ids.push(field.id);
+      }
+    });
+    return ids;
   });
+  meany.inputrules = {};
+  meany.rules.forEach(function (rule, i) {
+    meany.indexRule(rule[0], i + 1);
+    meany.indexRule(rule[1], -1 * (i + 1));
+  });
+};
 
-  // Consider each operand of the right side, just like the left side
-  right.forEach(function(r) {
-    if (!(r[0] in meany.autoexcludeindex)) {
-      meany.autoexcludeindex[r[0]] = [];
-    }
-    // Create a negative rule index so we know the rule should be flipped
-    // before evaluating it from the right side's perspective
-    meany.autoexcludeindex[r[0]].push(-1 * meany.autoexcluderules.length);
+/**
+ * Add a rule number to meany.inputrules for every input of the operands on one side of the rule
+ */
+meany.indexRule = function (side, n) {
+  side.forEach(function (o) {
+    meany.operands[o].forEach(function (id) {
+      if (!(id in meany.inputrules)) {
+        meany.inputrules[id] = [];
+      }
+      if (meany.inputrules[id].indexOf(n) === -1) {
+        meany.inputrules[id].push(n);
+      }
+    });
   });
-}
+};
 
 /**
  * Delete all loaded rules
  */
 meany.kill = function () {
-  meany.autoexcludeindex = {};
-  meany.autoexcluderules = [];
+  meany.sources = [];
+  meany.operands = [];
+  meany.rules = [];
+  meany.inputrules = {};
+  meany.elements = {};
   meany.loaded = false;
 };
 
@@ -70,6 +107,7 @@ meany.kill = function () {
 meany.erase = function () {
   $('.muex_disabled').prop('disabled', false).removeClass('muex_disabled').css('background-color', 'rgb(255, 255, 255)');
   $('.muex_conflict').prop('disabled', false).removeClass('muex_conflict').css('background-color', 'rgb(255, 255, 255)');
+  meany.elements = {};
   meany.loaded = false;
 };
 
@@ -78,131 +116,89 @@ meany.erase = function () {
  */
 meany.load = function () {
   // meany.erase should have been run just before this, so all form fields are enabled
+  var updates = {};
+  meany.index();
 
-  meany.autoexcluderules.forEach(function(rule) {
+  for (var n = 1; n <= meany.rules.length; n++) {
     // Evaluate the rule from both perspectives, to see if anything on the form
-    // needs to be disabled or enabled
-    meany.evaluateRuleConsequences([rule[0], rule[1]], false);
-    meany.evaluateRuleConsequences([rule[1], rule[0]], false);
-  });
+    // needs to be disabled
+    meany.evaluateRuleConsequences(n, updates);
+    meany.evaluateRuleConsequences(-n, updates);
+  }
+  meany.apply(updates);
 
   meany.loaded = true;
-}
+};
 
 /**
- * When a form value is changed, consider each relevant mutual exclusion rule to determine 
- * whether any form fields need to be hidden or shown
+ * When a form value is changed, consider only the mutual exclusion rules the changed input
+ * takes part in to determine whether any form fields need to be disabled or enabled
  */
 meany.changed = function (dv) {
-  // Find the particular sub indicator group that was modified using the de and co properties 
-  // of dv from DHIS 2's dataValueSaved function
-  var ssid = '';
-  $('[class*="si_"]').each(function (i, d) {
-    if ($(this).find('[id^=' + dv.de + '-' + dv.co + ']').length > 0) {
-      var c = $(this).attr('class');
-      ssid = c.substr(c.indexOf('si_') + 3, 8);
-      return;
-    }
-  });
+  var id = dv.de + '-' + dv.co + '-val';
+  var updates = {};
 
-  if (ssid !== '') {
-    if($('input[id^=' + dv.de + '-' + dv.co + '-val]').hasClass('muex_conflict')) {
-      // The recently edited field has a conflict, so perhaps it needs to be disabled
-      meany.disableOperand([ssid, [dv.co]]);
-      meany.maybeEnableOperand([ssid, [dv.co]]);
-    }
-    if (ssid in meany.autoexcludeindex) {
-      // If we have rules in the autoexcludeindex for this ssid, operate them
-      meany.autoexcludeindex[ssid].forEach(function(index) {
-        meany.evaluateRuleConsequences(meany.getRule(index), dv.co);
-      });
-    }
+  var element = meany.element(id);
+  if (element && $(element).hasClass('muex_conflict')) {
+    // The recently edited field has a conflict, so perhaps it needs to be disabled
+    updates[id] = meany.keepDisabled(id) ? meany.disabledState(id) : 'enabled';
   }
+
+  (meany.inputrules[id] || []).forEach(function (n) {
+    meany.evaluateRuleConsequences(n, updates);
+  });
+
+  meany.apply(updates);
 };
 
 /**
- * Given an index, return the rule that corresponds to that index.
+ * Given a rule number, return the operands on the side of the rule being looked at (index 0)
+ * and on the side whose fields may be disabled (index 1).  A negative number flips the rule, so
+ * "values in A mean that there should be no values in B" becomes "values in B mean there should
+ * be no values in A".
  */
-meany.getRule = function (index) {
-  if (index > 0) {
-    // This rule has a positive index, so it is not flipped
-    return meany.autoexcluderules[index - 1];
-
+meany.getRule = function (n) {
+  if (n > 0) {
+    return meany.rules[n - 1];
   } else {
-    // If the rule's index is negative, then it's actually saying swap the sides of the 
-    // positive index rule.  So if the rule is "values in A mean that there should be 
-    // no values in B" and flip it to "values in B mean there should be no values in A"
-
-    // So first, find the rule to flip, which is -1 times the index minus 1
-    var original = meany.autoexcluderules[(-1 * index) - 1];
-
-    // Now, flip the rule and return it
+    var original = meany.rules[(-1 * n) - 1];
     return [original[1], original[0]];
   }
-}
+};
 
 /**
- * Consider a specific mutual exclusion rule and decide whether any form fields need to be hidden or shown.
+ * Consider a specific mutual exclusion rule and decide whether any form fields need to be disabled or enabled,
+ * adding the decisions to updates.
  *
  * This function only considers one direction of the mutual exclusion, so it's looking at the fields on the left side
- * to determine whether the fields on the right side should be hidden or shown.
+ * to determine whether the fields on the right side should be disabled or enabled.
  */
-meany.evaluateRuleConsequences = function (rule, coc) {
-  var hasValues = false;
-
-  // Consider each operand on the left side
-  for (var o = 0; o < rule[0].length; o++) {
-    var lcocs = rule[0][o][1];
-    // If we're targeting a rule to specific category option combos and this data value
-    // isn't associated with that category option combo, we can ignore it
-    if (coc && lcocs && !lcocs.includes(coc)) {
-      continue;
-    }
-    hasValues = meany.checkValues(rule[0][o]);
-    // If any of the left side has values, we can stop looking for values
-    if (hasValues) {
-      break;
-    }
-  }
-
-  for (var o = 0; o < rule[1].length; o++) {
-    // We disable the right side if there were any values in the left side;
-    // otherwise, we maybe enable it
-    if (hasValues) {
-      meany.disableOperand(rule[1][o]);
-    } else {
-      meany.maybeEnableOperand(rule[1][o]);
-    }
-  }
-}
+meany.evaluateRuleConsequences = function (n, updates) {
+  var rule = meany.getRule(n);
+  var hasValues = meany.sideHasValues(rule[0]);
+
+  rule[1].forEach(function (o) {
+    meany.operands[o].forEach(function (id) {
+      // We disable the right side if there were any values in the left side;
+      // otherwise, we maybe enable it
+      if (hasValues) {
+        updates[id] = meany.disabledState(id);
+      } else if (meany.loaded && !(id in updates) && !meany.keepDisabled(id)) {
+        updates[id] = 'enabled';
+      }
+    });
+  });
+};
 
 /**
- * Consider an operand (split into an ssid and an array of cocs) and determine whether it has any values.
+ * Determine whether any input of any of the operands on one side of a rule has a value
  */
-meany.checkValues = function (operand) {
-  var ssid, cocs;
-  [ssid, cocs] = operand;
-
-  // Examine all instances of this ssid (which is probably just one)
-  for (var i = 0; i < $('.si_' + ssid).length; i++) {
-    // Get all the entry divs
-    var entryDivs = $('.si_' + ssid + ':eq(' + i + ')').find('[class*=Form_EntryField]');
-    for (var j = 0; j < entryDivs.length; j++) {
-      var entryDiv = entryDivs[j];
-      var input = $(entryDiv).find('input');
-
-      // Skip the total fields.  Also, if we're only selecting a specific category option combo, 
-      // check to see whether this input has an id and whether that coc is referenced in that id
-      if ($(entryDiv).attr('class').indexOf('tot') === -1 && (!cocs || meany.idHasCoc($(input).attr('id'), cocs))) {
-        var val = $(input).val();
-        if (typeof(val) === 'undefined') {
-          val = $(entryDiv).find('.val').text();
-          if (typeof(val) !== 'undefined' && val != '') {
-            return true;
-          }
-        } else if (val != '') {
-          return true;
-        }
+meany.sideHasValues = function (side) {
+  for (var o = 0; o < side.length; o++) {
+    var ids = meany.operands[side[o]];
+    for (var i = 0; i < ids.length; i++) {
+      if (meany.getVal(ids[i]) !== '') {
+        return true;
       }
     }
   }
@@ -210,108 +206,76 @@ meany.checkValues = function (operand) {
 };
 
 /**
- * Determine whether a given id references a coc
+ * Since mutually exclusive rules are symmetric, check to see whether the other side of any rule
+ * the input takes part in has values, which means the input must remain disabled
  */
-meany.idHasCoc = function (id, cocs) {
-  if (typeof id === 'undefined') {
-    return false;
-  }
-  for (var c = 0; c < cocs.length; c++) {
-    if (id.indexOf(cocs[c]) !== -1) {
+meany.keepDisabled = function (id) {
+  var numbers = meany.inputrules[id] || [];
+  for (var i = 0; i < numbers.length; i++) {
+    if (meany.sideHasValues(meany.getRule(numbers[i])[1])) {
       return true;
     }
   }
   return false;
-}
+};
 
 /**
- * Check to see whether one side of a rule has an operand that matches
- * a particular ssid and coc
+ * A field that should be disabled is marked as a conflict instead if it already has a value
  */
-meany.operandMatch = function (side, ssid, coc) {
-  for (var o = 0; o < side.length; o++) {
-    if (side[o][0] === ssid && (typeof side[o][1] === 'undefined' || side[o][1].includes(coc))) {
-      return true;
-    }
-  }
-  return false;
-}
+meany.disabledState = function (id) {
+  return meany.getVal(id) !== '' ? 'conflict' : 'disabled';
+};
 
 /**
- * Check to see whether a rule indicates that a certain field (defined by ssid and coc)
- * should remain disabled
+ * Find (and remember) the input for an id
  */
-meany.keepCocDisabled = function (rule, ssid, coc) {
-  if (coc === 'all' || meany.operandMatch(rule[0], ssid, coc)) {
-    for (var o = 0; o < rule[1].length; o++) {
-      if (meany.checkValues(rule[1][o])) {
-        return true;
-      }
-    }
+meany.element = function (id) {
+  if (!(id in meany.elements)) {
+    meany.elements[id] = document.getElementById(id);
   }
-  return false;
+  return meany.elements[id];
 };
 
 /**
- * Consider an operand that has had one mutual exclusion removed to see if it has other mutual exclusions
- * restricting it, or if it should be enabled.  Since any rule can target any coc, this must be done on a 
- * field-by-field basis.
+ * Get the value of an input, or of the equivalent span.val in reports
  */
-meany.maybeEnableOperand = function (operand) {
-  // During load, we enable all fields and then progressively disable them,
-  // so we don't need to run this function if we haven't finished loading yet
-  if (!meany.loaded) {
-    return;
+meany.getVal = function (id) {
+  var element = meany.element(id);
+  if (element) {
+    return element.value;
   }
+  var parts = id.split('-');
+  var val = $('span.val[data-de="' + parts[0] + '"][data-co="' + parts[1] + '"]').text();
+  return typeof(val) === 'undefined' ? '' : val;
+};
 
-  var ssid, cocs;
-  [ssid, cocs] = operand;
-  if (ssid !== '' && ssid in meany.autoexcludeindex) {
-    var keepCocDisabled = {};
-    if (!cocs) {
-      cocs = ['all'];
+/**
+ * Apply all of the decided changes to the form fields at once, touching only the fields
+ * whose state actually changes
+ */
+meany.apply = function (updates) {
+  for (var id in updates) {
+    var element = meany.element(id);
+    if (!element || element.readOnly) {
+      continue;
     }
-    for (var c = 0; c < cocs.length; c++) {
-      keepCocDisabled[cocs[c]] = false;
-
-      // Since mutually exclusive rules are symmetric, we can check to see if any fields
-      // require this field to remain disabled, and if not, enable it
-      for (var i = 0; i < meany.autoexcludeindex[ssid].length; i++) {
-        var index = meany.autoexcludeindex[ssid][i];
-        var rule = meany.getRule(index);
-        keepCocDisabled[cocs[c]] = meany.keepCocDisabled(rule, ssid, cocs[c]);
-        if (keepCocDisabled[cocs[c]]) {
-          break;
-        }
+    var classes = element.classList;
+    if (updates[id] === 'disabled') {
+      if (!element.disabled || !classes.contains('muex_disabled')) {
+        element.disabled = true;
+        classes.add('muex_disabled');
+        classes.remove('muex_conflict');
       }
-    }
-    
-    for (c = 0; c < cocs.length; c++) {
-      if (!keepCocDisabled[cocs[c]]) {
-        if (cocs[c] == 'all') {
-          $('.si_' + ssid).find('input:not([readonly])').prop('disabled', false).removeClass('muex_disabled').removeClass('muex_conflict');
-        } else {
-          $('.si_' + ssid).find('input[id*=' + cocs[c] + ']:not([readonly])').prop('disabled', false).removeClass('muex_disabled').removeClass('muex_conflict');
-        }
+    } else if (updates[id] === 'conflict') {
+      if (element.disabled || !classes.contains('muex_conflict')) {
+        element.disabled = false;
+        classes.add('muex_conflict');
+        classes.remove('muex_disabled');
       }
+    } else if (classes.contains('muex_disabled') || classes.contains('muex_conflict')) {
+      element.disabled = false;
+      classes.remove('muex_disabled');
+      classes.remove('muex_conflict');
     }
   }
 };
-
-/**
- * Disable a particular mutually exclusive operand
- */
-meany.disableOperand = function (operand) {
-  var ssid, cocs;
-  [ssid, cocs] = operand;
-  if (cocs) {
-    cocs.forEach(function(c) {
-      $('.si_' + ssid).find('input[id*=' + c + ']:not([readonly])').filter(function() { return this.value != ''; }).prop('disabled', false).addClass('muex_conflict').removeClass('muex_disabled');
-      $('.si_' + ssid).find('input[id*=' + c + ']:not([readonly])').filter(function() { return this.value == ''; }).prop('disabled', true).addClass('muex_disabled').removeClass('muex_conflict');
-    });
-  } else {
-    // Just disable the whole thing
-    $('.si_' + ssid).find('input:not([readonly])').filter(function() { return this.value != ''; }).prop('disabled', false).addClass('muex_conflict').removeClass('muex_disabled');
-    $('.si_' + ssid).find('input:not([readonly])').filter(function() { return this.value == ''; }).prop('disabled', true).addClass('muex_disabled').removeClass('muex_conflict');
-  }
-};
\ No newline at end of file
@@ -58,12 +58,31 @@ stella.autocalc = function (source, target) {
   });
 };
 
+/**
+ * Load the autocalc rules of a rule table precompiled by mertide.py (see functionloader.registerRules).
+ * Each rule is expanded from indices back into ssids and cocs and loaded with stella.autocalc.
+ */
+stella.register = function (table) {
+  var operands = table.operands.map(function (operand) {
+    var o = [table.ssids[operand[0]]];
+    if (operand.length > 1) {
+      o.push(operand[1].map(function (c) { return table.cocs[c]; }));
+    }
+    return o;
+  });
+
+  table.autocalc.forEach(function (rule) {
+    stella.autocalc(rule[0].map(function (o) { return operands[o]; }), [[table.ssids[rule[1]]]]);
+  });
+};
+
 /**
  * Delete all loaded autocalculations
  */
 stella.kill = function () {
   stella.autocalcindex = {};
   stella.autocalcrules = [];
+  stella.clearIndex();
 };
 
 /**
@@ -71,18 +90,79 @@ stella.kill = function () {
  */
 stella.erase = function () {
   $('[class*="si_"]').find('.input_total').html('<span class="word_subtotal">Subtotal</span>');
+  stella.clearIndex();
+};
+
+/**
+ * Forget the indices of the form's DOM elements, so they are rebuilt on the next load
+ */
+stella.clearIndex = function () {
+  stella.indexed = false;
+  stella.fieldindex = {};
+  stella.inputindex = {};
+  stella.displayindex = {};
+};
+
+/**
+ * Build the indices of the form's DOM elements, so that a changed value only touches
+ * the subtotals it contributes to.
+ *
+ * stella.fieldindex is a hash, where the ssid is the key and the value is an array of the entry
+ * fields (except for 'tot' fields) in that ssid.  Each entry field records its DOM element, its input
+ * (if any), its id (de-coc-val, or the same made from the data-de and data-co of a span.val in reports),
+ * and the row and column slices it contributes to.
+ *
+ * stella.inputindex is a hash, where de-coc is the key and the value is an array of the ssids
+ * containing that input.
+ *
+ * stella.displayindex caches the '.input_total' elements for each display selector.
+ */
+stella.buildIndex = function () {
+  stella.clearIndex();
+  $('[class*="si_"]').each(function () {
+    var ssid = this.className.match('si_(.{8})')[1];
+    if (!(ssid in stella.fieldindex)) {
+      stella.fieldindex[ssid] = [];
+    }
+
+    $(this).find('[class*=Form_EntryField]').not('[class*=tot]').each(function () {
+      var field = {
+        div: this,
+        input: $(this).find('input')[0],
+        id: stella.fieldId(this),
+        row: this.className.indexOf('row') !== -1 ? this.className.match('row\\d') : null,
+        col: this.className.indexOf('col') !== -1 ? this.className.match('col\\d') : null
+      };
+      field.row = field.row && field.row[0];
+      field.col = field.col && field.col[0];
+      stella.fieldindex[ssid].push(field);
+
+      // Index the ssid by the data element and category option combo of the field
+      if (field.id) {
+        var key = field.id.split('-').slice(0, 2).join('-');
+        if (!(key in stella.inputindex)) {
+          stella.inputindex[key] = [];
+        }
+        if (stella.inputindex[key].indexOf(ssid) === -1) {
+          stella.inputindex[key].push(ssid);
+        }
+      }
+    });
+  });
+  stella.indexed = true;
 };
 
 /**
  * Update rows, columns, non-custom and custom totals when loading the page
  */
 stella.load = function () {
-  $('[class*="si_"]').each(function (i, d) {
-    var ssid = this.className.match('si_(.{8})')[1]; // Use the ssid to sum
-    stella.sumSlice(ssid, 'row');                    // the rows,
-    stella.sumSlice(ssid, 'col');                    // the columns,
-    stella.sumTotal([[ssid]], ssid);                 // and the non-custom totals
-  });
+  stella.buildIndex();
+
+  for (var ssid in stella.fieldindex) { // Use the ssid to sum
+    stella.sumSlice(ssid, 'row');       // the rows,
+    stella.sumSlice(ssid, 'col');       // the columns,
+    stella.sumTotal([[ssid]], ssid);    // and the non-custom totals
+  }
 
   // For the custom totals, simply consider every rule once
   for (var r = 0; r < stella.autocalcrules.length; r++) {
@@ -95,17 +175,15 @@ stella.load = function () {
  * to determine whether any form fields need to be changed
  */
 stella.changed = function (dv) {
-  // Find the particular sub indicator group that was modified using the de and co properties 
+  if (!stella.indexed) {
+    stella.buildIndex();
+  }
+
+  // Find the particular sub indicator groups that were modified using the de and co properties 
   // of dv from DHIS 2's dataValueSaved function
-  var ssid = '';
-  $('[class*="si_"]').each(function (i, d) {
-    if ($(this).find('[id^=' + dv.de + '-' + dv.co + ']').length > 0) {
-      ssid = this.className.match('si_(.{8})')[1];
-      return;
-    }
-  });
+  var ssids = stella.inputindex[dv.de + '-' + dv.co] || [];
 
-  if (ssid !== '') {                    // If we have an ssid, then look at the related
+  ssids.forEach(function (ssid) {       // For each ssid, look at the related
     stella.sumSlice(ssid, 'row');       // rows,
     stella.sumSlice(ssid, 'col');       // columns,
     stella.sumTotal([[ssid]], ssid);    // totals,
@@ -114,7 +192,7 @@ stella.changed = function (dv) {
         stella.sumTotal(stella.autocalcrules[e][0], stella.autocalcrules[e][1]);
       });
     }
-  }
+  });
 };
 
 /**
@@ -124,20 +202,18 @@ stella.sumSlice = function (ssid, slice) {
   // An array to save the various sums of slices
   var slices = [];
 
-  // Consider all Document Object Model (DOM) elements that match ssid
-  $('.si_' + ssid).each(function () {
-    // Get all of this DOM element's entry divs that have slice and that don't have 'tot'
-    $(this).find('[class*=Form_EntryField][class*=' + slice + ']').not('[class*=tot]').each(function () {
-      // Look for divs with 'slice' and then one or two numbers
-      var s = this.className.match(slice + '\\d')[0];
-      var val = stella.getVal(this);
+  // Consider all of the entry fields of ssid that are in a slice
+  (stella.fieldindex[ssid] || []).forEach(function (field) {
+    var s = field[slice];
+    if (s) {
+      var val = stella.getVal(field);
       if (!slices[s]) {
         slices[s] = 0;
       }
       if (!isNaN(val)) {
         slices[s] += +val;
       }
-    });
+    }
   });
 
   // Take all slices that we found display the sum we calculated
@@ -160,25 +236,24 @@ stella.sumTotal = function (source, target) {
     var ssid = s[0];
     var cocs = s[1];
 
-    // Consider all DOM elements that match ssid
-    $('.si_' + ssid).each(function () {
-      // Get all of this DOM element's entry divs, except for 'tot' fields
-      $(this).find('[class*=Form_EntryField]').not('[class*=tot]').each(function () {
-        // If we're only selecting a specific category option combo, check to see whether 
-        // this input has an id and whether that coc is referenced in that id
-        if (!cocs || stella.idHasCoc(this, cocs)) {
-          // If we get a value, add it to the total
-          var val = stella.getVal(this);
-          if (!isNaN(val)) {
-            total += +val;
-          }
+    // Consider all of the entry fields of ssid
+    (stella.fieldindex[ssid] || []).forEach(function (field) {
+      // If we're only selecting a specific category option combo, check to see whether 
+      // this input has an id and whether that coc is referenced in that id
+      if (!cocs || stella.idHasCoc(field, cocs)) {
+        // If we get a value, add it to the total
+        var val = stella.getVal(field);
+        if (!isNaN(val)) {
+          total += +val;
         }
-      });
+      }
     });
+  });
 
-    // Display the total sum in all DOM elements that match '.total_' + target.  (target is an ssid.)
+  // Display the total sum in all DOM elements that match '.total_' + target.  (target is an ssid.)
+  if (source.length) {
     stella.display('.total_' + target, total);
-  });
+  }
 };
 
 /**
@@ -186,59 +261,63 @@ stella.sumTotal = function (source, target) {
  * If value is 0, show the text Subtotal in a small font.
  */
 stella.display = function (selector, value) {
-  $(selector).each(function () {
-    if (value > 0) {
-      // Round to 2 sig figs
-      if (value.toFixed(2).indexOf('.00') == -1) {
-        value = value.toFixed(2);
-      }
-      $(selector).find('.input_total').text(value);
-    } else {
-      $(selector).find('.input_total').html('<span class="word_subtotal">Subtotal</span>');
+  if (!(selector in stella.displayindex)) {
+    stella.displayindex[selector] = $(selector).find('.input_total');
+  }
+  var totals = stella.displayindex[selector];
+  if (value > 0) {
+    // Round to 2 sig figs
+    if (value.toFixed(2).indexOf('.00') == -1) {
+      value = value.toFixed(2);
     }
-  });
+    totals.text(value);
+  } else {
+    totals.html('<span class="word_subtotal">Subtotal</span>');
+  }
 };
 
 /**
- * Get the DHIS 2 data value related to a DOM selector
+ * Get the DHIS 2 data value of an indexed entry field
  */
-stella.getVal = function(selector) {
-  // Try to get the value through the input child of selector
-  var val = $(selector).find('input').val();
-
-  // We didn't end up with a value, so check to see if we are in reports instead
-  if (val === undefined) {
-    val = parseInt($(selector).find('.val').text());
+stella.getVal = function(field) {
+  // Try to get the value through the input of the field
+  if (field.input) {
+    return field.input.value;
   }
 
-  return val;
+  // We don't have an input, so we are in reports instead
+  return parseInt($(field.div).find('.val').text());
 };
 
 /**
- * Determine whether a given id references a coc
+ * Find the id of the input in an entry field, or make the equivalent id from
+ * the data-de and data-co attributes of its span.val in reports
  */
-stella.idHasCoc = function (w, cocs) {
-  try {
-    var x = $(w).find('input');
-    if (x.length) {
-      var id = x.attr('id');  
-    } else {
-      x = $(w).find('span.val');
-      if (!x.length) {
-        return false;
-      }
-      var id = x.attr('data-de') + '-' + x.attr('data-co') + '-val';
-    }
-
-    for (var c = 0; c < cocs.length; c++) {
-      if (id.indexOf(cocs[c]) !== -1) {
-        return true;
-      }
-    }
+stella.fieldId = function (w) {
+  var x = $(w).find('input');
+  if (x.length) {
+    return x.attr('id');
+  }
+  x = $(w).find('span.val');
+  if (x.length) {
+    return x.attr('data-de') + '-' + x.attr('data-co') + '-val';
+  }
+  return undefined;
+};
 
+/**
+ * Determine whether the id of an indexed entry field references a coc
+ */
+stella.idHasCoc = function (field, cocs) {
+  if (!field.id) {
     return false;
+  }
 
-  } catch(e) {
-    return false;
+  for (var c = 0; c < cocs.length; c++) {
+    if (field.id.indexOf(cocs[c]) !== -1) {
+      return true;
+    }
   }
-};
\ No newline at end of file
+
+  return false;
+};
@@ -4,30 +4,39 @@
 #		 ./mertide.py -i merdirectory -d /path/to/disagg/files/ [-n] [-f formuid1234,formid2468] [-h]
 #		 ./mertide.py --input=merform.csv --disaggs=/path/to/disagg/files/ [--noconnection] [--forms="formuid1234,formid2468"] [--help]
 
+import io
 import os
 import re
 import csv
 import sys
 import copy
 import json
+import threading
 import zlib
 import base64
 import getopt
 import pprint
+import time
 import random
 import string
 import urllib
+import tempfile
 import hashlib
 import zipfile
 import operator
-import requests
 import datetime
 from collections import defaultdict
-from xml.sax.saxutils import escape
+from xml.sax.saxutils import escape, quoteattr
+from periods import curYear, curQuarter, pepfarReportingQuarter, favoritePeriod
 
 # Output logging information to the screen and to logFile
 # logFile is updated as the script runs, instead of only being complete at the end
+# In a worker process compiling rules, lines are kept in logBuffer for the main process to log instead,
+# and before a run has opened logFile (or when MERtide is imported), lines are only printed
 def log(line, level = False):
+	if logBuffer is not None:
+		logBuffer.append((line, level))
+		return
 	if level == 'warn':
 		prefix = '*Warning: '
 	elif level == 'severe':
@@ -37,9 +46,334 @@ def log(line, level = False):
 	else:
 		prefix = ''
 	print(prefix + line)
-	logFile.write(prefix + line + '\n')
-	logFile.flush()
-	os.fsync(logFile.fileno())
+	if logFile:
+		logFile.write(prefix + line + '\n')
+		logFile.flush()
+		os.fsync(logFile.fileno())
+
+# Write an output artifact, but only if its content differs from the file already in outDir.
+# The file on disk is compared (by size, and then by hash), not the manifest of the previous run,
+# so a file left truncated by a run that died or edited by hand is always rewritten.  Changed
+# artifacts are written to a temporary file and renamed into place, so that anything syncing
+# output/ never sees a partially written file.
+def writeOutput(filename, content, mode = 0o644):
+	if isinstance(content, str):
+		content = content.encode('utf-8')
+	digest = hashlib.sha256(content).hexdigest()
+	outputManifest[filename] = digest
+	if outputDigest(filename, len(content)) == digest:
+		return False
+	fd, tempName = tempfile.mkstemp(dir=outDir, prefix='.' + filename + '.')
+	with os.fdopen(fd, 'wb') as tempFile:
+		tempFile.write(content)
+	os.chmod(tempName, mode)
+	os.replace(tempName, outDir + filename)
+	changedOutputs.append(filename)
+	return True
+
+# Build a zip file in memory containing a single file.  The timestamp is fixed so that
+# the same content always produces the same zip, and the zip is only rewritten when
+# its content has actually changed.
+def zipOutput(filename, content):
+	return zipOutputFiles([(filename, content)])
+
+# Build a zip file in memory containing several files, given as (filename, content) pairs, like zipOutput
+def zipOutputFiles(files):
+	buffer = io.BytesIO()
+	z = zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED)
+	for (filename, content) in files:
+		if isinstance(content, str):
+			content = content.encode('utf-8')
+		info = zipfile.ZipInfo(filename, date_time=(1980, 1, 1, 0, 0, 0))
+		info.compress_type = zipfile.ZIP_DEFLATED
+		info.external_attr = 0o644 << 16
+		z.writestr(info, content)
+	z.close()
+	return buffer.getvalue()
+
+# The sha256 of an artifact already in outDir, or None if it is missing, can't be read or is not the given size
+def outputDigest(filename, size):
+	try:
+		if os.path.getsize(outDir + filename) != size:
+			return None
+		with open(outDir + filename, 'rb') as f:
+			return hashlib.sha256(f.read()).hexdigest()
+	except OSError:
+		return None
+
+# Remove artifacts left over from previous runs that this run did not produce,
+# then write the manifest of this run and the list of changed artifacts
+def finishOutput():
+	removed = []
+	for f in sorted(os.listdir(outDir)):
+		if f not in outputManifest and f not in keepOutputs and os.path.isfile(outDir + f):
+			os.remove(outDir + f)
+			removed.append(f)
+	for filename, content in [(manifestFile, {'artifacts': outputManifest}),
+							  (changesFile, {'changed': sorted(changedOutputs), 'removed': removed})]:
+		fd, tempName = tempfile.mkstemp(dir=outDir, prefix='.' + filename + '.')
+		with os.fdopen(fd, 'w') as tempFile:
+			tempFile.write(json.dumps(content, sort_keys=True, indent=2, separators=(',', ': ')))
+		os.chmod(tempName, 0o644)
+		os.replace(tempName, outDir + filename)
+	log('Wrote ' + str(len(changedOutputs)) + ' changed artifact(s), ' + str(len(outputManifest) - len(changedOutputs)) +
+		' unchanged, ' + str(len(removed)) + ' removed')
+
+# Start the outputs of a run: make outDir, open logFile and remove the manifest and the list of changed
+# artifacts of the previous run.  They are only written again by finishOutput, so a run that stops early
+# leaves none next to the artifacts it may have partly rewritten.
+def startOutput():
+	global logFile
+	if not(os.path.exists(outDir)):
+		os.makedirs(outDir)
+	logFile = open(outDir+'mertide.log', 'w')
+	for filename in [manifestFile, changesFile]:
+		if os.path.exists(outDir + filename):
+			os.remove(outDir + filename)
+
+# Read the api endpoint and credentials from /opt/dhis2/dish.json, log in to DHIS2 and keep the session
+# (with its cookies) for every later request.  Nothing connects to DHIS2 until something needs it:
+# run checks the connection first, and anything else connects on its first request (see dhisGet).
+# Returns whether DHIS2 could be reached.
+def connectDhis():
+	global api, credentials, dhisSession, dhisConnected
+	import requests
+	try:
+		config = json.load(open('/opt/dhis2/dish.json', 'r'))
+		api = config['dhis']['baseurl'] + '/api/'
+		credentials = (config['dhis']['username'], config['dhis']['password'])
+	except FileNotFoundError:
+		# If you wish to hardcode the api endpoint and the username and password, you can do that here
+		api = 'http://localhost:8080/api/'
+		credentials = ('user', 'password')
+	dhisSession = requests.Session()
+	dhisSession.pid = os.getpid()
+	dhisSession.thread = threading.get_ident()
+	try:
+		dhisSession.get(api, auth=credentials)
+		dhisConnected = bool(dhisSession.get(api + 'resources.json').json()['resources'][0])
+	except Exception:
+		dhisConnected = False
+	return dhisConnected
+
+# The session to DHIS2 of the calling thread, connecting to DHIS2 first if needed.  A requests Session is not
+# thread safe, so only the thread that connected uses the session of connectDhis; any other thread (see
+# doControlFile), or a process forked by compileRules, makes its own session with the same cookies.
+def threadSession():
+	if dhisSession is None:
+		connectDhis()
+	if dhisSession.pid == os.getpid() and dhisSession.thread == threading.get_ident():
+		return dhisSession
+	session = getattr(threadSessions, 'session', None)
+	if session is None or session.pid != os.getpid():
+		import requests
+		session = requests.Session()
+		session.cookies.update(dhisSession.cookies)
+		session.pid = os.getpid()
+		threadSessions.session = session
+	return session
+
+# Get a resource from the DHIS2 api and return its JSON, connecting to DHIS2 first if needed.  While
+# compileRules compiles rules in a pool, the responses are kept in ruleResponses, and a worker gets the
+# responses the main process already got from there (as a copy, since callers may change them).
+def dhisGet(path, params = None):
+	if ruleResponses is not None:
+		key = responseKey(path, params)
+		if key not in ruleResponses:
+			ruleResponses[key] = fetchDhis(path, params)
+		return copy.deepcopy(ruleResponses[key])
+	return fetchDhis(path, params)
+
+# The key of a request to DHIS2 in ruleResponses
+def responseKey(path, params):
+	return json.dumps([path, params], sort_keys=True)
+
+# Get a resource from the DHIS2 api, through the HTTP cache with --httpcache
+def fetchDhis(path, params):
+	session = threadSession()
+	if httpCacheDir:
+		return cachedGet(session, path, params)
+	return session.get(api + path, params=params).json()
+
+# Open the persistent cache of DHIS2 responses (--httpcache), making its directory if needed.  The directory
+# is group writable and new files in it keep its group, so the users of a build host can share it.
+# Returns whether the cache can be used.
+def openHttpCache():
+	try:
+		if not os.path.isdir(httpCacheDir):
+			os.makedirs(httpCacheDir)
+			os.chmod(httpCacheDir, 0o2775)
+		return os.access(httpCacheDir, os.R_OK | os.W_OK | os.X_OK)
+	except OSError:
+		return False
+
+# The file caching the response to a GET of path with params, from the DHIS2 instance at api for the user
+# of credentials.  What DHIS2 returns depends on the sharing of the user, so users never share responses.
+def httpCacheFile(path, params):
+	key = json.dumps([api, credentials[0], path, params], sort_keys=True)
+	return os.path.join(httpCacheDir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+# The time to live, in seconds, of the response to a lookup of one object by uid (like dataElements for
+# dataElements/<uid>.json).  Anything else, like the download of every data element, is always revalidated,
+# so an object added to DHIS2 since it was cached is never missing.
+def httpCacheTTL(path):
+	r = re.fullmatch(r'(\w+)/\w{11}\.json', path)
+	return httpCacheTTLs.get(r.group(1), 0) if r else 0
+
+# Save a cached response, replacing the file at once so that other runs never read part of it
+def writeHttpCache(filename, entry):
+	try:
+		fd, tempName = tempfile.mkstemp(dir=httpCacheDir, prefix='.')
+		with os.fdopen(fd, 'w') as tempFile:
+			json.dump(entry, tempFile)
+		os.chmod(tempName, 0o664)
+		os.replace(tempName, filename)
+	except OSError as e:
+		log('Unable to write to the HTTP cache ' + httpCacheDir + ': ' + str(e), 'warn')
+
+# Get a resource from the DHIS2 api through the persistent cache.  A response younger than the time to live
+# of its endpoint is used as it is; an older one is revalidated with its ETag and Last-Modified date, and
+# only fetched again if DHIS2 says it has changed.  Using a cached response touches its file, so that
+# trimHttpCache evicts the least recently used responses first.
+def cachedGet(session, path, params):
+	filename = httpCacheFile(path, params)
+	try:
+		entry = json.load(open(filename, 'r'))
+	except (OSError, ValueError):
+		entry = None
+	if entry and time.time() - entry.get('stored', 0) < httpCacheTTL(path):
+		httpCacheStats['fresh'] += 1
+		try:
+			os.utime(filename)
+		except OSError:
+			pass
+		return entry['body']
+	headers = {}
+	if entry and entry.get('etag'):
+		headers['If-None-Match'] = entry['etag']
+	if entry and entry.get('lastModified'):
+		headers['If-Modified-Since'] = entry['lastModified']
+	response = session.get(api + path, params=params, headers=headers)
+	if entry and response.status_code == 304:
+		httpCacheStats['revalidated'] += 1
+		entry['stored'] = time.time()
+		writeHttpCache(filename, entry)
+		return entry['body']
+	httpCacheStats['fetched'] += 1
+	body = response.json()
+	entry = {'stored': time.time(), 'etag': response.headers.get('ETag'), 'lastModified': response.headers.get('Last-Modified'), 'body': body}
+	if response.status_code == 200 and (httpCacheTTL(path) or entry['etag'] or entry['lastModified']):
+		writeHttpCache(filename, entry)
+	return body
+
+# Evict the least recently used responses until the HTTP cache is no larger than httpCacheSize
+def trimHttpCache():
+	entries = []
+	for f in os.scandir(httpCacheDir):
+		if f.name.endswith('.json'):
+			try:
+				stat = f.stat()
+				entries.append((stat.st_mtime, stat.st_size, f.path))
+			except OSError:
+				pass
+	size = sum(e[1] for e in entries)
+	evicted = 0
+	for mtime, fileSize, filename in sorted(entries):
+		if size <= httpCacheSize:
+			break
+		try:
+			os.remove(filename)
+			evicted += 1
+		except OSError:
+			pass
+		size -= fileSize
+	log('HTTP cache: ' + str(httpCacheStats['fresh']) + ' fresh, ' + str(httpCacheStats['revalidated']) + ' revalidated, ' +
+		str(httpCacheStats['fetched']) + ' fetched, ' + str(evicted) + ' evicted')
+
+# Get a validation rule group with its current members, or None if it can't be retrieved
+def getValidationRuleGroup(uid):
+	try:
+		group = dhisGet('validationRuleGroups/' + uid + '.json', {'fields': 'id,name,validationRules[id]'})
+		if group.get('id') == uid:
+			return group
+	except Exception:
+		pass
+	return None
+
+# Split a metadata payload into chunks of at most importChunkSize objects, keeping
+# the order of the object types, so that validation rules are imported before the
+# group that refers to them
+def chunkMetadata(payload):
+	chunks = []
+	for key in payload:
+		for i in range(0, len(payload[key]), importChunkSize):
+			chunks.append({key: payload[key][i:i + importChunkSize]})
+	return chunks
+
+# The ids of the objects of a metadata payload in order, and a digest of the payload in which each of
+# those ids (wherever it appears, as in the members of a group) is replaced by its position.  New rules
+# get a new uid on every run, so the digest is the same for the same objects in the same order.
+def metadataDigest(payload, params):
+	ids = [o['id'] for key in payload for o in payload[key] if 'id' in o]
+	positions = dict((uid, '#' + str(i)) for (i, uid) in enumerate(ids))
+	text = re.sub(r'"(\w{11})"', lambda m: '"' + positions.get(m.group(1), m.group(1)) + '"', json.dumps(payload, sort_keys=True))
+	return [ids, hashlib.sha256((text + json.dumps(params, sort_keys=True)).encode('utf-8')).hexdigest()]
+
+# Import a metadata payload directly into DHIS2 in chunks, through one pooled session.
+# Each finished chunk is recorded in importProgressFile, with the ids of the payload, so if an
+# import is interrupted, running again with the same objects resumes after the last finished chunk,
+# giving the objects the ids they had in the interrupted run (so that a group imported after the
+# resume refers to the rules imported before it).  Returns True if every chunk was imported.
+def importMetadata(payload, params):
+	import requests
+	[ids, digest] = metadataDigest(payload, params)
+	try:
+		progress = json.load(open(outDir + importProgressFile, 'r'))
+	except (FileNotFoundError, ValueError):
+		progress = {}
+	start = progress.get('done', 0) if progress.get('digest') == digest else 0
+	if start:
+		log('Resuming import after ' + str(start) + ' chunk(s)')
+		previous = dict(zip(ids, progress['ids']))
+		payload = json.loads(re.sub(r'"(\w{11})"', lambda m: '"' + previous.get(m.group(1), m.group(1)) + '"', json.dumps(payload)))
+		ids = progress['ids']
+	chunks = chunkMetadata(payload)
+
+	session = requests.Session()
+	session.auth = credentials
+	session.mount(api, requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=3))
+
+	stats = {'created': 0, 'updated': 0, 'deleted': 0, 'ignored': 0}
+	errors = []
+	for i in range(start, len(chunks)):
+		try:
+			req = session.post(api + 'metadata', params=params, json=chunks[i])
+			report = req.json()
+		except Exception as e:
+			log('Import of chunk ' + str(i + 1) + ' of ' + str(len(chunks)) + ' failed: ' + str(e), 'severe')
+			return False
+		report = report.get('response', report)
+		for key in stats:
+			stats[key] += report.get('stats', {}).get(key, 0)
+		for typeReport in report.get('typeReports', []):
+			for objectReport in typeReport.get('objectReports', []):
+				for errorReport in objectReport.get('errorReports', []):
+					errors.append(str(objectReport.get('uid')) + ': ' + str(errorReport.get('message')))
+		if req.status_code >= 300 or report.get('status') == 'ERROR':
+			log('Import of chunk ' + str(i + 1) + ' of ' + str(len(chunks)) + ' failed with ' + str(req.status_code) +
+				' ' + str(report.get('message', report.get('status', ''))), 'severe')
+			for e in errors:
+				log('Import error: ' + e, 'warn')
+			return False
+		with open(outDir + importProgressFile, 'w') as progressFile:
+			progressFile.write(json.dumps({'digest': digest, 'done': i + 1, 'ids': ids}))
+
+	if os.path.isfile(outDir + importProgressFile):
+		os.remove(outDir + importProgressFile)
+	log('Imported ' + str(len(chunks) - start) + ' of ' + str(len(chunks)) + ' chunk(s): ' + ', '.join(str(stats[key]) + ' ' + key for key in stats))
+	for e in errors:
+		log('Import error: ' + e, 'warn')
+	return True
 
 def getNumeratorDenominator(shortName):
 	numeratorDenominator=re.sub('^.* \((.*)\).*', r'\1', shortName)
@@ -65,102 +399,6 @@ def filenameChecker(filename):
 		return False
 	return True
 
-# current fiscal year for fyoct
-def curFyOct():
-	curQ=(int(datetime.datetime.now().strftime("%m"))+2)//3
-	curY=int(datetime.datetime.now().strftime("%Y"))
-	if curQ == 4:
-		curY = curY + 1
-	return str(curY)
-
-# current year
-def curYear():
-	return str(int(datetime.datetime.now().strftime("%Y")))
-
-def curQuarter():
-	curQ = (int(datetime.datetime.now().strftime("%m"))+2) // 3
-	return str(curQ)
-
-def curISOQuarter():
-	return "FY"+curYear()+"Q"+curQuarter()
-
-# FIXME
-def ISOQuarterToISOSAApr(ISOQuarter):
-	#2018Q4 -> 2018AprilS2
-	#2019Q1 -> 2018AprilS2
-	#2019Q2 -> 2019AprilS1
-	#2019Q3 -> 2019AprilS1
-
-	year = int(ISOQuarter[:4])
-	quarter = int(ISOQuarter[-1])
-	fyaprYear=0
-	fyaprSA=0
-
-	if quarter == 1:
-		fyoctYear = year-1
-		fyaprSA = 2
-	elif quarter == 2:
-		fyoctYear = year
-		fyaprSA = 1
-	elif quarter == 3:
-		fyoctYear = year
-		fyaprSA = 1
-	elif quarter == 4:
-		fyoctYear = year
-		fyaprSA = 2
-
-	return str(fyoctYear)+"AprilS"+str(fyaprSA)
-
-def ISOQuarterToISOFYOctTARGET(ISOQuarter):
-	year = int(ISOQuarter[:4])
-	fyoctYear = year
-	return str(fyoctYear)+"Oct"
-
-def ISOQuarterToISOFYOct(ISOQuarter):
-	year = int(ISOQuarter[:4])
-	quarter = int(ISOQuarter[-1])
-	fyoctYear = 0
-
-	if quarter < 4:
-		fyoctYear = year - 1
-	else:
-		fyoctYear = year
-
-	return str(fyoctYear)+"Oct"
-
-def pepfarReportingQuarter(ISOQuarter,frequency):
-	quarter = int(ISOQuarter[-1])
-
-	if frequency == 'Quarterly':
-		return True
-	elif frequency == 'Semiannually' and (quarter == 1 or quarter == 3):
-		return True
-	elif frequency == 'Annually' and quarter == 3:
-		return True
-
-	return False
-
-def ISOQuarterToFYOctQuarter(ISOQuarter):
-	year = int(ISOQuarter[:4])
-	quarter = int(ISOQuarter[-1])
-	fyoctYear=0
-	fyoctQuarter=0
-
-	if quarter == 1:
-		fyoctQuarter = 2
-		fyoctYear = year
-	elif quarter == 2:
-		fyoctQuarter = 3
-		fyoctYear = year
-	elif quarter == 3:
-		fyoctQuarter = 4
-		fyoctYear = year
-	elif quarter == 4:
-		fyoctQuarter = 1
-		fyoctYear = year+1
-
-	return str(fyoctYear)+"Q"+str(fyoctQuarter)
-
 # Check to see if a string is a properly formatted DHIS2 uid
 def isDhisUid(string):
 	if (len(string) != 11):
@@ -171,13 +409,15 @@ def isDhisUid(string):
 		return False
 	return True
 
-# Find a data element, either using the dataElementCache or DHIS2
+# Find a data element, either using the dataElementCache, the data elements downloaded from DHIS2 at once
+# (see getAllDataElements) or DHIS2
 def getDataElement(uid, optionCombo=False):
+	if uid not in dataElementCache and uid in masterDataElementList:
+		dataElementCache[uid] = {'name': masterDataElementList[uid]['name'], 'shortName': masterDataElementList[uid]['shortName']}
 	if uid not in dataElementCache:
-		d = requests.get(api + 'dataElements.json', cookies=jsessionid,
-						 params = {'paging': False, 'fields': 'name,shortName', 'filter': 'id:eq:' + uid})
+		d = dhisGet('dataElements.json', {'paging': False, 'fields': 'name,shortName', 'filter': 'id:eq:' + uid})
 		try:
-			dataElementCache[uid] = d.json()['dataElements'][0]
+			dataElementCache[uid] = d['dataElements'][0]
 		except:
 			dataElementCache[uid] = {}
 	d = dataElementCache[uid]
@@ -187,7 +427,7 @@ def getDataElement(uid, optionCombo=False):
 		if optionCombo:
 			d['optionCombo'] = getCoc(optionCombo, uid)
 	else:
-		log('Data element ' + uid + ' is missing on ' + config['dhis']['baseurl'], 'warn')
+		log('Data element ' + uid + ' is missing on ' + api, 'warn')
 	return d
 
 # Generate a random uid
@@ -286,42 +526,39 @@ def addDataElement(form, uid, groups, frequency, categoryCombo = False):
 	else:
 		log('Cannot find data element ' + uid + ' in DHIS2')
 
+# Query the api to get all validation rules and cache them, to find the rules that already exist
+def getAllValidationRules():
+	d = dhisGet('validationRules.json', {'paging': False, 'fields': 'name,id,leftSide[expression,description,missingValueStrategy],operator,rightSide[expression,description,missingValueStrategy],description,ruleType,periodType,instruction,importance'})
+	for r in d['validationRules']:
+		rulesCache[hashRule(r)] = r['id']
+		dhisRulesCache[hashRule(r)] = canonicalRule(r)
+		dhisRuleNames[r['id']] = r.get('name', '')
+
 # Query the api to get all DE and put them in a master directory.
 def getAllDataElements():
-	d = requests.get(api + 'dataElements.json', cookies=jsessionid,
-			params = {'paging': False, 'fields': 'name,shortName,id,categoryCombo[id]'})
+	d = dhisGet('dataElements.json', {'paging': False, 'fields': 'name,shortName,id,categoryCombo[id]'})
 
-	for i in d.json()['dataElements']:
+	for i in d['dataElements']:
 		id = i['id']
 		masterDataElementList[id] = {'name' : i['name'], 'shortName': i['shortName'], 'id': i['id'], 'categoryComboID' : i['categoryCombo']['id']}
 
 # Query the api to get all Category Option Combos and put them in a master directory
 def getAllCategoryOptionCombos():
-	d = requests.get(api + 'categoryOptionCombos.json', cookies=jsessionid,
-			params = {'paging': False, 'fields': 'name,id,categoryCombo[name,id]'})
-	for i in d.json()['categoryOptionCombos']:
+	d = dhisGet('categoryOptionCombos.json', {'paging': False, 'fields': 'name,id,categoryCombo[name,id]'})
+	for i in d['categoryOptionCombos']:
 		id = i['id']
 		masterCategoryOptionComboList[id] = {'name' : i['name'], 'id': i['id'], 'categoryComboName': i['categoryCombo']['name'], 'categoryComboID' : i['categoryCombo']['id']}
 
-# Puts DE from forms into a list to be put in the data store.
-def getDataElementCadence():
+# Puts DE from forms into a list to be put in the data store, for the data elements reported in ISOQuarter
+def getDataElementCadence(ISOQuarter):
+	dataElementCadence = []
 	for key, value in formDataElementList.items():
-		if masterDataElementList[key]['shortName'].count('TARGET') == 0 and checkDataElementQuarter(formDataElementList[key]['frequency']):
+		if masterDataElementList[key]['shortName'].count('TARGET') == 0 and pepfarReportingQuarter(ISOQuarter, formDataElementList[key]['frequency']):
 			a = {}
 			a['uid'] = masterDataElementList[key]['id']
 			a['shortName'] = masterDataElementList[key]['shortName']
 			dataElementCadence.append(a)
-
-def checkDataElementQuarter(frequency):
-	quarter = int(favoritesISOQuarter[-1])
-	if frequency == 'Annually' and quarter == 3:
-		return True
-	elif frequency == 'Semiannually' and (quarter == 1 or quarter == 3):
-		return True
-	elif frequency == 'Quarterly' and (quarter >= 1 and quarter <= 4):
-		return True
-	else:
-		return False
+	return dataElementCadence
 
 def findCo(category, coc):
 	for option in category:
@@ -330,15 +567,19 @@ def findCo(category, coc):
 				return co['name']
 	return False
 
+# The request to DHIS2 of getCocsFromOptions for a data element, as [path, params]
+def cocsFromOptionsRequest(uid):
+	return ['dataElements/' + uid + '.json',
+		{'paging': False, 'fields': 'name,id,categoryCombo[name,id,categories[name,id,categoryOptions[name,id]],categoryOptionCombos[name,id,categoryOptions[name,id]]]'}]
+
 def getCocsFromOptions(options, uid):
 	optionCacheId = str(options) + '_' + uid
 	try:
 		if optionCacheId not in optionCache:
-			req = requests.get(api + 'dataElements/' + uid + '.json', cookies=jsessionid,
-				params = {'paging': False, 'fields': 'name,id,categoryCombo[name,id,categories[name,id,categoryOptions[name,id]],categoryOptionCombos[name,id,categoryOptions[name,id]]]'})
+			element = dhisGet(*cocsFromOptionsRequest(uid))
 			categoryCache = []
 			found = []
-			categories = req.json()['categoryCombo']['categories']
+			categories = element['categoryCombo']['categories']
 			for i in range(len(categories)):
 				categoryCache.append({})
 				for co in categories[i]['categoryOptions']:
@@ -354,7 +595,7 @@ def getCocsFromOptions(options, uid):
 					raise ValueError('The option ' + option + ' was not found in the categories for data element ' + uid)
 
 			optionCache[optionCacheId] = []
-			cocs = req.json()['categoryCombo']['categoryOptionCombos']
+			cocs = element['categoryCombo']['categoryOptionCombos']
 			for coc in cocs:
 				for category in categoryCache:
 					found = findCo(category, coc)
@@ -373,14 +614,17 @@ def getCocsFromOptions(options, uid):
 		optionCache[optionCacheId] = []
 	return optionCache[optionCacheId]
 
+# The request to DHIS2 of getCoc for an option combo name and a data element, as [path, params]
+def cocRequest(name, element):
+	return ['dataElements/' + element + '.json', {'paging': False, 'fields': 'id,name,categoryCombo[id,name,categoryOptionCombos[id,name]]',
+		'filter': 'categoryCombo.categoryOptionCombos.name:eq:' + name}]
+
 # Get the category option combo that matches a given name and element
 def getCoc(name, element):
 	try:
 		if (name + '_' + element) not in cocCache and name not in cocCache:
-			req = requests.get(api + 'dataElements/' + element + '.json', cookies=jsessionid,
-				params = {'paging': False, 'fields': 'id,name,categoryCombo[id,name,categoryOptionCombos[id,name]]',
-							'filter': 'categoryCombo.categoryOptionCombos.name:eq:' + name})
-			for coc in req.json()['categoryCombo']['categoryOptionCombos']:
+			d = dhisGet(*cocRequest(name, element))
+			for coc in d['categoryCombo']['categoryOptionCombos']:
 				cocCache2[coc['id']] = coc['name']
 				if coc['name'] == name:
 					cocCache[name + '_' + element] = coc['id']
@@ -499,6 +743,9 @@ def processMertideExpression(expression, rule, missingValue, which, uidCache, sk
 		for term in splitMertideExpression(terms):
 			termnames = []
 			[term, element, options, ignore, optionCombos, missingValueOverride] = parseMertideExpression(term)
+			if term != 'R' and (term + '_' + suffix) not in uidCache:
+				log('Syntax error: Unique id ' + term + ' is not defined for htab ' + suffix + ' in rule ' + ruleText, 'warn')
+				continue
 			try:
 				if operator == 'autocalculate' or operator == 'exclusive_pair':
 					if term == 'R':
@@ -616,12 +863,64 @@ def reformatDataElements(elements):
 	return a
 
 # Create a string from an expression, in which two equivalent expressions will have the same string
-#
-# Note that in very rare circumstances, will give a false positive; for instance,
-# {#aaaaaaaaaaa}+{#bbbbbbbbbbb} will be considered to be the same as {#aaaaaaaaaab}+{#abbbbbbbbbb}
-# Hopefully that never occurs in practice!
+# An expression that is a sum of operands, like #{a}+#{b.c}, is rewritten with its operands sorted,
+# so #{b.c} + #{a} gives the same string; any other expression just loses its whitespace
 def hashExpression(expression):
-	return ''.join(sorted(expression))
+	expression = re.sub(r'\s+', '', expression)
+	if re.fullmatch(r'(#\{[^}]*\}\+)*#\{[^}]*\}', expression):
+		return '+'.join(sorted(expression.split('+')))
+	return expression
+
+# Normalize a validation rule, either from DHIS2 or generated by MERtide, into a flat record of
+# the fields MERtide sets (like leftSide.expression), so that two rules can be compared field by field
+def canonicalRule(rule):
+	record = {}
+	for key in ruleFields:
+		if key in rule:
+			record[key] = rule[key]
+	for side in ['leftSide', 'rightSide']:
+		for key in ruleSideFields:
+			if key in rule.get(side, {}):
+				record[side + '.' + key] = hashExpression(rule[side][key]) if key == 'expression' else rule[side][key]
+	return record
+
+# Compare the generated rules with the rules in DHIS2 in one pass, sorting them into newRules,
+# modifiedRules and oldRules, and return the change set: the new rules, the fields that changed in
+# each modified rule, and the rules in the validation rule group that no control file generated
+def diffRules(group):
+	changes = {'new': [], 'modified': [], 'orphaned': []}
+	generated = set()
+	for (h, j) in generatedRules:
+		generated.add(j['id'])
+		if h not in dhisRulesCache:
+			newRules.append(j)
+			changes['new'].append({'id': j['id'], 'name': j['name']})
+			continue
+		dhisRule = dhisRulesCache[h]
+		rule = canonicalRule(j)
+		# Mutually exclusive rules are symmetric, so line up the sides with the rule in DHIS2
+		if (rule.get('operator') == 'exclusive_pair' and rule.get('leftSide.expression') != dhisRule.get('leftSide.expression') and
+				rule.get('leftSide.expression') == dhisRule.get('rightSide.expression')):
+			for key in ruleSideFields:
+				rule['leftSide.' + key], rule['rightSide.' + key] = rule.get('rightSide.' + key), rule.get('leftSide.' + key)
+		# As before, only the fields retrieved from DHIS2 are compared
+		fields = [key for key in dhisRule if rule.get(key) != dhisRule[key]]
+		if fields:
+			modifiedRules.append(j)
+			changes['modified'].append({'id': j['id'], 'name': j['name'],
+				'changes': [{'field': key, 'dhis2': dhisRule[key], 'mertide': rule.get(key)} for key in fields]})
+		else:
+			oldRules.append(j)
+	# With -f, the rules of the forms that were not made are not generated, so they would all look orphaned
+	if specificForms:
+		log('Only some forms were made, so orphaned rules are not looked for')
+	elif group:
+		for r in group.get('validationRules', []):
+			if r['id'] not in generated:
+				changes['orphaned'].append({'id': r['id'], 'name': dhisRuleNames.get(r['id'], '')})
+	log('Validation rules: ' + str(len(newRules)) + ' new, ' + str(len(modifiedRules)) + ' modified, ' +
+		str(len(oldRules)) + ' unchanged, ' + str(len(changes['orphaned'])) + ' orphaned in group ' + validationRuleGroup)
+	return changes
 
 # Create a string from a rule, in which two equivalent rules will have the same string
 # Deals with the situation of a + b <= c + d being the same as b + a <= d + c
@@ -670,10 +969,741 @@ def encodeQuote(quote):
 	# but it does stop the double encoding that was stopping some rules from working
 	return '"' + urllib.parse.quote(quote[0][1:-1]).replace('%25', '%') + '"'
 
+# Find the ids of the entry inputs in a piece of form HTML, grouped by the ssid of each
+# si_ block that encloses them.  As in meany.js, read-only inputs and inputs in total fields
+# are skipped.
+def findInputs(html):
+	inputs = defaultdict(list)
+	divs = []
+	for tag in re.finditer(r'<(/?)(div|input)\b([^>]*)>', html, flags=re.I):
+		if tag.group(2).lower() == 'div':
+			if tag.group(1):
+				if divs:
+					divs.pop()
+			elif not tag.group(3).rstrip().endswith('/'):
+				c = re.search(r'class\s*=\s*"([^"]*)"', tag.group(3))
+				divs.append(c.group(1) if c else '')
+		else:
+			i = re.search(r'id\s*=\s*"([^"]+-val)"', tag.group(3))
+			if i and 'readonly' not in tag.group(3).lower() and \
+					not [c for c in divs if 'Form_EntryField' in c and 'tot' in c]:
+				for c in divs:
+					for ssid in re.findall(r'\bsi_(\w{8})', c):
+						inputs[ssid].append(i.group(1))
+	return inputs
+
+# Precompile the autocalculate and mutually exclusive rules of a form into one compact table, consumed
+# by functionloader.registerRules.  Subindicator ids (ssids) and category option combos are each listed
+# once, and everything else refers to them by index:
+#   operands:  [ssid] or [ssid, [cocs]], shared by all rules
+#   autocalc:  [[operands to sum], target ssid]
+#   exclusive: [[operands on one side], [operands on the other side]]
+#   fields:    for each ssid used in an exclusive operand, the [de, coc] of each of its inputs, which
+#              --evaluate uses; it is left out of the form, where meany finds the inputs of an ssid itself
+def makeRuleTable(autocalcs, exclusions, ssidInputs):
+	table = {'ssids': [], 'cocs': [], 'operands': [], 'autocalc': [], 'exclusive': [], 'fields': {}}
+	indices = {'ssids': {}, 'cocs': {}, 'operands': {}}
+	def intern(key, value):
+		if value not in indices[key]:
+			indices[key][value] = len(table[key])
+			table[key].append(list(value) if isinstance(value, tuple) else value)
+		return indices[key][value]
+	def operands(side, exclusive):
+		a = []
+		for operand in side:
+			ssid = intern('ssids', operand[0])
+			if exclusive and ssid not in table['fields']:
+				fields = []
+				for i in ssidInputs.get(operand[0], []):
+					parts = i[:-len('-val')].split('-')
+					if len(parts) == 2 and parts not in fields:
+						fields.append(parts)
+				table['fields'][ssid] = fields
+			if len(operand) > 1:
+				o = intern('operands', (ssid, tuple(intern('cocs', coc) for coc in operand[1])))
+			else:
+				o = intern('operands', (ssid,))
+			if o not in a:
+				a.append(o)
+		return a
+	for (source, target) in autocalcs:
+		table['autocalc'].append([operands(source, False), intern('ssids', target[0][0])])
+	for exclusion in exclusions:
+		table['exclusive'].append([operands(exclusion[0], True), operands(exclusion[1], True)])
+	table['operands'] = [[o[0], list(o[1])] if len(o) > 1 else o for o in table['operands']]
+	return table
+
+# Remove comments from javascript, leaving strings, regular expressions and
+# the placeholder comments that makeForm replaces (like //#dataValuesLoaded#) alone
+def stripJsComments(text):
+	out = []
+	last = ''
+	i = 0
+	n = len(text)
+	while i < n:
+		c = text[i]
+		if c in '"\'`':
+			j = i + 1
+			while j < n and text[j] != c:
+				if text[j] == '\\':
+					j += 1
+				j += 1
+			out.append(text[i:j+1])
+			last = c
+			i = j + 1
+		elif text.startswith('//', i):
+			j = text.find('\n', i)
+			if j == -1:
+				j = n
+			if re.match(jsPlaceholder, text[i:j]):
+				out.append(text[i:j])
+			i = j
+		elif text.startswith('/*', i):
+			j = text.find('*/', i + 2)
+			j = n if j == -1 else j + 2
+			out.append('\n' if '\n' in text[i:j] else ' ')
+			i = j
+		elif c == '/' and (last == '' or last in '(,=:[!&|?{};'):
+			# A regular expression literal
+			j = i + 1
+			inClass = False
+			while j < n and text[j] != '\n' and (text[j] != '/' or inClass):
+				if text[j] == '\\':
+					j += 1
+				elif text[j] == '[':
+					inClass = True
+				elif text[j] == ']':
+					inClass = False
+				j += 1
+			out.append(text[i:j+1])
+			last = '/'
+			i = j + 1
+		else:
+			out.append(c)
+			if not c.isspace():
+				last = c
+			i += 1
+	return ''.join(out)
+
+# Compact javascript by removing comments, indentation and blank lines.
+# Line breaks are kept so that automatic semicolon insertion still works.
+def minifyJs(text):
+	lines = [line.strip() for line in stripJsComments(text).split('\n')]
+	return '\n'.join([line for line in lines if line])
+
+# Compact CSS by removing comments and unnecessary white space
+def minifyCss(text):
+	text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+	text = re.sub(r'\s+', ' ', text)
+	text = re.sub(r'\s*([{};,])\s*', r'\1', text)
+	return text.strip()
+
+# Compact the CSS and javascript inside the <style> and <script> blocks of an HTML page
+def minifyHtml(text):
+	text = re.sub(r'(<style[^>]*>)(.*?)(</style>)', lambda m: m.group(1) + minifyCss(m.group(2)) + m.group(3), text, flags=re.S)
+	text = re.sub(r'(<script[^>]*>)(.*?)(</script>)', lambda m: m.group(1) + minifyJs(m.group(2)) + m.group(3), text, flags=re.S)
+	return text
+
+# Write the form CSS and javascript as shared, content-hashed asset files and return the HTML
+# that references them.  Every form then carries only a small per-form script for its rules,
+# instead of its own copy of every asset.
+def bundleAssets(cssText, jsText):
+	jsText = jsText.replace('//#dataValuesLoaded#', 'if (functionloader.formLoaded) {\n      functionloader.formLoaded();\n    }')
+	files = []
+	for (text, extension) in [(cssText, 'css'), (jsText, 'js')]:
+		filename = 'mertide.' + hashlib.sha256(text.encode('utf-8')).hexdigest()[:12] + '.' + extension
+		writeOutput(filename, text)
+		bundledAssets.append([filename, text])
+		if '{file}' in assetBundle:
+			files.append(assetBundle.replace('{file}', filename))
+		else:
+			files.append(assetBundle + filename)
+		log('Shared asset bundle: ' + filename)
+	return assetBundleHTML(files)
+
+# The HTML that references the shared CSS and javascript files (see bundleAssets) at the given URLs
+def assetBundleHTML(files):
+	return '\n<link rel="stylesheet" type="text/css" href="' + files[0] + '" />\n' + \
+		'<script type="text/javascript" src="' + files[1] + '"></script>\n' + \
+		jsStart + '\nfunctionloader.formLoaded = function () {\n//#dataValuesLoaded#\n};\n' + jsEnd + '\n'
+
+# Parse the mutually exclusive (ctl_exclusive) and other (ctl_rules) rules of a control file row
+# into the rules that makeForm compiles once the form is rendered
+def parseRowRules(row, suffix, uids, ssids, periodType):
+	rules = []
+	if row['ctl_exclusive']:
+		left = 'R'
+		action = 'exclusive_pair'
+		exclusions = row['ctl_exclusive'].split(';')
+		for e in exclusions:
+			rules.append([left, action, e, suffix, uids, ssids, row['sub_priority'], 'ctl_exclusive ' + e + ' from row ' + row['ctl_exclusive'], periodType])
+
+	if row['ctl_rules']:
+		if '"' in row['ctl_rules']:
+			row['ctl_rules'] = re.sub('"[^"]*"', encodeQuote, row['ctl_rules'])
+
+		if ';' in row['ctl_rules']:
+			rs = row['ctl_rules'].split(';')
+		else:
+			rs = [row['ctl_rules']]
+
+		for r in rs:
+			operator = False
+			if ('>=' in r):
+				operator = '>='
+				action = 'greater_than_or_equal_to'
+			elif ('<=' in r):
+				operator = '<='
+				action = 'less_than_or_equal_to'
+			elif ('==' in r):
+				operator = '=='
+				action = 'equal_to'
+			elif ('=' in r):
+				operator = '='
+				action = 'autocalculate'
+			elif ('!!!' in r):
+				operator = '!!!'
+				action = 'exclusive_pair'
+			else:
+				log('Syntax error: Cannot compile rule ' + urllib.parse.unquote(r) + ' as it does not have an operator (=, <=, >=, !!!)', 'warn')
+
+			if operator:
+				# Save the rules to process later in the script
+				a = r.split(operator)
+				left = a[0]
+				right = a[1].strip(' ')
+				if (re.search('[^A-Za-z0-9\_\-\+\%\s\.\,\:\"\/\(\)]', left)):
+					log('Syntax error: Rule ' + urllib.parse.unquote(r) + ' cannot be compiled as it either uses an illegal operator (=, <=, >= or !!! allowed) or the left expression has illegal characters (letters, numbers, spaces, parens, and certain symbols (".,_-:/+%) allowed)', 'warn')
+				elif (re.search('[^A-Za-z0-9\_\-\+\%\s\.\,\:\"\/\(\)]', right)):
+					log('Syntax error: Rule ' + urllib.parse.unquote(r) + ' cannot be compiled as it either uses an illegal operator (=, <=, >= or !!! allowed) or the right expression has illegal characters (letters, numbers, spaces, parens, and certain symbols (".,_-:/+%) allowed)', 'warn')
+				else:
+					rules.append([left, action, right, suffix, uids, ssids, row['sub_priority'], 'ctl_rules row ' + urllib.parse.unquote(r), periodType])
+					if row['dhis_ind'] and action == 'autocalculate' and left == 'R' and suffix != 'xta':
+						rules.append([left, 'indicator', right, suffix, uids, ssids, row['sub_priority'], 'indicator for ctl_rules row ' + urllib.parse.unquote(r), row['dhis_ind']])
+	return rules
+
+# Compile one rule from makeForm into either an autocalculation, an indicator, or a validation rule
+# (with its hash, the hash of its sides swapped for mutually exclusive rules, and its javascript operands).
+# Ids are assigned later, in order, by makeForm, so this only depends on the rule and the metadata caches.
+def compileRule(rule, uidCache, skipCache):
+	# Get validation rule period
+	rulePeriod = rule[8]
+
+	[left, leftjs, leftnames, ignore] = processMertideExpression(rule[0], rule, False, 'left', uidCache, skipCache, dataElementCache)
+	[right, rightjs, rightnames, rightMissingValue] = processMertideExpression(rule[2], rule, False, 'right', uidCache, skipCache, dataElementCache)
+
+	if not(right or rightjs):
+		return None
+
+	if rule[1] == 'autocalculate':
+		return ['autocalculate', [rightjs, leftjs]]
+
+	elif rule[1] == 'indicator':
+		if rule[3] == 'dsd':
+			temprule = rule.copy()
+			temprule[3] = 'xta'
+			[tempright, ignore1, temprightnames, ignore2] = processMertideExpression(rule[2], temprule, False, 'right', uidCache, skipCache, dataElementCache)
+			right.extend(tempright)
+			rightnames.extend(temprightnames)
+		n = []
+		for x in right:
+			if x['optionCombo']:
+				n.append('#{' + x['id'] + '.' + x['optionCombo'] + '}')
+			else:
+				n.append('#{' + x['id'] + '}')
+
+		if not re.fullmatch(r'\w{11};.+', rule[8]):
+			log('Syntax error: dhis_ind ' + rule[8] + ' is not an indicator uid and name separated by ; in ' + rule[7], 'warn')
+			return None
+		[uid, name] = rule[8].split(';', 1)
+		return ['indicator', [name, uid, n, ' + '.join(rightnames)]]
+
+	if left == [{}] or right == [{}]:
+		if left == [{}]:
+			log('Syntax error: Left expression appears empty after processing in ' + rule[7], 'warn')
+		if right == [{}]:
+			log('Syntax error: Right expression appears empty after processing in ' + rule[7], 'warn')
+		return None
+
+	j = {}
+	j['importance'] = 'MEDIUM'
+	j['ruleType'] = 'VALIDATION'
+	j['periodType'] = rulePeriod
+	j['operator'] = rule[1]
+	j['leftSide'] = {}
+	j['rightSide'] = {}
+	j['leftSide']['dataElements'] = set([])
+	j['rightSide']['dataElements'] = set([])
+
+	for l in left:
+		j = addExpression(j, 'leftSide', l)
+
+	if j['operator'] == 'less_than_or_equal_to' or j['operator'] == 'greater_than_or_equal_to' or j['operator'] == 'equal_to':
+		if j['operator'] == 'less_than_or_equal_to':
+			j['name'] = ' <= '
+		elif j['operator'] == 'greater_than_or_equal_to':
+			j['name'] = ' >= '
+		else:
+			j['name'] = ' == '
+
+		if rule[6] in skip:
+			j['leftSide']['missingValueStrategy'] = 'SKIP_IF_ALL_VALUES_MISSING'
+		else:
+			j['leftSide']['missingValueStrategy'] = 'NEVER_SKIP'
+			if rule[6] not in neverskip:
+				log('Syntax error: ' + rule[6] + ' not associated with missing value strategy for rule ' + rule[7], 'warn')
+		j['rightSide']['missingValueStrategy'] = 'NEVER_SKIP'
+
+		if rightMissingValue:
+			j['rightSide']['missingValueStrategy'] = rightMissingValue
+		else:
+			log('Error: Unable to identify missing value strategy for right side of rule ' + rule[7] + '; defaulting to NEVER_SKIP', 'warn')
+			j['rightSide']['missingValueStrategy'] = 'NEVER_SKIP'
+
+	elif j['operator'] == 'exclusive_pair':
+		j['name'] = ' :OR: '
+		j['leftSide']['missingValueStrategy'] = 'SKIP_IF_ALL_VALUES_MISSING'
+		j['rightSide']['missingValueStrategy'] = 'SKIP_IF_ALL_VALUES_MISSING'
+
+	for r in right:
+		j = addExpression(j, 'rightSide', r)
+
+	j['name'] = ' + '.join(leftnames) + j['name'] + ' + '.join(rightnames)
+
+	j['description'] = j['name']
+	j['instruction'] = j['name']
+	j['leftSide']['dataElements'] = reformatDataElements(j['leftSide']['dataElements'])
+	j['rightSide']['dataElements'] = reformatDataElements(j['rightSide']['dataElements'])
+	h = hashRule(j)
+	if not h:
+		return None
+
+	hFlipped = False
+	if j['operator'] == 'exclusive_pair':
+		k = copy.deepcopy(j)
+		k['leftSide']['expression'] = j['rightSide']['expression']
+		k['rightSide']['expression'] = j['leftSide']['expression']
+		hFlipped = hashRule(k)
+
+	# Shorten the name if it's over 230 chars
+	j['name'] = j['name'][0:230]
+
+	# Shorten the descriptions if they are over 255 chars
+	j['leftSide']['description'] = j['leftSide']['description'][0:255]
+	j['rightSide']['description'] = j['rightSide']['description'][0:255]
+
+	return ['rule', [j, h, hFlipped, leftjs, rightjs]]
+
+# The terms of an expression, split and parsed as processMertideExpression does: for each part of the
+# expression between +'s, the part and its terms (see parseMertideExpression)
+def expressionTerms(expression):
+	return [[terms, [parseMertideExpression(term) for term in splitMertideExpression(terms)]] for terms in expression.split('+')]
+
+# The sides of a rule that compiling it looks up metadata for, as [terms, rule]: the left and the right
+# side, and for a dsd indicator the right side again with its xta uids
+def ruleSides(rule):
+	right = expressionTerms(rule[2])
+	sides = [[expressionTerms(rule[0]), rule], [right, rule]]
+	if rule[1] == 'indicator' and rule[3] == 'dsd':
+		temprule = rule.copy()
+		temprule[3] = 'xta'
+		sides.append([right, temprule])
+	return sides
+
+# The requests to DHIS2 that looking up the metadata of the sides of a rule can make (see lookupRule),
+# leaving out the ones the metadata caches already answer
+def ruleRequests(sides, uidCache):
+	requests = []
+	for [terms, rule] in sides:
+		for [ignore, parsed] in terms:
+			for [term, element, options, ignore2, optionCombos, ignore3] in parsed:
+				for u in getUids(term, rule[3], rule[4], uidCache):
+					if options and (str(options) + '_' + u) not in optionCache:
+						requests.append(cocsFromOptionsRequest(u))
+					for name in optionCombos:
+						if (name + '_' + u) not in cocCache and name not in cocCache:
+							requests.append(cocRequest(name, u))
+	return requests
+
+# Get the responses to requests to DHIS2, as [path, params], into ruleResponses, with at most dhisConnections
+# of them at once.  A request that fails is left out, so that it is made (and fails) again where it is needed.
+def prefetchResponses(requests):
+	import concurrent.futures
+	def fetch(request):
+		try:
+			return fetchDhis(*request)
+		except Exception:
+			return None
+	requests = dict((responseKey(*request), request) for request in requests if responseKey(*request) not in ruleResponses)
+	with concurrent.futures.ThreadPoolExecutor(dhisConnections) as executor:
+		for (key, response) in zip(requests, executor.map(fetch, requests.values())):
+			if response is not None:
+				ruleResponses[key] = response
+
+# Make a lookup of metadata, adding it to lookups the first time it is made
+def recordLookup(lookups, seen, function, *args):
+	key = (function.__name__, repr(args))
+	if key not in seen:
+		seen.add(key)
+		lookups.append([function, args])
+	return function(*args)
+
+# Look up the metadata of a side of a rule as processMertideExpression does (the same lookups in the same
+# order, leaving a term where it would), without compiling it.  The lookups of option combos, which name them
+# in cocCache2 in the order they are first made, are added to lookups (see recordLookup).  Returns whether
+# the side has any operands in its validation rule.
+def lookupSide(terms, rule, uidCache, lookups, seen):
+	[ignore, operator, ignore2, suffix, alluids, allssids, ignore3, ignore4, ignore5] = rule
+	operands = False
+	for [part, parsed] in terms:
+		for [term, element, options, ignore6, optionCombos, ignore7] in parsed:
+			if term != 'R' and (term + '_' + suffix) not in uidCache:
+				continue
+			try:
+				if operator == 'autocalculate' or operator == 'exclusive_pair':
+					uids = alluids if term == 'R' else uidCache[term + '_' + suffix]
+					for i in range(len(allssids) if term == 'R' else 1):
+						if element:
+							uids[element-1]
+						elif options:
+							recordLookup(lookups, seen, getCocsFromOptions, options, uids[i])
+						elif optionCombos:
+							for coc in optionCombos:
+								recordLookup(lookups, seen, getCoc, coc, uids[i])
+
+				if operator != 'autocalculate':
+					uids = getUids(term, suffix, alluids, uidCache)
+					if element:
+						uids = [uids[element-1]]
+					for u in uids:
+						if options:
+							for coc in recordLookup(lookups, seen, getCocsFromOptions, options, u):
+								getDataElement(u, coc).copy()
+								operands = True
+							getDataElement(u, False)['shortName']
+						elif optionCombos:
+							for coc in optionCombos:
+								recordLookup(lookups, seen, getDataElement, u, coc).copy()
+								operands = True
+							dataElementCache[u]['shortName']
+						else:
+							getDataElement(u, False).copy()
+							operands = True
+							getDataElement(u, False)['shortName']
+			except Exception:
+				pass
+
+		if operator != 'autocalculate' and '.options:' in part:
+			[term, element, ignore6, ignore7, ignore8, ignore9] = parseMertideExpression(part)
+			uids = getUids(term, suffix, alluids, uidCache)
+			if element:
+				uids = [uids[element-1]]
+			for u in uids:
+				getDataElement(u, False)['shortName']
+	return operands
+
+# Look up the metadata a rule needs as compileRule does, given its sides (see ruleSides): the xta side of a
+# dsd indicator is only looked up if its right side has operands
+def lookupRule(sides, uidCache, lookups, seen):
+	lookupSide(sides[0][0], sides[0][1], uidCache, lookups, seen)
+	if lookupSide(sides[1][0], sides[1][1], uidCache, lookups, seen) and len(sides) > 2:
+		lookupSide(sides[2][0], sides[2][1], uidCache, lookups, seen)
+
+# Start a worker of the pool of compileRules with everything its batches need, which it gets once: the rules,
+# their uids and priorities, the metadata caches as they were before the first batch, the lookups first made in
+# each batch and the responses from DHIS2
+def startRuleWorker(rules, uidCache, skipCache, caches, lookups, responses):
+	global ruleWorker, ruleResponses
+	ruleWorker = {'rules': rules, 'uidCache': uidCache, 'skipCache': skipCache, 'caches': caches, 'lookups': lookups, 'next': 0}
+	ruleResponses = responses
+
+# Compile a batch of rules in a worker process, returning the compiled rules along with what the worker logged,
+# so that makeForm can replay it in order.  The metadata caches of the worker are brought to where they are
+# before the batch by making the lookups first made in the batches before it (which were not compiled by this
+# worker), in order.  Those lookups log nothing, since the workers that compile their batches log it.
+def compileRuleBatch(n):
+	global logBuffer
+	if n < ruleWorker['next'] or ruleWorker['next'] == 0:
+		for (cache, state) in zip(metadataCaches(), ruleWorker['caches']):
+			cache.clear()
+			cache.update(state)
+		ruleWorker['next'] = 0
+	logBuffer = []
+	for lookups in ruleWorker['lookups'][ruleWorker['next']:n]:
+		for [function, args] in lookups:
+			function(*args)
+	logBuffer = []
+	compiled = [compileTimedRule(rule, ruleWorker['uidCache'], ruleWorker['skipCache'])
+		for rule in ruleWorker['rules'][n * ruleBatchSize:(n + 1) * ruleBatchSize]]
+	ruleWorker['next'] = n + 1
+	return [compiled, logBuffer]
+
+# Compile a rule, returning it along with how long compiling it took
+def compileTimedRule(rule, uidCache, skipCache):
+	start = time.perf_counter()
+	compiled = compileRule(rule, uidCache, skipCache)
+	return [compiled, time.perf_counter() - start]
+
+# The caches of metadata from DHIS2 that compiling rules fills in
+def metadataCaches():
+	return [dataElementCache, optionCache, cocCache, cocCache2]
+
+# Compile the rules of a form, in order, returning each compiled rule with how long it took to compile.
+# With ruleJobs > 1 and enough rules, batches of ruleBatchSize rules are compiled in a pool of forked
+# processes.  Before forking, the requests to DHIS2 that the rules need are made, dhisConnections at a time,
+# and the metadata is looked up in the order compiling the rules looks it up (see lookupRule), noting which
+# lookups are first made in each batch.  Each worker then makes the lookups of the batches before its batch
+# (see compileRuleBatch), from the responses that were kept, and compiles the batch with the same metadata
+# as one process would.  The caches of the main process are left as compiling the rules in order leaves them.
+def compileRules(rules, uidCache, skipCache):
+	global logBuffer, ruleResponses
+	if ruleJobs <= 1 or len(rules) <= ruleBatchSize:
+		return [compileTimedRule(rule, uidCache, skipCache) for rule in rules]
+
+	# What looking up the metadata logs is dropped, since the worker compiling the rule logs it again
+	[logged, logBuffer] = [logBuffer, []]
+	ruleResponses = {}
+	caches = [dict(cache) for cache in metadataCaches()]
+	sides = [ruleSides(rule) for rule in rules]
+	prefetchResponses([request for ruleSide in sides for request in ruleRequests(ruleSide, uidCache)])
+	seen = set()
+	batchLookups = []
+	for i in range(0, len(rules), ruleBatchSize):
+		batchLookups.append([])
+		for ruleSide in sides[i:i + ruleBatchSize]:
+			lookupRule(ruleSide, uidCache, batchLookups[-1], seen)
+	logBuffer = logged
+
+	try:
+		import multiprocessing
+		with multiprocessing.get_context('fork').Pool(min(ruleJobs, len(batchLookups)), startRuleWorker,
+				(rules, uidCache, skipCache, caches, batchLookups, ruleResponses)) as pool:
+			results = pool.map(compileRuleBatch, range(len(batchLookups)), 1)
+	finally:
+		ruleResponses = None
+
+	compiled = []
+	for [batchCompiled, batchLog] in results:
+		for (line, level) in batchLog:
+			log(line, level)
+		compiled.extend(batchCompiled)
+	return compiled
+
+# With --profile, start measuring the time and memory of a part of a form.  Marks can be nested (a form
+# and its rows), so before the peak memory is reset for a new mark, it is kept in every open mark.
+def profileMark():
+	import tracemalloc
+	peak = tracemalloc.get_traced_memory()[1]
+	for mark in profileMarks:
+		mark[2] = max(mark[2], peak)
+	tracemalloc.reset_peak()
+	mark = [time.perf_counter(), tracemalloc.get_traced_memory()[0], 0]
+	profileMarks.append(mark)
+	return mark
+
+# Add the time and peak memory since a mark, along with anything else measured, to the costs of a part of a
+# form: a control file row, as (form, vtab, indicator, row), or a whole form, as (form,)
+def profileAdd(key, mark=None, size=0, compileSeconds=0, rules=0, operands=0):
+	import tracemalloc
+	costs = profileCosts.setdefault(key, {'seconds': 0, 'compileSeconds': 0, 'bytes': 0, 'memory': 0, 'rules': 0, 'operands': 0})
+	if mark:
+		profileMarks.remove(mark)
+		costs['seconds'] += time.perf_counter() - mark[0]
+		costs['memory'] = max(costs['memory'], max(mark[2], tracemalloc.get_traced_memory()[1]) - mark[1])
+	costs['compileSeconds'] += compileSeconds
+	costs['bytes'] += size
+	costs['rules'] += rules
+	costs['operands'] += operands
+
+# The number of operands a compiled rule fans out into, in its validation rule and its javascript
+def countOperands(compiled):
+	if not compiled:
+		return 0
+	[kind, data] = compiled
+	if kind == 'autocalculate':
+		return len(data[0]) + len(data[1])
+	elif kind == 'indicator':
+		return len(data[2])
+	return data[0]['leftSide']['expression'].count('#{') + data[0]['rightSide']['expression'].count('#{') + len(data[3]) + len(data[4])
+
+# Log the profileTop most expensive forms, vtabs, indicators and rows.  Vtabs and indicators add up the
+# costs of their rows.  The render time and memory of a form are measured for the form as a whole, so they
+# include everything else makeForm does; its other costs add up its rows.
+def reportProfile():
+	levels = [['forms', 1], ['vtabs', 2], ['indicators', 3], ['rows', 4]]
+	for [name, depth] in levels:
+		totals = {}
+		for (key, costs) in profileCosts.items():
+			if len(key) < depth:
+				continue
+			total = totals.setdefault(key[:depth], dict.fromkeys(costs, 0))
+			for c in costs:
+				if depth == 1 and (len(key) == 1) != (c in ['seconds', 'memory']):
+					continue
+				total[c] = max(total[c], costs[c]) if c == 'memory' else total[c] + costs[c]
+		ranked = sorted(totals.items(), key=lambda item: item[1]['seconds'] + item[1]['compileSeconds'], reverse=True)
+		log('Most expensive ' + name + ':')
+		for (key, c) in ranked[:profileTop]:
+			log('  %8.1f ms render %8.1f ms rules %8.1f KB html %8.1f KB memory %6d rules %7d operands  %s' % (c['seconds'] * 1000,
+				c['compileSeconds'] * 1000, c['bytes'] / 1024, c['memory'] / 1024, c['rules'], c['operands'], ' / '.join(key)))
+
+# Read the CSS, the javascript and the standalone wrappers, compacting or bundling them as asked, and build
+# htmlBefore, the HTML prefix to use before the form-specific contents.  This happens once, for the first form.
+def loadAssets():
+	global htmlBefore, offlineHtmlBefore, standaloneBefore, standaloneEnd
+	if htmlBefore is not None:
+		return
+
+	# CSS
+	with open(css, "r") as readFile:
+		cssText = readFile.read()
+
+	# All JS Files
+	js = []
+	for (dirpath, dirnames, filenames) in os.walk(jsDir):
+		js.extend(filenames)
+		break
+	jsText = ''
+	for jsFile in js:
+		with open(jsDir+'/'+jsFile, "r") as readFile:
+			if(filenameChecker(jsFile)):
+				jsText+=readFile.read()
+				jsText+="\n"
+
+	standaloneBefore = open(standaloneHTMLa).read()
+	standaloneEnd = open(standaloneHTMLb).read()
+
+	if minifyAssets:
+		cssText = minifyCss(cssText)
+		jsText = minifyJs(jsText)
+		standaloneBefore = minifyHtml(standaloneBefore)
+
+	if assetBundle:
+		assetsHTML = bundleAssets(cssText, jsText)
+		# The offline bundle carries the shared files itself, next to its index.html
+		offlineAssetsHTML = assetBundleHTML([filename for [filename, text] in bundledAssets])
+	else:
+		assetsHTML = "\n"+cssStart+"\n"+cssText+"\n"+cssEnd+"\n"
+		assetsHTML+="\n"+jsStart+"\n"+jsText+"\n"+jsEnd+"\n"
+		offlineAssetsHTML = assetsHTML
+
+	# Major Nav
+	htmlBefore = "<!-- Start Custom DHIS2 Form -->\n"+assetsHTML+majorNavHTML_before+"\n"
+	offlineHtmlBefore = "<!-- Start Custom DHIS2 Form -->\n"+offlineAssetsHTML+majorNavHTML_before+"\n"
+
+# Look up the uid of a data element group of a group set by its name, and remember it.  If the group can't be
+# found this is logged and None is remembered, and addDataElementGroupSets then skips the group set.
+def lookupDataElementGroup(name):
+	dataElementGroupIds[name] = None
+	try:
+		d = dhisGet('dataElementGroups.json', {'paging': False, 'fields': 'name,id', 'filter': 'name:eq:' + name})
+		if not d['dataElementGroups']:
+			log('Data element group ' + name + ' not found in DHIS2, so its group set is left out', 'warn')
+			return
+		dataElementGroupIds[name] = d['dataElementGroups'][0]['id']
+	except Exception as e:
+		log('Unable to look up data element group ' + name + ': ' + repr(e) + ', so its group set is left out', 'warn')
+
+# The names of the data element groups of the group sets (degs1 and degs2) of the rows of a form
+def formDataElementGroupNames(form):
+	names = set()
+	for vtab in form['vtabs']:
+		for indicator in vtab['indicators']:
+			for row in indicator['rows']:
+				for j in ['degs1', 'degs2']:
+					if row[j]:
+						names.add(row[j])
+	return names
+
+# Add the data elements of the rows of a form with data element group sets (degs1 and degs2) to those groups,
+# as well as to the form's own data element groups
+def addDataElementGroupSets(form, degs, frequency):
+	for i in degs:
+		try:
+			if i not in dataElementGroupIds:
+				lookupDataElementGroup(i)
+			if not dataElementGroupIds[i]:
+				continue
+			groups = form['dataElementGroups'].copy()
+			groups.append(dataElementGroupIds[i] + '_' + i)
+			for uid in degs[i]:
+				addDataElement(form, uid, groups, frequency)
+		except Exception as e:
+			pass
+			#log('Syntax error: Problem with data element group set ' + i, 'warn')
+
+# Register the data elements and indicators of a form that is not being made (with -f) in the same order as
+# makeForm, without rendering the form or compiling its validation rules, so that the data element groups,
+# the data elements list, the cadences and the indicators still cover every form, and the forms that are
+# made come out the same as in a build of every form
+def registerForm(form):
+	form['formDataElements'] = set([])
+	degs = {}
+	indicatorRules = []
+	for vtab in form['vtabs']:
+		for htab in findHtabs(vtab):
+			prefix = 'de_' + htab['type'].lower()
+			for indicator in vtab['indicators']:
+				if not htabInIndicator(htab, indicator):
+					continue
+				for row in indicator['rows']:
+					if not row[prefix + '1']:
+						continue
+					plan = compileDisagg(row['sub_disagg'])
+					uids = []
+					ccs = {}
+					for k in ['1', '2', '3']:
+						uid = row[prefix + k]
+						cocs = [coc for [n, coc] in plan['inputs'] if n == k]
+						if cocs:
+							ccs[uid] = masterCategoryOptionComboList[cocs[0]]['categoryComboID']
+						if uid and uid != 'null':
+							addDataElement(form, uid, form['dataElementGroups'], indicator['frequency'], ccs[uid])
+							uids.append(uid)
+					for j in ['degs1', 'degs2']:
+						if row[j]:
+							degs.setdefault(row[j], []).extend(uids)
+					if row['dhis_ind']:
+						indicatorRules.extend(rule for rule in parseRowRules(row, htab['uidsuffix'], uids, [], form['periodType']) if rule[1] == 'indicator')
+	# Like makeForm, the data element group sets take the frequency of the last indicator
+	if not(noconnection) and degs:
+		addDataElementGroupSets(form, degs, indicator['frequency'])
+	# The indicators (dhis_ind) of the form are added like in makeForm, compiling only their rules
+	if not(noconnection):
+		for rule in indicatorRules:
+			compiled = compileRule(rule, form['uniqueIds'], form['priorities'])
+			if compiled:
+				addIndicator(*compiled[1])
+
+# Keep the parts of a standalone form that are not shared with the other forms, for the offline bundle
+# (--offlinebundle): the form's HTML after htmlBefore, the rules it registers when its data values are
+# loaded, and the names of its data elements and of the option combos of their category combos
+def addOfflineForm(form, formFileName, dynamicjs, outputHTML):
+	shared = htmlBefore.replace('//#dataValuesLoaded#', '\n' + dynamicjs)
+	dataElements = [[key, value['name']] for (key, value) in formDataElementList.items() if value['form'] == form['name']]
+	categoryCombos = set(formDataElementList[key]['categoryCombo'] for (key, name) in dataElements)
+	optionCombos = [[key, value['name']] for (key, value) in masterCategoryOptionComboList.items() if value['categoryComboID'] in categoryCombos]
+	offlineForms.append([form['uid'], form['name'], formFileName + '.js', {'name': form['name'], 'dataValuesLoaded': dynamicjs,
+		'html': outputHTML[len(shared):], 'attributeCombo': form['categoryCombo'] != 'bjDvmb4bfuf',
+		'dataElements': dataElements, 'optionCombos': optionCombos}])
+
+# Make the offline bundle: a zip with a small page (offlineBootstrapHTML) listing the forms, a runtime with
+# the standalone wrapper and the HTML shared by every form, and a data file for each form.  The page only
+# loads the runtime and the data of the form that is opened, and puts the standalone form together from them.
+# With --assetbundle, the shared CSS and javascript files are in the zip too, and the runtime refers to them there.
+def makeOfflineBundle():
+	files = [('index.html', open(offlineBootstrapHTML).read().replace('//offlineFormsHere',
+		'mertideOffline.forms = ' + json.dumps([f[:3] for f in offlineForms], separators=(',', ':')) + ';'))]
+	files.append(('runtime.js', 'mertideOffline.runtime(' + json.dumps({'before': standaloneBefore, 'form': offlineHtmlBefore, 'end': standaloneEnd}, separators=(',', ':')) + ');\n'))
+	files.extend(bundledAssets)
+	for [uid, name, filename, data] in offlineForms:
+		files.append(('forms/' + filename, 'mertideOffline.form(' + json.dumps(data, separators=(',', ':')) + ');\n'))
+	return zipOutputFiles(files)
+
 # Make and output a form. This is the core work.
 def makeForm(form):
-	global exportIndicators
 	#pprint.pprint(form)
+	loadAssets()
 	formFileName = safeName(form['name'])
 	form['formDataElements'] = set([])
 	outputHTML = htmlBefore
@@ -682,11 +1712,16 @@ def makeForm(form):
 	vtabNames = []
 	dynamicjs = ''
 	degs = {}
-	uidCache = {}
+	uidCache = form['uniqueIds']
 	uidCache2 = []
+	ssidInputs = defaultdict(list)
+	autocalcRules = []
+	exclusionRules = []
 	warnUidCache = []
-	skipCache = {}
+	skipCache = form['priorities']
+	uniqueIdsSeen = set()
 	rules = []
+	ruleRows = [] # With --profile, the row (as a profileCosts key) each rule came from
 	for i in range(len(form['vtabs'])):
 		vtab = form['vtabs'][i]
 		outputHTML += majorNavHTML_li % (str(i+1), vtab['name']) + "\n"
@@ -697,8 +1732,14 @@ def makeForm(form):
 		vtab = form['vtabs'][i]
 		htabs = findHtabs(vtab) # Find htabs referenced in this vtab
 
+		# With --lazytabs, every vtab after the first is only rendered when it is first opened
+		lazy = lazyTabs and i > 0
+
 		# Build minor navigation (htab navigation)
-		outputHTML += minorNavHTML_before % (str(i+1), str(i+1)) + "\n"
+		if lazy:
+			outputHTML += vtabHTML_start % str(i+1) + lazyTabHTML_start + htabNavHTML_before % str(i+1) + "\n"
+		else:
+			outputHTML += minorNavHTML_before % (str(i+1), str(i+1)) + "\n"
 		for htab in htabs:
 			outputHTML += minorNavHTML_li % (str(i+1), htab['type'], htab['label']) + "\n"
 		outputHTML += minorNavHTML_after + "\n"
@@ -715,31 +1756,31 @@ def makeForm(form):
 				subIndicatorsCount = 0
 
 				if htabInIndicator(htab, indicator):
-					for row in indicator['rows']:
+					for (n, row) in enumerate(indicator['rows']):
 						# Some edge cases will mix DSD/TA/Other _exclusives_ inside the same indicator,
 						# make sure that we only echo out if it has a UID 1
 						if row['de_' + htab['type'].lower() + '1'] :
+							if profileTop:
+								rowKey = (form['name'], vtab['name'], indicator['name'], htab['type'] + ' ' + (row['ctl_uniqueid'] or 'row ' + str(n + 1)))
+								rowMark = profileMark()
 							mutuallyExclusive = row['ctl_exclusive']
 
 							prefix = 'de_' + htab['type'].lower()
 							uids = []
 							ccs = {}
 
+							plan = compileDisagg(row['sub_disagg'])
+							fields = {}
 							for k in ['1', '2', '3']:
 								uid = row[prefix + k]
-								val = open(comboDir + row['sub_disagg'] + '.html').read().find('{deuid' + k + '}')
-								coc = open(comboDir + row['sub_disagg'] + '.html').read()[val+9:val+20]
-								if val > 0:
-									ccs[uid] = masterCategoryOptionComboList[coc]['categoryComboID']
+								cocs = [coc for [n, coc] in plan['inputs'] if n == k]
+								if cocs:
+									ccs[uid] = masterCategoryOptionComboList[cocs[0]]['categoryComboID']
 
 								if uid and uid != 'null':
 									if uid in uidCache2 and uid not in warnUidCache:
 										log(form['name'] + ': The uid ' + uid + ' appears multiple times', 'warn')
 										warnUidCache.append(uid)
-									if masterDataElementList[uid]['categoryComboID'] not in ccs[uid]:
-										log ("The data element " + masterDataElementList[uid]['name'] +
-											 " - " + uid + " DATIM cat combo " + masterDataElementList[uid]['categoryComboID'] +
-											 " does not match the " + row['sub_disagg'] + ".html catcombo(s) " + ccs[uid], 'warn')
 
 									addDataElement(form, uid, form['dataElementGroups'], indicator['frequency'], ccs[uid])
 									uids.append(uid)
@@ -747,29 +1788,28 @@ def makeForm(form):
 
 								if not('autocalc' in row['sub_disagg'] and 'wide' in row['sub_disagg']):
 									# Will need to phase out when CC is removed from .csv
-									if val > 0:
-										if coc in masterCategoryOptionComboList:
-											if masterCategoryOptionComboList[coc]['categoryComboID'] != ccs[uid]:
-												log("Cat Combo: " + masterCategoryOptionComboList[coc]['categoryComboName'] +
-													" - " + masterCategoryOptionComboList[coc]['categoryComboID'] +
-													" found in " + row['sub_disagg'] + ".html does not match the form of cat combo " +
-													k + " " + ccs[uid] + " at " + indicator['name'], 'warn')
-										else:
-											log("Could not find coc in master list: " + row['sub_disagg'] + ". Val is " + str(val),'warn')
-
-								globals()['uid' + k] = uid
+									# Every option combo of the data element's inputs, not only the first, is checked
+									unknown = [coc for coc in cocs if coc not in masterCategoryOptionComboList]
+									if unknown:
+										log("Could not find coc(s) in master list: " + ', '.join(unknown) + " in " + row['sub_disagg'] + ".html", 'warn')
+									for coc in cocs:
+										if coc in masterCategoryOptionComboList and masterCategoryOptionComboList[coc]['categoryComboID'] != ccs[uid]:
+											log("Cat Combo: " + masterCategoryOptionComboList[coc]['categoryComboName'] +
+												" - " + masterCategoryOptionComboList[coc]['categoryComboID'] +
+												" found in " + row['sub_disagg'] + ".html (option combo " + coc + ") does not match the form of cat combo " +
+												k + " " + ccs[uid] + " at " + indicator['name'], 'warn')
+
+								fields['deuid' + k] = uid
 
 							if row['ctl_uniqueid']:
-								if (row['ctl_uniqueid'] + '_' + htab['uidsuffix']) in uidCache:
+								if (row['ctl_uniqueid'] + '_' + htab['uidsuffix']) in uniqueIdsSeen:
 									log('Unique id ' + row['ctl_uniqueid'] + ' for htab ' + htab['uidsuffix'] + ' appears multiple times', 'severe')
-								uidCache[row['ctl_uniqueid'] + '_' + htab['uidsuffix']] = uids
-								skipCache[row['ctl_uniqueid']] = row['sub_priority']
+								uniqueIdsSeen.add(row['ctl_uniqueid'] + '_' + htab['uidsuffix'])
 								ssid = makeSsidHash(row['ctl_uniqueid'], htab['uidsuffix'])
 							else:
 								ssid = makeSsid(htab['uidsuffix'])
-								uidCache[ssid] = uids
 
-							subIndicatorsHTML += '<div class="si_' + ssid + '">\n'
+							rowHTML = '<div class="si_' + ssid + '">\n'
 
 							if 'autocalc' in row['sub_disagg'] and 'wide' in row['sub_disagg']:
 								ssids = [ssid, makeSsid(htab['uidsuffix']), makeSsid(htab['uidsuffix']), makeSsid(htab['uidsuffix'])]
@@ -778,66 +1818,23 @@ def makeForm(form):
 								else:
 									sub_text_1, sub_text_2, sub_text_3 = ['', '', '']
 
-								subIndicatorsHTML += open(comboDir + row['sub_disagg'] + '.html').read().format(
-									priority=row['sub_priority'], priority_css='PEPFAR_Form_Priority_'+safeName(row['sub_priority']),
+								fields.update(priority=row['sub_priority'], priority_css='PEPFAR_Form_Priority_'+safeName(row['sub_priority']),
 									description=row['sub_heading'], sub_text_1=sub_text_1, sub_text_2=sub_text_2, sub_text_3=sub_text_3,
-									ssid1=ssids[1], ssid2=ssids[2], ssid3=ssids[3], deuid1=uid1, deuid2=uid2, deuid3=uid3) + '\n</div>\n\n\n'
+									ssid1=ssids[1], ssid2=ssids[2], ssid3=ssids[3])
 							else:
 								ssids = [ssid]
-								subIndicatorsHTML += open(comboDir + row['sub_disagg'] + '.html').read().format(
-									priority=row['sub_priority'], priority_css='PEPFAR_Form_Priority_'+safeName(row['sub_priority']),
-									description=row['sub_heading'], description2=row['sub_text'],
-									ssid=ssid, deuid1=uid1, deuid2=uid2, deuid3=uid3) + '\n</div>\n\n\n'
-
-							if row['ctl_exclusive']:
-								left = 'R'
-								action = 'exclusive_pair'
-								exclusions = row['ctl_exclusive'].split(';')
-								for e in exclusions:
-									rules.append([left, action, e, htab['uidsuffix'], uids, ssids, row['sub_priority'], 'ctl_exclusive ' + e + ' from row ' + row['ctl_exclusive'], form['periodType']])
-
-							if row['ctl_rules']:
-								if '"' in row['ctl_rules']:
-									row['ctl_rules'] = re.sub('"[^"]*"', encodeQuote, row['ctl_rules'])
-
-								if ';' in row['ctl_rules']:
-									rs = row['ctl_rules'].split(';')
-								else:
-									rs = [row['ctl_rules']]
-
-								for r in rs:
-									operator = False
-									if ('>=' in r):
-										operator = '>='
-										action = 'greater_than_or_equal_to'
-									elif ('<=' in r):
-										operator = '<='
-										action = 'less_than_or_equal_to'
-									elif ('==' in r):
-										operator = '=='
-										action = 'equal_to'
-									elif ('=' in r):
-										operator = '='
-										action = 'autocalculate'
-									elif ('!!!' in r):
-										operator = '!!!'
-										action = 'exclusive_pair'
-									else:
-										log('Syntax error: Cannot compile rule ' + urllib.parse.unquote(r) + ' as it does not have an operator (=, <=, >=, !!!)', 'warn')
-
-									if operator:
-										# Save the rules to process later in the script
-										a = r.split(operator)
-										left = a[0]
-										right = a[1].strip(' ')
-										if (re.search('[^A-Za-z0-9\_\-\+\%\s\.\,\:\"\/\(\)]', left)):
-											log('Syntax error: Rule ' + urllib.parse.unquote(r) + ' cannot be compiled as it either uses an illegal operator (=, <=, >= or !!! allowed) or the left expression has illegal characters (letters, numbers, spaces, parens, and certain symbols (".,_-:/+%) allowed)', 'warn')
-										elif (re.search('[^A-Za-z0-9\_\-\+\%\s\.\,\:\"\/\(\)]', right)):
-											log('Syntax error: Rule ' + urllib.parse.unquote(r) + ' cannot be compiled as it either uses an illegal operator (=, <=, >= or !!! allowed) or the right expression has illegal characters (letters, numbers, spaces, parens, and certain symbols (".,_-:/+%) allowed)', 'warn')
-										else:
-											rules.append([left, action, right, htab['uidsuffix'], uids, ssids, row['sub_priority'], 'ctl_rules row ' + urllib.parse.unquote(r), form['periodType']])
-											if row['dhis_ind'] and action == 'autocalculate' and left == 'R' and htab['uidsuffix'] != 'xta':
-												rules.append([left, 'indicator', right, htab['uidsuffix'], uids, ssids, row['sub_priority'], 'indicator for ctl_rules row ' + urllib.parse.unquote(r), row['dhis_ind']])
+								fields.update(priority=row['sub_priority'], priority_css='PEPFAR_Form_Priority_'+safeName(row['sub_priority']),
+									description=row['sub_heading'], description2=row['sub_text'], ssid=ssid)
+							rowHTML += renderDisagg(plan, fields) + '\n</div>\n\n\n'
+
+							subIndicatorsHTML += rowHTML
+							# Only --evaluate needs the input fields of each ssid
+							if evaluateData:
+								for (inputSsid, inputs) in findInputs(rowHTML).items():
+									ssidInputs[inputSsid].extend(inputs)
+
+							rowRules = parseRowRules(row, htab['uidsuffix'], uids, ssids, form['periodType'])
+							rules.extend(rowRules)
 
 							for x in range(1, 3):
 								j = 'degs' + str(x)
@@ -850,6 +1847,10 @@ def makeForm(form):
 
 							subIndicatorsCount += 1
 
+							if profileTop:
+								ruleRows.extend([rowKey] * len(rowRules))
+								profileAdd(rowKey, rowMark, size=len(rowHTML))
+
 				if(subIndicatorsCount > 0):
 					if(len(htabs) == 1):
 						outputHTML += indicatorHTML_before.format(name=indicator['name'], frequency=indicator['frequency'], title=htab['type'] + ': ' + indicator['name'])
@@ -860,11 +1861,14 @@ def makeForm(form):
 
 			outputHTML += entryAreaHTML_end
 
-		outputHTML += minorNavHTML_end
+		if lazy:
+			outputHTML += divClose + lazyTabHTML_end + divClose
+		else:
+			outputHTML += minorNavHTML_end
 
 	#skipping targets for now
 	#form['name'].count('Targets') == 0
-	if not(nofavorites) and form['name'].count('Narratives') == 0 and (not(specificForms) or form['uid'] in formsToOutput):
+	if not(nofavorites) and form['name'].count('Narratives') == 0:
 
 		favoriteType = ''
 		if form['name'].count('Targets') > 0:
@@ -887,39 +1891,9 @@ def makeForm(form):
 						#print(indicator['name']+" - "+indicator['frequency'])
 
 						favoriteFirstDeShortName=getDataElement(list(findDataElementsFromRow(row))[0])['shortName']
-						#favoriteName="PEPFAR "+ISOQuarterToFYOctQuarter(favoritesISOQuarter)+" "+favoriteType+" "+indicator['name']+" "+getNumeratorDenominator(favoriteFirstDeShortName)+" "+getDisagg(favoriteFirstDeShortName)+" Completeness Review Precursor"
-
-						curISOQuarter="FY"+curYear()+"Q"+curQuarter()
 
-						favoriteName="PEPFAR "+favoritesISOQuarter+" "+favoriteType+" "+indicator['name']+" "+getNumeratorDenominator(favoriteFirstDeShortName)+" "+getDisagg(favoriteFirstDeShortName)+" Completeness Review Precursor"
-
-						favoriteDisplayName=favoriteName
 						favoriteDescription="This is an auto generated favorite made by MERTIDE, this is not intended to be deployed in its current form, but rather a precursor for PPM staff to create the completeness review pivot."
 
-						favoriteId=makeUidHash(favoriteName)
-
-						#log(favoriteName)
-						#no else statement, previous if that checks for a valid frequency would kick out sooner
-
-						favoriteISOPeriod=favoritesISOQuarter
-						favoritePeriodsPreCursor='{"periods": [{"id": ""}]}'
-						favoritePeriods=json.loads(favoritePeriodsPreCursor)
-
-
-						if favoriteType == 'Targets':
-							#favoriteISOPeriod=ISOQuarterToISOFYOctTARGET(favoritesISOQuarter)
-							#HARDCODE IS BAD
-							favoritePeriods['periods'][0]['id']='2019Oct'
-						elif indicator['frequency'] == 'Annually':
-							favoriteISOPeriod=ISOQuarterToISOFYOct(favoritesISOQuarter)
-							favoritePeriods['periods'][0]['id']=favoriteISOPeriod
-						elif indicator['frequency'] == 'Semiannually':
-							favoriteISOPeriod=ISOQuarterToISOSAApr(favoritesISOQuarter)
-							favoritePeriods['periods'][0]['id']=favoriteISOPeriod
-						elif indicator['frequency'] == 'Quarterly':
-							favoriteISOPeriod=favoritesISOQuarter
-							favoritePeriods['periods'][0]['id']=favoriteISOPeriod
-
 						favoriteDataDimensionsItems = {"dataDimensionItems": []}
 
 						for de in findDataElementsFromRow(row):
@@ -927,175 +1901,82 @@ def makeForm(form):
 							favoriteDataDimensionItemTypeFull["dataElement"]["id"] = str(de)
 							favoriteDataDimensionsItems["dataDimensionItems"].append(favoriteDataDimensionItemTypeFull)
 
-						favoriteNew=favoriteStub.copy()
+						# Make the favorite for each quarter in which the indicator is reported
+						for quarter in favoriteQuarters:
+							if not pepfarReportingQuarter(quarter, indicator['frequency']):
+								continue
 
-						favoriteNew['id'] = favoriteId
-						favoriteNew['name'] = favoriteName
-						favoriteNew['displayName'] = favoriteDisplayName
-						favoriteNew['description'] = favoriteDescription
-						favoriteNew['dataDimensionItems'] = favoriteDataDimensionsItems['dataDimensionItems']
-						favoriteNew['periods'] = favoritePeriods['periods']
+							#favoriteName="PEPFAR "+ISOQuarterToFYOctQuarter(quarter)+" "+favoriteType+" "+indicator['name']+" "+getNumeratorDenominator(favoriteFirstDeShortName)+" "+getDisagg(favoriteFirstDeShortName)+" Completeness Review Precursor"
+							favoriteName="PEPFAR "+quarter+" "+favoriteType+" "+indicator['name']+" "+getNumeratorDenominator(favoriteFirstDeShortName)+" "+getDisagg(favoriteFirstDeShortName)+" Completeness Review Precursor"
 
-						if favoriteId not in favoritesCreated:
-							favoritesCreated.append(favoriteId)
-							if indicator['frequency'] == 'Annually':
-								favoriteAnnuallyJSON['reportTables'].append(favoriteNew)
-							if indicator['frequency'] == 'Semiannually':
-								favoriteSemiannuallyJSON['reportTables'].append(favoriteNew)
-							if indicator['frequency'] == 'Quarterly':
-								favoriteQuarterlyJSON['reportTables'].append(favoriteNew)
+							favoriteDisplayName=favoriteName
 
-	if not(noconnection):
-		for rule in rules:
-			# Get validation rule period
-			rulePeriod = rule[8]
-
-			[left, leftjs, leftnames, ignore] = processMertideExpression(rule[0], rule, False, 'left', uidCache, skipCache, dataElementCache)
-			[right, rightjs, rightnames, rightMissingValue] = processMertideExpression(rule[2], rule, False, 'right', uidCache, skipCache, dataElementCache)
-
-			if right or rightjs:
-				if rule[1] == 'autocalculate':
-					dynamicjs += "      stella.autocalc(" + str(rightjs) + ", " + str(leftjs) + ");\n"
-
-				elif rule[1] == 'indicator':
-					if rule[3] == 'dsd':
-						temprule = rule.copy()
-						temprule[3] = 'xta'
-						[tempright, ignore1, temprightnames, ignore2] = processMertideExpression(rule[2], temprule, False, 'right', uidCache, skipCache, dataElementCache)
-						right.extend(tempright)
-						rightnames.extend(temprightnames)
-					n = []
-					for x in right:
-						if x['optionCombo']:
-							n.append('#{' + x['id'] + '.' + x['optionCombo'] + '}')
-						else:
-							n.append('#{' + x['id'] + '}')
+							favoriteId=makeUidHash(favoriteName)
 
-					[uid, name] = rule[8].split(';')
-					exportIndicators.append([name, uid, n, ' + '.join(rightnames)])
+							#log(favoriteName)
+							#no else statement, previous if that checks for a valid frequency would kick out sooner
 
-				else:
-					if left != [{}] and right != [{}]:
-						j = {}
-						j['importance'] = 'MEDIUM'
-						j['ruleType'] = 'VALIDATION'
-						j['periodType'] = rulePeriod
-						j['operator'] = rule[1]
-						j['leftSide'] = {}
-						j['rightSide'] = {}
-						j['leftSide']['dataElements'] = set([])
-						j['rightSide']['dataElements'] = set([])
-
-						for l in left:
-							j = addExpression(j, 'leftSide', l)
-
-						if j['operator'] == 'less_than_or_equal_to' or j['operator'] == 'greater_than_or_equal_to' or j['operator'] == 'equal_to':
-							if j['operator'] == 'less_than_or_equal_to':
-								j['name'] = ' <= '
-							elif j['operator'] == 'greater_than_or_equal_to':
-								j['name'] = ' >= '
-							else:
-								j['name'] = ' == '
+							favoritePeriods={"periods": [{"id": favoritePeriod(quarter, favoriteType, indicator['frequency'])}]}
 
-							if rule[6] in skip:
-								j['leftSide']['missingValueStrategy'] = 'SKIP_IF_ALL_VALUES_MISSING'
-							else:
-								j['leftSide']['missingValueStrategy'] = 'NEVER_SKIP'
-								if rule[6] not in neverskip:
-									log('Syntax error: ' + rule[6] + ' not associated with missing value strategy for rule ' + rule[7], 'warn')
-							j['rightSide']['missingValueStrategy'] = 'NEVER_SKIP'
+							favoriteNew=favoriteStub.copy()
 
-							if rightMissingValue:
-								j['rightSide']['missingValueStrategy'] = rightMissingValue
-							else:
-								log('Error: Unable to identify missing value strategy for right side of rule ' + rule[7] + '; defaulting to NEVER_SKIP', 'warn')
-								j['rightSide']['missingValueStrategy'] = 'NEVER_SKIP'
-
-						elif j['operator'] == 'exclusive_pair':
-							j['name'] = ' :OR: '
-							j['leftSide']['missingValueStrategy'] = 'SKIP_IF_ALL_VALUES_MISSING'
-							j['rightSide']['missingValueStrategy'] = 'SKIP_IF_ALL_VALUES_MISSING'
-
-						for r in right:
-							j = addExpression(j, 'rightSide', r)
-
-						j['name'] = ' + '.join(leftnames) + j['name'] + ' + '.join(rightnames)
-
-						j['description'] = j['name']
-						j['instruction'] = j['name']
-						j['leftSide']['dataElements'] = reformatDataElements(j['leftSide']['dataElements'])
-						j['rightSide']['dataElements'] = reformatDataElements(j['rightSide']['dataElements'])
-						h = hashRule(j)
-						if h:
-							if h in rulesCache:
-								j['id'] = rulesCache[h]
-							else:
-								if j['operator'] == 'exclusive_pair':
-									k = copy.deepcopy(j)
-									k['leftSide']['expression'] = j['rightSide']['expression']
-									k['rightSide']['expression'] = j['leftSide']['expression']
-									h = hashRule(k)
-									if h in rulesCache:
-										j['id'] = rulesCache[h]
-									else:
-										j['id'] = makeUid()
-								else:
-									j['id'] = makeUid()
-
-							# Shorten the name if it's over 230 chars
-							j['name'] = j['name'][0:230]
-
-							# Shorten the descriptions if they are over 255 chars
-							j['leftSide']['description'] = j['leftSide']['description'][0:255]
-							j['rightSide']['description'] = j['rightSide']['description'][0:255]
-
-							rulesCache[h] = 'used' + form['uid']
-
-							# Only add each rule once to DHIS2
-							if not(j['id'].startswith('used')):
-								if h in dhisRulesCache:
-									modified = False
-									for key in dhisRulesCache[h]:
-										if key == 'leftSide' or key == 'rightSide':
-											for key2 in dhisRulesCache[h][key]:
-												if (dhisRulesCache[h][key][key2] != j[key][key2] and
-														(key2 != 'expression' or hashExpression(dhisRulesCache[h][key][key2]) != hashExpression(j[key][key2]))):
-													modified = True
-													break
-										else:
-											if dhisRulesCache[h][key] != j[key]:
-												modified = True
-										if modified:
-											break
-									if modified:
-										modifiedRules.append(j)
-									else:
-										oldRules.append(j)
-								else:
-									newRules.append(j)
+							favoriteNew['id'] = favoriteId
+							favoriteNew['name'] = favoriteName
+							favoriteNew['displayName'] = favoriteDisplayName
+							favoriteNew['description'] = favoriteDescription
+							favoriteNew['dataDimensionItems'] = favoriteDataDimensionsItems['dataDimensionItems']
+							favoriteNew['periods'] = favoritePeriods['periods']
 
-								validationRules.append(j)
+							if favoriteId not in favoritesCreated:
+								favoritesCreated.append(favoriteId)
+								favoriteReportTables[(quarter, indicator['frequency'])].append(favoriteNew)
 
-							if j['operator'] == 'exclusive_pair':
-								dynamicjs += "      meany.autoexclude(" + str(leftjs) + ", " + str(rightjs) + ");\n"
+	if not(noconnection):
+		# Compile the rules, across ruleJobs processes if there are enough of them, and then
+		# assign ids and deduplicate them in order, so the result doesn't depend on ruleJobs
+		for (n, [compiled, seconds]) in enumerate(compileRules(rules, uidCache, skipCache)):
+			if profileTop:
+				profileAdd(ruleRows[n], compileSeconds=seconds, rules=1, operands=countOperands(compiled))
+			if not compiled:
+				continue
+			[kind, data] = compiled
+			if kind == 'autocalculate':
+				autocalcRules.append(data)
+
+			elif kind == 'indicator':
+				addIndicator(*data)
 
+			else:
+				[j, h, hFlipped, leftjs, rightjs] = data
+				if h in rulesCache:
+					j['id'] = rulesCache[h]
+				elif hFlipped:
+					h = hFlipped
+					if h in rulesCache:
+						j['id'] = rulesCache[h]
 					else:
-						if left == [{}]:
-							log('Syntax error: Left expression appears empty after processing in ' + rule[7], 'warn')
-						if right == [{}]:
-							log('Syntax error: Right expression appears empty after processing in ' + rule[7], 'warn')
+						j['id'] = makeUid()
+				else:
+					j['id'] = makeUid()
 
-		for i in degs:
-			try:
-				req = requests.get(api + 'dataElementGroups.json', cookies=jsessionid,
-					params = {'paging': False, 'fields': 'name,id', 'filter': 'name:eq:' + i})
-				groups = form['dataElementGroups'].copy()
-				groups.append(req.json()['dataElementGroups'][0]['id'] + '_' + i)
-				for uid in degs[i]:
-					addDataElement(form, uid, groups, indicator['frequency'])
-			except Exception as e:
-				pass
-				#log('Syntax error: Problem with data element group set ' + i, 'warn')
+				rulesCache[h] = 'used' + form['uid']
+
+				# Only add each rule once to DHIS2
+				if not(j['id'].startswith('used')):
+					generatedRules.append([h, j])
+					validationRules.append(j)
+					ruleForms[j['id']] = form['name']
+
+				if j['operator'] == 'exclusive_pair':
+					exclusionRules.append([leftjs, rightjs])
+
+		if autocalcRules or exclusionRules:
+			table = makeRuleTable(autocalcRules, exclusionRules, ssidInputs)
+			ruleTables.append([form['uid'], table])
+			formTable = {k: table[k] for k in table if k != 'fields'}
+			dynamicjs += "      functionloader.registerRules(" + json.dumps(formTable, separators=(',', ':')) + ");\n"
+
+		addDataElementGroupSets(form, degs, indicator['frequency'])
 
 	else:
 		log('Not connected to DHIS2, so skipping all rules and data element group sets', 'warn')
@@ -1113,14 +1994,11 @@ def makeForm(form):
 	if severe:
 		log('Skipping form due to severe error: ' + form['name'] + ' - ' + form['uid'])
 		return
-	elif specificForms and form['uid'] not in formsToOutput:
-		log('Skipping form: ' + form['name'] + ' - ' + form['uid'])
 	else:
 		log('Creating form: ' + form['name'] + ' - ' + form['periodType'] + ' - ' + form['uid'])
-		formFile = open(outDir+formFileName+'.html', 'w')
 
 		#Creats an offline version of the form for offline specific requests.
-		offlineOutputHTML = open(standaloneHTMLa).read().replace('MER Results: Facility Based', form['name'])
+		offlineOutputHTML = standaloneBefore.replace('MER Results: Facility Based', form['name'])
 
 		insertArray = ""
 		insertArray2 = ""
@@ -1140,11 +2018,10 @@ def makeForm(form):
 		if form['categoryCombo'] == 'bjDvmb4bfuf':
 			offlineOutputHTML = re.sub(r'<!--attributeComboStart(.*)attributeComboEnd-->','',offlineOutputHTML, flags=re.S)
 
-		formFile.write(offlineOutputHTML)
-
+		writeOutput(formFileName + '.html', offlineOutputHTML + standaloneEnd)
 
-		formFile.write(open(standaloneHTMLb).read())
-		formFile.close()
+		if offlineBundle:
+			addOfflineForm(form, formFileName, dynamicjs, outputHTML)
 
 	# Format the dataset for the ouput XML files
 	datasetPrefix = open('codechunks/dataset_prefix.xml').read() \
@@ -1170,30 +2047,29 @@ def makeForm(form):
 	dataElements += '		   </dataSetElements>\n'
 
 	# .xml export file
-	if not(specificForms) or (form['uid'] in formsToOutput):
-		exportDataEntryForms.append(
-			'	   <dataEntryForm id="' + form['formUid'] + '">\n' +
-			'		   <name>' +form['name'] + '</name>\n' +
-			'		   <externalAccess>false</externalAccess>\n' +
-			'		   <style>NORMAL</style>\n' +
-			'		   <htmlCode>\n' + escape(outputHTML) + '\n' +
-			'		   </htmlCode>\n' +
-			'		   <format>2</format>\n' +
-			'	   </dataEntryForm>\n')
+	exportDataEntryForms.append(
+		'	   <dataEntryForm id="' + form['formUid'] + '">\n' +
+		'		   <name>' +form['name'] + '</name>\n' +
+		'		   <externalAccess>false</externalAccess>\n' +
+		'		   <style>NORMAL</style>\n' +
+		'		   <htmlCode>\n' + escape(outputHTML) + '\n' +
+		'		   </htmlCode>\n' +
+		'		   <format>2</format>\n' +
+		'	   </dataEntryForm>\n')
 
-		# Offline forms
+	# Offline forms
 
-		exportStaticHTML.append(outputHTML)
+	exportStaticHTML.append(outputHTML)
 
-		thisDatasetPrefix = datasetPrefix
+	thisDatasetPrefix = datasetPrefix
 
-		if form['workflow']:
-			thisDatasetPrefix += '		  <workflow id="' + form['workflow'] + '" />\n'
+	if form['workflow']:
+		thisDatasetPrefix += '		  <workflow id="' + form['workflow'] + '" />\n'
 
-		exportDatasets.append(thisDatasetPrefix +
-			'		   <dataEntryForm id="' + form['formUid'] + '" />\n' +
-			dataElements +
-			'	   </dataSet>\n')
+	exportDatasets.append(thisDatasetPrefix +
+		'		   <dataEntryForm id="' + form['formUid'] + '" />\n' +
+		dataElements +
+		'	   </dataSet>\n')
 
 # Remove white space from all keys in a row
 def stripWhiteSpace(row):
@@ -1208,7 +2084,8 @@ def stripWhiteSpace(row):
 # form: name, uid, vtabs
 # vtab: name, indicators
 # indicator: name, frequency, rows (SUB / AUTO / DESC)
-def doControlFile(controlFileName):
+# Parse a control file into its forms, yielding each form as soon as it is complete
+def parseControlFile(controlFileName):
 	with open(controlFileName, encoding = "ISO-8859-1") as controlFile:
 		reader = csv.DictReader(controlFile, dialect='excel')
 		form = {} # FORM: name, uid, vtabs
@@ -1217,7 +2094,8 @@ def doControlFile(controlFileName):
 			type = row['Type']
 			if type == 'FORM':
 				if (form): # Not the first FORM
-					makeForm(form)
+					indexForm(form)
+					yield form
 					form = {}
 				form['name'] = row['form_name']
 				form['shortname'] = row['form_shortname']
@@ -1275,7 +2153,516 @@ def doControlFile(controlFileName):
 				form['vtabs'][-1]['indicators'][-1]['rows'].append(row)
 			elif type:
 				log('Error in ' + controlFileName + ': unexpected type' + type + '.', 'warn')
-		makeForm(form)
+		indexForm(form)
+		yield form
+
+# Index the rows of a form once, as it is parsed, so that rules and checks find what they refer to with a
+# lookup, wherever the row is in the form: the data elements of each unique id in each htab (like
+# uniqueid_dsd) and the priority of each unique id, in the form, and the rows of each data element and
+# disagg across every form, in controlIndex.  As when the form is made, a unique id that appears more
+# than once refers to its last row.
+def indexForm(form):
+	form['uniqueIds'] = {}
+	form['priorities'] = {}
+	for vtab in form['vtabs']:
+		for htab in findHtabs(vtab):
+			prefix = 'de_' + htab['type'].lower()
+			for indicator in vtab['indicators']:
+				for (n, row) in enumerate(indicator['rows']):
+					if not row[prefix + '1']:
+						continue
+					label = indicator['name'] + ' / ' + (row['ctl_uniqueid'] or 'row ' + str(n + 1))
+					uids = []
+					for k in ['1', '2', '3']:
+						uid = row[prefix + k]
+						if uid and uid != 'null':
+							uids.append(uid)
+							controlIndex['dataElements'][uid].append([form['name'], label, htab['uidsuffix'], row['sub_disagg'], k])
+					controlIndex['disaggs'][row['sub_disagg']].append([form['name'], label, htab['uidsuffix']])
+					if row['ctl_uniqueid']:
+						form['uniqueIds'][row['ctl_uniqueid'] + '_' + htab['uidsuffix']] = uids
+						form['priorities'][row['ctl_uniqueid']] = row['sub_priority']
+
+# Run a function that gets metadata from DHIS2 in a thread, with at most dhisConnections of them at once
+async def dhisThread(connections, function, *args):
+	import asyncio
+	async with connections:
+		return await asyncio.to_thread(function, *args)
+
+# Compile the disaggs of a form (see compileDisagg), leaving the ones that are missing to validateDataElements
+def compileFormDisaggs(form):
+	for vtab in form['vtabs']:
+		for indicator in vtab['indicators']:
+			for row in indicator['rows']:
+				try:
+					compileDisagg(row['sub_disagg'])
+				except FileNotFoundError:
+					pass
+
+# Make every form of a control file, overlapping the downloads from DHIS2 with each other and with the
+# work on the CPU.  The validation rules, data elements and option combos are downloaded in threads while
+# the assets are loaded and the control file is parsed, and as soon as each form is parsed its disaggs are
+# compiled and its data element groups are looked up.  Every data element is validated once the downloads
+# are done, and nothing is made if any of them would stop the build.  Then the forms are made in order,
+# each as soon as its data element groups are known, while the groups of later forms are looked up.
+# With -f, the forms that were not asked for are only registered (see registerForm), which costs a small
+# part of making them.
+async def doControlFile(controlFileName):
+	import asyncio
+	connections = asyncio.Semaphore(dhisConnections)
+	downloads = [dhisThread(connections, getAllDataElements), dhisThread(connections, getAllCategoryOptionCombos)]
+	if not(noconnection):
+		downloads.append(dhisThread(connections, getAllValidationRules))
+	downloads = [asyncio.create_task(download) for download in downloads]
+	assets = asyncio.create_task(asyncio.to_thread(loadAssets))
+
+	parser = parseControlFile(controlFileName)
+	forms = []
+	formReady = []
+	groupLookups = {}
+	while True:
+		form = await asyncio.to_thread(next, parser, None)
+		if form is None:
+			break
+		forms.append(form)
+		ready = [asyncio.create_task(asyncio.to_thread(compileFormDisaggs, form))]
+		if not(noconnection):
+			for name in sorted(formDataElementGroupNames(form)):
+				if name not in groupLookups:
+					groupLookups[name] = asyncio.create_task(dhisThread(connections, lookupDataElementGroup, name))
+				ready.append(groupLookups[name])
+		formReady.append(ready)
+
+	await asyncio.gather(assets, *downloads)
+	for ready in formReady:
+		await ready[0]
+	problems = validateDataElements()
+	if problems:
+		log('Stopping before making any forms, because of ' + str(problems) + ' problem(s) with data elements and disaggs', 'severe')
+		sys.exit(1)
+	for (form, ready) in zip(forms, formReady):
+		await asyncio.gather(*ready)
+		if specificForms and form['uid'] not in formsToOutput:
+			log('Skipping form: ' + form['name'] + ' - ' + form['uid'])
+			registerForm(form)
+		elif profileTop:
+			mark = profileMark()
+			makeForm(form)
+			profileAdd((form['name'],), mark)
+		else:
+			makeForm(form)
+	if profileTop:
+		reportProfile()
+
+# Check every form of a control file without making it.  Every unique id, .deN, option and optionCombo
+# used by the rules is resolved against the metadata from DHIS2, autocalculations are checked for
+# totals that depend on themselves or that are calculated in more than one way, and unique ids that
+# no rule refers to are listed.  Every problem is logged in one pass, and the number of problems
+# (including the syntax errors found while parsing) is returned.
+def checkControlFile(controlFileName):
+	global logBuffer
+	logBuffer = []
+	forms = {}
+	datasets = {}
+	ruleCount = 0
+	unreferenced = []
+
+	# The category option combo names and category option names of each category combo
+	cocNames = defaultdict(set)
+	optionNames = defaultdict(set)
+	for coc in masterCategoryOptionComboList.values():
+		cocNames[coc['categoryComboID']].add(coc['name'])
+		optionNames[coc['categoryComboID']].update(coc['name'].split(', '))
+
+	formCount = 0
+	for form in parseControlFile(controlFileName):
+		formCount += 1
+		where = form['name'] + ': '
+		if form['uid'] in forms:
+			log(where + 'Form uid ' + form['uid'] + ' is also used by ' + forms[form['uid']], 'warn')
+		forms[form['uid']] = form['name']
+		if form['formUid'] in datasets:
+			log(where + 'Data entry form uid ' + form['formUid'] + ' is also used by ' + datasets[form['formUid']], 'warn')
+		datasets[form['formUid']] = form['name']
+
+		# Collect the rows and their rules, like makeForm; the unique ids are looked up in the form's index
+		uniqueIds = form['uniqueIds']
+		seen = set()
+		used = set()
+		rules = []
+		for vtab in form['vtabs']:
+			for htab in findHtabs(vtab):
+				suffix = htab['uidsuffix']
+				prefix = 'de_' + htab['type'].lower()
+				for indicator in vtab['indicators']:
+					for row in indicator['rows']:
+						if not row[prefix + '1']:
+							continue
+						label = indicator['name'] + ' / ' + (row['ctl_uniqueid'] or 'row ' + str(indicator['rows'].index(row) + 1))
+						if not os.path.isfile(comboDir + row['sub_disagg'] + '.html'):
+							log(where + label + ': Disagg ' + row['sub_disagg'] + '.html not found in ' + comboDir, 'warn')
+						uids = []
+						for k in ['1', '2', '3']:
+							uid = row[prefix + k]
+							if uid and uid != 'null':
+								if not isDhisUid(uid):
+									log(where + label + ': ' + uid + ' is not a valid uid', 'warn')
+								elif masterDataElementList and uid not in masterDataElementList:
+									log(where + label + ': Data element ' + uid + ' is missing on ' + api, 'warn')
+								uids.append(uid)
+						if row['ctl_uniqueid']:
+							node = row['ctl_uniqueid'] + '_' + suffix
+							if node in seen:
+								log(where + label + ': Unique id ' + row['ctl_uniqueid'] + ' for htab ' + suffix + ' appears multiple times', 'warn')
+							seen.add(node)
+						else:
+							node = label + '_' + suffix
+						if row['dhis_ind'] and (len(row['dhis_ind'].split(';')) != 2 or not isDhisUid(row['dhis_ind'].split(';')[0])):
+							log(where + label + ': Indicator ' + row['dhis_ind'] + ' should be a uid and a name separated by ;', 'warn')
+						for rule in parseRowRules(row, suffix, uids, [node], form['periodType']):
+							rules.append([rule, where + label + ': ' + rule[7] + ': '])
+
+		# Resolve the terms of each side of each rule to the unique ids (nodes) they refer to, and to
+		# operands (the node with any .deN, options and optionCombos) for mutually exclusive rules
+		autocalcs = defaultdict(set)
+		for [rule, at] in rules:
+			ruleCount += 1
+			[left, action, right, suffix, alluids, [node], priority, ruleText, periodType] = rule
+			sides = []
+			operands = []
+			for expression in [left, right]:
+				nodes = []
+				operands.append(set())
+				for terms in expression.split('+'):
+					for term in splitMertideExpression(terms) or []:
+						[term, element, options, ignore, optionCombos, missingValueOverride] = parseMertideExpression(term)
+						if term == 'R':
+							uids = alluids
+							nodes.append(node)
+						elif (term + '_' + suffix) in uniqueIds:
+							uids = uniqueIds[term + '_' + suffix]
+							used.add(term + '_' + suffix)
+							nodes.append(term + '_' + suffix)
+						else:
+							log(at + 'Unique id ' + term + ' is not defined for htab ' + suffix, 'warn')
+							continue
+						operands[-1].add((nodes[-1], element, tuple(options), tuple(optionCombos)))
+						if element:
+							if element < 1 or element > len(uids):
+								log(at + term + '.de' + str(element) + ' refers to data element ' + str(element) + ', but there are only ' + str(len(uids)), 'warn')
+								continue
+							uids = [uids[element - 1]]
+						# A row may mix data elements with different disaggs, so an option (or option combo)
+						# only needs to be in the category combo of one of the term's data elements
+						ccs = [masterDataElementList[uid]['categoryComboID'] for uid in uids if uid in masterDataElementList]
+						if ccs:
+							for option in options:
+								if not [cc for cc in ccs if option in optionNames[cc]]:
+									log(at + 'Option ' + option + ' is not in the category combo of any data element of ' + term, 'warn')
+							for optionCombo in optionCombos:
+								if optionCombo not in masterCategoryOptionComboList and not [cc for cc in ccs if optionCombo in cocNames[cc]]:
+									log(at + 'Option combo ' + optionCombo + ' is not in the category combo of any data element of ' + term, 'warn')
+						if missingValueOverride and missingValueOverride not in ['NEVER_SKIP', 'SKIP_IF_ALL_VALUES_MISSING', 'SKIP_IF_ANY_VALUES_MISSING']:
+							log(at + missingValueOverride + ' is not a valid missing value override', 'warn')
+				sides.append(nodes)
+
+			if action in ['less_than_or_equal_to', 'greater_than_or_equal_to', 'equal_to'] and priority not in skip and priority not in neverskip:
+				log(at + priority + ' not associated with missing value strategy', 'warn')
+			if action == 'exclusive_pair' and operands[0] & operands[1]:
+				log(at + 'Excludes ' + ', '.join(sorted(o[0] for o in operands[0] & operands[1])) + ' from itself', 'warn')
+			if action == 'autocalculate':
+				for target in sides[0]:
+					autocalcs[target].add(tuple(sorted(sides[1])))
+
+		# A total calculated in more than one way, or that (through other totals) is part of itself
+		for target in sorted(autocalcs):
+			if len(autocalcs[target]) > 1:
+				log(where + 'Total ' + target + ' is autocalculated in ' + str(len(autocalcs[target])) + ' different ways', 'warn')
+		for cycle in findCycles({target: set(n for sources in autocalcs[target] for n in sources) for target in autocalcs}):
+			log(where + 'Autocalculation depends on itself: ' + ' <- '.join(cycle), 'warn')
+
+		for node in sorted(uniqueIds):
+			if node not in used:
+				unreferenced.append(where + node)
+
+	checkDataElementDisaggs()
+
+	logged = logBuffer
+	logBuffer = None
+	for (line, level) in logged:
+		log(line, level)
+	for node in unreferenced:
+		log('Unique id is never referred to by a rule: ' + node)
+	problems = len([line for (line, level) in logged if level])
+	log('Checked ' + str(formCount) + ' form(s) and ' + str(ruleCount) + ' rule(s): ' + str(problems) + ' problem(s), ' +
+		str(len(unreferenced)) + ' unreferenced unique id(s)')
+	return problems
+
+# Validate the data elements of every form (from controlIndex) in bulk, before any form is made: each data
+# element must be in DHIS2, and each disagg it is used in must exist and have inputs for it with option
+# combos that are in DHIS2.  Each problem is reported once, with every row it affects, and the number of
+# problems (which would otherwise stop the build in the middle of a form) is returned.  Data elements
+# whose category combo in DHIS2 is not the one of their disagg are only warned about.
+def validateDataElements():
+	problems = 0
+	rows = lambda places: ', '.join(formName + ': ' + label + ' (' + suffix + ')' for [formName, label, suffix] in places)
+	missingDisaggs = set()
+	for disagg in sorted(controlIndex['disaggs']):
+		try:
+			compileDisagg(disagg)
+		except FileNotFoundError:
+			log('Disagg ' + disagg + '.html not found in ' + comboDir + ', used in ' + rows(controlIndex['disaggs'][disagg]), 'severe')
+			missingDisaggs.add(disagg)
+			problems += 1
+	for uid in sorted(controlIndex['dataElements']):
+		places = controlIndex['dataElements'][uid]
+		if masterDataElementList and uid not in masterDataElementList:
+			log('Data element ' + uid + ' is not in DHIS2, used in ' + rows([place[:3] for place in places]), 'severe')
+			problems += 1
+			continue
+		uses = defaultdict(list)
+		for [formName, label, suffix, disagg, k] in places:
+			if disagg not in missingDisaggs:
+				uses[(disagg, k)].append([formName, label, suffix])
+		for (disagg, k) in sorted(uses):
+			cocs = [coc for [n, coc] in compileDisagg(disagg)['inputs'] if n == k]
+			if not cocs:
+				log('Disagg ' + disagg + '.html has no inputs for {deuid' + k + '}, where data element ' + uid + ' is used in ' + rows(uses[(disagg, k)]), 'severe')
+				problems += 1
+				continue
+			if masterCategoryOptionComboList:
+				missingCocs = [coc for coc in cocs if coc not in masterCategoryOptionComboList]
+				for coc in missingCocs:
+					log('Option combo ' + coc + ' of {deuid' + k + '} in ' + disagg + '.html is not in DHIS2, where data element ' + uid + ' is used in ' + rows(uses[(disagg, k)]), 'severe')
+				problems += len(missingCocs)
+				if masterDataElementList:
+					for categoryCombo in sorted(set(masterCategoryOptionComboList[coc]['categoryComboID'] for coc in cocs if coc not in missingCocs)):
+						if categoryCombo != masterDataElementList[uid]['categoryComboID']:
+							log('The data element ' + masterDataElementList[uid]['name'] + ' - ' + uid + ' DATIM cat combo ' + masterDataElementList[uid]['categoryComboID'] +
+								' does not match the ' + disagg + '.html catcombo ' + categoryCombo + ', used in ' + rows(uses[(disagg, k)]), 'warn')
+	return problems
+
+# Check, across every form, that each data element is used in disaggs of a single category combo, which
+# is the category combo of the data element in DHIS2
+def checkDataElementDisaggs():
+	for uid in sorted(controlIndex['dataElements']):
+		places = defaultdict(list)
+		for [formName, label, suffix, disagg, k] in controlIndex['dataElements'][uid]:
+			categoryCombo = disaggCategoryCombo(disagg, k)
+			if categoryCombo:
+				places[categoryCombo].append(formName + ': ' + label + ' (' + disagg + ')')
+		if len(places) > 1:
+			log('Data element ' + uid + ' is used in disaggs of ' + str(len(places)) + ' category combos: ' +
+				'; '.join(categoryCombo + ' in ' + ', '.join(places[categoryCombo]) for categoryCombo in sorted(places)), 'warn')
+		elif places and uid in masterDataElementList and masterDataElementList[uid]['categoryComboID'] not in places:
+			log('Data element ' + uid + ' has category combo ' + masterDataElementList[uid]['categoryComboID'] + ' in DHIS2, but is used in disaggs of ' +
+				list(places)[0] + ': ' + ', '.join(list(places.values())[0]), 'warn')
+
+# The category combo of the data element in a position ({deuid1}, {deuid2} or {deuid3}) of a disagg,
+# from the first of its inputs, or None if it can't be found
+def disaggCategoryCombo(disagg, k):
+	try:
+		cocs = [coc for [n, coc] in compileDisagg(disagg)['inputs'] if n == k and coc in masterCategoryOptionComboList]
+	except FileNotFoundError:
+		return None
+	return masterCategoryOptionComboList[cocs[0]]['categoryComboID'] if cocs else None
+
+# Compile a disagg template once into its render plan: the template as [literal, field] segments (as
+# string.Formatter parses it) and every input of a data element in it, as [N, coc] for {deuidN}-coc-val,
+# in order.  A template with a field that str.format treats specially (with a conversion, a format spec,
+# an index or an attribute) keeps no segments, and is rendered with str.format.
+def compileDisagg(disagg):
+	if disagg not in disaggPlans:
+		text = open(comboDir + disagg + '.html').read()
+		segments = []
+		for (literal, field, spec, conversion) in string.Formatter().parse(text):
+			if field is not None and (spec or conversion or not field.isidentifier()):
+				segments = None
+				break
+			segments.append([literal, field])
+		disaggPlans[disagg] = {'text': text, 'segments': segments,
+			'inputs': [[k, coc] for (k, coc) in re.findall(r'\{deuid([123])\}-(\w{11})-val', text)]}
+	return disaggPlans[disagg]
+
+# Render a disagg from its plan (see compileDisagg), given the values of its fields
+def renderDisagg(plan, fields):
+	if plan['segments'] is None:
+		return plan['text'].format(**fields)
+	return ''.join([literal if field is None else literal + fields[field] for [literal, field] in plan['segments']])
+
+# Find the cycles in a graph, given as a dictionary of each node and the set of nodes it depends on,
+# returning each cycle once as a list of nodes that starts and ends with the same node
+def findCycles(graph):
+	cycles = []
+	seen = set()
+	state = {}
+	def visit(node, path):
+		state[node] = 'visiting'
+		path.append(node)
+		for n in sorted(graph.get(node, [])):
+			if state.get(n) == 'visiting':
+				cycle = path[path.index(n):] + [n]
+				key = frozenset(cycle)
+				if key not in seen:
+					seen.add(key)
+					cycles.append(cycle)
+			elif n not in state:
+				visit(n, path)
+		path.pop()
+		state[node] = 'done'
+	for node in sorted(graph):
+		if node not in state:
+			visit(node, [])
+	return cycles
+
+# Read a data value set exported from DHIS2, as JSON or as CSV with a header row, and return its
+# numeric values as [orgUnit, period, attributeOptionCombo, dataElement, categoryOptionCombo, value]
+def readDataValues(filename):
+	if filename.endswith('.json'):
+		with open(filename) as f:
+			rows = json.load(f).get('dataValues', [])
+	else:
+		with open(filename, newline='') as f:
+			rows = [{dataValueColumns.get(k.lower(), k): v for k, v in row.items()} for row in csv.DictReader(f)]
+	dataValues = []
+	for row in rows:
+		if str(row.get('deleted', '')).lower() == 'true':
+			continue
+		try:
+			value = float(row['value'])
+		except (KeyError, TypeError, ValueError):
+			continue
+		dataValues.append([row.get('orgUnit', ''), row.get('period', ''), row.get('attributeOptionCombo', ''),
+			row.get('dataElement', ''), row.get('categoryOptionCombo', ''), value])
+	return dataValues
+
+# Arrange data values into a sparse matrix with a row for each data set (orgUnit, period and attribute option
+# combo) and a column for each operand (de.coc, or de for the total of all of a data element's option combos).
+# Only the cells that have a value are kept: each column is a pair of NumPy arrays (the rows that have a value,
+# in order, and their summed values) if NumPy is installed, or a dictionary of the summed value of each row
+# otherwise.  A data value set of many data sets and operands has few values for each data set, so this is
+# the size of the data values instead of the number of data sets times the number of operands.
+def makeValueMatrix(dataValues, operands):
+	keys = {}
+	columns = {o: i for (i, o) in enumerate(sorted(operands))}
+	cells = []
+	for [orgUnit, period, aoc, de, coc, value] in dataValues:
+		for operand in [de + '.' + coc, de]:
+			if operand in columns:
+				row = keys.setdefault((orgUnit, period, aoc), len(keys))
+				cells.append((row, columns[operand], value))
+	if numpy is not None:
+		values = [[numpy.zeros(0, dtype=int), numpy.zeros(0)] for c in columns]
+		if cells:
+			[rows, cols, vals] = [numpy.array(a) for a in zip(*cells)]
+			[cellIds, inverse] = numpy.unique(cols * len(keys) + rows, return_inverse=True)
+			sums = numpy.bincount(inverse.ravel(), weights=vals)
+			[cellCols, cellRows] = numpy.divmod(cellIds, len(keys))
+			starts = numpy.searchsorted(cellCols, numpy.arange(len(columns) + 1))
+			for c in range(len(columns)):
+				values[c] = [cellRows[starts[c]:starts[c + 1]], sums[starts[c]:starts[c + 1]]]
+	else:
+		values = [{} for c in columns]
+		for (row, col, value) in cells:
+			values[col][row] = values[col].get(row, 0.0) + value
+	return [sorted(keys, key=keys.get), columns, values]
+
+# Sum the operands of one side of a rule for every data set, returning the sums, how many of the operands
+# have a value and how many operands there are.  An operand may be listed more than once.
+def sumSide(matrix, operands):
+	[keys, columns, values] = matrix
+	cols = [columns[o] for o in operands]
+	if numpy is not None:
+		sums = numpy.zeros(len(keys))
+		counts = numpy.zeros(len(keys), dtype=int)
+		for c in cols:
+			[rows, vals] = values[c]
+			sums[rows] += vals
+			counts[rows] += 1
+		return [sums, counts, len(cols)]
+	sums = [0.0] * len(keys)
+	counts = [0] * len(keys)
+	for c in cols:
+		for (row, value) in values[c].items():
+			sums[row] += value
+			counts[row] += 1
+	return [sums, counts, len(cols)]
+
+# Whether a side of a rule is skipped, given how many of its n operands have a value, according to
+# its missing value strategy (otherwise missing values count as zero).  Works on a count or an array of them.
+def skipSide(counts, n, strategy):
+	if strategy == 'SKIP_IF_ANY_VALUES_MISSING':
+		return counts < n
+	elif strategy == 'SKIP_IF_ALL_VALUES_MISSING':
+		return counts == 0
+	return counts < 0
+
+# Find the data sets that violate a rule, given the sums of both of its sides, as a list of row numbers.
+# A rule with a skipped side is not violated, and pairs only look at whether each side has a value.
+def findViolations(operatorName, left, right, leftStrategy, rightStrategy):
+	violated = violatedOperators[operatorName]
+	pair = operatorName.endswith('_pair')
+	[lsum, lcount, ln] = left
+	[rsum, rcount, rn] = right
+	if numpy is not None:
+		if pair:
+			rows = violated(lcount > 0, rcount > 0)
+		else:
+			rows = violated(lsum, rsum) & ~skipSide(lcount, ln, leftStrategy) & ~skipSide(rcount, rn, rightStrategy)
+		return [int(i) for i in numpy.flatnonzero(rows)]
+	if pair:
+		return [i for i in range(len(lsum)) if violated(lcount[i] > 0, rcount[i] > 0)]
+	return [i for i in range(len(lsum)) if violated(lsum[i], rsum[i]) and
+		not(skipSide(lcount[i], ln, leftStrategy) or skipSide(rcount[i], rn, rightStrategy))]
+
+# The operands (de.coc) of a mutually exclusive operand in a rule table, which are the fields of the
+# operand's ssid that reference one of its cocs, the same way meany.index finds them
+def tableOperands(table, operand):
+	fields = table['fields'].get(operand[0], [])
+	if len(operand) > 1:
+		cocs = [table['cocs'][c] for c in operand[1]]
+		fields = [f for f in fields if [coc for coc in cocs if coc in f[0] + '-' + f[1]]]
+	return [de + '.' + coc for (de, coc) in fields]
+
+# Evaluate the generated validation rules and the mutually exclusive rules of each form's rule table
+# against a data value set, and return the violations of each rule, with up to evaluationExamples
+# of the data sets that violate it
+def evaluateRules(dataValues, rules, tables):
+	# NumPy is optional; without it, rules are evaluated one data set at a time
+	global numpy
+	try:
+		import numpy
+	except ImportError:
+		numpy = None
+
+	checks = []
+	for rule in rules:
+		sides = [re.findall(r'#\{([^}]+)\}', rule[side]['expression']) for side in ['leftSide', 'rightSide']]
+		checks.append([{'id': rule['id'], 'name': rule['name'], 'operator': rule['operator']}, sides,
+			rule['leftSide']['missingValueStrategy'], rule['rightSide']['missingValueStrategy']])
+	for (uid, table) in tables:
+		for (n, exclusion) in enumerate(table['exclusive']):
+			sides = [[o for operand in side for o in tableOperands(table, table['operands'][operand])] for side in exclusion]
+			checks.append([{'form': uid, 'exclusive': n}, sides, 'SKIP_IF_ALL_VALUES_MISSING', 'SKIP_IF_ALL_VALUES_MISSING'])
+
+	matrix = makeValueMatrix(dataValues, set(o for check in checks for side in check[1] for o in side))
+	keys = matrix[0]
+	results = {'dataSets': len(keys), 'validationRules': [], 'exclusions': []}
+	for [result, [leftOperands, rightOperands], leftStrategy, rightStrategy] in checks:
+		operatorName = result.get('operator', 'exclusive_pair')
+		left = sumSide(matrix, leftOperands)
+		right = sumSide(matrix, rightOperands)
+		violations = findViolations(operatorName, left, right, leftStrategy, rightStrategy)
+		if not violations:
+			continue
+		result['violations'] = len(violations)
+		result['examples'] = [{'orgUnit': keys[i][0], 'period': keys[i][1], 'attributeOptionCombo': keys[i][2],
+			'leftSide': float(left[0][i]), 'rightSide': float(right[0][i])} for i in violations[:evaluationExamples]]
+		results['exclusions' if 'exclusive' in result else 'validationRules'].append(result)
+
+	log('Evaluated ' + str(len(checks)) + ' rule(s) against ' + str(len(dataValues)) + ' value(s) in ' + str(len(keys)) + ' data set(s): ' +
+		str(len(results['validationRules'])) + ' validation rule(s) and ' + str(len(results['exclusions'])) + ' mutually exclusive rule(s) violated')
+	return results
 
 # Write dataElementGroups to an export file
 def writeDataElementGroups(out):
@@ -1291,40 +2678,198 @@ def writeDataElementGroups(out):
 		out.write('		</dataElementGroup>\n')
 	out.write('	</dataElementGroups>\n')
 
-# Format indicator into XML
-def formatIndicator(key, value):
-	code = key.upper().replace(' ', '_')
-	uid = makeUidHash('datimIndicator' + key)
-	r =  '	    <indicator code="' + code + '" id="' + uid + '" name="' + key + '" shortName="' + key + '">\n'
-	r += '		    <publicAccess>r-------</publicAccess>\n'
-	r += '		    <denominatorDescription>1</denominatorDescription>\n'
-	r += '		    <numeratorDescription>' + key + '</numeratorDescription>\n'
-	r += '		    <numerator>\n'
-	firstValue = True
-	for k in value:
-		if (firstValue):
-			r += '			    '
-			firstValue = False
+# Add an indicator from a dhis_ind row.  Its numerator is kept as the sorted set of its operands, so the
+# same operands in any order make the same numerator.  An indicator defined again (like on another form)
+# is only kept once.  An indicator with the same numerator as another one is still exported, but is
+# reported as a duplicate, since it is likely a mistake in the control files.
+def addIndicator(name, uid, numerator, description):
+	numerator = tuple(sorted(set(numerator)))
+	if uid in exportIndicators:
+		if exportIndicators[uid]['numerator'] != numerator:
+			log('Indicator ' + uid + ' (' + name + ') is defined with more than one numerator, so only the first is used', 'warn')
+		return
+	if numerator in indicatorNumerators:
+		log('Indicator ' + uid + ' (' + name + ') has the same numerator as indicator ' + indicatorNumerators[numerator], 'warn')
+	else:
+		indicatorNumerators[numerator] = uid
+	exportIndicators[uid] = {'name': name, 'numerator': numerator, 'description': description}
+
+# Make the DHIS2 metadata of each indicator, filling in codechunks/indicator.json
+def makeIndicators():
+	stub = json.load(open('codechunks/indicator.json'))
+	indicators = []
+	for (uid, definition) in exportIndicators.items():
+		indicator = copy.deepcopy(stub)
+		indicator.update({'id': uid, 'name': definition['name'], 'shortName': definition['name'][:50],
+			'numerator': '+'.join(definition['numerator']), 'numeratorDescription': definition['description']})
+		indicators.append(indicator)
+	return indicators
+
+# Compare the indicators with the existing indicators in DHIS2, which are fetched at once, and return the
+# change set: the new indicators, the fields that changed in each modified indicator, and the indicators
+# whose numerator is already used by another indicator in DHIS2
+def diffIndicators(indicators):
+	d = dhisGet('indicators.json', {'paging': False, 'fields': 'id,' + ','.join(indicatorFields)})
+	existing = {}
+	numerators = {}
+	for i in d['indicators']:
+		existing[i['id']] = i
+		numerators.setdefault(hashExpression(i.get('numerator', '')), i['id'])
+
+	changes = {'new': [], 'modified': [], 'duplicates': []}
+	for indicator in indicators:
+		uid = indicator['id']
+		same = numerators.get(hashExpression(indicator['numerator']))
+		if same and same != uid:
+			log('Indicator ' + uid + ' (' + indicator['name'] + ') has the same numerator as indicator ' + same + ' in DHIS2', 'warn')
+			changes['duplicates'].append({'id': uid, 'name': indicator['name'], 'dhis2': same})
+		if uid not in existing:
+			changes['new'].append(uid)
+			continue
+		fieldChanges = []
+		for field in indicatorFields:
+			[dhis, mertide] = [existing[uid].get(field), indicator.get(field)]
+			if field == 'numerator':
+				[dhis, mertide] = [hashExpression(dhis or ''), hashExpression(mertide)]
+			if dhis != mertide:
+				fieldChanges.append({'field': field, 'dhis2': existing[uid].get(field), 'mertide': indicator.get(field)})
+		if fieldChanges:
+			changes['modified'].append({'id': uid, 'name': indicator['name'], 'changes': fieldChanges})
+
+	log('Indicators: ' + str(len(changes['new'])) + ' new, ' + str(len(changes['modified'])) + ' modified, ' +
+		str(len(indicators) - len(changes['new']) - len(changes['modified'])) + ' unchanged')
+	return changes
+
+# Make the tables of the data element catalog from the data elements of the forms, the option combos of
+# their category combos, their data element groups and the operands of the generated validation rules
+def makeCatalog():
+	tables = {table: [] for table in catalogTables}
+	optionCombos = defaultdict(list)
+	for coc in masterCategoryOptionComboList.values():
+		optionCombos[coc['categoryComboID']].append(coc)
+	for (uid, element) in formDataElementList.items():
+		categoryCombo = catComboCache.get(uid) or masterDataElementList[uid]['categoryComboID']
+		tables['dataElements'].append([uid, element['name'], masterDataElementList[uid]['shortName'], element['type'],
+			element['form'], categoryCombo, element['frequency']])
+		for coc in optionCombos[categoryCombo]:
+			tables['optionCombos'].append([uid, categoryCombo, coc['id'], coc['name']])
+	for (group, uids) in dataElementGroups.items():
+		for uid in uids:
+			tables['groups'].append([uid, group[:11], group[12:]])
+	for rule in validationRules:
+		for side in ['leftSide', 'rightSide']:
+			for operand in re.findall(r'#\{([^}]+)\}', rule[side]['expression']):
+				[uid, coc] = (operand.split('.') + [''])[:2]
+				tables['rules'].append([uid, coc, rule['id'], side, rule['name'], ruleForms.get(rule['id'], ''),
+					rule['operator'], rule.get('importance', ''), rule.get('periodType', '')])
+	for rows in tables.values():
+		rows.sort()
+	return tables
+
+# Write each table of the catalog as a Parquet file, or as a CSV file if pyarrow is not installed, and write
+# catalogFile, which lists the tables with their files and columns and indexes the rows of each table by
+# its first column, as the first row and the number of rows with each value
+def writeCatalogTables(tables):
+	global pyarrow
+	try:
+		import pyarrow.parquet
+	except ImportError:
+		pyarrow = None
+	catalog = {'format': 'parquet' if pyarrow else 'csv', 'tables': {}}
+	for (table, rows) in tables.items():
+		columns = catalogTables[table]
+		filename = 'catalog_' + table + '.' + catalog['format']
+		if pyarrow:
+			buffer = io.BytesIO()
+			pyarrow.parquet.write_table(pyarrow.table({column: [row[n] for row in rows] for (n, column) in enumerate(columns)}), buffer)
+			writeOutput(filename, buffer.getvalue())
+		else:
+			buffer = io.StringIO()
+			writer = csv.writer(buffer, lineterminator='\n')
+			writer.writerow(columns)
+			writer.writerows(rows)
+			writeOutput(filename, buffer.getvalue())
+		index = {}
+		for (n, row) in enumerate(rows):
+			if row[0] in index:
+				index[row[0]][1] += 1
+			else:
+				index[row[0]] = [n, 1]
+		catalog['tables'][table] = {'file': filename, 'columns': columns, 'rows': len(rows), 'index': index}
+	writeOutput(catalogFile, json.dumps(catalog, sort_keys=True, indent=2, separators=(',', ': ')))
+	log('Wrote the catalog as ' + catalog['format'] + ': ' + ', '.join(str(len(rows)) + ' ' + table for (table, rows) in tables.items()))
+
+# Serialize metadata objects of one type (like indicators) for import into DHIS2, as JSON or as XML
+def serializeMetadata(objects, plural, format):
+	if format == 'json':
+		return json.dumps({plural: objects}, sort_keys=True, indent=2, separators=(',', ': '))
+	out = io.StringIO()
+	out.write('<?xml version="1.0" encoding="utf-8"?>\n<metadata xmlns="http://dhis2.org/schema/dxf/2.0">\n')
+	writeXmlElement(out, plural, objects, 1)
+	out.write('</metadata>\n')
+	return out.getvalue()
+
+# Write a value as an XML element.  The identifying fields of an object (like id and name) are attributes
+# and its other fields are elements, a list has an element for each item (named for the singular of the
+# list's name), and anything else is text
+def writeXmlElement(out, tag, value, depth):
+	indent = '\t' * depth
+	if isinstance(value, list) or isinstance(value, dict):
+		if isinstance(value, list):
+			singular = tag[:-2] if tag.endswith('sses') else tag[:-1]
+			attributes = ''
+			children = [(singular, item) for item in value]
 		else:
-			r += '+'
-		r += '#{' + k + '}'
-	r += '\n'
-	r += '		    </numerator>\n'
-	r += '		    <denominator>1</denominator>\n'
-	r += '		    <annualized>false</annualized>\n'
-	r += '		    <indicatorType id="QEjvmP5XVSn"/>\n'
-	r += '	    </indicator>\n'
-	return(r)
+			attributes = ''.join(' ' + k + '=' + quoteattr(str(value[k])) for k in xmlAttributes if k in value)
+			children = [(k, value[k]) for k in sorted(value) if k not in xmlAttributes]
+		if not children:
+			out.write(indent + '<' + tag + attributes + ' />\n')
+			return
+		out.write(indent + '<' + tag + attributes + '>\n')
+		for (k, v) in children:
+			writeXmlElement(out, k, v, depth + 1)
+		out.write(indent + '</' + tag + '>\n')
+	elif isinstance(value, bool):
+		out.write(indent + '<' + tag + '>' + str(value).lower() + '</' + tag + '>\n')
+	else:
+		out.write(indent + '<' + tag + '>' + escape(str(value)) + '</' + tag + '>\n')
+
+# Given a range (2019Q1-2019Q4) or a list (2019Q1,2019Q3) of quarters, return every quarter in it,
+# or False if it is not one.  Like --favoriteisoquarter, the quarters must be from 2018 on.
+def parseISOQuarters(arg):
+	quarters = []
+	for part in arg.split(','):
+		ends = part.strip().split('-')
+		if len(ends) > 2 or not all(re.fullmatch(r'20\d\dQ[1-4]', q) and int(q[2:4]) >= 18 for q in ends):
+			return False
+		[year, quarter] = [int(ends[0][:4]), int(ends[0][-1])]
+		while True:
+			q = str(year) + 'Q' + str(quarter)
+			if q not in quarters:
+				quarters.append(q)
+			if q == ends[-1]:
+				break
+			if q > ends[-1]:
+				return False
+			[year, quarter] = [year + quarter // 4, quarter % 4 + 1]
+	return quarters
+
+# Name the output file for a quarter, when favorites are made for more than one quarter
+def quarterFileName(filename, ISOQuarter):
+	if len(favoriteQuarters) == 1:
+		return filename
+	[name, extension] = filename.rsplit('.', 1)
+	return name + '_' + ISOQuarter + '.' + extension
 
 # The main function
 def main(argv):
 	curISOQuarter=curYear()+"Q"+curQuarter()
 	# Order of sysargs:
-	sysargs = ['','','',False,'',False,curISOQuarter,False]
-	usage = 'usage: mertide.py -i [merform.csv|merdirectory] -d /path/to/disagg/files/ [options]\n	options:\n	  -n, --noconnection\n			Parse CSV even if there is no connection to DHIS2\n\n	  -f formuid1234,formid2468, --forms=formuid1234,formid2468\n			Only include forms with uid formuid1234 and formuid2468\n\n	  --nofavorites\n			Do not output favorites\n\n	  --html\n			Outputs static HTML versions of the forms\n			for uploading directly to DHIS2\n\n	  --favoriteisoquarter=2019Q1\n			Year and Quarter in which to create favorites override\n			(Defaults to current quarter)\n\n	 -h, --help\n		Prints this message\n'
+	sysargs = ['','','',False,'',False,curISOQuarter,False,False,'',False,1,False,'',[],0,'',False,False,False]
+	usage = 'usage: mertide.py -i [merform.csv|merdirectory] -d /path/to/disagg/files/ [options]\n	options:\n	  -n, --noconnection\n			Parse CSV even if there is no connection to DHIS2\n\n	  -f formuid1234,formid2468, --forms=formuid1234,formid2468\n			Only include forms with uid formuid1234 and formuid2468\n\n	  --nofavorites\n			Do not output favorites\n\n	  --html\n			Outputs static HTML versions of the forms\n			for uploading directly to DHIS2\n\n	  --favoriteisoquarter=2019Q1\n			Year and Quarter in which to create favorites override\n			(Defaults to current quarter)\n\n	  --favoriteisoquarters=2019Q1-2019Q4, --favoriteisoquarters=2019Q1,2019Q3\n			Create favorites and data element cadences for each of these\n			quarters in one run, in files named for each quarter\n\n	  --minify\n			Compact the CSS and javascript included in the forms\n\n	  --assetbundle=https://example.org/api/apps/assets/\n			Write the CSS and javascript once as shared, content-hashed files and\n			reference them from each form at this URL, instead of inlining them\n			({file} in the URL is replaced by the file name)\n\n	  --import\n			Import the new and modified validation rules directly into DHIS2,\n			in chunks that are resumed if the import is interrupted\n\n	  --jobs=4\n			Compile validation rules in this many processes (Defaults to 1)\n\n	  --check\n			Check the control files and their rules against DHIS2 and report\n			every problem found, without making any forms\n\n	  --httpcache=/var/cache/mertide\n			Keep the metadata responses of DHIS2 in this directory between runs,\n			and revalidate them instead of fetching them again\n\n	  --offlinebundle\n			Write offlineForms.zip, with a page that only loads the form that is\n			opened, a runtime shared by the forms and a data file for each form\n\n	  --lazytabs\n			Emit every vertical tab after the first as a template that is only\n			rendered, and set up for data entry, the first time the tab is opened\n\n	  --catalog\n			Write a catalog of the data elements, their option combos, data element\n			groups and rules as Parquet files (or CSV files without pyarrow)\n\n	  --profile=20\n			Measure the time, HTML, memory, rules and operands of each form,\n			vtab, indicator and row, and list the 20 most expensive of each\n\n	  --evaluate=datavalues.csv\n			Evaluate the validation rules and mutually exclusive rules against\n			a data value set exported from DHIS2 (as CSV or JSON) and report\n			the violations of each rule\n\n	 -h, --help\n		Prints this message\n'
 
 	try:
-		opts, args = getopt.getopt(argv,'i:d:f:h:n',['input=','disaggs=','noconnection','forms=','nofavorites','favoriteisoquarter=','html','help'])
+		opts, args = getopt.getopt(argv,'i:d:f:h:n',['input=','disaggs=','noconnection','forms=','nofavorites','favoriteisoquarter=','favoriteisoquarters=','html','minify','assetbundle=','import','jobs=','check','evaluate=','profile=','httpcache=','catalog','offlinebundle','lazytabs','help'])
 	except getopt.GetoptError:
 		log(usage)
 		sys.exit(2)
@@ -1371,7 +2916,48 @@ def main(argv):
 			sysargs[5] = True
 		elif opt in ('--html'):
 			sysargs[7] = True
-		elif opt in ('--favoriteisoquarter'):
+		elif opt in ('--minify'):
+			sysargs[8] = True
+		elif opt in ('--assetbundle'):
+			sysargs[9] = arg
+		elif opt in ('--import'):
+			sysargs[10] = True
+		elif opt in ('--jobs'):
+			if not arg.isdigit() or int(arg) < 1:
+				log('Number of jobs (' + arg + ') is not a positive number', 'severe')
+				log(usage)
+				sys.exit(2)
+			sysargs[11] = int(arg)
+		elif opt in ('--check'):
+			sysargs[12] = True
+		elif opt in ('--profile'):
+			if not arg.isdigit() or int(arg) < 1:
+				log('Number of hotspots (' + arg + ') is not a positive number', 'severe')
+				log(usage)
+				sys.exit(2)
+			sysargs[15] = int(arg)
+		elif opt in ('--httpcache'):
+			sysargs[16] = arg
+		elif opt in ('--catalog'):
+			sysargs[17] = True
+		elif opt in ('--offlinebundle'):
+			sysargs[18] = True
+		elif opt in ('--lazytabs',):
+			sysargs[19] = True
+		elif opt in ('--evaluate'):
+			if not os.path.isfile(arg):
+				log('Data value set (' + arg + ') not found', 'severe')
+				log(usage)
+				sys.exit(2)
+			sysargs[13] = arg
+		elif opt in ('--favoriteisoquarters',):
+			quarters = parseISOQuarters(arg)
+			if not quarters:
+				log('Quarters (' + arg + ') are not a range or list of quarters like 2019Q1', 'severe')
+				log(usage)
+				sys.exit(2)
+			sysargs[14] = quarters
+		elif opt in ('--favoriteisoquarter',):
 			#Example: 2018Q4
 			#Check length, check for the 20, check for the Q
 			if len(arg) == 6 and arg[:2] == '20' and arg[-2] == 'Q':
@@ -1411,16 +2997,17 @@ cocCache = {}
 cocCache2 = {}
 rulesCache = {}
 dhisRulesCache = {}
+dhisRuleNames = {}
+generatedRules = []
 newRules = []
 modifiedRules = []
 validationRules = []
+ruleForms = {} # The name of the form each validation rule was generated for, by rule uid
 oldRules = []
+ruleTables = []
 inputArgs = []
 favoritesCreated = []
-favoriteAnnuallyJSON=json.loads('{"reportTables": []}')
-favoriteSemiannuallyJSON=json.loads('{"reportTables": []}')
-favoriteQuarterlyJSON=json.loads('{"reportTables": []}')
-dataElementCadence= []
+favoriteReportTables = defaultdict(list) # Favorites, by quarter and frequency
 
 noconnection = False
 severe = False
@@ -1436,82 +3023,90 @@ operators = {'equal_to': '==',
 			'exclusive_pair': '[Exclusive pair]'}
 
 outDir = 'output/'
-
-if not(os.path.exists(outDir)):
-	os.makedirs(outDir)
-
-for f in os.listdir(outDir):
-	if (f != '.gitignore' and not(os.path.isdir(f))):
-		os.remove(os.path.join(outDir, f))
-
-logFile = open(outDir+'mertide.log', 'w')
-
-# Get those args!
-if __name__ == '__main__':
-   inputArgs = main(sys.argv[1:])
-
-controlDir = inputArgs[0]
-controlFile = inputArgs[1]
-comboDir = inputArgs[2]
-noconnection = inputArgs[3]
-nofavorites = inputArgs[5]
-favoritesISOQuarter = inputArgs[6]
-statichtml = inputArgs[7]
-
-if controlDir:
-	log('Control Folder: ' + controlDir)
-	if not(controlDir.endswith('/')):
-		controlDir += '/'
-else:
-	log('Control File: ' + controlFile)
-
-log('Disagg Folder: ' + comboDir)
-if not(comboDir.endswith('/')):
-	comboDir += '/'
-
+manifestFile = 'manifest.json'
+changesFile = 'changes.json'
+importProgressFile = 'importProgress.json'
+keepOutputs = ['.gitignore', 'mertide.log', 'temp.csv', manifestFile, changesFile, importProgressFile]
+validationRuleGroup = 'wnFo1vX2IW3'
+ruleFields = ['name', 'description', 'instruction', 'operator', 'importance', 'periodType', 'ruleType']
+ruleSideFields = ['expression', 'description', 'missingValueStrategy']
+indicatorFields = ['name', 'shortName', 'numerator', 'numeratorDescription', 'denominator', 'denominatorDescription']
+xmlAttributes = ['id', 'code', 'name', 'shortName']
+importChunkSize = 500
+ruleBatchSize = 50
+ruleWorker = None # What a worker of the pool of compileRules needs for its batches (see startRuleWorker)
+ruleResponses = None # The responses from DHIS2 kept for the pool of compileRules, by path and parameters
+evaluationFile = 'validationRuleViolations.json'
+catalogFile = 'catalog.json'
+
+# The tables of the data element catalog (--catalog) and their columns.  The rows of each table are sorted
+# by its columns, and catalogFile indexes them by the first one.
+catalogTables = {'dataElements': ['dataElement', 'name', 'shortName', 'type', 'form', 'categoryCombo', 'frequency'],
+			'optionCombos': ['dataElement', 'categoryCombo', 'categoryOptionCombo', 'name'],
+			'groups': ['dataElement', 'dataElementGroup', 'name'],
+			'rules': ['dataElement', 'categoryOptionCombo', 'rule', 'side', 'name', 'form', 'operator', 'importance', 'periodType']}
+evaluationExamples = 10
+
+# For each validation rule operator, whether the values of the two sides violate the rule
+violatedOperators = {'equal_to': operator.ne,
+			'not_equal_to': operator.eq,
+			'less_than': operator.ge,
+			'less_than_or_equal_to': operator.gt,
+			'greater_than': operator.le,
+			'greater_than_or_equal_to': operator.lt,
+			'compulsory_pair': operator.ne,
+			'exclusive_pair': operator.and_}
+
+# Header names in a CSV data value set exported from DHIS2
+dataValueColumns = {'dataelement': 'dataElement', 'period': 'period', 'orgunit': 'orgUnit',
+			'catoptcombo': 'categoryOptionCombo', 'categoryoptioncombo': 'categoryOptionCombo',
+			'attroptcombo': 'attributeOptionCombo', 'attributeoptioncombo': 'attributeOptionCombo',
+			'value': 'value', 'deleted': 'deleted'}
+
+outputManifest = {}
+changedOutputs = []
+logFile = None
+logBuffer = None
+
+# Options of the run (see main), and the state set up for it by run
+controlDir = ''
+controlFile = ''
+comboDir = ''
+nofavorites = False
+favoritesISOQuarter = ''
+favoriteQuarters = []
+statichtml = False
+minifyAssets = False
+assetBundle = ''
+directImport = False
+ruleJobs = 1
+checkOnly = False
+evaluateData = ''
+profileTop = 0
+profileCosts = {} # With --profile, the costs of each form and row, by key (see profileAdd)
+profileMarks = [] # The marks (see profileMark) being measured
 specificForms = False
 formsToOutput = []
-if inputArgs[4]:
-	log('Output forms: ' + ', '.join(inputArgs[4]))
-	formsToOutput = inputArgs[4]
-	specificForms = True
-else:
-	log('Outputting all forms')
-
-try:
-	config = json.load(open('/opt/dhis2/dish.json', 'r'))
-	api = config['dhis']['baseurl'] + '/api/'
-	credentials = (config['dhis']['username'], config['dhis']['password'])
-except FileNotFoundError:
-	# If you wish to hardcode the api endpoint and the username and password, you can do that here
-	api = 'http://localhost:8080/api/'
-	credentials = ('user', 'password')
-
-try:
-	req = requests.Session()
-	req.get(api, auth=credentials)
-	jsessionid = req.cookies.get_dict()
-	req = requests.get(api + 'resources.json', cookies=jsessionid)
-	if req.json()['resources'][0]:
-		log('Connected to DHIS2 using ' + api)
-	else:
-		raise ConnectionError('Not connected to DHIS2')
-except:
-	log('Not connected to DHIS2')
-	if not(noconnection):
-		sys.exit(2)
-
-# get the favorite stub
-if not nofavorites:
-	try:
-		favoriteStub = json.load(open('./codechunks/favorite_stub.json', 'r'))
-		log('Outputting favorites for '+favoritesISOQuarter)
-	except FileNotFoundError:
-		log('favorite stub not found exiting')
-		sys.exit(2)
-else:
-	log('Skipping favorite generation')
-
+favoriteStub = None
+numpy = None # Loaded by evaluateRules, if it is installed
+writeCatalog = False
+pyarrow = None # Loaded by writeCatalogTables, if it is installed
+offlineBundle = False
+
+# The persistent cache of DHIS2 responses (see cachedGet), its size in bytes, and the time to live, in seconds,
+# of the lookups of one object by uid of each endpoint (see httpCacheTTL).  Everything else, including the
+# downloads of every data element and option combo and the rules and indicators, is always revalidated.
+httpCacheDir = ''
+httpCacheSize = 256 * 1024 * 1024
+httpCacheTTLs = {'dataElements': 24 * 60 * 60}
+httpCacheStats = defaultdict(int)
+
+# The connection to DHIS2 (see connectDhis)
+api = ''
+credentials = None
+dhisSession = None
+threadSessions = threading.local()
+dhisConnected = False
 
 # CSS
 cssStart = '<style>'
@@ -1520,18 +3115,22 @@ cssEnd = '</style>'
 
 # Javascript
 jsStart = '<script>'
-js = []
+jsPlaceholder = r'//(#\w+#|dataElementListHere)'
 jsEnd = '</script>'
 jsDir = './js'
-for (dirpath, dirnames, filenames) in os.walk(jsDir):
-	js.extend(filenames)
-	break
 
-htmlBefore = "<!-- Start Custom DHIS2 Form -->\n"
+# The HTML that starts every form (and the one for the offline bundle), the standalone wrappers and the shared
+# asset files of --assetbundle, as [filename, text], made when the first form is made (see loadAssets)
+htmlBefore = None
+offlineHtmlBefore = None
+bundledAssets = []
+standaloneBefore = None
+standaloneEnd = None
 
 # Standalone wrappers
 standaloneHTMLa = './codechunks/standaloneform_before.html'
 standaloneHTMLb = './codechunks/standaloneform_end.html'
+offlineBootstrapHTML = './codechunks/offline_bootstrap.html'
 setuptabsHTML = './codechunks/setuptabs.html'
 
 ulClose = '</ul>\n'
@@ -1553,11 +3152,17 @@ majorNavHTML_end = divClose + divClose
 allHtabs = [{'type': 'DSD', 'label': 'DSD', 'uidsuffix': 'dsd'}, {'type': 'TA', 'label': 'TA-SDI', 'uidsuffix': 'xta'}, {'type': 'CS', 'label': 'CS', 'uidsuffix': 'xcs'}, {'type': 'NA', 'label': 'Other', 'uidsuffix': 'xna'}]
 
 # Minor Navigation List with HTML
-minorNavHTML_before = '<div id="PEPFAR_Tabs_vertical_%s">\n<div id="PEPFAR_Tabs_h_%s">\n<ul class="ui-helper-hidden">'
+vtabHTML_start = '<div id="PEPFAR_Tabs_vertical_%s">\n'
+htabNavHTML_before = '<div id="PEPFAR_Tabs_h_%s">\n<ul class="ui-helper-hidden">'
+minorNavHTML_before = vtabHTML_start + htabNavHTML_before
 minorNavHTML_li='\t<li><a href="#PEPFAR_Form_%s_%s">%s</a></li>'
 minorNavHTML_after=ulClose
 minorNavHTML_end=divClose+divClose
 
+# Lazy vtab (--lazytabs), rendered and set up for data entry by functionloader.materializeTab when first opened
+lazyTabHTML_start = '<template class="PEPFAR_Tabs_lazy">\n'
+lazyTabHTML_end = '</template>\n'
+
 # Entry Area
 entryAreaHTML_start = '<div id="PEPFAR_Form_%s_%s">\n<p class="PEPFAR_Form_ShowHide">&nbsp;</p>\n\n'
 entryAreaHTML_end = divClose
@@ -1573,185 +3178,249 @@ indicatorHTML_after = \
 	'<!-- END {title} --></div>\n\n' + \
 	'<p>&nbsp;</p>\n\n'
 
-# Build HTML prefix to use before the form-specific contents
-
-# CSS
-htmlBefore+="\n"+cssStart+"\n"
-with open(css, "r") as readFile:
-	htmlBefore+=readFile.read()
-htmlBefore+="\n"+cssEnd+"\n"
-
-# All JS Files
-htmlBefore+="\n"+jsStart+"\n"
-for jsFile in js:
-	with open(jsDir+'/'+jsFile, "r") as readFile:
-		if(filenameChecker(jsFile)):
-			htmlBefore+=readFile.read()
-			htmlBefore+="\n"
-htmlBefore+="\n"+jsEnd+"\n"
-
-# Major Nav
-htmlBefore+=majorNavHTML_before+"\n"
-
 exportDataEntryForms = [] #Array of XML <dataEntryForm> definitions to export (v2.22 and following)
 exportStaticHTML = [] #Array of static HTML forms
+offlineForms = [] # The uid, name, data file and data of each form in the offline bundle (see addOfflineForm)
 exportDatasets = [] #Array of XML <dataset> definitions to export (v2.22 and following)
-exportIndicators = []
+exportIndicators = {} # Indicators to export, by uid
+indicatorNumerators = {} # The uid of the first indicator with each numerator
 dataElementGroups = defaultdict(set) # Data element groups and their members for export
+dataElementGroupIds = {} # The uid of each data element group of a group set (degs1 and degs2), by name
+dhisConnections = 8 # The most requests that are made to DHIS2 at once while the forms are made (see doControlFile)
+controlIndex = {'dataElements': defaultdict(list), 'disaggs': defaultdict(list)} # The rows of each data element and disagg (see indexForm)
+disaggPlans = {} # The render plan of each disagg (see compileDisagg)
+
+# Top-level logic: make the forms and other outputs of a control file, given the command line arguments
+def run(argv):
+	global inputArgs, controlDir, controlFile, comboDir, noconnection, nofavorites, favoritesISOQuarter, favoriteQuarters
+	global statichtml, minifyAssets, assetBundle, directImport, ruleJobs, checkOnly, evaluateData, profileTop
+	global specificForms, formsToOutput, favoriteStub, httpCacheDir, writeCatalog, offlineBundle, lazyTabs
+
+	# Get those args!
+	inputArgs = main(argv)
+	startOutput()
+
+	controlDir = inputArgs[0]
+	controlFile = inputArgs[1]
+	comboDir = inputArgs[2]
+	noconnection = inputArgs[3]
+	nofavorites = inputArgs[5]
+	favoritesISOQuarter = inputArgs[6]
+	favoriteQuarters = inputArgs[14] or [favoritesISOQuarter]
+	statichtml = inputArgs[7]
+	minifyAssets = inputArgs[8]
+	assetBundle = inputArgs[9]
+	directImport = inputArgs[10]
+	ruleJobs = inputArgs[11]
+	checkOnly = inputArgs[12]
+	evaluateData = inputArgs[13]
+	profileTop = inputArgs[15]
+	httpCacheDir = inputArgs[16]
+	writeCatalog = inputArgs[17]
+	offlineBundle = inputArgs[18]
+	lazyTabs = inputArgs[19]
+	if profileTop:
+		import tracemalloc
+		tracemalloc.start()
+
+	if controlDir:
+		log('Control Folder: ' + controlDir)
+		if not(controlDir.endswith('/')):
+			controlDir += '/'
+	else:
+		log('Control File: ' + controlFile)
 
-# Top-level logic
+	log('Disagg Folder: ' + comboDir)
+	if not(comboDir.endswith('/')):
+		comboDir += '/'
 
-random.seed()
+	importFailed = False
 
-# for (dirpath, dirnames, filenames) in os.walk('.'):
-#	 for filename in filenames:
-#		 if re.match('^mertide_.*csv$',filename):
-#			 doControlFile(dirpath + '/' + filename)
+	specificForms = False
+	formsToOutput = []
+	if inputArgs[4]:
+		log('Output forms: ' + ', '.join(inputArgs[4]))
+		formsToOutput = inputArgs[4]
+		specificForms = True
+	else:
+		log('Outputting all forms')
 
-# FIXME: Add comments! :)
+	if httpCacheDir:
+		if openHttpCache():
+			log('Caching DHIS2 metadata in ' + httpCacheDir)
+		else:
+			log('Unable to use ' + httpCacheDir + ' as the HTTP cache, so metadata will not be cached', 'warn')
+			httpCacheDir = ''
 
-if not(noconnection):
-	# Cache currently existing rules
-	req = requests.get(api + 'validationRules.json', cookies=jsessionid,
-			params = {'paging': False, 'fields': 'name,id,leftSide[expression,description,missingValueStrategy],operator,rightSide[expression,description,missingValueStrategy],description,ruleType,periodType,instruction,importance'})
-	for r in req.json()['validationRules']:
-		rulesCache[hashRule(r)] = r['id']
-		dhisRulesCache[hashRule(r)] = r
-
-if controlDir:
-	controlFile = outDir + 'temp.csv'
-	o = open(controlFile, 'w')
-	for i in os.listdir(controlDir):
-		if i.endswith('.csv'):
-			ih = open(controlDir + i, 'r')
-			o.write(ih.read())
-	o.close()
-
-# Pull Data Element and Cat Option Combo data from connected dhis2 server
-getAllDataElements()
-getAllCategoryOptionCombos()
-doControlFile(controlFile)
-
-# Write indicator file
-
-indicator = open('codechunks/indicator.json').read()
-j = []
-for i in exportIndicators:
-	n = '+'.join(i[2])
-	shortName = i[0][:50]
-	j.append(indicator.format(name=i[0], uid=i[1], numerator=n, numeratorDescription=i[3], shortName=shortName))
-export = open(outDir+'indicators.json', 'w')
-export.write('{\n  "indicators": [\n' + '\n,\n'.join(j) + '  ]\n}')
-export.close()
-
-
-# Write XML import file for api/xx/metadata
-
-if severe:
-	log('Skipping DSsDEFsDEGs.xml due to severe error')
-else:
-	export = open(outDir + 'DSsDEFsDEGs.xml', 'w')
-	export.write(open('codechunks/datasets_before.xml').read())
-
-	export.write('	<dataEntryForms>\n')
-	for form in exportDataEntryForms:
-		export.write(form)
-	export.write('	</dataEntryForms>\n')
-
-	export.write('	<dataSets>\n')
-	for dataSet in exportDatasets:
-		export.write(dataSet)
-	export.write('	</dataSets>\n')
-
-	writeDataElementGroups(export)
-
-	export.write('</metadata>\n')
-	export.close()
-	z = zipfile.ZipFile(outDir + 'DSsDEFsDEGs.xml.zip', 'w', zipfile.ZIP_DEFLATED)
-	z.write(outDir + 'DSsDEFsDEGs.xml')
-	z.close()
+	if connectDhis():
+		log('Connected to DHIS2 using ' + api)
+	else:
+		log('Not connected to DHIS2')
+		if not(noconnection):
+			sys.exit(2)
 
-if not(nofavorites):
-	export = open(outDir + 'precursorFavoritesAnnually.json', 'w')
-	export.write(json.dumps(favoriteAnnuallyJSON, sort_keys=True, indent=2, separators=(',', ': ')))
-	export.close()
+	# get the favorite stub
+	if not nofavorites:
+		try:
+			favoriteStub = json.load(open('./codechunks/favorite_stub.json', 'r'))
+			log('Outputting favorites for '+', '.join(favoriteQuarters))
+		except FileNotFoundError:
+			log('favorite stub not found exiting')
+			sys.exit(2)
+	else:
+		log('Skipping favorite generation')
 
-	export = open(outDir + 'precursorFavoritesSemiannually.json', 'w')
-	export.write(json.dumps(favoriteSemiannuallyJSON, sort_keys=True, indent=2, separators=(',', ': ')))
-	export.close()
+	random.seed()
 
-	export = open(outDir + 'precursorFavoritesQuarterly.json', 'w')
-	export.write(json.dumps(favoriteQuarterlyJSON, sort_keys=True, indent=2, separators=(',', ': ')))
-	export.close()
+	# for (dirpath, dirnames, filenames) in os.walk('.'):
+	#	 for filename in filenames:
+	#		 if re.match('^mertide_.*csv$',filename):
+	#			 doControlFile(dirpath + '/' + filename)
 
-if not(noconnection):
-	deleteRules = ''
-	addRulesToGroup = ''
-	shellScriptBegin = open('codechunks/shellscript.sh').read()
+	# FIXME: Add comments! :)
 
-	for r in newRules:
-		deleteRules += "dhis_api --request DELETE --api-request='validationRules/" + r['id'] + "'\n"
-		addRulesToGroup += "dhis_api --request POST --api-request='validationRuleGroups/wnFo1vX2IW3/validationRules/" + r['id'] + "'\n"
+	if controlDir:
+		controlFile = outDir + 'temp.csv'
+		o = open(controlFile, 'w')
+		for i in os.listdir(controlDir):
+			if i.endswith('.csv'):
+				ih = open(controlDir + i, 'r')
+				o.write(ih.read())
+		o.close()
 
-	for r in modifiedRules:
-		deleteRules += "# dhis_api --request DELETE --api-request='validationRules/" + r['id'] + "'\n"
-		addRulesToGroup += "# dhis_api --request POST --api-request='validationRuleGroups/wnFo1vX2IW3/validationRules/" + r['id'] + "'\n"
+	# Only check the control files, if asked, and exit with a failure if there were problems
+	if checkOnly:
+		try:
+			getAllDataElements()
+			getAllCategoryOptionCombos()
+		except Exception:
+			log('Unable to get metadata from DHIS2, so data elements and option combos will not be checked', 'warn')
+		problems = checkControlFile(controlFile)
+		if httpCacheDir:
+			trimHttpCache()
+		logFile.close()
+		sys.exit(1 if problems else 0)
+
+	# Pull the rules, Data Elements and Cat Option Combos from connected dhis2 server while the forms are parsed and made
+	import asyncio
+	asyncio.run(doControlFile(controlFile))
+
+	# Write indicator files
+
+	indicators = makeIndicators()
+	writeOutput('indicators.json', serializeMetadata(indicators, 'indicators', 'json'))
+	writeOutput('indicators.xml', serializeMetadata(indicators, 'indicators', 'xml'))
+	if not(noconnection):
+		writeOutput('indicatorChanges.json', json.dumps(diffIndicators(indicators), sort_keys=True, indent=2, separators=(',', ': ')))
 
-	for r in oldRules:
-		deleteRules += "# dhis_api --request DELETE --api-request='validationRules/" + r['id'] + "'\n"
-		addRulesToGroup += "# dhis_api --request POST --api-request='validationRuleGroups/wnFo1vX2IW3/validationRules/" + r['id'] + "'\n"
 
-	for r in validationRules:
-		deleteRules += "dhis_api --request DELETE --api-request='validationRules/" + r['id'] + "'\n"
-		addRulesToGroup += "dhis_api --request POST --api-request='validationRuleGroups/wnFo1vX2IW3/validationRules/" + r['id'] + "'\n"
+	# Write XML import file for api/xx/metadata
 
 	if severe:
-		log('Skipping validation rule JSONs due to severe error')
+		log('Skipping DSsDEFsDEGs.xml due to severe error')
 	else:
+		export = io.StringIO()
+		export.write(open('codechunks/datasets_before.xml').read())
 
-		export = open(outDir + 'validationRules.json', 'w')
-		export.write(json.dumps({'validationRules': validationRules}, sort_keys=True, indent=2, separators=(',', ': ')))
+		export.write('	<dataEntryForms>\n')
+		for form in exportDataEntryForms:
+			export.write(form)
+		export.write('	</dataEntryForms>\n')
 
+		export.write('	<dataSets>\n')
+		for dataSet in exportDatasets:
+			export.write(dataSet)
+		export.write('	</dataSets>\n')
 
-		export = open(outDir + 'newValidationRules.json', 'w')
-		export.write(json.dumps({'validationRules': newRules}, sort_keys=True, indent=2, separators=(',', ': ')))
-		export.close()
+		writeDataElementGroups(export)
 
-		export = open(outDir + 'modifiedValidationRules.json', 'w')
-		export.write(json.dumps({'validationRules': modifiedRules}, sort_keys=True, indent=2, separators=(',', ': ')))
+		export.write('</metadata>\n')
+		writeOutput('DSsDEFsDEGs.xml', export.getvalue())
+		writeOutput('DSsDEFsDEGs.xml.zip', zipOutput(outDir + 'DSsDEFsDEGs.xml', export.getvalue()))
 		export.close()
 
-		export = open(outDir + 'oldValidationRules.json', 'w')
-		export.write(json.dumps({'validationRules': oldRules}, sort_keys=True, indent=2, separators=(',', ': ')))
-		export.close()
+	if not(nofavorites):
+		for quarter in favoriteQuarters:
+			for frequency in ['Annually', 'Semiannually', 'Quarterly']:
+				writeOutput(quarterFileName('precursorFavorites' + frequency + '.json', quarter),
+					json.dumps({'reportTables': favoriteReportTables[(quarter, frequency)]}, sort_keys=True, indent=2, separators=(',', ': ')))
 
-		export = open(outDir + 'createValidationRules.sh', 'w')
-		export.write(shellScriptBegin)
-		export.write("dhis_api --content-json --request POST --data-binary '@newValidationRules.json' --api-request='metadata/?preheatCache=false&dryRun=false'\n")
-		export.write("dhis_api --content-json --request POST --data-binary '@modifiedValidationRules.json' --api-request='metadata/?preheatCache=false&dryRun=false'\n")
-		export.write("# dhis_api --content-json --request POST --data-binary '@oldValidationRules.json' --api-request='metadata/?preheatCache=false&dryRun=false'\n\n")
-		export.write(addRulesToGroup)
-		os.fchmod(export.fileno(), 0o755) # Make the script executable
-		export.close()
+	if not(noconnection):
+		shellScriptBegin = open('codechunks/shellscript.sh').read()
+		group = getValidationRuleGroup(validationRuleGroup)
+		if not group:
+			log('Unable to get validation rule group ' + validationRuleGroup + ', so rules will not be added to it and orphaned rules will not be found', 'warn')
+		ruleChanges = diffRules(group)
+
+		if severe:
+			log('Skipping validation rule JSONs due to severe error')
+		else:
 
-		export = open(outDir + 'deleteValidationRules.sh', 'w')
-		export.write(shellScriptBegin)
-		export.write(deleteRules)
-		os.fchmod(export.fileno(), 0o755) # Make the script executable
-		export.close()
+			writeOutput('validationRules.json', json.dumps({'validationRules': validationRules}, sort_keys=True, indent=2, separators=(',', ': ')))
+			writeOutput('newValidationRules.json', json.dumps({'validationRules': newRules}, sort_keys=True, indent=2, separators=(',', ': ')))
+			writeOutput('modifiedValidationRules.json', json.dumps({'validationRules': modifiedRules}, sort_keys=True, indent=2, separators=(',', ': ')))
+			writeOutput('oldValidationRules.json', json.dumps({'validationRules': oldRules}, sort_keys=True, indent=2, separators=(',', ': ')))
+			writeOutput('validationRuleChanges.json', json.dumps(ruleChanges, sort_keys=True, indent=2, separators=(',', ': ')))
 
-		export = open(outDir + 'dataElements.tsv', 'w')
-		for key, value in formDataElementList.items():
-			export.write(key+"\t"+value['type']+"\t"+value['form']+"\t"+value['categoryCombo']+"\t"+value['name']+"\t"+value['frequency']+"\n")
+			# One metadata import with the new and modified rules and the membership of every rule in the
+			# validation rule group, which replaces the group's members, so its current members are kept
+			importRules = {'validationRules': newRules + modifiedRules}
+			if group:
+				members = [r['id'] for r in group.get('validationRules', [])]
+				members.extend([r['id'] for r in validationRules if r['id'] not in members])
+				importRules['validationRuleGroups'] = [{'id': group['id'], 'name': group['name'], 'validationRules': [{'id': m} for m in members]}]
+			writeOutput('validationRulesImport.json', json.dumps(importRules, sort_keys=True, indent=2, separators=(',', ': ')))
+			writeOutput('validationRulesDelete.json', json.dumps({'validationRules': [{'id': r['id']} for r in validationRules]}, sort_keys=True, indent=2, separators=(',', ': ')))
 
-		export.close()
+			export = shellScriptBegin
+			export += "dhis_api --content-json --request POST --data-binary '@validationRulesImport.json' --api-request='metadata/?preheatCache=false&dryRun=false'\n"
+			writeOutput('createValidationRules.sh', export, 0o755) # Make the script executable
+
+			export = shellScriptBegin
+			export += "dhis_api --content-json --request POST --data-binary '@validationRulesDelete.json' --api-request='metadata/?importStrategy=DELETE&preheatCache=false&dryRun=false'\n"
+			writeOutput('deleteValidationRules.sh', export, 0o755) # Make the script executable
+
+			if directImport:
+				log('Importing validation rules into ' + api)
+				importFailed = not importMetadata(importRules, {'preheatCache': 'false', 'dryRun': 'false'})
+
+			if evaluateData:
+				log('Evaluating rules against ' + evaluateData)
+				violations = evaluateRules(readDataValues(evaluateData), validationRules, ruleTables)
+				writeOutput(evaluationFile, json.dumps(violations, sort_keys=True, indent=2, separators=(',', ': ')))
+
+			export = ''
+			for key, value in formDataElementList.items():
+				export += key+"\t"+value['type']+"\t"+value['form']+"\t"+value['categoryCombo']+"\t"+value['name']+"\t"+value['frequency']+"\n"
+			writeOutput('dataElements.tsv', export)
+
+
+	if noconnection and evaluateData:
+		log('Not connected to DHIS2, so there are no rules to evaluate against ' + evaluateData, 'warn')
 
+	for quarter in favoriteQuarters:
+		writeOutput(quarterFileName('dataElementCadence.json', quarter),
+			json.dumps({'period' : quarter, 'dataElements': getDataElementCadence(quarter)}, sort_keys=True, indent=2, separators=(',', ': ')))
 
-getDataElementCadence()
-export = open(outDir + 'dataElementCadence.json', 'w')
-export.write(json.dumps({'period' : favoritesISOQuarter, 'dataElements': dataElementCadence}, sort_keys=True, indent=2, separators=(',', ': ')))
-export.close()
+	if writeCatalog:
+		writeCatalogTables(makeCatalog())
 
-log('Finished processing control file, exiting normally')
+	if offlineBundle and offlineForms:
+		writeOutput('offlineForms.zip', makeOfflineBundle())
 
-logFile.close()
+	finishOutput()
+
+	if httpCacheDir:
+		trimHttpCache()
+
+	if importFailed:
+		log('Finished processing control file, but the import into DHIS2 failed', 'severe')
+		logFile.close()
+		sys.exit(1)
+
+	log('Finished processing control file, exiting normally')
+
+	logFile.close()
+
+if __name__ == '__main__':
+	run(sys.argv[1:])
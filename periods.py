@@ -0,0 +1,109 @@
+# Period conversions for MERtide favorites and data element cadences
+#
+# Every ISO quarter (like 2019Q1) is converted once into the DHIS2 periods of each period type
+# MERtide uses, and kept in a lookup table, so conversions inside the favorites loop are dictionary
+# lookups.  The current quarter is taken from a reference date that is read once, when it is first
+# needed (not when this module is imported), from the environment variable SOURCE_DATE_EPOCH if it
+# is set (so runs can be reproduced) or from the clock.
+
+import os
+import re
+import datetime
+
+# The frequencies of indicators and the quarters (of the calendar year) in which each is reported
+reportingQuarters = {'Quarterly': (1, 2, 3, 4), 'Semiannually': (1, 3), 'Annually': (3,)}
+
+# The DHIS2 period type used for the favorites of indicators with each frequency
+frequencyPeriodTypes = {'Quarterly': 'Quarterly', 'Semiannually': 'SixMonthlyApril', 'Annually': 'FinancialOct'}
+
+# The first year of the lookup table, and how many years past the reference date it covers
+firstYear = 2018
+yearsAhead = 5
+
+# Read the reference date: SOURCE_DATE_EPOCH (seconds since 1970, in UTC) if it is set, or today
+def readReferenceDate():
+	epoch = os.environ.get('SOURCE_DATE_EPOCH')
+	if epoch:
+		return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).date()
+	return datetime.date.today()
+
+# The reference date, read the first time it is needed, when the lookup table is also filled with every
+# quarter from firstYear to yearsAhead years past it
+def getReferenceDate():
+	global referenceDate
+	if referenceDate is None:
+		referenceDate = readReferenceDate()
+		for year in range(firstYear, referenceDate.year + yearsAhead + 1):
+			for quarter in range(1, 5):
+				periodTable.setdefault(str(year) + 'Q' + str(quarter), makePeriods(year, quarter))
+	return referenceDate
+
+# Convert an ISO quarter into the periods of each period type:
+#   Quarterly:       2019Q1 -> 2019Q1
+#   SixMonthlyApril: 2018Q4 -> 2018AprilS2, 2019Q1 -> 2018AprilS2, 2019Q2 -> 2019AprilS1, 2019Q3 -> 2019AprilS1
+#   FinancialOct:    2019Q1, 2019Q2 and 2019Q3 -> 2018Oct, 2019Q4 -> 2019Oct
+#   Targets:         2019Qn -> 2019Oct, the financial year that starts in the quarter's year
+#   FYOctQuarter:    the quarter of the financial year, 2019Q1 -> 2019Q2, 2019Q4 -> 2020Q1
+def makePeriods(year, quarter):
+	if quarter == 1:
+		sixMonthlyApril = str(year - 1) + 'AprilS2'
+	elif quarter == 4:
+		sixMonthlyApril = str(year) + 'AprilS2'
+	else:
+		sixMonthlyApril = str(year) + 'AprilS1'
+	return {'Quarterly': str(year) + 'Q' + str(quarter),
+		'SixMonthlyApril': sixMonthlyApril,
+		'FinancialOct': str(year - 1 if quarter < 4 else year) + 'Oct',
+		'Targets': str(year) + 'Oct',
+		'FYOctQuarter': str(year + 1 if quarter == 4 else year) + 'Q' + str(quarter % 4 + 1)}
+
+# Look up the periods of an ISO quarter, converting (and remembering) any quarter outside the table
+def quarterPeriods(ISOQuarter):
+	if ISOQuarter not in periodTable:
+		r = re.fullmatch(r'(\d{4})Q([1-4])', ISOQuarter)
+		if not r:
+			raise ValueError(ISOQuarter + ' is not an ISO quarter like 2019Q1')
+		periodTable[ISOQuarter] = makePeriods(int(r.group(1)), int(r.group(2)))
+	return periodTable[ISOQuarter]
+
+# current fiscal year for fyoct
+def curFyOct():
+	return str(getReferenceDate().year + 1 if curQuarter() == '4' else getReferenceDate().year)
+
+# current year
+def curYear():
+	return str(getReferenceDate().year)
+
+def curQuarter():
+	return str((getReferenceDate().month + 2) // 3)
+
+def curISOQuarter():
+	return 'FY' + curYear() + 'Q' + curQuarter()
+
+def ISOQuarterToISOSAApr(ISOQuarter):
+	return quarterPeriods(ISOQuarter)['SixMonthlyApril']
+
+def ISOQuarterToISOFYOctTARGET(ISOQuarter):
+	return quarterPeriods(ISOQuarter)['Targets']
+
+def ISOQuarterToISOFYOct(ISOQuarter):
+	return quarterPeriods(ISOQuarter)['FinancialOct']
+
+def ISOQuarterToFYOctQuarter(ISOQuarter):
+	return quarterPeriods(ISOQuarter)['FYOctQuarter']
+
+# Whether an indicator (or data element) with a frequency is reported in an ISO quarter
+def pepfarReportingQuarter(ISOQuarter, frequency):
+	return int(ISOQuarter[-1]) in reportingQuarters.get(frequency, ())
+
+# The DHIS2 period of a favorite for an ISO quarter, given the favorite's type (Targets or Results) and
+# the frequency of its indicator, or '' if the frequency has no period type
+def favoritePeriod(ISOQuarter, favoriteType, frequency):
+	if favoriteType == 'Targets':
+		return quarterPeriods(ISOQuarter)['Targets']
+	if frequency in frequencyPeriodTypes:
+		return quarterPeriods(ISOQuarter)[frequencyPeriodTypes[frequency]]
+	return ''
+
+referenceDate = None
+periodTable = {}